@@ -0,0 +1,258 @@
+import argparse
+import csv
+import io
+import json
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Any, Dict, List, Mapping, Optional, TextIO
+import unittest
+
+from arguments import name_and_path
+from blend import Blender, Column, read_corpus_counts
+from columnar import ColumnarBag
+from dictionary import Dictionary
+from rank import Rank
+from term import Term
+
+COVERAGE_LEVELS = [0.9, 0.95, 0.99]
+"""
+Fractions of all tokens for which the report gives the number of top terms needed
+"""
+CSV_RANKS = [1000, 2000, 5000, 10000, 20000, 40000, 60000, 80000, 100000, 150000, 200000]
+"""
+Ranks at which the CSV report gives the cumulative coverage
+"""
+
+
+def cumulative_coverage(column: Column) -> array:
+    """
+    Fraction of all tokens covered by the top n terms at index n - 1.
+    """
+    assert column.frequencies is not None
+    frequencies = sorted(column.frequencies, reverse=True)
+    total = sum(frequencies)
+    if not total:
+        return array("d")
+    return array("d", [x / total for x in accumulate(frequencies)])
+
+
+def coverage_rank(cumulative: array, level: float) -> Optional[int]:
+    """
+    Number of top terms needed to cover the fraction of tokens, or None if all terms cover less.
+    """
+    # Sums of floats can fall just short of 1.0
+    index = bisect_left(cumulative, level - 1e-9)
+    return index + 1 if index < len(cumulative) else None
+
+
+def coverage_at(cumulative: array, rank: int) -> float:
+    if not cumulative:
+        return 0.0
+    return cumulative[min(rank, len(cumulative)) - 1]
+
+
+def ranks_by_id(column: Column, size: int) -> array:
+    """
+    Rank of every term id in the column, or -1 for terms that it does not contain.
+    """
+    result = array("q", [-1]) * size
+    for term_id, rank in zip(column.ids, column.get_ranks()):
+        result[term_id] = rank
+    return result
+
+
+def spearman(a: List[int], b: List[int]) -> Optional[float]:
+    """
+    Spearman's rank correlation of two lists of distinct ranks of the same terms.
+
+    Ranks are renumbered from 0 within the given terms first,
+    so terms missing from either corpus do not shift the others.
+    """
+    n = len(a)
+    if n < 2:
+        return None
+
+    def renumber(ranks: List[int]) -> List[int]:
+        result = [0] * n
+        for position, i in enumerate(sorted(range(n), key=ranks.__getitem__)):
+            result[i] = position
+        return result
+
+    squares = sum((x - y) ** 2 for x, y in zip(renumber(a), renumber(b)))
+    return 1 - 6 * squares / (n * (n * n - 1))
+
+
+class Analysis:
+    """
+    Coverage and agreement of several corpora.
+
+    Terms of all corpora share their ids through a Blender,
+    so comparisons between corpora work on aligned arrays of ranks by term id.
+    Corpora given as rank dictionaries have no counts, so they are only compared, not covered.
+    """
+    blender: Blender
+    names: List[str]
+    tokens: List[Optional[int]]
+
+    def __init__(self):
+        self.blender = Blender()
+        self.names = []
+        self.tokens = []
+
+    def add_counts(self, name: str, counts: Mapping[Term, int]) -> "Analysis":
+        self.blender.add_counts(counts)
+        self.names.append(name)
+        self.tokens.append(sum(counts.values()))
+        return self
+
+    def add_ranks(self, name: str, dic: Dictionary) -> "Analysis":
+        self.blender.add_ranks(dic)
+        self.names.append(name)
+        self.tokens.append(None)
+        return self
+
+    def corpus_report(self, index: int, ranks: List[int], levels: List[float]) -> Dict[str, Any]:
+        column = self.blender.columns[index]
+        obj: Dict[str, Any] = {"types": len(column), "tokens": self.tokens[index]}
+        if column.frequencies is not None:
+            cumulative = cumulative_coverage(column)
+            obj["coverage_rank"] = {str(level): coverage_rank(cumulative, level) for level in levels}
+            obj["coverage_at"] = {str(rank): round(coverage_at(cumulative, rank), 6) for rank in ranks}
+        return obj
+
+    def pair_report(self, a: int, b: int, by_id: List[array], top: int) -> Dict[str, Any]:
+        ranks_a, ranks_b = by_id[a], by_id[b]
+        shared = [i for i in self.blender.columns[a].ids if ranks_b[i] >= 0]
+        size_a, size_b = len(self.blender.columns[a]), len(self.blender.columns[b])
+        correlation = spearman([ranks_a[i] for i in shared], [ranks_b[i] for i in shared])
+        top_ids = [i for i in shared if ranks_a[i] < top and ranks_b[i] < top]
+        top_correlation = spearman([ranks_a[i] for i in top_ids], [ranks_b[i] for i in top_ids])
+        return {
+            "a": self.names[a],
+            "b": self.names[b],
+            "shared": len(shared),
+            "jaccard": round(len(shared) / (size_a + size_b - len(shared)), 6) if size_a + size_b else 0.0,
+            "top_overlap": round(len(top_ids) / min(top, size_a, size_b), 6) if min(size_a, size_b) else 0.0,
+            "spearman": None if correlation is None else round(correlation, 6),
+            "top_spearman": None if top_correlation is None else round(top_correlation, 6),
+        }
+
+    def report(self, ranks: List[int], levels: List[float] = COVERAGE_LEVELS, top: int = 10000) -> Dict[str, Any]:
+        """
+        Coverage of each corpus and, for every pair of corpora, the share of common terms,
+        the overlap of their top terms, and the rank correlation of all common terms and of the common top terms.
+        """
+        size = len(self.blender.terms)
+        by_id = [ranks_by_id(column, size) for column in self.blender.columns]
+        n = len(self.names)
+        return {
+            "corpora": {name: self.corpus_report(i, ranks, levels) for i, name in enumerate(self.names)},
+            "top": top,
+            "pairs": [self.pair_report(a, b, by_id, top) for a in range(n) for b in range(a + 1, n)],
+        }
+
+    def write_csv(self, f: TextIO, ranks: List[int]):
+        """
+        Write the cumulative coverage of each corpus with counts at the ranks, one row per corpus and rank.
+        """
+        writer = csv.writer(f)
+        writer.writerow(["corpus", "rank", "coverage"])
+        for name, column in zip(self.names, self.blender.columns):
+            if column.frequencies is None:
+                continue
+            cumulative = cumulative_coverage(column)
+            for rank in ranks:
+                if rank <= len(cumulative):
+                    writer.writerow([name, rank, f"{coverage_at(cumulative, rank):.6f}"])
+
+
+class TestAnalytics(unittest.TestCase):
+    a, b, c, d = Term("学校", "がっこう"), Term("川", "かわ"), Term("海", "うみ"), Term("水", "みず")
+
+    def test_coverage(self):
+        analysis = Analysis().add_counts("x", {self.a: 10, self.b: 60, self.c: 30})
+        cumulative = cumulative_coverage(analysis.blender.columns[0])
+        self.assertEqual([0.6, 0.9, 1.0], [round(x, 6) for x in cumulative])
+        self.assertEqual(1, coverage_rank(cumulative, 0.5))
+        self.assertEqual(2, coverage_rank(cumulative, 0.9))
+        self.assertEqual(3, coverage_rank(cumulative, 0.95))
+        self.assertEqual(3, coverage_rank(cumulative, 1.0))
+        self.assertEqual(1.0, coverage_at(cumulative, 80000))
+
+        report = analysis.report([1, 2], [0.9])
+        self.assertEqual({"types": 3, "tokens": 100, "coverage_rank": {"0.9": 2},
+                          "coverage_at": {"1": 0.6, "2": 0.9}}, report["corpora"]["x"])
+
+    def test_spearman(self):
+        self.assertEqual(1.0, spearman([0, 1, 2, 3], [0, 1, 2, 3]))
+        self.assertEqual(-1.0, spearman([0, 1, 2, 3], [3, 2, 1, 0]))
+        # Gaps from terms missing in one corpus do not matter
+        self.assertEqual(1.0, spearman([0, 5, 9], [1, 2, 3]))
+        self.assertIsNone(spearman([0], [0]))
+
+    def test_pairs(self):
+        ranks = Rank.dictionary([Rank(self.a, 0), Rank(self.d, 1), Rank(self.b, 2)])
+        analysis = Analysis() \
+            .add_counts("x", {self.a: 50, self.b: 30, self.c: 20}) \
+            .add_ranks("y", ranks)
+        report = analysis.report([2], top=2)
+        self.assertNotIn("coverage_rank", report["corpora"]["y"])
+        pair = report["pairs"][0]
+        self.assertEqual(("x", "y", 2), (pair["a"], pair["b"], pair["shared"]))
+        self.assertEqual(0.5, pair["jaccard"])
+        # Only a is in the top two of both
+        self.assertEqual(0.5, pair["top_overlap"])
+        self.assertEqual(1.0, pair["spearman"])
+
+        f = io.StringIO()
+        analysis.write_csv(f, [1, 2, 5])
+        self.assertEqual(["corpus,rank,coverage", "x,1,0.500000", "x,2,0.800000"], f.getvalue().split())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report token coverage by rank and agreement between corpora")
+
+    parser.add_argument("--data", type=str, default=None, help="Path to directory with NINJAL zip files")
+    parser.add_argument("--corpus", type=str, action="append", default=[],
+                        help="Corpus to read from the data directory: bccwj, csj, nwjc, shc, chj-modern, chj-premodern")
+    parser.add_argument("--store", type=str, action="append", default=[], help="Columnar store NAME=PATH")
+    parser.add_argument("--rank", type=str, action="append", default=[], help="Rank dictionary NAME=PATH")
+    parser.add_argument("--top", type=int, default=10000, help="Number of top terms compared between corpora")
+    parser.add_argument("--levels", type=float, nargs="+", default=COVERAGE_LEVELS, help="Coverage levels")
+    parser.add_argument("--json", type=str, default=None, help="Path of JSON report; standard output by default")
+    parser.add_argument("--csv", type=str, default=None, help="Path of CSV report of coverage by rank")
+
+    args = parser.parse_args()
+
+    if args.corpus and args.data is None:
+        parser.error("--corpus requires --data")
+    if not (args.corpus or args.store or args.rank):
+        parser.error("at least one of --corpus --store --rank is required")
+
+    start = time.perf_counter()
+    analysis = Analysis()
+    for name in args.corpus:
+        analysis.add_counts(name, read_corpus_counts(name, args.data))
+    for name, path in map(name_and_path, args.store):
+        with ColumnarBag(path) as store:
+            analysis.add_counts(name, store.to_counts())
+    for name, path in map(name_and_path, args.rank):
+        analysis.add_ranks(name, Rank.dictionary_reader().with_path(path).read())
+    loaded = time.perf_counter()
+
+    report = analysis.report(CSV_RANKS, args.levels, args.top)
+    if args.csv is not None:
+        with open(args.csv, "w", encoding="utf-8", newline="") as f:
+            analysis.write_csv(f, CSV_RANKS)
+    end = time.perf_counter()
+    print(f"load {loaded - start:.2f} s, analyse {end - loaded:.2f} s", file=sys.stderr)
+
+    if args.json is not None:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+    else:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=1)
+        print()
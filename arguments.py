@@ -0,0 +1,34 @@
+import os
+from typing import Tuple
+import unittest
+
+
+def with_weight(argument: str) -> Tuple[str, float]:
+    """
+    Parse NAME_OR_PATH[=WEIGHT], where the weight defaults to one.
+    """
+    if "=" in argument:
+        name, weight = argument.rsplit("=", 1)
+        return name, float(weight)
+    return argument, 1.0
+
+
+def name_and_path(argument: str) -> Tuple[str, str]:
+    """
+    Parse NAME=PATH, where the name defaults to the file name without extension.
+    """
+    if "=" in argument:
+        name, path = argument.split("=", 1)
+        return name, path
+    return os.path.splitext(os.path.basename(argument))[0], argument
+
+
+class TestArguments(unittest.TestCase):
+    def test_with_weight(self):
+        self.assertEqual(("bccwj", 2.5), with_weight("bccwj=2.5"))
+        self.assertEqual(("a=b.zip", 1.0), with_weight("a=b.zip=1"))
+        self.assertEqual(("csj", 1.0), with_weight("csj"))
+
+    def test_name_and_path(self):
+        self.assertEqual(("ranks", "a/b.zip"), name_and_path("ranks=a/b.zip"))
+        self.assertEqual(("b", "a/b.zip"), name_and_path("a/b.zip"))
@@ -2,40 +2,53 @@ import argparse
 import os
 import unittest
 from datetime import date
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Dict, Container, Any, Callable
 
+import profiling
 import rank
+from dictionary import Dictionary
 from occurrence import OccurrenceBag, OccurrenceReader
 from rank import Rank
+from term import Term
 
 
-def read_suw_bag(zip_dir_path: str) -> OccurrenceBag:
-    zip_path = os.path.join(zip_dir_path, "BCCWJ_frequencylist_suw_ver1_1.zip")
-    return OccurrenceReader() \
-        .with_zip_path(zip_path) \
-        .add_path("BCCWJ_frequencylist_suw_ver1_1.tsv") \
-        .with_separator("\t") \
-        .with_skip_lines(1) \
-        .with_text_index(2) \
-        .with_reading_index(1) \
-        .with_count_index(6) \
-        .read()
+SUW_ZIP_NAME = "BCCWJ_frequencylist_suw_ver1_1.zip"
+LUW2_ZIP_NAME = "BCCWJ_frequencylist_luw2_ver1_1.zip"
+
+KeyFilter = Tuple[Container[Any], Optional[Callable[[str, str], Any]]]
+"""
+Keys to keep and the function that computes the key of a row, if not its text and reading
+"""
 
-def read_luw2_bag(zip_dir_path: str) -> Optional[OccurrenceBag]:
-    zip_path = os.path.join(zip_dir_path, "BCCWJ_frequencylist_luw2_ver1_1.zip")
-    return OccurrenceReader() \
+def reader(zip_path: str, path: str, key_filter: Optional[KeyFilter]) -> OccurrenceReader:
+    reader = OccurrenceReader() \
         .with_zip_path(zip_path) \
-        .add_path("BCCWJ_frequencylist_luw2_ver1_1.tsv") \
+        .add_path(path) \
         .with_separator("\t") \
         .with_skip_lines(1) \
         .with_text_index(2) \
         .with_reading_index(1) \
-        .with_count_index(6) \
-        .maybe_read()
+        .with_count_index(6)
+    if key_filter is not None:
+        reader.with_key_filter(*key_filter)
+    return reader
+
+def read_suw_bag(zip_dir_path: str, key_filter: Optional[KeyFilter] = None) -> OccurrenceBag:
+    zip_path = os.path.join(zip_dir_path, SUW_ZIP_NAME)
+    return reader(zip_path, "BCCWJ_frequencylist_suw_ver1_1.tsv", key_filter).read()
+
+def read_luw2_bag(zip_dir_path: str, key_filter: Optional[KeyFilter] = None) -> Optional[OccurrenceBag]:
+    zip_path = os.path.join(zip_dir_path, LUW2_ZIP_NAME)
+    return reader(zip_path, "BCCWJ_frequencylist_luw2_ver1_1.tsv", key_filter).maybe_read()
 
-def read_bag(zip_dir_path: str) -> Tuple[OccurrenceBag, bool]:
-    suw_bag = read_suw_bag(zip_dir_path)
-    luw_bag = read_luw2_bag(zip_dir_path)
+def read_bag(zip_dir_path: str, key_filter: Optional[KeyFilter] = None) -> Tuple[OccurrenceBag, bool]:
+    """
+    Read the SUW bag, extended by the LUW2 bag if it exists.
+
+    A key filter drops the rows of terms that are not needed, see OccurrenceReader.with_key_filter.
+    """
+    suw_bag = read_suw_bag(zip_dir_path, key_filter)
+    luw_bag = read_luw2_bag(zip_dir_path, key_filter)
     if luw_bag is None:
         return suw_bag, False
     else:
@@ -43,6 +56,22 @@ def read_bag(zip_dir_path: str) -> Tuple[OccurrenceBag, bool]:
         return luw_bag, True
 
 
+def rank_dictionary(counts: Dict[Term, int], includes_luw: bool, max_rank: int) -> Dictionary:
+    it = rank.from_counts(counts)
+    it = rank.below_max_rank(it, max_rank)
+    suw_luw_version = "SUW+LUW" if includes_luw else "SUW"
+
+    return Rank.dictionary(list(it)) \
+        .with_title("書き言葉") \
+        .with_revision(f"data v1.1 (2017-12) yomi v{date.today().isoformat()} {suw_luw_version}") \
+        .with_author("NINJAL, uncomputable") \
+        .with_url("https://github.com/uncomputable/japanese-tools") \
+        .with_description("""『現代日本語書き言葉均衡コーパス（BCCWJ）』は、現代日本語の書き言葉の全体像を把握するために構築したコーパスであり、現在、日本語について入手可能な唯一の均衡コーパスです。
+
+        https://clrd.ninjal.ac.jp/bccwj/index.html""") \
+        .with_attribution("CC BY-NC-ND 3.0 https://creativecommons.org/licenses/by-nc-nd/3.0/deed.ja")
+
+
 class TestBCCWJ(unittest.TestCase):
     def test_read_suw(self):
         suw_bag = read_suw_bag("../data")
@@ -59,24 +88,14 @@ if __name__ == "__main__":
     parser.add_argument("path_in", type=str, help="Path to directory with BCCWJ zip files")
     parser.add_argument("path_out", type=str, help="Path of output dictionary")
     parser.add_argument("--max", type=int, default=80000, help="Maximum term frequency included in dictionary")
+    profiling.add_arguments(parser)
 
     args = parser.parse_args()
 
-    bag, includes_luw = read_bag(args.path_in)
-    it = rank.from_counts(bag.to_counts())
-    it = rank.below_max_rank(it, args.max)
-    suw_luw_version = "SUW+LUW" if includes_luw else "SUW"
-
-    Rank.dictionary(list(it)) \
-        .with_title("書き言葉") \
-        .with_revision(f"data v1.1 (2017-12) yomi v{date.today().isoformat()} {suw_luw_version}") \
-        .with_author("NINJAL, uncomputable") \
-        .with_url("https://github.com/uncomputable/japanese-tools") \
-        .with_description("""『現代日本語書き言葉均衡コーパス（BCCWJ）』は、現代日本語の書き言葉の全体像を把握するために構築したコーパスであり、現在、日本語について入手可能な唯一の均衡コーパスです。
-
-        https://clrd.ninjal.ac.jp/bccwj/index.html""") \
-        .with_attribution("CC BY-NC-ND 3.0 https://creativecommons.org/licenses/by-nc-nd/3.0/deed.ja") \
-        .writer() \
-        .with_path(args.path_out) \
-        .in_chunks(10000) \
-        .write()
+    with profiling.from_args(args):
+        bag, includes_luw = read_bag(args.path_in)
+        rank_dictionary(bag.to_counts(), includes_luw, args.max) \
+            .writer() \
+            .with_path(args.path_out) \
+            .in_chunks(10000) \
+            .write()
@@ -0,0 +1,185 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple
+import unittest
+
+import bccwj
+import chj
+import csj
+import rank
+import shc
+import synthetic
+from definition import Definition
+from occurrence import OccurrenceBag
+from rank import Rank
+
+Case = Tuple[str, Callable[[], Any]]
+
+
+@dataclass
+class Result:
+    name: str
+    seconds: float
+    """
+    Fastest time of all repetitions
+    """
+    peak_bytes: int
+    """
+    Peak of memory allocated by Python while running once, as traced by tracemalloc
+    """
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"seconds": round(self.seconds, 4), "peak_bytes": self.peak_bytes}
+
+    def __str__(self) -> str:
+        return f"{self.name:20} {self.seconds:8.3f} s {self.peak_bytes / 1024 / 1024:8.1f} MB"
+
+
+def measure(name: str, function: Callable[[], Any], repeat: int = 3) -> Result:
+    """
+    Time the function and then run it once more under tracemalloc for its peak memory.
+    Tracing slows allocation down, so it is kept out of the timed runs.
+    """
+    seconds = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        seconds = min(seconds, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        function()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Result(name, seconds, peak)
+
+
+def cases(directory: str, max_rank: int) -> List[Case]:
+    """
+    Benchmarks of reading, merging, ranking and writing on the synthetic data in the directory.
+    """
+    suw = bccwj.read_suw_bag(directory)
+    spoken = csj.read_suw_bag(directory)
+    counts = suw.to_counts()
+    dic = rank.convert_dictionary(Rank.dictionary(list(rank.from_counts(counts))), max_rank)
+    ranks_path = os.path.join(directory, "ranks.zip")
+    dic.writer().with_path(ranks_path).in_chunks(10000).write()
+
+    def merge() -> OccurrenceBag:
+        bag = OccurrenceBag()
+        bag.extend_distinct(suw)
+        bag.extend_overlap(spoken)
+        return bag
+
+    def write():
+        dic.writer().with_path(os.path.join(directory, "written.zip")).in_chunks(10000).write()
+
+    return [
+        ("read bccwj", lambda: bccwj.read_bag(directory)),
+        ("read shc utf-16", lambda: shc.read_suw_bag(directory)),
+        ("read chj premodern", lambda: chj.read_premodern_bag(directory)),
+        ("merge bags", merge),
+        ("count", suw.to_counts),
+        ("rank", lambda: list(rank.below_max_rank(rank.from_counts(counts), max_rank))),
+        ("write ranks", write),
+        ("read ranks", lambda: Rank.dictionary_reader().with_path(ranks_path).read()),
+        ("read definitions",
+         lambda: Definition.dictionary_reader().with_path(os.path.join(directory, "definitions.zip")).read()),
+    ]
+
+
+def run(rows: int, vocabulary_size: int, repeat: int = 3, max_rank: int = 80000) -> List[Result]:
+    with tempfile.TemporaryDirectory() as directory:
+        synthetic.write_corpora(directory, rows, vocabulary_size, names=["bccwj", "csj", "shc", "chj"])
+        vocabulary = synthetic.Vocabulary(vocabulary_size)
+        synthetic.definition_dictionary(vocabulary, vocabulary_size // 2).writer() \
+            .with_path(os.path.join(directory, "definitions.zip")) \
+            .in_chunks(10000) \
+            .write()
+
+        return [measure(name, function, repeat) for name, function in cases(directory, max_rank)]
+
+
+def compare(results: List[Result], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Describe every result that is slower or uses more memory than its baseline by more than the tolerance,
+    given as a fraction of the baseline.
+    Baselines of zero, such as times below the rounding of Result.to_json, are too small to compare and skipped.
+    """
+    regressions = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is None:
+            continue
+        for key, value in result.to_json().items():
+            if base[key] and value > base[key] * (1 + tolerance):
+                regressions.append(f"{result.name}: {key} {base[key]} -> {value} (+{value / base[key] - 1:.0%})")
+    return regressions
+
+
+def slow():
+    time.sleep(0.01)
+
+
+def allocate() -> List[int]:
+    return list(range(100000))
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_measure(self):
+        result = measure("slow", slow, 2)
+        self.assertGreaterEqual(result.seconds, 0.01)
+        self.assertGreater(measure("allocate", allocate, 1).peak_bytes, 800000)
+
+    def test_compare(self):
+        results = [Result("a", 1.5, 100), Result("b", 1.0, 300), Result("new", 1.0, 100)]
+        baseline = {"a": {"seconds": 1.0, "peak_bytes": 100}, "b": {"seconds": 1.0, "peak_bytes": 100}}
+        self.assertEqual(["a: seconds 1.0 -> 1.5 (+50%)", "b: peak_bytes 100 -> 300 (+200%)"],
+                         compare(results, baseline, 0.25))
+        self.assertEqual([], compare(results, baseline, 2.5))
+        self.assertEqual([], compare([Result("fast", 0.001, 100)], {"fast": {"seconds": 0.0, "peak_bytes": 100}}, 0.25))
+
+    def test_run(self):
+        results = run(200, 100, repeat=1, max_rank=50)
+        self.assertEqual(9, len(results))
+        self.assertTrue(all(x.seconds > 0 and x.peak_bytes > 0 for x in results))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time reading, merging, ranking and writing on synthetic corpora")
+
+    parser.add_argument("--rows", type=int, default=200000, help="Number of rows of each synthetic frequency list")
+    parser.add_argument("--vocabulary", type=int, default=100000, help="Number of distinct synthetic terms")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs of each benchmark")
+    parser.add_argument("--baseline", type=str, default=None, help="Path to JSON file of baseline results")
+    parser.add_argument("--save", action="store_true", help="Write the results to the baseline file")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Fraction by which a result may exceed its baseline")
+
+    args = parser.parse_args()
+
+    results = run(args.rows, args.vocabulary, args.repeat)
+    for result in results:
+        print(result)
+
+    scale = {"rows": args.rows, "vocabulary": args.vocabulary}
+    if args.baseline is not None and args.save:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"scale": scale, "results": {x.name: x.to_json() for x in results}}, f, indent=1)
+    elif args.baseline is not None:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline["scale"] != scale:
+            parser.error(f"baseline was measured at a different scale: {baseline['scale']}")
+        regressions = compare(results, baseline["results"], args.tolerance)
+        for regression in regressions:
+            print(f"Regression {regression}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
@@ -0,0 +1,278 @@
+import argparse
+import operator
+from itertools import islice, repeat
+import random
+import time
+from array import array
+from datetime import date
+from typing import Dict, List, Mapping, Iterator, Optional
+import unittest
+
+import bccwj
+import chj
+import csj
+import nwjc
+import profiling
+import shc
+from arguments import with_weight
+from dictionary import Dictionary
+from occurrence import OccurrenceBag
+from rank import Rank
+from term import Term
+
+METHODS = ["frequency", "borda", "reciprocal"]
+"""
+Ways of combining corpora.
+
+Frequency takes the weighted mean of the per-million frequency of each term and needs counts.
+Borda gives each term 1 - rank / size points per corpus, and reciprocal rank fusion 1 / (k + rank).
+Both rank methods also accept rank dictionaries.
+Terms missing from a corpus get no points from it.
+"""
+RECIPROCAL_K = 60
+
+
+class Column:
+    """
+    Values of one corpus for the terms it contains, as parallel arrays of term ids and values.
+    """
+    ids: array
+    ranks: Optional[array]
+    """
+    Rank of each term, starting at 0, computed from the frequencies when first needed
+    """
+    frequencies: Optional[array]
+    """
+    Occurrences per million tokens of each term, if the corpus has counts
+    """
+    weight: float
+
+    def __init__(self, ids: array, ranks: Optional[array], frequencies: Optional[array], weight: float):
+        assert ranks is not None or frequencies is not None
+        self.ids = ids
+        self.ranks = ranks
+        self.frequencies = frequencies
+        self.weight = weight
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def get_ranks(self) -> array:
+        if self.ranks is None:
+            assert self.frequencies is not None
+            # Ties keep their order, as in rank.from_counts
+            order = sorted(range(len(self)), key=self.frequencies.__getitem__, reverse=True)
+            ranks = array("I", bytes(4 * len(self)))
+            for r, i in enumerate(order):
+                ranks[i] = r
+            self.ranks = ranks
+        return self.ranks
+
+
+class Blender:
+    """
+    Combines the counts or ranks of several corpora into a single ranking.
+
+    Terms of all corpora are numbered once.
+    Each corpus becomes a column of values indexed by term id,
+    and columns are combined element-wise over the union of term ids.
+    """
+    terms: List[Term]
+    ids: Dict[Term, int]
+    columns: List[Column]
+
+    def __init__(self):
+        self.terms = []
+        self.ids = dict()
+        self.columns = []
+
+    def term_ids(self, terms: List[Term]) -> array:
+        ids = self.ids
+        setdefault = ids.setdefault
+        # New terms get the next id, which is the size of the map before insertion
+        result = array("I", [setdefault(term, len(ids)) for term in terms])
+        self.terms.extend(islice(ids, len(self.terms), None))
+        return result
+
+    def add_counts(self, counts: Mapping[Term, int], weight: float = 1.0) -> "Blender":
+        total = sum(counts.values())
+        scale = 1e6 / total if total else 0.0
+        ids = self.term_ids(list(counts))
+        frequencies = array("d", [count * scale for count in counts.values()])
+        self.columns.append(Column(ids, None, frequencies, weight))
+        return self
+
+    def add_bag(self, bag: OccurrenceBag, weight: float = 1.0) -> "Blender":
+        return self.add_counts(bag.to_counts(), weight)
+
+    def add_ranks(self, dic: Dictionary, weight: float = 1.0) -> "Blender":
+        """
+        Add a rank dictionary.
+
+        If a term occurs more than once, its best rank counts.
+        """
+        best: Dict[Term, int] = dict()
+        for x in dic:
+            if x.term not in best or x.rank < best[x.term]:
+                best[x.term] = x.rank
+        ids = self.term_ids(list(best))
+        self.columns.append(Column(ids, array("I", best.values()), None, weight))
+        return self
+
+    def column_scores(self, column: Column, method: str) -> array:
+        """
+        Points of each term of the column under the given method, before weighting.
+        """
+        if method == "frequency":
+            if column.frequencies is None:
+                raise ValueError("Frequency blending needs counts, not rank dictionaries")
+            return column.frequencies
+        if method == "borda":
+            size = len(column)
+            return array("d", [1.0 - r / size for r in column.get_ranks()])
+        if method == "reciprocal":
+            return array("d", [1.0 / (RECIPROCAL_K + r) for r in column.get_ranks()])
+        raise ValueError(f"Unknown blending method: {method}")
+
+    def scores(self, method: str = "borda") -> array:
+        """
+        Blended score of each term id.
+
+        For frequency blending, the weights are normalized to sum to one,
+        so the result is again in occurrences per million.
+        """
+        total_weight = sum(column.weight for column in self.columns)
+        if method == "frequency" and total_weight:
+            weights = [column.weight / total_weight for column in self.columns]
+        else:
+            weights = [column.weight for column in self.columns]
+
+        scores = array("d", bytes(8 * len(self.terms)))
+        for column, weight in zip(self.columns, weights):
+            values = self.column_scores(column, method)
+            if weight != 1.0:
+                values = array("d", map(operator.mul, values, repeat(weight, len(values))))
+            for i, value in zip(column.ids, values):
+                scores[i] += value
+        return scores
+
+    def ranks(self, method: str = "borda") -> Iterator[Rank]:
+        """
+        Iterate over all terms from the highest to the lowest blended score.
+
+        Ties keep the order in which the terms were first added.
+        """
+        scores = self.scores(method)
+        order = sorted(range(len(self.terms)), key=scores.__getitem__, reverse=True)
+        terms = self.terms
+        for position, i in enumerate(order):
+            yield Rank(terms[i], position)
+
+
+def blend_dictionary(blender: Blender, method: str, max_rank: int) -> Dictionary:
+    # Ranks are consecutive, so the ones below the maximum come first
+    it = islice(blender.ranks(method), max_rank)
+
+    return Rank.dictionary(list(it)) \
+        .with_title("総合") \
+        .with_revision(f"{method} blend of {len(blender.columns)} corpora yomi v{date.today().isoformat()}") \
+        .with_author("NINJAL, uncomputable") \
+        .with_url("https://github.com/uncomputable/japanese-tools")
+
+
+def read_corpus_counts(name: str, data_dir: str) -> Dict[Term, int]:
+    if name == "bccwj":
+        return bccwj.read_bag(data_dir)[0].to_counts()
+    if name in ["csj", "nwjc", "shc"]:
+        return {"csj": csj, "nwjc": nwjc, "shc": shc}[name].read_suw_bag(data_dir).to_counts()
+    if name == "chj-modern":
+        return chj.read_modern_bag(data_dir).to_counts()
+    if name == "chj-premodern":
+        return chj.read_premodern_bag(data_dir).to_counts()
+    raise ValueError(f"Unknown corpus: {name}")
+
+
+def random_counts(vocabulary: List[Term], size: int) -> Dict[Term, int]:
+    """
+    Zipf-like counts of a random sample of the vocabulary.
+    """
+    return {term: 1000000 // (i + 1) + 1 for i, term in enumerate(random.sample(vocabulary, size))}
+
+
+class TestBlend(unittest.TestCase):
+    a, b, c, d = Term("学校", "がっこう"), Term("川", "かわ"), Term("海", "うみ"), Term("水", "みず")
+
+    def test_frequency(self):
+        blender = Blender() \
+            .add_counts({self.a: 30, self.b: 10}) \
+            .add_counts({self.c: 900, self.b: 100}, weight=3.0)
+        scores = blender.scores("frequency")
+        # Per million: a 750k, b 250k + 3 * 100k, c 3 * 900k, all divided by the weight sum 4
+        self.assertEqual([187500.0, 137500.0, 675000.0], list(scores))
+        self.assertEqual([self.c, self.a, self.b], [x.term for x in blender.ranks("frequency")])
+
+    def test_rank_methods(self):
+        ranks = Rank.dictionary([Rank(self.b, 0), Rank(self.d, 1), Rank(self.b, 5)])
+        blender = Blender() \
+            .add_counts({self.a: 5, self.b: 4}) \
+            .add_ranks(ranks)
+        self.assertEqual([1.0, 1.5, 0.5], list(blender.scores("borda")))
+        self.assertEqual([self.b, self.a, self.d], [x.term for x in blender.ranks("borda")])
+        self.assertEqual([self.b, self.a, self.d], [x.term for x in blender.ranks("reciprocal")])
+        self.assertRaises(ValueError, blender.scores, "frequency")
+        self.assertRaises(ValueError, blender.scores, "unknown")
+
+    def test_blend_dictionary(self):
+        blender = Blender().add_counts({self.a: 3, self.b: 2, self.c: 1})
+        dic = blend_dictionary(blender, "frequency", 2)
+        self.assertEqual([Rank(self.a, 0), Rank(self.b, 1)], dic.data)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Blend several corpora into one frequency dictionary")
+
+    parser.add_argument("path_out", type=str, nargs="?", help="Path of output dictionary")
+    parser.add_argument("--data", type=str, help="Path to directory with corpus zip files")
+    parser.add_argument("--corpus", type=str, action="append", default=[],
+                        help="Corpus in the data directory as NAME[=WEIGHT], "
+                             "one of bccwj, csj, nwjc, shc, chj-modern, chj-premodern")
+    parser.add_argument("--rank", type=str, action="append", default=[],
+                        help="Rank dictionary as PATH[=WEIGHT]")
+    parser.add_argument("--method", choices=METHODS, default="borda", help="How to combine the corpora")
+    parser.add_argument("--max", type=int, default=80000, help="Maximum term frequency in output")
+    parser.add_argument("--benchmark", action="store_true", help="Blend five synthetic corpora and report the time")
+    profiling.add_arguments(parser)
+
+    args = parser.parse_args()
+
+    with profiling.from_args(args):
+        if args.benchmark:
+            vocabulary = [Term(f"語{i}", f"ご{i}") for i in range(1000000)]
+            sizes = [100000, 200000, 400000, 600000, 800000]
+            corpora = [random_counts(vocabulary, size) for size in sizes]
+            for method in METHODS:
+                start = time.perf_counter()
+                blender = Blender()
+                for counts in corpora:
+                    blender.add_counts(counts)
+                added = time.perf_counter()
+                dic = blend_dictionary(blender, method, args.max)
+                end = time.perf_counter()
+                print(f"{method:10} {len(blender.terms)} terms: add {added - start:6.2f} s blend {end - added:6.2f} s")
+        else:
+            if args.path_out is None:
+                parser.error("the following arguments are required: path_out")
+
+            blender = Blender()
+            for argument in args.corpus:
+                name, weight = with_weight(argument)
+                blender.add_counts(read_corpus_counts(name, args.data), weight)
+            for argument in args.rank:
+                path, weight = with_weight(argument)
+                blender.add_ranks(Rank.dictionary_reader().with_path(path).read(), weight)
+
+            blend_dictionary(blender, args.method, args.max) \
+                .writer() \
+                .with_path(args.path_out) \
+                .in_chunks(10000) \
+                .write()
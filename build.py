@@ -0,0 +1,626 @@
+import argparse
+import ast
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from types import CodeType
+from typing import List, Any, Dict, Set, Tuple, Callable, Optional
+import unittest
+
+import bccwj
+import chj
+import csj
+import jlpt
+import nwjc
+import profiling
+import rank
+import shc
+import shinmeikai
+from dictionary import Dictionary
+from rank import Rank
+from term import Term
+
+
+@dataclass(frozen=True)
+class Target:
+    """
+    Node in the build graph.
+
+    Instances of this class are immutable.
+    """
+    name: str
+    """
+    Unique name of the target.
+    """
+    function: Callable[..., Any]
+    """
+    Function that builds the target.
+
+    It is called with the results of the dependencies followed by the arguments.
+    It has to be picklable to run in a process pool.
+    """
+    args: Tuple[Any, ...] = ()
+    """
+    Additional arguments of the function.
+    """
+    dependencies: Tuple[str, ...] = ()
+    """
+    Names of the targets whose results are passed to the function.
+    """
+    inputs: Tuple[str, ...] = ()
+    """
+    Paths of the data files that the target reads.
+    """
+    sources: Tuple[str, ...] = ()
+    """
+    Names of the modules whose code determines the output, in addition to the source of the function
+    and of the functions of its module that it uses.
+
+    Local modules that these modules import are included automatically.
+    """
+    output: Optional[str] = None
+    """
+    Path of the file that the target writes, if any.
+
+    Targets without output only exist to share their result with dependent targets.
+    """
+
+
+@dataclass(frozen=True)
+class Timing:
+    """
+    Outcome of building a target.
+
+    Instances of this class are immutable.
+    """
+    name: str
+    seconds: float
+    error: Optional[str] = None
+
+
+def run_target(function: Callable[..., Any], args: Tuple[Any, ...]) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def with_dependencies(targets: List[Target], names: List[str]) -> List[Target]:
+    """
+    Select the named targets plus everything they depend on, in topological order.
+    """
+    by_name = {target.name: target for target in targets}
+    selected: List[Target] = []
+    visiting = set()
+    visited = set()
+
+    def visit(name: str):
+        if name in visited:
+            return
+        if name in visiting:
+            raise ValueError(f"Dependency cycle through {name}")
+        if name not in by_name:
+            raise ValueError(f"Unknown target: {name}")
+        visiting.add(name)
+        for dependency in by_name[name].dependencies:
+            visit(dependency)
+        visiting.remove(name)
+        visited.add(name)
+        selected.append(by_name[name])
+
+    for name in names:
+        visit(name)
+    return selected
+
+
+def run(targets: List[Target], processes: int = 1) -> List[Timing]:
+    """
+    Build the targets in dependency order.
+
+    Independent targets run in a process pool.
+    Results of a target are shared with every dependent target
+    and released once all of them have started.
+    If a target fails, its dependents are skipped.
+
+    With a single process, targets run one after another in the current process.
+    """
+    targets = with_dependencies(targets, [target.name for target in targets])
+    results: Dict[str, Any] = dict()
+    remaining_users = {target.name: 0 for target in targets}
+    for target in targets:
+        for dependency in target.dependencies:
+            remaining_users[dependency] += 1
+    timings: List[Timing] = []
+    failed = set()
+
+    def arguments(target: Target) -> Tuple[Any, ...]:
+        args = tuple(results[dependency] for dependency in target.dependencies) + target.args
+        for dependency in target.dependencies:
+            remaining_users[dependency] -= 1
+            if remaining_users[dependency] == 0:
+                del results[dependency]
+        return args
+
+    def finish(target: Target, outcome: Callable[[], Tuple[Any, float]]):
+        try:
+            result, seconds = outcome()
+        except Exception as e:
+            failed.add(target.name)
+            timings.append(Timing(target.name, 0.0, f"{type(e).__name__}: {e}"))
+            return
+        if remaining_users[target.name] > 0:
+            results[target.name] = result
+        timings.append(Timing(target.name, seconds))
+
+    def skipped(target: Target) -> bool:
+        if any(dependency in failed for dependency in target.dependencies):
+            failed.add(target.name)
+            timings.append(Timing(target.name, 0.0, "skipped"))
+            return True
+        return False
+
+    if processes <= 1:
+        for target in targets:
+            if not skipped(target):
+                args = arguments(target)
+                finish(target, lambda: run_target(target.function, args))
+        return timings
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        waiting = list(targets)
+        running: Dict[Future, Target] = dict()
+        done = set()
+
+        while waiting or running:
+            for target in list(waiting):
+                if all(dependency in done for dependency in target.dependencies):
+                    waiting.remove(target)
+                    if skipped(target):
+                        done.add(target.name)
+                    else:
+                        future = executor.submit(run_target, target.function, arguments(target))
+                        running[future] = target
+            if not running:
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                target = running.pop(future)
+                finish(target, future.result)
+                done.add(target.name)
+
+    return timings
+
+
+def local_imports(path: str) -> List[str]:
+    """
+    Paths of the modules next to the given module that it imports.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), path)
+
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.append(node.module)
+
+    directory = os.path.dirname(path)
+    paths = [os.path.join(directory, f"{name}.py") for name in names]
+    return [path for path in paths if os.path.isfile(path)]
+
+
+def local_sources(paths: List[str]) -> List[str]:
+    """
+    Paths of the given modules plus the paths of all local modules they import, transitively.
+    """
+    found = set()
+    stack = [os.path.abspath(path) for path in paths]
+    while stack:
+        path = stack.pop()
+        if path not in found:
+            found.add(path)
+            stack.extend(os.path.abspath(imported) for imported in local_imports(path))
+    return sorted(found)
+
+
+def code_names(code: CodeType) -> Set[str]:
+    """
+    Global names used by the code, including its nested functions and comprehensions.
+    """
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= code_names(const)
+    return names
+
+
+def function_sources(function: Callable[..., Any]) -> Dict[str, str]:
+    """
+    Content hashes of the source of the function and of the functions of its module that it uses, transitively.
+    """
+    found: Dict[str, str] = dict()
+    stack = [function]
+    while stack:
+        f = stack.pop()
+        if f.__qualname__ in found:
+            continue
+        found[f.__qualname__] = hashlib.sha256(inspect.getsource(f).encode("utf-8")).hexdigest()
+        for name in code_names(f.__code__):
+            value = function.__globals__.get(name)
+            if inspect.isfunction(value) and value.__module__ == function.__module__:
+                stack.append(value)
+    return found
+
+
+def module_path(name: str) -> str:
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), f"{name}.py")
+
+
+class BuildCache:
+    """
+    Record of the fingerprint of each output, so that up-to-date outputs can be skipped.
+
+    The fingerprint of a target covers the function and its arguments,
+    the content of its input files, the code of its modules
+    and the fingerprints of its dependencies.
+    Outputs themselves are not fingerprinted,
+    so metadata that changes on every build, such as the revision date, does not cause rebuilds.
+
+    Content hashes of files are reused as long as their size and modification time stay the same.
+    """
+    path: str
+    files: Dict[str, Dict[str, Any]]
+    """
+    Maps absolute file paths to their size, modification time and content hash.
+    """
+    fingerprints: Dict[str, str]
+    """
+    Maps target names to the fingerprint of their last successful build.
+    """
+    current: Dict[str, str]
+    """
+    Maps target names to their fingerprint as of this build.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.files = dict()
+        self.fingerprints = dict()
+        self.current = dict()
+
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                obj = json.load(f)
+            self.files = obj.get("files", dict())
+            self.fingerprints = obj.get("fingerprints", dict())
+
+    def save(self):
+        obj = {"files": self.files, "fingerprints": self.fingerprints}
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, ensure_ascii=False, indent=1, sort_keys=True)
+
+    def file_hash(self, path: str) -> str:
+        path = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return "missing"
+
+        entry = self.files.get(path)
+        if entry is not None and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["sha256"]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        sha256 = digest.hexdigest()
+        self.files[path] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha256}
+        return sha256
+
+    def fingerprint(self, target: Target, by_name: Dict[str, Target]) -> str:
+        if target.name in self.current:
+            return self.current[target.name]
+
+        # Only the functions the target uses, because their module imports the modules of all other targets
+        sources = local_sources([module_path(name) for name in target.sources])
+        obj = {
+            "function": target.function.__qualname__,
+            "function_sources": function_sources(target.function),
+            "args": repr(target.args),
+            "inputs": {path: self.file_hash(path) for path in target.inputs},
+            "sources": {os.path.basename(path): self.file_hash(path) for path in sources},
+            "dependencies": [self.fingerprint(by_name[name], by_name) for name in target.dependencies],
+        }
+        fingerprint = hashlib.sha256(json.dumps(obj, sort_keys=True).encode("utf-8")).hexdigest()
+        self.current[target.name] = fingerprint
+        return fingerprint
+
+    def is_up_to_date(self, target: Target, by_name: Dict[str, Target]) -> bool:
+        if target.output is None or not os.path.exists(target.output):
+            return False
+        return self.fingerprints.get(target.name) == self.fingerprint(target, by_name)
+
+    def outdated(self, targets: List[Target]) -> List[Target]:
+        """
+        Select the targets whose output is missing or out of date, plus everything they depend on.
+        """
+        by_name = {target.name: target for target in targets}
+        names = [target.name for target in targets
+                 if target.output is not None and not self.is_up_to_date(target, by_name)]
+        return with_dependencies(targets, names)
+
+    def record(self, targets: List[Target], timings: List[Timing]):
+        """
+        Remember the fingerprints of the outputs that were built successfully.
+        """
+        by_name = {target.name: target for target in targets}
+        for timing in timings:
+            target = by_name[timing.name]
+            if timing.error is None and target.output is not None:
+                self.fingerprints[target.name] = self.fingerprint(target, by_name)
+
+
+def print_summary(timings: List[Timing], total_seconds: float):
+    width = max([len(timing.name) for timing in timings] + [5])
+    for timing in timings:
+        status = timing.error if timing.error is not None else "ok"
+        print(f"{timing.name:{width}} {timing.seconds:8.2f} s  {status}")
+    print(f"{'total':{width}} {total_seconds:8.2f} s")
+
+
+def write(dic: Dictionary, path_out: str):
+    dic \
+        .writer() \
+        .with_path(path_out) \
+        .in_chunks(10000) \
+        .write()
+
+
+def read_bccwj_counts(path_in: str) -> Tuple[Dict[Term, int], bool]:
+    bag, includes_luw = bccwj.read_bag(path_in)
+    return bag.to_counts(), includes_luw
+
+
+def build_bccwj(bccwj_counts: Tuple[Dict[Term, int], bool], path_out: str, max_rank: int):
+    counts, includes_luw = bccwj_counts
+    write(bccwj.rank_dictionary(counts, includes_luw, max_rank), path_out)
+
+
+def build_suw(module: str, path_in: str, path_out: str, max_rank: int):
+    corpus = {"csj": csj, "nwjc": nwjc, "shc": shc}[module]
+    bag = corpus.read_suw_bag(path_in)
+    write(corpus.rank_dictionary(bag.to_counts(), max_rank), path_out)
+
+
+def build_chj(modern: bool, path_in: str, path_out: str, max_rank: int):
+    bag = chj.read_modern_bag(path_in) if modern else chj.read_premodern_bag(path_in)
+    write(chj.rank_dictionary(bag.to_counts(), modern, max_rank), path_out)
+
+
+def build_shinmeikai(bccwj_counts: Tuple[Dict[Term, int], bool], path_in: str, path_out: str):
+    counts, _includes_luw = bccwj_counts
+    dic = shinmeikai.read_dictionary(path_in)
+    write(shinmeikai.upgrade_dictionary(dic, counts), path_out)
+
+
+def build_rank(path_in: str, path_out: str, max_rank: int):
+    dic = Rank.dictionary_reader() \
+        .with_path(path_in) \
+        .read()
+    write_rank(dic, path_out, max_rank)
+
+
+def write_rank(dic: Dictionary, path_out: str, max_rank: int):
+    """
+    Convert a rank dictionary and write it as a single term bank, as the rank module does.
+    """
+    rank.convert_dictionary(dic, max_rank) \
+        .writer() \
+        .with_path(path_out) \
+        .write()
+
+
+def targets(data_dir: str, out_dir: str, max_rank: int, shinmeikai_dir: Optional[str] = None,
+            rank_in: Optional[str] = None) -> List[Target]:
+    """
+    Build graph of all dictionaries.
+
+    BCCWJ is read once and its counts are shared by the BCCWJ and Shinmeikai dictionaries.
+    Shinmeikai and the converted rank dictionary are only built if their inputs are given.
+    """
+    def out(name: str) -> str:
+        return os.path.join(out_dir, f"{name}.zip")
+
+    def data(name: str) -> str:
+        return os.path.join(data_dir, name)
+
+    graph = [
+        Target("bccwj-counts", read_bccwj_counts, (data_dir,),
+               inputs=(data(bccwj.SUW_ZIP_NAME), data(bccwj.LUW2_ZIP_NAME)), sources=("bccwj",)),
+        Target("bccwj", build_bccwj, (out("bccwj"), max_rank), ("bccwj-counts",),
+               sources=("bccwj",), output=out("bccwj")),
+        Target("csj", build_suw, ("csj", data_dir, out("csj"), max_rank),
+               inputs=(data(csj.ZIP_NAME),), sources=("csj",), output=out("csj")),
+        Target("nwjc", build_suw, ("nwjc", data_dir, out("nwjc"), max_rank),
+               inputs=(data(nwjc.ZIP_NAME),), sources=("nwjc",), output=out("nwjc")),
+        Target("shc", build_suw, ("shc", data_dir, out("shc"), max_rank),
+               inputs=(data(shc.ZIP_NAME),), sources=("shc",), output=out("shc")),
+        Target("chj-modern", build_chj, (True, data_dir, out("chj-modern"), max_rank),
+               inputs=(data(chj.ZIP_NAME),), sources=("chj",), output=out("chj-modern")),
+        Target("chj-premodern", build_chj, (False, data_dir, out("chj-premodern"), max_rank),
+               inputs=(data(chj.ZIP_NAME),), sources=("chj",), output=out("chj-premodern")),
+    ]
+    if shinmeikai_dir is not None:
+        graph.append(Target("shinmeikai", build_shinmeikai, (shinmeikai_dir, out("shinmeikai")), ("bccwj-counts",),
+                            inputs=(os.path.join(shinmeikai_dir, shinmeikai.ZIP_NAME), jlpt.LEVELS_PATH),
+                            sources=("shinmeikai",), output=out("shinmeikai")))
+    if rank_in is not None:
+        graph.append(Target("rank", build_rank, (rank_in, out("rank"), max_rank),
+                            inputs=(rank_in,), sources=("rank",), output=out("rank")))
+    return graph
+
+
+def add(x: int, y: int) -> int:
+    return x + y
+
+
+def fail():
+    raise ValueError("Failure")
+
+
+def copy_file(path_in: str, path_out: str):
+    with open(path_in, "rb") as f_in, open(path_out, "wb") as f_out:
+        f_out.write(f_in.read())
+
+
+class TestBuild(unittest.TestCase):
+    graph = [
+        Target("sum", add, (), ("one", "two")),
+        Target("one", add, (0, 1)),
+        Target("two", add, (1, 1)),
+        Target("more", add, (10,), ("sum",)),
+        Target("broken", fail),
+        Target("after-broken", add, (1,), ("broken",)),
+    ]
+
+    def test_with_dependencies(self):
+        names = [target.name for target in with_dependencies(self.graph, ["more"])]
+        self.assertEqual(["one", "two", "sum", "more"], names)
+
+        cycle = [Target("a", add, (), ("b",)), Target("b", add, (), ("a",))]
+        self.assertRaises(ValueError, with_dependencies, cycle, ["a"])
+        self.assertRaises(ValueError, with_dependencies, self.graph, ["missing"])
+
+    def test_run(self):
+        for processes in [1, 2]:
+            timings = {timing.name: timing for timing in run(self.graph, processes)}
+            self.assertEqual(set(target.name for target in self.graph), set(timings))
+            self.assertIsNone(timings["more"].error)
+            self.assertIn("ValueError", timings["broken"].error)
+            self.assertEqual("skipped", timings["after-broken"].error)
+
+    def test_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path_in = os.path.join(directory, "in.txt")
+            path_out = os.path.join(directory, "out.txt")
+            cache_path = os.path.join(directory, "cache.json")
+            graph = [Target("copy", copy_file, (path_in, path_out), inputs=(path_in,), output=path_out)]
+
+            def build() -> List[str]:
+                cache = BuildCache(cache_path)
+                outdated = cache.outdated(graph)
+                cache.record(outdated, run(outdated))
+                cache.save()
+                return [target.name for target in outdated]
+
+            with open(path_in, "w") as f:
+                f.write("a")
+            self.assertEqual(["copy"], build())
+            self.assertEqual([], build())
+
+            # Same content with a new modification time
+            os.utime(path_in, ns=(0, 0))
+            self.assertEqual([], build())
+
+            with open(path_in, "w") as f:
+                f.write("b")
+            os.utime(path_in, ns=(1, 1))
+            self.assertEqual(["copy"], build())
+
+            os.remove(path_out)
+            self.assertEqual(["copy"], build())
+
+    def test_fingerprint_sources(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = BuildCache(os.path.join(directory, "cache.json"))
+            csj_target = Target("csj", build_suw, ("csj", directory, "csj.zip", 10), sources=("csj",))
+            cache.fingerprint(csj_target, {"csj": csj_target})
+            names = {os.path.basename(path) for path in cache.files}
+            self.assertIn("csj.py", names)
+            self.assertNotIn("build.py", names)
+            self.assertNotIn("shinmeikai.py", names)
+        self.assertEqual({"build_suw", "write"}, set(function_sources(build_suw)))
+
+    def test_changed_helper(self):
+        with tempfile.TemporaryDirectory() as directory:
+            module_file = os.path.join(directory, "helper_target.py")
+            path_out = os.path.join(directory, "out.txt")
+            cache_path = os.path.join(directory, "cache.json")
+
+            def load(helper_body: str) -> Target:
+                with open(module_file, "w", encoding="utf-8") as f:
+                    f.write(f"def helper(path):\n    {helper_body}\n\n"
+                            "def make(path):\n    with open(path, 'w') as f:\n        f.write(helper(path))\n")
+                spec = importlib.util.spec_from_file_location("helper_target", module_file)
+                assert spec is not None and spec.loader is not None
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                return Target("make", module.make, (path_out,), output=path_out)
+
+            def build(graph: List[Target]) -> List[str]:
+                cache = BuildCache(cache_path)
+                outdated = cache.outdated(graph)
+                cache.record(outdated, run(outdated))
+                cache.save()
+                return [target.name for target in outdated]
+
+            graph = [load("return 'a'")]
+            self.assertEqual(["make"], build(graph))
+            self.assertEqual([], build(graph))
+            self.assertEqual(["make"], build([load("return 'changed'")]))
+
+    def test_local_sources(self):
+        names = [os.path.basename(path) for path in local_sources([module_path("bccwj")])]
+        for name in ["bccwj.py", "rank.py", "occurrence.py", "conversion.py", "term.py", "dictionary.py"]:
+            self.assertIn(name, names)
+        self.assertNotIn("shinmeikai.py", names)
+
+    def test_results(self):
+        collected = []
+        graph = with_dependencies(self.graph, ["more"]) + [Target("collect", collected.append, (), ("more",))]
+        run(graph, 1)
+        self.assertEqual([13], collected)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build all dictionaries")
+
+    parser.add_argument("path_in", type=str, help="Path to directory with NINJAL zip files")
+    parser.add_argument("path_out", type=str, help="Path to directory of output dictionaries")
+    parser.add_argument("--shinmeikai", type=str, help="Path to directory with Shinmeikai dictionary")
+    parser.add_argument("--rank", type=str, help="Path to frequency dictionary to convert")
+    parser.add_argument("--max", type=int, default=80000, help="Maximum term frequency included in dictionaries")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="Number of parallel targets")
+    parser.add_argument("--targets", type=str, nargs="*", help="Names of targets to build; all by default")
+    parser.add_argument("--force", action="store_true", help="Rebuild targets even if they are up to date")
+    profiling.add_arguments(parser)
+
+    args = parser.parse_args()
+
+    with profiling.from_args(args):
+        graph = targets(args.path_in, args.path_out, args.max, args.shinmeikai, args.rank)
+        if args.targets:
+            graph = with_dependencies(graph, args.targets)
+
+        os.makedirs(args.path_out, exist_ok=True)
+        start = time.perf_counter()
+        cache = BuildCache(os.path.join(args.path_out, ".build-cache.json"))
+        if not args.force:
+            graph = cache.outdated(graph)
+        timings = run(graph, args.processes)
+        cache.record(graph, timings)
+        cache.save()
+        if not timings:
+            print("All targets are up to date")
+        print_summary(timings, time.perf_counter() - start)
+        if any(timing.error is not None for timing in timings):
+            sys.exit(1)
@@ -2,14 +2,20 @@ import argparse
 import os
 import unittest
 from datetime import date
+from typing import Dict
 
+import profiling
 import rank
+from dictionary import Dictionary
 from occurrence import OccurrenceBag, OccurrenceReader
 from rank import Rank
+from term import Term
 
 
+ZIP_NAME = "CHJ_integratedFequencyList_202303.zip"
+
 def read_modern_bag(zip_dir_path: str) -> OccurrenceBag:
-    zip_path = os.path.join(zip_dir_path, "CHJ_integratedFequencyList_202303.zip")
+    zip_path = os.path.join(zip_dir_path, ZIP_NAME)
     # Provenance: 作品名, 部, 本文種別
     return OccurrenceReader() \
         .with_zip_path(zip_path) \
@@ -27,7 +33,7 @@ def read_modern_bag(zip_dir_path: str) -> OccurrenceBag:
         .read()
 
 def read_premodern_bag(zip_dir_path: str) -> OccurrenceBag:
-    zip_path = os.path.join(zip_dir_path, "CHJ_integratedFequencyList_202303.zip")
+    zip_path = os.path.join(zip_dir_path, ZIP_NAME)
     # Provenance: 作品名, 部, 本文種別
     suw_bag = OccurrenceReader() \
         .with_zip_path(zip_path) \
@@ -60,30 +66,8 @@ def read_premodern_bag(zip_dir_path: str) -> OccurrenceBag:
     return luw_bag
 
 
-class TestCHJ(unittest.TestCase):
-    def test_read_modern(self):
-        bag = read_modern_bag("../data")
-        self.assertEqual(120109, len(bag))
-
-    def test_read_premodern(self):
-        bag = read_premodern_bag("../data")
-        self.assertEqual(104284, len(bag))
-
-
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Generate CHJ frequency dictionary")
-    parser.add_argument("path_in", type=str, help="Path to directory with CHJ zip file")
-    parser.add_argument("path_out", type=str, help="Path of output dictionary")
-    parser.add_argument("--max", type=int, default=80000, help="Maximum term frequency included in dictionary")
-
-    group = parser.add_mutually_exclusive_group(required=True)
-    group.add_argument("--modern", action="store_true", help="Use modern part")
-    group.add_argument("--premodern", action="store_false", dest="modern", help="Use premodern part")
-
-    args = parser.parse_args()
-
-    if args.modern:
-        bag = read_modern_bag(args.path_in)
+def rank_dictionary(counts: Dict[Term, int], modern: bool, max_rank: int) -> Dictionary:
+    if modern:
         title = "明治〜大正"
         suw_luw_version = "SUW"
         description = """ 『日本語歴史コーパス（CHJ）』は、デジタル時代における日本語史研究の基礎資料として開発を進めているコーパスです。
@@ -92,7 +76,6 @@ if __name__ == "__main__":
 
         https://clrd.ninjal.ac.jp/chj/index.html"""
     else:
-        bag = read_premodern_bag(args.path_in)
         title = "奈良〜江戸"
         suw_luw_version = "SUW+LUW"
         description = """『日本語歴史コーパス（CHJ）』は、デジタル時代における日本語史研究の基礎資料として開発を進めているコーパスです。
@@ -105,17 +88,49 @@ if __name__ == "__main__":
 
         https://clrd.ninjal.ac.jp/chj/index.html"""
 
-    it = rank.from_counts(bag.to_counts())
-    it = rank.below_max_rank(it, args.max)
+    it = rank.from_counts(counts)
+    it = rank.below_max_rank(it, max_rank)
 
-    Rank.dictionary(list(it)) \
+    return Rank.dictionary(list(it)) \
         .with_title(title) \
         .with_revision(f"data v2023-03 yomi yomi v{date.today().isoformat()} {suw_luw_version}") \
         .with_author("NINJAL, uncomputable") \
         .with_url("https://github.com/uncomputable/japanese-tools") \
         .with_description(description) \
-        .with_attribution("CC BY-NC-SA 4.0 https://creativecommons.org/licenses/by-nc-sa/4.0/deed.ja") \
-        .writer() \
-        .with_path(args.path_out) \
-        .in_chunks(10000) \
-        .write()
+        .with_attribution("CC BY-NC-SA 4.0 https://creativecommons.org/licenses/by-nc-sa/4.0/deed.ja")
+
+
+class TestCHJ(unittest.TestCase):
+    def test_read_modern(self):
+        bag = read_modern_bag("../data")
+        self.assertEqual(120109, len(bag))
+
+    def test_read_premodern(self):
+        bag = read_premodern_bag("../data")
+        self.assertEqual(104284, len(bag))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate CHJ frequency dictionary")
+    parser.add_argument("path_in", type=str, help="Path to directory with CHJ zip file")
+    parser.add_argument("path_out", type=str, help="Path of output dictionary")
+    parser.add_argument("--max", type=int, default=80000, help="Maximum term frequency included in dictionary")
+
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--modern", action="store_true", help="Use modern part")
+    group.add_argument("--premodern", action="store_false", dest="modern", help="Use premodern part")
+    profiling.add_arguments(parser)
+
+    args = parser.parse_args()
+
+    with profiling.from_args(args):
+        if args.modern:
+            bag = read_modern_bag(args.path_in)
+        else:
+            bag = read_premodern_bag(args.path_in)
+
+        rank_dictionary(bag.to_counts(), args.modern, args.max) \
+            .writer() \
+            .with_path(args.path_out) \
+            .in_chunks(10000) \
+            .write()
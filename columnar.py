@@ -0,0 +1,397 @@
+import argparse
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import unittest
+
+import bccwj
+import chj
+import csj
+import nwjc
+import shc
+import workers
+from occurrence import Occurrence, OccurrenceBag
+from term import Term
+
+MAGIC = b"YOMICOL1"
+HEADER = struct.Struct("<8sI")
+SECTION = struct.Struct("<QQ")
+SECTIONS = ["text_offsets", "texts", "reading_offsets", "readings", "provenance_offsets", "provenances",
+            "provenance_rows", "term_ids", "counts", "totals"]
+"""
+Sections of a store in file order.
+
+Strings are stored as one UTF-8 blob per table with the offsets of each string, plus the end.
+Rows are sorted by provenance and then by term,
+so the rows of provenance i are provenance_rows[i] to provenance_rows[i + 1].
+Totals hold the sum of the counts of each term over all provenances.
+"""
+TYPECODES = {"text_offsets": "Q", "reading_offsets": "Q", "provenance_offsets": "Q", "provenance_rows": "Q",
+             "term_ids": "I", "counts": "q", "totals": "q"}
+ALIGNMENT = 8
+MODES = ["distinct", "overlap"]
+"""
+How counts of the same term and provenance are merged, as in OccurrenceBag.extend_distinct and extend_overlap
+"""
+
+
+def string_table(strings: Sequence[str]) -> Tuple[array, bytes]:
+    offsets = array("Q", [0])
+    blobs = []
+    end = 0
+    for string in strings:
+        blob = string.encode("utf-8")
+        blobs.append(blob)
+        end += len(blob)
+        offsets.append(end)
+    return offsets, b"".join(blobs)
+
+
+def write_columns(path: str, terms: Sequence[Term], provenances: Sequence[str],
+                  rows: Iterator[Tuple[int, int, int]]):
+    """
+    Write a store from its terms, provenances and (provenance id, term id, count) rows.
+    Rows must be sorted by provenance id and then by term id.
+    """
+    provenance_rows = array("Q", [0] * (len(provenances) + 1))
+    term_ids = array("I")
+    counts = array("q")
+    totals = array("q", [0] * len(terms))
+    for provenance_id, term_id, count in rows:
+        provenance_rows[provenance_id + 1] += 1
+        term_ids.append(term_id)
+        counts.append(count)
+        totals[term_id] += count
+    for i in range(len(provenances)):
+        provenance_rows[i + 1] += provenance_rows[i]
+
+    text_offsets, texts = string_table([term.text for term in terms])
+    reading_offsets, readings = string_table([term.reading for term in terms])
+    provenance_offsets, provenance_blob = string_table(provenances)
+    sections: Dict[str, Any] = {
+        "text_offsets": text_offsets, "texts": texts,
+        "reading_offsets": reading_offsets, "readings": readings,
+        "provenance_offsets": provenance_offsets, "provenances": provenance_blob,
+        "provenance_rows": provenance_rows, "term_ids": term_ids, "counts": counts, "totals": totals,
+    }
+
+    # Write to a temporary file first, so that processes never map a half-written store
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        position = HEADER.size + SECTION.size * len(SECTIONS)
+        layout = []
+        for name in SECTIONS:
+            position += -position % ALIGNMENT
+            size = len(memoryview(sections[name]).cast("B"))
+            layout.append((position, size))
+            position += size
+
+        f.write(HEADER.pack(MAGIC, len(SECTIONS)))
+        for offset, size in layout:
+            f.write(SECTION.pack(offset, size))
+        for name, (offset, _size) in zip(SECTIONS, layout):
+            f.write(b"\0" * (offset - f.tell()))
+            f.write(sections[name])
+    os.replace(tmp_path, path)
+
+
+def write_bag(bag: OccurrenceBag, path: str):
+    """
+    Write an occurrence bag to a store.
+    Terms keep the order of the bag, so to_counts ranks ties in the same order as OccurrenceBag.to_counts.
+    """
+    terms = list(bag.data)
+    provenance_ids: Dict[str, int] = dict()
+    rows = []
+    for term_id, term in enumerate(terms):
+        for provenance, count in bag.data[term].items():
+            provenance_id = provenance_ids.setdefault(provenance, len(provenance_ids))
+            rows.append((provenance_id, term_id, count))
+    rows.sort()
+    write_columns(path, terms, list(provenance_ids), iter(rows))
+
+
+class ColumnarBag:
+    """
+    Occurrence bag in a memory-mapped file.
+
+    Opening maps the file without reading it; only the pages that are touched are loaded.
+    The mapping is read-only and backed by the page cache,
+    so processes that open the same store share its pages.
+    Counts are aggregated on the mapped arrays, and Python objects are only created for the results.
+    Views returned by provenance_slice stay valid after the store is closed,
+    and the file is unmapped once the last of them is released.
+    """
+    path: str
+    mapped: mmap.mmap
+    columns: Dict[str, memoryview]
+
+    def __init__(self, path: str):
+        if sys.byteorder != "little":
+            raise ValueError("Stores are little-endian")
+        self.path = path
+        with open(path, "rb") as f:
+            self.mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(self.mapped)
+        if len(view) < HEADER.size or HEADER.unpack_from(view, 0) != (MAGIC, len(SECTIONS)):
+            view.release()
+            self.mapped.close()
+            raise ValueError(f"Not a columnar store: {path}")
+
+        self.columns = dict()
+        for i, name in enumerate(SECTIONS):
+            offset, size = SECTION.unpack_from(view, HEADER.size + i * SECTION.size)
+            column = view[offset:offset + size]
+            self.columns[name] = column.cast(TYPECODES[name]) if name in TYPECODES else column
+        view.release()
+
+    def close(self):
+        for column in self.columns.values():
+            column.release()
+        self.columns = dict()
+        try:
+            self.mapped.close()
+        except BufferError:
+            # Views handed out by provenance_slice hold a reference to the mapping, which unmaps it when they go away
+            pass
+
+    def __enter__(self) -> "ColumnarBag":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.columns["totals"])
+
+    def string(self, table: str, index: int) -> str:
+        offsets = self.columns[f"{table[:-1]}_offsets"]
+        return bytes(self.columns[table][offsets[index]:offsets[index + 1]]).decode("utf-8")
+
+    def strings(self, table: str) -> List[str]:
+        """
+        Decode a whole string table at once, which is faster than decoding one string at a time.
+        """
+        offsets = self.columns[f"{table[:-1]}_offsets"]
+        blob = bytes(self.columns[table])
+        return [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(len(offsets) - 1)]
+
+    def term(self, term_id: int) -> Term:
+        return Term(self.string("texts", term_id), self.string("readings", term_id))
+
+    def terms(self) -> List[Term]:
+        return [Term(text, reading) for text, reading in zip(self.strings("texts"), self.strings("readings"))]
+
+    def provenances(self) -> List[str]:
+        return self.strings("provenances")
+
+    def provenance_id(self, provenance: str) -> int:
+        try:
+            return self.provenances().index(provenance)
+        except ValueError:
+            raise KeyError(provenance) from None
+
+    def provenance_slice(self, provenance: str) -> Tuple[memoryview, memoryview]:
+        """
+        Term ids and counts of the rows of one provenance, as views into the mapped file.
+        """
+        provenance_id = self.provenance_id(provenance)
+        rows = self.columns["provenance_rows"]
+        start, end = rows[provenance_id], rows[provenance_id + 1]
+        return self.columns["term_ids"][start:end], self.columns["counts"][start:end]
+
+    def to_counts(self) -> Dict[Term, int]:
+        return dict(zip(self.terms(), self.columns["totals"]))
+
+    def provenance_counts(self, provenance: str) -> Dict[Term, int]:
+        term_ids, counts = self.provenance_slice(provenance)
+        terms = self.terms()
+        return {terms[term_id]: count for term_id, count in zip(term_ids, counts)}
+
+    def provenance_totals(self) -> Dict[str, int]:
+        """
+        Sum of all counts of each provenance.
+        """
+        rows = self.columns["provenance_rows"]
+        counts = self.columns["counts"]
+        return {provenance: sum(counts[rows[i]:rows[i + 1]]) for i, provenance in enumerate(self.provenances())}
+
+    def to_bag(self) -> OccurrenceBag:
+        bag = OccurrenceBag()
+        terms = self.terms()
+        rows = self.columns["provenance_rows"]
+        term_ids = self.columns["term_ids"]
+        counts = self.columns["counts"]
+        for i, provenance in enumerate(self.provenances()):
+            for row in range(rows[i], rows[i + 1]):
+                bag.insert(Occurrence(terms[term_ids[row]], provenance), counts[row])
+        return bag
+
+
+def merge(stores: List[ColumnarBag], path: str, mode: str = "distinct"):
+    """
+    Merge stores into a new store, summing the counts of the same term and provenance
+    or taking their maximum.
+
+    Terms and provenances are matched by their strings,
+    and the rows are combined from the mapped arrays without creating terms.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode: {mode}")
+    combine: Callable[[int, int], int] = (lambda x, y: x + y) if mode == "distinct" else max
+
+    term_ids: Dict[Tuple[str, str], int] = dict()
+    provenance_ids: Dict[str, int] = dict()
+    merged: Dict[Tuple[int, int], int] = dict()
+    for store in stores:
+        term_map = [term_ids.setdefault(key, len(term_ids))
+                    for key in zip(store.strings("texts"), store.strings("readings"))]
+        rows = store.columns["provenance_rows"]
+        store_term_ids = store.columns["term_ids"]
+        counts = store.columns["counts"]
+        for i, provenance in enumerate(store.provenances()):
+            provenance_id = provenance_ids.setdefault(provenance, len(provenance_ids))
+            for row in range(rows[i], rows[i + 1]):
+                key = (provenance_id, term_map[store_term_ids[row]])
+                count = counts[row]
+                old = merged.get(key)
+                merged[key] = count if old is None else combine(old, count)
+
+    terms = [Term(text, reading) for text, reading in term_ids]
+    write_columns(path, terms, list(provenance_ids), ((p, t, c) for (p, t), c in sorted(merged.items())))
+
+
+_store: Optional[ColumnarBag] = None
+
+
+def init_worker(path: str):
+    global _store
+    _store = ColumnarBag(path)
+
+
+def provenance_total_in_worker(provenance: str) -> int:
+    assert _store is not None
+    _term_ids, counts = _store.provenance_slice(provenance)
+    return sum(counts)
+
+
+CORPORA: Dict[str, Callable[[str], OccurrenceBag]] = {
+    "bccwj": lambda data_dir: bccwj.read_bag(data_dir)[0],
+    "csj": csj.read_suw_bag,
+    "nwjc": nwjc.read_suw_bag,
+    "shc": shc.read_suw_bag,
+    "chj-modern": chj.read_modern_bag,
+    "chj-premodern": chj.read_premodern_bag,
+}
+
+
+class TestColumnar(unittest.TestCase):
+    a, b, c = Term("学校", "がっこう"), Term("川", "かわ"), Term("海", "うみ")
+
+    def make_bag(self, rows: List[Tuple[Term, str, int]]) -> OccurrenceBag:
+        bag = OccurrenceBag()
+        for term, provenance, count in rows:
+            bag.insert(Occurrence(term, provenance), count)
+        return bag
+
+    def test_roundtrip(self):
+        bag = self.make_bag([(self.a, "本", 3), (self.b, "本", 1), (self.a, "雑誌", 4), (self.c, "雑誌", 2)])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bag.col")
+            write_bag(bag, path)
+            with ColumnarBag(path) as store:
+                self.assertEqual(3, len(store))
+                self.assertEqual(self.b, store.term(1))
+                self.assertEqual(bag.to_counts(), store.to_counts())
+                self.assertEqual(list(bag.to_counts()), list(store.to_counts()))
+                self.assertEqual({self.a: 4, self.c: 2}, store.provenance_counts("雑誌"))
+                self.assertEqual({"本": 4, "雑誌": 6}, store.provenance_totals())
+                self.assertEqual(bag.data, store.to_bag().data)
+                with self.assertRaises(KeyError):
+                    store.provenance_slice("新聞")
+                term_ids, counts = store.provenance_slice("本")
+
+            # Views outlive the store
+            self.assertEqual(([0, 1], [3, 1]), (list(term_ids), list(counts)))
+            term_ids.release()
+            counts.release()
+
+            with open(path, "wb") as f:
+                f.write(b"not a store")
+            with self.assertRaises(ValueError):
+                ColumnarBag(path)
+
+    def test_merge(self):
+        x = self.make_bag([(self.a, "本", 3), (self.b, "本", 1)])
+        y = self.make_bag([(self.a, "本", 5), (self.c, "新聞", 2)])
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, name) for name in ["x.col", "y.col", "distinct.col", "overlap.col"]]
+            write_bag(x, paths[0])
+            write_bag(y, paths[1])
+            with ColumnarBag(paths[0]) as store_x, ColumnarBag(paths[1]) as store_y:
+                merge([store_x, store_y], paths[2], "distinct")
+                merge([store_x, store_y], paths[3], "overlap")
+
+            for path, extend in [(paths[2], OccurrenceBag.extend_distinct), (paths[3], OccurrenceBag.extend_overlap)]:
+                expected = self.make_bag([])
+                extend(expected, x)
+                extend(expected, y)
+                with ColumnarBag(path) as store:
+                    self.assertEqual(expected.data, store.to_bag().data)
+
+    def test_shared_workers(self):
+        bag = self.make_bag([(Term(f"語{i}", f"ご{i}"), f"出所{i % 3}", i) for i in range(30)])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bag.col")
+            write_bag(bag, path)
+            provenances = ["出所0", "出所1", "出所2"]
+            totals = list(workers.imap_ordered(provenance_total_in_worker, iter(provenances), 2,
+                                                initializer=init_worker, initargs=(path,)))
+        self.assertEqual([sum(range(k, 30, 3)) for k in range(3)], totals)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Store parsed corpora in memory-mapped columnar files")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    write_parser = subparsers.add_parser("write", help="Parse a corpus and write it to a store")
+    write_parser.add_argument("corpus", choices=list(CORPORA), help="Corpus to parse")
+    write_parser.add_argument("path_in", type=str, help="Path to directory with NINJAL zip files")
+    write_parser.add_argument("path_out", type=str, help="Path of output store")
+
+    merge_parser = subparsers.add_parser("merge", help="Merge stores into one")
+    merge_parser.add_argument("path_out", type=str, help="Path of output store")
+    merge_parser.add_argument("paths_in", type=str, nargs="+", help="Paths to input stores")
+    merge_parser.add_argument("--mode", choices=MODES, default="distinct",
+                              help="Sum counts of the same term and provenance, or take their maximum")
+
+    info_parser = subparsers.add_parser("info", help="Report the size of a store and the time to load its counts")
+    info_parser.add_argument("path", type=str, help="Path to store")
+
+    args = parser.parse_args()
+
+    if args.command == "write":
+        write_bag(CORPORA[args.corpus](args.path_in), args.path_out)
+    elif args.command == "merge":
+        opened = [ColumnarBag(path) for path in args.paths_in]
+        try:
+            merge(opened, args.path_out, args.mode)
+        finally:
+            for store in opened:
+                store.close()
+    else:
+        start = time.perf_counter()
+        with ColumnarBag(args.path) as store:
+            opened_seconds = time.perf_counter() - start
+            counts = store.to_counts()
+            counts_seconds = time.perf_counter() - start - opened_seconds
+            rows = len(store.columns["term_ids"])
+            print(f"{len(store)} terms, {len(store.provenances())} provenances, {rows} rows, "
+                  f"{os.path.getsize(args.path) / 1024 / 1024:.1f} MB")
+            print(f"open {opened_seconds * 1000:.2f} ms, to_counts {counts_seconds * 1000:.1f} ms")
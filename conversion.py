@@ -1,7 +1,19 @@
 import argparse
+import codecs
+import io
+import os
+import random
+import re
+import time
+import timeit
 import unittest
 import sys
-from typing import List
+import tempfile
+from collections import defaultdict
+from functools import partial
+from itertools import product
+from typing import List, Iterator, BinaryIO, Callable, Dict, Iterable, Optional, Union
+from zipfile import ZipFile
 
 KATAKANA = "ァアィイゥウェエォオカガキギクグケゲコゴサザシジスズセゼソゾタダチヂッツヅテデトドナニヌネノハバパヒビピフブプヘベペホボポマミムメモャヤュユョヨラリルレロヮワヰヱヲンヴヵヶヽヾ"
 """
@@ -14,6 +26,15 @@ Hiragana unicode block plus repetition marks
 SHINJITAI = "亜悪圧囲為医壱逸稲飲隠営栄衛駅謁円縁艶塩奥応横欧殴黄温穏仮価禍画会壊悔懐海絵慨概拡殻覚学岳楽喝渇褐勧巻寛歓漢缶観関陥顔器既帰気祈亀偽戯犠旧拠挙虚峡挟狭郷響暁勤謹区駆勲薫径恵掲渓経継茎蛍軽鶏芸撃欠倹剣圏検権献研県険顕験厳効広恒鉱号国穀黒済砕斎剤桜冊殺雑参惨桟蚕賛残祉糸視歯児辞湿実舎写煮社者釈寿収臭従渋獣縦祝粛処暑緒署諸叙奨将渉焼祥称証乗剰壌嬢条浄状畳譲醸嘱触寝慎真神尽図粋酔随髄数枢瀬声静斉摂窃節専戦浅潜繊践銭禅曽祖僧双壮層捜挿巣争痩総荘装騒増憎臓蔵贈即属続堕体対帯滞台滝択沢単嘆担胆団弾断痴遅昼虫鋳著庁徴懲聴勅鎮塚逓鉄転点伝都党盗灯当闘徳独読突届縄難弐悩脳覇廃拝梅売麦発髪抜繁晩蛮卑碑秘浜賓頻敏瓶侮福払仏併塀並変辺勉弁弁弁舗歩穂宝褒豊墨没翻毎万満免麺黙餅戻弥薬訳予余与誉揺様謡来頼乱欄覧隆竜虜両猟緑塁涙類励礼隷霊齢暦歴恋練錬炉労廊朗楼郎録湾尭槙琢禄聡巌渚瑶禎遥晋猪祐穣"
 KYUJITAI  = "亞惡壓圍爲醫壹逸稻飮隱營榮衞驛謁圓緣艷鹽奧應橫歐毆黃溫穩假價禍畫會壞悔懷海繪慨槪擴殼覺學嶽樂喝渴褐勸卷寬歡漢罐觀關陷顏器既歸氣祈龜僞戲犧舊據擧虛峽挾狹鄕響曉勤謹區驅勳薰徑惠揭溪經繼莖螢輕鷄藝擊缺儉劍圈檢權獻硏縣險顯驗嚴效廣恆鑛號國穀黑濟碎齋劑櫻册殺雜參慘棧蠶贊殘祉絲視齒兒辭濕實舍寫煮社者釋壽收臭從澁獸縱祝肅處暑緖署諸敍奬將涉燒祥稱證乘剩壤孃條淨狀疊讓釀囑觸寢愼眞神盡圖粹醉隨髓數樞瀨聲靜齊攝竊節專戰淺潛纖踐錢禪曾祖僧雙壯層搜插巢爭瘦總莊裝騷增憎臟藏贈卽屬續墮體對帶滯臺瀧擇澤單嘆擔膽團彈斷癡遲晝蟲鑄著廳徵懲聽敕鎭塚遞鐵轉點傳都黨盜燈當鬭德獨讀突屆繩難貳惱腦霸廢拜梅賣麥發髮拔繁晚蠻卑碑祕濱賓頻敏甁侮福拂佛倂塀竝變邊勉辨瓣辯舖步穗寶襃豐墨沒飜每萬滿免麵默餠戾彌藥譯豫餘與譽搖樣謠來賴亂欄覽隆龍虜兩獵綠壘淚類勵禮隸靈齡曆歷戀練鍊爐勞廊朗樓郞錄灣堯槇琢祿聰巖渚瑤禎遙晉猪祐穰"
 
+COMBINING = "\u3099\u309A"
+"""
+Combining dakuten and handakuten
+"""
+BLOCK_SIZE = 1 << 20
+"""
+Default number of bytes that are read at once in stream mode
+"""
+
 KATA_TO_HIRA = str.maketrans(KATAKANA, HIRAGANA)
 HIRA_TO_KATA = str.maketrans(HIRAGANA, KATAKANA)
 SHIN_TO_KYU  = str.maketrans(SHINJITAI, KYUJITAI)
@@ -45,9 +66,214 @@ def shin_to_kyu(string: str) -> str:
 def kyu_to_shin(string: str) -> str:
     return string.translate(KYU_TO_SHIN)
 
+Rules = Dict[str, str]
+"""
+Mapping from input strings to output strings that is applied by longest match.
+
+Characters that are not covered by any key are copied.
+"""
+
+def rules_of(f: Callable[[str], str], keys: Iterable[str]) -> Rules:
+    """
+    Rules that agree with function f on each of the keys.
+    """
+    return {key: f(key) for key in keys}
+
+KATA_TO_HIRA_RULES = rules_of(kata_to_hira, KATAKANA + "ヿヷヸヹヺ")
+# XXX: Composite unicode characters are produced by multi-character keys
+# Edit with care
+HIRA_TO_KATA_RULES = rules_of(hira_to_kata, [*HIRAGANA, "ゟ", *[base + "゙" for base in "わゐゑをワヰヱヲ"]])
+SHIN_TO_KYU_RULES = rules_of(shin_to_kyu, SHINJITAI)
+KYU_TO_SHIN_RULES = rules_of(kyu_to_shin, KYUJITAI)
+
+class Converter:
+    """
+    Converter that applies a set of rules by longest match.
+
+    Rules with single-character keys are compiled into one translation table.
+    Rules with multi-character keys are compiled into one regular expression,
+    whose matches split the input into segments for the translation table.
+    Inputs without multi-character keys are translated in one pass.
+    """
+    rules: Rules
+    table: Dict[int, Union[int, str]]
+    pattern: Optional[re.Pattern]
+
+    def __init__(self, rules: Rules):
+        self.rules = {key: value for key, value in rules.items() if key != value}
+        # Single characters are stored as ordinals, which str.translate handles faster
+        self.table = {ord(key): ord(value) if len(value) == 1 else value
+                      for key, value in self.rules.items() if len(key) == 1}
+        multi_keys = sorted((key for key in self.rules if len(key) > 1), key=len, reverse=True)
+        if multi_keys:
+            self.pattern = re.compile("(" + "|".join(map(re.escape, multi_keys)) + ")")
+        else:
+            self.pattern = None
+
+    @classmethod
+    def chain(cls, *rule_sets: Rules) -> "Converter":
+        """
+        Compile a converter that is equivalent to applying each of the rule sets in order.
+        """
+        converter = Converter(dict())
+        for rules in rule_sets:
+            converter = converter.then(rules)
+        return converter
+
+    def then(self, rules: Rules) -> "Converter":
+        """
+        Compile a converter that is equivalent to applying this converter and then the rules.
+
+        Keys of the combined rules are the keys of both rule sets
+        plus every string that this converter maps character by character onto a multi-character key.
+        Outputs of this converter are not combined with the following input.
+        """
+        second = Converter(rules)
+        preimages: Dict[str, List[str]] = defaultdict(list)
+        for key, value in self.rules.items():
+            if len(key) == 1 and len(value) == 1:
+                preimages[value].append(key)
+
+        keys = set(self.rules) | set(second.rules)
+        for key in second.rules:
+            if len(key) > 1:
+                for chars in product(*[[char, *preimages[char]] for char in key]):
+                    keys.add("".join(chars))
+
+        return Converter({key: second(self(key)) for key in keys})
+
+    def __call__(self, string: str) -> str:
+        if self.pattern is None:
+            return string.translate(self.table)
+
+        parts = self.pattern.split(string)
+        if len(parts) == 1:
+            return string.translate(self.table)
+        for index in range(0, len(parts), 2):
+            parts[index] = parts[index].translate(self.table)
+        for index in range(1, len(parts), 2):
+            parts[index] = self.rules[parts[index]]
+        return "".join(parts)
+
 def string_to_ordinals(string: str) -> List[int]:
     return [ord(char) for char in string]
 
+def safe_split(string: str) -> int:
+    """
+    Index where the string can be split without separating a character from its combining marks.
+
+    The last character is always kept in the second part,
+    because the next block might start with a combining mark.
+    """
+    index = len(string) - 1
+    while index > 0 and string[index] in COMBINING:
+        index -= 1
+    return max(index, 0)
+
+def read_blocks(f: BinaryIO, encoding: str = "utf-8", block_size: int = BLOCK_SIZE) -> Iterator[str]:
+    """
+    Read decoded text in blocks of bounded size.
+
+    Blocks never end in the middle of a multi-byte sequence
+    or between a character and its combining marks.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    carry = ""
+    while True:
+        data = f.read(block_size)
+        text = carry + decoder.decode(data, final=not data)
+        if not data:
+            if text:
+                yield text
+            return
+
+        index = safe_split(text)
+        carry = text[index:]
+        if index > 0:
+            yield text[:index]
+
+def convert_to_utf8(convert: Callable[[str], str], string: str) -> bytes:
+    return convert(string).encode("utf-8")
+
+class ByteCounter:
+    """
+    Binary file wrapper that counts the bytes read.
+    """
+    f: BinaryIO
+    count: int
+
+    def __init__(self, f: BinaryIO):
+        self.f = f
+        self.count = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.f.read(size)
+        self.count += len(data)
+        return data
+
+def convert_stream(f_in: BinaryIO, f_out: BinaryIO, convert: Callable[[str], str], encoding: str = "utf-8",
+                   block_size: int = BLOCK_SIZE, processes: int = 1) -> int:
+    """
+    Convert a text stream block by block and write the result as UTF-8.
+
+    With more than one process, blocks are converted in a process pool
+    and written in the original order.
+    Function convert has to be picklable in that case.
+
+    Return the number of bytes read.
+    """
+    counter = ByteCounter(f_in)
+    blocks = read_blocks(counter, encoding, block_size)
+
+    f = partial(convert_to_utf8, convert)
+    if processes > 1:
+        # Imported here, because workers pulls in multiprocessing, which would slow down importing this module
+        import workers
+        converted = workers.imap_ordered(f, blocks, processes)
+    else:
+        converted = map(f, blocks)
+
+    for data in converted:
+        f_out.write(data)
+
+    return counter.count
+
+def convert_columns(lines: Iterable[str], f_out: BinaryIO, convert: Callable[[str], str], columns: List[int],
+                    separator: str = "\t", skip_lines: int = 0) -> int:
+    """
+    Convert the given columns of separated lines and write them as UTF-8 TSV.
+
+    The first skip_lines lines, such as headers, are copied unconverted.
+    Columns missing from blank or short lines are skipped, so such lines are copied as they are.
+
+    Return the number of lines written.
+    """
+    count = 0
+    for line_index, line in enumerate(lines):
+        split_line = line.rstrip("\r\n").split(separator)
+        if line_index >= skip_lines:
+            for column in columns:
+                if column < len(split_line):
+                    split_line[column] = convert(split_line[column])
+        f_out.write(("\t".join(split_line) + "\n").encode("utf-8"))
+        count += 1
+    return count
+
+def convert_zip_columns(zip_path: str, member: str, f_out: BinaryIO, convert: Callable[[str], str], columns: List[int],
+                        separator: str = "\t", encoding: str = "utf-8", skip_lines: int = 0) -> int:
+    """
+    Convert the given columns of a separated file inside a zip archive and write them as UTF-8 TSV.
+
+    The member is decompressed and decoded line by line,
+    so the whole file is never held in memory.
+
+    Return the number of lines written.
+    """
+    with ZipFile(zip_path, mode="r") as zip_file:
+        with zip_file.open(member, "r") as f:
+            lines = io.TextIOWrapper(f, encoding=encoding, newline="")
+            return convert_columns(lines, f_out, convert, columns, separator, skip_lines)
+
 class TestConversion(unittest.TestCase):
     def test_kata_hira(self):
         # XXX: Composite unicode characters are present
@@ -79,30 +305,164 @@ class TestConversion(unittest.TestCase):
                 hira, kata = pair[0], pair[1]
                 self.assertEqual(kata_to_hira(kata), hira)
                 self.assertEqual(hira_to_kata(hira), kata)
+                self.assertEqual(Converter(KATA_TO_HIRA_RULES)(kata), hira)
+                self.assertEqual(Converter(HIRA_TO_KATA_RULES)(hira), kata)
 
     def test_shin_kyu(self):
         self.assertEqual(shin_to_kyu("旧字体"), "舊字體")
         self.assertEqual(kyu_to_shin("舊字體"), "旧字体")
 
+    def test_stream(self):
+        # XXX: Composite unicode characters are present
+        # Edit with care
+        text = "わ゙ゐ゙ゑ゙を゙ゟか゚ら゚\nヷヸヹヺヿ旧字体\n" * 5
+
+        for convert in [hira_to_kata, kata_to_hira, shin_to_kyu, kyu_to_shin]:
+            expected = convert(text).encode("utf-8")
+            for encoding in ["utf-8", "utf-16"]:
+                data = text.encode(encoding)
+                for block_size in [1, 2, 3, 5, 64, BLOCK_SIZE]:
+                    f_out = io.BytesIO()
+                    count = convert_stream(io.BytesIO(data), f_out, convert, encoding, block_size)
+                    self.assertEqual(expected, f_out.getvalue())
+                    self.assertEqual(len(data), count)
+
+        f_out = io.BytesIO()
+        convert_stream(io.BytesIO(text.encode("utf-8")), f_out, hira_to_kata, block_size=7, processes=2)
+        self.assertEqual(hira_to_kata(text).encode("utf-8"), f_out.getvalue())
+
+    def test_zip_columns(self):
+        rows = [
+            "語彙素読み\t語彙素\t頻度",
+            "ガッコウ\t學校\t10",
+            "カワ\t川\t5",
+        ]
+        expected = "語彙素読み\t語彙素\t頻度\nがっこう\t学校\t10\nかわ\t川\t5\n"
+
+        with tempfile.TemporaryDirectory() as directory:
+            zip_path = os.path.join(directory, "corpus.zip")
+            with ZipFile(zip_path, mode="w") as zip_file:
+                zip_file.writestr("corpus.csv", "\r\n".join(rows).encode("utf-16"))
+
+            f_out = io.BytesIO()
+            convert = Converter.chain(KATA_TO_HIRA_RULES, KYU_TO_SHIN_RULES)
+            count = convert_zip_columns(zip_path, "corpus.csv", f_out, convert, [0, 1], encoding="utf-16", skip_lines=1)
+            self.assertEqual(3, count)
+            self.assertEqual(expected, f_out.getvalue().decode("utf-8"))
+
+        # Blank and short rows do not stop the conversion
+        f_out = io.BytesIO()
+        count = convert_columns(["カワ\t川\t5\n", "\n", "ガッコウ\n", ""], f_out, kata_to_hira, [0, 1])
+        self.assertEqual(4, count)
+        self.assertEqual("かわ\t川\t5\n\nがっこう\n\n", f_out.getvalue().decode("utf-8"))
+
+    def test_converter(self):
+        # XXX: Composite unicode characters are present
+        # Edit with care
+        alphabet = KATAKANA + HIRAGANA + COMBINING + "ヿヷヸヹヺゟ旧舊字體体学學" + "わゐゑをワヰヱヲ" * 4
+        random.seed(0)
+        texts = ["".join(random.choices(alphabet, k=random.randint(0, 6))) for _ in range(2000)]
+        conversions = [
+            (kata_to_hira, KATA_TO_HIRA_RULES),
+            (hira_to_kata, HIRA_TO_KATA_RULES),
+            (shin_to_kyu, SHIN_TO_KYU_RULES),
+            (kyu_to_shin, KYU_TO_SHIN_RULES),
+        ]
+
+        for f, rules in conversions:
+            converter = Converter(rules)
+            for text in texts:
+                self.assertEqual(f(text), converter(text))
+
+        for f, f_rules in conversions:
+            for g, g_rules in conversions:
+                converter = Converter.chain(f_rules, g_rules)
+                for text in texts:
+                    self.assertEqual(g(f(text)), converter(text))
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Convert Japanese text")
 
-    to_group = parser.add_mutually_exclusive_group(required=True)
-    to_group.add_argument("--kata", action="store_true", help="Convert hiragana to katakana")
-    to_group.add_argument("--hira", action="store_true", help="Convert katakana to hiragana")
-    to_group.add_argument("--shin", action="store_true", help="Convert kyujitai to shinjitai")
-    to_group.add_argument("--kyu", action="store_true", help="Convert shinjitai to kyujitai")
-    parser.add_argument('text', nargs='?', default=sys.stdin.read(), help='Text to convert')
+    conversions = {
+        "kata": (hira_to_kata, HIRA_TO_KATA_RULES),
+        "hira": (kata_to_hira, KATA_TO_HIRA_RULES),
+        "shin": (kyu_to_shin, KYU_TO_SHIN_RULES),
+        "kyu": (shin_to_kyu, SHIN_TO_KYU_RULES),
+    }
+    to_group = parser.add_argument_group("conversions", "Applied in the given order; at least one is required")
+    to_group.add_argument("--kata", action="append_const", dest="to", const="kata", help="Convert hiragana to katakana")
+    to_group.add_argument("--hira", action="append_const", dest="to", const="hira", help="Convert katakana to hiragana")
+    to_group.add_argument("--shin", action="append_const", dest="to", const="shin", help="Convert kyujitai to shinjitai")
+    to_group.add_argument("--kyu", action="append_const", dest="to", const="kyu", help="Convert shinjitai to kyujitai")
+    parser.add_argument("text", nargs="?", help="Text to convert; input stream is converted if omitted")
+    parser.add_argument("--input", type=str, help="Path of input file instead of standard input")
+    parser.add_argument("--output", type=str, help="Path of output file instead of standard output")
+    parser.add_argument("--encoding", type=str, default="utf-8", help="Encoding of input stream; output is UTF-8")
+    parser.add_argument("--block-size", type=int, default=BLOCK_SIZE, help="Number of bytes converted at once")
+    parser.add_argument("--processes", type=int, default=1, help="Number of processes for converting blocks")
+    parser.add_argument("--throughput", action="store_true", help="Report throughput on standard error")
+    parser.add_argument("--zip", type=str, help="Path of zip archive with a separated file to convert column-wise")
+    parser.add_argument("--member", type=str, help="Path of separated file inside the zip archive")
+    parser.add_argument("--columns", type=str, help="Comma-separated zero-based indices of columns to convert")
+    parser.add_argument("--separator", type=str, default="\t", help="Column separator of the separated file")
+    parser.add_argument("--skip-lines", type=int, default=0, help="Number of header lines that are copied unconverted")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Compare the compiled converter against the conversion functions on the input")
 
     args = parser.parse_args()
 
-    if args.kata:
-        print(hira_to_kata(args.text))
-    elif args.hira:
-        print(kata_to_hira(args.text))
-    elif args.shin:
-        print(kyu_to_shin(args.text))
+    if not args.to:
+        parser.error("at least one of --kata --hira --shin --kyu is required")
+
+    if len(args.to) == 1:
+        convert = conversions[args.to[0]][0]
+    else:
+        convert = Converter.chain(*[conversions[name][1] for name in args.to])
+
+    if args.zip is not None:
+        if args.member is None or args.columns is None:
+            parser.error("--zip requires --member and --columns")
+        columns = [int(column) for column in args.columns.split(",")]
+        f_out = open(args.output, "wb") if args.output else sys.stdout.buffer
+        try:
+            convert_zip_columns(args.zip, args.member, f_out, convert, columns, args.separator, args.encoding,
+                                args.skip_lines)
+        finally:
+            if args.output:
+                f_out.close()
+    elif args.benchmark:
+        if args.text is not None:
+            text = args.text
+        else:
+            with open(args.input, "rb") if args.input else sys.stdin.buffer as f_in:
+                text = f_in.read().decode(args.encoding)
+
+        def functions(string: str) -> str:
+            for name in args.to:
+                string = conversions[name][0](string)
+            return string
+
+        compiled = Converter.chain(*[conversions[name][1] for name in args.to])
+        assert functions(text) == compiled(text)
+
+        for name, f in [("functions", functions), ("compiled", compiled)]:
+            seconds = min(timeit.repeat(lambda: f(text), number=1, repeat=5))
+            print(f"{name:10} {seconds * 1000:8.1f} ms {len(text) / 1e6 / seconds:8.1f} Mchar/s")
+    elif args.text is not None:
+        print(convert(args.text))
     else:
-        assert args.kyu
-        print(shin_to_kyu(args.text))
+        f_in = open(args.input, "rb") if args.input else sys.stdin.buffer
+        f_out = open(args.output, "wb") if args.output else sys.stdout.buffer
+        start = time.perf_counter()
+        try:
+            count = convert_stream(f_in, f_out, convert, args.encoding, args.block_size, args.processes)
+        finally:
+            if args.input:
+                f_in.close()
+            if args.output:
+                f_out.close()
+        seconds = time.perf_counter() - start
+        if args.throughput:
+            megabytes = count / 1e6
+            print(f"{megabytes:.1f} MB in {seconds:.2f} s ({megabytes / max(seconds, 1e-9):.1f} MB/s)", file=sys.stderr)
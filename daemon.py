@@ -0,0 +1,439 @@
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import unittest
+
+import bccwj
+import build
+import chj
+import csj
+import join
+import jlpt
+import nwjc
+import rank
+import shc
+import shinmeikai
+from rank import Rank
+
+ResourceKey = Tuple[Any, ...]
+"""
+Name of a loader followed by its arguments
+"""
+Job = Callable[["Workspace", Dict[str, Any]], Any]
+"""
+Build job that reads its resources from the workspace and takes keyword parameters from the client
+"""
+
+
+def estimate_size(obj: Any, sample: int = 100, depth: int = 4) -> int:
+    """
+    Rough estimate of the memory that an object and everything it references occupies, in bytes.
+
+    Large containers are measured on a sample of their items and extrapolated,
+    so the estimate is cheap even for corpora with millions of terms.
+    Shared objects such as interned terms are counted once per reference.
+    """
+    size = sys.getsizeof(obj)
+    if depth == 0 or isinstance(obj, (str, bytes, int, float, bool)) or obj is None:
+        return size
+
+    if isinstance(obj, dict):
+        items = list(obj.items())
+        parts = [part for item in items[:sample] for part in item]
+        length = len(items)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        parts = list(obj)[:sample]
+        length = len(obj)
+    elif hasattr(obj, "__dict__"):
+        return size + estimate_size(vars(obj), sample, depth - 1)
+    elif hasattr(type(obj), "__slots__"):
+        parts = [getattr(obj, name) for name in type(obj).__slots__ if hasattr(obj, name)]
+        length = len(parts)
+    else:
+        return size
+
+    if not parts:
+        return size
+    measured = sum(estimate_size(part, sample, depth - 1) for part in parts)
+    if isinstance(obj, dict):
+        return size + measured * length // min(length, sample)
+    return size + measured * length // len(parts)
+
+
+@dataclass
+class Resource:
+    value: Any
+    fingerprint: List[Any]
+    """
+    Size and modification time of the input files when the resource was loaded
+    """
+    size: int
+    """
+    Estimated memory of the value in bytes
+    """
+    seconds: float
+    """
+    Time that loading took
+    """
+
+
+def fingerprint(paths: List[str]) -> List[Any]:
+    result = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            result.append([path, stat.st_size, stat.st_mtime_ns])
+        except FileNotFoundError:
+            result.append([path, None])
+    return result
+
+
+class Workspace:
+    """
+    Parsed corpora and dictionaries kept in memory across build jobs.
+
+    Resources are loaded on first use and reloaded when one of their input files changes.
+    When the estimated memory of all resources exceeds the budget,
+    the least recently used resources are evicted until it fits again.
+    The resource that was just requested is never evicted.
+    """
+    loaders: Dict[str, Callable[..., Any]]
+    max_bytes: Optional[int]
+    resources: "OrderedDict[ResourceKey, Resource]"
+    """
+    Loaded resources from least to most recently used
+    """
+
+    def __init__(self, loaders: Dict[str, Callable[..., Any]], max_bytes: Optional[int] = None):
+        self.loaders = loaders
+        self.max_bytes = max_bytes
+        self.resources = OrderedDict()
+
+    def get(self, name: str, *args: Any, inputs: Tuple[str, ...] = ()) -> Any:
+        """
+        Value of the loader with the given arguments, loading it if necessary.
+
+        The input paths decide when a loaded value is stale.
+        """
+        return self.get_or_load((name, *args), lambda: self.loaders[name](*args), inputs)
+
+    def get_or_load(self, key: ResourceKey, load: Callable[[], Any], inputs: Tuple[str, ...] = ()) -> Any:
+        """
+        Value under the given key, calling the load function if it is missing or stale.
+
+        Useful for resources derived from other resources.
+        """
+        current = fingerprint(list(inputs))
+        resource = self.resources.get(key)
+        if resource is not None and resource.fingerprint == current:
+            self.resources.move_to_end(key)
+            return resource.value
+
+        self.resources.pop(key, None)
+        start = time.perf_counter()
+        value = load()
+        seconds = time.perf_counter() - start
+        self.resources[key] = Resource(value, current, estimate_size(value), seconds)
+        self.evict(keep=key)
+        return value
+
+    def total_bytes(self) -> int:
+        return sum(resource.size for resource in self.resources.values())
+
+    def evict(self, keep: Optional[ResourceKey] = None):
+        if self.max_bytes is None:
+            return
+        for key in list(self.resources):
+            if self.total_bytes() <= self.max_bytes:
+                break
+            if key != keep:
+                del self.resources[key]
+
+    def clear(self):
+        self.resources.clear()
+
+    def status(self) -> List[Dict[str, Any]]:
+        return [{"key": list(key), "bytes": resource.size, "load_seconds": round(resource.seconds, 3)}
+                for key, resource in self.resources.items()]
+
+
+def corpus_loaders() -> Dict[str, Callable[..., Any]]:
+    return {
+        "bccwj-counts": build.read_bccwj_counts,
+        "suw-counts": lambda module, data_dir: {"csj": csj, "nwjc": nwjc, "shc": shc}[module]
+            .read_suw_bag(data_dir).to_counts(),
+        "chj-counts": lambda modern, data_dir: (chj.read_modern_bag(data_dir) if modern
+                                                else chj.read_premodern_bag(data_dir)).to_counts(),
+        "shinmeikai": shinmeikai.read_dictionary,
+        "rank": lambda path: Rank.dictionary_reader().with_path(path).read(),
+    }
+
+
+def run_bccwj(workspace: Workspace, params: Dict[str, Any]):
+    data_dir = params["data_dir"]
+    counts, includes_luw = workspace.get("bccwj-counts", data_dir, inputs=(
+        os.path.join(data_dir, bccwj.SUW_ZIP_NAME), os.path.join(data_dir, bccwj.LUW2_ZIP_NAME)))
+    build.write(bccwj.rank_dictionary(counts, includes_luw, params["max_rank"]), params["path_out"])
+
+
+def run_suw(module: str, workspace: Workspace, params: Dict[str, Any]):
+    data_dir = params["data_dir"]
+    corpus = {"csj": csj, "nwjc": nwjc, "shc": shc}[module]
+    counts = workspace.get("suw-counts", module, data_dir, inputs=(os.path.join(data_dir, corpus.ZIP_NAME),))
+    build.write(corpus.rank_dictionary(counts, params["max_rank"]), params["path_out"])
+
+
+def run_chj(modern: bool, workspace: Workspace, params: Dict[str, Any]):
+    data_dir = params["data_dir"]
+    counts = workspace.get("chj-counts", modern, data_dir, inputs=(os.path.join(data_dir, chj.ZIP_NAME),))
+    build.write(chj.rank_dictionary(counts, modern, params["max_rank"]), params["path_out"])
+
+
+def run_shinmeikai(workspace: Workspace, params: Dict[str, Any]):
+    data_dir = params["data_dir"]
+    shinmeikai_dir = params["shinmeikai_dir"]
+    bccwj_inputs = (os.path.join(data_dir, bccwj.SUW_ZIP_NAME), os.path.join(data_dir, bccwj.LUW2_ZIP_NAME))
+    variants = params.get("variants", "exact")
+
+    dic = workspace.get("shinmeikai", shinmeikai_dir, inputs=(os.path.join(shinmeikai_dir, shinmeikai.ZIP_NAME),))
+    counts = workspace.get("bccwj-counts", data_dir, inputs=bccwj_inputs)[0]
+    if variants != "exact":
+        counts = workspace.get_or_load(("bccwj-join", data_dir, variants),
+                                       lambda: join.JoinIndex(counts, variants), bccwj_inputs)
+    # Levels are loaded once per process anyway
+    jlpt.levels()
+    build.write(shinmeikai.upgrade_dictionary(dic, counts, params.get("processes", 1)), params["path_out"])
+
+
+def run_rank(workspace: Workspace, params: Dict[str, Any]):
+    path_in = params["path_in"]
+    dic = workspace.get("rank", path_in, inputs=(path_in,))
+    build.write_rank(dic, params["path_out"], params["max_rank"])
+
+
+def corpus_jobs() -> Dict[str, Job]:
+    return {
+        "bccwj": run_bccwj,
+        "csj": lambda workspace, params: run_suw("csj", workspace, params),
+        "nwjc": lambda workspace, params: run_suw("nwjc", workspace, params),
+        "shc": lambda workspace, params: run_suw("shc", workspace, params),
+        "chj-modern": lambda workspace, params: run_chj(True, workspace, params),
+        "chj-premodern": lambda workspace, params: run_chj(False, workspace, params),
+        "shinmeikai": run_shinmeikai,
+        "rank": run_rank,
+    }
+
+
+class DaemonHandler(socketserver.StreamRequestHandler):
+    """
+    Reads one JSON request per line and answers each with one JSON line.
+    """
+    server: "DaemonServer"
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                response = self.server.respond(json.loads(line))
+            except Exception as e:
+                response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+            if response.get("shutdown"):
+                return
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """
+    Resident build server on a Unix socket.
+
+    Requests:
+    - {"command": "run", "job": name, "params": {...}} runs a build job against the workspace
+    - {"command": "status"} lists the loaded resources
+    - {"command": "clear"} evicts all resources
+    - {"command": "shutdown"} stops the server
+
+    Connections are served one at a time, so jobs never run concurrently
+    and never observe a resource in the middle of being loaded.
+    """
+    workspace: Workspace
+    jobs: Dict[str, Job]
+
+    def __init__(self, socket_path: str, workspace: Workspace, jobs: Dict[str, Job]):
+        self.workspace = workspace
+        self.jobs = jobs
+        super().__init__(socket_path, DaemonHandler)
+
+    def respond(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        command = request.get("command")
+        if command == "run":
+            job = self.jobs.get(request.get("job"))
+            if job is None:
+                raise ValueError(f"Unknown job: {request.get('job')}")
+            start = time.perf_counter()
+            result = job(self.workspace, request.get("params", dict()))
+            return {"ok": True, "seconds": round(time.perf_counter() - start, 3), "result": result}
+        if command == "status":
+            return {"ok": True, "resources": self.workspace.status(), "bytes": self.workspace.total_bytes()}
+        if command == "clear":
+            self.workspace.clear()
+            return {"ok": True}
+        if command == "shutdown":
+            threading.Thread(target=self.shutdown).start()
+            return {"ok": True, "shutdown": True}
+        raise ValueError(f"Unknown command: {command}")
+
+
+def submit(socket_path: str, request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Send one request to a running daemon and wait for its response.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        with sock.makefile("rwb") as f:
+            f.write(json.dumps(request, ensure_ascii=False).encode("utf-8") + b"\n")
+            f.flush()
+            return json.loads(f.readline())
+
+
+def serve(socket_path: str, workspace: Workspace, jobs: Dict[str, Job]):
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    with DaemonServer(socket_path, workspace, jobs) as server:
+        try:
+            server.serve_forever()
+        finally:
+            os.remove(socket_path)
+
+
+def read_lines(path: str) -> List[str]:
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read().splitlines()
+
+
+def count_lines(workspace: Workspace, params: Dict[str, Any]) -> int:
+    return len(workspace.get("lines", params["path"], inputs=(params["path"],)))
+
+
+class TestDaemon(unittest.TestCase):
+    def test_estimate_size(self):
+        small = {str(i): i for i in range(10)}
+        large = {str(i): i for i in range(10000)}
+        self.assertLess(estimate_size(small), estimate_size(large))
+        self.assertGreater(estimate_size(large), sys.getsizeof(large))
+
+    def test_workspace(self):
+        loads = []
+
+        def load(n: int) -> List[int]:
+            loads.append(n)
+            return list(range(n))
+
+        workspace = Workspace({"range": load}, max_bytes=estimate_size(list(range(1000))) * 2)
+        self.assertEqual(10, len(workspace.get("range", 10)))
+        self.assertEqual(10, len(workspace.get("range", 10)))
+        self.assertEqual([10], loads)
+
+        workspace.get("range", 1000)
+        workspace.get("range", 10)
+        # Does not fit next to both, so the least recently used one goes
+        workspace.get("range", 1001)
+        self.assertEqual([("range", 10), ("range", 1001)], list(workspace.resources))
+
+    def test_reload_changed_input(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "lines.txt")
+            with open(path, "w") as f:
+                f.write("a\nb\n")
+            workspace = Workspace({"lines": read_lines})
+            self.assertEqual(2, count_lines(workspace, {"path": path}))
+
+            with open(path, "w") as f:
+                f.write("a\nb\nc\n")
+            os.utime(path, ns=(0, 0))
+            self.assertEqual(3, count_lines(workspace, {"path": path}))
+
+    def test_server(self):
+        with tempfile.TemporaryDirectory() as directory:
+            socket_path = os.path.join(directory, "daemon.sock")
+            path = os.path.join(directory, "lines.txt")
+            with open(path, "w") as f:
+                f.write("a\nb\n")
+
+            workspace = Workspace({"lines": read_lines})
+            thread = threading.Thread(target=serve, args=(socket_path, workspace, {"count": count_lines}))
+            thread.start()
+            while not os.path.exists(socket_path):
+                time.sleep(0.01)
+
+            response = submit(socket_path, {"command": "run", "job": "count", "params": {"path": path}})
+            self.assertEqual(2, response["result"])
+            response = submit(socket_path, {"command": "status"})
+            self.assertEqual([["lines", path]], [x["key"] for x in response["resources"]])
+            response = submit(socket_path, {"command": "run", "job": "missing"})
+            self.assertFalse(response["ok"])
+
+            submit(socket_path, {"command": "shutdown"})
+            thread.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resident build daemon that keeps parsed corpora in memory")
+    parser.add_argument("--socket", type=str, default=os.path.join(tempfile.gettempdir(), "japanese-tools.sock"),
+                        help="Path of the Unix socket")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="Start the daemon in the foreground")
+    serve_parser.add_argument("--max-memory", type=int, default=None,
+                              help="Estimated memory budget of the loaded corpora in megabytes")
+
+    run_parser = subparsers.add_parser("run", help="Submit a build job to the daemon")
+    run_parser.add_argument("job", choices=sorted(corpus_jobs()), help="Job to run")
+    run_parser.add_argument("path_out", type=str, help="Path of output dictionary")
+    run_parser.add_argument("--data", type=str, help="Path to directory with corpus zip files")
+    run_parser.add_argument("--shinmeikai", type=str, help="Path to directory with Shinmeikai dictionary")
+    run_parser.add_argument("--rank", type=str, help="Path of rank dictionary to convert")
+    run_parser.add_argument("--max", type=int, default=80000, help="Maximum rank")
+    run_parser.add_argument("--variants", choices=["exact", *join.AGGREGATES], default="exact",
+                            help="How to count terms that occur only in spelling variants in BCCWJ")
+    run_parser.add_argument("--processes", type=int, default=1, help="Number of processes for per-definition stages")
+
+    subparsers.add_parser("status", help="List the loaded corpora")
+    subparsers.add_parser("clear", help="Evict all loaded corpora")
+    subparsers.add_parser("shutdown", help="Stop the daemon")
+
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        max_bytes = None if args.max_memory is None else args.max_memory * 1024 * 1024
+        serve(args.socket, Workspace(corpus_loaders(), max_bytes), corpus_jobs())
+        sys.exit(0)
+
+    if args.command == "run":
+        params = {
+            "path_out": os.path.abspath(args.path_out),
+            "max_rank": args.max,
+            "variants": args.variants,
+            "processes": args.processes,
+        }
+        for name, path in [("data_dir", args.data), ("shinmeikai_dir", args.shinmeikai), ("path_in", args.rank)]:
+            if path is not None:
+                params[name] = os.path.abspath(path)
+        request = {"command": "run", "job": args.job, "params": params}
+    else:
+        request = {"command": args.command}
+
+    response = submit(args.socket, request)
+    print(json.dumps(response, ensure_ascii=False, indent=1))
+    if not response["ok"]:
+        sys.exit(1)
@@ -1,10 +1,11 @@
 import dataclasses
 from dataclasses import dataclass
-from typing import List, Tuple, Any, Iterator, Dict, Callable, Optional
+from typing import List, Tuple, Any, Iterator, Mapping, Callable, Optional
 import unittest
 
+import profiling
 from dictionary import Dictionary, DictionaryReader
-from term import Term
+from term import Term, TermPool
 
 
 @dataclass(frozen=True)
@@ -74,9 +75,9 @@ class Definition:
         return self.top_tags == "" and len(self.definitions) == 1
 
     @classmethod
-    def from_json(cls, obj: List[Any]) -> "Definition":
+    def from_json(cls, obj: List[Any], term_pool: Optional[TermPool] = None) -> "Definition":
         text, reading, def_tags, conjugation, popularity, definitions, sequence_number, top_tags = obj
-        term = Term(text, reading)
+        term = Term(text, reading) if term_pool is None else term_pool.get(text, reading)
         return Definition(term, def_tags, conjugation, popularity, definitions, sequence_number, top_tags)
 
     def to_json(self) -> List[Any]:
@@ -101,7 +102,8 @@ class Definition:
         return DictionaryReader(Definition, "term_bank")
 
 
-def with_counts(it: Iterator[Definition], counts: Dict[Term, int]) -> Iterator[Tuple[Definition, int]]:
+@profiling.iterator_stage("definition.with_counts")
+def with_counts(it: Iterator[Definition], counts: Mapping[Term, int]) -> Iterator[Tuple[Definition, int]]:
     """
     Iterate over each term definition together with the term's count.
 
@@ -112,6 +114,7 @@ def with_counts(it: Iterator[Definition], counts: Dict[Term, int]) -> Iterator[T
 
     return map(helper, it)
 
+@profiling.iterator_stage("definition.sort_by_count")
 def sort_by_count(it: Iterator[Tuple[Definition, int]]) -> Iterator[Tuple[Definition, int]]:
     """
     Iterate in descending order of term counts.
@@ -122,6 +125,7 @@ def sort_by_count(it: Iterator[Tuple[Definition, int]]) -> Iterator[Tuple[Defini
     for item in sorted_list:
         yield item
 
+@profiling.iterator_stage("definition.count_as_popularity")
 def count_as_popularity(it: Iterator[Tuple[Definition, int]]) -> Iterator[Tuple[Definition, int]]:
     """
     Set the popularity field of each definition equal to the term count.
@@ -133,6 +137,7 @@ def count_as_popularity(it: Iterator[Tuple[Definition, int]]) -> Iterator[Tuple[
 
     return map(helper, it)
 
+@profiling.iterator_stage("definition.only_definitions")
 def only_definitions(it: Iterator[Tuple[Definition, int]]) -> Iterator[Definition]:
     """
     Iterate over definitions only.
@@ -141,6 +146,7 @@ def only_definitions(it: Iterator[Tuple[Definition, int]]) -> Iterator[Definitio
     """
     return map(lambda x: x[0], it)
 
+@profiling.iterator_stage("definition.sort_by_term")
 def sort_by_term(it: Iterator[Definition]) -> Iterator[Definition]:
     """
     Iterate in ascending order of terms (lexicographic order).
@@ -151,6 +157,7 @@ def sort_by_term(it: Iterator[Definition]) -> Iterator[Definition]:
     for item in sorted_list:
         yield item
 
+@profiling.iterator_stage("definition.position_as_sequence")
 def position_as_sequence(it: Iterator[Definition]) -> Iterator[Definition]:
     """
     Set the sequence field of each definition equal to the iterator position.
@@ -166,6 +173,7 @@ def position_as_sequence(it: Iterator[Definition]) -> Iterator[Definition]:
 
     return map(helper, enumerate(it))
 
+@profiling.iterator_stage("definition.map_term")
 def map_term(it: Iterator[Definition], f: Callable[[Term], Term]) -> Iterator[Definition]:
     """
     Set the term field of each definition equal to the result of function f.
@@ -179,6 +187,7 @@ def map_term(it: Iterator[Definition], f: Callable[[Term], Term]) -> Iterator[De
 
     return map(helper, it)
 
+@profiling.iterator_stage("definition.copy_term")
 def copy_term(it: Iterator[Definition], f: Callable[[Term], Optional[Term]]) -> Iterator[Definition]:
     """
     Create a copy of each definition where the term field is equal the result of function f.
@@ -195,6 +204,7 @@ def copy_term(it: Iterator[Definition], f: Callable[[Term], Optional[Term]]) ->
         if mapped_term is not None:
             yield x.with_term(mapped_term)
 
+@profiling.iterator_stage("definition.add_def_tag")
 def add_def_tag(it: Iterator[Definition], f: Callable[[Definition], Optional[str]]) -> Iterator[Definition]:
     """
     Add the result of function f to the def tag field of each definition.
@@ -211,6 +221,7 @@ def add_def_tag(it: Iterator[Definition], f: Callable[[Definition], Optional[str
         else:
             yield x
 
+@profiling.iterator_stage("definition.filter_definition")
 def filter_definition(it: Iterator[Definition], f: Callable[[str], bool]) -> Iterator[Definition]:
     for x in it:
         if f(x.get_definition()):
@@ -1,9 +1,14 @@
 import dataclasses
+import inspect
 from dataclasses import dataclass
 from typing import Optional, List, Any, Type, Iterator, Dict
 from zipfile import ZipFile, ZIP_DEFLATED
 import json
 
+import profiling
+from pipeline import Pipeline, StageStats
+from term import TermPool
+
 
 @dataclass(frozen=True)
 class Dictionary:
@@ -84,16 +89,49 @@ class DictionaryReader:
     data_class: Type[Any]
     term_bank_name: str
     path: Optional[str]
+    term_pool: Optional[TermPool]
+    """
+    Pool to intern the read terms in, which only saves memory when it is shared by several readers
+    """
+    pooled: bool
+    """
+    Whether the from_json of the data class accepts a term pool
+    """
+    queue_size: Optional[int]
+    """
+    Size of the queues between the stages of the pipeline, or None to read sequentially
+    """
+    stage_stats: List[StageStats]
+    """
+    Statistics of the stages of the last pipelined read
+    """
 
     def __init__(self, data_class: Type[Any], term_bank_name: str):
         self.data_class = data_class
         self.term_bank_name = term_bank_name
         self.path = None
+        self.term_pool = None
+        self.pooled = "term_pool" in inspect.signature(data_class.from_json).parameters
+        self.queue_size = None
+        self.stage_stats = []
 
     def with_path(self, path: str) -> "DictionaryReader":
         self.path = path
         return self
 
+    def with_term_pool(self, term_pool: TermPool) -> "DictionaryReader":
+        self.term_pool = term_pool
+        return self
+
+    def with_pipeline(self, queue_size: int = 4) -> "DictionaryReader":
+        """
+        Inflate, parse and convert the banks in separate threads,
+        so that inflating the next bank overlaps with converting the current one.
+        """
+        self.queue_size = queue_size
+        return self
+
+    @profiling.stage("dictionary.read")
     def read(self) -> Dictionary:
         if self.path is None:
             raise ValueError("Path required")
@@ -102,13 +140,18 @@ class DictionaryReader:
             data = list()
             bank_files = [f for f in zip_file.namelist() if self.term_bank_name in f]
 
-            for file in bank_files:
-                with zip_file.open(file, "r") as f:
-                    array_obj = json.load(f)
-                    for data_obj in array_obj:
-                        datum = self.data_class.from_json(data_obj)
-                        datum.term.with_default_reading()
-                        data.append(datum)
+            if self.queue_size is None:
+                for file in bank_files:
+                    with zip_file.open(file, "r") as f:
+                        data.extend(self.from_json(json.load(f)))
+            else:
+                pipeline = Pipeline(self.queue_size) \
+                    .add_stage("inflate", lambda it: (zip_file.read(file) for file in it)) \
+                    .add_stage("parse", lambda it: map(json.loads, it)) \
+                    .add_stage("convert", lambda it: map(self.from_json, it))
+                for chunk in pipeline.run(iter(bank_files)):
+                    data.extend(chunk)
+                self.stage_stats = pipeline.stats
 
             with zip_file.open("index.json", "r") as f:
                 index_obj = json.load(f)
@@ -117,6 +160,17 @@ class DictionaryReader:
 
             return dictionary
 
+    def from_json(self, array_obj: List[Any]) -> List[Any]:
+        data = list()
+        for data_obj in array_obj:
+            if self.pooled and self.term_pool is not None:
+                datum = self.data_class.from_json(data_obj, term_pool=self.term_pool)
+            else:
+                datum = self.data_class.from_json(data_obj)
+            datum.term.with_default_reading()
+            data.append(datum)
+        return data
+
 
 class DictionaryWriter:
     dictionary: Dictionary
@@ -136,6 +190,7 @@ class DictionaryWriter:
         self.chunk_size = chunk_size
         return self
 
+    @profiling.stage("dictionary.write", records_in=lambda self: len(self.dictionary))
     def write(self):
         if self.path is None:
             raise ValueError("Path required")
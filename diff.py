@@ -0,0 +1,293 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import zlib
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Type
+from zipfile import ZipFile
+import unittest
+
+import profiling
+from definition import Definition
+from rank import Rank
+from term import Term
+
+Key = Tuple[str, str]
+"""
+Text and reading of a term
+"""
+BANK_CLASSES = {"term_meta_bank": Rank, "term_bank": Definition}
+"""
+Maps the name prefix of banks to the class of their entries
+"""
+MEMORY_FACTOR = 10
+"""
+Approximate ratio of the memory of parsed entries to the size of their JSON
+"""
+
+
+def entry_key(obj: Any, data_class: Type[Any]) -> Key:
+    """
+    Text and reading of a raw entry, parsed the same way as by the entry class but without building it.
+    """
+    if data_class is Definition:
+        return obj[0], obj[1]
+    second_obj = obj[2]
+    if isinstance(second_obj, dict) and "frequency" in second_obj:
+        return obj[0], second_obj.get("reading", obj[0])
+    return obj[0], obj[0]
+
+
+def bank_class(name: str) -> Optional[Type[Any]]:
+    return next((cls for prefix, cls in BANK_CLASSES.items() if name.startswith(prefix)), None)
+
+
+def read_entries(zip_path: str) -> Iterator[Tuple[Key, Any]]:
+    """
+    Iterate over the term and raw JSON object of every entry in the banks of a dictionary zip.
+
+    Banks are loaded one at a time, so memory does not grow with the number of banks.
+    """
+    with ZipFile(zip_path, mode="r") as zip_file:
+        for name in zip_file.namelist():
+            data_class = bank_class(name)
+            if data_class is None:
+                continue
+            with zip_file.open(name, "r") as f:
+                for obj in json.load(f):
+                    yield entry_key(obj, data_class), obj
+
+
+def estimated_size(zip_path: str) -> int:
+    """
+    Rough memory in bytes of all entries of a dictionary zip once parsed,
+    estimated from the uncompressed size of its banks.
+    """
+    with ZipFile(zip_path, mode="r") as zip_file:
+        return MEMORY_FACTOR * sum(info.file_size for info in zip_file.infolist() if bank_class(info.filename))
+
+
+def read_index(zip_path: str) -> Dict[str, Any]:
+    with ZipFile(zip_path, mode="r") as zip_file:
+        with zip_file.open("index.json", "r") as f:
+            return json.load(f)
+
+
+def group(entries: Iterator[Tuple[Key, Any]]) -> Dict[Key, List[Any]]:
+    groups: Dict[Key, List[Any]] = dict()
+    for key, obj in entries:
+        groups.setdefault(key, []).append(obj)
+    return groups
+
+
+class DiffSummary:
+    """
+    Statistics over all compared terms.
+    """
+    counts: Counter
+    rank_shifts: List[int]
+    """
+    Old rank minus new rank of each term that moved, so positive shifts move up
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+        self.rank_shifts = []
+
+    def to_json(self) -> Dict[str, Any]:
+        obj: Dict[str, Any] = {key: self.counts[key] for key in sorted(self.counts)}
+        if self.rank_shifts:
+            shifts = [abs(shift) for shift in self.rank_shifts]
+            obj["moved_up"] = sum(1 for shift in self.rank_shifts if shift > 0)
+            obj["moved_down"] = sum(1 for shift in self.rank_shifts if shift < 0)
+            obj["mean_abs_shift"] = sum(shifts) / len(shifts)
+            obj["max_abs_shift"] = max(shifts)
+        return obj
+
+
+def compare(key: Key, old: List[Any], new: List[Any], summary: DiffSummary) -> Optional[Dict[str, Any]]:
+    """
+    Report of how the entries of one term changed, or None if they did not.
+    """
+    text, reading = key
+    if not old:
+        summary.counts["added"] += 1
+        return {"change": "added", "text": text, "reading": reading, "new": new}
+    if not new:
+        summary.counts["removed"] += 1
+        return {"change": "removed", "text": text, "reading": reading, "old": old}
+
+    def canonical(objs: Iterable[Any]) -> List[str]:
+        return sorted(json.dumps(obj, ensure_ascii=False, sort_keys=True) for obj in objs)
+
+    # Entries usually keep their order, which saves serializing them
+    if old == new or canonical(old) == canonical(new):
+        summary.counts["unchanged"] += 1
+        return None
+
+    summary.counts["changed"] += 1
+    record: Dict[str, Any] = {"change": "changed", "text": text, "reading": reading, "old": old, "new": new}
+
+    if all(len(obj) == 3 and obj[1] == "freq" for obj in old + new):
+        old_rank = min(Rank.from_json(obj).rank for obj in old)
+        new_rank = min(Rank.from_json(obj).rank for obj in new)
+        if old_rank != new_rank:
+            record["rank_shift"] = old_rank - new_rank
+            summary.rank_shifts.append(old_rank - new_rank)
+    else:
+        old_definitions = [Definition.from_json(obj) for obj in old]
+        new_definitions = [Definition.from_json(obj) for obj in new]
+        fields = {
+            "tags": lambda x: (x.def_tags, x.top_tags),
+            "glosses": lambda x: tuple(x.definitions),
+            "popularity": lambda x: x.popularity,
+        }
+        # Glosses can be structured content, which has no order, so fields are compared as JSON
+        changed_fields = [name for name, f in fields.items()
+                          if canonical(map(f, old_definitions)) != canonical(map(f, new_definitions))]
+        for name in changed_fields:
+            summary.counts[f"{name}_changed"] += 1
+        record["fields"] = changed_fields
+    return record
+
+
+def diff_groups(old: Dict[Key, List[Any]], new_entries: Iterator[Tuple[Key, Any]], f_out: TextIO, summary: DiffSummary):
+    """
+    Hash join of the grouped old entries with the new entries, writing one JSON line per changed term.
+    """
+    new = group(new_entries)
+    for key, objs in new.items():
+        record = compare(key, old.pop(key, []), objs, summary)
+        if record is not None:
+            f_out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    for key, objs in old.items():
+        record = compare(key, objs, [], summary)
+        f_out.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def partition_path(directory: str, side: str, index: int) -> str:
+    return os.path.join(directory, f"{side}_{index}.jsonl")
+
+
+def write_partitions(entries: Iterator[Tuple[Key, Any]], directory: str, side: str, partitions: int):
+    """
+    Spread entries over partition files by the hash of their term,
+    so that each term of both sides ends up in the partition with the same index.
+    """
+    files = [open(partition_path(directory, side, i), "w", encoding="utf-8") for i in range(partitions)]
+    try:
+        for key, obj in entries:
+            index = zlib.crc32(f"{key[0]}\t{key[1]}".encode("utf-8")) % partitions
+            files[index].write(json.dumps([key[0], key[1], obj], ensure_ascii=False) + "\n")
+    finally:
+        for f in files:
+            f.close()
+
+
+def read_partition(path: str) -> Iterator[Tuple[Key, Any]]:
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            text, reading, obj = json.loads(line)
+            yield (text, reading), obj
+
+
+def diff(old_path: str, new_path: str, f_out: TextIO, memory_budget: int = 1 << 30, partitions: int = 16) -> DiffSummary:
+    """
+    Write a JSON line for every term whose entries differ between two dictionary zips and return a summary.
+
+    Both dictionaries are grouped by term in memory if the estimated size of each fits the budget in bytes.
+    Otherwise, both dictionaries are partitioned into temporary files by the hash of each term
+    and the partitions are joined one pair at a time.
+    """
+    summary = DiffSummary()
+    if max(estimated_size(old_path), estimated_size(new_path)) <= memory_budget:
+        diff_groups(group(read_entries(old_path)), read_entries(new_path), f_out, summary)
+        return summary
+
+    summary.counts["partitions"] = partitions
+    with tempfile.TemporaryDirectory() as directory:
+        write_partitions(read_entries(old_path), directory, "old", partitions)
+        write_partitions(read_entries(new_path), directory, "new", partitions)
+        for i in range(partitions):
+            old = group(read_partition(partition_path(directory, "old", i)))
+            diff_groups(old, read_partition(partition_path(directory, "new", i)), f_out, summary)
+    return summary
+
+
+def index_changes(old_path: str, new_path: str) -> Dict[str, List[Any]]:
+    old = read_index(old_path)
+    new = read_index(new_path)
+    return {key: [old.get(key), new.get(key)] for key in sorted(set(old) | set(new)) if old.get(key) != new.get(key)}
+
+
+class TestDiff(unittest.TestCase):
+    def write_dictionaries(self, directory: str) -> Tuple[str, str]:
+        old = Rank.dictionary([Rank(Term(f"語{i}", f"ご{i}"), i) for i in range(100)]).with_revision("1")
+        new = Rank.dictionary([Rank(Term(f"語{i}", f"ご{i}"), i if i % 10 else i + 5) for i in range(5, 105)]) \
+            .with_revision("2")
+        old_path = os.path.join(directory, "old.zip")
+        new_path = os.path.join(directory, "new.zip")
+        old.writer().with_path(old_path).in_chunks(30).write()
+        new.writer().with_path(new_path).in_chunks(30).write()
+        return old_path, new_path
+
+    def run_diff(self, old_path: str, new_path: str, memory_budget: int) -> Tuple[List[Dict[str, Any]], DiffSummary]:
+        with tempfile.TemporaryFile("w+", encoding="utf-8") as f:
+            summary = diff(old_path, new_path, f, memory_budget, partitions=4)
+            f.seek(0)
+            records = sorted((json.loads(line) for line in f), key=lambda x: (x["text"], x["reading"]))
+        return records, summary
+
+    def test_ranks(self):
+        with tempfile.TemporaryDirectory() as directory:
+            old_path, new_path = self.write_dictionaries(directory)
+            records, summary = self.run_diff(old_path, new_path, 1 << 30)
+            partitioned_records, partitioned_summary = self.run_diff(old_path, new_path, 100)
+            self.assertEqual({"revision": ["1", "2"]}, index_changes(old_path, new_path))
+
+        self.assertEqual(records, partitioned_records)
+        self.assertEqual(4, partitioned_summary.counts["partitions"])
+        self.assertEqual({"added": 5, "removed": 5, "changed": 9, "unchanged": 86,
+                          "moved_up": 0, "moved_down": 9, "mean_abs_shift": 5.0, "max_abs_shift": 5},
+                         summary.to_json())
+        changed = [x for x in records if x["change"] == "changed"]
+        self.assertEqual({-5}, {x["rank_shift"] for x in changed})
+
+    def test_definitions(self):
+        summary = DiffSummary()
+        old = [Definition(Term("川", "かわ"), "", "", 0, ("流れ。",), 1, "").to_json()]
+        new = [Definition(Term("川", "かわ"), "N5", "", 3, ("流れ。",), 1, "").to_json()]
+        record = compare(("川", "かわ"), old, new, summary)
+        self.assertEqual(["tags", "popularity"], record["fields"])
+        self.assertIsNone(compare(("川", "かわ"), old, old, summary))
+        self.assertEqual({"changed": 1, "unchanged": 1, "tags_changed": 1, "popularity_changed": 1},
+                         summary.to_json())
+
+        glosses = [{"type": "structured-content", "content": "流れ。"}, {"type": "structured-content", "content": "川。"}]
+        old = [Definition(Term("川", "かわ"), "", "", 0, (gloss,), 1, "").to_json() for gloss in glosses]
+        new = [Definition(Term("川", "かわ"), "", "", 1, (gloss,), 1, "").to_json() for gloss in reversed(glosses)]
+        self.assertEqual(["popularity"], compare(("川", "かわ"), old, new, summary)["fields"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report the differences between two Yomichan dictionaries")
+
+    parser.add_argument("path_old", type=str, help="Path to old dictionary")
+    parser.add_argument("path_new", type=str, help="Path to new dictionary")
+    parser.add_argument("path_out", type=str, help="Path of JSON lines report with one line per changed term")
+    parser.add_argument("--memory", type=int, default=1024,
+                        help="Memory budget in megabytes before partitioning to disk")
+    parser.add_argument("--partitions", type=int, default=16, help="Number of partitions when over budget")
+    profiling.add_arguments(parser)
+
+    args = parser.parse_args()
+
+    with profiling.from_args(args):
+        with open(args.path_out, "w", encoding="utf-8") as f:
+            summary = diff(args.path_old, args.path_new, f, args.memory * 1024 * 1024, args.partitions)
+
+        report = {"index": index_changes(args.path_old, args.path_new), "summary": summary.to_json()}
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=1)
+        print()
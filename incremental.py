@@ -0,0 +1,265 @@
+import json
+import os
+import tempfile
+from bisect import bisect_left, insort
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Tuple
+import unittest
+
+import rank
+from occurrence import Occurrence, OccurrenceBag
+from rank import Rank
+from term import Term
+
+MODES = ["distinct", "overlap"]
+"""
+How a new source is added to the bag, as in OccurrenceBag.extend_distinct and extend_overlap
+"""
+
+
+@dataclass
+class RankDelta:
+    changed: List[Rank] = field(default_factory=list)
+    """
+    Entries whose rank is new or different, ordered by rank
+    """
+    removed: List[Term] = field(default_factory=list)
+    """
+    Terms that fell to or beyond the maximum rank
+    """
+
+    def __len__(self) -> int:
+        return len(self.changed) + len(self.removed)
+
+
+class RankTracker:
+    """
+    Ranking by count that is maintained under count updates.
+
+    Terms are kept in a sorted list of (-count, sequence) keys,
+    where the sequence number of a term is the order in which it first appeared.
+    That is the same order as rank.from_counts on a dictionary with the same insertion order.
+
+    An update moves each changed term by removal and insertion into the sorted list
+    and then only compares the positions between the lowest and highest affected position
+    with the published ranks.
+    Updates that touch a large part of the terms rebuild the sorted list in one go instead.
+    """
+    max_rank: int
+    counts: Dict[Term, int]
+    sequence: Dict[Term, int]
+    order: List[Tuple[int, int]]
+    terms: List[Term]
+    """
+    Maps sequence numbers to terms
+    """
+    published: Dict[Term, int]
+    """
+    Ranks below the maximum as of the last update
+    """
+
+    def __init__(self, max_rank: int):
+        self.max_rank = max_rank
+        self.counts = dict()
+        self.sequence = dict()
+        self.order = []
+        self.terms = []
+        self.published = dict()
+
+    def ranks(self) -> List[Rank]:
+        terms = self.terms
+        return [Rank(terms[seq], position) for position, (_count, seq) in enumerate(self.order[:self.max_rank])]
+
+    def update(self, counts: Mapping[Term, int]) -> RankDelta:
+        """
+        Set the counts of the given terms and return the changed ranks.
+        """
+        if len(counts) > len(self.order) // 4:
+            return self.rebuild(counts)
+
+        order = self.order
+        low = len(order)
+        high = -1
+
+        for term, count in counts.items():
+            seq = self.sequence.get(term)
+            if seq is None:
+                seq = self.sequence[term] = len(self.terms)
+                self.terms.append(term)
+                # A new term shifts every term after it
+                high = len(order)
+            else:
+                old_count = self.counts[term]
+                if old_count == count:
+                    continue
+                old = bisect_left(order, (-old_count, seq))
+                del order[old]
+                low = min(low, old)
+                high = max(high, old)
+
+            self.counts[term] = count
+            insort(order, (-count, seq))
+            new = bisect_left(order, (-count, seq))
+            low = min(low, new)
+            high = max(high, new)
+
+        return self.publish(low, high)
+
+    def rebuild(self, counts: Mapping[Term, int]) -> RankDelta:
+        for term, count in counts.items():
+            if term not in self.sequence:
+                self.sequence[term] = len(self.terms)
+                self.terms.append(term)
+            self.counts[term] = count
+
+        sequence = self.sequence
+        self.order = sorted((-count, sequence[term]) for term, count in self.counts.items())
+        return self.publish(0, len(self.order) - 1)
+
+    def publish(self, low: int, high: int) -> RankDelta:
+        """
+        Compare the positions from low to high with the published ranks and update them.
+        """
+        delta = RankDelta()
+        order = self.order
+        terms = self.terms
+        published = self.published
+        for position in range(low, min(high + 1, len(order))):
+            term = terms[order[position][1]]
+            if position < self.max_rank:
+                if published.get(term) != position:
+                    published[term] = position
+                    delta.changed.append(Rank(term, position))
+            elif term in published:
+                del published[term]
+                delta.removed.append(term)
+        return delta
+
+
+class IncrementalBag:
+    """
+    Occurrence bag that absorbs new sources one at a time and keeps its ranking up to date.
+
+    Absorbing a source costs time proportional to its size plus the number of rank positions that move.
+    Each source is absorbed at most once, so rerunning a refresh does not double count.
+    """
+    bag: OccurrenceBag
+    sources: List[str]
+    tracker: RankTracker
+
+    def __init__(self, max_rank: int):
+        self.bag = OccurrenceBag()
+        self.sources = []
+        self.tracker = RankTracker(max_rank)
+
+    def absorb(self, name: str, other: OccurrenceBag, mode: str = "distinct") -> RankDelta:
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode: {mode}")
+        if name in self.sources:
+            return RankDelta()
+
+        if mode == "distinct":
+            self.bag.extend_distinct(other)
+        else:
+            self.bag.extend_overlap(other)
+        self.sources.append(name)
+
+        data = self.bag.data
+        totals = {term: sum(data[term].values()) for term in other.data}
+        return self.tracker.update(totals)
+
+    def save(self, path: str):
+        """
+        Write the bag to a JSON file.
+
+        Terms are written in the order in which they first appeared, which decides ties in the ranking.
+        """
+        data = self.bag.data
+        occurrences = [[term.text, term.reading, provenance, count]
+                       for term in self.tracker.terms
+                       for provenance, count in data[term].items()]
+        obj = {"max_rank": self.tracker.max_rank, "sources": self.sources, "occurrences": occurrences}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str) -> "IncrementalBag":
+        with open(path, "r", encoding="utf-8") as f:
+            obj = json.load(f)
+
+        result = IncrementalBag(obj["max_rank"])
+        for text, reading, provenance, count in obj["occurrences"]:
+            result.bag.insert(Occurrence(Term(text, reading), provenance), count)
+        result.sources = obj["sources"]
+        data = result.bag.data
+        result.tracker.update({term: sum(data[term].values()) for term in data})
+        return result
+
+
+def apply_delta(ranks: Dict[Term, int], delta: RankDelta):
+    """
+    Bring a published mapping of terms to ranks up to date.
+    """
+    for term in delta.removed:
+        ranks.pop(term, None)
+    for x in delta.changed:
+        ranks[x.term] = x.rank
+
+
+class TestIncremental(unittest.TestCase):
+    a, b, c, d = Term("学校", "がっこう"), Term("川", "かわ"), Term("海", "うみ"), Term("水", "みず")
+
+    def make_bag(self, counts: Dict[Term, int], provenance: str = "") -> OccurrenceBag:
+        bag = OccurrenceBag()
+        for term, count in counts.items():
+            bag.insert(Occurrence(term, provenance), count)
+        return bag
+
+    def assertMatchesScratch(self, incremental: IncrementalBag):
+        expected = list(rank.below_max_rank(rank.from_counts(incremental.bag.to_counts()), incremental.tracker.max_rank))
+        self.assertEqual(expected, incremental.tracker.ranks())
+        self.assertEqual({x.term: x.rank for x in expected}, incremental.tracker.published)
+
+    def test_absorb(self):
+        incremental = IncrementalBag(3)
+        delta = incremental.absorb("first", self.make_bag({self.a: 5, self.b: 3, self.c: 1}))
+        self.assertEqual([Rank(self.a, 0), Rank(self.b, 1), Rank(self.c, 2)], delta.changed)
+
+        delta = incremental.absorb("second", self.make_bag({self.c: 6, self.d: 2}))
+        # c moves up past a and b, d stays beyond the maximum rank
+        self.assertEqual([Rank(self.c, 0), Rank(self.a, 1), Rank(self.b, 2)], delta.changed)
+        self.assertEqual([], delta.removed)
+        self.assertMatchesScratch(incremental)
+
+        delta = incremental.absorb("third", self.make_bag({self.d: 10}))
+        self.assertEqual([Rank(self.d, 0), Rank(self.c, 1), Rank(self.a, 2)], delta.changed)
+        self.assertEqual([self.b], delta.removed)
+        self.assertMatchesScratch(incremental)
+
+        self.assertEqual(0, len(incremental.absorb("third", self.make_bag({self.d: 10}))))
+
+    def test_overlap(self):
+        incremental = IncrementalBag(10)
+        incremental.absorb("suw", self.make_bag({self.a: 5, self.b: 3}, "x"))
+        delta = incremental.absorb("luw", self.make_bag({self.a: 4, self.b: 6}, "x"), "overlap")
+        self.assertEqual([Rank(self.b, 0), Rank(self.a, 1)], delta.changed)
+        self.assertMatchesScratch(incremental)
+
+    def test_apply_delta(self):
+        incremental = IncrementalBag(2)
+        published: Dict[Term, int] = dict()
+        for i, counts in enumerate([{self.a: 1, self.b: 2}, {self.c: 5}, {self.a: 10, self.d: 1}]):
+            apply_delta(published, incremental.absorb(str(i), self.make_bag(counts)))
+            self.assertEqual({x.term: x.rank for x in incremental.tracker.ranks()}, published)
+
+    def test_save_load(self):
+        incremental = IncrementalBag(10)
+        incremental.absorb("first", self.make_bag({self.a: 1, self.b: 1, self.c: 2}))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bag.json")
+            incremental.save(path)
+            loaded = IncrementalBag.load(path)
+
+        self.assertEqual(incremental.tracker.ranks(), loaded.tracker.ranks())
+        self.assertEqual(["first"], loaded.sources)
+        self.assertMatchesScratch(loaded)
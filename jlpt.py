@@ -1,34 +1,95 @@
+import os
+import sys
 import unittest
-from typing import Optional
+from typing import Optional, Dict, Set, List, Iterable, Iterator, Tuple
 
 from definition import Definition
+from join import CanonicalKey, canonical_keys
 from term import Term
 
-N5 = {Term("学校", "がっこう"), Term("川", "かわ"), Term("手", "て"), Term("戸", "と"), Term("眼鏡", "めがね"), Term("煙草", "たばこ"), Term("赤", "あか"), Term("仕事", "しごと"), Term("英語", "えいご"), Term("問題", "もんだい"), Term("部屋", "へや"), Term("子供", "こども"), Term("時間", "じかん"), Term("雨", "あめ"), Term("先生", "せんせい"), Term("年", "とし"), Term("手紙", "てがみ"), Term("電話", "でんわ"), Term("水", "みず"), Term("病気", "びょうき"), Term("会社", "かいしゃ"), Term("上げる", "あげる"), Term("結婚", "けっこん"), Term("言葉", "ことば"), Term("目", "め"), Term("走る", "はしる"), Term("名前", "なまえ"), Term("旅行", "りょこう"), Term("道", "みち"), Term("飛行機", "ひこうき"), Term("映画", "えいが"), Term("音楽", "おんがく"), Term("木", "き"), Term("大学", "だいがく"), Term("時計", "とけい"), Term("家族", "かぞく"), Term("花", "はな"), Term("猫", "ねこ"), Term("毎日", "まいにち"), Term("宿題", "しゅくだい"), Term("雪", "ゆき"), Term("山", "やま"), Term("窓", "まど"), Term("動物", "どうぶつ"), Term("夜", "よる"), Term("料理", "りょうり"), Term("夏", "なつ"), Term("新聞", "しんぶん"), Term("公園", "こうえん"), Term("意味", "いみ"), Term("自転車", "じてんしゃ"), Term("足", "あし"), Term("電車", "でんしゃ"), Term("散歩", "さんぽ"), Term("声", "こえ"), Term("朝", "あさ"), Term("歌", "うた"), Term("靴", "くつ"), Term("箱", "はこ"), Term("机", "つくえ"), Term("帽子", "ぼうし"), Term("海", "うみ"), Term("授業", "じゅぎょう"), Term("銀行", "ぎんこう"), Term("写真", "しゃしん"), Term("冬", "ふゆ"), Term("村", "むら"), Term("傘", "かさ"), Term("口", "くち"), Term("橋", "はし"), Term("病院", "びょういん"), Term("図書館", "としょかん"), Term("春", "はる"), Term("買い物", "かいもの"), Term("椅子", "いす"), Term("自動車", "じどうしゃ"), Term("色", "いろ"), Term("卵", "たまご"), Term("肉", "にく"), Term("風邪", "かぜ"), Term("掃除", "そうじ"), Term("紙", "かみ"), Term("鍵", "かぎ"), Term("雑誌", "ざっし"), Term("切符", "きっぷ"), Term("外国人", "がいこくじん"), Term("財布", "さいふ"), Term("鉛筆", "えんぴつ"), Term("大人", "おとな"), Term("塩", "しお"), Term("砂糖", "さとう"), Term("夏休み", "なつやすみ"), Term("池", "いけ"), Term("郵便局", "ゆうびんきょく"), Term("教室", "きょうしつ"), Term("耳", "みみ"), Term("切手", "きって"), Term("台所", "だいどころ"), Term("電気", "でんき"), Term("作文", "さくぶん"), Term("紅茶", "こうちゃ"), Term("家庭", "かてい"), Term("野菜", "やさい"), Term("風呂", "ふろ"), Term("玄関", "げんかん"), Term("地下鉄", "ちかてつ"), Term("鼻", "はな"), Term("緑", "みどり"), Term("昼", "ひる"), Term("西", "にし"), Term("白", "しろ"), Term("洗濯", "せんたく"), Term("冷蔵庫", "れいぞうこ"), Term("南", "みなみ"), Term("火曜日", "かようび"), Term("北", "きた"), Term("茶色", "ちゃいろ"), Term("喫茶店", "きっさてん"), Term("黒", "くろ"), Term("青", "あお"), Term("靴下", "くつした"), Term("封筒", "ふうとう"), Term("辺", "へん"), Term("黄色", "きいろ"), Term("映画館", "えいがかん"), Term("箸", "はし"), Term("食堂", "しょくどう"), Term("牛肉", "ぎゅうにく"), Term("交差点", "こうさてん"), Term("茶わん", "ちゃわん"), Term("漢字", "かんじ"), Term("曇り", "くもり"), Term("背広", "せびろ"), Term("万年筆", "まんねんひつ"), Term("灰皿", "はいざら"), Term("大使館", "たいしかん"), Term("豚肉", "ぶたにく"), Term("交番", "こうばん"), Term("飲む", "のむ"), Term("頭", "あたま"), Term("日曜日", "にちようび"), Term("誕生日", "たんじょうび"), Term("可愛い", "かわい"), Term("鞄", "かばん"), Term("土曜日", "どようび"), Term("月曜日", "げつようび"), Term("金曜日", "きんようび"), Term("花瓶", "かびん"), Term("木曜日", "もくようび"), Term("本棚", "ほんだな"), Term("石鹸", "せっけん"), Term("水曜日", "すいようび"), Term("飴", "あめ"), Term("八百屋", "やおや"), Term("成る", "なる"), Term("より", "より"), Term("一番", "いちばん"), Term("私", "わたし"), Term("外", "そと"), Term("姉", "あね"), Term("百", "ひゃく"), Term("在る", "ある"), Term("其の", "その"), Term("言う", "いう"), Term("出来る", "できる"), Term("良い", "よい"), Term("下さい", "ください"), Term("見る", "みる"), Term("此の", "この"), Term("自分", "じぶん"), Term("知る", "しる"), Term("持つ", "もつ"), Term("何", "なに"), Term("車", "くるま"), Term("話す", "はなす"), Term("今", "いま"), Term("今日", "きょう"), Term("買う", "かう"), Term("読む", "よむ"), Term("皆", "みんな"), Term("新しい", "あたらしい"), Term("話", "はなし"), Term("明日", "あした"), Term("昨日", "きのう"), Term("出る", "でる"), Term("勉強", "べんきょう"), Term("取る", "とる"), Term("誰", "だれ"), Term("お金", "おかね"), Term("男", "おとこ"), Term("犬", "いぬ"), Term("使う", "つかう"), Term("大変", "たいへん"), Term("待つ", "まつ"), Term("作る", "つくる"), Term("後ろ", "うしろ"), Term("町", "まち"), Term("駅", "えき"), Term("少し", "すこし"), Term("貴方", "あなた"), Term("欲しい", "ほしい"), Term("行く", "いく"), Term("乗る", "のる"), Term("大きな", "おおきな"), Term("医者", "いしゃ"), Term("終わる", "おわる"), Term("学生", "がくせい"), Term("長い", "ながい"), Term("何の", "どの"), Term("国", "くに"), Term("又", "また"), Term("高い", "たかい"), Term("余り", "あまり"), Term("難しい", "むずかしい"), Term("友達", "ともだち"), Term("本当", "ほんとう"), Term("一つ", "ひとつ"), Term("寝る", "ねる"), Term("生徒", "せいと"), Term("忙しい", "いそがしい"), Term("両親", "りょうしん"), Term("泳ぐ", "およぐ"), Term("立つ", "たつ"), Term("出す", "だす"), Term("早い", "はやい"), Term("楽しい", "たのしい"), Term("面白い", "おもしろい"), Term("絵", "え"), Term("女の子", "おんなのこ"), Term("着る", "きる"), Term("上手", "じょうず"), Term("古い", "ふるい"), Term("強い", "つよい"), Term("全部", "ぜんぶ"), Term("呼ぶ", "よぶ"), Term("午後", "ごご"), Term("掛ける", "かける"), Term("辞書", "じしょ"), Term("天気", "てんき"), Term("体", "からだ"), Term("大きい", "おおきい"), Term("質問", "しつもん"), Term("夕べ", "ゆうべ"), Term("有名", "ゆうめい"), Term("兄", "あに"), Term("歌う", "うたう"), Term("上る", "のぼる"), Term("服", "ふく"), Term("鳥", "とり"), Term("時々", "ときどき"), Term("妹", "いもうと"), Term("二つ", "ふたつ"), Term("頼む", "たのむ"), Term("お父さん", "おとうさん"), Term("今朝", "けさ"), Term("遅い", "おそい"), Term("薬", "くすり"), Term("借りる", "かりる"), Term("庭", "にわ"), Term("外国", "がいこく"), Term("元気", "げんき"), Term("小さい", "ちいさい"), Term("弟", "おとうと"), Term("今年", "ことし"), Term("魚", "さかな"), Term("お母さん", "おかあさん"), Term("男の子", "おとこのこ"), Term("飛ぶ", "とぶ"), Term("売る", "うる"), Term("静か", "しずか"), Term("休む", "やすむ"), Term("食べ物", "たべもの"), Term("大切", "たいせつ"), Term("警官", "けいかん"), Term("来週", "らいしゅう"), Term("建物", "たてもの"), Term("暖かい", "あたたかい"), Term("降りる", "おりる"), Term("止まる", "とまる"), Term("一緒", "いっしょ"), Term("先週", "せんしゅう"), Term("白い", "しろい"), Term("二", "に"), Term("少ない", "すくない"), Term("赤い", "あかい"), Term("洗う", "あらう"), Term("嫌い", "きらい"), Term("立派", "りっぱ"), Term("暇", "ひま"), Term("お茶", "おちゃ"), Term("広い", "ひろい"), Term("去年", "きょねん"), Term("隣", "となり"), Term("大好き", "だいすき"), Term("女", "おんな"), Term("多分", "たぶん"), Term("切る", "きる"), Term("嫌", "いや"), Term("毎朝", "まいあさ"), Term("荷物", "にもつ"), Term("番号", "ばんごう"), Term("返す", "かえす"), Term("来年", "らいねん"), Term("明るい", "あかるい"), Term("近い", "ちかい"), Term("向こう", "むこう"), Term("始め", "はじめ"), Term("痛い", "いたい"), Term("休み", "やすみ"), Term("十", "じゅう"), Term("練習", "れんしゅう"), Term("先月", "せんげつ"), Term("上着", "うわぎ"), Term("結構", "けっこう"), Term("毎年", "まいとし"), Term("兄弟", "きょうだい"), Term("来月", "らいげつ"), Term("五", "ご"), Term("飲み物", "のみもの"), Term("牛乳", "ぎゅうにゅう"), Term("弱い", "よわい"), Term("三", "さん"), Term("大丈夫", "だいじょうぶ"), Term("黒い", "くろい"), Term("半分", "はんぶん"), Term("皆さん", "みなさん"), Term("押す", "おす"), Term("勤める", "つとめる"), Term("熱い", "あつい"), Term("三つ", "みっつ"), Term("果物", "くだもの"), Term("今週", "こんしゅう"), Term("甘い", "あまい"), Term("右", "みぎ"), Term("晩", "ばん"), Term("幾つ", "いくつ"), Term("大勢", "おおぜい"), Term("階段", "かいだん"), Term("張る", "はる"), Term("夕方", "ゆうがた"), Term("低い", "ひくい"), Term("左", "ひだり"), Term("毎週", "まいしゅう"), Term("下手", "へた"), Term("千", "せん"), Term("渡す", "わたす"), Term("午前", "ごぜん"), Term("丸い", "まるい"), Term("便利", "べんり"), Term("今月", "こんげつ"), Term("浴びる", "あびる"), Term("半", "はん"), Term("洋服", "ようふく"), Term("撮る", "とる"), Term("締める", "しめる"), Term("文章", "ぶんしょう"), Term("八", "はち"), Term("薄い", "うすい"), Term("横", "よこ"), Term("四つ", "よっつ"), Term("六", "ろく"), Term("丈夫", "じょうぶ"), Term("毎晩", "まいばん"), Term("東", "ひがし"), Term("晴れ", "はれ"), Term("五つ", "いつ"), Term("細い", "ほそい"), Term("廊下", "ろうか"), Term("太い", "ふとい"), Term("縦", "たて"), Term("九つ", "ここのつ"), Term("留学生", "りゅうがくせい"), Term("七つ", "ななつ"), Term("一昨年", "いっさくねん"), Term("人", "ひと"), Term("居る", "いる"), Term("其れ", "それ"), Term("物", "もの"), Term("家", "いえ"), Term("本", "ほん"), Term("迚も", "とても"), Term("会う", "あう"), Term("好き", "すき"), Term("分かる", "わかる"), Term("聞く", "きく"), Term("所", "ところ"), Term("先", "さき"), Term("何時も", "いつも"), Term("書く", "かく"), Term("沢山", "たくさん"), Term("入る", "はいる"), Term("置く", "おく"), Term("何処", "どこ"), Term("住む", "すむ"), Term("食べる", "たべる"), Term("歩く", "あるく"), Term("働く", "はたらく"), Term("着く", "つく"), Term("上", "うえ"), Term("悪い", "わるい"), Term("教える", "おしえる"), Term("降る", "ふる"), Term("死ぬ", "しぬ"), Term("帰る", "かえる"), Term("忘れる", "わすれる"), Term("多い", "おおい"), Term("出掛ける", "でかける"), Term("若い", "わかい"), Term("掛かる", "かかる"), Term("同じ", "おなじ"), Term("起きる", "おきる"), Term("座る", "すわる"), Term("店", "みせ"), Term("入れる", "いれる"), Term("何方", "どなた"), Term("一寸", "ちょっと"), Term("疲れる", "つかれる"), Term("開ける", "あける"), Term("何故", "なぜ"), Term("一日", "いちにち"), Term("寒い", "さむい"), Term("見せる", "みせる"), Term("違う", "ちがう"), Term("如何して", "どうして"), Term("付ける", "つける"), Term("覚える", "おぼえる"), Term("近く", "ちかく"), Term("風", "かぜ"), Term("困る", "こまる"), Term("生まれる", "うまれる"), Term("丁度", "ちょうど"), Term("初めて", "はじめて"), Term("始まる", "はじまる"), Term("貸す", "かす"), Term("奇麗", "きれい"), Term("幾ら", "いくら"), Term("空", "そら"), Term("弾く", "ひく"), Term("暑い", "あつい"), Term("遊ぶ", "あそぶ"), Term("然し", "しかし"), Term("無くす", "なくす"), Term("色々", "いろいろ"), Term("渡る", "わたる"), Term("暗い", "くらい"), Term("此方", "こちら"), Term("重い", "おもい"), Term("今晩", "こんばん"), Term("美味しい", "おいしい"), Term("消す", "けす"), Term("易しい", "やさしい"), Term("閉める", "しめる"), Term("安い", "やすい"), Term("遠い", "とおい"), Term("短い", "みじかい"), Term("晴れる", "はれる"), Term("曲がる", "まがる"), Term("消える", "きえる"), Term("冷たい", "つめたい"), Term("青い", "あおい"), Term("吹く", "ふく"), Term("頁", "ページ"), Term("奥さん", "おくさん"), Term("引く", "ひく"), Term("段々", "だんだん"), Term("習う", "ならう"), Term("彼処", "あそこ"), Term("狭い", "せまい"), Term("軽い", "かるい"), Term("脱ぐ", "ぬぐ"), Term("万", "まん"), Term("煩い", "うるさい"), Term("並ぶ", "ならぶ"), Term("吸う", "すう"), Term("詰らない", "つまらない"), Term("閉まる", "しまる"), Term("咲く", "さく"), Term("真っ直ぐ", "まっすぐ"), Term("一", "いち"), Term("お祖母さん", "おばあさん"), Term("涼しい", "すずしい"), Term("其方", "そちら"), Term("厚い", "あつい"), Term("お兄さん", "おにいさん"), Term("お姉さん", "おねえさん"), Term("危ない", "あぶない"), Term("汚い", "きたない"), Term("並べる", "ならべる"), Term("お腹", "おなか"), Term("不味い", "まずい"), Term("曇る", "くもる"), Term("ご飯", "ごはん"), Term("磨く", "みがく"), Term("お菓子", "おかし"), Term("黄色い", "きいろい"), Term("賑やか", "にぎやか"), Term("鳴く", "なく"), Term("夕飯", "ゆうはん"), Term("葉書", "はがき"), Term("Ｙシャツ", "シャツ"), Term("朝ご飯", "あさごはん"), Term("六つ", "むっつ"), Term("お手洗い", "おてあらい"), Term("お巡りさん", "おまわりさん"), Term("差す", "さす"), Term("零", "れい"), Term("二十日", "はつか"), Term("粁", "キロメートル"), Term("八つ", "やっつ"), Term("再来年", "さらいねん"), Term("良く", "よく"), Term("其処", "そこ"), Term("小さな", "ちいさな"), Term("答える", "こたえる"), Term("もう一度", "もういちど"), Term("要る", "いる"), Term("背", "せ"), Term("お弁当", "おべんとう"), Term("晩御飯", "ばんごはん"), Term("でも", "でも"), Term("等", "など"), Term("クラス", "クラス"), Term("プール", "プール"), Term("中", "なか"), Term("テレビ", "テレビ"), Term("コーヒー", "コーヒー"), Term("ホテル", "ホテル"), Term("ニュース", "ニュース"), Term("テーブル", "テーブル"), Term("カメラ", "カメラ"), Term("タクシー", "タクシー"), Term("スポーツ", "スポーツ"), Term("ラジオ", "ラジオ"), Term("ペン", "ペン"), Term("レストラン", "レストラン"), Term("テスト", "テスト"), Term("ベッド", "ベッド"), Term("パン", "パン"), Term("ナイフ", "ナイフ"), Term("シャツ", "シャツ"), Term("ネクタイ", "ネクタイ"), Term("ギター", "ギター"), Term("セーター", "セーター"), Term("米", "メートル"), Term("アパート", "アパート"), Term("ポケット", "ポケット"), Term("バター", "バター"), Term("キロ", "キロ"), Term("スカート", "スカート"), Term("レコード", "レコード"), Term("エレベーター", "エレベーター"), Term("ズボン", "ズボン"), Term("ポスト", "ポスト"), Term("コピー", "コピー"), Term("シャワー", "シャワー"), Term("ハンカチ", "ハンカチ"), Term("一昨日", "おととい"), Term("ストーブ", "ストーブ"), Term("テープ", "テープ"), Term("カップ", "カップ"), Term("テープレコーダー", "テープレコーダー"), Term("ボールペン", "ボールペン"), Term("スプーン", "スプーン"), Term("スリッパ", "スリッパ"), Term("醤油", "しょうゆ"), Term("はい", "はい"), Term("ペット", "ペット"), Term("為る", "する"), Term("彼", "あれ"), Term("バス", "バス"), Term("三日", "みっか"), Term("五日", "いつか"), Term("二日", "ふつか"), Term("十日", "とおか"), Term("六日", "むいか"), Term("八日", "ようか"), Term("九日", "ここのか"), Term("来る", "くる"), Term("後", "あと"), Term("一人", "ひとり"), Term("二人", "ふたり"), Term("側", "そば"), Term("否", "いいえ"), Term("地図", "ちず"), Term("辛い", "からい"), Term("門", "もん"), Term("角", "かど"), Term("毎月", "まいつき"), Term("七", "しち"), Term("伯母さん", "おばさん"), Term("四", "し"), Term("お風呂", "おふろ"), Term("お酒", "おさけ"), Term("入口", "いりぐち"), Term("出口", "でぐち"), Term("お皿", "おさら"), Term("昼ご飯", "ひるごはん"), Term("鳥肉", "とりにく"), Term("此れ", "これ"), Term("此処", "ここ"), Term("前", "まえ"), Term("もう", "もう"), Term("如何", "どう"), Term("方", "かた"), Term("未だ", "まだ"), Term("もっと", "もっと"), Term("何時", "いつ"), Term("パーティ", "パーティ"), Term("他", "ほか"), Term("次", "つぎ"), Term("ドア", "ドア"), Term("誰か", "だれか"), Term("開く", "あく"), Term("どうぞ", "どうぞ"), Term("こんな", "こんな"), Term("下", "した"), Term("然して", "そして"), Term("ゆっくり", "ゆっくり"), Term("コート", "コート"), Term("さあ", "さあ"), Term("どうも", "どうも"), Term("じゃあ", "じゃあ"), Term("コップ", "コップ"), Term("其れから", "それから"), Term("ええ", "ええ"), Term("ノート", "ノート"), Term("ボタン", "ボタン"), Term("デパート", "デパート"), Term("トイレ", "トイレ"), Term("其れでは", "それでは"), Term("フォーク", "フォーク"), Term("明後日", "あさって"), Term("何れ", "どれ"), Term("二十歳", "はたち"), Term("彼方", "あちら"), Term("では", "では"), Term("フィルム", "フィルム"), Term("温い", "ぬるい"), Term("四日", "よっか"), Term("カレンダー", "カレンダー"), Term("七日", "なのか"), Term("然うして", "そうして"), Term("瓦", "グラム"), Term("瓩", "キログラム"), Term("直ぐに", "すぐに"), Term("一月", "ひとつき"), Term("あのう", "あのう"), Term("マッチ", "マッチ"), Term("秋", "あき"), Term("燐寸", "マッチ"), Term("字引", "じびき"), Term("咖哩", "カレー"), Term("ラジカセ", "ラジカセ"), Term("ＰＥＴ", ""), Term("歯", "は")}
-N4 = {Term("腕", "うで"), Term("人形", "にんぎょう"), Term("文化", "ぶんか"), Term("海岸", "かいがん"), Term("産業", "さんぎょう"), Term("動物園", "どうぶつえん"), Term("美術館", "びじゅつかん"), Term("水道", "すいどう"), Term("飛行場", "ひこうじょう"), Term("葡萄", "ぶどう"), Term("事故", "じこ"), Term("息子", "むすこ"), Term("生活", "せいかつ"), Term("注意", "ちゅうい"), Term("女性", "じょせい"), Term("生きる", "いきる"), Term("船", "ふね"), Term("説明", "せつめい"), Term("警察", "けいさつ"), Term("危険", "きけん"), Term("世界", "せかい"), Term("戦争", "せんそう"), Term("小説", "しょうせつ"), Term("関係", "かんけい"), Term("研究", "けんきゅう"), Term("会議", "かいぎ"), Term("音", "おと"), Term("普通", "ふつう"), Term("湖", "みずうみ"), Term("夢", "ゆめ"), Term("空港", "くうこう"), Term("数学", "すうがく"), Term("教育", "きょういく"), Term("赤ちゃん", "あかちゃん"), Term("火", "ひ"), Term("自由", "じゆう"), Term("森", "もり"), Term("法律", "ほうりつ"), Term("気分", "きぶん"), Term("壁", "かべ"), Term("田舎", "いなか"), Term("気", "き"), Term("男性", "だんせい"), Term("地震", "じしん"), Term("故障", "こしょう"), Term("人口", "じんこう"), Term("残念", "ざんねん"), Term("島", "しま"), Term("歴史", "れきし"), Term("教会", "きょうかい"), Term("住所", "じゅうしょ"), Term("社会", "しゃかい"), Term("工場", "こうじょう"), Term("趣味", "しゅみ"), Term("経済", "けいざい"), Term("台風", "たいふう"), Term("卒業", "そつぎょう"), Term("雲", "くも"), Term("科学", "かがく"), Term("光", "ひかり"), Term("贈り物", "おくりもの"), Term("政治", "せいじ"), Term("特別", "とくべつ"), Term("水泳", "すいえい"), Term("講義", "こうぎ"), Term("指", "ゆび"), Term("生産", "せいさん"), Term("会話", "かいわ"), Term("季節", "きせつ"), Term("玩具", "おもちゃ"), Term("翻訳", "ほんやく"), Term("貿易", "ぼうえき"), Term("文学", "ぶんがく"), Term("葉", "は"), Term("交通", "こうつう"), Term("遊び", "あそび"), Term("道具", "どうぐ"), Term("入学", "にゅうがく"), Term("背中", "せなか"), Term("発音", "はつおん"), Term("指輪", "ゆびわ"), Term("医学", "いがく"), Term("漫画", "まんが"), Term("鏡", "かがみ"), Term("電報", "でんぽう"), Term("校長", "こうちょう"), Term("市民", "しみん"), Term("郊外", "こうがい"), Term("砂", "すな"), Term("手袋", "てぶくろ"), Term("絹", "きぬ"), Term("日記", "にっき"), Term("文法", "ぶんぽう"), Term("糸", "いと"), Term("神社", "じんじゃ"), Term("駐車場", "ちゅうしゃじょう"), Term("展覧会", "てんらんかい"), Term("小学校", "しょうがっこう"), Term("西洋", "せいよう"), Term("先輩", "せんぱい"), Term("注射", "ちゅうしゃ"), Term("坂", "さか"), Term("乗り物", "のりもの"), Term("旅館", "りょかん"), Term("林", "はやし"), Term("布団", "ふとん"), Term("中学校", "ちゅうがっこう"), Term("研究室", "けんきゅうしつ"), Term("会議室", "かいぎしつ"), Term("柔道", "じゅうどう"), Term("高等学校", "こうとうがっこう"), Term("花見", "はなみ"), Term("公務員", "こうむいん"), Term("辞典", "じてん"), Term("心", "こころ"), Term("力", "ちから"), Term("喧嘩", "けんか"), Term("天気予報", "てんきよほう"), Term("髭", "ひげ"), Term("押し入れ", "おしいれ"), Term("味噌", "みそ"), Term("客", "きゃく"), Term("祖父", "そふ"), Term("高校", "こうこう"), Term("近所", "きんじょ"), Term("番組", "ばんぐみ"), Term("見物", "けんぶつ"), Term("亜米利加", "アメリカ"), Term("彼女", "かのじょ"), Term("思う", "おもう"), Term("僕", "ぼく"), Term("必要", "ひつよう"), Term("見える", "みえる"), Term("考える", "かんがえる"), Term("為", "ため"), Term("始める", "はじめる"), Term("受ける", "うける"), Term("美しい", "うつくしい"), Term("試験", "しけん"), Term("親切", "しんせつ"), Term("失敗", "しっぱい"), Term("以上", "いじょう"), Term("意見", "いけん"), Term("決して", "けっして"), Term("十分", "じゅうぶん"), Term("試合", "しあい"), Term("一生懸命", "いっしょうけんめい"), Term("子", "こ"), Term("探す", "さがす"), Term("急ぐ", "いそぐ"), Term("選ぶ", "えらぶ"), Term("送る", "おくる"), Term("必ず", "かならず"), Term("怒る", "おこる"), Term("最近", "さいきん"), Term("払う", "はらう"), Term("合う", "あう"), Term("点", "てん"), Term("決める", "きめる"), Term("笑う", "わらう"), Term("最初", "さいしょ"), Term("反対", "はんたい"), Term("妻", "つま"), Term("娘", "むすめ"), Term("喜ぶ", "よろこぶ"), Term("理由", "りゆう"), Term("昔", "むかし"), Term("約束", "やくそく"), Term("思い出す", "おもいだす"), Term("正しい", "ただしい"), Term("落ちる", "おちる"), Term("場所", "ばしょ"), Term("楽しむ", "たのしむ"), Term("利用", "りよう"), Term("間に合う", "まにあう"), Term("今度", "こんど"), Term("予定", "よてい"), Term("訪ねる", "たずねる"), Term("赤ん坊", "あかんぼう"), Term("進む", "すすむ"), Term("最後", "さいご"), Term("向かう", "むかう"), Term("通る", "とおる"), Term("興味", "きょうみ"), Term("時代", "じだい"), Term("気持ち", "きもち"), Term("途中", "とちゅう"), Term("返事", "へんじ"), Term("簡単", "かんたん"), Term("深い", "ふかい"), Term("起こす", "おこす"), Term("夫", "おっと"), Term("一度", "いちど"), Term("場合", "ばあい"), Term("運ぶ", "はこぶ"), Term("今夜", "こんや"), Term("盗む", "ぬすむ"), Term("習慣", "しゅうかん"), Term("大抵", "たいてい"), Term("残る", "のこる"), Term("上がる", "あがる"), Term("席", "せき"), Term("値段", "ねだん"), Term("将来", "しょうらい"), Term("優しい", "やさしい"), Term("致す", "いたす"), Term("逃げる", "にげる"), Term("空気", "くうき"), Term("役に立つ", "やくにたつ"), Term("答え", "こたえ"), Term("予約", "よやく"), Term("機会", "きかい"), Term("原因", "げんいん"), Term("火事", "かじ"), Term("泥棒", "どろぼう"), Term("髪", "かみ"), Term("規則", "きそく"), Term("行う", "おこなう"), Term("代わり", "かわり"), Term("見つかる", "みつかる"), Term("打つ", "うつ"), Term("厳しい", "きびしい"), Term("増える", "ふえる"), Term("迎える", "むかえる"), Term("怖い", "こわい"), Term("社長", "しゃちょう"), Term("紹介", "しょうかい"), Term("集める", "あつめる"), Term("星", "ほし"), Term("事務所", "じむしょ"), Term("特に", "とくに"), Term("集まる", "あつまる"), Term("比べる", "くらべる"), Term("無理", "むり"), Term("用意", "ようい"), Term("落とす", "おとす"), Term("壊れる", "こわれる"), Term("具合", "ぐあい"), Term("倒れる", "たおれる"), Term("味", "あじ"), Term("安全", "あんぜん"), Term("変", "へん"), Term("祖母", "そぼ"), Term("連絡", "れんらく"), Term("大事", "だいじ"), Term("下がる", "さがる"), Term("壊す", "こわす"), Term("決まる", "きまる"), Term("汽車", "きしゃ"), Term("確か", "たしか"), Term("楽しみ", "たのしみ"), Term("可笑しい", "おかしい"), Term("隅", "すみ"), Term("競争", "きょうそう"), Term("入院", "にゅういん"), Term("形", "かたち"), Term("仕方", "しかた"), Term("留守", "るす"), Term("景色", "けしき"), Term("首", "くび"), Term("君", "きみ"), Term("血", "ち"), Term("以内", "いない"), Term("例えば", "たとえば"), Term("別れる", "わかれる"), Term("棚", "たな"), Term("引っ越す", "ひっこす"), Term("申し上げる", "もうしあげる"), Term("複雑", "ふくざつ"), Term("品物", "しなもの"), Term("技術", "ぎじゅつ"), Term("ご存じ", "ごぞんじ"), Term("草", "くさ"), Term("以下", "いか"), Term("倍", "ばい"), Term("両方", "りょうほう"), Term("港", "みなと"), Term("安心", "あんしん"), Term("大体", "だいたい"), Term("線", "せん"), Term("下げる", "さげる"), Term("虫", "むし"), Term("小鳥", "ことり"), Term("高校生", "こうこうせい"), Term("乗り換える", "のりかえる"), Term("枝", "えだ"), Term("寺", "てら"), Term("着物", "きもの"), Term("通う", "かよう"), Term("店員", "てんいん"), Term("帰り", "かえり"), Term("終わり", "おわり"), Term("騒ぐ", "さわぐ"), Term("柔らかい", "やわらかい"), Term("丁寧", "ていねい"), Term("踏む", "ふむ"), Term("真ん中", "まんなか"), Term("冷える", "ひえる"), Term("裏", "うら"), Term("飾る", "かざる"), Term("遠慮", "えんりょ"), Term("表", "おもて"), Term("都合", "つごう"), Term("暮れる", "くれる"), Term("部長", "ぶちょう"), Term("昼間", "ひるま"), Term("引き出し", "ひきだし"), Term("急", "きゅう"), Term("会場", "かいじょう"), Term("地理", "ちり"), Term("電灯", "でんとう"), Term("急行", "きゅうこう"), Term("又は", "または"), Term("踊り", "おどり"), Term("細かい", "こまかい"), Term("適当", "てきとう"), Term("課長", "かちょう"), Term("盛ん", "さかん"), Term("割合", "わりあい"), Term("暖房", "だんぼう"), Term("引き出す", "ひきだす"), Term("申す", "もうす"), Term("退院", "たいいん"), Term("売り場", "うりば"), Term("受付", "うけつけ"), Term("講堂", "こうどう"), Term("不便", "ふべん"), Term("苦い", "にがい"), Term("下宿", "げしゅく"), Term("食料品", "しょくりょうひん"), Term("新聞社", "しんぶんしゃ"), Term("写す", "うつす"), Term("湯", "ゆ"), Term("工業", "こうぎょう"), Term("冷房", "れいぼう"), Term("下着", "したぎ"), Term("畳", "たたみ"), Term("沸かす", "わかす"), Term("お嬢さん", "おじょうさん"), Term("特急", "とっきゅう"), Term("漬ける", "つける"), Term("呉れる", "くれる"), Term("過ぎる", "すぎる"), Term("積もり", "つもり"), Term("殆ど", "ほとんど"), Term("止める", "とめる"), Term("酷い", "ひどい"), Term("遅れる", "おくれる"), Term("続ける", "つづける"), Term("手伝う", "てつだう"), Term("見付ける", "みつける"), Term("驚く", "おどろく"), Term("眠る", "ねむる"), Term("勝つ", "かつ"), Term("聞こえる", "きこえる"), Term("尋ねる", "たずねる"), Term("慣れる", "なれる"), Term("泣く", "なく"), Term("似る", "にる"), Term("屹度", "きっと"), Term("戻る", "もどる"), Term("調べる", "しらべる"), Term("伝える", "つたえる"), Term("筈", "はず"), Term("無くなる", "なくなる"), Term("動く", "うごく"), Term("知らせる", "しらせる"), Term("続く", "つづく"), Term("別", "べつ"), Term("鳴る", "なる"), Term("市", "し"), Term("負ける", "まける"), Term("悲しい", "かなしい"), Term("亡くなる", "なくなる"), Term("以外", "いがい"), Term("治す", "なおす"), Term("暫く", "しばらく"), Term("回る", "まわる"), Term("間違える", "まちがえる"), Term("捨てる", "すてる"), Term("確り", "しっかり"), Term("育てる", "そだてる"), Term("褒める", "ほめる"), Term("石", "いし"), Term("恥ずかしい", "はずかしい"), Term("塗る", "ぬる"), Term("泊まる", "とまる"), Term("片付ける", "かたづける"), Term("止む", "やむ"), Term("遠く", "とおく"), Term("済む", "すむ"), Term("到頭", "とうとう"), Term("捕まえる", "つかまえる"), Term("踊る", "おどる"), Term("足りる", "たりる"), Term("治る", "なおる"), Term("為さる", "なさる"), Term("硬い", "かたい"), Term("建てる", "たてる"), Term("凄い", "すごい"), Term("謝る", "あやまる"), Term("此れから", "これから"), Term("立てる", "たてる"), Term("寂しい", "さびしい"), Term("濡れる", "ぬれる"), Term("投げる", "なげる"), Term("太る", "ふとる"), Term("寄る", "よる"), Term("歯医者", "はいしゃ"), Term("参る", "まいる"), Term("召し上がる", "めしあがる"), Term("珍しい", "めずらしい"), Term("揺れる", "ゆれる"), Term("祈る", "いのる"), Term("硝子", "ガラス"), Term("込む", "こむ"), Term("折る", "おる"), Term("大学生", "だいがくせい"), Term("お礼", "おれい"), Term("眠い", "ねむい"), Term("それ程", "それほど"), Term("痩せる", "やせる"), Term("偶に", "たまに"), Term("噛む", "かむ"), Term("億", "おく"), Term("触る", "さわる"), Term("瓦斯", "ガス"), Term("掏摸", "すり"), Term("成程", "なるほど"), Term("拾う", "ひろう"), Term("焼く", "やく"), Term("割れる", "われる"), Term("些とも", "ちっとも"), Term("お宅", "おたく"), Term("折れる", "おれる"), Term("移る", "うつる"), Term("光る", "ひかる"), Term("植える", "うえる"), Term("差し上げる", "さしあげる"), Term("字", "じ"), Term("焼ける", "やける"), Term("取り替える", "とりかえる"), Term("お祝い", "おいわい"), Term("乾く", "かわく"), Term("釣る", "つる"), Term("用事", "ようじ"), Term("成るべく", "なるべく"), Term("届ける", "とどける"), Term("浅い", "あさい"), Term("苛める", "いじめる"), Term("お土産", "おみやげ"), Term("床屋", "とこや"), Term("拝見", "はいけん"), Term("足す", "たす"), Term("お釣り", "おつり"), Term("予習", "よしゅう"), Term("寝坊", "ねぼう"), Term("沸く", "わく"), Term("忘れ物", "わすれもの"), Term("復習", "ふくしゅう"), Term("ご主人", "ごしゅじん"), Term("再来月", "さらいげつ"), Term("再来週", "さらいしゅう"), Term("付く", "つく"), Term("変える", "かえる"), Term("阿弗利加", "アフリカ"), Term("看護師", "かんごし"), Term("降り出す", "ふりだす"), Term("けど", "けど"), Term("日", "ひ"), Term("大分", "だいぶ"), Term("間", "あいだ"), Term("親", "おや"), Term("熱", "ねつ"), Term("運転手", "うんてんしゅ"), Term("木綿", "もめん"), Term("消しゴム", "けしゴム"), Term("テニス", "テニス"), Term("ピアノ", "ピアノ"), Term("コンピュータ", "コンピュータ"), Term("周り", "まわり"), Term("ケーキ", "ケーキ"), Term("ビル", "ビル"), Term("カーテン", "カーテン"), Term("ガソリン", "ガソリン"), Term("アルコール", "アルコール"), Term("サンドイッチ", "サンドイッチ"), Term("オートバイ", "オートバイ"), Term("サラダ", "サラダ"), Term("ソフト", "ソフト"), Term("テキスト", "テキスト"), Term("ガソリンスタンド", "ガソリンスタンド"), Term("ジャム", "ジャム"), Term("ステレオ", "ステレオ"), Term("アナウンサー", "アナウンサー"), Term("パート", "パート"), Term("アクセサリー", "アクセサリー"), Term("エスカレーター", "エスカレーター"), Term("あっ", "あっ"), Term("スーツケース", "スーツケース"), Term("ステーキ", "ステーキ"), Term("アジア", "アジア"), Term("チェック", "チェック"), Term("サンダル", "サンダル"), Term("スクリーン", "スクリーン"), Term("一杯", "いっぱい"), Term("用", "よう"), Term("レジ", "レジ"), Term("内", "うち"), Term("訳", "わけ"), Term("お蔭", "おかげ"), Term("もう直ぐ", "もうすぐ"), Term("包む", "つつむ"), Term("国際", "こくさい"), Term("毛", "け"), Term("泳ぎ方", "およぎかた"), Term("都", "と"), Term("家内", "かない"), Term("お見舞い", "おみまい"), Term("そう", "そう"), Term("そんな", "そんな"), Term("若し", "もし"), Term("非常に", "ひじょうに"), Term("だから", "だから"), Term("はっきり", "はっきり"), Term("すっかり", "すっかり"), Term("コンサート", "コンサート"), Term("やっと", "やっと"), Term("あんな", "あんな"), Term("プレゼント", "プレゼント"), Term("タイプ", "タイプ"), Term("レポート", "レポート"), Term("そろそろ", "そろそろ"), Term("ベル", "ベル"), Term("いらっしゃる", "いらっしゃる"), Term("其れで", "それで"), Term("どんどん", "どんどん"), Term("スーツ", "スーツ"), Term("ちゃん", "ちゃん"), Term("ワープロ", "ワープロ"), Term("汚れる", "よごれる"), Term("パソコン", "パソコン"), Term("ご馳走", "ごちそう"), Term("この頃", "このごろ"), Term("アルバイト", "アルバイト"), Term("ハンドバッグ", "ハンドバッグ"), Term("すると", "すると"), Term("さっき", "さっき"), Term("其れに", "それに"), Term("この間", "このあいだ"), Term("ファックス", "ファックス"), Term("すっと", "すっと"), Term("そんなに", "そんなに"), Term("仰っしゃる", "おっしゃる"), Term("うん", "うん"), Term("ああ", "ああ"), Term("ご覧になる", "ごらんになる"), Term("変わる", "かわる"), Term("久しぶり", "ひさしぶり"), Term("昼休み", "ひるやすみ"), Term("二階建て", "にかいだて"), Term("斯う", "こう"), Term("お出でになる", "おいでになる"), Term("お祭り", "おまつり"), Term("端", "つま"), Term("滑る", "すべる"), Term("屋上", "おくじょう")}
-N3 = {Term("程", "ほど"), Term("正直", "しょうじき"), Term("一致", "いっち"), Term("博物館", "はくぶつかん"), Term("皿", "さら"), Term("舞台", "ぶたい"), Term("寄付", "きふ"), Term("猿", "さる"), Term("平等", "びょうどう"), Term("左右", "さゆう"), Term("金属", "きんぞく"), Term("商人", "しょうにん"), Term("国境", "こっきょう"), Term("集団", "しゅうだん"), Term("根", "ね"), Term("鎖", "くさり"), Term("時", "とき"), Term("元", "もと"), Term("計画", "けいかく"), Term("少年", "しょうねん"), Term("列車", "れっしゃ"), Term("健康", "けんこう"), Term("人間", "にんげん"), Term("結果", "けっか"), Term("理解", "りかい"), Term("少女", "しょうじょ"), Term("事実", "じじつ"), Term("食事", "しょくじ"), Term("人生", "じんせい"), Term("母親", "ははおや"), Term("行動", "こうどう"), Term("父親", "ちちおや"), Term("太陽", "たいよう"), Term("幸福", "こうふく"), Term("政府", "せいふ"), Term("経験", "けいけん"), Term("責任", "せきにん"), Term("我慢", "がまん"), Term("噂", "うわさ"), Term("道路", "どうろ"), Term("機械", "きかい"), Term("地球", "ちきゅう"), Term("秘密", "ひみつ"), Term("偶然", "ぐうぜん"), Term("情報", "じょうほう"), Term("現在", "げんざい"), Term("昼食", "ちゅうしょく"), Term("期待", "きたい"), Term("嵐", "あらし"), Term("丘", "おか"), Term("運動", "うんどう"), Term("大統領", "だいとうりょう"), Term("演説", "えんぜつ"), Term("神", "かみ"), Term("馬", "うま"), Term("読書", "どくしょ"), Term("詩", "し"), Term("知識", "ちしき"), Term("嘘", "うそ"), Term("都市", "とし"), Term("収入", "しゅうにゅう"), Term("詩人", "しじん"), Term("涙", "なみだ"), Term("円", "えん"), Term("酒", "さけ"), Term("勇気", "ゆうき"), Term("発見", "はっけん"), Term("解決", "かいけつ"), Term("学者", "がくしゃ"), Term("患者", "かんじゃ"), Term("存在", "そんざい"), Term("信頼", "しんらい"), Term("言語", "げんご"), Term("海外", "かいがい"), Term("作家", "さっか"), Term("平和", "へいわ"), Term("希望", "きぼう"), Term("調査", "ちょうさ"), Term("地域", "ちいき"), Term("気候", "きこう"), Term("愛", "あい"), Term("実験", "じっけん"), Term("権利", "けんり"), Term("国民", "こくみん"), Term("騒音", "そうおん"), Term("義務", "ぎむ"), Term("釣り", "つり"), Term("胸", "むね"), Term("利益", "りえき"), Term("物価", "ぶっか"), Term("過去", "かこ"), Term("植物", "しょくぶつ"), Term("教授", "きょうじゅ"), Term("発明", "はつめい"), Term("氷", "こおり"), Term("石油", "せきゆ"), Term("痛み", "いたみ"), Term("進歩", "しんぽ"), Term("物語", "ものがたり"), Term("感情", "かんじょう"), Term("週", "しゅう"), Term("屋根", "やね"), Term("議長", "ぎちょう"), Term("恐怖", "きょうふ"), Term("費用", "ひよう"), Term("否定", "ひてい"), Term("商品", "しょうひん"), Term("作品", "さくひん"), Term("賞", "しょう"), Term("城", "しろ"), Term("価格", "かかく"), Term("留学", "りゅうがく"), Term("犯罪", "はんざい"), Term("肩", "かた"), Term("意志", "いし"), Term("正午", "しょうご"), Term("評価", "ひょうか"), Term("職業", "しょくぎょう"), Term("家具", "かぐ"), Term("不安", "ふあん"), Term("首相", "しゅしょう"), Term("劇場", "げきじょう"), Term("自然", "しぜん"), Term("意識", "いしき"), Term("自殺", "じさつ"), Term("爆発", "ばくはつ"), Term("逮捕", "たいほ"), Term("論文", "ろんぶん"), Term("記録", "きろく"), Term("世紀", "せいき"), Term("頭痛", "ずつう"), Term("契約", "けいやく"), Term("精神", "せいしん"), Term("牛", "うし"), Term("俳優", "はいゆう"), Term("記憶", "きおく"), Term("独立", "どくりつ"), Term("優勝", "ゆうしょう"), Term("額", "がく"), Term("公平", "こうへい"), Term("州", "しゅう"), Term("生命", "せいめい"), Term("強盗", "ごうとう"), Term("命令", "めいれい"), Term("記事", "きじ"), Term("輸入", "ゆにゅう"), Term("銃", "じゅう"), Term("医師", "いし"), Term("合図", "あいず"), Term("宇宙", "うちゅう"), Term("計算", "けいさん"), Term("禁煙", "きんえん"), Term("友情", "ゆうじょう"), Term("現実", "げんじつ"), Term("握手", "あくしゅ"), Term("方向", "ほうこう"), Term("攻撃", "こうげき"), Term("生物", "せいぶつ"), Term("訓練", "くんれん"), Term("企業", "きぎょう"), Term("香り", "かおり"), Term("芸術", "げいじゅつ"), Term("役割", "やくわり"), Term("羽", "はね"), Term("波", "なみ"), Term("流れ", "ながれ"), Term("個人", "こじん"), Term("広告", "こうこく"), Term("無料", "むりょう"), Term("署名", "しょめい"), Term("王様", "おうさま"), Term("駐車", "ちゅうしゃ"), Term("証明", "しょうめい"), Term("宝石", "ほうせき"), Term("現金", "げんきん"), Term("話題", "わだい"), Term("芝居", "しばい"), Term("博士", "はかせ"), Term("出版", "しゅっぱん"), Term("塔", "とう"), Term("保証", "ほしょう"), Term("競技", "きょうぎ"), Term("軍隊", "ぐんたい"), Term("投票", "とうひょう"), Term("離婚", "りこん"), Term("診察", "しんさつ"), Term("年寄り", "としより"), Term("心臓", "しんぞう"), Term("衝突", "しょうとつ"), Term("影", "かげ"), Term("販売", "はんばい"), Term("平均", "へいきん"), Term("輸出", "ゆしゅつ"), Term("型", "かた"), Term("冒険", "ぼうけん"), Term("永遠", "えいえん"), Term("表情", "ひょうじょう"), Term("未来", "みらい"), Term("胃", "い"), Term("小屋", "こや"), Term("畑", "はたけ"), Term("制度", "せいど"), Term("通学", "つうがく"), Term("改善", "かいぜん"), Term("虎", "とら"), Term("放送", "ほうそう"), Term("信号", "しんごう"), Term("籠", "かご"), Term("観客", "かんきゃく"), Term("文字", "もじ"), Term("鉄道", "てつどう"), Term("収穫", "しゅうかく"), Term("中心", "ちゅうしん"), Term("雷", "かみなり"), Term("建設", "けんせつ"), Term("袋", "ふくろ"), Term("節約", "せつやく"), Term("化学", "かがく"), Term("国家", "こっか"), Term("睡眠", "すいみん"), Term("教科書", "きょうかしょ"), Term("毒", "どく"), Term("油", "あぶら"), Term("単位", "たんい"), Term("座席", "ざせき"), Term("常識", "じょうしき"), Term("郵便", "ゆうびん"), Term("家事", "かじ"), Term("運", "うん"), Term("労働", "ろうどう"), Term("誕生", "たんじょう"), Term("観光", "かんこう"), Term("失業", "しつぎょう"), Term("数字", "すうじ"), Term("学習", "がくしゅう"), Term("食欲", "しょくよく"), Term("汗", "あせ"), Term("知恵", "ちえ"), Term("毛布", "もうふ"), Term("婚約", "こんやく"), Term("分析", "ぶんせき"), Term("引用", "いんよう"), Term("鉄", "てつ"), Term("首都", "しゅと"), Term("書斎", "しょさい"), Term("砂漠", "さばく"), Term("武器", "ぶき"), Term("舌", "した"), Term("位置", "いち"), Term("笑い", "わらい"), Term("針", "はり"), Term("異常", "いじょう"), Term("硬貨", "こうか"), Term("監督", "かんとく"), Term("対象", "たいしょう"), Term("酸素", "さんそ"), Term("速度", "そくど"), Term("穀物", "こくもつ"), Term("絶滅", "ぜつめつ"), Term("予算", "よさん"), Term("感覚", "かんかく"), Term("祭", "まつり"), Term("物質", "ぶっしつ"), Term("逆", "ぎゃく"), Term("奨学金", "しょうがくきん"), Term("泥", "どろ"), Term("安定", "あんてい"), Term("農家", "のうか"), Term("議会", "ぎかい"), Term("批評", "ひひょう"), Term("独身", "どくしん"), Term("黒板", "こくばん"), Term("石炭", "せきたん"), Term("農業", "のうぎょう"), Term("巣", "す"), Term("谷", "たに"), Term("建築", "けんちく"), Term("文明", "ぶんめい"), Term("吸収", "きゅうしゅう"), Term("知事", "ちじ"), Term("体温", "たいおん"), Term("活用", "かつよう"), Term("大陸", "たいりく"), Term("消費", "しょうひ"), Term("金融", "きんゆう"), Term("信仰", "しんこう"), Term("大臣", "だいじん"), Term("外交", "がいこう"), Term("学期", "がっき"), Term("翼", "つばさ"), Term("鍋", "なべ"), Term("理想", "りそう"), Term("営業", "えいぎょう"), Term("助手", "じょしゅ"), Term("現状", "げんじょう"), Term("筋肉", "きんにく"), Term("火災", "かさい"), Term("神経", "しんけい"), Term("悪魔", "あくま"), Term("組合", "くみあい"), Term("腹", "はら"), Term("板", "いた"), Term("金庫", "きんこ"), Term("作業", "さぎょう"), Term("伝統", "でんとう"), Term("岸", "きし"), Term("現象", "げんしょう"), Term("食品", "しょくひん"), Term("旗", "はた"), Term("恋人", "こいびと"), Term("宝", "たから"), Term("炎", "ほのお"), Term("哲学", "てつがく"), Term("呼吸", "こきゅう"), Term("登山", "とざん"), Term("鬼", "おに"), Term("代理", "だいり"), Term("印刷", "いんさつ"), Term("知能", "ちのう"), Term("骨折", "こっせつ"), Term("憲法", "けんぽう"), Term("梅雨", "つゆ"), Term("裸", "はだか"), Term("渋滞", "じゅうたい"), Term("銀", "ぎん"), Term("航空", "こうくう"), Term("弁当", "べんとう"), Term("大使", "たいし"), Term("相続", "そうぞく"), Term("歩道", "ほどう"), Term("栄養", "えいよう"), Term("免許", "めんきょ"), Term("衛星", "えいせい"), Term("模様", "もよう"), Term("芽", "め"), Term("会計", "かいけい"), Term("墓", "はか"), Term("議員", "ぎいん"), Term("缶", "かん"), Term("地下", "ちか"), Term("差別", "さべつ"), Term("筋", "すじ"), Term("笛", "ふえ"), Term("道徳", "どうとく"), Term("国語", "こくご"), Term("湾", "わん"), Term("礼", "れい"), Term("豆", "まめ"), Term("体育", "たいいく"), Term("筆", "ふで"), Term("作曲", "さっきょく"), Term("土産", "みやげ"), Term("刀", "かたな"), Term("粉", "こな"), Term("泡", "あわ"), Term("電子", "でんし"), Term("菓子", "かし"), Term("熱帯", "ねったい"), Term("飯", "めし"), Term("梅", "うめ"), Term("能", "のう"), Term("馬鹿", "ばか"), Term("月", "つき"), Term("屡々", "しばしば"), Term("退屈", "たいくつ"), Term("流れる", "ながれる"), Term("暗記", "あんき"), Term("兎", "うさぎ"), Term("鼠", "ねずみ"), Term("膝", "ひざ"), Term("頬", "ほお"), Term("餌", "えさ"), Term("量", "りょう"), Term("莫大", "ばくだい"), Term("式", "しき"), Term("紐", "ひも"), Term("連想", "れんそう"), Term("地平線", "ちへいせん"), Term("場", "ば"), Term("動詞", "どうし"), Term("袖", "そで"), Term("灰", "はい"), Term("秒", "びょう"), Term("県", "けん"), Term("帯", "おび"), Term("と", "と"), Term("外出", "がいしゅつ"), Term("当時", "とうじ"), Term("案内", "あんない"), Term("地方", "ちほう"), Term("一方", "いっぽう"), Term("発展", "はってん"), Term("双子", "ふたご"), Term("団体", "だんたい"), Term("夜中", "よなか"), Term("中央", "ちゅうおう"), Term("共同", "きょうどう"), Term("通り", "とおり"), Term("埃", "ほこり"), Term("事", "こと"), Term("欧羅巴", "ヨーロッパ"), Term("彼ら", "かれら"), Term("我々", "われわれ"), Term("成功", "せいこう"), Term("尻", "しり"), Term("出発", "しゅっぱつ"), Term("起こる", "おこる"), Term("考え", "かんがえ"), Term("何も", "なにも"), Term("友人", "ゆうじん"), Term("努力", "どりょく"), Term("終える", "おえる"), Term("最も", "もっとも"), Term("素晴らしい", "すばらしい"), Term("運転", "うんてん"), Term("重要", "じゅうよう"), Term("助ける", "たすける"), Term("幸せ", "しあわせ"), Term("心配", "しんぱい"), Term("感じる", "かんじる"), Term("提案", "ていあん"), Term("出席", "しゅっせき"), Term("他人", "たにん"), Term("以前", "いぜん"), Term("間違い", "まちがい"), Term("価値", "かち"), Term("突然", "とつぜん"), Term("賛成", "さんせい"), Term("老人", "ろうじん"), Term("愛する", "あいする"), Term("到着", "とうちゃく"), Term("満足", "まんぞく"), Term("氏", "し"), Term("守る", "まもる"), Term("失う", "うしなう"), Term("下さる", "くださる"), Term("只", "ただ"), Term("方法", "ほうほう"), Term("無駄", "むだ"), Term("援助", "えんじょ"), Term("合格", "ごうかく"), Term("許す", "ゆるす"), Term("帰宅", "きたく"), Term("世話", "せわ"), Term("会合", "かいごう"), Term("事件", "じけん"), Term("お前", "おまえ"), Term("議論", "ぎろん"), Term("困難", "こんなん"), Term("決心", "けっしん"), Term("要求", "ようきゅう"), Term("駄目", "だめ"), Term("受け取る", "うけとる"), Term("休暇", "きゅうか"), Term("年間", "ねんかん"), Term("結局", "けっきょく"), Term("激しい", "はげしい"), Term("尊敬", "そんけい"), Term("大いに", "おおいに"), Term("準備", "じゅんび"), Term("滞在", "たいざい"), Term("全然", "ぜんぜん"), Term("現れる", "あらわれる"), Term("参加", "さんか"), Term("扱う", "あつかう"), Term("実行", "じっこう"), Term("離れる", "はなれる"), Term("貧しい", "まずしい"), Term("偉大", "いだい"), Term("望む", "のぞむ"), Term("修理", "しゅうり"), Term("誤り", "あやまり"), Term("目的", "もくてき"), Term("感謝", "かんしゃ"), Term("示す", "しめす"), Term("全員", "ぜんいん"), Term("教師", "きょうし"), Term("相手", "あいて"), Term("人気", "にんき"), Term("招待", "しょうたい"), Term("黙る", "だまる"), Term("出会う", "であう"), Term("完全", "かんぜん"), Term("実際", "じっさい"), Term("辺り", "あたり"), Term("歌手", "かしゅ"), Term("冗談", "じょうだん"), Term("能力", "のうりょく"), Term("才能", "さいのう"), Term("自慢", "じまん"), Term("敵", "てき"), Term("選手", "せんしゅ"), Term("欠点", "けってん"), Term("一体", "いったい"), Term("素敵", "すてき"), Term("更に", "さらに"), Term("熱心", "ねっしん"), Term("回復", "かいふく"), Term("判断", "はんだん"), Term("訪問", "ほうもん"), Term("注文", "ちゅうもん"), Term("給料", "きゅうりょう"), Term("態度", "たいど"), Term("既に", "すでに"), Term("次第", "しだい"), Term("影響", "えいきょう"), Term("決定", "けってい"), Term("年齢", "ねんれい"), Term("主張", "しゅちょう"), Term("正確", "せいかく"), Term("便り", "たより"), Term("信用", "しんよう"), Term("延期", "えんき"), Term("土地", "とち"), Term("旅", "たび"), Term("奪う", "うばう"), Term("商売", "しょうばい"), Term("苦労", "くろう"), Term("喜び", "よろこび"), Term("提出", "ていしゅつ"), Term("回", "かい"), Term("姿", "すがた"), Term("追いつく", "おいつく"), Term("明らか", "あきらか"), Term("話し合う", "はなしあう"), Term("不足", "ふそく"), Term("状況", "じょうきょう"), Term("好む", "このむ"), Term("邪魔", "じゃま"), Term("書類", "しょるい"), Term("変化", "へんか"), Term("万一", "まんいち"), Term("単語", "たんご"), Term("恐れる", "おそれる"), Term("最高", "さいこう"), Term("種類", "しゅるい"), Term("週間", "しゅうかん"), Term("越える", "こえる"), Term("幸運", "こううん"), Term("事態", "じたい"), Term("状態", "じょうたい"), Term("得意", "とくい"), Term("調子", "ちょうし"), Term("以来", "いらい"), Term("成長", "せいちょう"), Term("必ずしも", "かならずしも"), Term("残す", "のこす"), Term("隠す", "かくす"), Term("頼る", "たよる"), Term("恐ろしい", "おそろしい"), Term("光景", "こうけい"), Term("実は", "じつは"), Term("戦う", "たたかう"), Term("常に", "つねに"), Term("誇り", "ほこり"), Term("一言", "ひとこと"), Term("借金", "しゃっきん"), Term("性格", "せいかく"), Term("中止", "ちゅうし"), Term("達する", "たっする"), Term("勝ち", "かち"), Term("乗客", "じょうきゃく"), Term("地位", "ちい"), Term("罪", "つみ"), Term("天候", "てんこう"), Term("立場", "たちば"), Term("再び", "ふたたび"), Term("一層", "いっそう"), Term("備える", "そなえる"), Term("命", "いのち"), Term("職", "しょく"), Term("不思議", "ふしぎ"), Term("欠席", "けっせき"), Term("環境", "かんきょう"), Term("傾向", "けいこう"), Term("是非", "ぜひ"), Term("燃える", "もえる"), Term("出身", "しゅっしん"), Term("覆う", "おおう"), Term("供給", "きょうきゅう"), Term("手段", "しゅだん"), Term("不幸", "ふこう"), Term("感動", "かんどう"), Term("断る", "ことわる"), Term("乗せる", "のせる"), Term("先日", "せんじつ"), Term("感じ", "かんじ"), Term("表現", "ひょうげん"), Term("無視", "むし"), Term("閉じる", "とじる"), Term("奇妙", "きみょう"), Term("余裕", "よゆう"), Term("明かり", "あかり"), Term("支払う", "しはらう"), Term("違い", "ちがい"), Term("変更", "へんこう"), Term("美人", "びじん"), Term("合わせる", "あわせる"), Term("実現", "じつげん"), Term("無事", "ぶじ"), Term("雇う", "やとう"), Term("成績", "せいせき"), Term("仲間", "なかま"), Term("殺す", "ころす"), Term("発表", "はっぴょう"), Term("様々", "さまざま"), Term("全体", "ぜんたい"), Term("許可", "きょか"), Term("恐らく", "おそらく"), Term("製品", "せいひん"), Term("歓迎", "かんげい"), Term("疑う", "うたがう"), Term("大部分", "だいぶぶん"), Term("想像", "そうぞう"), Term("女優", "じょゆう"), Term("最終", "さいしゅう"), Term("動かす", "うごかす"), Term("完成", "かんせい"), Term("通す", "とおす"), Term("物事", "ものごと"), Term("便", "びん"), Term("経営", "けいえい"), Term("増加", "ぞうか"), Term("関心", "かんしん"), Term("横断", "おうだん"), Term("救う", "すくう"), Term("唯一", "ゆいいつ"), Term("育つ", "そだつ"), Term("現代", "げんだい"), Term("際", "さい"), Term("支払い", "しはらい"), Term("婦人", "ふじん"), Term("相談", "そうだん"), Term("王", "おう"), Term("活動", "かつどう"), Term("貯金", "ちょきん"), Term("考慮", "こうりょ"), Term("出来事", "できごと"), Term("命じる", "めいじる"), Term("結論", "けつろん"), Term("劇", "げき"), Term("文句", "もんく"), Term("人類", "じんるい"), Term("見送り", "みおくり"), Term("分ける", "わける"), Term("協力", "きょうりょく"), Term("人物", "じんぶつ"), Term("桜", "さくら"), Term("望み", "のぞみ"), Term("食料", "しょくりょう"), Term("略", "ほぼ"), Term("食物", "しょくもつ"), Term("確かめる", "たしかめる"), Term("癖", "くせ"), Term("処理", "しょり"), Term("加える", "くわえる"), Term("確認", "かくにん"), Term("愛情", "あいじょう"), Term("使用", "しよう"), Term("部分", "ぶぶん"), Term("同様", "どうよう"), Term("報告", "ほうこく"), Term("当てる", "あてる"), Term("日曜", "にちよう"), Term("可能", "かのう"), Term("画家", "がか"), Term("直ちに", "ただちに"), Term("眺める", "ながめる"), Term("深刻", "しんこく"), Term("禁止", "きんし"), Term("様子", "ようす"), Term("自身", "じしん"), Term("高価", "こうか"), Term("頂上", "ちょうじょう"), Term("誤解", "ごかい"), Term("傷", "きず"), Term("被害", "ひがい"), Term("手術", "しゅじゅつ"), Term("穴", "あな"), Term("夫婦", "ふうふ"), Term("誘う", "さそう"), Term("重大", "じゅうだい"), Term("用いる", "もちいる"), Term("評判", "ひょうばん"), Term("抱える", "かかえる"), Term("慎重", "しんちょう"), Term("暮らし", "くらし"), Term("瓶", "びん"), Term("味方", "みかた"), Term("犯人", "はんにん"), Term("繰り返す", "くりかえす"), Term("夫人", "ふじん"), Term("目標", "もくひょう"), Term("損害", "そんがい"), Term("親しい", "したしい"), Term("交換", "こうかん"), Term("好み", "このみ"), Term("今回", "こんかい"), Term("限る", "かぎる"), Term("例", "れい"), Term("演奏", "えんそう"), Term("相当", "そうとう"), Term("語る", "かたる"), Term("骨", "ほね"), Term("世の中", "よのなか"), Term("料金", "りょうきん"), Term("幸い", "さい"), Term("条件", "じょうけん"), Term("不自由", "ふじゆう"), Term("有効", "ゆうこう"), Term("戦い", "たたかい"), Term("内容", "ないよう"), Term("有能", "ゆうのう"), Term("事情", "じじょう"), Term("列", "れつ"), Term("破る", "やぶる"), Term("従って", "したがって"), Term("不満", "ふまん"), Term("数える", "かぞえる"), Term("減る", "へる"), Term("本物", "ほんもの"), Term("次々", "つぎつぎ"), Term("言わば", "いわば"), Term("程度", "ていど"), Term("芝生", "しばふ"), Term("貴重", "きちょう"), Term("区別", "くべつ"), Term("都会", "とかい"), Term("岩", "いわ"), Term("回す", "まわす"), Term("会員", "かいいん"), Term("失望", "しつぼう"), Term("組織", "そしき"), Term("豊か", "ゆたか"), Term("急速", "きゅうそく"), Term("新鮮", "しんせん"), Term("面倒", "めんどう"), Term("残り", "のこり"), Term("製造", "せいぞう"), Term("批判", "ひはん"), Term("加わる", "くわわる"), Term("検査", "けんさ"), Term("手伝い", "てつだい"), Term("構う", "かまう"), Term("現場", "げんば"), Term("徐々", "じょじょ"), Term("税金", "ぜいきん"), Term("今後", "こんご"), Term("塀", "へい"), Term("願い", "ねがい"), Term("少々", "しょうしょう"), Term("新た", "あらた"), Term("比較", "ひかく"), Term("豊富", "ほうふ"), Term("有利", "ゆうり"), Term("株", "かぶ"), Term("構成", "こうせい"), Term("息", "いき"), Term("結ぶ", "むすぶ"), Term("直接", "ちょくせつ"), Term("快適", "かいてき"), Term("勘定", "かんじょう"), Term("検討", "けんとう"), Term("追う", "おう"), Term("詳しい", "くわしい"), Term("苦手", "にがて"), Term("応じる", "おうじる"), Term("絶対", "ぜったい"), Term("謎", "なぞ"), Term("組む", "くむ"), Term("別に", "べつに"), Term("刈る", "かる"), Term("解釈", "かいしゃく"), Term("囲む", "かこむ"), Term("共に", "ともに"), Term("選択", "せんたく"), Term("冷静", "れいせい"), Term("魅力", "みりょく"), Term("需要", "じゅよう"), Term("撃つ", "うつ"), Term("飛び出す", "とびだす"), Term("減らす", "へらす"), Term("害", "がい"), Term("確実", "かくじつ"), Term("握る", "にぎる"), Term("思想", "しそう"), Term("髪の毛", "かみのけ"), Term("悲しむ", "かなしむ"), Term("汚染", "おせん"), Term("悩む", "なやむ"), Term("適切", "てきせつ"), Term("作物", "さくもつ"), Term("時期", "じき"), Term("観察", "かんさつ"), Term("主要", "しゅよう"), Term("周囲", "しゅうい"), Term("支配", "しはい"), Term("休憩", "きゅうけい"), Term("鋭い", "するどい"), Term("不利", "ふり"), Term("姉妹", "しまい"), Term("注目", "ちゅうもく"), Term("答案", "とうあん"), Term("祝う", "いわう"), Term("覚悟", "かくご"), Term("注ぐ", "そそぐ"), Term("集中", "しゅうちゅう"), Term("贈る", "おくる"), Term("嫌う", "きらう"), Term("何で", "なんで"), Term("換える", "かえる"), Term("可哀相", "かわいそう"), Term("疑問", "ぎもん"), Term("試す", "ためす"), Term("順調", "じゅんちょう"), Term("小包", "こづつみ"), Term("配達", "はいたつ"), Term("混雑", "こんざつ"), Term("優秀", "ゆうしゅう"), Term("永久", "えいきゅう"), Term("一家", "いっか"), Term("就職", "しゅうしょく"), Term("印", "しるし"), Term("軍", "ぐん"), Term("多少", "たしょう"), Term("景気", "けいき"), Term("玉", "たま"), Term("分野", "ぶんや"), Term("見事", "みごと"), Term("書物", "しょもつ"), Term("混乱", "こんらん"), Term("主義", "しゅぎ"), Term("外す", "はずす"), Term("親友", "しんゆう"), Term("国会", "こっかい"), Term("記入", "きにゅう"), Term("衣服", "いふく"), Term("講演", "こうえん"), Term("納得", "なっとく"), Term("時刻", "じこく"), Term("適用", "てきよう"), Term("合計", "ごうけい"), Term("思い出", "おもいで"), Term("大半", "たいはん"), Term("承知", "しょうち"), Term("食卓", "しょくたく"), Term("身長", "しんちょう"), Term("制限", "せいげん"), Term("尊重", "そんちょう"), Term("質", "しつ"), Term("布", "ぬの"), Term("管理", "かんり"), Term("克服", "こくふく"), Term("維持", "いじ"), Term("穏やか", "おだやか"), Term("障害", "しょうがい"), Term("苦痛", "くつう"), Term("論争", "ろんそう"), Term("効果", "こうか"), Term("皮", "かわ"), Term("感心", "かんしん"), Term("別れ", "わかれ"), Term("肌", "はだ"), Term("範囲", "はんい"), Term("移動", "いどう"), Term("承認", "しょうにん"), Term("科目", "かもく"), Term("貢献", "こうけん"), Term("年代", "ねんだい"), Term("脇", "わき"), Term("試し", "ためし"), Term("要するに", "ようするに"), Term("気温", "きおん"), Term("順番", "じゅんばん"), Term("記者", "きしゃ"), Term("度々", "たびたび"), Term("緊張", "きんちょう"), Term("金銭", "きんせん"), Term("経由", "けいゆ"), Term("陽気", "ようき"), Term("著者", "ちょしゃ"), Term("底", "そこ"), Term("期間", "きかん"), Term("巨大", "きょだい"), Term("風景", "ふうけい"), Term("共通", "きょうつう"), Term("引っ張る", "ひっぱる"), Term("軒", "のき"), Term("意思", "いし"), Term("関連", "かんれん"), Term("開始", "かいし"), Term("代金", "だいきん"), Term("一般", "いっぱん"), Term("損", "そん"), Term("日光", "にっこう"), Term("見舞い", "みまい"), Term("家賃", "やちん"), Term("同僚", "どうりょう"), Term("引退", "いんたい"), Term("発達", "はったつ"), Term("表面", "ひょうめん"), Term("技師", "ぎし"), Term("小麦", "こむぎ"), Term("月曜", "げつよう"), Term("後者", "こうしゃ"), Term("思わず", "おもわず"), Term("通過", "つうか"), Term("真っ赤", "まっか"), Term("食糧", "しょくりょう"), Term("住民", "じゅうみん"), Term("請求", "せいきゅう"), Term("泳ぎ", "およぎ"), Term("九", "きゅう"), Term("温暖", "おんだん"), Term("男子", "だんし"), Term("差", "さ"), Term("女子", "じょし"), Term("救助", "きゅうじょ"), Term("上京", "じょうきょう"), Term("化粧", "けしょう"), Term("王子", "おうじ"), Term("見解", "けんかい"), Term("単に", "たんに"), Term("予測", "よそく"), Term("学問", "がくもん"), Term("非常", "ひじょう"), Term("支度", "したく"), Term("徹夜", "てつや"), Term("意外", "いがい"), Term("機能", "きのう"), Term("印象", "いんしょう"), Term("笑顔", "えがお"), Term("積極的", "せっきょくてき"), Term("単純", "たんじゅん"), Term("棒", "ぼう"), Term("単なる", "たんなる"), Term("適度", "てきど"), Term("抵抗", "ていこう"), Term("虫歯", "むしば"), Term("破産", "はさん"), Term("疲れ", "つかれ"), Term("流す", "ながす"), Term("普段", "ふだん"), Term("連続", "れんぞく"), Term("雰囲気", "ふんいき"), Term("操作", "そうさ"), Term("実施", "じっし"), Term("宿泊", "しゅくはく"), Term("場面", "ばめん"), Term("勤め", "つとめ"), Term("金額", "きんがく"), Term("大会", "たいかい"), Term("妙", "みょう"), Term("前者", "ぜんしゃ"), Term("苦しい", "くるしい"), Term("指導", "しどう"), Term("夜明け", "よあけ"), Term("重視", "じゅうし"), Term("倒す", "たおす"), Term("両替", "りょうがえ"), Term("刺激", "しげき"), Term("物理", "ぶつり"), Term("主婦", "しゅふ"), Term("症状", "しょうじょう"), Term("成人", "せいじん"), Term("清潔", "せいけつ"), Term("悲劇", "ひげき"), Term("死亡", "しぼう"), Term("材料", "ざいりょう"), Term("演技", "えんぎ"), Term("設計", "せっけい"), Term("粗末", "そまつ"), Term("欠陥", "けっかん"), Term("格好", "かっこう"), Term("担当", "たんとう"), Term("限界", "げんかい"), Term("仲", "なか"), Term("交際", "こうさい"), Term("一時", "いちじ"), Term("入場", "にゅうじょう"), Term("半ば", "なかば"), Term("支出", "ししゅつ"), Term("不正", "ふせい"), Term("進学", "しんがく"), Term("農民", "のうみん"), Term("特徴", "とくちょう"), Term("活気", "かっき"), Term("委員", "いいん"), Term("礼儀", "れいぎ"), Term("修正", "しゅうせい"), Term("幅", "はば"), Term("依頼", "いらい"), Term("最低", "さいてい"), Term("推薦", "すいせん"), Term("生地", "きじ"), Term("審判", "しんぱん"), Term("急激", "きゅうげき"), Term("地区", "ちく"), Term("党", "とう"), Term("生き物", "いきもの"), Term("完了", "かんりょう"), Term("支店", "してん"), Term("厄介", "やっかい"), Term("装置", "そうち"), Term("整理", "せいり"), Term("課", "か"), Term("拡大", "かくだい"), Term("支給", "しきゅう"), Term("予期", "よき"), Term("基本", "きほん"), Term("記念", "きねん"), Term("刑事", "けいじ"), Term("収める", "おさめる"), Term("手間", "てま"), Term("本人", "ほんにん"), Term("設備", "せつび"), Term("発行", "はっこう"), Term("全国", "ぜんこく"), Term("土曜", "どよう"), Term("読み", "よみ"), Term("続き", "つづき"), Term("微妙", "びみょう"), Term("正式", "せいしき"), Term("掲示", "けいじ"), Term("迎え", "むかえ"), Term("券", "けん"), Term("長期", "ちょうき"), Term("豪華", "ごうか"), Term("決まり", "きまり"), Term("幕", "まく"), Term("語学", "ごがく"), Term("大気", "たいき"), Term("必死", "ひっし"), Term("向い", "むかい"), Term("水準", "すいじゅん"), Term("敬意", "けいい"), Term("強力", "きょうりょく"), Term("迷惑", "めいわく"), Term("愉快", "ゆかい"), Term("裁判", "さいばん"), Term("出会い", "であい"), Term("集まり", "あつまり"), Term("図", "ず"), Term("予防", "よぼう"), Term("飛行", "ひこう"), Term("孫", "まご"), Term("陸", "りく"), Term("輪", "わ"), Term("盛り", "さかり"), Term("組", "くみ"), Term("騒ぎ", "さわぎ"), Term("地", "ち"), Term("係", "かかり"), Term("年中", "ねんじゅう"), Term("問い", "とい"), Term("方々", "かたがた"), Term("心理", "しんり"), Term("違反", "いはん"), Term("順", "じゅん"), Term("負け", "まけ"), Term("中学", "ちゅうがく"), Term("通信", "つうしん"), Term("野", "の"), Term("宿", "やど"), Term("稲", "いね"), Term("金曜", "きんよう"), Term("事務", "じむ"), Term("日常", "にちじょう"), Term("移す", "うつす"), Term("予報", "よほう"), Term("気味", "きみ"), Term("始まり", "はじまり"), Term("候補", "こうほ"), Term("天然", "てんねん"), Term("通行", "つうこう"), Term("革", "かわ"), Term("沖", "おき"), Term("近代", "きんだい"), Term("空き", "あき"), Term("徹底", "てってい"), Term("木曜", "もくよう"), Term("機関", "きかん"), Term("機嫌", "きげん"), Term("連れ", "つれ"), Term("注", "ちゅう"), Term("境", "さかい"), Term("恩", "おん"), Term("題", "だい"), Term("自動", "じどう"), Term("名人", "めいじん"), Term("学", "がく"), Term("誠に", "まことに"), Term("見当", "けんとう"), Term("束", "たば"), Term("可", "か"), Term("嫁", "よめ"), Term("中古", "ちゅうこ"), Term("縄", "なわ"), Term("祝い", "いわい"), Term("加減", "かげん"), Term("定期", "ていき"), Term("作法", "さほう"), Term("参考", "さんこう"), Term("高速", "こうそく"), Term("泉", "いずみ"), Term("図書", "としょ"), Term("宅", "たく"), Term("火曜", "かよう"), Term("段", "だん"), Term("来", "らい"), Term("局", "きょく"), Term("現れ", "あらわれ"), Term("下り", "くだり"), Term("老い", "おい"), Term("消防", "しょうぼう"), Term("大戦", "たいせん"), Term("今に", "いまに"), Term("御", "ご"), Term("仕舞う", "しまう"), Term("様", "よう"), Term("貰う", "もらう"), Term("全て", "すべて"), Term("行けない", "いけない"), Term("全く", "まったく"), Term("履く", "はく"), Term("信じる", "しんじる"), Term("与える", "あたえる"), Term("分", "ぶん"), Term("頃", "ころ"), Term("知らせ", "しらせ"), Term("求める", "もとめる"), Term("得る", "える"), Term("者", "もの"), Term("嬉しい", "うれしい"), Term("可也", "かなり"), Term("学ぶ", "まなぶ"), Term("過ごす", "すごす"), Term("位", "くらい"), Term("認める", "みとめる"), Term("気付く", "きづく"), Term("頂く", "いただく"), Term("遂に", "ついに"), Term("先ず", "まず"), Term("有らゆる", "あらゆる"), Term("宜しい", "よろしい"), Term("暮らす", "くらす"), Term("丸で", "まるで"), Term("数", "すう"), Term("如何しても", "どうしても"), Term("気に入る", "きにいる"), Term("解く", "とく"), Term("喋る", "しゃべる"), Term("寧ろ", "むしろ"), Term("優れる", "すぐれる"), Term("何時でも", "いつでも"), Term("遅刻", "ちこく"), Term("従う", "したがう"), Term("例え", "たとえ"), Term("怪我", "けが"), Term("回り", "まわり"), Term("益々", "ますます"), Term("済みません", "すみません"), Term("現す", "あらわす"), Term("描く", "えがく"), Term("少しも", "すこしも"), Term("丸", "まる"), Term("述べる", "のべる"), Term("当たる", "あたる"), Term("切れる", "きれる"), Term("会", "かい"), Term("或", "ある"), Term("効く", "きく"), Term("約", "やく"), Term("中中", "なかなか"), Term("避ける", "さける"), Term("僅か", "わずか"), Term("賢い", "かしこい"), Term("正に", "まさに"), Term("経つ", "たつ"), Term("勿論", "もちろん"), Term("夢中", "むちゅう"), Term("諦める", "あきらめる"), Term("掴む", "つかむ"), Term("床", "ゆか"), Term("異なる", "ことなる"), Term("伸ばす", "のばす"), Term("随分", "ずいぶん"), Term("飼う", "かう"), Term("去る", "さる"), Term("沈む", "しずむ"), Term("輝く", "かがやく"), Term("願う", "ねがう"), Term("利口", "りこう"), Term("取れる", "とれる"), Term("抱く", "いだく"), Term("似合う", "にあう"), Term("匂い", "におい"), Term("偶々", "たまたま"), Term("お喋り", "おしゃべり"), Term("招く", "まねく"), Term("割る", "わる"), Term("凝乎と", "じっと"), Term("任せる", "まかせる"), Term("所謂", "いわゆる"), Term("触れる", "ふれる"), Term("届く", "とどく"), Term("解ける", "とける"), Term("文", "ぶん"), Term("立ち上がる", "たちあがる"), Term("不平", "ふへい"), Term("大した", "たいした"), Term("腐る", "くさる"), Term("宜しく", "よろしく"), Term("軈て", "やがて"), Term("伺う", "うかがう"), Term("通じる", "つうじる"), Term("罹る", "かかる"), Term("稼ぐ", "かせぐ"), Term("辞める", "やめる"), Term("含む", "ふくむ"), Term("微笑む", "ほほえむ"), Term("苦しむ", "くるしむ"), Term("種", "たね"), Term("叱る", "しかる"), Term("詰まり", "つまり"), Term("近頃", "ちかごろ"), Term("勧める", "すすめる"), Term("基づく", "もとづく"), Term("兎に角", "とにかく"), Term("責める", "せめる"), Term("済ませる", "すませる"), Term("苛々", "いらいら"), Term("面", "めん"), Term("就く", "つく"), Term("案", "あん"), Term("捕まる", "つかまる"), Term("欠ける", "かける"), Term("従兄弟", "いとこ"), Term("向く", "むく"), Term("精々", "せいぜい"), Term("横切る", "よこぎる"), Term("下ろす", "おろす"), Term("強調", "きょうちょう"), Term("生まれ", "うまれ"), Term("転ぶ", "ころぶ"), Term("轢く", "ひく"), Term("其の儘", "そのまま"), Term("生じる", "しょうじる"), Term("法", "ほう"), Term("劣る", "おとる"), Term("隠れる", "かくれる"), Term("度", "ど"), Term("吠える", "ほえる"), Term("訴える", "うったえる"), Term("繋ぐ", "つなぐ"), Term("震える", "ふるえる"), Term("品", "ひん"), Term("怠ける", "なまける"), Term("伸びる", "のびる"), Term("凍る", "こおる"), Term("広がる", "ひろがる"), Term("悪戯", "いたずら"), Term("罰する", "ばっする"), Term("堪らない", "たまらない"), Term("酔う", "よう"), Term("生憎", "あいにく"), Term("態と", "わざと"), Term("濃い", "こい"), Term("飽きる", "あきる"), Term("除く", "のぞく"), Term("論じる", "ろんじる"), Term("支える", "ささえる"), Term("満ちる", "みちる"), Term("抜く", "ぬく"), Term("何時までも", "いつまでも"), Term("真面目", "まじめ"), Term("直に", "じかに"), Term("適する", "てきする"), Term("臭い", "くさい"), Term("陰", "かげ"), Term("若しも", "もしも"), Term("途端", "とたん"), Term("振る", "ふる"), Term("通り過ぎる", "とおりすぎる"), Term("喉", "のど"), Term("真似", "まね"), Term("幼い", "おさない"), Term("止す", "よす"), Term("防ぐ", "ふせぐ"), Term("凡そ", "およそ"), Term("用心", "ようじん"), Term("抜ける", "ぬける"), Term("性", "せい"), Term("行儀", "ぎょうぎ"), Term("不図", "ふと"), Term("物音", "ものおと"), Term("熱中", "ねっちゅう"), Term("等しい", "ひとしい"), Term("放す", "はなす"), Term("省く", "はぶく"), Term("上達", "じょうたつ"), Term("取り上げる", "とりあげる"), Term("眺め", "ながめ"), Term("逆らう", "さからう"), Term("諺", "ことわざ"), Term("気の毒", "きのどく"), Term("譲る", "ゆずる"), Term("申し込む", "もうしこむ"), Term("占める", "しめる"), Term("増す", "ます"), Term("一度に", "いちどに"), Term("一人一人", "ひとりひとり"), Term("即ち", "すなわち"), Term("可愛らしい", "かわいらしい"), Term("詰める", "つめる"), Term("その内", "そのうち"), Term("我が儘", "わがまま"), Term("狂う", "くるう"), Term("頂戴", "ちょうだい"), Term("札", "さつ"), Term("迷子", "まいご"), Term("象", "ぞう"), Term("生", "なま"), Term("真剣", "しんけん"), Term("売れる", "うれる"), Term("頻りに", "しきりに"), Term("要点", "ようてん"), Term("食う", "くう"), Term("指す", "さす"), Term("飛ばす", "とばす"), Term("とんでも無い", "とんでもない"), Term("贅沢", "ぜいたく"), Term("至る", "いたる"), Term("最中", "さいちゅう"), Term("居眠り", "いねむり"), Term("或いは", "あるいは"), Term("真逆", "まさか"), Term("余分", "よぶん"), Term("親戚", "しんせき"), Term("停留所", "ていりゅうじょ"), Term("反抗", "はんこう"), Term("進める", "すすめる"), Term("上等", "じょうとう"), Term("離す", "はなす"), Term("今にも", "いまにも"), Term("越す", "こす"), Term("手品", "てじな"), Term("平ら", "たいら"), Term("包み", "つつみ"), Term("率", "りつ"), Term("哀れ", "あわれ"), Term("積もる", "つもる"), Term("覚める", "さめる"), Term("綿", "めん"), Term("及ぼす", "およぼす"), Term("旧", "きゅう"), Term("稍", "やや"), Term("咳", "せき"), Term("切れ", "きれ"), Term("器用", "きよう"), Term("唸る", "うなる"), Term("説", "せつ"), Term("粗い", "あらい"), Term("大屋", "おおや"), Term("節", "ふし"), Term("関する", "かんする"), Term("覚ます", "さます"), Term("原", "はら"), Term("銅貨", "どうか"), Term("これ等", "これら"), Term("旨い", "うまい"), Term("急に", "きゅうに"), Term("番", "ばん"), Term("人ごみ", "ひとごみ"), Term("持ち上げる", "もちあげる"), Term("お昼", "おひる"), Term("小", "しょう"), Term("だって", "だって"), Term("ビール", "ビール"), Term("メンバー", "メンバー"), Term("ドラマ", "ドラマ"), Term("オーバー", "オーバー"), Term("語", "ご"), Term("市場", "いちば"), Term("煙", "けむり"), Term("値", "あたい"), Term("善", "ぜん"), Term("灯", "ひ"), Term("管", "かん"), Term("チーム", "チーム"), Term("ドレス", "ドレス"), Term("スキー", "スキー"), Term("ボール", "ボール"), Term("ピクニック", "ピクニック"), Term("ゲーム", "ゲーム"), Term("ワイン", "ワイン"), Term("スープ", "スープ"), Term("ボート", "ボート"), Term("クリスマス", "クリスマス"), Term("グループ", "グループ"), Term("エンジン", "エンジン"), Term("まあ", "まあ"), Term("ダンス", "ダンス"), Term("ソファ", "ソファ"), Term("サービス", "サービス"), Term("ベンチ", "ベンチ"), Term("バイオリン", "バイオリン"), Term("チャンス", "チャンス"), Term("デート", "デート"), Term("トランプ", "トランプ"), Term("ユーモア", "ユーモア"), Term("チーズ", "チーズ"), Term("インク", "インク"), Term("パスポート", "パスポート"), Term("ドライブ", "ドライブ"), Term("スケート", "スケート"), Term("ノック", "ノック"), Term("パーセント", "パーセント"), Term("トンネル", "トンネル"), Term("キャンプ", "キャンプ"), Term("ハイキング", "ハイキング"), Term("ヨット", "ヨット"), Term("パイロット", "パイロット"), Term("スタイル", "スタイル"), Term("アルバム", "アルバム"), Term("ラケット", "ラケット"), Term("タイプライター", "タイプライター"), Term("タオル", "タオル"), Term("ウィスキー", "ウィスキー"), Term("アイスクリーム", "アイスクリーム"), Term("ロケット", "ロケット"), Term("テント", "テント"), Term("パイプ", "パイプ"), Term("ブレーキ", "ブレーキ"), Term("ジェット機", "ジェットき"), Term("コーチ", "コーチ"), Term("霜", "しも"), Term("ベルト", "ベルト"), Term("ケース", "ケース"), Term("ライター", "ライター"), Term("ジュース", "ジュース"), Term("アイロン", "アイロン"), Term("アウト", "アウト"), Term("スタンド", "スタンド"), Term("プラス", "プラス"), Term("日本", "にほん"), Term("オフィス", "オフィス"), Term("キャプテン", "キャプテン"), Term("ジーンズ", "ジーンズ"), Term("マスター", "マスター"), Term("パス", "パス"), Term("カー", "カー"), Term("グランド", "グランド"), Term("日中", "にっちゅう"), Term("ゴール", "ゴール"), Term("セット", "セット"), Term("センター", "センター"), Term("マーケット", "マーケット"), Term("バン", "バン"), Term("何か", "なにか"), Term("何でも", "なんでも"), Term("名", "な"), Term("出来るだけ", "できるだけ"), Term("何とか", "なんとか"), Term("何時か", "いつか"), Term("楽", "らく"), Term("行き", "いき"), Term("流行", "りゅうこう"), Term("故郷", "ふるさと"), Term("台", "だい"), Term("悪口", "わるぐち"), Term("お互い", "おたがい"), Term("世間", "せけん"), Term("預ける", "あずける"), Term("主に", "おもに"), Term("一種", "いっしゅ"), Term("腰", "こし"), Term("税", "ぜい"), Term("末", "すえ"), Term("居間", "いま"), Term("資源", "しげん"), Term("章", "しょう"), Term("同一", "どういつ"), Term("医療", "いりょう"), Term("縁", "ふち"), Term("土", "つち"), Term("資本", "しほん"), Term("無", "む"), Term("人工", "じんこう"), Term("柄", "がら"), Term("密", "みつ"), Term("堀", "ほり"), Term("曜日", "ようび"), Term("松", "まつ"), Term("はあ", "はあ"), Term("金", "かね"), Term("かも知れない", "かもしれない"), Term("ずっと", "ずっと"), Term("どんな", "どんな"), Term("実", "み"), Term("どんなに", "どんなに"), Term("何処か", "どこか"), Term("其処で", "そこで"), Term("有り難う", "ありがとう"), Term("滅多に", "めったに"), Term("ミルク", "ミルク"), Term("こんなに", "こんなに"), Term("夫れ夫れ", "それぞれ"), Term("トラック", "トラック"), Term("被る", "かぶる"), Term("其れ共", "それとも"), Term("がっかり", "がっかり"), Term("彼方此方", "あちこち"), Term("きちんと", "きちんと"), Term("スピーチ", "スピーチ"), Term("所為", "せい"), Term("ですから", "ですから"), Term("バッグ", "バッグ"), Term("其れでも", "それでも"), Term("ちゃんと", "ちゃんと"), Term("ペンキ", "ペンキ"), Term("溺れる", "おぼれる"), Term("たった", "たった"), Term("きつい", "きつい"), Term("ぐっすり", "ぐっすり"), Term("ぴったり", "ぴったり"), Term("サイン", "サイン"), Term("カード", "カード"), Term("何故なら", "なぜなら"), Term("塵", "ごみ"), Term("さっぱり", "さっぱり"), Term("ミス", "ミス"), Term("然も", "しかも"), Term("所で", "ところで"), Term("グラス", "グラス"), Term("お目出度う", "おめでとう"), Term("偖", "さて"), Term("対", "つい"), Term("ハンサム", "ハンサム"), Term("メモ", "メモ"), Term("ざっと", "ざっと"), Term("スイッチ", "スイッチ"), Term("たっぷり", "たっぷり"), Term("ダイヤ", "ダイヤ"), Term("ぼんやり", "ぼんやり"), Term("プラン", "プラン"), Term("今日は", "こんにちは"), Term("プロ", "プロ"), Term("のんびり", "のんびり"), Term("デモ", "デモ"), Term("ビデオ", "ビデオ"), Term("トップ", "トップ"), Term("鋏", "はさみ"), Term("ホーム", "ホーム"), Term("クリーム", "クリーム"), Term("スター", "スター"), Term("ピン", "ピン"), Term("ボーイ", "ボーイ"), Term("クラシック", "クラシック"), Term("屯", "トン"), Term("マイク", "マイク"), Term("所が", "ところが"), Term("空く", "すく"), Term("仏", "ほとけ"), Term("コード", "コード"), Term("田", "た"), Term("そっくり", "そっくり"), Term("いらっしゃい", "いらっしゃい"), Term("にっこり", "にっこり"), Term("だけど", "だけど"), Term("だが", "だが"), Term("ノー", "ノー"), Term("身", "み"), Term("叫ぶ", "さけぶ"), Term("役", "やく"), Term("働き", "はたらき"), Term("奥", "おく"), Term("申し訳", "もうしわけ"), Term("同時", "どうじ"), Term("不可", "ふか"), Term("暮れ", "くれ"), Term("正", "せい"), Term("具体", "ぐたい"), Term("訓", "くん"), Term("向ける", "むける"), Term("尤も", "もっとも"), Term("吐く", "はく"), Term("嗽", "うがい"), Term("違いない", "ちがいない"), Term("対する", "たいする"), Term("矢張り", "やはり"), Term("頂きます", "いただきます"), Term("仕舞った", "しまった"), Term("吃驚", "びっくり"), Term("男の人", "おとこのひと"), Term("あんなに", "あんなに"), Term("極", "きょく"), Term("御免なさい", "ごめんなさい"), Term("ばったり", "ばったり"), Term("エネルギー", "エネルギー"), Term("ど", "ど"), Term("率土", "そっと"), Term("球", "きゅう"), Term("不", "ふ"), Term("無し", "なし"), Term("ママ", "ママ"), Term("依ると", "よると"), Term("麦酒", "ばくしゅ"), Term("直", "なお"), Term("ト", "ト"), Term("けち", "けち"), Term("計る", "はかる"), Term("日付", "ひづけ"), Term("財産", "ざいさん"), Term("霧", "きり"), Term("服装", "ふくそう"), Term("宗教", "しゅうきょう"), Term("青年", "せいねん"), Term("女王", "じょおう"), Term("拍手", "はくしゅ"), Term("瞬間", "しゅんかん"), Term("絵画", "かいが"), Term("人種", "じんしゅ"), Term("温度", "おんど"), Term("跡", "あと"), Term("句", "く"), Term("茶", "ちゃ"), Term("容易", "ようい"), Term("恋", "こい"), Term("一生", "いっしょう"), Term("専攻", "せんこう"), Term("裏切る", "うらぎる"), Term("友", "とも"), Term("代表", "だいひょう"), Term("要素", "ようそ"), Term("戻す", "もどす"), Term("明確", "めいかく"), Term("独特", "どくとく"), Term("保存", "ほぞん"), Term("住宅", "じゅうたく"), Term("級", "きゅう"), Term("年月", "としつき"), Term("勢い", "いきおい"), Term("互い", "たがい"), Term("典型", "てんけい"), Term("勘", "かん"), Term("発車", "はっしゃ")}
-N2 = {Term("儀式", "ぎしき"), Term("南極", "なんきょく"), Term("職人", "しょくにん"), Term("北極", "ほっきょく"), Term("新幹線", "しんかんせん"), Term("昼寝", "ひるね"), Term("大通り", "おおどおり"), Term("木材", "もくざい"), Term("運河", "うんが"), Term("遊園地", "ゆうえんち"), Term("天皇", "てんのう"), Term("蛇口", "じゃぐち"), Term("溶岩", "ようがん"), Term("武士", "ぶし"), Term("名字", "みょうじ"), Term("面接", "めんせつ"), Term("資料", "しりょう"), Term("解放", "かいほう"), Term("望遠鏡", "ぼうえんきょう"), Term("唇", "くちびる"), Term("群れ", "むれ"), Term("液体", "えきたい"), Term("温泉", "おんせん"), Term("書店", "しょてん"), Term("過失", "かしつ"), Term("広場", "ひろば"), Term("通勤", "つうきん"), Term("垣根", "かきね"), Term("煙突", "えんとつ"), Term("井戸", "いど"), Term("果実", "かじつ"), Term("演劇", "えんげき"), Term("矛盾", "むじゅん"), Term("通訳", "つうやく"), Term("皮膚", "ひふ"), Term("宣伝", "せんでん"), Term("電池", "でんち"), Term("通貨", "つうか"), Term("虹", "にじ"), Term("回転", "かいてん"), Term("競馬", "けいば"), Term("水素", "すいそ"), Term("中世", "ちゅうせい"), Term("観念", "かんねん"), Term("火山", "かざん"), Term("相撲", "すもう"), Term("吹雪", "ふぶき"), Term("基礎", "きそ"), Term("車庫", "しゃこ"), Term("枕", "まくら"), Term("花火", "はなび"), Term("商業", "しょうぎょう"), Term("公害", "こうがい"), Term("鐘", "かね"), Term("停電", "ていでん"), Term("空想", "くうそう"), Term("政党", "せいとう"), Term("角度", "かくど"), Term("足跡", "あしあと"), Term("名所", "めいしょ"), Term("公式", "こうしき"), Term("公共", "こうきょう"), Term("百科事典", "ひゃっかじてん"), Term("牧場", "ぼくじょう"), Term("蒸気", "じょうき"), Term("車輪", "しゃりん"), Term("紅葉", "こうよう"), Term("強化", "きょうか"), Term("死体", "したい"), Term("姿勢", "しせい"), Term("血液", "けつえき"), Term("看板", "かんばん"), Term("神話", "しんわ"), Term("乗り換え", "のりかえ"), Term("森林", "しんりん"), Term("磁石", "じしゃく"), Term("大工", "だいく"), Term("寺院", "じいん"), Term("文体", "ぶんたい"), Term("薬局", "やっきょく"), Term("消化", "しょうか"), Term("面積", "めんせき"), Term("顕微鏡", "けんびきょう"), Term("寮", "りょう"), Term("家屋", "かおく"), Term("撮影", "さつえい"), Term("酢", "す"), Term("滝", "たき"), Term("電力", "でんりょく"), Term("方言", "ほうげん"), Term("東洋", "とうよう"), Term("給与", "きゅうよ"), Term("診断", "しんだん"), Term("風船", "ふうせん"), Term("国籍", "こくせき"), Term("刺身", "さしみ"), Term("血圧", "けつあつ"), Term("将棋", "しょうぎ"), Term("楽器", "がっき"), Term("直線", "ちょくせん"), Term("伝記", "でんき"), Term("反省", "はんせい"), Term("無限", "むげん"), Term("継続", "けいぞく"), Term("噴火", "ふんか"), Term("包装", "ほうそう"), Term("手首", "てくび"), Term("姓", "せい"), Term("明け方", "あけがた"), Term("香水", "こうすい"), Term("彫刻", "ちょうこく"), Term("先祖", "せんぞ"), Term("包丁", "ほうちょう"), Term("太鼓", "たいこ"), Term("電柱", "でんちゅう"), Term("和服", "わふく"), Term("手前", "てまえ"), Term("竹", "たけ"), Term("表紙", "ひょうし"), Term("園芸", "えんげい"), Term("行列", "ぎょうれつ"), Term("商社", "しょうしゃ"), Term("学年", "がくねん"), Term("分布", "ぶんぷ"), Term("深夜", "しんや"), Term("統一", "とういつ"), Term("引き分け", "ひきわけ"), Term("記号", "きごう"), Term("煮る", "にる"), Term("古典", "こてん"), Term("通路", "つうろ"), Term("宴会", "えんかい"), Term("原理", "げんり"), Term("平日", "へいじつ"), Term("集合", "しゅうごう"), Term("光線", "こうせん"), Term("測定", "そくてい"), Term("電球", "でんきゅう"), Term("親指", "おやゆび"), Term("温室", "おんしつ"), Term("体操", "たいそう"), Term("漁師", "りょうし"), Term("中年", "ちゅうねん"), Term("農産物", "のうさんぶつ"), Term("編集", "へんしゅう"), Term("算数", "さんすう"), Term("淡水", "たんすい"), Term("口紅", "くちべに"), Term("俳句", "はいく"), Term("自然科学", "しぜんかがく"), Term("歯磨き", "はみがき"), Term("水蒸気", "すいじょうき"), Term("垂直", "すいちょく"), Term("売買", "ばいばい"), Term("交流", "こうりゅう"), Term("確率", "かくりつ"), Term("税関", "ぜいかん"), Term("水平", "すいへい"), Term("文房具", "ぶんぼうぐ"), Term("電波", "でんぱ"), Term("複数", "ふくすう"), Term("餅", "もち"), Term("水分", "すいぶん"), Term("摩擦", "まさつ"), Term("大学院", "だいがくいん"), Term("性別", "せいべつ"), Term("漁業", "ぎょぎょう"), Term("役所", "やくしょ"), Term("灯台", "とうだい"), Term("吐き気", "はきけ"), Term("電流", "でんりゅう"), Term("鉱物", "こうぶつ"), Term("透明", "とうめい"), Term("線路", "せんろ"), Term("幼稚園", "ようちえん"), Term("歯車", "はぐるま"), Term("冠", "かんむり"), Term("代名詞", "だいめいし"), Term("随筆", "ずいひつ"), Term("紫", "むらさき"), Term("工夫", "くふう"), Term("貨物", "かもつ"), Term("洗剤", "せんざい"), Term("車掌", "しゃしょう"), Term("祝日", "しゅくじつ"), Term("名刺", "めいし"), Term("会館", "かいかん"), Term("気圧", "きあつ"), Term("頂点", "ちょうてん"), Term("接続", "せつぞく"), Term("半島", "はんとう"), Term("農薬", "のうやく"), Term("圧縮", "あっしゅく"), Term("重力", "じゅうりょく"), Term("学部", "がくぶ"), Term("真空", "しんくう"), Term("発電", "はつでん"), Term("官庁", "かんちょう"), Term("名物", "めいぶつ"), Term("司会", "しかい"), Term("転々", "てんてん"), Term("流域", "りゅういき"), Term("社説", "しゃせつ"), Term("郡", "ぐん"), Term("機関車", "きかんしゃ"), Term("浴衣", "ゆかた"), Term("炭鉱", "たんこう"), Term("献立", "こんだて"), Term("索引", "さくいん"), Term("輸血", "ゆけつ"), Term("社会科学", "しゃかいかがく"), Term("為替", "かわせ"), Term("西暦", "せいれき"), Term("図鑑", "ずかん"), Term("峠", "とうげ"), Term("自治", "じち"), Term("筆記", "ひっき"), Term("学会", "がっかい"), Term("改札", "かいさつ"), Term("紙幣", "しへい"), Term("杉", "すぎ"), Term("曖昧", "あいまい"), Term("梯子", "はしご"), Term("肘", "ひじ"), Term("絨毯", "じゅうたん"), Term("釘", "くぎ"), Term("編み物", "あみもの"), Term("気体", "きたい"), Term("茹でる", "ゆでる"), Term("包帯", "ほうたい"), Term("胡椒", "こしょう"), Term("飢饉", "ききん"), Term("煉瓦", "れんが"), Term("直角", "ちょっかく"), Term("錆", "さび"), Term("迷信", "めいしん"), Term("櫛", "くし"), Term("失恋", "しつれん"), Term("待合室", "まちあいしつ"), Term("名詞", "めいし"), Term("省略", "しょうりゃく"), Term("回り道", "まわりみち"), Term("扇風機", "せんぷうき"), Term("蒸発", "じょうはつ"), Term("形容詞", "けいようし"), Term("屑", "くず"), Term("正方形", "せいほうけい"), Term("裁縫", "さいほう"), Term("蕎麦", "そば"), Term("副詞", "ふくし"), Term("人差し指", "ひとさしゆび"), Term("消防署", "しょうぼうしょ"), Term("定規", "じょうぎ"), Term("蛍光灯", "けいこうとう"), Term("敬語", "けいご"), Term("矢印", "やじるし"), Term("時間割", "じかんわり"), Term("箒", "ほうき"), Term("体積", "たいせき"), Term("人文科学", "じんぶんかがく"), Term("長方形", "ちょうほうけい"), Term("経度", "けいど"), Term("括弧", "かっこ"), Term("海水浴", "かいすいよく"), Term("座布団", "ざぶとん"), Term("障子", "しょうじ"), Term("薬指", "くすりゆび"), Term("便所", "べんじょ"), Term("温帯", "おんたい"), Term("下駄", "げた"), Term("風呂敷", "ふろしき"), Term("肌着", "はだぎ"), Term("水筒", "すいとう"), Term("複写", "ふくしゃ"), Term("手洗い", "てあらい"), Term("噴水", "ふんすい"), Term("螺子", "ねじ"), Term("主語", "しゅご"), Term("零点", "れいてん"), Term("長所", "ちょうしょ"), Term("休息", "きゅうそく"), Term("湿気", "しっけ"), Term("勝負", "しょうぶ"), Term("役人", "やくにん"), Term("相互", "そうご"), Term("引っ越し", "ひっこし"), Term("海洋", "かいよう"), Term("関西", "かんさい"), Term("上り", "のぼり"), Term("切っ掛け", "きっかけ"), Term("正門", "せいもん"), Term("南米", "なんべい"), Term("連合", "れんごう"), Term("下町", "したまち"), Term("一応", "いちおう"), Term("大小", "だいしょう"), Term("御免", "ごめん"), Term("一旦", "いったん"), Term("麓", "ふもと"), Term("生け花", "いけばな"), Term("欧米", "おうべい"), Term("稽古", "けいこ"), Term("隙間", "すきま"), Term("瀬戸物", "せともの"), Term("箪笥", "たんす"), Term("合流", "ごうりゅう"), Term("下る", "くだる"), Term("間もなく", "まもなく"), Term("耐える", "たえる"), Term("少なくとも", "すくなくとも"), Term("押さえる", "おさえる"), Term("知り合い", "しりあい"), Term("相変わらず", "あいかわらず"), Term("率直", "そっちょく"), Term("殴る", "なぐる"), Term("努める", "つとめる"), Term("慌てる", "あわてる"), Term("診る", "みる"), Term("何とも", "なんとも"), Term("稀", "まれ"), Term("狙う", "ねらう"), Term("迫る", "せまる"), Term("浮かべる", "うかべる"), Term("預かる", "あずかる"), Term("交代", "こうたい"), Term("枯れる", "かれる"), Term("当たり前", "あたりまえ"), Term("外れる", "はずれる"), Term("広げる", "ひろげる"), Term("取り消す", "とりけす"), Term("見送る", "みおくる"), Term("伝わる", "つたわる"), Term("配る", "くばる"), Term("分かれる", "わかれる"), Term("売り上げ", "うりあげ"), Term("刺す", "さす"), Term("接する", "せっする"), Term("属する", "ぞくする"), Term("作成", "さくせい"), Term("呼び出す", "よびだす"), Term("積む", "つむ"), Term("飢える", "うえる"), Term("性質", "せいしつ"), Term("懐かしい", "なつかしい"), Term("話し合い", "はなしあい"), Term("解散", "かいさん"), Term("方針", "ほうしん"), Term("埋める", "うめる"), Term("兼ねる", "かねる"), Term("建つ", "たつ"), Term("余計", "よけい"), Term("夫妻", "ふさい"), Term("法則", "ほうそく"), Term("生き生き", "いきいき"), Term("原稿", "げんこう"), Term("国王", "こくおう"), Term("登場", "とうじょう"), Term("通知", "つうち"), Term("手続き", "てつづき"), Term("締め切り", "しめきり"), Term("本来", "ほんらい"), Term("日差し", "ひざし"), Term("別荘", "べっそう"), Term("縛る", "しばる"), Term("例外", "れいがい"), Term("一流", "いちりゅう"), Term("傑作", "けっさく"), Term("動作", "どうさ"), Term("集会", "しゅうかい"), Term("絞る", "しぼる"), Term("出張", "しゅっちょう"), Term("皮肉", "ひにく"), Term("以降", "いこう"), Term("幼児", "ようじ"), Term("蚊", "か"), Term("周辺", "しゅうへん"), Term("低下", "ていか"), Term("全身", "ぜんしん"), Term("仲良し", "なかよし"), Term("増大", "ぞうだい"), Term("要領", "ようりょう"), Term("不運", "ふうん"), Term("狙い", "ねらい"), Term("侵入", "しんにゅう"), Term("食器", "しょっき"), Term("特定", "とくてい"), Term("一定", "いってい"), Term("分類", "ぶんるい"), Term("満点", "まんてん"), Term("地点", "ちてん"), Term("郵送", "ゆうそう"), Term("公正", "こうせい"), Term("手入れ", "ていれ"), Term("高度", "こうど"), Term("改正", "かいせい"), Term("手ごろ", "てごろ"), Term("学科", "がっか"), Term("小遣い", "こづかい"), Term("日の出", "ひので"), Term("調整", "ちょうせい"), Term("苦情", "くじょう"), Term("統計", "とうけい"), Term("住まい", "すまい"), Term("展開", "てんかい"), Term("王女", "おうじょ"), Term("時速", "じそく"), Term("標識", "ひょうしき"), Term("乱暴", "らんぼう"), Term("接近", "せっきん"), Term("高める", "たかめる"), Term("構造", "こうぞう"), Term("刻む", "きざむ"), Term("判事", "はんじ"), Term("詰まる", "つまる"), Term("見舞う", "みまう"), Term("利害", "りがい"), Term("無数", "むすう"), Term("前後", "ぜんご"), Term("教養", "きょうよう"), Term("弱点", "じゃくてん"), Term("知人", "ちじん"), Term("総理大臣", "そうりだいじん"), Term("派手", "はで"), Term("素直", "すなお"), Term("反映", "はんえい"), Term("往復", "おうふく"), Term("見本", "みほん"), Term("重役", "じゅうやく"), Term("崩れる", "くずれる"), Term("娯楽", "ごらく"), Term("役目", "やくめ"), Term("解答", "かいとう"), Term("満員", "まんいん"), Term("役者", "やくしゃ"), Term("挟む", "はさむ"), Term("対策", "たいさく"), Term("空中", "くうちゅう"), Term("焦点", "しょうてん"), Term("冷やす", "ひやす"), Term("可決", "かけつ"), Term("延長", "えんちょう"), Term("早口", "はやくち"), Term("基準", "きじゅん"), Term("生存", "せいぞん"), Term("寄せる", "よせる"), Term("期限", "きげん"), Term("争う", "あらそう"), Term("中身", "なかみ"), Term("塊", "かたまり"), Term("祖先", "そせん"), Term("箇所", "かしょ"), Term("受話器", "じゅわき"), Term("修繕", "しゅうぜん"), Term("応援", "おうえん"), Term("停車", "ていしゃ"), Term("花嫁", "はなよめ"), Term("相違", "そうい"), Term("輸送", "ゆそう"), Term("推定", "すいてい"), Term("受験", "じゅけん"), Term("見学", "けんがく"), Term("追加", "ついか"), Term("応対", "おうたい"), Term("器具", "きぐ"), Term("防止", "ぼうし"), Term("葬式", "そうしき"), Term("果たして", "はたして"), Term("部品", "ぶひん"), Term("標準", "ひょうじゅん"), Term("口実", "こうじつ"), Term("割引", "わりびき"), Term("過程", "かてい"), Term("回答", "かいとう"), Term("直後", "ちょくご"), Term("短期", "たんき"), Term("活力", "かつりょく"), Term("予備", "よび"), Term("出迎える", "でむかえる"), Term("点数", "てんすう"), Term("重ねる", "かさねる"), Term("見直す", "みなおす"), Term("神様", "かみさま"), Term("気配", "けはい"), Term("形式", "けいしき"), Term("間隔", "かんかく"), Term("月給", "げっきゅう"), Term("膨らむ", "ふくらむ"), Term("上下", "じょうげ"), Term("恩恵", "おんけい"), Term("言葉遣い", "ことばづかい"), Term("申請", "しんせい"), Term("発売", "はつばい"), Term("不通", "ふつう"), Term("行事", "ぎょうじ"), Term("恨み", "うらみ"), Term("改める", "あらためる"), Term("指定", "してい"), Term("拡張", "かくちょう"), Term("素質", "そしつ"), Term("次ぐ", "つぐ"), Term("実物", "じつぶつ"), Term("消極的", "しょうきょくてき"), Term("裏口", "うらぐち"), Term("親類", "しんるい"), Term("受取り", "うけとり"), Term("縮小", "しゅくしょう"), Term("商店", "しょうてん"), Term("休養", "きゅうよう"), Term("英文", "えいぶん"), Term("物語る", "ものがたる"), Term("性能", "せいのう"), Term("過剰", "かじょう"), Term("対立", "たいりつ"), Term("削る", "けずる"), Term("謙虚", "けんきょ"), Term("日時", "にちじ"), Term("公表", "こうひょう"), Term("応用", "おうよう"), Term("過半数", "かはんすう"), Term("真っ暗", "まっくら"), Term("売れ行き", "うれゆき"), Term("窓口", "まどぐち"), Term("筆者", "ひっしゃ"), Term("採点", "さいてん"), Term("作者", "さくしゃ"), Term("隔てる", "へだてる"), Term("日陰", "ひかげ"), Term("夕日", "ゆうひ"), Term("寿命", "じゅみょう"), Term("綱", "つな"), Term("近々", "ちかぢか"), Term("一段", "いちだん"), Term("看病", "かんびょう"), Term("出迎え", "でむかえ"), Term("心身", "しんしん"), Term("理科", "りか"), Term("両側", "りょうがわ"), Term("真っ先", "まっさき"), Term("来日", "らいにち"), Term("整備", "せいび"), Term("兵隊", "へいたい"), Term("破片", "はへん"), Term("原料", "げんりょう"), Term("体制", "たいせい"), Term("講師", "こうし"), Term("削除", "さくじょ"), Term("公衆", "こうしゅう"), Term("就任", "しゅうにん"), Term("功績", "こうせき"), Term("混合", "こんごう"), Term("開会", "かいかい"), Term("書留", "かきとめ"), Term("膨大", "ぼうだい"), Term("移転", "いてん"), Term("膨らます", "ふくらます"), Term("臨時", "りんじ"), Term("実例", "じつれい"), Term("民間", "みんかん"), Term("直前", "ちょくぜん"), Term("重量", "じゅうりょう"), Term("循環", "じゅんかん"), Term("危うい", "あやうい"), Term("夜間", "やかん"), Term("規律", "きりつ"), Term("起床", "きしょう"), Term("用語", "ようご"), Term("問い合わせ", "といあわせ"), Term("強引", "ごういん"), Term("創作", "そうさく"), Term("有料", "ゆうりょう"), Term("書籍", "しょせき"), Term("成立", "せいりつ"), Term("盗難", "とうなん"), Term("地帯", "ちたい"), Term("碁", "ご"), Term("交通機関", "こうつうきかん"), Term("真っ白", "まっしろ"), Term("工事", "こうじ"), Term("当日", "とうじつ"), Term("先端", "せんたん"), Term("重点", "じゅうてん"), Term("雑音", "ざつおん"), Term("児童", "じどう"), Term("学級", "がっきゅう"), Term("夕刊", "ゆうかん"), Term("対照", "たいしょう"), Term("響き", "ひびき"), Term("意義", "いぎ"), Term("休業", "きゅうぎょう"), Term("深まる", "ふかまる"), Term("冷凍", "れいとう"), Term("区域", "くいき"), Term("方面", "ほうめん"), Term("植木", "うえき"), Term("外部", "がいぶ"), Term("薄暗い", "うすぐらい"), Term("寸法", "すんぽう"), Term("貸家", "かしや"), Term("警備", "けいび"), Term("開放", "かいほう"), Term("斜め", "ななめ"), Term("月末", "げつまつ"), Term("容器", "ようき"), Term("限度", "げんど"), Term("文脈", "ぶんみゃく"), Term("逆さ", "さかさ"), Term("加速", "かそく"), Term("家主", "やぬし"), Term("高級", "こうきゅう"), Term("回数", "かいすう"), Term("快晴", "かいせい"), Term("改造", "かいぞう"), Term("子孫", "しそん"), Term("持参", "じさん"), Term("出入り", "でいり"), Term("実感", "じっかん"), Term("実用", "じつよう"), Term("活字", "かつじ"), Term("主役", "しゅやく"), Term("付近", "ふきん"), Term("再三", "さいさん"), Term("力強い", "ちからづよい"), Term("鉄砲", "てっぽう"), Term("順序", "じゅんじょ"), Term("定期券", "ていきけん"), Term("案外", "あんがい"), Term("以後", "いご"), Term("鉢", "はち"), Term("育児", "いくじ"), Term("架空", "かくう"), Term("水曜", "すいよう"), Term("長女", "ちょうじょ"), Term("成分", "せいぶん"), Term("正面", "しょうめん"), Term("屋外", "おくがい"), Term("青少年", "せいしょうねん"), Term("全集", "ぜんしゅう"), Term("能率", "のうりつ"), Term("欄", "らん"), Term("出勤", "しゅっきん"), Term("感想", "かんそう"), Term("片道", "かたみち"), Term("校庭", "こうてい"), Term("何しろ", "なにしろ"), Term("課税", "かぜい"), Term("写る", "うつる"), Term("絵の具", "えのぐ"), Term("閉会", "へいかい"), Term("実績", "じっせき"), Term("物置", "ものおき"), Term("終点", "しゅうてん"), Term("鈴", "すず"), Term("免税", "めんぜい"), Term("芯", "しん"), Term("評論", "ひょうろん"), Term("粒", "つぶ"), Term("汁", "しる"), Term("原始", "げんし"), Term("募集", "ぼしゅう"), Term("上級", "じょうきゅう"), Term("当番", "とうばん"), Term("人命", "じんめい"), Term("驚かす", "おどろかす"), Term("制作", "せいさく"), Term("不規則", "ふきそく"), Term("研修", "けんしゅう"), Term("美容", "びよう"), Term("的確", "てきかく"), Term("題名", "だいめい"), Term("地名", "ちめい"), Term("下車", "げしゃ"), Term("超過", "ちょうか"), Term("重体", "じゅうたい"), Term("定員", "ていいん"), Term("効力", "こうりょく"), Term("各自", "かくじ"), Term("売店", "ばいてん"), Term("酸性", "さんせい"), Term("外科", "げか"), Term("氏名", "しめい"), Term("私立", "しりつ"), Term("脂", "あぶら"), Term("発想", "はっそう"), Term("区分", "くぶん"), Term("開通", "かいつう"), Term("別々", "べつべつ"), Term("執筆", "しっぴつ"), Term("都心", "としん"), Term("感激", "かんげき"), Term("巡査", "じゅんさ"), Term("暴れる", "あばれる"), Term("肯定", "こうてい"), Term("断水", "だんすい"), Term("断定", "だんてい"), Term("苦心", "くしん"), Term("飾り", "かざり"), Term("強気", "つよき"), Term("東西", "とうざい"), Term("寝台", "しんだい"), Term("清掃", "せいそう"), Term("生年月日", "せいねんがっぴ"), Term("乗車", "じょうしゃ"), Term("酒場", "さかば"), Term("続々", "ぞくぞく"), Term("系統", "けいとう"), Term("薬品", "やくひん"), Term("体系", "たいけい"), Term("実習", "じっしゅう"), Term("盆地", "ぼんち"), Term("下旬", "げじゅん"), Term("地質", "ちしつ"), Term("下水", "げすい"), Term("中旬", "ちゅうじゅん"), Term("中途", "ちゅうと"), Term("直通", "ちょくつう"), Term("公務", "こうむ"), Term("本部", "ほんぶ"), Term("定価", "ていか"), Term("課程", "かてい"), Term("解説", "かいせつ"), Term("催し", "もよおし"), Term("境界", "きょうかい"), Term("街角", "まちかど"), Term("殻", "から"), Term("日課", "にっか"), Term("学術", "がくじゅつ"), Term("学力", "がくりょく"), Term("坊さん", "ぼうさん"), Term("分量", "ぶんりょう"), Term("年度", "ねんど"), Term("書道", "しょどう"), Term("助教授", "じょきょうじゅ"), Term("勝敗", "しょうはい"), Term("賞品", "しょうひん"), Term("客席", "きゃくせき"), Term("上旬", "じょうじゅん"), Term("南北", "なんぼく"), Term("食塩", "しょくえん"), Term("金魚", "きんぎょ"), Term("製作", "せいさく"), Term("有無", "うむ"), Term("内科", "ないか"), Term("送料", "そうりょう"), Term("並木", "なみき"), Term("国立", "こくりつ"), Term("物指", "ものさし"), Term("加熱", "かねつ"), Term("攻める", "せめる"), Term("灯油", "とうゆ"), Term("要旨", "ようし"), Term("高等", "こうとう"), Term("安易", "あんい"), Term("消耗", "しょうもう"), Term("生長", "せいちょう"), Term("盆", "ぼん"), Term("紺", "こん"), Term("拡充", "かくじゅう"), Term("格別", "かくべつ"), Term("余所", "よそ"), Term("話しかける", "はなしかける"), Term("巡る", "めぐる"), Term("騙す", "だます"), Term("付き合う", "つきあう"), Term("落ち着く", "おちつく"), Term("振る舞う", "ふるまう"), Term("当てはまる", "あてはまる"), Term("浮かぶ", "うかぶ"), Term("思い付く", "おもいつく"), Term("矢っ張り", "やっぱり"), Term("目印", "めじるし"), Term("為す", "なす"), Term("引き受ける", "ひきうける"), Term("捕らえる", "とらえる"), Term("追いかける", "おいかける"), Term("替わる", "かわる"), Term("溢れる", "あふれる"), Term("零れる", "こぼれる"), Term("零す", "こぼす"), Term("漸く", "ようやく"), Term("恵まれる", "めぐまれる"), Term("取り出す", "とりだす"), Term("誓う", "ちかう"), Term("飛び込む", "とびこむ"), Term("酸っぱい", "すっぱい"), Term("蝋燭", "ろうそく"), Term("蓄える", "たくわえる"), Term("立ち止まる", "たちどまる"), Term("掘る", "ほる"), Term("係わる", "かかわる"), Term("却って", "かえって"), Term("例える", "たとえる"), Term("嫌がる", "いやがる"), Term("寄越す", "よこす"), Term("生える", "はえる"), Term("躊躇う", "ためらう"), Term("妨げる", "さまたげる"), Term("点く", "つく"), Term("拭く", "ふく"), Term("繋がる", "つながる"), Term("怠る", "おこたる"), Term("目立つ", "めだつ"), Term("纏める", "まとめる"), Term("儲ける", "もうける"), Term("流行る", "はやる"), Term("羨ましい", "うらやましい"), Term("蹴る", "ける"), Term("有難い", "ありがたい"), Term("助かる", "たすかる"), Term("騒がしい", "さわがしい"), Term("溶ける", "とける"), Term("銘々", "めいめい"), Term("訳す", "やくす"), Term("憎む", "にくむ"), Term("大して", "たいして"), Term("大層", "たいそう"), Term("幾分", "いくぶん"), Term("味わう", "あじわう"), Term("殖やす", "ふやす"), Term("絶えず", "たえず"), Term("存じる", "ぞんじる"), Term("温める", "あたためる"), Term("惨め", "みじめ"), Term("一休み", "ひとやすみ"), Term("怪しい", "あやしい"), Term("溜まる", "たまる"), Term("遡る", "さかのぼる"), Term("是非とも", "ぜひとも"), Term("泊める", "とめる"), Term("足る", "たる"), Term("鳴らす", "ならす"), Term("塞ぐ", "ふさぐ"), Term("掻く", "かく"), Term("平気", "へいき"), Term("独りでに", "ひとりでに"), Term("折角", "せっかく"), Term("物凄い", "ものすごい"), Term("比較的", "ひかくてき"), Term("塞がる", "ふさがる"), Term("喧しい", "やかましい"), Term("引っ掛かる", "ひっかかる"), Term("空っぽ", "からっぽ"), Term("混ぜる", "まぜる"), Term("遠足", "えんそく"), Term("見下ろす", "みおろす"), Term("偉い", "えらい"), Term("大人しい", "おとなしい"), Term("憧れる", "あこがれる"), Term("巻く", "まく"), Term("醜い", "みにくい"), Term("忽ち", "たち"), Term("照らす", "てらす"), Term("詫びる", "わびる"), Term("覗く", "のぞく"), Term("兎も角", "ともかく"), Term("剃る", "そる"), Term("突く", "つく"), Term("燃やす", "もやす"), Term("裏返す", "うらがえす"), Term("囁く", "ささやく"), Term("思いがけない", "おもいがけない"), Term("厚かましい", "あつかましい"), Term("突っ込む", "つっこむ"), Term("撒く", "まく"), Term("崩す", "くずす"), Term("鈍い", "にぶい"), Term("怒鳴る", "どなる"), Term("揃える", "そろえる"), Term("組み立てる", "くみたてる"), Term("敷く", "しく"), Term("恋しい", "こいしい"), Term("縫う", "ぬう"), Term("独り言", "ひとりごと"), Term("甘やかす", "あまやかす"), Term("嗅ぐ", "かぐ"), Term("意地悪", "いじわる"), Term("擦る", "こする"), Term("真っ青", "まっさお"), Term("曲げる", "まげる"), Term("水平線", "すいへいせん"), Term("映る", "うつる"), Term("傾く", "かたむく"), Term("編む", "あむ"), Term("済まない", "すまない"), Term("躓く", "つまずく"), Term("補う", "おぎなう"), Term("近づける", "ちかづける"), Term("図々しい", "ずうずうしい"), Term("含める", "ふくめる"), Term("生意気", "なまいき"), Term("爽やか", "さわやか"), Term("砕ける", "くだける"), Term("散らかる", "ちらかる"), Term("捕る", "とる"), Term("だらし無い", "だらしない"), Term("承る", "うけたまわる"), Term("返る", "かえる"), Term("蒸し暑い", "むしあつい"), Term("早速", "さっそく"), Term("敬う", "うやまう"), Term("焦げる", "こげる"), Term("嵌める", "はめる"), Term("固まる", "かたまる"), Term("這う", "はう"), Term("改めて", "あらためて"), Term("必需品", "ひつじゅひん"), Term("目覚まし", "めざまし"), Term("浮く", "うく"), Term("下らない", "くだらない"), Term("目茶苦茶", "めちゃくちゃ"), Term("近寄る", "ちかよる"), Term("青白い", "あおじろい"), Term("出来上がる", "できあがる"), Term("背負う", "せおう"), Term("欠伸", "あくび"), Term("妥当", "だとう"), Term("言い出す", "いいだす"), Term("険しい", "けわしい"), Term("転がる", "ころがる"), Term("仮定", "かてい"), Term("何分", "なにぶん"), Term("お早う", "おはよう"), Term("引き返す", "ひきかえす"), Term("行き成り", "いきなり"), Term("各地", "かくち"), Term("姪", "めい"), Term("儲かる", "もうかる"), Term("裂く", "さく"), Term("睨む", "にらむ"), Term("先ほど", "さきほど"), Term("重なる", "かさなる"), Term("呉れ呉れも", "くれぐれも"), Term("照る", "てる"), Term("畳む", "たたむ"), Term("恐縮", "きょうしゅく"), Term("教わる", "おそわる"), Term("澄む", "すむ"), Term("宛名", "あてな"), Term("痒い", "かゆい"), Term("但し", "ただし"), Term("跳ねる", "はねる"), Term("逃がす", "にがす"), Term("落第", "らくだい"), Term("静まる", "しずまる"), Term("湿る", "しめる"), Term("災難", "さいなん"), Term("揃う", "そろう"), Term("羊毛", "ようもう"), Term("脱線", "だっせん"), Term("実る", "みのる"), Term("溜める", "ためる"), Term("乾かす", "かわかす"), Term("受け持つ", "うけもつ"), Term("何となく", "なんとなく"), Term("目眩", "めまい"), Term("威張る", "いばる"), Term("元々", "もともと"), Term("お休み", "おやすみ"), Term("溶け込む", "とけこむ"), Term("ご無沙汰", "ごぶさた"), Term("いつの間にか", "いつのまにか"), Term("謎々", "なぞなぞ"), Term("耕す", "たがやす"), Term("通用", "つうよう"), Term("打ち合わせ", "うちあわせ"), Term("担ぐ", "かつぐ"), Term("思い込む", "おもいこむ"), Term("目上", "めうえ"), Term("愈々", "いよいよ"), Term("惜しい", "おしい"), Term("若しかしたら", "もしかしたら"), Term("掃く", "はく"), Term("騒々しい", "そうぞうしい"), Term("ため息", "ためいき"), Term("信ずる", "しんずる"), Term("真似る", "まねる"), Term("下品", "げひん"), Term("引力", "いんりょく"), Term("速達", "そくたつ"), Term("塩辛い", "しおからい"), Term("出鱈目", "でたらめ"), Term("更ける", "ふける"), Term("熱する", "ねっする"), Term("交ざる", "まざる"), Term("護謨", "ゴム"), Term("巫山戯る", "ふざける"), Term("重たい", "おもたい"), Term("溶かす", "とかす"), Term("整う", "ととのう"), Term("因る", "よる"), Term("濡らす", "ぬらす"), Term("探る", "さぐる"), Term("短所", "たんしょ"), Term("着せる", "きせる"), Term("戸棚", "とだな"), Term("広める", "ひろめる"), Term("御洒落", "おしゃれ"), Term("纏まる", "まとまる"), Term("散らかす", "ちらかす"), Term("茂る", "しげる"), Term("取り入れる", "とりいれる"), Term("縮む", "ちぢむ"), Term("末っ子", "すえっこ"), Term("汲む", "くむ"), Term("当てはめる", "あてはめる"), Term("針金", "はりがね"), Term("酔っ払い", "よっぱらい"), Term("偶数", "ぐうすう"), Term("凍える", "こごえる"), Term("見っともない", "みっともない"), Term("糊", "のり"), Term("売り切れ", "うりきれ"), Term("釣り合う", "つりあう"), Term("湧く", "わく"), Term("煮える", "にえる"), Term("売り切れる", "うりきれる"), Term("剥く", "むく"), Term("被せる", "かぶせる"), Term("錆びる", "さびる"), Term("始終", "しじゅう"), Term("毎度", "まいど"), Term("治める", "おさめる"), Term("夕立", "ゆうだち"), Term("流石", "さすが"), Term("眩しい", "まぶしい"), Term("拵える", "こしらえる"), Term("瞼", "まぶた"), Term("凸凹", "でこぼこ"), Term("荒い", "あらい"), Term("帰す", "かえす"), Term("お手伝いさん", "おてつだいさん"), Term("引っ込む", "ひっこむ"), Term("剥がす", "はがす"), Term("所々", "ところどころ"), Term("大ざっぱ", "おおざっぱ"), Term("濁る", "にごる"), Term("彫る", "ほる"), Term("交差", "こうさ"), Term("吊るす", "つるす"), Term("好き嫌い", "すききらい"), Term("特売", "とくばい"), Term("突き当たる", "つきあたる"), Term("散る", "ちる"), Term("片付く", "かたづく"), Term("命ずる", "めいずる"), Term("面倒くさい", "めんどくさい"), Term("目出度い", "めでたい"), Term("若々しい", "わかわかしい"), Term("道順", "みちじゅん"), Term("萎む", "しぼむ"), Term("熟語", "じゅくご"), Term("長引く", "ながびく"), Term("清書", "せいしょ"), Term("お八つ", "おやつ"), Term("悔しい", "くやしい"), Term("好き好き", "すきずき"), Term("炊く", "たく"), Term("衣食住", "いしょくじゅう"), Term("諄い", "くどい"), Term("焚く", "たく"), Term("等分", "とうぶん"), Term("人通り", "ひとどおり"), Term("月日", "つきひ"), Term("待ち合わせる", "まちあわせる"), Term("謙遜", "けんそん"), Term("不潔", "ふけつ"), Term("追い越す", "おいこす"), Term("採る", "とる"), Term("鉄橋", "てっきょう"), Term("転がす", "ころがす"), Term("日の入り", "ひのいり"), Term("催促", "さいそく"), Term("砕く", "くだく"), Term("散らす", "ちらす"), Term("感ずる", "かんずる"), Term("勇ましい", "いさましい"), Term("射す", "さす"), Term("四角", "しかく"), Term("略す", "りゃくす"), Term("注す", "さす"), Term("慌ただしい", "あわただしい"), Term("ちり紙", "ちりがみ"), Term("扇ぐ", "あおぐ"), Term("若しかすると", "もしかすると"), Term("払い戻す", "はらいもどす"), Term("人造", "じんぞう"), Term("勘違い", "かんちがい"), Term("休講", "きゅうこう"), Term("清い", "きよい"), Term("生ずる", "しょうずる"), Term("祭日", "さいじつ"), Term("欲張り", "よくばり"), Term("下書き", "したがき"), Term("跨ぐ", "またぐ"), Term("着替え", "きがえ"), Term("幼稚", "ようち"), Term("著す", "あらわす"), Term("定休日", "ていきゅうび"), Term("偏る", "かたよる"), Term("伝染", "でんせん"), Term("引き算", "ひきざん"), Term("お参り", "おまいり"), Term("物騒", "ぶっそう"), Term("腰掛け", "こしかけ"), Term("祭る", "まつる"), Term("瓶詰め", "びんづめ"), Term("払い込む", "はらいこむ"), Term("便箋", "びんせん"), Term("無地", "むじ"), Term("紙屑", "かみくず"), Term("縞", "しま"), Term("頼もしい", "たのもしい"), Term("椀", "わん"), Term("畏まりました", "かしこまりました"), Term("揉む", "もむ"), Term("悠々", "ゆうゆう"), Term("饂飩", "うどん"), Term("縮れる", "ちぢれる"), Term("小便", "しょうべん"), Term("吃逆", "しゃっくり"), Term("純情", "じゅんじょう"), Term("匙", "さじ"), Term("入れ物", "いれもの"), Term("掛け算", "かけざん"), Term("区切る", "くぎる"), Term("差し支え", "さしつかえ"), Term("甚だしい", "はなはだしい"), Term("ご苦労さま", "ごくろうさま"), Term("倣う", "ならう"), Term("匂う", "におう"), Term("俄", "にわか"), Term("一まず", "ひとまず"), Term("炊事", "すいじ"), Term("坊ちゃん", "ぼっちゃん"), Term("図表", "ずひょう"), Term("水滴", "すいてき"), Term("雨戸", "あまど"), Term("占う", "うらなう"), Term("湯のみ", "ゆのみ"), Term("送別", "そうべつ"), Term("損得", "そんとく"), Term("卸す", "おろす"), Term("馬鹿らしい", "ばからしい"), Term("中性", "ちゅうせい"), Term("湯気", "ゆげ"), Term("回数券", "かいすうけん"), Term("拝む", "おがむ"), Term("番地", "ばんち"), Term("卑怯", "ひきょう"), Term("刷る", "する"), Term("雑巾", "ぞうきん"), Term("四角い", "しかくい"), Term("お願いします", "おねがいします"), Term("御覧", "ごらん"), Term("見かけ", "みかけ"), Term("女の人", "おんなのひと"), Term("仕様が無い", "しょうがない"), Term("引っ繰り返る", "ひっくりかえる"), Term("やむを得ない", "やむをえない"), Term("思い切り", "おもいっきり"), Term("従姉妹", "いとこ"), Term("田んぼ", "たんぼ"), Term("広々", "ひろびろ"), Term("行ってらっしゃい", "いってらっしゃい"), Term("憎い", "にくい"), Term("話し中", "はなしちゅう"), Term("悔やむ", "くやむ"), Term("仕上がる", "しあがる"), Term("坊や", "ぼうや"), Term("請う", "こう"), Term("焦がす", "こがす"), Term("挟まる", "はさまる"), Term("特長", "とくちょう"), Term("飽くまで", "あくまで"), Term("逆様", "さかさま"), Term("齧る", "かじる"), Term("言いつける", "いいつける"), Term("通り掛かる", "とおりかかる"), Term("御数", "おかず"), Term("バランス", "バランス"), Term("ウール", "ウール"), Term("ダム", "ダム"), Term("鋸", "のこぎり"), Term("パターン", "パターン"), Term("ブローチ", "ブローチ"), Term("赤道", "せきどう"), Term("爪", "つめ"), Term("平野", "へいや"), Term("小指", "こゆび"), Term("下線", "かせん"), Term("琴", "こと"), Term("墨", "すみ"), Term("その他", "そのほか"), Term("お辞儀", "おじぎ"), Term("バケツ", "バケツ"), Term("ブラウス", "ブラウス"), Term("モデル", "モデル"), Term("ステージ", "ステージ"), Term("ハンドル", "ハンドル"), Term("ピンク", "ピンク"), Term("蓋", "ふた"), Term("マラソン", "マラソン"), Term("リボン", "リボン"), Term("ダイヤモンド", "ダイヤモンド"), Term("ブラシ", "ブラシ"), Term("ネックレス", "ネックレス"), Term("ヘリコプター", "ヘリコプター"), Term("センチ", "センチ"), Term("マンション", "マンション"), Term("レインコート", "レインコート"), Term("プラットホーム", "プラットホーム"), Term("プログラム", "プログラム"), Term("ジャーナリスト", "ジャーナリスト"), Term("アクセント", "アクセント"), Term("カバー", "カバー"), Term("スタート", "スタート"), Term("チョーク", "チョーク"), Term("オーケストラ", "オーケストラ"), Term("ボーナス", "ボーナス"), Term("コンクリート", "コンクリート"), Term("セメント", "セメント"), Term("サラリーマン", "サラリーマン"), Term("インタビュー", "インタビュー"), Term("ダイヤル", "ダイヤル"), Term("テーマ", "テーマ"), Term("シーツ", "シーツ"), Term("ビタミン", "ビタミン"), Term("ポスター", "ポスター"), Term("リズム", "リズム"), Term("カロリー", "カロリー"), Term("サイレン", "サイレン"), Term("ロッカー", "ロッカー"), Term("ナイロン", "ナイロン"), Term("キャンパス", "キャンパス"), Term("ファスナー", "ファスナー"), Term("フライパン", "フライパン"), Term("コンクール", "コンクール"), Term("リットル", "リットル"), Term("レジャー", "レジャー"), Term("レンズ", "レンズ"), Term("アンテナ", "アンテナ"), Term("ストップ", "ストップ"), Term("スピーカー", "スピーカー"), Term("スライド", "スライド"), Term("マスク", "マスク"), Term("テンポ", "テンポ"), Term("オルガン", "オルガン"), Term("ミシン", "ミシン"), Term("ミリ", "ミリ"), Term("シリーズ", "シリーズ"), Term("スマート", "スマート"), Term("扇子", "せんす"), Term("チップ", "チップ"), Term("サンプル", "サンプル"), Term("バンド", "バンド"), Term("ギャング", "ギャング"), Term("ストッキング", "ストッキング"), Term("コレクション", "コレクション"), Term("イコール", "イコール"), Term("コーラス", "コーラス"), Term("エプロン", "エプロン"), Term("歌留多", "かるた"), Term("コース", "コース"), Term("大凡", "おおよそ"), Term("目下", "めした"), Term("沁み沁み", "しみじみ"), Term("脅かす", "おどかす"), Term("羨む", "うらやむ"), Term("大木", "たいぼく"), Term("ひっくり返す", "ひっくりかえす"), Term("日日", "ひにち"), Term("お出掛け", "おでかけ"), Term("白髪", "しらが"), Term("すれ違う", "すれちがう"), Term("お先に", "おさきに"), Term("父母", "ふぼ"), Term("関東", "かんとう"), Term("万歳", "ばんざい"), Term("お目出度い", "おめでたい"), Term("破く", "やぶく"), Term("炙る", "あぶる"), Term("放る", "ほうる"), Term("順々", "じゅんじゅん"), Term("茶色い", "ちゃい"), Term("通ずる", "つうずる"), Term("傾らか", "なだらか"), Term("此間", "こないだ"), Term("じゃん拳", "じゃんけん"), Term("点々", "てんてん"), Term("繋げる", "つなげる"), Term("挿す", "さす"), Term("通帳", "つうちょう"), Term("工芸", "こうげい"), Term("民謡", "みんよう"), Term("私鉄", "してつ"), Term("領事", "りょうじ"), Term("列島", "れっとう"), Term("床の間", "とこのま"), Term("消毒", "しょうどく"), Term("踏切", "ふみきり"), Term("曲線", "きょくせん"), Term("地下水", "ちかすい"), Term("半径", "はんけい"), Term("文芸", "ぶんげい"), Term("造船", "ぞうせん"), Term("見出し", "みだし"), Term("団地", "だんち"), Term("調味料", "ちょうみりょう"), Term("合同", "ごうどう"), Term("濃度", "のうど"), Term("換気", "かんき"), Term("気を付ける", "きをつける"), Term("揶揄う", "からかう"), Term("その上", "そのうえ"), Term("アイデア", "アイデア"), Term("左様なら", "さようなら"), Term("点ける", "つける"), Term("打つかる", "ぶつかる"), Term("そっと", "そっと"), Term("打付ける", "ぶつける"), Term("火傷", "やけど"), Term("スケジュール", "スケジュール"), Term("うっかり", "うっかり"), Term("彼此", "あれこれ"), Term("くっ付く", "くっつく"), Term("ドキドキ", "ドキドキ"), Term("ぶつぶつ", "ぶつぶつ"), Term("プラスチック", "プラスチック"), Term("しつこい", "しつこい"), Term("こっそり", "こっそり"), Term("メニュー", "メニュー"), Term("汚す", "よごす"), Term("逸れる", "それる"), Term("痺れる", "しびれる"), Term("ニコニコ", "ニコニコ"), Term("どうせ", "どうせ"), Term("呆れる", "あきれる"), Term("退く", "どく"), Term("レベル", "レベル"), Term("バック", "バック"), Term("まあまあ", "まあまあ"), Term("ピストル", "ピストル"), Term("クリーニング", "クリーニング"), Term("退ける", "のける"), Term("すっきり", "すっきり"), Term("ラッシュアワー", "ラッシュアワー"), Term("ランチ", "ランチ"), Term("カーブ", "カーブ"), Term("コック", "コック"), Term("スチュワーデス", "スチュワーデス"), Term("シーズン", "シーズン"), Term("疾っくに", "とっくに"), Term("凭れる", "もたれる"), Term("メーター", "メーター"), Term("モーター", "モーター"), Term("嚏", "くしゃみ"), Term("ロビー", "ロビー"), Term("クーラー", "クーラー"), Term("日当たり", "ひあたり"), Term("ダブル", "ダブル"), Term("マイナス", "マイナス"), Term("カラー", "カラー"), Term("潰れる", "つぶれる"), Term("船便", "ふなびん"), Term("ぴかぴか", "ぴかぴか"), Term("滑らす", "ずらす"), Term("トレーニング", "トレーニング"), Term("狡い", "ずるい"), Term("草臥れる", "くたびれる"), Term("シャッター", "シャッター"), Term("パンツ", "パンツ"), Term("捻る", "ひねる"), Term("秤", "はかり"), Term("ベテラン", "ベテラン"), Term("モダン", "モダン"), Term("レクリエーション", "レクリエーション"), Term("ぎっしり", "ぎっしり"), Term("くっ付ける", "くっつける"), Term("マフラー", "マフラー"), Term("お陰様で", "おかげさまで"), Term("プリント", "プリント"), Term("冷ます", "さます"), Term("めっきり", "めっきり"), Term("ワンピース", "ワンピース"), Term("そそっかしい", "そそっかしい"), Term("洒落", "しゃれ"), Term("うろうろ", "うろうろ"), Term("カセット", "カセット"), Term("エチケット", "エチケット"), Term("フワフワ", "フワフワ"), Term("のろのろ", "のろのろ"), Term("コンセント", "コンセント"), Term("ランニング", "ランニング"), Term("しゃがむ", "しゃがむ"), Term("スクール", "スクール"), Term("ナンバー", "ナンバー"), Term("発条", "ばね"), Term("初めに", "はじめに"), Term("一通り", "ひととおり"), Term("目次", "もくじ"), Term("小数", "しょうすう"), Term("振り仮名", "ふりがな"), Term("整数", "せいすう"), Term("緯度", "いど"), Term("五十音", "ごじゅうおん"), Term("襖", "ふすま"), Term("草履", "ぞうり"), Term("送り仮名", "おくりがな"), Term("剃刀", "かみそり"), Term("三日月", "みかづき"), Term("符号", "ふごう"), Term("分数", "ぶんすう"), Term("平仮名", "ひらがな"), Term("片仮名", "かたかな"), Term("方程式", "ほうていしき"), Term("牧畜", "ぼくちく"), Term("どっと", "どっと"), Term("えっと", "えっと"), Term("せっせと", "せっせと"), Term("ウェイトレス", "ウェイトレス"), Term("そう言えば", "そういえば"), Term("捩る", "ねじる"), Term("お大事に", "おだいじに"), Term("ずらり", "ずらり"), Term("楕円", "だえん"), Term("スカーフ", "スカーフ"), Term("テニスコート", "テニスコート"), Term("オイル", "オイル"), Term("ガム", "ガム"), Term("ショップ", "ショップ"), Term("見慣れる", "みなれる"), Term("煎る", "いる"), Term("足袋", "たび"), Term("直流", "ちょくりゅう"), Term("加速度", "かそくど"), Term("同格", "どうかく"), Term("部首", "ぶしゅ"), Term("やっ付ける", "やっつける"), Term("咥える", "くわえる"), Term("目安", "めやす"), Term("県庁", "けんちょう"), Term("バイバイ", "バイバイ"), Term("発揮", "はっき"), Term("余る", "あまる"), Term("呼びかける", "よびかける"), Term("自衛", "じえい"), Term("問答", "もんどう"), Term("友好", "ゆうこう"), Term("抽象", "ちゅうしょう"), Term("間接", "かんせつ"), Term("初旬", "しょじゅん"), Term("短編", "たんぺん"), Term("歌謡", "かよう"), Term("三角", "さんかく"), Term("一斉", "いっせい"), Term("水産", "すいさん"), Term("図形", "ずけい"), Term("集金", "しゅうきん"), Term("合理", "ごうり"), Term("英和", "えいわ"), Term("下降", "かこう"), Term("芸能", "げいのう"), Term("増減", "ぞうげん"), Term("応接", "おうせつ"), Term("原産", "げんさん"), Term("全般", "ぜんぱん"), Term("現に", "げんに"), Term("個体", "こたい"), Term("地盤", "じばん"), Term("貯蔵", "ちょぞう"), Term("盛る", "もる"), Term("出来上がり", "できあがり"), Term("長短", "ちょうたん"), Term("投書", "とうしょ"), Term("差し引き", "さしひき"), Term("丼", "どんぶり"), Term("田植え", "たうえ"), Term("工員", "こういん"), Term("広さ", "ひろさ"), Term("高層", "こうそう"), Term("座敷", "ざしき"), Term("山林", "さんりん"), Term("産地", "さんち"), Term("目指す", "めざす"), Term("潰す", "つぶす"), Term("響く", "ひびく"), Term("慰める", "なぐさめる"), Term("緩い", "ゆるい"), Term("載る", "のる"), Term("吊る", "つる"), Term("渇く", "かわく"), Term("凹む", "へこむ"), Term("自習", "じしゅう"), Term("写生", "しゃせい"), Term("ぶら下げる", "ぶらさげる"), Term("溶く", "とく"), Term("漢和", "かんわ"), Term("算盤", "そろばん"), Term("手拭い", "てぬぐい"), Term("寝巻き", "ねまき"), Term("割り算", "わりざん"), Term("打ち消す", "うちけす"), Term("応ずる", "おうずる"), Term("割合に", "わりあいに"), Term("判子", "はんこ"), Term("蒔く", "まく"), Term("心当たり", "こころあたり"), Term("円周", "えんしゅう"), Term("粗筋", "あらすじ"), Term("透き通る", "すきとおる"), Term("縮める", "ちぢめる"), Term("論ずる", "ろんずる"), Term("煙い", "けむい"), Term("落とし物", "おとしもの"), Term("涼む", "すずむ"), Term("単数", "たんすう"), Term("四つ角", "よつかど"), Term("ご馳走さま", "ごちそうさま"), Term("御中", "おんちゅう"), Term("張り切る", "はりきる"), Term("放れる", "はなれる"), Term("句読点", "くとうてん"), Term("領収", "りょうしゅう"), Term("薄める", "うすめる"), Term("作製", "さくせい"), Term("概論", "がいろん"), Term("割りと", "わりと"), Term("斬る", "きる"), Term("正味", "しょうみ"), Term("習字", "しゅうじ"), Term("針路", "しんろ"), Term("養分", "ようぶん"), Term("専制", "せんせい"), Term("夜行", "やこう"), Term("速力", "そくりょく"), Term("何々", "なになに"), Term("激増", "げきぞう"), Term("耕地", "こうち"), Term("明明後日", "しあさって"), Term("斯うして", "こうして"), Term("潜る", "もぐる"), Term("うんと", "うんと"), Term("お気の毒に", "おきのどくに"), Term("襤褸", "ぼろ"), Term("初めまして", "はじめまして"), Term("しゃぶる", "しゃぶる"), Term("しーん", "しーん"), Term("お待たせしました", "おまたせしました"), Term("その為", "そのため"), Term("こちらこそ", "こちらこそ"), Term("はきはき", "はきはき"), Term("釜", "かま"), Term("寒帯", "かんたい"), Term("述語", "じゅつご"), Term("蒸す", "むす"), Term("形容動詞", "けいようどうし"), Term("火口", "かこう"), Term("伯父さん", "おじさん"), Term("ペンチ", "ペンチ"), Term("ローマ字", "ローマじ"), Term("フリー", "フリー"), Term("モノレール", "モノレール"), Term("ダイアグラム", "ダイアグラム"), Term("サークル", "サークル"), Term("ウーマン", "ウーマン"), Term("酌む", "くむ"), Term("碗", "わん"), Term("序", "ついで"), Term("先々月", "せんせんげつ"), Term("無沙汰", "ぶさた"), Term("攻め手", "せめて"), Term("洋品店", "ようひんてん"), Term("先先週", "せんせんしゅう"), Term("店屋", "みせや"), Term("存ずる", "ぞんずる"), Term("斜", "はす"), Term("行ってまいります", "いってまいります"), Term("お待ち遠様", "おまちどおさま"), Term("破れる", "やぶれる"), Term("ビニール", "ビニール"), Term("和英", "わえい"), Term("臍", "へそ"), Term("仮名", "かな"), Term("千切る", "ちぎる"), Term("まごまご", "まごまご"), Term("ご免ください", "ごめんください"), Term("言付ける", "ことづける"), Term("今晩は", "こんばんは"), Term("ゼミ", "ゼミ"), Term("ビルディング", "ビルディング"), Term("×", ""), Term("ローンチ", "ローンチ"), Term("一昨昨日", "いっさくさくじつ"), Term("佚", "いつ"), Term("それなのに", "それなのに"), Term("お掛け下さい", "おかけください"), Term("タイア", "タイア"), Term("その頃", "そのころ"), Term("お邪魔します", "おじゃまします"), Term("オーバコート", "オーバコート"), Term("どうぞ宜しく", "どうぞよろしく"), Term("並行", "へいこう"), Term("銅", "どう"), Term("一々", "いちいち"), Term("出入り口", "でいりぐち"), Term("付属", "ふぞく"), Term("尻尾", "しっぽ"), Term("可愛がる", "かわいがる"), Term("勿体ない", "もったいない"), Term("組み合わせ", "くみあわせ"), Term("書き取り", "かきとり"), Term("中指", "なかゆび"), Term("乾杯", "かんぱい"), Term("乾燥", "かんそう"), Term("毛皮", "けがわ"), Term("灰色", "はいいろ"), Term("倉庫", "そうこ"), Term("湿度", "しつど"), Term("観測", "かんそく"), Term("実力", "じつりょく"), Term("校舎", "こうしゃ"), Term("普及", "ふきゅう"), Term("身分", "みぶん"), Term("項目", "こうもく"), Term("段階", "だんかい"), Term("頭脳", "ずのう"), Term("活躍", "かつやく"), Term("油断", "ゆだん"), Term("先頭", "せんとう"), Term("温まる", "あたたまる"), Term("調節", "ちょうせつ"), Term("停止", "ていし"), Term("心得る", "こころえる"), Term("賞金", "しょうきん"), Term("発射", "はっしゃ"), Term("純粋", "じゅんすい"), Term("録音", "ろくおん"), Term("残らず", "のこらず"), Term("手帳", "てちょう"), Term("缶詰", "かんづめ"), Term("敷地", "しきち"), Term("基盤", "きばん"), Term("小学生", "しょうがくせい"), Term("四季", "しき"), Term("栓", "せん"), Term("日程", "にってい"), Term("在学", "ざいがく"), Term("素人", "しろうと"), Term("材木", "ざいもく"), Term("日用品", "にちようひん"), Term("中間", "ちゅうかん"), Term("岬", "みさき"), Term("貝", "かい"), Term("瞳", "ひとみ"), Term("日帰り", "ひがえり"), Term("地味", "じみ"), Term("入社", "にゅうしゃ"), Term("文献", "ぶんけん"), Term("乾電池", "かんでんち"), Term("容積", "ようせき"), Term("用途", "ようと"), Term("名作", "めいさく"), Term("締め切る", "しめきる"), Term("初級", "しょきゅう"), Term("孝行", "こうこう"), Term("仲直り", "なかなおり"), Term("申し訳ない", "もうしわけない"), Term("冷める", "さめる"), Term("至急", "しきゅう"), Term("暢気", "のんき"), Term("甦る", "よみがえる"), Term("腰掛ける", "こしかける"), Term("薬缶", "やかん"), Term("引き止める", "ひきとめる"), Term("尖る", "とがる"), Term("交じる", "まじる"), Term("着々", "ちゃくちゃく"), Term("貸間", "かしま"), Term("毛糸", "けいと"), Term("真っ黒", "まっくろ"), Term("繋がり", "つながり"), Term("客間", "きゃくま"), Term("撫でる", "なでる"), Term("朗らか", "ほがらか"), Term("突き当たり", "つきあたり"), Term("憎らしい", "にくらしい"), Term("防犯", "ぼうはん"), Term("オートメーション", "オートメーション"), Term("仮名遣い", "かなづかい"), Term("枚数", "まいすう"), Term("農村", "のうそん")}
-N1 = {Term("切り", "きり"), Term("農場", "のうじょう"), Term("惑星", "わくせい"), Term("尾", "お"), Term("矢", "や"), Term("地獄", "じごく"), Term("津波", "つなみ"), Term("皇居", "こうきょ"), Term("仏像", "ぶつぞう"), Term("流通", "りゅうつう"), Term("見合い", "みあい"), Term("海運", "かいうん"), Term("水源", "すいげん"), Term("黄金", "おうごん"), Term("嬢", "じょう"), Term("振り", "ふり"), Term("死", "し"), Term("説得", "せっとく"), Term("助言", "じょげん"), Term("理論", "りろん"), Term("怒り", "いかり"), Term("秘書", "ひしょ"), Term("紳士", "しんし"), Term("証拠", "しょうこ"), Term("選挙", "せんきょ"), Term("運命", "うんめい"), Term("世", "よ"), Term("天才", "てんさい"), Term("富", "とみ"), Term("取引", "とりひき"), Term("階", "かい"), Term("危機", "きき"), Term("勝利", "しょうり"), Term("交渉", "こうしょう"), Term("予想", "よそう"), Term("政策", "せいさく"), Term("距離", "きょり"), Term("洪水", "こうずい"), Term("幽霊", "ゆうれい"), Term("同情", "どうじょう"), Term("航海", "こうかい"), Term("破壊", "はかい"), Term("自信", "じしん"), Term("世代", "せだい"), Term("殺人", "さつじん"), Term("治療", "ちりょう"), Term("資格", "しかく"), Term("小切手", "こぎって"), Term("反応", "はんのう"), Term("制服", "せいふく"), Term("企画", "きかく"), Term("報道", "ほうどう"), Term("賃金", "ちんぎん"), Term("権力", "けんりょく"), Term("名誉", "めいよ"), Term("暴力", "ぼうりょく"), Term("貧困", "ひんこん"), Term("美", "び"), Term("保険", "ほけん"), Term("孤独", "こどく"), Term("妥協", "だきょう"), Term("聖書", "せいしょ"), Term("昆虫", "こんちゅう"), Term("向き", "むき"), Term("判決", "はんけつ"), Term("保護", "ほご"), Term("牧師", "ぼくし"), Term("規制", "きせい"), Term("倒産", "とうさん"), Term("着陸", "ちゃくりく"), Term("偏見", "へんけん"), Term("入浴", "にゅうよく"), Term("報酬", "ほうしゅう"), Term("財政", "ざいせい"), Term("証言", "しょうげん"), Term("革命", "かくめい"), Term("人民", "じんみん"), Term("動機", "どうき"), Term("祈り", "いのり"), Term("予言", "よげん"), Term("自己", "じこ"), Term("決断", "けつだん"), Term("移民", "いみん"), Term("改革", "かいかく"), Term("暴動", "ぼうどう"), Term("妊娠", "にんしん"), Term("死刑", "しけい"), Term("災害", "さいがい"), Term("実業家", "じつぎょうか"), Term("真珠", "しんじゅ"), Term("爆弾", "ばくだん"), Term("燃料", "ねんりょう"), Term("民族", "みんぞく"), Term("人格", "じんかく"), Term("権威", "けんい"), Term("承諾", "しょうだく"), Term("定義", "ていぎ"), Term("伝説", "でんせつ"), Term("網", "あみ"), Term("悪", "あく"), Term("圧力", "あつりょく"), Term("脳", "のう"), Term("植民地", "しょくみんち"), Term("品質", "ひんしつ"), Term("反乱", "はんらん"), Term("物体", "ぶったい"), Term("体力", "たいりょく"), Term("孤児", "こじ"), Term("認識", "にんしき"), Term("海峡", "かいきょう"), Term("芝", "しば"), Term("宮殿", "きゅうでん"), Term("福祉", "ふくし"), Term("火星", "かせい"), Term("文書", "ぶんしょ"), Term("探検", "たんけん"), Term("戦闘", "せんとう"), Term("柱", "はしら"), Term("預金", "よきん"), Term("正義", "せいぎ"), Term("理性", "りせい"), Term("真理", "しんり"), Term("闇", "やみ"), Term("条約", "じょうやく"), Term("出血", "しゅっけつ"), Term("職員", "しょくいん"), Term("声明", "せいめい"), Term("関税", "かんぜい"), Term("日焼け", "ひやけ"), Term("思考", "しこう"), Term("本能", "ほんのう"), Term("形態", "けいたい"), Term("尿", "にょう"), Term("憎しみ", "にくしみ"), Term("内閣", "ないかく"), Term("固定", "こてい"), Term("見積もり", "みつもり"), Term("概念", "がいねん"), Term("良心", "りょうしん"), Term("比例", "ひれい"), Term("視野", "しや"), Term("独占", "どくせん"), Term("資産", "しさん"), Term("恋愛", "れんあい"), Term("看護", "かんご"), Term("根源", "こんげん"), Term("転勤", "てんきん"), Term("負債", "ふさい"), Term("面会", "めんかい"), Term("貴族", "きぞく"), Term("権限", "けんげん"), Term("電線", "でんせん"), Term("疲労", "ひろう"), Term("乱用", "らんよう"), Term("在庫", "ざいこ"), Term("家出", "いえで"), Term("運賃", "うんちん"), Term("潮", "しお"), Term("退学", "たいがく"), Term("天国", "てんごく"), Term("与党", "よとう"), Term("肺", "はい"), Term("定年", "ていねん"), Term("山脈", "さんみゃく"), Term("腐敗", "ふはい"), Term("救済", "きゅうさい"), Term("遺跡", "いせき"), Term("扉", "とびら"), Term("捕虜", "ほりょ"), Term("得点", "とくてん"), Term("気質", "きしつ"), Term("実践", "じっせん"), Term("設定", "せってい"), Term("戦術", "せんじゅつ"), Term("喜劇", "きげき"), Term("連邦", "れんぽう"), Term("野党", "やとう"), Term("介護", "かいご"), Term("原子", "げんし"), Term("主食", "しゅしょく"), Term("分裂", "ぶんれつ"), Term("人体", "じんたい"), Term("人質", "ひとじち"), Term("模型", "もけい"), Term("細胞", "さいぼう"), Term("感染", "かんせん"), Term("主人公", "しゅじんこう"), Term("占領", "せんりょう"), Term("斜面", "しゃめん"), Term("暗殺", "あんさつ"), Term("堤防", "ていぼう"), Term("家畜", "かちく"), Term("反発", "はんぱつ"), Term("神秘", "しんぴ"), Term("政権", "せいけん"), Term("証人", "しょうにん"), Term("脂肪", "しぼう"), Term("襟", "えり"), Term("君主", "くんしゅ"), Term("無効", "むこう"), Term("同調", "どうちょう"), Term("清算", "せいさん"), Term("貨幣", "かへい"), Term("織物", "おりもの"), Term("天体", "てんたい"), Term("抑圧", "よくあつ"), Term("基金", "ききん"), Term("乱れる", "みだれる"), Term("詐欺", "さぎ"), Term("中立", "ちゅうりつ"), Term("回路", "かいろ"), Term("刃", "は"), Term("本質", "ほんしつ"), Term("前提", "ぜんてい"), Term("戯曲", "ぎきょく"), Term("墓地", "ぼち"), Term("官僚", "かんりょう"), Term("枠", "わく"), Term("視覚", "しかく"), Term("漁船", "ぎょせん"), Term("調理", "ちょうり"), Term("作戦", "さくせん"), Term("教員", "きょういん"), Term("仕様", "しよう"), Term("解除", "かいじょ"), Term("利子", "りし"), Term("照明", "しょうめい"), Term("下痢", "げり"), Term("反響", "はんきょう"), Term("均衡", "きんこう"), Term("財", "ざい"), Term("反射", "はんしゃ"), Term("麻酔", "ますい"), Term("発作", "ほっさ"), Term("街道", "かいどう"), Term("結晶", "けっしょう"), Term("僧", "そう"), Term("映像", "えいぞう"), Term("蜜", "みつ"), Term("鉛", "なまり"), Term("装飾", "そうしょく"), Term("共鳴", "きょうめい"), Term("農地", "のうち"), Term("義理", "ぎり"), Term("戸籍", "こせき"), Term("差異", "さい"), Term("化石", "かせき"), Term("迫害", "はくがい"), Term("地形", "ちけい"), Term("国土", "こくど"), Term("旅客", "りょかく"), Term("音色", "ねいろ"), Term("錯覚", "さっかく"), Term("行政", "ぎょうせい"), Term("処罰", "しょばつ"), Term("棄権", "きけん"), Term("炒める", "いためる"), Term("融資", "ゆうし"), Term("工学", "こうがく"), Term("繊維", "せんい"), Term("怪獣", "かいじゅう"), Term("合唱", "がっしょう"), Term("沼", "ぬま"), Term("窒息", "ちっそく"), Term("脚本", "きゃくほん"), Term("送金", "そうきん"), Term("修士", "しゅうし"), Term("格", "かく"), Term("共感", "きょうかん"), Term("拡散", "かくさん"), Term("封鎖", "ふうさ"), Term("岩石", "がんせき"), Term("同志", "どうし"), Term("衛生", "えいせい"), Term("軌範", "きはん"), Term("主体", "しゅたい"), Term("参議院", "さんぎいん"), Term("給食", "きゅうしょく"), Term("没収", "ぼっしゅう"), Term("溶液", "ようえき"), Term("炭素", "たんそ"), Term("手錠", "てじょう"), Term("刑罰", "けいばつ"), Term("楽譜", "がくふ"), Term("定食", "ていしょく"), Term("保守", "ほしゅ"), Term("動力", "どうりょく"), Term("執着", "しゅうちゃく"), Term("禅", "ぜん"), Term("混血", "こんけつ"), Term("品種", "ひんしゅ"), Term("結核", "けっかく"), Term("鉄棒", "てつぼう"), Term("地主", "じぬし"), Term("警部", "けいぶ"), Term("舗装", "ほそう"), Term("自我", "じが"), Term("風俗", "ふうぞく"), Term("光沢", "こうたく"), Term("燃焼", "ねんしょう"), Term("再建", "さいけん"), Term("根回し", "ねまわし"), Term("織り", "おり"), Term("星座", "せいざ"), Term("調停", "ちょうてい"), Term("粥", "かゆ"), Term("三味線", "しゃみせん"), Term("偽造", "ぎぞう"), Term("書評", "しょひょう"), Term("雪崩", "なだれ"), Term("味覚", "みかく"), Term("捕鯨", "ほげい"), Term("語源", "ごげん"), Term("居住", "きょじゅう"), Term("多数決", "たすうけつ"), Term("衆議院", "しゅうぎいん"), Term("新", "しん"), Term("無知", "むち"), Term("崖", "がけ"), Term("嫉妬", "しっと"), Term("混同", "こんどう"), Term("顎", "あご"), Term("蜂蜜", "はちみつ"), Term("蕾", "つぼみ"), Term("藁", "わら"), Term("無口", "むくち"), Term("杖", "つえ"), Term("夕焼け", "ゆうやけ"), Term("麻痺", "まひ"), Term("語彙", "ごい"), Term("現像", "げんぞう"), Term("片思い", "かたおもい"), Term("直感", "ちょっかん"), Term("逆立ち", "さかだち"), Term("貝殻", "かいがら"), Term("班", "はん"), Term("満月", "まんげつ"), Term("元素", "げんそ"), Term("模倣", "もほう"), Term("裸足", "はだし"), Term("器官", "きかん"), Term("名札", "なふだ"), Term("近視", "きんし"), Term("畜生", "ちくしょう"), Term("滴", "しずく"), Term("暗示", "あんじ"), Term("略語", "りゃくご"), Term("炬燵", "こたつ"), Term("海流", "かいりゅう"), Term("助詞", "じょし"), Term("壷", "つぼ"), Term("時刻表", "じこくひょう"), Term("刺繍", "ししゅう"), Term("香辛料", "こうしんりょう"), Term("自転", "じてん"), Term("葦", "あし"), Term("年鑑", "ねんかん"), Term("風車", "ふうしゃ"), Term("手芸", "しゅげい"), Term("絶版", "ぜっぱん"), Term("暗算", "あんざん"), Term("映写", "えいしゃ"), Term("浮力", "ふりょく"), Term("聴診器", "ちょうしんき"), Term("上司", "じょうし"), Term("手元", "てもと"), Term("一切", "いっさい"), Term("不当", "ふとう"), Term("寒気", "さむけ"), Term("開拓", "かいたく"), Term("産物", "さんぶつ"), Term("田園", "でんえん"), Term("鉱山", "こうざん"), Term("振興", "しんこう"), Term("万能", "ばんのう"), Term("無線", "むせん"), Term("市街", "しがい"), Term("円満", "えんまん"), Term("遠方", "えんぽう"), Term("花壇", "かだん"), Term("十字路", "じゅうじろ"), Term("団扇", "うちわ"), Term("丈", "たけ"), Term("何と", "なんと"), Term("俺", "おれ"), Term("助け", "たすけ"), Term("真実", "しんじつ"), Term("傍ら", "かたわら"), Term("同意", "どうい"), Term("事業", "じぎょう"), Term("勤勉", "きんべん"), Term("確信", "かくしん"), Term("本の", "ほんの"), Term("行為", "こうい"), Term("興奮", "こうふん"), Term("非難", "ひなん"), Term("倶楽部", "クラブ"), Term("受け入れる", "うけいれる"), Term("貧乏", "びんぼう"), Term("兵士", "へいし"), Term("賢明", "けんめい"), Term("申し出", "もうしで"), Term("過ぎ", "すぎ"), Term("支持", "しじ"), Term("勝る", "まさる"), Term("見込み", "みこみ"), Term("立ち寄る", "たちよる"), Term("匹", "ひき"), Term("直面", "ちょくめん"), Term("当て", "あて"), Term("癌", "がん"), Term("余地", "よち"), Term("廃止", "はいし"), Term("一部", "いちぶ"), Term("発言", "はつげん"), Term("上昇", "じょうしょう"), Term("襲う", "おそう"), Term("従業員", "じゅうぎょういん"), Term("何より", "なにより"), Term("達成", "たっせい"), Term("侮辱", "ぶじょく"), Term("誠実", "せいじつ"), Term("負う", "おう"), Term("資金", "しきん"), Term("対処", "たいしょ"), Term("指摘", "してき"), Term("曲", "きょく"), Term("保つ", "たもつ"), Term("従事", "じゅうじ"), Term("素早い", "すばやい"), Term("昇進", "しょうしん"), Term("拒否", "きょひ"), Term("提供", "ていきょう"), Term("浪費", "ろうひ"), Term("法案", "ほうあん"), Term("退職", "たいしょく"), Term("詳細", "しょうさい"), Term("真相", "しんそう"), Term("討論", "とうろん"), Term("抗議", "こうぎ"), Term("驚き", "おどろき"), Term("日々", "ひび"), Term("広まる", "ひろまる"), Term("負傷", "ふしょう"), Term("指示", "しじ"), Term("本気", "ほんき"), Term("沈黙", "ちんもく"), Term("誘惑", "ゆうわく"), Term("及ぶ", "およぶ"), Term("採用", "さいよう"), Term("設立", "せつりつ"), Term("部下", "ぶか"), Term("一面", "いちめん"), Term("尚", "なお"), Term("忠実", "ちゅうじつ"), Term("事柄", "ことがら"), Term("満たす", "みたす"), Term("成り立つ", "なりたつ"), Term("扱い", "あつかい"), Term("控える", "ひかえる"), Term("過ち", "あやまち"), Term("辞職", "じしょく"), Term("時折", "ときおり"), Term("緊急", "きんきゅう"), Term("逃れる", "のがれる"), Term("赤字", "あかじ"), Term("開発", "かいはつ"), Term("行い", "おこない"), Term("遅れ", "おくれ"), Term("出世", "しゅっせ"), Term("購入", "こうにゅう"), Term("不可欠", "ふかけつ"), Term("任命", "にんめい"), Term("敏感", "びんかん"), Term("勤務", "きんむ"), Term("発生", "はっせい"), Term("申し込み", "もうしこみ"), Term("辛うじて", "かろうじて"), Term("付き", "つき"), Term("動き", "うごき"), Term("悩ます", "なやます"), Term("残酷", "ざんこく"), Term("収集", "しゅうしゅう"), Term("英雄", "えいゆう"), Term("値引き", "ねびき"), Term("栽培", "さいばい"), Term("号", "ごう"), Term("不在", "ふざい"), Term("獲得", "かくとく"), Term("体験", "たいけん"), Term("用紙", "ようし"), Term("悪化", "あっか"), Term("継ぐ", "つぐ"), Term("悩み", "なやみ"), Term("盗み", "ぬすみ"), Term("気楽", "きらく"), Term("不況", "ふきょう"), Term("減少", "げんしょう"), Term("生かす", "いかす"), Term("野心", "やしん"), Term("念", "ねん"), Term("伝達", "でんたつ"), Term("開催", "かいさい"), Term("絶望", "ぜつぼう"), Term("大衆", "たいしゅう"), Term("施設", "しせつ"), Term("最善", "さいぜん"), Term("依存", "いぞん"), Term("根拠", "こんきょ"), Term("通常", "つうじょう"), Term("観点", "かんてん"), Term("意図", "いと"), Term("催す", "もよおす"), Term("要する", "ようする"), Term("美術", "びじゅつ"), Term("対応", "たいおう"), Term("試み", "こころみ"), Term("推測", "すいそく"), Term("覚え", "おぼえ"), Term("合意", "ごうい"), Term("適応", "てきおう"), Term("像", "ぞう"), Term("禁じる", "きんじる"), Term("特有", "とくゆう"), Term("策", "さく"), Term("所属", "しょぞく"), Term("過労", "かろう"), Term("階級", "かいきゅう"), Term("職務", "しょくむ"), Term("断然", "だんぜん"), Term("浜辺", "はまべ"), Term("地元", "じもと"), Term("始発", "しはつ"), Term("挑戦", "ちょうせん"), Term("決意", "けつい"), Term("見方", "みかた"), Term("大胆", "だいたん"), Term("課題", "かだい"), Term("処分", "しょぶん"), Term("蝶", "ちょう"), Term("極端", "きょくたん"), Term("有益", "ゆうえき"), Term("頻繁", "ひんぱん"), Term("到達", "とうたつ"), Term("他方", "たほう"), Term("人柄", "ひとがら"), Term("調和", "ちょうわ"), Term("反する", "はんする"), Term("独自", "どくじ"), Term("中断", "ちゅうだん"), Term("接触", "せっしょく"), Term("同士", "どうし"), Term("合併", "がっぺい"), Term("肉体", "にくたい"), Term("好意", "こうい"), Term("励ます", "はげます"), Term("損う", "そこなう"), Term("手配", "てはい"), Term("観衆", "かんしゅう"), Term("頑固", "がんこ"), Term("抜け出す", "ぬけだす"), Term("発", "はつ"), Term("少数", "しょうすう"), Term("登校", "とうこう"), Term("崩壊", "ほうかい"), Term("弁解", "べんかい"), Term("起源", "きげん"), Term("図る", "はかる"), Term("収容", "しゅうよう"), Term("悲鳴", "ひめい"), Term("業者", "ぎょうしゃ"), Term("慣習", "かんしゅう"), Term("簡潔", "かんけつ"), Term("促進", "そくしん"), Term("閉鎖", "へいさ"), Term("情熱", "じょうねつ"), Term("創立", "そうりつ"), Term("野生", "やせい"), Term("読者", "どくしゃ"), Term("事項", "じこう"), Term("成果", "せいか"), Term("再会", "さいかい"), Term("徒歩", "とほ"), Term("余暇", "よか"), Term("源", "みなもと"), Term("法廷", "ほうてい"), Term("異議", "いぎ"), Term("恐れ", "おそれ"), Term("愛想", "あいそ"), Term("要請", "ようせい"), Term("背景", "はいけい"), Term("向上", "こうじょう"), Term("脅す", "おどす"), Term("無駄遣い", "むだづかい"), Term("干渉", "かんしょう"), Term("滑らか", "なめらか"), Term("見通し", "みとおし"), Term("微笑", "びしょう"), Term("業績", "ぎょうせき"), Term("経費", "けいひ"), Term("経歴", "けいれき"), Term("紛争", "ふんそう"), Term("決勝", "けっしょう"), Term("争い", "あらそい"), Term("行進", "こうしん"), Term("獲物", "えもの"), Term("快い", "こころよい"), Term("任務", "にんむ"), Term("利点", "りてん"), Term("怠慢", "たいまん"), Term("要因", "よういん"), Term("抑制", "よくせい"), Term("匹敵", "ひってき"), Term("訂正", "ていせい"), Term("教訓", "きょうくん"), Term("上演", "じょうえん"), Term("高まる", "たかまる"), Term("国連", "こくれん"), Term("象徴", "しょうちょう"), Term("入手", "にゅうしゅ"), Term("参照", "さんしょう"), Term("大幅", "おおはば"), Term("論議", "ろんぎ"), Term("迅速", "じんそく"), Term("部門", "ぶもん"), Term("活発", "かっぱつ"), Term("特権", "とっけん"), Term("一連", "いちれん"), Term("断言", "だんげん"), Term("通", "つう"), Term("著名", "ちょめい"), Term("警戒", "けいかい"), Term("衣類", "いるい"), Term("見地", "けんち"), Term("使い", "つかい"), Term("正常", "せいじょう"), Term("繁栄", "はんえい"), Term("公開", "こうかい"), Term("告白", "こくはく"), Term("当選", "とうせん"), Term("名簿", "めいぼ"), Term("負担", "ふたん"), Term("軌道", "きどう"), Term("大げさ", "おおげさ"), Term("歓声", "かんせい"), Term("登録", "とうろく"), Term("打ち込む", "うちこむ"), Term("創造", "そうぞう"), Term("打撃", "だげき"), Term("密接", "みっせつ"), Term("背後", "はいご"), Term("操縦", "そうじゅう"), Term("衝撃", "しょうげき"), Term("団結", "だんけつ"), Term("日取り", "ひどり"), Term("交互", "こうご"), Term("処置", "しょち"), Term("追放", "ついほう"), Term("免除", "めんじょ"), Term("展示", "てんじ"), Term("確立", "かくりつ"), Term("確保", "かくほ"), Term("腕前", "うでまえ"), Term("唱える", "となえる"), Term("鮮やか", "あざやか"), Term("訴訟", "そしょう"), Term("協定", "きょうてい"), Term("浴室", "よくしつ"), Term("堂々", "どうどう"), Term("要望", "ようぼう"), Term("軽率", "けいそつ"), Term("鉄鋼", "てっこう"), Term("知的", "ちてき"), Term("消息", "しょうそく"), Term("何だか", "なんだか"), Term("上空", "じょうくう"), Term("作", "さく"), Term("施す", "ほどこす"), Term("雌", "めす"), Term("会見", "かいけん"), Term("出演", "しゅつえん"), Term("捜索", "そうさく"), Term("知性", "ちせい"), Term("晴天", "せいてん"), Term("境遇", "きょうぐう"), Term("協会", "きょうかい"), Term("宣言", "せんげん"), Term("教科", "きょうか"), Term("逃走", "とうそう"), Term("業務", "ぎょうむ"), Term("当たり", "あたり"), Term("排除", "はいじょ"), Term("秩序", "ちつじょ"), Term("票", "ひょう"), Term("恵み", "めぐみ"), Term("返答", "へんとう"), Term("手本", "てほん"), Term("望ましい", "のぞましい"), Term("良質", "りょうしつ"), Term("有望", "ゆうぼう"), Term("分配", "ぶんぱい"), Term("自立", "じりつ"), Term("削減", "さくげん"), Term("着", "ちゃく"), Term("取っ手", "とって"), Term("出費", "しゅっぴ"), Term("提示", "ていじ"), Term("描写", "びょうしゃ"), Term("趣旨", "しゅし"), Term("風習", "ふうしゅう"), Term("脱出", "だっしゅつ"), Term("育ち", "そだち"), Term("除外", "じょがい"), Term("措置", "そち"), Term("樹立", "じゅりつ"), Term("個性", "こせい"), Term("爆破", "ばくは"), Term("猛烈", "もうれつ"), Term("危害", "きがい"), Term("放棄", "ほうき"), Term("色彩", "しきさい"), Term("神聖", "しんせい"), Term("配置", "はいち"), Term("享受", "きょうじゅ"), Term("熱意", "ねつい"), Term("運営", "うんえい"), Term("携帯", "けいたい"), Term("原則", "げんそく"), Term("帯びる", "おびる"), Term("単独", "たんどく"), Term("家計", "かけい"), Term("申告", "しんこく"), Term("優先", "ゆうせん"), Term("保管", "ほかん"), Term("動揺", "どうよう"), Term("所得", "しょとく"), Term("制", "せい"), Term("巧み", "たくみ"), Term("版", "はん"), Term("指揮", "しき"), Term("憤慨", "ふんがい"), Term("後退", "こうたい"), Term("写し", "うつし"), Term("借り", "かり"), Term("避難", "ひなん"), Term("素材", "そざい"), Term("肝心", "かんじん"), Term("効き目", "ききめ"), Term("手順", "てじゅん"), Term("不明", "ふめい"), Term("孤立", "こりつ"), Term("記述", "きじゅつ"), Term("疑惑", "ぎわく"), Term("襲撃", "しゅうげき"), Term("移住", "いじゅう"), Term("衣装", "いしょう"), Term("一同", "いちどう"), Term("追い出す", "おいだす"), Term("土手", "どて"), Term("脈", "みゃく"), Term("苦しめる", "くるしめる"), Term("対等", "たいとう"), Term("問い合わせる", "といあわせる"), Term("従来", "じゅうらい"), Term("原文", "げんぶん"), Term("落ち葉", "おちば"), Term("惜しむ", "おしむ"), Term("理屈", "りくつ"), Term("不景気", "ふけいき"), Term("転落", "てんらく"), Term("作用", "さよう"), Term("導入", "どうにゅう"), Term("待遇", "たいぐう"), Term("視点", "してん"), Term("盛大", "せいだい"), Term("対抗", "たいこう"), Term("自覚", "じかく"), Term("実質", "じっしつ"), Term("有りのまま", "ありのまま"), Term("雇用", "こよう"), Term("正当", "せいとう"), Term("収支", "しゅうし"), Term("無断", "むだん"), Term("記載", "きさい"), Term("集計", "しゅうけい"), Term("規定", "きてい"), Term("技能", "ぎのう"), Term("議案", "ぎあん"), Term("議題", "ぎだい"), Term("異論", "いろん"), Term("強烈", "きょうれつ"), Term("駆ける", "かける"), Term("勢力", "せいりょく"), Term("歩み", "あゆみ"), Term("押し込む", "おしこむ"), Term("豊作", "ほうさく"), Term("報じる", "ほうじる"), Term("人材", "じんざい"), Term("使命", "しめい"), Term("終始", "しゅうし"), Term("装備", "そうび"), Term("果て", "はて"), Term("進展", "しんてん"), Term("公演", "こうえん"), Term("募金", "ぼきん"), Term("優勢", "ゆうせい"), Term("届", "とどけ"), Term("浮気", "うわき"), Term("営む", "いとなむ"), Term("細菌", "さいきん"), Term("物資", "ぶっし"), Term("仕組み", "しくみ"), Term("飼育", "しいく"), Term("換算", "かんさん"), Term("防衛", "ぼうえい"), Term("関与", "かんよ"), Term("変動", "へんどう"), Term("制する", "せいする"), Term("痛感", "つうかん"), Term("連休", "れんきゅう"), Term("備わる", "そなわる"), Term("無用", "むよう"), Term("専用", "せんよう"), Term("体格", "たいかく"), Term("規模", "きぼ"), Term("領土", "りょうど"), Term("奨励", "しょうれい"), Term("引き取る", "ひきとる"), Term("緩やか", "ゆるやか"), Term("掲げる", "かかげる"), Term("類似", "るいじ"), Term("黒字", "くろじ"), Term("有力", "ゆうりょく"), Term("沈没", "ちんぼつ"), Term("引きずる", "ひきずる"), Term("雨天", "うてん"), Term("両立", "りょうりつ"), Term("結びつく", "むすびつく"), Term("増進", "ぞうしん"), Term("不服", "ふふく"), Term("現地", "げんち"), Term("限定", "げんてい"), Term("統治", "とうち"), Term("不良", "ふりょう"), Term("悲惨", "ひさん"), Term("好評", "こうひょう"), Term("荷", "に"), Term("辞退", "じたい"), Term("脱する", "だっする"), Term("介入", "かいにゅう"), Term("会談", "かいだん"), Term("補給", "ほきゅう"), Term("野外", "やがい"), Term("分担", "ぶんたん"), Term("点検", "てんけん"), Term("始末", "しまつ"), Term("寄与", "きよ"), Term("終日", "しゅうじつ"), Term("期末", "きまつ"), Term("気軽", "きがる"), Term("依然", "いぜん"), Term("進路", "しんろ"), Term("暴風", "ぼうふう"), Term("領域", "りょういき"), Term("前例", "ぜんれい"), Term("招き", "まねき"), Term("上陸", "じょうりく"), Term("制裁", "せいさい"), Term("救援", "きゅうえん"), Term("心地", "ここち"), Term("経過", "けいか"), Term("優美", "ゆうび"), Term("進出", "しんしゅつ"), Term("制定", "せいてい"), Term("決議", "けつぎ"), Term("結合", "けつごう"), Term("乙", "おつ"), Term("達者", "たっしゃ"), Term("権", "けん"), Term("日夜", "にちや"), Term("固有", "こゆう"), Term("膨張", "ぼうちょう"), Term("願書", "がんしょ"), Term("好ましい", "このましい"), Term("同盟", "どうめい"), Term("荒らす", "あらす"), Term("荒廃", "こうはい"), Term("賭け", "かけ"), Term("再生", "さいせい"), Term("配慮", "はいりょ"), Term("復活", "ふっかつ"), Term("学説", "がくせつ"), Term("掛け", "かけ"), Term("至って", "いたって"), Term("視察", "しさつ"), Term("分離", "ぶんり"), Term("似通う", "にかよう"), Term("扶養", "ふよう"), Term("社交", "しゃこう"), Term("若干", "じゃっかん"), Term("弁論", "べんろん"), Term("裏返し", "うらがえし"), Term("充実", "じゅうじつ"), Term("粉末", "ふんまつ"), Term("放出", "ほうしゅつ"), Term("陳列", "ちんれつ"), Term("系", "けい"), Term("施行", "しこう"), Term("意地", "いじ"), Term("入賞", "にゅうしょう"), Term("審議", "しんぎ"), Term("富豪", "ふごう"), Term("深める", "ふかめる"), Term("壮大", "そうだい"), Term("動向", "どうこう"), Term("福", "ふく"), Term("庶民", "しょみん"), Term("種々", "しゅじゅ"), Term("密集", "みっしゅう"), Term("統合", "とうごう"), Term("お手上げ", "おてあげ"), Term("当人", "とうにん"), Term("口頭", "こうとう"), Term("妨害", "ぼうがい"), Term("夕暮れ", "ゆうぐれ"), Term("区", "く"), Term("群", "ぐん"), Term("了解", "りょうかい"), Term("刑", "けい"), Term("沿岸", "えんがん"), Term("補助", "ほじょ"), Term("用品", "ようひん"), Term("故人", "こじん"), Term("非行", "ひこう"), Term("護衛", "ごえい"), Term("交える", "まじえる"), Term("公然", "こうぜん"), Term("改良", "かいりょう"), Term("割り当て", "わりあて"), Term("補充", "ほじゅう"), Term("雑談", "ざつだん"), Term("使い道", "つかいみち"), Term("学歴", "がくれき"), Term("対話", "たいわ"), Term("訴え", "うったえ"), Term("放置", "ほうち"), Term("事前", "じぜん"), Term("侍", "さむらい"), Term("幹部", "かんぶ"), Term("途上", "とじょう"), Term("守備", "しゅび"), Term("手がける", "てがける"), Term("貧弱", "ひんじゃく"), Term("土台", "どだい"), Term("面目", "めんぼく"), Term("楽観", "らっかん"), Term("受け入れ", "うけいれ"), Term("機構", "きこう"), Term("存続", "そんぞく"), Term("宿命", "しゅくめい"), Term("塾", "じゅく"), Term("初", "はつ"), Term("原爆", "げんばく"), Term("小柄", "こがら"), Term("称する", "しょうする"), Term("覆す", "くつがえす"), Term("配分", "はいぶん"), Term("上位", "じょうい"), Term("信者", "しんじゃ"), Term("侵す", "おかす"), Term("騒動", "そうどう"), Term("未知", "みち"), Term("様式", "ようしき"), Term("悲観", "ひかん"), Term("生死", "せいし"), Term("投入", "とうにゅう"), Term("廃棄", "はいき"), Term("禁物", "きんもつ"), Term("激励", "げきれい"), Term("強いる", "しいる"), Term("良好", "りょうこう"), Term("首脳", "しゅのう"), Term("方策", "ほうさく"), Term("噴出", "ふんしゅつ"), Term("復興", "ふっこう"), Term("模範", "もはん"), Term("検事", "けんじ"), Term("舞う", "まう"), Term("原作", "げんさく"), Term("加工", "かこう"), Term("屋敷", "やしき"), Term("好況", "こうきょう"), Term("好調", "こうちょう"), Term("何気ない", "なにげない"), Term("交付", "こうふ"), Term("仕掛ける", "しかける"), Term("出生", "しゅっしょう"), Term("再発", "さいはつ"), Term("提携", "ていけい"), Term("冷淡", "れいたん"), Term("採択", "さいたく"), Term("難", "なん"), Term("志望", "しぼう"), Term("短縮", "たんしゅく"), Term("勧め", "すすめ"), Term("勧誘", "かんゆう"), Term("方式", "ほうしき"), Term("真上", "まうえ"), Term("内臓", "ないぞう"), Term("手法", "しゅほう"), Term("趣", "おもむき"), Term("器", "うつわ"), Term("連帯", "れんたい"), Term("受け止める", "うけとめる"), Term("受身", "うけみ"), Term("出動", "しゅつどう"), Term("所持", "しょじ"), Term("議決", "ぎけつ"), Term("取材", "しゅざい"), Term("眉", "まゆ"), Term("協調", "きょうちょう"), Term("逆転", "ぎゃくてん"), Term("華やか", "はなやか"), Term("譲歩", "じょうほ"), Term("移行", "いこう"), Term("露骨", "ろこつ"), Term("中傷", "ちゅうしょう"), Term("定まる", "さだまる"), Term("審査", "しんさ"), Term("神殿", "しんでん"), Term("名高い", "なだかい"), Term("投げ出す", "なげだす"), Term("一部分", "いちぶぶん"), Term("教え", "おしえ"), Term("未熟", "みじゅく"), Term("正解", "せいかい"), Term("復旧", "ふっきゅう"), Term("設置", "せっち"), Term("全盛", "ぜんせい"), Term("液", "えき"), Term("阻む", "はばむ"), Term("走行", "そうこう"), Term("命中", "めいちゅう"), Term("本文", "ほんぶん"), Term("掲載", "けいさい"), Term("脱退", "だったい"), Term("街頭", "がいとう"), Term("緩和", "かんわ"), Term("応急", "おうきゅう"), Term("結成", "けっせい"), Term("健在", "けんざい"), Term("原油", "げんゆ"), Term("個別", "こべつ"), Term("後回し", "あとまわし"), Term("育成", "いくせい"), Term("河川", "かせん"), Term("公立", "こうりつ"), Term("工作", "こうさく"), Term("巧妙", "こうみょう"), Term("予感", "よかん"), Term("編", "へん"), Term("配給", "はいきゅう"), Term("改訂", "かいてい"), Term("根気", "こんき"), Term("採算", "さいさん"), Term("外貨", "がいか"), Term("外相", "がいしょう"), Term("調印", "ちょういん"), Term("雑貨", "ざっか"), Term("酸化", "さんか"), Term("残高", "ざんだか"), Term("委託", "いたく"), Term("旅券", "りょけん"), Term("時差", "じさ"), Term("必修", "ひっしゅう"), Term("苗", "なえ"), Term("磁気", "じき"), Term("慣行", "かんこう"), Term("様相", "ようそう"), Term("誘導", "ゆうどう"), Term("名称", "めいしょう"), Term("軸", "じく"), Term("失格", "しっかく"), Term("売り出す", "うりだす"), Term("主演", "しゅえん"), Term("埋蔵", "まいぞう"), Term("目録", "もくろく"), Term("志向", "しこう"), Term("丸ごと", "まるごと"), Term("天災", "てんさい"), Term("切れ目", "きれめ"), Term("既婚", "きこん"), Term("期日", "きじつ"), Term("取り締まり", "とりしまり"), Term("防火", "ぼうか"), Term("規約", "きやく"), Term("初版", "しょはん"), Term("技", "わざ"), Term("意気込む", "いきごむ"), Term("反感", "はんかん"), Term("売り出し", "うりだし"), Term("休戦", "きゅうせん"), Term("救い", "すくい"), Term("追及", "ついきゅう"), Term("心情", "しんじょう"), Term("再現", "さいげん"), Term("窮屈", "きゅうくつ"), Term("親しむ", "したしむ"), Term("揺さぶる", "ゆさぶる"), Term("身近", "みぢか"), Term("進み", "すすみ"), Term("契機", "けいき"), Term("凶作", "きょうさく"), Term("頂", "いただき"), Term("推進", "すいしん"), Term("危ぶむ", "あやぶむ"), Term("是正", "ぜせい"), Term("教材", "きょうざい"), Term("制約", "せいやく"), Term("志", "こころざし"), Term("郷愁", "きょうしゅう"), Term("大方", "おおかた"), Term("生育", "せいいく"), Term("精巧", "せいこう"), Term("精密", "せいみつ"), Term("税務署", "ぜいむしょ"), Term("責務", "せきむ"), Term("法学", "ほうがく"), Term("軍備", "ぐんび"), Term("傾斜", "けいしゃ"), Term("封", "ふう"), Term("相場", "そうば"), Term("経路", "けいろ"), Term("決算", "けっさん"), Term("対談", "たいだん"), Term("肉親", "にくしん"), Term("対比", "たいひ"), Term("停滞", "ていたい"), Term("態勢", "たいせい"), Term("単一", "たんいつ"), Term("日ごろ", "ひごろ"), Term("中枢", "ちゅうすう"), Term("張り紙", "はりがみ"), Term("公用", "こうよう"), Term("増強", "ぞうきょう"), Term("現行", "げんこう"), Term("振り出し", "ふりだし"), Term("誇る", "ほこる"), Term("出題", "しゅつだい"), Term("読み上げる", "よみあげる"), Term("内乱", "ないらん"), Term("誤差", "ごさ"), Term("内訳", "うちわけ"), Term("抗争", "こうそう"), Term("拘束", "こうそく"), Term("控除", "こうじょ"), Term("耕作", "こうさく"), Term("略奪", "りゃくだつ"), Term("講習", "こうしゅう"), Term("砂利", "じゃり"), Term("階層", "かいそう"), Term("同等", "どうとう"), Term("反撃", "はんげき"), Term("山岳", "さんがく"), Term("確定", "かくてい"), Term("持ち", "もち"), Term("指令", "しれい"), Term("融通", "ゆうずう"), Term("物議", "ぶつぎ"), Term("勧告", "かんこく"), Term("碑", "いしぶみ"), Term("本体", "ほんたい"), Term("感触", "かんしょく"), Term("自在", "じざい"), Term("敗戦", "はいせん"), Term("胴", "どう"), Term("峰", "みね"), Term("還元", "かんげん"), Term("主催", "しゅさい"), Term("円滑", "えんかつ"), Term("手軽", "てがる"), Term("本館", "ほんかん"), Term("否決", "ひけつ"), Term("修了", "しゅうりょう"), Term("明朗", "めいろう"), Term("粘り", "ねばり"), Term("記す", "しるす"), Term("女史", "じょし"), Term("所在", "しょざい"), Term("発足", "ほっそく"), Term("症", "しょう"), Term("運搬", "うんぱん"), Term("採決", "さいけつ"), Term("一変", "いっぺん"), Term("覆面", "ふくめん"), Term("発掘", "はっくつ"), Term("所定", "しょてい"), Term("半端", "はんぱ"), Term("製鉄", "せいてつ"), Term("製法", "せいほう"), Term("特集", "とくしゅう"), Term("静止", "せいし"), Term("勤め先", "つとめさき"), Term("勤労", "きんろう"), Term("同居", "どうきょ"), Term("味わい", "あじわい"), Term("総合", "そうごう"), Term("運輸", "うんゆ"), Term("先行", "せんこう"), Term("区間", "くかん"), Term("着工", "ちゃっこう"), Term("選考", "せんこう"), Term("仕掛け", "しかけ"), Term("切実", "せつじつ"), Term("創刊", "そうかん"), Term("遭難", "そうなん"), Term("計器", "けいき"), Term("即する", "そくする"), Term("打開", "だかい"), Term("末期", "まっき"), Term("大筋", "おおすじ"), Term("情緒", "じょうちょ"), Term("下位", "かい"), Term("該当", "がいとう"), Term("下火", "したび"), Term("了承", "りょうしょう"), Term("適性", "てきせい"), Term("不評", "ふひょう"), Term("不調", "ふちょう"), Term("原形", "げんけい"), Term("中継", "ちゅうけい"), Term("聴講", "ちょうこう"), Term("長官", "ちょうかん"), Term("長編", "ちょうへん"), Term("比率", "ひりつ"), Term("電源", "でんげん"), Term("交易", "こうえき"), Term("公団", "こうだん"), Term("火花", "ひばな"), Term("変遷", "へんせん"), Term("大空", "おおぞら"), Term("許容", "きょよう"), Term("寛容", "かんよう"), Term("素朴", "そぼく"), Term("格差", "かくさ"), Term("攻め", "せめ"), Term("過密", "かみつ"), Term("画", "かく"), Term("行員", "こういん"), Term("根底", "こんてい"), Term("採掘", "さいくつ"), Term("採集", "さいしゅう"), Term("未練", "みれん"), Term("外来", "がいらい"), Term("お産", "おさん"), Term("沿線", "えんせん"), Term("船舶", "せんぱく"), Term("学芸", "がくげい"), Term("子息", "しそく"), Term("遣る", "やる"), Term("直ぐ", "すぐ"), Term("間違う", "まちがう"), Term("何て", "なんて"), Term("訪れる", "おとずれる"), Term("易い", "やすい"), Term("忠告", "ちゅうこく"), Term("的", "てき"), Term("近づく", "ちかづく"), Term("犯す", "おかす"), Term("冊", "さつ"), Term("後悔", "こうかい"), Term("齎す", "もたらす"), Term("果たす", "はたす"), Term("嘗て", "かつて"), Term("尽くす", "つくす"), Term("軽蔑", "けいべつ"), Term("愚か", "おろか"), Term("役立つ", "やくだつ"), Term("取り戻す", "とりもどす"), Term("産む", "うむ"), Term("枚", "まい"), Term("養う", "やしなう"), Term("勇敢", "ゆうかん"), Term("痛む", "いたむ"), Term("名付ける", "なづける"), Term("遥か", "はるか"), Term("引き起こす", "ひきおこす"), Term("極めて", "きわめて"), Term("部", "ぶ"), Term("値する", "あたいする"), Term("仕上げる", "しあげる"), Term("自ずから", "おのずから"), Term("空腹", "くうふく"), Term("最早", "もはや"), Term("態々", "わざわざ"), Term("夜更かし", "よふかし"), Term("取り除く", "とりのぞく"), Term("済ます", "すます"), Term("前もって", "まえもって"), Term("恥じる", "はじる"), Term("捧げる", "ささげる"), Term("生まれつき", "うまれつき"), Term("見渡す", "みわたす"), Term("富む", "とむ"), Term("如何に", "いかに"), Term("試みる", "こころみる"), Term("相応しい", "ふさわしい"), Term("取り分け", "とりわけ"), Term("受かる", "うかる"), Term("完璧", "かんぺき"), Term("無礼", "ぶれい"), Term("逃げ出す", "にげだす"), Term("況して", "まして"), Term("費やす", "ついやす"), Term("漏らす", "もらす"), Term("尚更", "なおさら"), Term("群集", "ぐんしゅう"), Term("費", "ひ"), Term("誠", "まこと"), Term("演じる", "えんじる"), Term("顔付き", "かおつき"), Term("容易い", "たやすい"), Term("如何にも", "いかにも"), Term("嘘つき", "うそつき"), Term("製", "せい"), Term("取り組む", "とりくむ"), Term("目覚める", "めざめる"), Term("乗り込む", "のりこむ"), Term("賭ける", "かける"), Term("叶う", "かなう"), Term("沿う", "そう"), Term("員", "いん"), Term("治まる", "おさまる"), Term("悟る", "さとる"), Term("拒絶", "きょぜつ"), Term("尽きる", "つきる"), Term("お祖父さん", "おじいさん"), Term("番目", "ばんめ"), Term("向け", "むけ"), Term("欠く", "かく"), Term("害する", "がいする"), Term("奢る", "おごる"), Term("漏れる", "もれる"), Term("衰える", "おとろえる"), Term("兎角", "とかく"), Term("伴う", "ともなう"), Term("憂鬱", "ゆううつ"), Term("身振り", "みぶり"), Term("整える", "ととのえる"), Term("及び", "および"), Term("誤る", "あやまる"), Term("咎める", "とがめる"), Term("見逃す", "みのがす"), Term("申し出る", "もうしでる"), Term("颯と", "さっと"), Term("差し出す", "さしだす"), Term("間柄", "あいだがら"), Term("見せびらかす", "みせびらかす"), Term("摘む", "つまむ"), Term("痛める", "いためる"), Term("込める", "こめる"), Term("敢えて", "あえて"), Term("面する", "めんする"), Term("取り扱う", "とりあつかう"), Term("無邪気", "むじゃき"), Term("玄人", "くろうと"), Term("いい加減", "いいかげん"), Term("非", "ひ"), Term("囀る", "さえずる"), Term("飲み込む", "のみこむ"), Term("詫び", "わび"), Term("身なり", "みなり"), Term("築く", "きずく"), Term("予め", "あらかじめ"), Term("負かす", "まかす"), Term("臆病", "おくびょう"), Term("お世辞", "おせじ"), Term("和らげる", "やわらげる"), Term("割り込む", "わりこむ"), Term("付け加える", "つけくわえる"), Term("添える", "そえる"), Term("白状", "はくじょう"), Term("染みる", "しみる"), Term("遮る", "さえぎる"), Term("罵る", "ののしる"), Term("到底", "とうてい"), Term("温和", "おんわ"), Term("崇拝", "すうはい"), Term("乏しい", "とぼしい"), Term("見晴らし", "みはらし"), Term("舐める", "なめる"), Term("紛失", "ふんしつ"), Term("微か", "かすか"), Term("滑稽", "こっけい"), Term("漕ぐ", "こぐ"), Term("辿る", "たどる"), Term("短気", "たんき"), Term("見窄らしい", "みすぼらしい"), Term("誤魔化す", "ごまかす"), Term("明かす", "あかす"), Term("貫く", "つらぬく"), Term("檻", "おり"), Term("辛抱", "しんぼう"), Term("雛", "ひよこ"), Term("専ら", "もっぱら"), Term("甥", "おい"), Term("見落とす", "みおとす"), Term("捗る", "はかどる"), Term("妬む", "ねたむ"), Term("寝かせる", "ねかせる"), Term("弱る", "よわる"), Term("絶える", "たえる"), Term("代わる代わる", "かわるがわる"), Term("値打ち", "ねうち"), Term("交わる", "まじわる"), Term("今更", "いまさら"), Term("取りあえず", "とりあえず"), Term("矢鱈", "やたら"), Term("逞しい", "たくましい"), Term("諸", "しょ"), Term("強請る", "ねだる"), Term("鍛える", "きたえる"), Term("無茶", "むちゃ"), Term("慎む", "つつしむ"), Term("老ける", "ふける"), Term("導く", "みちびく"), Term("不意", "ふい"), Term("派", "は"), Term("設ける", "もうける"), Term("嘆く", "なげく"), Term("久しい", "ひさしい"), Term("叶える", "かなえる"), Term("携わる", "たずさわる"), Term("棘", "とげ"), Term("無意味", "むいみ"), Term("傾ける", "かたむける"), Term("説く", "とく"), Term("目覚ましい", "めざましい"), Term("構える", "かまえる"), Term("励む", "はげむ"), Term("同封", "どうふう"), Term("受け付ける", "うけつける"), Term("超", "ちょう"), Term("指差す", "ゆびさす"), Term("情け", "なさけ"), Term("仕立てる", "したてる"), Term("重んじる", "おもんじる"), Term("密か", "ひそか"), Term("休める", "やすめる"), Term("心がける", "こころがける"), Term("躾", "しつけ"), Term("空しい", "むなしい"), Term("総", "そう"), Term("待ち遠しい", "まちどおしい"), Term("仰ぐ", "あおぐ"), Term("著しい", "いちじるしい"), Term("持て成す", "もてなす"), Term("荷作り", "にづくり"), Term("質素", "しっそ"), Term("氾濫", "はんらん"), Term("海抜", "かいばつ"), Term("再", "さい"), Term("病", "やまい"), Term("金槌", "かなづち"), Term("弱まる", "よわまる"), Term("奇数", "きすう"), Term("老いる", "おいる"), Term("足し算", "たしざん"), Term("眠たい", "ねむたい"), Term("滅びる", "ほろびる"), Term("霞む", "かすむ"), Term("生やす", "はやす"), Term("染まる", "そまる"), Term("染める", "そめる"), Term("見合わせる", "みあわせる"), Term("群がる", "むらがる"), Term("脆い", "もろい"), Term("倹約", "けんやく"), Term("背く", "そむく"), Term("備え付ける", "そなえつける"), Term("冴える", "さえる"), Term("聳える", "そびえる"), Term("使用人", "しようにん"), Term("憧れ", "あこがれ"), Term("目付き", "めつき"), Term("顧みる", "かえりみる"), Term("志す", "こころざす"), Term("滅亡", "めつぼう"), Term("几帳面", "きちょうめん"), Term("指図", "さしず"), Term("碌に", "ろくに"), Term("乗っ取る", "のっとる"), Term("呟く", "つぶやく"), Term("尊い", "とうとい"), Term("唾", "つば"), Term("待ち合わせ", "まちあわせ"), Term("絡む", "からむ"), Term("練る", "ねる"), Term("誇張", "こちょう"), Term("夜更け", "よふけ"), Term("合わす", "あわす"), Term("繁盛", "はんじょう"), Term("察する", "さっする"), Term("各種", "かくしゅ"), Term("繕う", "つくろう"), Term("戸締まり", "とじまり"), Term("頑丈", "がんじょう"), Term("自惚れ", "うぬぼれ"), Term("病む", "やむ"), Term("弱める", "よわめる"), Term("無能", "むのう"), Term("汽船", "きせん"), Term("案の定", "あんのじょう"), Term("欺く", "あざむく"), Term("丸々", "まるまる"), Term("取り寄せる", "とりよせる"), Term("余程", "よほど"), Term("鬱陶しい", "うっとうしい"), Term("盛り上がる", "もりあがる"), Term("裂ける", "さける"), Term("大水", "おおみず"), Term("踵", "かかと"), Term("着飾る", "きかざる"), Term("怠い", "だるい"), Term("儚い", "はかない"), Term("皺", "しわ"), Term("貶す", "けなす"), Term("賄う", "まかなう"), Term("裁く", "さばく"), Term("歩む", "あゆむ"), Term("思いつき", "おもいつき"), Term("緩める", "ゆるめる"), Term("甘える", "あまえる"), Term("操る", "あやつる"), Term("若しくは", "もしくは"), Term("不吉", "ふきつ"), Term("先天的", "せんてんてき"), Term("善し悪し", "よしあし"), Term("安静", "あんせい"), Term("映える", "はえる"), Term("明瞭", "めいりょう"), Term("障る", "さわる"), Term("織る", "おる"), Term("食い違う", "くいちがう"), Term("嘸", "さぞ"), Term("促す", "うながす"), Term("滲む", "にじむ"), Term("組み合わせる", "くみあわせる"), Term("掻き回す", "かきまわす"), Term("恵む", "めぐむ"), Term("遠ざかる", "とおざかる"), Term("欠乏", "けつぼう"), Term("自首", "じしゅ"), Term("長閑", "のどか"), Term("辻褄", "つじつま"), Term("努めて", "つとめて"), Term("恋する", "こいする"), Term("有する", "ゆうする"), Term("乃至", "ないし"), Term("剥げる", "はげる"), Term("卑しい", "いやしい"), Term("弁償", "べんしょう"), Term("没落", "ぼつらく"), Term("途絶える", "とだえる"), Term("左利き", "ひだりき"), Term("観", "かん"), Term("籠もる", "こもる"), Term("丸める", "まるめる"), Term("守衛", "しゅえい"), Term("揉める", "もめる"), Term("瞑る", "つぶる"), Term("取り締まる", "とりしまる"), Term("取り巻く", "とりまく"), Term("研ぐ", "とぐ"), Term("悉く", "ことごとく"), Term("冷やかす", "ひやかす"), Term("強まる", "つよまる"), Term("雨具", "あまぐ"), Term("只管", "ひたすら"), Term("全滅", "ぜんめつ"), Term("体つき", "からだつき"), Term("月賦", "げっぷ"), Term("嫌らしい", "いやらしい"), Term("綻びる", "ほころびる"), Term("面皰", "にきび"), Term("仮", "かり"), Term("月並み", "つきなみ"), Term("沈める", "しずめる"), Term("馴れ馴れしい", "なれなれしい"), Term("賑わう", "にぎわう"), Term("吟味", "ぎんみ"), Term("気まぐれ", "きまぐれ"), Term("乱す", "みだす"), Term("雑", "ざつ"), Term("公", "おおやけ"), Term("共稼ぎ", "ともかせぎ"), Term("慕う", "したう"), Term("目方", "めかた"), Term("予て", "かねて"), Term("中和", "ちゅうわ"), Term("率いる", "ひきいる"), Term("手遅れ", "ておくれ"), Term("悪者", "わるもの"), Term("渋い", "しぶい"), Term("安っぽい", "やすっぽい"), Term("剥ぐ", "はぐ"), Term("心強い", "こころづよい"), Term("整列", "せいれつ"), Term("仕入れる", "しいれる"), Term("平方", "へいほう"), Term("煙たい", "けむたい"), Term("賛美", "さんび"), Term("束縛", "そくばく"), Term("月謝", "げっしゃ"), Term("健やか", "すこやか"), Term("懲りる", "こりる"), Term("綴じる", "とじる"), Term("鈍感", "どんかん"), Term("陰気", "いんき"), Term("垢", "あか"), Term("同", "どう"), Term("貴ぶ", "とうとぶ"), Term("煩わしい", "わずらわしい"), Term("平たい", "ひらたい"), Term("目盛り", "めもり"), Term("無闇に", "むやみに"), Term("無茶苦茶", "むちゃくちゃ"), Term("次いで", "ついで"), Term("漏る", "もる"), Term("夜具", "やぐ"), Term("着席", "ちゃくせき"), Term("主観", "しゅかん"), Term("弱", "じゃく"), Term("適宜", "てきぎ"), Term("私用", "しよう"), Term("代弁", "だいべん"), Term("改まる", "あらたまる"), Term("手分け", "てわけ"), Term("急かす", "せかす"), Term("持てる", "もてる"), Term("碌な", "ろくな"), Term("徐行", "じょこう"), Term("見苦しい", "みぐるしい"), Term("嘴", "くちばし"), Term("心細い", "こころぼそい"), Term("甚だ", "はなはだ"), Term("連ねる", "つらねる"), Term("先だって", "せんだって"), Term("近眼", "きんがん"), Term("前置き", "まえおき"), Term("延べ", "のべ"), Term("清々しい", "すがすがしい"), Term("下調べ", "したしらべ"), Term("化ける", "ばける"), Term("原書", "げんしょ"), Term("何卒", "なにとぞ"), Term("葬る", "ほうむる"), Term("突如", "とつじょ"), Term("差し支える", "さしつかえる"), Term("布巾", "ふきん"), Term("物足りない", "ものたりない"), Term("厳か", "おごそか"), Term("頬っぺた", "ほっぺた"), Term("彼の", "あの"), Term("カ月", "カげつ"), Term("嗚呼", "ああ"), Term("第", "だい"), Term("見かける", "みかける"), Term("御座います", "ございます"), Term("怯える", "おびえる"), Term("たどり着く", "たどりつく"), Term("傷つく", "きずつく"), Term("且つ", "かつ"), Term("即座に", "そくざに"), Term("出社", "しゅっしゃ"), Term("若しかして", "もしかして"), Term("一息", "ひといき"), Term("お使い", "おつかい"), Term("赴く", "おもむく"), Term("何だかんだ", "なんだかんだ"), Term("司る", "つかさどる"), Term("お襁褓", "おむつ"), Term("微塵", "みじん"), Term("粉々", "こなごな"), Term("逃す", "のがす"), Term("出くわす", "でくわす"), Term("小銭", "こぜに"), Term("結び付ける", "むすびつける"), Term("仕える", "つかえる"), Term("善良", "ぜんりょう"), Term("長々", "ながなが"), Term("上回る", "うわまわる"), Term("素っ気ない", "そっけない"), Term("給仕", "きゅうじ"), Term("産出", "さんしゅつ"), Term("教職", "きょうしょく"), Term("滅ぼす", "ほろぼす"), Term("同い年", "おないどし"), Term("勘弁", "かんべん"), Term("挑む", "いどむ"), Term("朝寝坊", "あさねぼう"), Term("幾多", "いくた"), Term("期", "き"), Term("生ける", "いける"), Term("整然", "せいぜん"), Term("拝借", "はいしゃく"), Term("片付け", "かたづけ"), Term("召す", "めす"), Term("用法", "ようほう"), Term("初耳", "はつみみ"), Term("大柄", "おおがら"), Term("昼飯", "ひるめし"), Term("口述", "こうじゅつ"), Term("痛切", "つうせつ"), Term("首輪", "くびわ"), Term("案じる", "あんじる"), Term("西日", "にしび"), Term("滞る", "とどこおる"), Term("手近", "てぢか"), Term("下取り", "したどり"), Term("下心", "したごころ"), Term("原典", "げんてん"), Term("海路", "かいろ"), Term("産休", "さんきゅう"), Term("甘口", "あまくち"), Term("転校", "てんこう"), Term("窮乏", "きゅうぼう"), Term("遠回り", "とおまわり"), Term("決行", "けっこう"), Term("呼び止める", "よびとめる"), Term("語句", "ごく"), Term("家来", "けらい"), Term("概略", "がいりゃく"), Term("片言", "かたこと"), Term("隔たる", "へだたる"), Term("仕切る", "しきる"), Term("諮る", "はかる"), Term("持ち切り", "もちきり"), Term("優越", "ゆうえつ"), Term("取り調べる", "とりしらべる"), Term("取り立てる", "とりたてる"), Term("首飾り", "くびかざり"), Term("愛憎", "あいぞう"), Term("口ずさむ", "くちずさむ"), Term("気流", "きりゅう"), Term("記名", "きめい"), Term("照合", "しょうごう"), Term("澄ます", "すます"), Term("潜入", "せんにゅう"), Term("継ぎ目", "つぎめ"), Term("兼用", "けんよう"), Term("宙返り", "ちゅうがえり"), Term("伝来", "でんらい"), Term("統率", "とうそつ"), Term("悩ましい", "なやましい"), Term("高尚", "こうしょう"), Term("回覧", "かいらん"), Term("封建", "ほうけん"), Term("山腹", "さんぷく"), Term("残金", "ざんきん"), Term("然しながら", "しかしながら"), Term("寄り掛かる", "よりかかる"), Term("捩れる", "ねじれる"), Term("誂える", "あつらえる"), Term("難い", "かたい"), Term("くらい", "くらい"), Term("オレンジ", "オレンジ"), Term("ボルト", "ボルト"), Term("レース", "レース"), Term("セール", "セール"), Term("タイマー", "タイマー"), Term("アンコール", "アンコール"), Term("ソロ", "ソロ"), Term("天井", "てんじょう"), Term("世論", "よろん"), Term("日向", "ひなた"), Term("降伏", "こうふく"), Term("自尊心", "じそんしん"), Term("乳", "ちち"), Term("酸", "さん"), Term("雄", "おす"), Term("骨董品", "こっとうひん"), Term("獣", "けもの"), Term("焚き火", "たきび"), Term("蓮", "はす"), Term("周", "しゅう"), Term("接続詞", "せつぞくし"), Term("腸", "ちょう"), Term("自動詞", "じどうし"), Term("修飾", "しゅうしょく"), Term("蒸留", "じょうりゅう"), Term("他動詞", "たどうし"), Term("ショック", "ショック"), Term("ロープ", "ロープ"), Term("データ", "データ"), Term("サイズ", "サイズ"), Term("デザイン", "デザイン"), Term("システム", "システム"), Term("カンニング", "カンニング"), Term("ジャズ", "ジャズ"), Term("コンテスト", "コンテスト"), Term("ファン", "ファン"), Term("ストレス", "ストレス"), Term("タイヤ", "タイヤ"), Term("ストライキ", "ストライキ"), Term("ベスト", "ベスト"), Term("デザート", "デザート"), Term("ビジネス", "ビジネス"), Term("ポット", "ポット"), Term("コミュニケーション", "コミュニケーション"), Term("街", "がい"), Term("ソース", "ソース"), Term("ジャンプ", "ジャンプ"), Term("パンク", "パンク"), Term("メロディー", "メロディー"), Term("ウイルス", "ウイルス"), Term("コーナー", "コーナー"), Term("アンケート", "アンケート"), Term("パジャマ", "パジャマ"), Term("タイミング", "タイミング"), Term("ブーム", "ブーム"), Term("アマチュア", "アマチュア"), Term("クイズ", "クイズ"), Term("フロント", "フロント"), Term("パチンコ", "パチンコ"), Term("レギュラー", "レギュラー"), Term("ダウン", "ダウン"), Term("ドライ", "ドライ"), Term("オープン", "オープン"), Term("グラフ", "グラフ"), Term("スタジオ", "スタジオ"), Term("タレント", "タレント"), Term("ムード", "ムード"), Term("和", "わ"), Term("ノイローゼ", "ノイローゼ"), Term("ワット", "ワット"), Term("アルカリ", "アルカリ"), Term("バッジ", "バッジ"), Term("インテリ", "インテリ"), Term("柵", "さく"), Term("カテゴリー", "カテゴリー"), Term("イエス", "イエス"), Term("ドライバー", "ドライバー"), Term("コメント", "コメント"), Term("ナプキン", "ナプキン"), Term("ブーツ", "ブーツ"), Term("ポイント", "ポイント"), Term("サンタクロース", "サンタクロース"), Term("スペース", "スペース"), Term("スポーツカー", "スポーツカー"), Term("フェリー", "フェリー"), Term("レンタカー", "レンタカー"), Term("コンタクト", "コンタクト"), Term("ベストセラー", "ベストセラー"), Term("ラベル", "ラベル"), Term("ゼリー", "ゼリー"), Term("ナイター", "ナイター"), Term("ベース", "ベース"), Term("カクテル", "カクテル"), Term("モニター", "モニター"), Term("コンパス", "コンパス"), Term("デモンストレーション", "デモンストレーション"), Term("キャリア", "キャリア"), Term("キャッチ", "キャッチ"), Term("シック", "シック"), Term("チャイム", "チャイム"), Term("トランジスタ", "トランジスタ"), Term("アクセル", "アクセル"), Term("ストロー", "ストロー"), Term("オンライン", "オンライン"), Term("ポンプ", "ポンプ"), Term("クレーン", "クレーン"), Term("コントラスト", "コントラスト"), Term("サイクル", "サイクル"), Term("ジャンボ", "ジャンボ"), Term("タイル", "タイル"), Term("デッサン", "デッサン"), Term("ボイコット", "ボイコット"), Term("ポジション", "ポジション"), Term("大部", "たいぶ"), Term("樹木", "じゅもく"), Term("土俵", "どひょう"), Term("酪農", "らくのう"), Term("ショー", "ショー"), Term("バー", "バー"), Term("カルテ", "カルテ"), Term("グレー", "グレー"), Term("大金", "たいきん"), Term("戦", "いくさ"), Term("一目", "ひとめ"), Term("遣り遂げる", "やりとげる"), Term("類い", "たぐい"), Term("万人", "ばんにん"), Term("行", "ぎょう"), Term("正しく", "まさしく"), Term("ずぶ濡れ", "ずぶぬれ"), Term("恥", "はじ"), Term("高", "たか"), Term("遅くとも", "おそくとも"), Term("早急", "さっきゅう"), Term("あざ笑う", "あざわらう"), Term("新入生", "しんにゅうせい"), Term("作り", "つくり"), Term("廃れる", "すたれる"), Term("引っ掻く", "ひっかく"), Term("沿い", "ぞい"), Term("相応", "そうおう"), Term("放り出す", "ほうりだす"), Term("其処ら", "そこら"), Term("一重", "ひとえ"), Term("お供", "おとも"), Term("震わせる", "ふるわせる"), Term("先に", "さきに"), Term("故", "こ"), Term("仕来たり", "しきたり"), Term("校", "こう"), Term("呆気ない", "あっけない"), Term("造り", "つくり"), Term("悪どい", "あくどい"), Term("諦め", "あきらめ"), Term("花弁", "はなびら"), Term("盛装", "せいそう"), Term("蹴飛ばす", "けとばす"), Term("濯ぐ", "すすぐ"), Term("気立て", "きだて"), Term("真ん前", "まんまえ"), Term("つり革", "つりかわ"), Term("嵩張る", "かさばる"), Term("郷里", "きょうり"), Term("然程", "さほど"), Term("一頃", "ひところ"), Term("給う", "たまう"), Term("涸れる", "かれる"), Term("嫌々", "いやいや"), Term("恐れ入る", "おそれいる"), Term("中程", "なかほど"), Term("馬鹿馬鹿しい", "ばかばかしい"), Term("腹立ち", "はらだち"), Term("何なり", "なんなり"), Term("演出", "えんしゅつ"), Term("貫禄", "かんろく"), Term("園", "その"), Term("煌々", "こうこう"), Term("軋む", "きしむ"), Term("瞬き", "まばたき"), Term("助動詞", "じょどうし"), Term("植わる", "うわる"), Term("因って", "よって"), Term("接ぐ", "つぐ"), Term("勤まる", "つとまる"), Term("諸に", "もろに"), Term("一筋", "ひとすじ"), Term("放り込む", "ほうりこむ"), Term("噛み切る", "かみきる"), Term("心中", "しんじゅう"), Term("帳", "とばり"), Term("賜る", "たまわる"), Term("湿気る", "しける"), Term("咄嗟", "とっさ"), Term("毟る", "むしる"), Term("手筈", "てはず"), Term("辟易", "へきえき"), Term("嵩む", "かさむ"), Term("宛てる", "あてる"), Term("照り返す", "てりかえす"), Term("朽ちる", "くちる"), Term("問", "もん"), Term("鉄片", "てっぺん"), Term("対辺", "たいへん"), Term("細工", "さいく"), Term("圏", "けん"), Term("供する", "きょうする"), Term("虚ろ", "うつろ"), Term("生真面目", "きまじめ"), Term("赤らむ", "あからむ"), Term("相対", "あいたい"), Term("経緯", "いきさつ"), Term("汚らわしい", "けがらわしい"), Term("抓る", "つねる"), Term("言伝", "ことづて"), Term("纏まり", "まとまり"), Term("駄作", "ださく"), Term("お宮", "おみや"), Term("介抱", "かいほう"), Term("高原", "こうげん"), Term("合わせ", "あわせ"), Term("差し引く", "さしひく"), Term("密度", "みつど"), Term("持続", "じぞく"), Term("治安", "ちあん"), Term("振動", "しんどう"), Term("立体", "りったい"), Term("立法", "りっぽう"), Term("林業", "りんぎょう"), Term("暦", "こよみ"), Term("歯科", "しか"), Term("畜産", "ちくさん"), Term("領海", "りょうかい"), Term("断面", "だんめん"), Term("極楽", "ごくらく"), Term("比重", "ひじゅう"), Term("渦", "うず"), Term("軍服", "ぐんぷく"), Term("仲人", "なこうど"), Term("原点", "げんてん"), Term("渡り鳥", "わたりどり"), Term("配列", "はいれつ"), Term("動員", "どういん"), Term("特許", "とっきょ"), Term("考古学", "こうこがく"), Term("鉱業", "こうぎょう"), Term("合成", "ごうせい"), Term("版画", "はんが"), Term("肥料", "ひりょう"), Term("標語", "ひょうご"), Term("分業", "ぶんぎょう"), Term("分散", "ぶんさん"), Term("文化財", "ぶんかざい"), Term("桟橋", "さんばし"), Term("革新", "かくしん"), Term("学士", "がくし"), Term("司法", "しほう"), Term("飽和", "ほうわ"), Term("さん", "さん"), Term("留める", "とどめる"), Term("にも関わらず", "にもかかわらず"), Term("第一", "だいいち"), Term("どうにか", "どうにか"), Term("スピード", "スピード"), Term("だらけ", "だらけ"), Term("ホール", "ホール"), Term("ルール", "ルール"), Term("きっぱり", "きっぱり"), Term("どうやら", "どうやら"), Term("しょっちゅう", "しょっちゅう"), Term("センス", "センス"), Term("ぶらぶら", "ぶらぶら"), Term("インフレ", "インフレ"), Term("カーペット", "カーペット"), Term("じっくり", "じっくり"), Term("サボる", "サボる"), Term("打", "ダース"), Term("捲る", "まくる"), Term("室", "しつ"), Term("ガイド", "ガイド"), Term("バット", "バット"), Term("メッセージ", "メッセージ"), Term("焦る", "あせる"), Term("毎", "ごと"), Term("拘わる", "こだわる"), Term("授ける", "さずける"), Term("あら", "あら"), Term("チャネル", "チャネル"), Term("ロマンチック", "ロマンチック"), Term("タワー", "タワー"), Term("トラブル", "トラブル"), Term("メーカー", "メーカー"), Term("マスコミ", "マスコミ"), Term("ガレージ", "ガレージ"), Term("垂れる", "たれる"), Term("紛れる", "まぎれる"), Term("露", "つゆ"), Term("あっさり", "あっさり"), Term("ゆとり", "ゆとり"), Term("セックス", "セックス"), Term("カメラマン", "カメラマン"), Term("だぶだぶ", "だぶだぶ"), Term("シート", "シート"), Term("パトカー", "パトカー"), Term("ヒント", "ヒント"), Term("しくじる", "しくじる"), Term("メディア", "メディア"), Term("レントゲン", "レントゲン"), Term("おどおど", "おどおど"), Term("藻掻く", "もがく"), Term("間誤付く", "まごつく"), Term("タイム", "タイム"), Term("跨る", "またがる"), Term("弄る", "いじる"), Term("ずばり", "ずばり"), Term("疎か", "おろそか"), Term("区々", "まちまち"), Term("びっしょり", "びっしょり"), Term("ぺこぺこ", "ぺこぺこ"), Term("ややこしい", "ややこしい"), Term("ずれる", "ずれる"), Term("マーク", "マーク"), Term("コマーシャル", "コマーシャル"), Term("シナリオ", "シナリオ"), Term("アップ", "アップ"), Term("がっちり", "がっちり"), Term("きっちり", "きっちり"), Term("ニュアンス", "ニュアンス"), Term("ミュージック", "ミュージック"), Term("労る", "いたわる"), Term("がっしり", "がっしり"), Term("ずるずる", "ずるずる"), Term("ぞんざい", "ぞんざい"), Term("でかい", "でかい"), Term("歪む", "ゆがむ"), Term("埋まる", "うまる"), Term("ミスプリント", "ミスプリント"), Term("ばてる", "ばてる"), Term("ちょくちょく", "ちょくちょく"), Term("あやふや", "あやふや"), Term("てっきり", "てっきり"), Term("とんだ", "とんだ"), Term("股", "もも"), Term("ぼやける", "ぼやける"), Term("丁目", "ちょうめ"), Term("あべこべ", "あべこべ"), Term("アルミ", "アルミ"), Term("盲点", "もうてん"), Term("仮令", "たとえ"), Term("冬眠", "とうみん"), Term("梅干し", "うめぼし"), Term("ちり取り", "ちりとり"), Term("修行", "しゅぎょう"), Term("類推", "るいすい"), Term("文語", "ぶんご"), Term("屈折", "くっせつ"), Term("縁側", "えんがわ"), Term("蛋白質", "タンパクしつ"), Term("降水", "こうすい"), Term("発芽", "はつが"), Term("うんざり", "うんざり"), Term("なんか", "なんか"), Term("ほっと", "ほっと"), Term("おおい", "おおい"), Term("共", "とも"), Term("ＯＫ", ""), Term("ちらっと", "ちらっと"), Term("嵌まる", "はまる"), Term("がっくり", "がっくり"), Term("くっきり", "くっきり"), Term("ばら撒く", "ばらまく"), Term("がる", "がる"), Term("消去", "しょうきょ"), Term("卯", "う"), Term("ファイル", "ファイル"), Term("レッスン", "レッスン"), Term("ランプ", "ランプ"), Term("ブルー", "ブルー"), Term("ガイドブック", "ガイドブック"), Term("タイピスト", "タイピスト"), Term("アプローチ", "アプローチ"), Term("コントロール", "コントロール"), Term("カット", "カット"), Term("エンジニア", "エンジニア"), Term("ユニーク", "ユニーク"), Term("ユニフォーム", "ユニフォーム"), Term("ソックス", "ソックス"), Term("ナンセンス", "ナンセンス"), Term("ハンガー", "ハンガー"), Term("ブザー", "ブザー"), Term("ポーズ", "ポーズ"), Term("レバー", "レバー"), Term("ニュー", "ニュー"), Term("セクション", "セクション"), Term("タイトル", "タイトル"), Term("チームワーク", "チームワーク"), Term("ライス", "ライス"), Term("レディー", "レディー"), Term("ゲスト", "ゲスト"), Term("スチーム", "スチーム"), Term("スラックス", "スラックス"), Term("ストロボ", "ストロボ"), Term("テレックス", "テレックス"), Term("アラブ", "アラブ"), Term("ファイト", "ファイト"), Term("インフォメーション", "インフォメーション"), Term("オリエンテーション", "オリエンテーション"), Term("免れる", "まぬがれる"), Term("泊", "はく"), Term("鈍る", "にぶる"), Term("化する", "かする"), Term("真下", "ました"), Term("磁器", "じき"), Term("球根", "きゅうこん"), Term("座標", "ざひょう"), Term("失調", "しっちょう"), Term("字体", "じたい"), Term("退化", "たいか"), Term("短波", "たんぱ"), Term("碁盤", "ごばん"), Term("回送", "かいそう"), Term("社宅", "しゃたく"), Term("新興", "しんこう"), Term("庁", "ちょう"), Term("箇", "か"), Term("汚れ", "けがれ"), Term("モーテル", "モーテル"), Term("ドライブイン", "ドライブイン"), Term("ホット", "ホット"), Term("インターフォン", "インターフォン"), Term("ドライクリーニング", "ドライクリーニング"), Term("犠牲", "ぎせい"), Term("告げる", "つげる"), Term("応募", "おうぼ"), Term("愚痴", "ぐち"), Term("固める", "かためる"), Term("言論", "げんろん"), Term("断つ", "たつ"), Term("進行", "しんこう"), Term("不振", "ふしん"), Term("叫び", "さけび"), Term("証", "あかし"), Term("巻", "まき"), Term("蓄積", "ちくせき"), Term("合間", "あいま"), Term("演ずる", "えんずる"), Term("幹", "みき"), Term("本格", "ほんかく"), Term("本場", "ほんば"), Term("私有", "しゆう"), Term("刊行", "かんこう"), Term("本名", "ほんみょう"), Term("麻", "あさ"), Term("民主", "みんしゅ"), Term("名残", "なごり"), Term("幹線", "かんせん"), Term("模索", "もさく"), Term("感慨", "かんがい"), Term("慣れ", "なれ"), Term("慣例", "かんれい"), Term("有機", "ゆうき"), Term("揺らぐ", "ゆらぐ"), Term("手引", "てびき"), Term("質疑", "しつぎ"), Term("簡易", "かんい"), Term("実費", "じっぴ"), Term("了", "りょう"), Term("還暦", "かんれき"), Term("主導", "しゅどう"), Term("和風", "わふう"), Term("眼科", "がんか"), Term("翔る", "かける"), Term("周期", "しゅうき"), Term("共存", "きょうぞん"), Term("就業", "しゅうぎょう"), Term("衆", "しゅう"), Term("重複", "ちょうふく"), Term("住", "じゅう"), Term("祝賀", "しゅくが"), Term("出直し", "でなおし"), Term("先代", "せんだい"), Term("季刊", "きかん"), Term("規格", "きかく"), Term("準じる", "じゅんじる"), Term("準ずる", "じゅんずる"), Term("威力", "いりょく"), Term("運送", "うんそう"), Term("起点", "きてん"), Term("起伏", "きふく"), Term("小児科", "しょうにか"), Term("議事堂", "ぎじどう"), Term("喫茶", "きっさ"), Term("客観", "きゃっかん"), Term("普遍", "ふへん"), Term("異動", "いどう"), Term("優位", "ゆうい"), Term("信任", "しんにん"), Term("共和", "きょうわ"), Term("真っ二つ", "まっぷたつ"), Term("平常", "へいじょう"), Term("漁村", "ぎょそん"), Term("一心", "いっしん"), Term("手際", "てぎわ"), Term("共学", "きょうがく"), Term("共産", "きょうさん"), Term("水田", "すいでん"), Term("横綱", "よこづな"), Term("強行", "きょうこう"), Term("特産", "とくさん"), Term("一律", "いちりつ"), Term("親善", "しんぜん"), Term("教習", "きょうしゅう"), Term("橋渡し", "はしわたし"), Term("正規", "せいき"), Term("興業", "こうぎょう"), Term("印鑑", "いんかん"), Term("控え室", "ひかえしつ"), Term("生計", "せいけい"), Term("感度", "かんど"), Term("折衷", "せっちゅう"), Term("区切り", "くぎり"), Term("専修", "せんしゅう"), Term("戦災", "せんさい"), Term("並びに", "ならびに"), Term("英字", "えいじ"), Term("聞き取り", "ききとり"), Term("加味", "かみ"), Term("膳", "ぜん"), Term("過疎", "かそ"), Term("徴収", "ちょうしゅう"), Term("水気", "みずけ"), Term("運用", "うんよう"), Term("懸賞", "けんしょう"), Term("筒", "つつ"), Term("演習", "えんしゅう"), Term("自主", "じしゅ"), Term("経る", "へる"), Term("一様", "いちよう"), Term("蔵相", "ぞうしょう"), Term("過多", "かた"), Term("軽減", "けいげん"), Term("妥結", "だけつ"), Term("商", "しょう"), Term("一気", "いっき"), Term("隔週", "かくしゅう"), Term("結びつき", "むすびつき"), Term("結び", "むすび"), Term("結束", "けっそく"), Term("漠然", "ばくぜん"), Term("短歌", "たんか"), Term("短大", "たんだい"), Term("弾力", "だんりょく"), Term("茶の間", "ちゃのま"), Term("着目", "ちゃくもく"), Term("抽選", "ちゅうせん"), Term("殿様", "とのさま"), Term("土木", "どぼく"), Term("科", "か"), Term("公認", "こうにん"), Term("公募", "こうぼ"), Term("同級", "どうきゅう"), Term("独裁", "どくさい"), Term("独創", "どくそう"), Term("内陸", "ないりく"), Term("農耕", "のうこう"), Term("納入", "のうにゅう"), Term("合議", "ごうぎ"), Term("倍率", "ばいりつ"), Term("国交", "こっこう"), Term("国有", "こくゆう"), Term("発病", "はつびょう"), Term("壇", "だん"), Term("改修", "かいしゅう"), Term("改定", "かいてい"), Term("微量", "びりょう"), Term("必然", "ひつぜん"), Term("座談会", "ざだんかい"), Term("赴任", "ふにん"), Term("財源", "ざいげん"), Term("複合", "ふくごう"), Term("産婦人科", "さんふじんか"), Term("返還", "へんかん"), Term("膜", "まく"), Term("保育", "ほいく"), Term("保温", "ほおん"), Term("保養", "ほよう"), Term("穂", "ほ"), Term("台無し", "だいなし"), Term("遂げる", "とげる"), Term("添う", "そう"), Term("旦那", "だんな"), Term("薄弱", "はくじゃく"), Term("よそ見", "よそみ"), Term("緩む", "ゆるむ"), Term("耳鼻科", "じびか"), Term("冷蔵", "れいぞう"), Term("取り次ぐ", "とりつぐ"), Term("婉曲", "えんきょく"), Term("籤引き", "くじびき"), Term("煌びやか", "きらびやか"), Term("殊に", "ことに"), Term("点火", "てんか"), Term("ばい菌", "ばいきん"), Term("行き違い", "いきちがい"), Term("帰京", "ききょう"), Term("華々しい", "はなばなしい"), Term("重んずる", "おもんずる"), Term("縮まる", "ちぢまる"), Term("潤う", "うるおう"), Term("掬う", "すくう"), Term("情け深い", "なさけぶかい"), Term("水洗", "すいせん"), Term("付録", "ふろく"), Term("状", "じょう"), Term("休学", "きゅうがく"), Term("民俗", "みんぞく"), Term("養護", "ようご"), Term("一挙に", "いっきょに"), Term("婿", "むこ"), Term("Ｇパン", "パン"), Term("大便", "だいべん"), Term("連なる", "つらなる"), Term("姓名", "せいめい"), Term("清らか", "きよらか"), Term("生臭い", "なまぐさい"), Term("気兼ね", "きがね"), Term("縁談", "えんだん"), Term("切ない", "せつない"), Term("物好き", "ものずき"), Term("錯誤", "さくご"), Term("生ぬるい", "なまぬるい"), Term("駆け足", "かけあし"), Term("心がけ", "こころがけ"), Term("折り返す", "おりかえす"), Term("並列", "へいれつ"), Term("軒並み", "のきなみ"), Term("年輪", "ねんりん"), Term("突っ張る", "つっぱる"), Term("担架", "たんか"), Term("減点", "げんてん"), Term("年号", "ねんごう"), Term("紛らわしい", "まぎらわしい"), Term("化繊", "かせん"), Term("長大", "ちょうだい"), Term("遅らす", "おくらす"), Term("原っぱ", "はらっぱ"), Term("着色", "ちゃくしょく"), Term("化合", "かごう"), Term("何れ何れ", "どれどれ"), Term("纏め", "まとめ"), Term("光熱費", "こうねつひ"), Term("特技", "とくぎ"), Term("雅致", "がち"), Term("粘る", "ねばる"), Term("拝啓", "はいけい"), Term("敬具", "けいぐ"), Term("分母", "ぶんぼ"), Term("擽ったい", "くすぐったい"), Term("嗜好", "しこう"), Term("云々", "うんぬん"), Term("切り替える", "きりかえる"), Term("駆けっこ", "かけっこ"), Term("申し分", "もうしぶん"), Term("私物", "しぶつ"), Term("名産", "めいさん"), Term("余興", "よきょう"), Term("両極", "りょうきょく"), Term("領地", "りょうち"), Term("観覧", "かんらん"), Term("和文", "わぶん"), Term("眼球", "がんきゅう"), Term("修学", "しゅうがく"), Term("気風", "きふう"), Term("来場", "らいじょう"), Term("庶務", "しょむ"), Term("兼業", "けんぎょう"), Term("刷り", "すり"), Term("利根", "りこん"), Term("進呈", "しんてい"), Term("興じる", "きょうじる"), Term("清純", "せいじゅん"), Term("生身", "なまみ"), Term("隠居", "いんきょ"), Term("静的", "せいてき"), Term("切開", "せっかい"), Term("宣教", "せんきょう"), Term("旧知", "きゅうち"), Term("対して", "たいして"), Term("慣用", "かんよう"), Term("華美", "かび"), Term("見世物", "みせもの"), Term("恥じらう", "はじらう"), Term("跡継ぎ", "あとつぎ"), Term("転回", "てんかい"), Term("転任", "てんにん"), Term("等級", "とうきゅう"), Term("果てる", "はてる"), Term("動的", "どうてき"), Term("特派", "とくは"), Term("課外", "かがい"), Term("据え付ける", "すえつける"), Term("反り", "そり"), Term("改悪", "かいあく"), Term("概説", "がいせつ"), Term("産後", "さんご"), Term("熱量", "ねつりょう"), Term("きまり悪い", "きまりわるい"), Term("ど忘れ", "どわすれ"), Term("報ずる", "ほうずる"), Term("ヤング", "ヤング"), Term("１０分", "ぷん"), Term("件", "くだん"), Term("社", "やしろ"), Term("御覧なさい", "ごらんなさい"), Term("機", "はた"), Term("明白", "あからさま"), Term("一見", "いちげん"), Term("きっかり", "きっかり"), Term("掠る", "かする"), Term("いざ", "いざ"), Term("細やか", "こまやか"), Term("業", "ごう"), Term("懐く", "なつく"), Term("気触れる", "かぶれる"), Term("てんで", "てんで"), Term("びり", "びり"), Term("稲光", "いなびかり"), Term("それ故", "それゆえ"), Term("詰る", "なじる"), Term("ダブる", "ダブる"), Term("遣り通す", "やりとおす"), Term("館", "かん"), Term("事によると", "ことによると"), Term("揃い", "そろい"), Term("すばしこい", "すばしこい"), Term("干し物", "ほしもの"), Term("ぐっと", "ぐっと"), Term("ちやほや", "ちやほや"), Term("しぶとい", "しぶとい"), Term("すんなり", "すんなり"), Term("し尿", "しにょう"), Term("海鷂魚", "えい"), Term("沈澱", "ちんでん"), Term("当て字", "あてじ"), Term("道場", "どうじょう"), Term("未", "ひつじ"), Term("チェンジ", "チェンジ"), Term("ホース", "ホース"), Term("レンジ", "レンジ"), Term("ジャンル", "ジャンル"), Term("スプリング", "スプリング"), Term("ダンプ", "ダンプ"), Term("ジャンパー", "ジャンパー"), Term("ティッシュペーパー", "ティッシュペーパー"), Term("フィルター", "フィルター"), Term("ペア", "ペア"), Term("オートマチック", "オートマチック"), Term("マッサージ", "マッサージ"), Term("甕", "かめ"), Term("杯", "さかずき"), Term("間々", "まま"), Term("宝器", "ほうき"), Term("仙", "せん"), Term("罰", "ばち"), Term("凝る", "こごる"), Term("主なる", "おもなる"), Term("歩", "ふ"), Term("甲", "きのえ"), Term("豪儀", "ごうぎ"), Term("古", "いにしえ"), Term("倅", "せがれ"), Term("一敗", "いっぱい"), Term("構え", "かまえ"), Term("干し", "ほし"), Term("式場", "しきじょう"), Term("欲深い", "よくぶかい"), Term("溜まり", "たまり"), Term("謝絶", "しゃぜつ"), Term("取り混ぜる", "とりまぜる"), Term("手回し", "てまわし"), Term("亜科", "あか"), Term("旧事", "きゅうじ"), Term("天地", "てんち"), Term("出切る", "できる"), Term("こげ茶", "こげちゃ"), Term("箇条書き", "かじょうがき"), Term("助", "じょ"), Term("蔵", "くら"), Term("尉", "じょう"), Term("仕舞い", "しまい"), Term("梢", "こずえ"), Term("丁々", "ちょうちょう"), Term("取り替え", "とりかえ"), Term("蕩ける", "とろける"), Term("異見", "いけん"), Term("謙る", "へりくだる"), Term("世辞", "せじ"), Term("萎びる", "しなびる"), Term("延いては", "ひいては"), Term("捕吏", "ほり"), Term("壕", "ごう"), Term("洋灯", "ようとう"), Term("伊", "い"), Term("進度", "しんど"), Term("ＬＡＭＰ", ""), Term("一別", "いちべつ"), Term("数詞", "すうし"), Term("成る丈", "なるたけ"), Term("外方", "そっぽ"), Term("清濁", "せいだく"), Term("局限", "きょくげん"), Term("奉る", "たてまつる"), Term("浅ましい", "あさましい"), Term("契る", "ちぎる"), Term("相", "あい"), Term("下地", "したじ"), Term("真ん円い", "まんまるい"), Term("吹奏", "すいそう"), Term("下番", "かばん"), Term("下吏", "かり"), Term("些事", "さじ"), Term("感無量", "かんむりょう"), Term("すれ違い", "すれちがい"), Term("佳句", "かく"), Term("殿", "しんがり"), Term("点線", "てんせん"), Term("画期", "かっき"), Term("講読", "こうどく"), Term("埋め込む", "うめこむ"), Term("参上", "さんじょう"), Term("偏", "へん"), Term("仕付ける", "しつける"), Term("竿", "さお"), Term("流", "りゅう"), Term("手数", "てすう"), Term("強いて", "しいて"), Term("いっそ", "いっそ"), Term("ぶかぶか", "ぶかぶか"), Term("ドリル", "ドリル"), Term("嫋か", "しなやか"), Term("エアメール", "エアメール"), Term("判", "はん"), Term("ミセス", "ミセス"), Term("きちっと", "きちっと"), Term("カムバック", "カムバック"), Term("ルーズ", "ルーズ"), Term("サンキュー", "サンキュー"), Term("クラブ", "クラブ"), Term("セレモニー", "セレモニー"), Term("タイムリー", "タイムリー"), Term("デコレーション", "デコレーション"), Term("トーン", "トーン"), Term("アワー", "アワー"), Term("ネガ", "ネガ"), Term("インターナショナル", "インターナショナル"), Term("フォーム", "フォーム"), Term("エレガント", "エレガント"), Term("立方", "たちかた"), Term("哉", "かな"), Term("城下", "じょうか"), Term("ずれ", "ずれ"), Term("国定", "こくてい"), Term("雑木", "ぞうき"), Term("霰", "あられ"), Term("鞠", "まり"), Term("インターチェンジ", "インターチェンジ"), Term("サン", "サン"), Term("奴", "やっこ"), Term("基", "もとい"), Term("代", "しろ"), Term("伝言", "つてこと"), Term("魂", "こん"), Term("金蔵", "かねぐら"), Term("長", "おさ"), Term("溝", "こう"), Term("空き間", "あきま"), Term("斑", "ぶち"), Term("凝らす", "こごらす"), Term("違える", "ちがえる"), Term("反", "たん"), Term("艶", "えん"), Term("華奢", "かしゃ"), Term("擦れる", "すれる"), Term("優", "やさ"), Term("嫌に", "いやに"), Term("拗れる", "こじれる"), Term("悪日", "あくにち"), Term("出来物", "できもの"), Term("日当", "にっとう"), Term("嘆", "たん"), Term("ひょっと", "ひょっと"), Term("秭", "し"), Term("ぼやく", "ぼやく"), Term("ぼつぼつ", "ぼつぼつ"), Term("げっそり", "げっそり"), Term("ふんだん", "ふんだん"), Term("於て", "おいて"), Term("弛み", "たるみ"), Term("おっかない", "おっかない"), Term("棟", "とう"), Term("ずらっと", "ずらっと"), Term("投資", "とうし"), Term("古代", "こだい"), Term("進化", "しんか"), Term("固体", "こたい"), Term("奉仕", "ほうし"), Term("収益", "しゅうえき"), Term("統制", "とうせい"), Term("脅迫", "きょうはく"), Term("強制", "きょうせい"), Term("分子", "ぶんし"), Term("小売", "こうり"), Term("聴覚", "ちょうかく"), Term("兵器", "へいき"), Term("気象", "きしょう"), Term("血管", "けっかん"), Term("花粉", "かふん"), Term("軍事", "ぐんじ"), Term("主権", "しゅけん"), Term("鳥居", "とりい"), Term("盾", "たて"), Term("言い訳", "いいわけ"), Term("損失", "そんしつ"), Term("討議", "とうぎ"), Term("連中", "れんちゅう"), Term("沸騰", "ふっとう"), Term("情勢", "じょうせい"), Term("手掛かり", "てがかり"), Term("年生", "ねんせい"), Term("受け継ぐ", "うけつぐ"), Term("落ち込む", "おちこむ"), Term("征服", "せいふく"), Term("追跡", "ついせき"), Term("諸君", "しょくん"), Term("返済", "へんさい"), Term("漂う", "ただよう"), Term("並", "なみ"), Term("単調", "たんちょう"), Term("増し", "まし"), Term("墜落", "ついらく"), Term("形成", "けいせい"), Term("頼み", "たのみ"), Term("逃亡", "とうぼう"), Term("武装", "ぶそう"), Term("問う", "とう"), Term("定める", "さだめる"), Term("監視", "かんし"), Term("新人", "しんじん"), Term("前途", "ぜんと"), Term("側面", "そくめん"), Term("主題", "しゅだい"), Term("待ち望む", "まちのぞむ"), Term("生理", "せいり"), Term("交わす", "かわす"), Term("欲望", "よくぼう"), Term("募る", "つのる"), Term("出産", "しゅっさん"), Term("意向", "いこう"), Term("早める", "はやめる"), Term("着手", "ちゃくしゅ"), Term("手当", "てあて"), Term("破裂", "はれつ"), Term("落ち着き", "おちつき"), Term("不動産", "ふどうさん"), Term("把握", "はあく"), Term("新築", "しんちく"), Term("柔軟", "じゅうなん"), Term("発育", "はついく"), Term("役職", "やくしょく"), Term("追い込む", "おいこむ"), Term("任す", "まかす"), Term("労力", "ろうりょく"), Term("良識", "りょうしき"), Term("同感", "どうかん"), Term("繁殖", "はんしょく"), Term("代用", "だいよう"), Term("捜査", "そうさ"), Term("著書", "ちょしょ"), Term("兆し", "きざし"), Term("強硬", "きょうこう"), Term("阻止", "そし"), Term("強める", "つよめる"), Term("協議", "きょうぎ"), Term("衣料", "いりょう"), Term("退治", "たいじ"), Term("流し", "ながし"), Term("奮闘", "ふんとう"), Term("変革", "へんかく"), Term("偽物", "にせもの"), Term("陶器", "とうき"), Term("形勢", "けいせい"), Term("中毒", "ちゅうどく"), Term("破棄", "はき"), Term("弁護", "べんご"), Term("武力", "ぶりょく"), Term("圧迫", "あっぱく"), Term("加入", "かにゅう"), Term("購読", "こうどく"), Term("簡素", "かんそ"), Term("回収", "かいしゅう"), Term("無論", "むろん"), Term("仕上げ", "しあげ"), Term("滞納", "たいのう"), Term("油絵", "あぶらえ"), Term("総会", "そうかい"), Term("熱湯", "ねっとう"), Term("外観", "がいかん"), Term("未定", "みてい"), Term("一帯", "いったい"), Term("新婚", "しんこん"), Term("転じる", "てんじる"), Term("意欲", "いよく"), Term("個々", "ここ"), Term("収まる", "おさまる"), Term("利息", "りそく"), Term("無言", "むごん"), Term("捕獲", "ほかく"), Term("打ち切る", "うちきる"), Term("引き下げる", "ひきさげる"), Term("便宜", "べんぎ"), Term("破損", "はそん"), Term("老衰", "ろうすい"), Term("放射能", "ほうしゃのう"), Term("調べ", "しらべ"), Term("展望", "てんぼう"), Term("粋", "いき"), Term("風土", "ふうど"), Term("日の丸", "ひのまる"), Term("有り様", "ありさま"), Term("合致", "がっち"), Term("解剖", "かいぼう"), Term("前売り", "まえうり"), Term("核", "かく"), Term("利潤", "りじゅん"), Term("実情", "じつじょう"), Term("邸宅", "ていたく"), Term("人目", "ひとめ"), Term("国産", "こくさん"), Term("区画", "くかく"), Term("劇団", "げきだん"), Term("戦力", "せんりょく"), Term("構想", "こうそう"), Term("異性", "いせい"), Term("据える", "すえる"), Term("申し入れる", "もうしいれる"), Term("一概に", "いちがいに"), Term("無難", "ぶなん"), Term("元来", "がんらい"), Term("購買", "こうばい"), Term("踏まえる", "ふまえる"), Term("軽快", "けいかい"), Term("不順", "ふじゅん"), Term("排水", "はいすい"), Term("台本", "だいほん"), Term("共働き", "ともばたらき"), Term("養成", "ようせい"), Term("丘陵", "きゅうりょう"), Term("連盟", "れんめい"), Term("建て前", "たてまえ"), Term("問屋", "とんや"), Term("心得", "こころえ"), Term("年頃", "としごろ"), Term("料", "りょう"), Term("凌ぐ", "しのぐ"), Term("用件", "ようけん"), Term("褒美", "ほうび"), Term("弾む", "はずむ"), Term("書き取る", "かきとる"), Term("途切れる", "とぎれる"), Term("全快", "ぜんかい"), Term("慣らす", "ならす"), Term("抜かす", "ぬかす"), Term("浸す", "ひたす"), Term("腫れる", "はれる"), Term("臨む", "のぞむ"), Term("丸っきり", "まるっきり"), Term("栄える", "さかえる"), Term("鼾", "いびき"), Term("夥しい", "おびただしい"), Term("脚色", "きゃくしょく"), Term("未開", "みかい"), Term("引っ掛ける", "ひっかける"), Term("重宝", "ちょうほう"), Term("煽てる", "おだてる"), Term("お負け", "おまけ"), Term("冷酷", "れいこく"), Term("差し掛かる", "さしかかる"), Term("担う", "になう"), Term("裾", "すそ"), Term("荒っぽい", "あらっぽい"), Term("煙る", "けむる"), Term("年長", "ねんちょう"), Term("打ち合わせる", "うちあわせる"), Term("掌", "てのひら"), Term("元首", "げんしゅ"), Term("気障", "きざ"), Term("漢語", "かんご"), Term("域外", "いきがい"), Term("閲覧", "えつらん"), Term("遊牧", "ゆうぼく"), Term("保母", "ほぼ"), Term("桐", "きり"), Term("元年", "がんねん"), Term("対面", "たいめん"), Term("出品", "しゅっぴん"), Term("先着", "せんちゃく"), Term("準急", "じゅんきゅう"), Term("弛む", "たるむ"), Term("以て", "もって"), Term("打ち消し", "うちけし"), Term("明くる", "あくる"), Term("洋風", "ようふう")}
-COMMON = {Term("は", "は"), Term("迄", "まで"), Term("北海道", "ほっかいどう"), Term("刑務所", "けいむしょ"), Term("大雪", "おおゆき"), Term("太平洋", "たいへいよう"), Term("狐", "きつね"), Term("歌舞伎", "かぶき"), Term("礼拝", "れいはい"), Term("大西洋", "たいせいよう"), Term("地中海", "ちちゅうかい"), Term("豆腐", "とうふ"), Term("比", "ひ"), Term("阪神", "はんしん"), Term("茶道", "さどう"), Term("植物園", "しょくぶつえん"), Term("北極圏", "ほっきょくけん"), Term("外務省", "がいむしょう"), Term("古墳", "こふん"), Term("平成", "へいせい"), Term("聖地", "せいち"), Term("大名", "だいみょう"), Term("北欧", "ほくおう"), Term("盆栽", "ぼんさい"), Term("北上", "ほくじょう"), Term("気象庁", "きしょうちょう"), Term("大蔵省", "おおくらしょう"), Term("水族館", "すいぞくかん"), Term("修道院", "しゅうどういん"), Term("朝鮮", "ちょうせん"), Term("極東", "きょくとう"), Term("朝鮮半島", "ちょうせんはんとう"), Term("を", "を"), Term("運動場", "うんどうじょう"), Term("烏賊", "いか"), Term("大晦日", "おおみそか"), Term("体育館", "たいいくかん"), Term("両", "りょう"), Term("競技場", "きょうぎじょう"), Term("海老", "えび"), Term("靖国神社", "やすくにじんじゃ"), Term("の", "の"), Term("三鞭酒", "シャンパン"), Term("顔", "かお"), Term("夕食", "ゆうしょく"), Term("野球", "やきゅう"), Term("朝食", "ちょうしょく"), Term("日本語", "にほんご"), Term("弁護士", "べんごし"), Term("委員会", "いいんかい"), Term("喫煙", "きつえん"), Term("交通事故", "こうつうじこ"), Term("科学者", "かがくしゃ"), Term("週末", "しゅうまつ"), Term("悲しみ", "かなしみ"), Term("体重", "たいじゅう"), Term("挨拶", "あいさつ"), Term("離陸", "りりく"), Term("外国語", "がいこくご"), Term("結婚式", "けっこんしき"), Term("解雇", "かいこ"), Term("休日", "きゅうじつ"), Term("無罪", "むざい"), Term("羊", "ひつじ"), Term("高さ", "たかさ"), Term("専門家", "せんもんか"), Term("精通", "せいつう"), Term("支配人", "しはいにん"), Term("忍耐", "にんたい"), Term("信念", "しんねん"), Term("民主主義", "みんしゅしゅぎ"), Term("好奇心", "こうきしん"), Term("裁判官", "さいばんかん"), Term("腕時計", "うでどけい"), Term("奴隷", "どれい"), Term("鯨", "くじら"), Term("難民", "なんみん"), Term("鹿", "しか"), Term("視力", "しりょく"), Term("罰金", "ばっきん"), Term("目撃", "もくげき"), Term("戦後", "せんご"), Term("年金", "ねんきん"), Term("香港", "ほんこん"), Term("寝室", "しんしつ"), Term("物理学", "ぶつりがく"), Term("九州", "きゅうしゅう"), Term("高速道路", "こうそくどうろ"), Term("奇跡", "きせき"), Term("鶴", "つる"), Term("将軍", "しょうぐん"), Term("株価", "かぶか"), Term("飢え", "うえ"), Term("麻薬", "まやく"), Term("中古車", "ちゅうこしゃ"), Term("雑草", "ざっそう"), Term("天使", "てんし"), Term("狼", "おおかみ"), Term("被告", "ひこく"), Term("天", "てん"), Term("搭乗", "とうじょう"), Term("小川", "おがわ"), Term("戦死", "せんし"), Term("小麦粉", "こむぎこ"), Term("生物学", "せいぶつがく"), Term("原子力", "げんしりょく"), Term("中国人", "ちゅうごくじん"), Term("推理小説", "すいりしょうせつ"), Term("洗濯機", "せんたくき"), Term("苦しみ", "くるしみ"), Term("走者", "そうしゃ"), Term("運動会", "うんどうかい"), Term("帝国", "ていこく"), Term("表明", "ひょうめい"), Term("祖国", "そこく"), Term("会長", "かいちょう"), Term("怪物", "かいぶつ"), Term("弾丸", "だんがん"), Term("錠", "じょう"), Term("豚", "ぶた"), Term("燕", "つばめ"), Term("説教", "せっきょう"), Term("民主党", "みんしゅとう"), Term("虐待", "ぎゃくたい"), Term("指揮者", "しきしゃ"), Term("中東", "ちゅうとう"), Term("宇宙飛行士", "うちゅうひこうし"), Term("消費者", "しょうひしゃ"), Term("救急車", "きゅうきゅうしゃ"), Term("天文学", "てんもんがく"), Term("一人息子", "ひとりむすこ"), Term("納豆", "なっとう"), Term("水着", "みずぎ"), Term("防御", "ぼうぎょ"), Term("正月", "しょうがつ"), Term("帆", "ほ"), Term("磁場", "じば"), Term("廃墟", "はいきょ"), Term("鷲", "わし"), Term("学位", "がくい"), Term("水面", "すいめん"), Term("朝日", "あさひ"), Term("土壌", "どじょう"), Term("故意", "こい"), Term("海底", "かいてい"), Term("外人", "がいじん"), Term("消費税", "しょうひぜい"), Term("狂気", "きょうき"), Term("粘土", "ねんど"), Term("人間関係", "にんげんかんけい"), Term("労働組合", "ろうどうくみあい"), Term("日没", "にちぼつ"), Term("警察署", "けいさつしょ"), Term("凧", "たこ"), Term("恐竜", "きょうりゅう"), Term("一位", "いちい"), Term("飲料", "いんりょう"), Term("部族", "ぶぞく"), Term("心理学", "しんりがく"), Term("学費", "がくひ"), Term("伴奏", "ばんそう"), Term("和解", "わかい"), Term("共産主義", "きょうさんしゅぎ"), Term("銀座", "ぎんざ"), Term("人工衛星", "じんこうえいせい"), Term("銃声", "じゅうせい"), Term("手数料", "てすうりょう"), Term("遺伝", "いでん"), Term("遺言", "ゆいごん"), Term("失明", "しつめい"), Term("画像", "がぞう"), Term("領収書", "りょうしゅうしょ"), Term("投手", "とうしゅ"), Term("評論家", "ひょうろんか"), Term("馬車", "ばしゃ"), Term("現行犯", "げんこうはん"), Term("先進国", "せんしんこく"), Term("剣", "けん"), Term("山火事", "やまかじ"), Term("所有権", "しょゆうけん"), Term("旅客機", "りょかくき"), Term("葵", "あおい"), Term("悪夢", "あくむ"), Term("国旗", "こっき"), Term("編集者", "へんしゅうしゃ"), Term("陸軍", "りくぐん"), Term("人権", "じんけん"), Term("汚職", "おしょく"), Term("王室", "おうしつ"), Term("予防接種", "よぼうせっしゅ"), Term("社会学", "しゃかいがく"), Term("氷山", "ひょうざん"), Term("海軍", "かいぐん"), Term("戦略", "せんりゃく"), Term("入場券", "にゅうじょうけん"), Term("絆", "きずな"), Term("雨期", "うき"), Term("公衆電話", "こうしゅうでんわ"), Term("繁華街", "はんかがい"), Term("競走", "きょうそう"), Term("買収", "ばいしゅう"), Term("共和党", "きょうわとう"), Term("空間", "くうかん"), Term("座", "ざ"), Term("掃除機", "そうじき"), Term("伝染病", "でんせんびょう"), Term("創造力", "そうぞうりょく"), Term("指紋", "しもん"), Term("埋葬", "まいそう"), Term("懲役", "ちょうえき"), Term("鶏肉", "けいにく"), Term("狩猟", "しゅりょう"), Term("国民総生産", "こくみんそうせいさん"), Term("昭和", "しょうわ"), Term("雷雨", "らいう"), Term("英文学", "えいぶんがく"), Term("肥満", "ひまん"), Term("損傷", "そんしょう"), Term("大洋", "たいよう"), Term("航空機", "こうくうき"), Term("海賊", "かいぞく"), Term("海面", "かいめん"), Term("開花", "かいか"), Term("探偵", "たんてい"), Term("鴨", "かも"), Term("脱税", "だつぜい"), Term("疑念", "ぎねん"), Term("総選挙", "そうせんきょ"), Term("共同体", "きょうどうたい"), Term("矯正", "きょうせい"), Term("迷路", "めいろ"), Term("盗賊", "とうぞく"), Term("自動販売機", "じどうはんばいき"), Term("大国", "たいこく"), Term("社会保障", "しゃかいほしょう"), Term("所得税", "しょとくぜい"), Term("価値観", "かちかん"), Term("副作用", "ふくさよう"), Term("暗号", "あんごう"), Term("手すり", "てすり"), Term("遺書", "いしょ"), Term("世界大戦", "せかいたいせん"), Term("方法論", "ほうほうろん"), Term("腰痛", "ようつう"), Term("雀", "すずめ"), Term("十一", "じゅういち"), Term("国会議員", "こっかいぎいん"), Term("汚名", "おめい"), Term("人事", "じんじ"), Term("社会問題", "しゃかいもんだい"), Term("筆跡", "ひっせき"), Term("火災保険", "かさいほけん"), Term("関節", "かんせつ"), Term("包囲", "ほうい"), Term("誘拐", "ゆうかい"), Term("幾何学", "きかがく"), Term("紀元前", "きげんぜん"), Term("騎士", "きし"), Term("木星", "もくせい"), Term("調達", "ちょうたつ"), Term("軍人", "ぐんじん"), Term("失策", "しっさく"), Term("資本金", "しほんきん"), Term("枯れ葉", "かれは"), Term("竜", "りゅう"), Term("鷹", "たか"), Term("排出", "はいしゅつ"), Term("教育委員会", "きょういくいいんかい"), Term("船員", "せんいん"), Term("山小屋", "やまごや"), Term("本土", "ほんど"), Term("春休み", "はるやすみ"), Term("中庭", "なかにわ"), Term("選手権", "せんしゅけん"), Term("生化学", "せいかがく"), Term("法律事務所", "ほうりつじむしょ"), Term("仲裁", "ちゅうさい"), Term("保守党", "ほしゅとう"), Term("酔い", "よい"), Term("黒幕", "くろまく"), Term("聖職者", "せいしょくしゃ"), Term("炎症", "えんしょう"), Term("内戦", "ないせん"), Term("音質", "おんしつ"), Term("生命保険", "せいめいほけん"), Term("銅像", "どうぞう"), Term("拷問", "ごうもん"), Term("種子", "しゅし"), Term("証書", "しょうしょ"), Term("大尉", "たいい"), Term("火薬", "かやく"), Term("会計年度", "かいけいねんど"), Term("隔離", "かくり"), Term("釈迦", "しゃか"), Term("評決", "ひょうけつ"), Term("気球", "ききゅう"), Term("抗生物質", "こうせいぶっしつ"), Term("暗礁", "あんしょう"), Term("飢餓", "きが"), Term("明治", "めいじ"), Term("自白", "じはく"), Term("切り札", "きりふだ"), Term("紫外線", "しがいせん"), Term("雨水", "あまみず"), Term("高齢者", "こうれいしゃ"), Term("軍縮", "ぐんしゅく"), Term("防水", "ぼうすい"), Term("憎悪", "ぞうお"), Term("電話機", "でんわき"), Term("大理石", "だいりせき"), Term("死亡率", "しぼうりつ"), Term("お化け", "おばけ"), Term("子会社", "こがいしゃ"), Term("葬儀", "そうぎ"), Term("焼肉", "やきにく"), Term("報復", "ほうふく"), Term("人類学", "じんるいがく"), Term("飛行船", "ひこうせん"), Term("別居", "べっきょ"), Term("意思決定", "いしけってい"), Term("肝臓", "かんぞう"), Term("委任", "いにん"), Term("債権", "さいけん"), Term("燃費", "ねんぴ"), Term("砂浜", "すなはま"), Term("横断歩道", "おうだんほどう"), Term("冷却", "れいきゃく"), Term("国債", "こくさい"), Term("貧血", "ひんけつ"), Term("脳死", "のうし"), Term("国歌", "こっか"), Term("槍", "やり"), Term("氷河", "ひょうが"), Term("株主", "かぶぬし"), Term("高血圧", "こうけつあつ"), Term("転向", "てんこう"), Term("水路", "すいろ"), Term("緑茶", "りょくちゃ"), Term("錫", "すず"), Term("機体", "きたい"), Term("白衣", "はくい"), Term("騎手", "きしゅ"), Term("義務教育", "ぎむきょういく"), Term("皇太子", "こうたいし"), Term("著作権", "ちょさくけん"), Term("救命", "きゅうめい"), Term("浸透", "しんとう"), Term("競売", "きょうばい"), Term("恐慌", "きょうこう"), Term("予知", "よち"), Term("脳波", "のうは"), Term("放射線", "ほうしゃせん"), Term("派閥", "はばつ"), Term("長さ", "ながさ"), Term("信号機", "しんごうき"), Term("落書き", "らくがき"), Term("勲章", "くんしょう"), Term("上院", "じょういん"), Term("有", "ゆう"), Term("発電所", "はつでんしょ"), Term("楽屋", "がくや"), Term("食中毒", "しょくちゅうどく"), Term("優等生", "ゆうとうせい"), Term("入力", "にゅうりょく"), Term("柳", "やなぎ"), Term("日本海", "にほんかい"), Term("油田", "ゆでん"), Term("音声", "おんせい"), Term("交響曲", "こうきょうきょく"), Term("王手", "おうて"), Term("背泳ぎ", "せおよぎ"), Term("古着", "ふるぎ"), Term("樽", "たる"), Term("称号", "しょうごう"), Term("負荷", "ふか"), Term("新世界", "しんせかい"), Term("撤退", "てったい"), Term("士気", "しき"), Term("弾圧", "だんあつ"), Term("亜鉛", "あえん"), Term("文化遺産", "ぶんかいさん"), Term("感染症", "かんせんしょう"), Term("断食", "だんじき"), Term("税率", "ぜいりつ"), Term("無意識", "むいしき"), Term("断絶", "だんぜつ"), Term("請願", "せいがん"), Term("声楽", "せいがく"), Term("大砲", "たいほう"), Term("精神科", "せいしんか"), Term("宇宙空間", "うちゅうくうかん"), Term("羽毛", "うもう"), Term("血縁", "けつえん"), Term("生態系", "せいたいけい"), Term("江戸", "えど"), Term("生息地", "せいそくち"), Term("債券", "さいけん"), Term("債務", "さいむ"), Term("路地", "ろじ"), Term("押収", "おうしゅう"), Term("水死", "すいし"), Term("王妃", "おうひ"), Term("下院", "かいん"), Term("仮面", "かめん"), Term("士官", "しかん"), Term("歌詞", "かし"), Term("盗塁", "とうるい"), Term("花粉症", "かふんしょう"), Term("百姓", "ひゃくしょう"), Term("打率", "だりつ"), Term("連結", "れんけつ"), Term("成金", "なりきん"), Term("童謡", "どうよう"), Term("海水浴場", "かいすいよくじょう"), Term("外交官", "がいこうかん"), Term("潜水艦", "せんすいかん"), Term("核家族", "かくかぞく"), Term("核実験", "かくじっけん"), Term("世襲", "せしゅう"), Term("冷戦", "れいせん"), Term("電卓", "でんたく"), Term("粘膜", "ねんまく"), Term("平泳ぎ", "ひらおよぎ"), Term("国宝", "こくほう"), Term("漢方薬", "かんぽうやく"), Term("国際法", "こくさいほう"), Term("水割り", "みずわり"), Term("覇権", "はけん"), Term("図面", "ずめん"), Term("相乗り", "あいのり"), Term("北海", "ほっかい"), Term("子宮", "しきゅう"), Term("刃物", "はもの"), Term("配当", "はいとう"), Term("合金", "ごうきん"), Term("救世主", "きゅうせいしゅ"), Term("鋼", "はがね"), Term("一条", "いちじょう"), Term("身分証明書", "みぶんしょうめいしょ"), Term("中華", "ちゅうか"), Term("履歴書", "りれきしょ"), Term("商法", "しょうほう"), Term("盲導犬", "もうどうけん"), Term("金貨", "きんか"), Term("思春期", "ししゅんき"), Term("遺伝子", "いでんし"), Term("発電機", "はつでんき"), Term("綱引き", "つなひき"), Term("空軍", "くうぐん"), Term("神道", "しんとう"), Term("皇帝", "こうてい"), Term("車線", "しゃせん"), Term("認証", "にんしょう"), Term("落ち", "おち"), Term("刑法", "けいほう"), Term("乳房", "ちぶさ"), Term("校歌", "こうか"), Term("社会主義", "しゃかいしゅぎ"), Term("社会党", "しゃかいとう"), Term("年功序列", "ねんこうじょれつ"), Term("波長", "はちょう"), Term("嫌悪", "けんお"), Term("抗体", "こうたい"), Term("献血", "けんけつ"), Term("即興", "そっきょう"), Term("触媒", "しょくばい"), Term("金色", "きんいろ"), Term("色気", "いろけ"), Term("北方", "ほっぽう"), Term("実体", "じったい"), Term("公民権", "こうみんけん"), Term("自伝", "じでん"), Term("妖怪", "ようかい"), Term("抽出", "ちゅうしゅつ"), Term("振り込み", "ふりこみ"), Term("精度", "せいど"), Term("発声", "はっせい"), Term("遊び場", "あそびば"), Term("資本主義", "しほんしゅぎ"), Term("親族", "しんぞく"), Term("中隊", "ちゅうたい"), Term("愛称", "あいしょう"), Term("洗礼", "せんれい"), Term("赤旗", "あかはた"), Term("不整脈", "ふせいみゃく"), Term("完全試合", "かんぜんしあい"), Term("海戦", "かいせん"), Term("海上自衛隊", "かいじょうじえいたい"), Term("異端", "いたん"), Term("担保", "たんぽ"), Term("第三者", "だいさんしゃ"), Term("医薬品", "いやくひん"), Term("港湾", "こうわん"), Term("戦艦", "せんかん"), Term("戦前", "せんぜん"), Term("一酸化炭素", "いっさんかたんそ"), Term("専門店", "せんもんてん"), Term("岐阜", "ぎふ"), Term("宣誓", "せんせい"), Term("天文台", "てんもんだい"), Term("三塁打", "さんるいだ"), Term("日食", "にっしょく"), Term("先例", "せんれい"), Term("因子", "いんし"), Term("端末", "たんまつ"), Term("報道機関", "ほうどうきかん"), Term("駅弁", "えきべん"), Term("彼岸", "ひがん"), Term("不渡り", "ふわたり"), Term("肖像", "しょうぞう"), Term("公明党", "こうめいとう"), Term("殺し", "ころし"), Term("合", "ごう"), Term("恩赦", "おんしゃ"), Term("雪国", "ゆきぐに"), Term("書記", "しょき"), Term("化合物", "かごうぶつ"), Term("染色", "せんしょく"), Term("皮革", "ひかく"), Term("洗浄", "せんじょう"), Term("家政婦", "かせいふ"), Term("象牙", "ぞうげ"), Term("試金石", "しきんせき"), Term("塗装", "とそう"), Term("二人三脚", "ににんさんきゃく"), Term("求人", "きゅうじん"), Term("打ち切り", "うちきり"), Term("大仏", "だいぶつ"), Term("怪談", "かいだん"), Term("投機", "とうき"), Term("拍車", "はくしゃ"), Term("血液型", "けつえきがた"), Term("海兵隊", "かいへいたい"), Term("絵本", "えほん"), Term("壁画", "へきが"), Term("開業医", "かいぎょうい"), Term("歩兵", "ほへい"), Term("少佐", "しょうさ"), Term("不倫", "ふりん"), Term("格子", "こうし"), Term("静脈", "じょうみゃく"), Term("核酸", "かくさん"), Term("競泳", "きょうえい"), Term("祭壇", "さいだん"), Term("重要文化財", "じゅうようぶんかざい"), Term("株券", "かぶけん"), Term("背番号", "せばんごう"), Term("感性", "かんせい"), Term("庭木", "にわき"), Term("聖堂", "せいどう"), Term("師団", "しだん"), Term("精製", "せいせい"), Term("肝炎", "かんえん"), Term("健康食品", "けんこうしょくひん"), Term("体罰", "たいばつ"), Term("鎌", "かま"), Term("機関銃", "きかんじゅう"), Term("機動隊", "きどうたい"), Term("機密", "きみつ"), Term("帰化", "きか"), Term("同期", "どうき"), Term("疑問符", "ぎもんふ"), Term("出稼ぎ", "でかせぎ"), Term("脱皮", "だっぴ"), Term("地層", "ちそう"), Term("地雷", "じらい"), Term("拒絶反応", "きょぜつはんのう"), Term("拒否権", "きょひけん"), Term("風速", "ふうそく"), Term("窒素", "ちっそ"), Term("和室", "わしつ"), Term("和牛", "わぎゅう"), Term("終止符", "しゅうしふ"), Term("不祥事", "ふしょうじ"), Term("協奏曲", "きょうそうきょく"), Term("狭心症", "きょうしんしょう"), Term("鎖国", "さこく"), Term("歌唱", "かしょう"), Term("局長", "きょくちょう"), Term("下水道", "げすいどう"), Term("金網", "かなあみ"), Term("金融機関", "きんゆうきかん"), Term("銀河", "ぎんが"), Term("洋食", "ようしょく"), Term("骨格", "こっかく"), Term("空襲", "くうしゅう"), Term("軍団", "ぐんだん"), Term("敬称", "けいしょう"), Term("瀬戸", "せと"), Term("鳥類", "ちょうるい"), Term("国道", "こくどう"), Term("炊飯器", "すいはんき"), Term("首都圏", "しゅとけん"), Term("剣道", "けんどう"), Term("連隊", "れんたい"), Term("検問", "けんもん"), Term("国会議事堂", "こっかいぎじどう"), Term("検閲", "けんえつ"), Term("国庫", "こっこ"), Term("木工", "もっこう"), Term("元日", "がんじつ"), Term("水域", "すいいき"), Term("原告", "げんこく"), Term("玄米", "げんまい"), Term("腎臓", "じんぞう"), Term("孤児院", "こじいん"), Term("仁", "じん"), Term("間取り", "まどり"), Term("原子核", "げんしかく"), Term("青写真", "あおじゃしん"), Term("取締役会", "とりしまりやくかい"), Term("力学", "りきがく"), Term("世界観", "せかいかん"), Term("生理学", "せいりがく"), Term("主筆", "しゅひつ"), Term("再開発", "さいかいはつ"), Term("行政機関", "ぎょうせいきかん"), Term("出塁", "しゅつるい"), Term("紅白", "こうはく"), Term("人工呼吸", "じんこうこきゅう"), Term("社債", "しゃさい"), Term("牧草", "ぼくそう"), Term("忘年会", "ぼうねんかい"), Term("射撃", "しゃげき"), Term("容量", "ようりょう"), Term("治癒", "ちゆ"), Term("地下道", "ちかどう"), Term("日本画", "にほんが"), Term("盗聴", "とうちょう"), Term("公債", "こうさい"), Term("公共料金", "こうきょうりょうきん"), Term("親近感", "しんきんかん"), Term("に", "に"), Term("林檎", "りんご"), Term("薔薇", "ばら"), Term("仕方がない", "しかたがない"), Term("賄賂", "わいろ"), Term("蜘蛛", "くも"), Term("じゃが芋", "じゃがいも"), Term("文通", "ぶんつう"), Term("寿司", "すし"), Term("蛙", "かえる"), Term("乞食", "こじき"), Term("苺", "いちご"), Term("悪意", "あくい"), Term("人参", "にんじん"), Term("罠", "わな"), Term("仮説", "かせつ"), Term("目覚まし時計", "めざましどけい"), Term("電話帳", "でんわちょう"), Term("基督", "キリスト"), Term("航空券", "こうくうけん"), Term("大文字", "おおもじ"), Term("玉蜀黍", "とうもろこし"), Term("慈悲", "じひ"), Term("捻挫", "ねんざ"), Term("麻雀", "マージャン"), Term("週刊誌", "しゅうかんし"), Term("肉眼", "にくがん"), Term("西瓜", "すいか"), Term("知覚", "ちかく"), Term("痣", "あざ"), Term("鯉", "こい"), Term("贔屓", "ひいき"), Term("赤面", "せきめん"), Term("掲示板", "けいじばん"), Term("発散", "はっさん"), Term("天ぷら", "てんぷら"), Term("味噌汁", "みそしる"), Term("すき焼き", "すきやき"), Term("呪い", "のろい"), Term("野蛮", "やばん"), Term("正装", "せいそう"), Term("運転士", "うんてんし"), Term("非常口", "ひじょうぐち"), Term("虎列剌", "コレラ"), Term("阿呆", "あほ"), Term("北風", "きたかぜ"), Term("乗車券", "じょうしゃけん"), Term("独学", "どくがく"), Term("同化", "どうか"), Term("乾期", "かんき"), Term("寒波", "かんぱ"), Term("錨", "いかり"), Term("麒麟", "きりん"), Term("歩行者", "ほこうしゃ"), Term("魔術", "まじゅつ"), Term("万引", "まんびき"), Term("車椅子", "くるまいす"), Term("同棲", "どうせい"), Term("蝉", "せみ"), Term("冬休み", "ふゆやすみ"), Term("脇役", "わきやく"), Term("眉毛", "まゆげ"), Term("人見知り", "ひとみしり"), Term("体温計", "たいおんけい"), Term("独楽", "こま"), Term("胡瓜", "きゅうり"), Term("優越感", "ゆうえつかん"), Term("鮪", "まぐろ"), Term("利己主義", "りこしゅぎ"), Term("初恋", "はつこい"), Term("蜻蛉", "とんぼ"), Term("段落", "だんらく"), Term("診療所", "しんりょうしょ"), Term("月食", "げっしょく"), Term("敷金", "しききん"), Term("山葵", "わさび"), Term("盲腸", "もうちょう"), Term("派生", "はせい"), Term("薔薇色", "バラいろ"), Term("品詞", "ひんし"), Term("幻覚", "げんかく"), Term("寝言", "ねごと"), Term("鯛", "たい"), Term("侮蔑", "ぶべつ"), Term("日光浴", "にっこうよく"), Term("猫背", "ねこぜ"), Term("飲料水", "いんりょうすい"), Term("渦巻き", "うずまき"), Term("停学", "ていがく"), Term("葱", "ねぎ"), Term("貨車", "かしゃ"), Term("漢文", "かんぶん"), Term("水色", "みずいろ"), Term("吹き溜まり", "ふきだまり"), Term("焼酎", "しょうちゅう"), Term("相槌", "あいづち"), Term("滑走路", "かっそうろ"), Term("紀元", "きげん"), Term("散らし", "ちらし"), Term("余談", "よだん"), Term("煎餅", "せんべい"), Term("唐辛子", "とうがらし"), Term("さつま芋", "さつまいも"), Term("蛍", "ほたる"), Term("芸能人", "げいのうじん"), Term("法学部", "ほうがくぶ"), Term("野暮", "やぼ"), Term("ひき肉", "ひきにく"), Term("初詣で", "はつもうで"), Term("南瓜", "かぼちゃ"), Term("疎外", "そがい"), Term("搾取", "さくしゅ"), Term("座禅", "ざぜん"), Term("拉麺", "ラーメン"), Term("黴", "かび"), Term("鞦韆", "ぶらんこ"), Term("音楽家", "おんがくか"), Term("警察官", "けいさつかん"), Term("中国語", "ちゅうごくご"), Term("入学試験", "にゅうがくしけん"), Term("想像力", "そうぞうりょく"), Term("日常生活", "にちじょうせいかつ"), Term("傲慢", "ごうまん"), Term("経済学", "けいざいがく"), Term("作曲家", "さっきょくか"), Term("建築家", "けんちくか"), Term("日本料理", "にほんりょうり"), Term("運転免許", "うんてんめんきょ"), Term("演奏会", "えんそうかい"), Term("環境問題", "かんきょうもんだい"), Term("二酸化炭素", "にさんかたんそ"), Term("大蒜", "にんにく"), Term("中華料理", "ちゅうかりょうり"), Term("四国", "しこく"), Term("廃棄物", "はいきぶつ"), Term("携帯電話", "けいたいでんわ"), Term("温度計", "おんどけい"), Term("競争力", "きょうそうりょく"), Term("琵琶湖", "びわこ"), Term("電話番号", "でんわばんごう"), Term("記者会見", "きしゃかいけん"), Term("飲酒運転", "いんしゅうんてん"), Term("集中力", "しゅうちゅうりょく"), Term("会計士", "かいけいし"), Term("子育て", "こそだて"), Term("商店街", "しょうてんがい"), Term("損害賠償", "そんがいばいしょう"), Term("江戸時代", "えどじだい"), Term("新潟", "にいがた"), Term("牡蠣", "かき"), Term("化学物質", "かがくぶっしつ"), Term("労働力", "ろうどうりょく"), Term("写真家", "しゃしんか"), Term("鮫", "さめ"), Term("航空会社", "こうくうがいしゃ"), Term("血液検査", "けつえきけんさ"), Term("自然環境", "しぜんかんきょう"), Term("つま先", "つまさき"), Term("建築物", "けんちくぶつ"), Term("転送", "てんそう"), Term("路線図", "ろせんず"), Term("未成年者", "みせいねんしゃ"), Term("便秘", "べんぴ"), Term("戦闘機", "せんとうき"), Term("旬", "しゅん"), Term("雛祭", "ひなまつり"), Term("多様性", "たようせい"), Term("巷", "ちまた"), Term("越幾斯", "エキス"), Term("痔", "じ"), Term("ゴミ箱", "ゴミばこ"), Term("痴漢", "ちかん"), Term("依存症", "いぞんしょう"), Term("狸", "たぬき"), Term("麺", "めん"), Term("歯科衛生士", "しかえいせいし"), Term("拡張子", "かくちょうし"), Term("改ざん", "かいざん"), Term("海王星", "かいおうせい"), Term("嘔吐", "おうと"), Term("肩凝り", "かたこり"), Term("吸血鬼", "きゅうけつき"), Term("粗品", "そしな"), Term("驚愕", "きょうがく"), Term("爬虫類", "はちゅうるい"), Term("鯖", "さば"), Term("腫瘍", "しゅよう"), Term("乳首", "ちくび"), Term("蜚蠊", "ごきぶり"), Term("獅子女", "すふぃんくす"), Term("金糸雀", "きんしじゃく"), Term("Γ", ""), Term("Β", ""), Term("Α", ""), Term("か", "か"), Term("も", "も"), Term("よ", "よ"), Term("へ", "へ"), Term("ね", "ね"), Term("な", "な"), Term("さ", "さ"), Term("や", "や"), Term("って", "って"), Term("わ", "わ"), Term("し", "し"), Term("え", "え"), Term("中国", "ちゅうごく"), Term("当地", "とうち"), Term("六月", "ろくがつ"), Term("米国", "べいこく"), Term("最寄り", "もより"), Term("駅前", "えきまえ"), Term("自力", "じりき"), Term("韓国", "かんこく"), Term("谷間", "たにま"), Term("割", "わり"), Term("山々", "やまやま"), Term("東北", "とうほく"), Term("更新", "こうしん"), Term("伸び", "のび"), Term("踊り子", "おどりこ"), Term("尺度", "しゃくど"), Term("外側", "そとがわ"), Term("公会堂", "こうかいどう"), Term("日米", "にちべい"), Term("片隅", "かたすみ"), Term("欧州", "おうしゅう"), Term("館内", "かんない"), Term("小僧", "こぞう"), Term("上げ", "あげ"), Term("台湾", "たいわん"), Term("菜園", "さいえん"), Term("日数", "にっすう"), Term("楽園", "らくえん"), Term("本領", "ほんりょう"), Term("湖畔", "こはん"), Term("仕込み", "しこみ"), Term("接待", "せったい"), Term("愛国", "あいこく"), Term("奥行き", "おくゆき"), Term("新米", "しんまい"), Term("清新", "せいしん"), Term("部数", "ぶすう"), Term("北朝鮮", "きたちょうせん"), Term("勝手", "かって"), Term("市街地", "しがいち"), Term("拘置所", "こうちしょ"), Term("肝要", "かんよう"), Term("中南米", "ちゅうなんべい"), Term("法王", "ほうおう"), Term("取り組み", "とりくみ"), Term("手形", "てがた"), Term("文部省", "もんぶしょう"), Term("新入", "しんにゅう"), Term("二番", "にばん"), Term("院内", "いんない"), Term("通産省", "つうさんしょう"), Term("新手", "あらて"), Term("天文", "てんもん"), Term("小道具", "こどうぐ"), Term("泥沼", "どろぬま"), Term("更正", "こうせい"), Term("絞り", "しぼり"), Term("防衛庁", "ぼうえいちょう"), Term("三枚", "さんまい"), Term("子牛", "こうし"), Term("目玉", "めだま"), Term("枯れ木", "かれき"), Term("大麦", "おおむぎ"), Term("分岐", "ぶんき"), Term("下見", "したみ"), Term("親睦", "しんぼく"), Term("風呂屋", "ふろや"), Term("英国", "えいこく"), Term("鎧", "よろい"), Term("父", "ちち"), Term("母", "はは"), Term("私たち", "わたしたち"), Term("人々", "ひとびと"), Term("東京", "とうきょう"), Term("金持ち", "かねもち"), Term("一週間", "いっしゅうかん"), Term("伯父", "おじ"), Term("当然", "とうぜん"), Term("京都", "きょうと"), Term("若者", "わかもの"), Term("限り", "かぎり"), Term("不可能", "ふかのう"), Term("三人", "さんにん"), Term("言うまでもない", "いうまでもない"), Term("昨年", "さくねん"), Term("何度", "なんど"), Term("実に", "じつに"), Term("聴衆", "ちょうしゅう"), Term("見つめる", "みつめる"), Term("年上", "としうえ"), Term("互いに", "たがいに"), Term("労働者", "ろうどうしゃ"), Term("四月", "しがつ"), Term("人前", "ひとまえ"), Term("可能性", "かのうせい"), Term("振る舞い", "ふるまい"), Term("頑張る", "がんばる"), Term("新車", "しんしゃ"), Term("全力", "ぜんりょく"), Term("看護婦", "かんごふ"), Term("名声", "めいせい"), Term("地面", "じめん"), Term("見知らぬ", "みしらぬ"), Term("市長", "しちょう"), Term("疑い", "うたがい"), Term("伯母", "おば"), Term("主人", "しゅじん"), Term("時半", "じはん"), Term("一般的", "いっぱんてき"), Term("自ら", "みずから"), Term("我が", "わが"), Term("同然", "どうぜん"), Term("懸命", "けんめい"), Term("無実", "むじつ"), Term("暗闇", "くらやみ"), Term("自分自身", "じぶんじしん"), Term("多額", "たがく"), Term("報告書", "ほうこくしょ"), Term("余りに", "あまりに"), Term("待たせる", "またせる"), Term("今や", "いまや"), Term("何回", "なんかい"), Term("賞賛", "しょうさん"), Term("有罪", "ゆうざい"), Term("仲良く", "なかよく"), Term("熊", "くま"), Term("放課後", "ほうかご"), Term("最新", "さいしん"), Term("裕福", "ゆうふく"), Term("何事", "なにごと"), Term("知り合う", "しりあう"), Term("連れる", "つれる"), Term("疑わしい", "うたがわしい"), Term("考え方", "かんがえかた"), Term("我が国", "わがくに"), Term("芸術家", "げいじゅつか"), Term("五月", "ごがつ"), Term("我が家", "わがや"), Term("群衆", "ぐんしゅう"), Term("長年", "ながねん"), Term("蛇", "へび"), Term("応える", "こたえる"), Term("持ち主", "もちぬし"), Term("多数", "たすう"), Term("使い方", "つかいかた"), Term("次第に", "しだいに"), Term("病人", "びょうにん"), Term("大雨", "おおあめ"), Term("危うく", "あやうく"), Term("小説家", "しょうせつか"), Term("習得", "しゅうとく"), Term("三月", "さんがつ"), Term("生涯", "しょうがい"), Term("隣人", "りんじん"), Term("振り返る", "ふりかえる"), Term("悪天候", "あくてんこう"), Term("所有", "しょゆう"), Term("歩き回る", "あるきまわる"), Term("七月", "しちがつ"), Term("最良", "さいりょう"), Term("一枚", "いちまい"), Term("外見", "がいけん"), Term("万事", "ばんじ"), Term("大量", "たいりょう"), Term("囚人", "しゅうじん"), Term("定刻", "ていこく"), Term("村人", "むらびと"), Term("最大限", "さいだいげん"), Term("経済的", "けいざいてき"), Term("巻き込む", "まきこむ"), Term("役に立たない", "やくにたたない"), Term("帰国", "きこく"), Term("二月", "にがつ"), Term("手助け", "てだすけ"), Term("口論", "こうろん"), Term("切望", "せつぼう"), Term("両手", "りょうて"), Term("同社", "どうしゃ"), Term("初心者", "しょしんしゃ"), Term("最悪", "さいあく"), Term("大家族", "だいかぞく"), Term("野原", "のはら"), Term("待たす", "またす"), Term("無関心", "むかんしん"), Term("社会的", "しゃかいてき"), Term("個人的", "こじんてき"), Term("仮に", "かりに"), Term("八月", "はちがつ"), Term("真夜中", "まよなか"), Term("基本的", "きほんてき"), Term("死後", "しご"), Term("思いやり", "おもいやり"), Term("引き継ぐ", "ひきつぐ"), Term("無理やり", "むりやり"), Term("押し入る", "おしいる"), Term("容疑者", "ようぎしゃ"), Term("数日", "すうじつ"), Term("新型", "しんがた"), Term("町中", "まちなか"), Term("職場", "しょくば"), Term("二階", "にかい"), Term("綴り", "つづり"), Term("叫び声", "さけびごえ"), Term("真の", "しんの"), Term("言い方", "いいかた"), Term("寛大", "かんだい"), Term("年下", "としした"), Term("社員", "しゃいん"), Term("市内", "しない"), Term("乗組員", "のりくみいん"), Term("船長", "せんちょう"), Term("本屋", "ほんや"), Term("何百", "なんびゃく"), Term("出席者", "しゅっせきしゃ"), Term("木々", "きぎ"), Term("山頂", "さんちょう"), Term("一員", "いちいん"), Term("顧客", "こきゃく"), Term("苦難", "くなん"), Term("好機", "こうき"), Term("三度", "さんど"), Term("地上", "ちじょう"), Term("国々", "くにぐに"), Term("皆様", "みなさま"), Term("学識", "がくしき"), Term("足下", "あしもと"), Term("鶏", "にわとり"), Term("潔白", "けっぱく"), Term("百万", "ひゃくまん"), Term("当社", "とうしゃ"), Term("没頭", "ぼっとう"), Term("辞任", "じにん"), Term("精神的", "せいしんてき"), Term("破滅", "はめつ"), Term("餓死", "がし"), Term("頑張って", "がんばって"), Term("業界", "ぎょうかい"), Term("九月", "くがつ"), Term("釈放", "しゃくほう"), Term("地球上", "ちきゅうじょう"), Term("世界的", "せかいてき"), Term("生み出す", "うみだす"), Term("商用", "しょうよう"), Term("感銘", "かんめい"), Term("立候補", "りっこうほ"), Term("外れ", "はずれ"), Term("強風", "きょうふう"), Term("着実", "ちゃくじつ"), Term("男女", "だんじょ"), Term("支援", "しえん"), Term("自発的", "じはつてき"), Term("選出", "せんしゅつ"), Term("海辺", "うみべ"), Term("沖縄", "おきなわ"), Term("常", "つね"), Term("中でも", "なかでも"), Term("両国", "りょうこく"), Term("断念", "だんねん"), Term("効果的", "こうかてき"), Term("多大", "ただい"), Term("黒人", "こくじん"), Term("両者", "りょうしゃ"), Term("得", "とく"), Term("翌朝", "よくあさ"), Term("入試", "にゅうし"), Term("発する", "はっする"), Term("安否", "あんぴ"), Term("お返し", "おかえし"), Term("満開", "まんかい"), Term("吹き出す", "ふきだす"), Term("判明", "はんめい"), Term("思い切って", "おもいきって"), Term("経営者", "けいえいしゃ"), Term("放つ", "はなつ"), Term("何千", "なんぜん"), Term("主将", "しゅしょう"), Term("由来", "ゆらい"), Term("一足", "いっそく"), Term("本日", "ほんじつ"), Term("蔵書", "ぞうしょ"), Term("繰り返し", "くりかえし"), Term("不愉快", "ふゆかい"), Term("落胆", "らくたん"), Term("雄弁", "ゆうべん"), Term("故国", "ここく"), Term("待ち", "まち"), Term("左手", "ひだりて"), Term("長時間", "ちょうじかん"), Term("食後", "しょくご"), Term("多量", "たりょう"), Term("昇給", "しょうきゅう"), Term("依然として", "いぜんとして"), Term("十月", "じゅうがつ"), Term("残業", "ざんぎょう"), Term("担任", "たんにん"), Term("お手伝い", "おてつだい"), Term("左側", "ひだりがわ"), Term("記念碑", "きねんひ"), Term("十二月", "じゅうにがつ"), Term("保守的", "ほしゅてき"), Term("近年", "きんねん"), Term("手探り", "てさぐり"), Term("目的地", "もくてきち"), Term("見当たる", "みあたる"), Term("体調", "たいちょう"), Term("己", "おのれ"), Term("広大", "こうだい"), Term("告発", "こくはつ"), Term("持ち出す", "もちだす"), Term("無関係", "むかんけい"), Term("数多く", "かずおおく"), Term("右手", "みぎて"), Term("羽目", "はめ"), Term("走り出す", "はしりだす"), Term("視線", "しせん"), Term("有害", "ゆうがい"), Term("切らす", "きらす"), Term("初期", "しょき"), Term("優雅", "ゆうが"), Term("伝統的", "でんとうてき"), Term("追求", "ついきゅう"), Term("少なからず", "すくなからず"), Term("定期的", "ていきてき"), Term("国内", "こくない"), Term("大規模", "だいきぼ"), Term("新年", "しんねん"), Term("路線", "ろせん"), Term("年々", "ねんねん"), Term("右側", "みぎがわ"), Term("前方", "ぜんぽう"), Term("不充分", "ふじゅうぶん"), Term("歴史的", "れきしてき"), Term("来客", "らいきゃく"), Term("除いて", "のぞいて"), Term("典型的", "てんけいてき"), Term("顔色", "かおいろ"), Term("球場", "きゅうじょう"), Term("精力", "せいりょく"), Term("許し", "ゆるし"), Term("賃上げ", "ちんあげ"), Term("泰", "タイ"), Term("遂行", "すいこう"), Term("激怒", "げきど"), Term("言い分", "いいぶん"), Term("一人暮らし", "ひとりぐらし"), Term("告訴", "こくそ"), Term("口調", "くちょう"), Term("荒れる", "あれる"), Term("難問", "なんもん"), Term("在宅", "ざいたく"), Term("作動", "さどう"), Term("共有", "きょうゆう"), Term("上流", "じょうりゅう"), Term("不公平", "ふこうへい"), Term("一団", "いちだん"), Term("前日", "ぜんじつ"), Term("無責任", "むせきにん"), Term("値上げ", "ねあげ"), Term("航空便", "こうくうびん"), Term("近道", "ちかみち"), Term("事務員", "じむいん"), Term("静けさ", "しずけさ"), Term("居合わせる", "いあわせる"), Term("擁護", "ようご"), Term("脅威", "きょうい"), Term("魅了", "みりょう"), Term("重荷", "おもに"), Term("言及", "げんきゅう"), Term("手渡す", "てわたす"), Term("光栄", "こうえい"), Term("良き", "よき"), Term("口座", "こうざ"), Term("水中", "すいちゅう"), Term("目の前", "めのまえ"), Term("災い", "わざわい"), Term("大騒ぎ", "おおさわぎ"), Term("出版社", "しゅっぱんしゃ"), Term("締め出す", "しめだす"), Term("死者", "ししゃ"), Term("部員", "ぶいん"), Term("神経質", "しんけいしつ"), Term("大喜び", "おおよろこび"), Term("自国", "じこく"), Term("飲酒", "いんしゅ"), Term("当局", "とうきょく"), Term("高齢", "こうれい"), Term("宣告", "せんこく"), Term("関心事", "かんしんじ"), Term("愛着", "あいちゃく"), Term("責任者", "せきにんしゃ"), Term("年配", "ねんぱい"), Term("祝福", "しゅくふく"), Term("閉店", "へいてん"), Term("脱走", "だっそう"), Term("青空", "あおぞら"), Term("文字通り", "もじどおり"), Term("半年", "はんとし"), Term("中途半端", "ちゅうとはんぱ"), Term("後半", "こうはん"), Term("三十", "さんじゅう"), Term("出", "で"), Term("間に合わせる", "まにあわせる"), Term("断固", "だんこ"), Term("困惑", "こんわく"), Term("市役所", "しやくしょ"), Term("大多数", "だいたすう"), Term("指名", "しめい"), Term("自宅", "じたく"), Term("由", "よし"), Term("不作", "ふさく"), Term("有用", "ゆうよう"), Term("上映", "じょうえい"), Term("敗北", "はいぼく"), Term("金利", "きんり"), Term("全面的", "ぜんめんてき"), Term("族", "ぞく"), Term("事実上", "じじつじょう"), Term("課する", "かする"), Term("犠牲者", "ぎせいしゃ"), Term("外科医", "げかい"), Term("具体的", "ぐたいてき"), Term("書き込む", "かきこむ"), Term("宝くじ", "たからくじ"), Term("泣き", "なき"), Term("厳格", "げんかく"), Term("栄光", "えいこう"), Term("欠かす", "かかす"), Term("口ぶり", "くちぶり"), Term("好転", "こうてん"), Term("抜き", "ぬき"), Term("手足", "てあし"), Term("新任", "しんにん"), Term("民衆", "みんしゅう"), Term("泊まり", "とまり"), Term("就寝", "しゅうしん"), Term("謝罪", "しゃざい"), Term("陳述", "ちんじゅつ"), Term("遺憾", "いかん"), Term("南部", "なんぶ"), Term("悪人", "あくにん"), Term("安らか", "やすらか"), Term("一時的", "いちじてき"), Term("欲しがる", "ほしがる"), Term("本社", "ほんしゃ"), Term("空席", "くうせき"), Term("土壇場", "どたんば"), Term("注ぎ込む", "そそぎこむ"), Term("傷口", "きずぐち"), Term("寒さ", "さむさ"), Term("間近", "まぢか"), Term("老齢", "ろうれい"), Term("双方", "そうほう"), Term("鎮圧", "ちんあつ"), Term("喜ばす", "よろこばす"), Term("理想的", "りそうてき"), Term("政界", "せいかい"), Term("働かせる", "はたらかせる"), Term("芸", "げい"), Term("開店", "かいてん"), Term("必要性", "ひつようせい"), Term("弱者", "じゃくしゃ"), Term("仕事場", "しごとば"), Term("試練", "しれん"), Term("眠り", "ねむり"), Term("慈善", "じぜん"), Term("躍起", "やっき"), Term("容疑", "ようぎ"), Term("乗馬", "じょうば"), Term("道のり", "みちのり"), Term("老夫婦", "ろうふうふ"), Term("円高", "えんだか"), Term("力量", "りきりょう"), Term("下り坂", "くだりざか"), Term("同じく", "おなじく"), Term("動議", "どうぎ"), Term("打者", "だしゃ"), Term("服用", "ふくよう"), Term("桃", "もも"), Term("仕草", "しぐさ"), Term("遺産", "いさん"), Term("当事者", "とうじしゃ"), Term("専門", "せんもん"), Term("書き方", "かきかた"), Term("見込む", "みこむ"), Term("暴落", "ぼうらく"), Term("半数", "はんすう"), Term("減量", "げんりょう"), Term("敵意", "てきい"), Term("出現", "しゅつげん"), Term("急死", "きゅうし"), Term("研究者", "けんきゅうしゃ"), Term("十一月", "じゅういちがつ"), Term("木造", "もくぞう"), Term("十五", "じゅうご"), Term("戸外", "こがい"), Term("時として", "ときとして"), Term("長持ち", "ながもち"), Term("違法", "いほう"), Term("綿密", "めんみつ"), Term("軽視", "けいし"), Term("片手", "かたて"), Term("着用", "ちゃくよう"), Term("再開", "さいかい"), Term("不快", "ふかい"), Term("数百", "すうひゃく"), Term("惨事", "さんじ"), Term("赤信号", "あかしんごう"), Term("木の実", "このみ"), Term("転職", "てんしょく"), Term("出港", "しゅっこう"), Term("平静", "へいせい"), Term("委員長", "いいんちょう"), Term("一貫", "いっかん"), Term("居心地", "いごこち"), Term("体質", "たいしつ"), Term("王位", "おうい"), Term("早朝", "そうちょう"), Term("何者", "なにもの"), Term("何ら", "なんら"), Term("上機嫌", "じょうきげん"), Term("過激", "かげき"), Term("創設", "そうせつ"), Term("十代", "じゅうだい"), Term("同行", "どうこう"), Term("白人", "はくじん"), Term("学業", "がくぎょう"), Term("前兆", "ぜんちょう"), Term("全世界", "ぜんせかい"), Term("当面", "とうめん"), Term("重み", "おもみ"), Term("丸太", "まるた"), Term("装う", "よそおう"), Term("路上", "ろじょう"), Term("川沿い", "かわぞい"), Term("教徒", "きょうと"), Term("曲がり角", "まがりかど"), Term("小型", "こがた"), Term("新薬", "しんやく"), Term("絶頂", "ぜっちょう"), Term("屈辱", "くつじょく"), Term("良さ", "よさ"), Term("結末", "けつまつ"), Term("建造", "けんぞう"), Term("参加者", "さんかしゃ"), Term("出荷", "しゅっか"), Term("減税", "げんぜい"), Term("亭主", "ていしゅ"), Term("年末", "ねんまつ"), Term("成り行き", "なりゆき"), Term("航行", "こうこう"), Term("行使", "こうし"), Term("凍結", "とうけつ"), Term("当分", "とうぶん"), Term("抽象的", "ちゅうしょうてき"), Term("正反対", "せいはんたい"), Term("受賞", "じゅしょう"), Term("三時", "さんじ"), Term("相性", "あいしょう"), Term("手持ち", "てもち"), Term("歯科医", "しかい"), Term("事例", "じれい"), Term("持ち込む", "もちこむ"), Term("次回", "じかい"), Term("木製", "もくせい"), Term("主として", "しゅとして"), Term("辞表", "じひょう"), Term("肉体的", "にくたいてき"), Term("同伴", "どうはん"), Term("抜群", "ばつぐん"), Term("未亡人", "みぼうじん"), Term("未払い", "みはらい"), Term("悪臭", "あくしゅう"), Term("未解決", "みかいけつ"), Term("新作", "しんさく"), Term("最終的", "さいしゅうてき"), Term("脅し", "おどし"), Term("運行", "うんこう"), Term("押し", "おし"), Term("不気味", "ぶきみ"), Term("満席", "まんせき"), Term("漂流", "ひょうりゅう"), Term("万が一", "まんがいち"), Term("容姿", "ようし"), Term("解消", "かいしょう"), Term("街路", "がいろ"), Term("弟子", "でし"), Term("道理", "どうり"), Term("読み書き", "よみかき"), Term("回想", "かいそう"), Term("衝動", "しょうどう"), Term("同時代", "どうじだい"), Term("消滅", "しょうめつ"), Term("祖父母", "そふぼ"), Term("機器", "きき"), Term("立証", "りっしょう"), Term("買い手", "かいて"), Term("全額", "ぜんがく"), Term("吸い込む", "すいこむ"), Term("到来", "とうらい"), Term("救出", "きゅうしゅつ"), Term("制御", "せいぎょ"), Term("選挙権", "せんきょけん"), Term("予告", "よこく"), Term("具体化", "ぐたいか"), Term("住み心地", "すみごこち"), Term("梨", "なし"), Term("懸念", "けねん"), Term("拳", "こぶし"), Term("母さん", "かあさん"), Term("役員", "やくいん"), Term("通例", "つうれい"), Term("高熱", "こうねつ"), Term("国外", "こくがい"), Term("大企業", "だいきぎょう"), Term("再度", "さいど"), Term("殺害", "さつがい"), Term("周年", "しゅうねん"), Term("散会", "さんかい"), Term("夜空", "よぞら"), Term("継承", "けいしょう"), Term("四方", "しほう"), Term("指数", "しすう"), Term("忠誠", "ちゅうせい"), Term("小声", "こごえ"), Term("狩り", "かり"), Term("式典", "しきてん"), Term("入国", "にゅうこく"), Term("人間的", "にんげんてき"), Term("利", "り"), Term("対戦", "たいせん"), Term("親子", "おやこ"), Term("値上がり", "ねあがり"), Term("別問題", "べつもんだい"), Term("鳴き声", "なきごえ"), Term("困り果てる", "こまりはてる"), Term("お話し中", "おはなしちゅう"), Term("１等", "っとう"), Term("人影", "ひとかげ"), Term("年収", "ねんしゅう"), Term("下落", "げらく"), Term("下流", "かりゅう"), Term("引き渡す", "ひきわたす"), Term("平穏", "へいおん"), Term("科する", "かする"), Term("足首", "あしくび"), Term("頼り", "たより"), Term("花束", "はなたば"), Term("致命的", "ちめいてき"), Term("論評", "ろんぴょう"), Term("壊滅", "かいめつ"), Term("開業", "かいぎょう"), Term("翌年", "よくねん"), Term("確固", "かっこ"), Term("霊", "れい"), Term("浴びせる", "あびせる"), Term("産業界", "さんぎょうかい"), Term("何にも", "なんにも"), Term("特性", "とくせい"), Term("速やか", "すみやか"), Term("輝き", "かがやき"), Term("想定", "そうてい"), Term("議事", "ぎじ"), Term("必須", "ひっす"), Term("実演", "じつえん"), Term("欲する", "ほっする"), Term("著作", "ちょさく"), Term("取り込む", "とりこむ"), Term("取り残す", "とりのこす"), Term("強み", "つよみ"), Term("養子", "ようし"), Term("局面", "きょくめん"), Term("市民権", "しみんけん"), Term("善意", "ぜんい"), Term("君臨", "くんりん"), Term("償い", "つぐない"), Term("乗り", "のり"), Term("足音", "あしおと"), Term("晩年", "ばんねん"), Term("処刑", "しょけい"), Term("展示会", "てんじかい"), Term("本心", "ほんしん"), Term("兆候", "ちょうこう"), Term("考察", "こうさつ"), Term("絶好", "ぜっこう"), Term("行方", "ゆくえ"), Term("定時", "ていじ"), Term("病弱", "びょうじゃく"), Term("熟練", "じゅくれん"), Term("根本的", "こんぽんてき"), Term("閉ざす", "とざす"), Term("直行", "ちょっこう"), Term("白黒", "しろくろ"), Term("対照的", "たいしょうてき"), Term("揚げ句", "あげく"), Term("戦場", "せんじょう"), Term("長距離", "ちょうきょり"), Term("視界", "しかい"), Term("授業料", "じゅぎょうりょう"), Term("受信", "じゅしん"), Term("取り囲む", "とりかこむ"), Term("取得", "しゅとく"), Term("大物", "おおもの"), Term("返信", "へんしん"), Term("発送", "はっそう"), Term("放題", "ほうだい"), Term("互角", "ごかく"), Term("労働条件", "ろうどうじょうけん"), Term("生々しい", "なまなましい"), Term("爆笑", "ばくしょう"), Term("爆撃", "ばくげき"), Term("感情的", "かんじょうてき"), Term("野鳥", "やちょう"), Term("陣地", "じんち"), Term("一刻", "いっこく"), Term("一国", "いっこく"), Term("人気者", "にんきもの"), Term("取締役", "とりしまりやく"), Term("知らん顔", "しらんかお"), Term("親密", "しんみつ"), Term("強固", "きょうこ"), Term("月々", "つきづき"), Term("数値", "すうち"), Term("会費", "かいひ"), Term("回顧", "かいこ"), Term("移植", "いしょく"), Term("不自然", "ふしぜん"), Term("閣僚", "かくりょう"), Term("第一人者", "だいいちにんしゃ"), Term("他社", "たしゃ"), Term("続行", "ぞっこう"), Term("和食", "わしょく"), Term("楽団", "がくだん"), Term("登頂", "とうちょう"), Term("感じ取る", "かんじとる"), Term("観戦", "かんせん"), Term("心臓病", "しんぞうびょう"), Term("世界一", "せかいいち"), Term("帰省", "きせい"), Term("起訴", "きそ"), Term("二十世紀", "にじっせいき"), Term("新品", "しんぴん"), Term("窮地", "きゅうち"), Term("国民的", "こくみんてき"), Term("突入", "とつにゅう"), Term("強要", "きょうよう"), Term("快楽", "かいらく"), Term("持ち帰る", "もちかえる"), Term("計上", "けいじょう"), Term("同級生", "どうきゅうせい"), Term("激突", "げきとつ"), Term("読み方", "よみかた"), Term("聞かす", "きかす"), Term("映し出す", "うつしだす"), Term("物質的", "ぶっしつてき"), Term("復帰", "ふっき"), Term("言い渡す", "いいわたす"), Term("古今", "ここん"), Term("後世", "こうせい"), Term("後部", "こうぶ"), Term("侵害", "しんがい"), Term("前回", "ぜんかい"), Term("度胸", "どきょう"), Term("除名", "じょめい"), Term("批判的", "ひはんてき"), Term("口先", "くちさき"), Term("敬遠", "けいえん"), Term("広範囲", "こうはんい"), Term("繊細", "せんさい"), Term("高額", "こうがく"), Term("合法的", "ごうほうてき"), Term("豪雨", "ごうう"), Term("行き先", "いきさき"), Term("不法", "ふほう"), Term("痕跡", "こんせき"), Term("最小限", "さいしょうげん"), Term("歳月", "さいげつ"), Term("幅広い", "はばひろい"), Term("出場", "しゅつじょう"), Term("支障", "ししょう"), Term("私的", "してき"), Term("裏側", "うらがわ"), Term("裏切り者", "うらぎりもの"), Term("長身", "ちょうしん"), Term("飼い主", "かいぬし"), Term("自動的", "じどうてき"), Term("識別", "しきべつ"), Term("室内", "しつない"), Term("保証人", "ほしょうにん"), Term("投稿", "とうこう"), Term("主治医", "しゅじい"), Term("断じて", "だんじて"), Term("手立て", "てだて"), Term("愛読", "あいどく"), Term("風味", "ふうみ"), Term("授与", "じゅよ"), Term("格段", "かくだん"), Term("説明書", "せつめいしょ"), Term("端的", "たんてき"), Term("家業", "かぎょう"), Term("平均点", "へいきんてん"), Term("卿", "きょう"), Term("願望", "がんぼう"), Term("一族", "いちぞく"), Term("激論", "げきろん"), Term("一方的", "いっぽうてき"), Term("永続", "えいぞく"), Term("英訳", "えいやく"), Term("釈明", "しゃくめい"), Term("数々", "かずかず"), Term("転倒", "てんとう"), Term("薄れる", "うすれる"), Term("立ち入り", "たちいり"), Term("媒体", "ばいたい"), Term("左腕", "さわん"), Term("連れ去る", "つれさる"), Term("稼ぎ", "かせぎ"), Term("人間性", "にんげんせい"), Term("画廊", "がろう"), Term("大差", "たいさ"), Term("回避", "かいひ"), Term("懐", "ふところ"), Term("開演", "かいえん"), Term("炎上", "えんじょう"), Term("帳簿", "ちょうぼ"), Term("核心", "かくしん"), Term("大将", "たいしょう"), Term("悪質", "あくしつ"), Term("苦悩", "くのう"), Term("六十", "ろくじゅう"), Term("待ち構える", "まちかまえる"), Term("圧倒", "あっとう"), Term("男優", "だんゆう"), Term("法規", "ほうき"), Term("走り", "はしり"), Term("背筋", "せすじ"), Term("相手取る", "あいてどる"), Term("寄港", "きこう"), Term("起因", "きいん"), Term("締め", "しめ"), Term("技巧", "ぎこう"), Term("技術的", "ぎじゅつてき"), Term("議席", "ぎせき"), Term("合言葉", "あいことば"), Term("客観的", "きゃっかんてき"), Term("肩書", "かたがき"), Term("急増", "きゅうぞう"), Term("払い戻し", "はらいもどし"), Term("傷跡", "きずあと"), Term("巨額", "きょがく"), Term("昼夜", "ちゅうや"), Term("他国", "たこく"), Term("入り込む", "はいりこむ"), Term("文化的", "ぶんかてき"), Term("島々", "しまじま"), Term("足取り", "あしどり"), Term("増税", "ぞうぜい"), Term("警報", "けいほう"), Term("条項", "じょうこう"), Term("大型", "おおがた"), Term("決定的", "けっていてき"), Term("夜景", "やけい"), Term("絶対的", "ぜったいてき"), Term("建立", "こんりゅう"), Term("突進", "とっしん"), Term("急騰", "きゅうとう"), Term("上場", "じょうじょう"), Term("独創的", "どくそうてき"), Term("特典", "とくてん"), Term("言動", "げんどう"), Term("古来", "こらい"), Term("希薄", "きはく"), Term("特質", "とくしつ"), Term("後方", "こうほう"), Term("暴力団", "ぼうりょくだん"), Term("笑み", "えみ"), Term("欲求", "よっきゅう"), Term("闘争", "とうそう"), Term("歩調", "ほちょう"), Term("高騰", "こうとう"), Term("合理的", "ごうりてき"), Term("身動き", "みうごき"), Term("東部", "とうぶ"), Term("少額", "しょうがく"), Term("挫折", "ざせつ"), Term("投じる", "とうじる"), Term("妻子", "さいし"), Term("有毒", "ゆうどく"), Term("丹念", "たんねん"), Term("掌握", "しょうあく"), Term("目当て", "めあて"), Term("欠如", "けつじょ"), Term("目前", "もくぜん"), Term("不適当", "ふてきとう"), Term("参拝", "さんぱい"), Term("算出", "さんしゅつ"), Term("志願", "しがん"), Term("指標", "しひょう"), Term("死因", "しいん"), Term("死傷者", "ししょうしゃ"), Term("誌", "し"), Term("自制", "じせい"), Term("撤廃", "てっぱい"), Term("射殺", "しゃさつ"), Term("命名", "めいめい"), Term("主たる", "しゅたる"), Term("主席", "しゅせき"), Term("手ごわい", "てごわい"), Term("昔話", "むかしばなし"), Term("兵", "へい"), Term("点差", "てんさ"), Term("積み込む", "つみこむ"), Term("不完全", "ふかんぜん"), Term("専門学校", "せんもんがっこう"), Term("早", "はや"), Term("愛人", "あいじん"), Term("就労", "しゅうろう"), Term("召集", "しょうしゅう"), Term("修復", "しゅうふく"), Term("不安定", "ふあんてい"), Term("初日", "しょにち"), Term("四十", "よんじゅう"), Term("的中", "てきちゅう"), Term("野山", "のやま"), Term("出火", "しゅっか"), Term("意気", "いき"), Term("関係者", "かんけいしゃ"), Term("為替相場", "かわせそうば"), Term("一億", "いちおく"), Term("実地", "じっち"), Term("一年生", "いちねんせい"), Term("美女", "びじょ"), Term("印象的", "いんしょうてき"), Term("論外", "ろんがい"), Term("原案", "げんあん"), Term("生息", "せいそく"), Term("備え", "そなえ"), Term("運航", "うんこう"), Term("往来", "おうらい"), Term("政敵", "せいてき"), Term("通報", "つうほう"), Term("家系", "かけい"), Term("段取り", "だんどり"), Term("手作り", "てづくり"), Term("取り決める", "とりきめる"), Term("受取人", "うけとりにん"), Term("潮流", "ちょうりゅう"), Term("哀悼", "あいとう"), Term("団員", "だんいん"), Term("管理職", "かんりしょく"), Term("撲滅", "ぼくめつ"), Term("確約", "かくやく"), Term("学長", "がくちょう"), Term("衰弱", "すいじゃく"), Term("住人", "じゅうにん"), Term("雄大", "ゆうだい"), Term("免疫", "めんえき"), Term("専門的", "せんもんてき"), Term("久々", "ひさびさ"), Term("監禁", "かんきん"), Term("探求", "たんきゅう"), Term("親しみ", "したしみ"), Term("入札", "にゅうさつ"), Term("声援", "せいえん"), Term("岸辺", "きしべ"), Term("白紙", "はくし"), Term("気力", "きりょく"), Term("証券", "しょうけん"), Term("保険金", "ほけんきん"), Term("技法", "ぎほう"), Term("挿絵", "さしえ"), Term("組み立て", "くみたて"), Term("客室", "きゃくしつ"), Term("急落", "きゅうらく"), Term("大地", "だいち"), Term("巨人", "きょじん"), Term("配送", "はいそう"), Term("頭文字", "かしらもじ"), Term("大手", "おおて"), Term("共用", "きょうよう"), Term("背骨", "せぼね"), Term("一大", "いちだい"), Term("指先", "ゆびさき"), Term("盲人", "もうじん"), Term("上向き", "うわむき"), Term("空き缶", "あきかん"), Term("倫理", "りんり"), Term("繰り上げる", "くりあげる"), Term("代償", "だいしょう"), Term("形跡", "けいせき"), Term("濃厚", "のうこう"), Term("教え子", "おしえご"), Term("劇的", "げきてき"), Term("喜ばしい", "よろこばしい"), Term("年賀状", "ねんがじょう"), Term("嫌疑", "けんぎ"), Term("建設的", "けんせつてき"), Term("潤い", "うるおい"), Term("対外", "たいがい"), Term("検索", "けんさく"), Term("猛威", "もうい"), Term("原本", "げんぽん"), Term("全校", "ぜんこう"), Term("交じり", "まじり"), Term("任期", "にんき"), Term("服役", "ふくえき"), Term("打倒", "だとう"), Term("五十", "ごじゅう"), Term("後援", "こうえん"), Term("効率的", "こうりつてき"), Term("隣接", "りんせつ"), Term("浮かび上がる", "うかびあがる"), Term("村民", "そんみん"), Term("陽光", "ようこう"), Term("免職", "めんしょく"), Term("暗黙", "あんもく"), Term("難点", "なんてん"), Term("難関", "なんかん"), Term("食用", "しょくよう"), Term("校門", "こうもん"), Term("尊厳", "そんげん"), Term("講座", "こうざ"), Term("降雪", "こうせつ"), Term("高給", "こうきゅう"), Term("存分", "ぞんぶん"), Term("内政", "ないせい"), Term("刻々", "こっこく"), Term("黒っぽい", "くろっぽい"), Term("再選", "さいせん"), Term("満々", "まんまん"), Term("偉業", "いぎょう"), Term("小量", "しょうりょう"), Term("細か", "こまか"), Term("道端", "みちばた"), Term("際限", "さいげん"), Term("材質", "ざいしつ"), Term("財団", "ざいだん"), Term("昨今", "さっこん"), Term("上半身", "じょうはんしん"), Term("一人前", "いちにんまえ"), Term("送迎", "そうげい"), Term("賛辞", "さんじ"), Term("銘柄", "めいがら"), Term("史学", "しがく"), Term("史上", "しじょう"), Term("市販", "しはん"), Term("近代的", "きんだいてき"), Term("死去", "しきょ"), Term("私生活", "しせいかつ"), Term("糸口", "いとぐち"), Term("時点", "じてん"), Term("示唆", "しさ"), Term("早期", "そうき"), Term("実験室", "じっけんしつ"), Term("無縁", "むえん"), Term("謝礼", "しゃれい"), Term("若手", "わかて"), Term("誘い", "さそい"), Term("最前列", "さいぜんれつ"), Term("七十", "しちじゅう"), Term("主導権", "しゅどうけん"), Term("得意先", "とくいさき"), Term("手製", "てせい"), Term("手直し", "てなおし"), Term("素", "す"), Term("退役", "たいえき"), Term("名画", "めいが"), Term("受理", "じゅり"), Term("草案", "そうあん"), Term("愛好", "あいこう"), Term("兵役", "へいえき"), Term("修学旅行", "しゅうがくりょこう"), Term("折", "おり"), Term("駆け引き", "かけひき"), Term("悪徳", "あくとく"), Term("寝具", "しんぐ"), Term("君子", "くんし"), Term("本書", "ほんしょ"), Term("暗に", "あんに"), Term("益", "えき"), Term("出資", "しゅっし"), Term("出身者", "しゅっしんしゃ"), Term("船出", "ふなで"), Term("手腕", "しゅわん"), Term("車中", "しゃちゅう"), Term("純金", "じゅんきん"), Term("搭載", "とうさい"), Term("腹心", "ふくしん"), Term("複製", "ふくせい"), Term("初老", "しょろう"), Term("引き上げ", "ひきあげ"), Term("違和感", "いわかん"), Term("不断", "ふだん"), Term("風通し", "かぜとおし"), Term("商談", "しょうだん"), Term("将校", "しょうこう"), Term("小雨", "こさめ"), Term("食", "しょく"), Term("開館", "かいかん"), Term("外車", "がいしゃ"), Term("一新", "いっしん"), Term("厳粛", "げんしゅく"), Term("引き締め", "ひきしめ"), Term("一掃", "いっそう"), Term("内輪", "うちわ"), Term("本調子", "ほんちょうし"), Term("一例", "いちれい"), Term("稲作", "いなさく"), Term("直属", "ちょくぞく"), Term("先導", "せんどう"), Term("路面", "ろめん"), Term("査定", "さてい"), Term("応答", "おうとう"), Term("塗り替える", "ぬりかえる"), Term("英知", "えいち"), Term("横転", "おうてん"), Term("横領", "おうりょう"), Term("王座", "おうざ"), Term("王者", "おうじゃ"), Term("浴槽", "よくそう"), Term("着地", "ちゃくち"), Term("屋内", "おくない"), Term("恩師", "おんし"), Term("通行止め", "つうこうどめ"), Term("音響", "おんきょう"), Term("下部", "かぶ"), Term("自室", "じしつ"), Term("手引書", "てびきしょ"), Term("加算", "かさん"), Term("撤去", "てっきょ"), Term("年率", "ねんりつ"), Term("航路", "こうろ"), Term("荷台", "にだい"), Term("過熱", "かねつ"), Term("体勢", "たいせい"), Term("会期", "かいき"), Term("通話", "つうわ"), Term("開校", "かいこう"), Term("白色", "はくしょく"), Term("徴兵", "ちょうへい"), Term("概算", "がいさん"), Term("二百", "にひゃく"), Term("顔負け", "かおまけ"), Term("一段落", "いちだんらく"), Term("見極める", "みきわめる"), Term("一時期", "いちじき"), Term("根性", "こんじょう"), Term("留め金", "とめがね"), Term("冷夏", "れいか"), Term("空き地", "あきち"), Term("夜勤", "やきん"), Term("企業家", "きぎょうか"), Term("意図的", "いとてき"), Term("奇抜", "きばつ"), Term("強度", "きょうど"), Term("機敏", "きびん"), Term("帰還", "きかん"), Term("出所", "しゅっしょ"), Term("娘婿", "むすめむこ"), Term("就いて", "ついて"), Term("非公式", "ひこうしき"), Term("希少", "きしょう"), Term("芸人", "げいにん"), Term("税法", "ぜいほう"), Term("税引き", "ぜいびき"), Term("草木", "くさき"), Term("首位", "しゅい"), Term("言", "げん"), Term("行き過ぎ", "いきすぎ"), Term("利回り", "りまわり"), Term("生後", "せいご"), Term("急ぎ", "いそぎ"), Term("旧式", "きゅうしき"), Term("築き上げる", "きずきあげる"), Term("虚構", "きょこう"), Term("増水", "ぞうすい"), Term("競合", "きょうごう"), Term("遅延", "ちえん"), Term("致命傷", "ちめいしょう"), Term("容赦", "ようしゃ"), Term("緊迫", "きんぱく"), Term("区役所", "くやくしょ"), Term("陸路", "りくろ"), Term("失脚", "しっきゃく"), Term("制圧", "せいあつ"), Term("異状", "いじょう"), Term("計", "けい"), Term("発注", "はっちゅう"), Term("発端", "ほったん"), Term("動画", "どうが"), Term("瀬戸際", "せとぎわ"), Term("月収", "げっしゅう"), Term("件数", "けんすう"), Term("思い起こす", "おもいおこす"), Term("同胞", "どうほう"), Term("兼", "けん"), Term("検証", "けんしょう"), Term("顕著", "けんちょ"), Term("半額", "はんがく"), Term("言い切る", "いいきる"), Term("税込み", "ぜいこみ"), Term("西部", "せいぶ"), Term("有数", "ゆうすう"), Term("通し", "とおし"), Term("水増し", "みずまし"), Term("時機", "じき"), Term("交通網", "こうつうもう"), Term("売却", "ばいきゃく"), Term("倍増", "ばいぞう"), Term("公金", "こうきん"), Term("公言", "こうげん"), Term("配線", "はいせん"), Term("中腹", "ちゅうふく"), Term("試食", "ししょく"), Term("即刻", "そっこく"), Term("工程", "こうてい"), Term("陣痛", "じんつう"), Term("多発", "たはつ"), Term("州都", "しゅうと"), Term("破り", "やぶり"), Term("高官", "こうかん"), Term("居場所", "いばしょ"), Term("棚上げ", "たなあげ"), Term("高値", "たかね"), Term("北側", "きたがわ"), Term("国務長官", "こくむちょうかん"), Term("加担", "かたん"), Term("根ざす", "ねざす"), Term("二枚", "にまい"), Term("年来", "ねんらい"), Term("年齢層", "ねんれいそう"), Term("再考", "さいこう"), Term("最強", "さいきょう"), Term("年次", "ねんじ"), Term("足掛かり", "あしがかり"), Term("細心", "さいしん"), Term("在住", "ざいじゅう"), Term("創造的", "そうぞうてき"), Term("熱気", "ねっき"), Term("第一歩", "だいいっぽ"), Term("認可", "にんか"), Term("利率", "りりつ"), Term("動植物", "どうしょくぶつ"), Term("仕切り", "しきり"), Term("使者", "ししゃ"), Term("身の回り", "みのまわり"), Term("子女", "しじょ"), Term("信頼性", "しんらいせい"), Term("市政", "しせい"), Term("市立", "しりつ"), Term("指し示す", "さししめす"), Term("支社", "ししゃ"), Term("分科会", "ぶんかかい"), Term("試行錯誤", "しこうさくご"), Term("空爆", "くうばく"), Term("日本式", "にほんしき"), Term("時給", "じきゅう"), Term("時限", "じげん"), Term("真夏", "まなつ"), Term("猶予", "ゆうよ"), Term("大火", "たいか"), Term("不用意", "ふようい"), Term("執行", "しっこう"), Term("景観", "けいかん"), Term("励み", "はげみ"), Term("煩雑", "はんざつ"), Term("完売", "かんばい"), Term("弱気", "よわき"), Term("流動的", "りゅうどうてき"), Term("振り回す", "ふりまわす"), Term("党員", "とういん"), Term("同月", "どうげつ"), Term("手書き", "てがき"), Term("手提げ", "てさげ"), Term("係長", "かかりちょう"), Term("酒屋", "さかや"), Term("冬季", "とうき"), Term("両端", "りょうたん"), Term("入港", "にゅうこう"), Term("需給", "じゅきゅう"), Term("愛犬", "あいけん"), Term("同性", "どうせい"), Term("収量", "しゅうりょう"), Term("愛用", "あいよう"), Term("就学", "しゅうがく"), Term("悪さ", "わるさ"), Term("揺る", "ゆる"), Term("終値", "おわりね"), Term("終盤", "しゅうばん"), Term("圧勝", "あっしょう"), Term("充てる", "あてる"), Term("充電", "じゅうでん"), Term("安らぎ", "やすらぎ"), Term("重圧", "じゅうあつ"), Term("暗雲", "あんうん"), Term("重責", "じゅうせき"), Term("銃器", "じゅうき"), Term("直接的", "ちょくせつてき"), Term("出向く", "でむく"), Term("出馬", "しゅつば"), Term("春先", "はるさき"), Term("計画的", "けいかくてき"), Term("巡回", "じゅんかい"), Term("異様", "いよう"), Term("唐突", "とうとつ"), Term("社屋", "しゃおく"), Term("初対面", "しょたいめん"), Term("初代", "しょだい"), Term("遺体", "いたい"), Term("医", "い"), Term("医院", "いいん"), Term("除去", "じょきょ"), Term("一因", "いちいん"), Term("一円", "いちえん"), Term("踏ん張る", "ふんばる"), Term("法的", "ほうてき"), Term("小学", "しょうがく"), Term("紅潮", "こうちょう"), Term("掛け金", "かけきん"), Term("立ち往生", "たちおうじょう"), Term("小島", "こじま"), Term("貸付", "かしつけ"), Term("一字", "いちじ"), Term("好成績", "こうせいせき"), Term("劣悪", "れつあく"), Term("特大", "とくだい"), Term("利用者", "りようしゃ"), Term("無条件", "むじょうけん"), Term("連勝", "れんしょう"), Term("消息筋", "しょうそくすじ"), Term("履行", "りこう"), Term("笑い声", "わらいごえ"), Term("一代", "いちだい"), Term("一着", "いっちゃく"), Term("上告", "じょうこく"), Term("一塁", "いちるい"), Term("職権", "しょっけん"), Term("寝", "ね"), Term("員数", "いんずう"), Term("因縁", "いんねん"), Term("抱負", "ほうふ"), Term("振り込む", "ふりこむ"), Term("独走", "どくそう"), Term("新規", "しんき"), Term("放浪", "ほうろう"), Term("毒性", "どくせい"), Term("真価", "しんか"), Term("真正面", "ましょうめん"), Term("包括", "ほうかつ"), Term("社会科", "しゃかいか"), Term("駅員", "えきいん"), Term("円安", "えんやす"), Term("宴", "うたげ"), Term("延滞", "えんたい"), Term("後ろ向き", "うしろむき"), Term("記録的", "きろくてき"), Term("表記", "ひょうき"), Term("最盛期", "さいせいき"), Term("臓器", "ぞうき"), Term("夕刻", "ゆうこく"), Term("楼閣", "ろうかく"), Term("応酬", "おうしゅう"), Term("贈呈", "ぞうてい"), Term("横暴", "おうぼう"), Term("横目", "よこめ"), Term("達人", "たつじん"), Term("代役", "だいやく"), Term("高性能", "こうせいのう"), Term("裏方", "うらかた"), Term("冷害", "れいがい"), Term("黄", "き"), Term("流出", "りゅうしゅつ"), Term("来訪", "らいほう"), Term("具", "ぐ"), Term("内定", "ないてい"), Term("国家試験", "こっかしけん"), Term("何やら", "なにやら"), Term("二つ目", "ふたつめ"), Term("夏場", "なつば"), Term("家計簿", "かけいぼ"), Term("内装", "ないそう"), Term("家庭教師", "かていきょうし"), Term("三種", "さんしゅ"), Term("果樹", "かじゅ"), Term("花盛り", "はなざかり"), Term("送信", "そうしん"), Term("奔放", "ほんぽう"), Term("過大", "かだい"), Term("一色", "いっしょく"), Term("保全", "ほぜん"), Term("小売り店", "こうりてん"), Term("保護者", "ほごしゃ"), Term("開き直る", "ひらきなおる"), Term("弁護人", "べんごにん"), Term("草の根", "くさのね"), Term("先決", "せんけつ"), Term("総理", "そうり"), Term("概要", "がいよう"), Term("垣", "かき"), Term("実戦", "じっせん"), Term("格安", "かくやす"), Term("格闘", "かくとう"), Term("総合的", "そうごうてき"), Term("当直", "とうちょく"), Term("核武装", "かくぶそう"), Term("満面", "まんめん"), Term("登記", "とうき"), Term("総勢", "そうぜい"), Term("予想外", "よそうがい"), Term("所蔵", "しょぞう"), Term("相次ぐ", "あいつぐ"), Term("幹事", "かんじ"), Term("遺族", "いぞく"), Term("無利子", "むりし"), Term("入荷", "にゅうか"), Term("町並み", "まちなみ"), Term("管制官", "かんせいかん"), Term("変換", "へんかん"), Term("変わった", "かわった"), Term("鑑定", "かんてい"), Term("間接税", "かんせつぜい"), Term("差出人", "さしだしにん"), Term("間接的", "かんせつてき"), Term("電動", "でんどう"), Term("陥落", "かんらく"), Term("電信", "でんしん"), Term("喪失", "そうしつ"), Term("投下", "とうか"), Term("本国", "ほんごく"), Term("愛しい", "いとしい"), Term("老年", "ろうねん"), Term("一打", "いちだ"), Term("申し入れ", "もうしいれ"), Term("米価", "べいか"), Term("既存", "きそん"), Term("棋士", "きし"), Term("機材", "きざい"), Term("高らか", "たからか"), Term("密林", "みつりん"), Term("留置場", "りゅうちじょう"), Term("巡り会う", "めぐりあう"), Term("長雨", "ながあめ"), Term("流入", "りゅうにゅう"), Term("飛球", "ひきゅう"), Term("帰途", "きと"), Term("認定", "にんてい"), Term("気迫", "きはく"), Term("安上がり", "やすあがり"), Term("議事録", "ぎじろく"), Term("喫する", "きっする"), Term("虐殺", "ぎゃくさつ"), Term("養育", "よういく"), Term("休止", "きゅうし"), Term("沖合", "おきあい"), Term("伝票", "でんぴょう"), Term("水害", "すいがい"), Term("点滴", "てんてき"), Term("給水", "きゅうすい"), Term("給付", "きゅうふ"), Term("組閣", "そかく"), Term("供述", "きょうじゅつ"), Term("供与", "きょうよ"), Term("零細", "れいさい"), Term("相まって", "あいまって"), Term("躍進", "やくしん"), Term("静養", "せいよう"), Term("論者", "ろんしゃ"), Term("強大", "きょうだい"), Term("労使", "ろうし"), Term("胸中", "きょうちゅう"), Term("胸部", "きょうぶ"), Term("興行", "こうぎょう"), Term("極秘", "ごくひ"), Term("開国", "かいこく"), Term("開設", "かいせつ"), Term("緊密", "きんみつ"), Term("近辺", "きんぺん"), Term("近隣", "きんりん"), Term("全文", "ぜんぶん"), Term("地道", "じみち"), Term("生還", "せいかん"), Term("心境", "しんきょう"), Term("落選", "らくせん"), Term("駆使", "くし"), Term("駆除", "くじょ"), Term("駒", "こま"), Term("空手", "からて"), Term("空前", "くうぜん"), Term("空白", "くうはく"), Term("周知", "しゅうち"), Term("力士", "りきし"), Term("落ち度", "おちど"), Term("軍部", "ぐんぶ"), Term("啓発", "けいはつ"), Term("念頭", "ねんとう"), Term("年内", "ねんない"), Term("激戦", "げきせん"), Term("決め手", "きめて"), Term("見所", "みどころ"), Term("穴埋め", "あなうめ"), Term("当方", "とうほう"), Term("顔見知り", "かおみしり"), Term("入党", "にゅうとう"), Term("月面", "げつめん"), Term("見識", "けんしき"), Term("前年", "ぜんねん"), Term("復元", "ふくげん"), Term("南東", "なんとう"), Term("見直し", "みなおし"), Term("摘発", "てきはつ"), Term("前線", "ぜんせん"), Term("前期", "ぜんき"), Term("逆襲", "ぎゃくしゅう"), Term("翌月", "よくげつ"), Term("原発", "げんぱつ"), Term("副社長", "ふくしゃちょう"), Term("幻", "まぼろし"), Term("歌劇", "かげき"), Term("鮮明", "せんめい"), Term("減退", "げんたい"), Term("選別", "せんべつ"), Term("現物", "げんぶつ"), Term("現役", "げんえき"), Term("風潮", "ふうちょう"), Term("獣医", "じゅうい"), Term("最長", "さいちょう"), Term("古都", "こと"), Term("大病", "たいびょう"), Term("後押し", "あとおし"), Term("後始末", "あとしまつ"), Term("選択肢", "せんたくし"), Term("選挙戦", "せんきょせん"), Term("後任", "こうにん"), Term("歌声", "うたごえ"), Term("熱帯魚", "ねったいぎょ"), Term("公私", "こうし"), Term("公職", "こうしょく"), Term("最年少", "さいねんしょう"), Term("公約", "こうやく"), Term("中退", "ちゅうたい"), Term("立ち消え", "たちぎえ"), Term("旋律", "せんりつ"), Term("失態", "しったい"), Term("好感", "こうかん"), Term("好物", "こうぶつ"), Term("広がり", "ひろがり"), Term("控訴", "こうそ"), Term("攻勢", "こうせい"), Term("不穏", "ふおん"), Term("硬直", "こうちょく"), Term("稿", "こう"), Term("高水準", "こうすいじゅん"), Term("定か", "さだか"), Term("高品質", "こうひんしつ"), Term("合宿", "がっしゅく"), Term("戦勝", "せんしょう"), Term("仲介", "ちゅうかい"), Term("解禁", "かいきん"), Term("黒色", "こくしょく"), Term("衰え", "おとろえ"), Term("今夏", "こんか"), Term("閑散", "かんさん"), Term("千里", "せんり"), Term("力点", "りきてん"), Term("不可分", "ふかぶん"), Term("不確実", "ふかくじつ"), Term("頻度", "ひんど"), Term("先入観", "せんにゅうかん"), Term("先制", "せんせい"), Term("再婚", "さいこん"), Term("秒速", "びょうそく"), Term("病名", "びょうめい"), Term("最古", "さいこ"), Term("最高裁", "さいこうさい"), Term("最高峰", "さいこうほう"), Term("最小", "さいしょう"), Term("低迷", "ていめい"), Term("二重", "にじゅう"), Term("最短", "さいたん"), Term("使い分け", "つかいわけ"), Term("財務", "ざいむ"), Term("粒子", "りゅうし"), Term("坂道", "さかみち"), Term("作柄", "さくがら"), Term("札束", "さつたば"), Term("殺意", "さつい"), Term("昼前", "ひるまえ"), Term("走り高跳び", "はしりたかとび"), Term("三塁", "さんるい"), Term("使用者", "しようしゃ"), Term("司会者", "しかいしゃ"), Term("満場一致", "まんじょういっち"), Term("市場調査", "しじょうちょうさ"), Term("立案", "りつあん"), Term("絶大", "ぜつだい"), Term("支部", "しぶ"), Term("発覚", "はっかく"), Term("標高", "ひょうこう"), Term("視聴", "しちょう"), Term("要職", "ようしょく"), Term("資質", "ししつ"), Term("招集", "しょうしゅう"), Term("持ち前", "もちまえ"), Term("浮上", "ふじょう"), Term("必然的", "ひつぜんてき"), Term("席上", "せきじょう"), Term("時期尚早", "じきしょうそう"), Term("朝夕", "あさゆう"), Term("美容師", "びようし"), Term("陳情", "ちんじょう"), Term("自主的", "じしゅてき"), Term("自由化", "じゆうか"), Term("利害関係", "りがいかんけい"), Term("麦", "むぎ"), Term("辞意", "じい"), Term("実家", "じっか"), Term("賢人", "けんじん"), Term("実質的", "じっしつてき"), Term("実証", "じっしょう"), Term("岸壁", "がんぺき"), Term("社内", "しゃない"), Term("全うする", "まっとうする"), Term("車内", "しゃない"), Term("邪", "よこしま"), Term("若葉", "わかば"), Term("不備", "ふび"), Term("守り", "まもり"), Term("祝儀", "しゅうぎ"), Term("昼過ぎ", "ひるすぎ"), Term("手始め", "てはじめ"), Term("買い", "かい"), Term("脳卒中", "のうそっちゅう"), Term("卸", "おろし"), Term("手動", "しゅどう"), Term("口癖", "くちぐせ"), Term("実権", "じっけん"), Term("脳裏", "のうり"), Term("発給", "はっきゅう"), Term("長期的", "ちょうきてき"), Term("修業", "しゅうぎょう"), Term("地方公務員", "ちほうこうむいん"), Term("樹齢", "じゅれい"), Term("収縮", "しゅうしゅく"), Term("裏目", "うらめ"), Term("収録", "しゅうろく"), Term("周到", "しゅうとう"), Term("両輪", "りょうりん"), Term("改築", "かいちく"), Term("修道", "しゅうどう"), Term("名義", "めいぎ"), Term("底力", "そこぢから"), Term("瞬時", "しゅんじ"), Term("終戦", "しゅうせん"), Term("裏面", "りめん"), Term("落語家", "らくごか"), Term("習性", "しゅうせい"), Term("集い", "つどい"), Term("握り", "にぎり"), Term("集積", "しゅうせき"), Term("注入", "ちゅうにゅう"), Term("枠組み", "わくぐみ"), Term("集約", "しゅうやく"), Term("住宅街", "じゅうたくがい"), Term("充足", "じゅうそく"), Term("充当", "じゅうとう"), Term("威勢", "いせい"), Term("雪辱", "せつじょく"), Term("銃弾", "じゅうだん"), Term("祝辞", "しゅくじ"), Term("出願", "しゅつがん"), Term("出展", "しゅってん"), Term("仲間入り", "なかまいり"), Term("準決勝", "じゅんけっしょう"), Term("潤滑油", "じゅんかつゆ"), Term("検察", "けんさつ"), Term("破局", "はきょく"), Term("交友", "こうゆう"), Term("宝飾", "ほうしょく"), Term("異質", "いしつ"), Term("順に", "じゅんに"), Term("卸売物価", "おろしうりぶっか"), Term("移り変わり", "うつりかわり"), Term("別館", "べっかん"), Term("初心", "しょしん"), Term("風当たり", "かぜあたり"), Term("初頭", "しょとう"), Term("所管", "しょかん"), Term("所見", "しょけん"), Term("書名", "しょめい"), Term("駐在", "ちゅうざい"), Term("持ち株", "もちかぶ"), Term("助演", "じょえん"), Term("償還", "しょうかん"), Term("商い", "あきない"), Term("意味合い", "いみあい"), Term("商品券", "しょうひんけん"), Term("柏", "かしわ"), Term("割高", "わりだか"), Term("小児", "しょうに"), Term("挑発", "ちょうはつ"), Term("一戸建て", "いっこだて"), Term("小物", "こもの"), Term("増発", "ぞうはつ"), Term("一座", "いちざ"), Term("床下", "ゆかした"), Term("重き", "おもき"), Term("取り壊し", "とりこわし"), Term("排斥", "はいせき"), Term("廃絶", "はいぜつ"), Term("一式", "いっしき"), Term("凶悪", "きょうあく"), Term("通商", "つうしょう"), Term("敗因", "はいいん"), Term("病室", "びょうしつ"), Term("引き受け", "ひきうけ"), Term("陽性", "ようせい"), Term("一石二鳥", "いっせきにちょう"), Term("敗訴", "はいそ"), Term("発起人", "ほっきにん"), Term("馬券", "ばけん"), Term("敗退", "はいたい"), Term("乗員", "じょういん"), Term("挙式", "きょしき"), Term("敗者", "はいしゃ"), Term("常習", "じょうしゅう"), Term("一辺倒", "いっぺんとう"), Term("常務", "じょうむ"), Term("情景", "じょうけい"), Term("条文", "じょうぶん"), Term("一躍", "いちやく"), Term("参院", "さんいん"), Term("植林", "しょくりん"), Term("色調", "しきちょう"), Term("伸び率", "のびりつ"), Term("走り幅跳び", "はしりはばとび"), Term("信販会社", "しんぱんがいしゃ"), Term("半月", "はんげつ"), Term("新刊", "しんかん"), Term("新風", "しんぷう"), Term("浸水", "しんすい"), Term("品目", "ひんもく"), Term("背信", "はいしん"), Term("真っ向", "まっこう"), Term("雲行き", "くもゆき"), Term("意気込み", "いきごみ"), Term("最低限", "さいていげん"), Term("拠出", "きょしゅつ"), Term("営利", "えいり"), Term("親分", "おやぶん"), Term("永住", "えいじゅう"), Term("身柄", "みがら"), Term("進入", "しんにゅう"), Term("懲罰", "ちょうばつ"), Term("人工的", "じんこうてき"), Term("人出", "ひとで"), Term("異色", "いしょく"), Term("円卓", "えんたく"), Term("人脈", "じんみゃく"), Term("母体", "ぼたい"), Term("幼少", "ようしょう"), Term("買い占める", "かいしめる"), Term("余波", "よは"), Term("空砲", "くうほう"), Term("演壇", "えんだん"), Term("図式", "ずしき"), Term("図柄", "ずがら"), Term("定期便", "ていきびん"), Term("余念", "よねん"), Term("推す", "おす"), Term("余韻", "よいん"), Term("水温", "すいおん"), Term("水彩画", "すいさいが"), Term("小売価格", "こうりかかく"), Term("精神障害", "せいしんしょうがい"), Term("反戦", "はんせん"), Term("塩分", "えんぶん"), Term("便乗", "びんじょう"), Term("随一", "ずいいち"), Term("汚水", "おすい"), Term("寸断", "すんだん"), Term("辛口", "からくち"), Term("小差", "しょうさ"), Term("日の目", "ひのめ"), Term("横行", "おうこう"), Term("梅雨明け", "つゆあけ"), Term("正論", "せいろん"), Term("朝刊", "ちょうかん"), Term("清浄", "せいじょう"), Term("送り込む", "おくりこむ"), Term("生家", "せいか"), Term("生協", "せいきょう"), Term("前身", "ぜんしん"), Term("朗報", "ろうほう"), Term("恩返し", "おんがえし"), Term("穏健", "おんけん"), Term("擁する", "ようする"), Term("常識的", "じょうしきてき"), Term("誓約", "せいやく"), Term("不動", "ふどう"), Term("持ち味", "もちあじ"), Term("下山", "げざん"), Term("離着陸", "りちゃくりく"), Term("射止める", "いとめる"), Term("税収", "ぜいしゅう"), Term("下方", "かほう"), Term("電器", "でんき"), Term("化学肥料", "かがくひりょう"), Term("敷設", "ふせつ"), Term("仮想", "かそう"), Term("接見", "せっけん"), Term("接点", "せってん"), Term("折衝", "せっしょう"), Term("節減", "せつげん"), Term("節度", "せつど"), Term("雪解け", "ゆきどけ"), Term("先々", "さきざき"), Term("先安", "さきやす"), Term("先見", "せんけん"), Term("先人", "せんじん"), Term("逃げ切る", "にげきる"), Term("未知数", "みちすう"), Term("占拠", "せんきょ"), Term("宣戦", "せんせん"), Term("専属", "せんぞく"), Term("可否", "かひ"), Term("川岸", "かわぎし"), Term("鉢植え", "はちうえ"), Term("戦火", "せんか"), Term("戦犯", "せんぱん"), Term("週明け", "しゅうあけ"), Term("杏", "あんず"), Term("融合", "ゆうごう"), Term("舞踊", "ぶよう"), Term("転用", "てんよう"), Term("無制限", "むせいげん"), Term("家財", "かざい"), Term("迷い", "まよい"), Term("家庭科", "かていか"), Term("潜在", "せんざい"), Term("前部", "ぜんぶ"), Term("前面", "ぜんめん"), Term("前夜", "ぜんや"), Term("善戦", "ぜんせん"), Term("火器", "かき"), Term("全権", "ぜんけん"), Term("全社", "ぜんしゃ"), Term("授賞式", "じゅしょうしき"), Term("火種", "ひだね"), Term("全長", "ぜんちょう"), Term("全土", "ぜんど"), Term("民放", "みんぽう"), Term("第一声", "だいいっせい"), Term("乗用車", "じょうようしゃ"), Term("紙面", "しめん"), Term("加盟", "かめい"), Term("慰霊", "いれい"), Term("過渡期", "かとき"), Term("過敏", "かびん"), Term("聴取", "ちょうしゅ"), Term("防戦", "ぼうせん"), Term("会堂", "かいどう"), Term("解約", "かいやく"), Term("回線", "かいせん"), Term("快感", "かいかん"), Term("町民", "ちょうみん"), Term("戒厳令", "かいげんれい"), Term("取りまとめる", "とりまとめる"), Term("改選", "かいせん"), Term("好んで", "このんで"), Term("壮行", "そうこう"), Term("節目", "ふしめ"), Term("連立", "れんりつ"), Term("侵犯", "しんぱん"), Term("海中", "かいちゅう"), Term("投薬", "とうやく"), Term("跳躍", "ちょうやく"), Term("観賞", "かんしょう"), Term("開港", "かいこう"), Term("開票", "かいひょう"), Term("開幕", "かいまく"), Term("本番", "ほんばん"), Term("外壁", "がいへき"), Term("稼働", "かどう"), Term("評議", "ひょうぎ"), Term("発刊", "はっかん"), Term("東経", "とうけい"), Term("宙", "ちゅう"), Term("街路樹", "がいろじゅ"), Term("切り抜き", "きりぬき"), Term("核融合", "かくゆうごう"), Term("閣議", "かくぎ"), Term("隔て", "へだて"), Term("焼死", "しょうし"), Term("学院", "がくいん"), Term("物産", "ぶっさん"), Term("動静", "どうせい"), Term("暴走", "ぼうそう"), Term("社会面", "しゃかいめん"), Term("楽観的", "らっかんてき"), Term("額面", "がくめん"), Term("活況", "かっきょう"), Term("滑走", "かっそう"), Term("異名", "いみょう"), Term("褐色", "かっしょく"), Term("戦時", "せんじ"), Term("場外", "じょうがい"), Term("巻末", "かんまつ"), Term("喚起", "かんき"), Term("喚問", "かんもん"), Term("完敗", "かんぱい"), Term("甘え", "あまえ"), Term("訓示", "くんじ"), Term("発祥", "はっしょう"), Term("管弦楽団", "かんげんがくだん"), Term("数万", "すうまん"), Term("外洋", "がいよう"), Term("緩急", "かんきゅう"), Term("観劇", "かんげき"), Term("円相場", "えんそうば"), Term("関知", "かんち"), Term("含み", "ふくみ"), Term("統括", "とうかつ"), Term("一問", "いちもん"), Term("終局", "しゅうきょく"), Term("混ぜ合わす", "まぜあわす"), Term("生き残り", "いきのこり"), Term("第一線", "だいいっせん"), Term("来店", "らいてん"), Term("基調", "きちょう"), Term("定形", "ていけい"), Term("安らぐ", "やすらぐ"), Term("既成事実", "きせいじじつ"), Term("人一倍", "ひといちばい"), Term("機首", "きしゅ"), Term("情報産業", "じょうほうさんぎょう"), Term("入れ替え", "いれかえ"), Term("自負", "じふ"), Term("引き継ぎ", "ひきつぎ"), Term("全治", "ぜんち"), Term("顔面", "がんめん"), Term("呼び名", "よびな"), Term("特異", "とくい"), Term("足並み", "あしなみ"), Term("気遣い", "きづかい"), Term("気勢", "きせい"), Term("起用", "きよう"), Term("投球", "とうきゅう"), Term("初舞台", "はつぶたい"), Term("偽", "にせ"), Term("起死回生", "きしかいせい"), Term("偏重", "へんちょう"), Term("義母", "ぎぼ"), Term("宮廷", "きゅうてい"), Term("救急", "きゅうきゅう"), Term("求職", "きゅうしょく"), Term("水質", "すいしつ"), Term("究明", "きゅうめい"), Term("給油", "きゅうゆ"), Term("競走馬", "きょうそうば"), Term("停泊", "ていはく"), Term("許諾", "きょだく"), Term("漁獲", "ぎょかく"), Term("教育者", "きょういくしゃ"), Term("快調", "かいちょう"), Term("共済", "きょうさい"), Term("共立", "きょうりつ"), Term("格上げ", "かくあげ"), Term("空輸", "くうゆ"), Term("門前", "もんぜん"), Term("振替", "ふりかえ"), Term("恐喝", "きょうかつ"), Term("教官", "きょうかん"), Term("堅実", "けんじつ"), Term("教職員", "きょうしょくいん"), Term("教団", "きょうだん"), Term("北東", "ほくとう"), Term("講ずる", "こうずる"), Term("降格", "こうかく"), Term("与野党", "よやとう"), Term("危惧", "きぐ"), Term("凝った", "こった"), Term("極力", "きょくりょく"), Term("玉虫色", "たまむしいろ"), Term("勤続", "きんぞく"), Term("錦", "にしき"), Term("筋書き", "すじがき"), Term("近畿", "きんき"), Term("間口", "まぐち"), Term("見返り", "みかえり"), Term("関門", "かんもん"), Term("理", "り"), Term("平年並み", "へいねんなみ"), Term("真顔", "まがお"), Term("区民", "くみん"), Term("辞す", "じす"), Term("薬学", "やくがく"), Term("沿道", "えんどう"), Term("屈指", "くっし"), Term("出撃", "しゅつげき"), Term("片側", "かたがわ"), Term("係官", "かかりかん"), Term("傾注", "けいちゅう"), Term("四本", "よんほん"), Term("完走", "かんそう"), Term("躍動", "やくどう"), Term("景品", "けいひん"), Term("現段階", "げんだんかい"), Term("異例", "いれい"), Term("計り知れない", "はかりしれない"), Term("文庫", "ぶんこ"), Term("軽傷", "けいしょう"), Term("迎撃", "げいげき"), Term("撃墜", "げきつい"), Term("激化", "げきか"), Term("決する", "けっする"), Term("決別", "けつべつ"), Term("決裂", "けつれつ"), Term("付き添い", "つきそい"), Term("便利さ", "べんりさ"), Term("血痕", "けっこん"), Term("練り", "ねり"), Term("月額", "げつがく"), Term("月間", "げっかん"), Term("月例", "げつれい"), Term("兼ね備える", "かねそなえる"), Term("嫌がらせ", "いやがらせ"), Term("建材", "けんざい"), Term("憲政", "けんせい"), Term("検出", "けんしゅつ"), Term("談話", "だんわ"), Term("献金", "けんきん"), Term("摘出", "てきしゅつ"), Term("県知事", "けんちじ"), Term("県道", "けんどう"), Term("届け出", "とどけで"), Term("見受ける", "みうける"), Term("乱れ", "みだれ"), Term("名優", "めいゆう"), Term("原画", "げんが"), Term("原水爆", "げんすいばく"), Term("同種", "どうしゅ"), Term("面談", "めんだん"), Term("減速", "げんそく"), Term("崩れ", "くずれ"), Term("減免", "げんめん"), Term("現職", "げんしょく"), Term("磨き", "みがき"), Term("収納", "しゅうのう"), Term("個人差", "こじんさ"), Term("隊員", "たいいん"), Term("府県", "ふけん"), Term("援護", "えんご"), Term("普遍的", "ふへんてき"), Term("古参", "こさん"), Term("本命", "ほんめい"), Term("八十", "はちじゅう"), Term("草分け", "くさわけ"), Term("お年玉", "おとしだま"), Term("若年", "じゃくねん"), Term("語り口", "かたりくち"), Term("語気", "ごき"), Term("誤認", "ごにん"), Term("交戦", "こうせん"), Term("矢先", "やさき"), Term("交通費", "こうつうひ"), Term("署長", "しょちょう"), Term("高速度", "こうそくど"), Term("国文学", "こくぶんがく"), Term("水深", "すいしん"), Term("痛手", "いたで"), Term("対価", "たいか"), Term("公使", "こうし"), Term("公判", "こうはん"), Term("論調", "ろんちょう"), Term("今年度", "こんねんど"), Term("昨秋", "さくしゅう"), Term("変身", "へんしん"), Term("効能", "こうのう"), Term("新設", "しんせつ"), Term("民話", "みんわ"), Term("一環", "いっかん"), Term("反旗", "はんき"), Term("一過", "いっか"), Term("広範", "こうはん"), Term("拘置", "こうち"), Term("産品", "さんぴん"), Term("港内", "こうない"), Term("振り切る", "ふりきる"), Term("併用", "へいよう"), Term("解析", "かいせき"), Term("昨年度", "さくねんど"), Term("購買力", "こうばいりょく"), Term("鋼材", "こうざい"), Term("降雨", "こうう"), Term("生中継", "なまちゅうけい"), Term("降水量", "こうすいりょう"), Term("高温", "こうおん"), Term("奇異", "きい"), Term("合唱団", "がっしょうだん"), Term("合否", "ごうひ"), Term("猛暑", "もうしょ"), Term("告知", "こくち"), Term("国際化", "こくさいか"), Term("背任", "はいにん"), Term("軽々", "かるがる"), Term("免責", "めんせき"), Term("繰り出す", "くりだす"), Term("今期", "こんき"), Term("中型", "ちゅうがた"), Term("兵力", "へいりょく"), Term("生え抜き", "はえぬき"), Term("生き", "いき"), Term("査察", "ささつ"), Term("支店長", "してんちょう"), Term("再起", "さいき"), Term("三部", "さんぶ"), Term("再燃", "さいねん"), Term("近づき", "ちかづき"), Term("採取", "さいしゅ"), Term("淡々", "たんたん"), Term("祭典", "さいてん"), Term("自助", "じじょ"), Term("暴徒", "ぼうと"), Term("裁決", "さいけつ"), Term("在職", "ざいしょく"), Term("財政難", "ざいせいなん"), Term("字数", "じすう"), Term("明記", "めいき"), Term("自粛", "じしゅく"), Term("察知", "さっち"), Term("有志", "ゆうし"), Term("算定", "さんてい"), Term("名乗り出る", "なのりでる"), Term("大別", "たいべつ"), Term("山間", "さんかん"), Term("口々", "くちぐち"), Term("呼応", "こおう"), Term("散布", "さんぷ"), Term("産科", "さんか"), Term("賛同", "さんどう"), Term("仕業", "しわざ"), Term("使節", "しせつ"), Term("底辺", "ていへん"), Term("衆院", "しゅういん"), Term("司令官", "しれいかん"), Term("始業", "しぎょう"), Term("二者択一", "にしゃたくいつ"), Term("二世", "にせい"), Term("市中", "しちゅう"), Term("二次", "にじ"), Term("思惑", "おもわく"), Term("獅子", "しし"), Term("私見", "しけん"), Term("名目", "めいもく"), Term("対向", "たいこう"), Term("視聴者", "しちょうしゃ"), Term("詩集", "ししゅう"), Term("付け根", "つけね"), Term("試写", "ししゃ"), Term("資金繰り", "しきんぐり"), Term("資材", "しざい"), Term("事後", "じご"), Term("事象", "じしょう"), Term("事典", "じてん"), Term("事務局", "じむきょく"), Term("郵政", "ゆうせい"), Term("持ち越す", "もちこす"), Term("彩り", "いろどり"), Term("時間切れ", "じかんぎれ"), Term("次官", "じかん"), Term("次期", "じき"), Term("目先", "めさき"), Term("自社", "じしゃ"), Term("自前", "じまえ"), Term("自費", "じひ"), Term("通院", "つういん"), Term("辞令", "じれい"), Term("無秩序", "むちつじょ"), Term("実り", "みのり"), Term("実業", "じつぎょう"), Term("無給", "むきゅう"), Term("搬入", "はんにゅう"), Term("競り合う", "せりあう"), Term("実務", "じつむ"), Term("社会人", "しゃかいじん"), Term("社外", "しゃがい"), Term("謝意", "しゃい"), Term("車検", "しゃけん"), Term("車道", "しゃどう"), Term("直下", "ちょっか"), Term("借款", "しゃっかん"), Term("借入金", "かりいれきん"), Term("点在", "てんざい"), Term("気配り", "きくばり"), Term("生鮮", "せいせん"), Term("専門医", "せんもんい"), Term("主体的", "しゅたいてき"), Term("主犯", "しゅはん"), Term("主流", "しゅりゅう"), Term("正統", "せいとう"), Term("組長", "くみちょう"), Term("美術展", "びじゅつてん"), Term("無い", "ない"), Term("が", "が"), Term("如し", "ごとし"), Term("早く", "はやく"), Term("本当に", "ほんとうに"), Term("一緒に", "いっしょに"), Term("やって来る", "やってくる"), Term("どの位", "どのくらい"), Term("不注意", "ふちゅうい"), Term("乗り遅れる", "のりおくれる"), Term("彼奴", "あいつ"), Term("早起き", "はやおき"), Term("持っていく", "もっていく"), Term("連れて行く", "つれていく"), Term("失礼", "しつれい"), Term("昨晩", "さくばん"), Term("今頃", "いまごろ"), Term("やり方", "やりかた"), Term("見なす", "みなす"), Term("個", "こ"), Term("大声", "おおごえ"), Term("怖がる", "こわがる"), Term("分別", "ふんべつ"), Term("外に", "ほかに"), Term("全", "ぜん"), Term("一般に", "いっぱんに"), Term("傷付ける", "きずつける"), Term("寛ぐ", "くつろぐ"), Term("一晩中", "ひとばんじゅう"), Term("取り掛かる", "とりかかる"), Term("怠惰", "たいだ"), Term("立ち去る", "たちさる"), Term("晒す", "さらす"), Term("下す", "くだす"), Term("長生き", "ながいき"), Term("耽る", "ふける"), Term("内気", "うちき"), Term("成し遂げる", "なしとげる"), Term("時には", "ときには"), Term("その物", "そのもの"), Term("早寝", "はやね"), Term("流暢", "りゅうちょう"), Term("専念", "せんねん"), Term("酔っ払う", "よっぱらう"), Term("向こう側", "むこうがわ"), Term("横たわる", "よこたわる"), Term("迷う", "まよう"), Term("類", "るい"), Term("陥る", "おちいる"), Term("当惑", "とうわく"), Term("見失う", "みうしなう"), Term("兄さん", "にいさん"), Term("青ざめる", "あおざめる"), Term("色んな", "いろんな"), Term("立ち直る", "たちなおる"), Term("大嫌い", "だいきらい"), Term("頷く", "うなずく"), Term("打ち明ける", "うちあける"), Term("見守る", "みまもる"), Term("精一杯", "せいいっぱい"), Term("見出す", "みいだす"), Term("ただ今", "ただいま"), Term("各", "かく"), Term("仰向け", "あおむけ"), Term("連れて来る", "つれてくる"), Term("固執", "こしつ"), Term("噛み付く", "かみつく"), Term("整頓", "せいとん"), Term("徹底的", "てっていてき"), Term("お気に入り", "おきにいり"), Term("口答え", "くちごたえ"), Term("敵わない", "かなわない"), Term("拒む", "こばむ"), Term("引き付ける", "ひきつける"), Term("割に", "わりに"), Term("ＡＩＤＳ", ""), Term("撥ねる", "はねる"), Term("振り向く", "ふりむく"), Term("気難しい", "きむずかしい"), Term("蝿", "はえ"), Term("引き裂く", "ひきさく"), Term("一斉に", "いっせいに"), Term("訛り", "なまり"), Term("見捨てる", "みすてる"), Term("見上げる", "みあげる"), Term("散髪", "さんぱつ"), Term("諸国", "しょこく"), Term("降参", "こうさん"), Term("染み", "しみ"), Term("生き方", "いきかた"), Term("打ち上げる", "うちあげる"), Term("金儲け", "かねもうけ"), Term("明朝", "みょうちょう"), Term("至る所", "いたるところ"), Term("気前", "きまえ"), Term("押し付ける", "おしつける"), Term("要約", "ようやく"), Term("内緒", "ないしょ"), Term("蟻", "あり"), Term("雇い主", "やといぬし"), Term("不器用", "ぶきよう"), Term("自惚れる", "うぬぼれる"), Term("可笑しな", "おかしな"), Term("割り当てる", "わりあてる"), Term("添付", "てんぷ"), Term("言い換える", "いいかえる"), Term("付け込む", "つけこむ"), Term("厳守", "げんしゅ"), Term("お医者さん", "おいしゃさん"), Term("一年中", "いちねんじゅう"), Term("静める", "しずめる"), Term("気取る", "きどる"), Term("天辺", "てっぺん"), Term("姉さん", "ねえさん"), Term("持ち物", "もちもの"), Term("難なく", "なんなく"), Term("名案", "めいあん"), Term("全速力", "ぜんそくりょく"), Term("雨降り", "あめふり"), Term("感嘆", "かんたん"), Term("返却", "へんきゃく"), Term("お仕舞い", "おしまい"), Term("見張る", "みはる"), Term("終電", "しゅうでん"), Term("発展途上国", "はってんとじょうこく"), Term("貴重品", "きちょうひん"), Term("揺りかご", "ゆりかご"), Term("閉じこもる", "とじこもる"), Term("服従", "ふくじゅう"), Term("摩る", "さする"), Term("悪事", "あくじ"), Term("一気に", "いっきに"), Term("場違い", "ばちがい"), Term("和らぐ", "やわらぐ"), Term("善悪", "ぜんあく"), Term("上品", "じょうひん"), Term("着替える", "きがえる"), Term("間食", "かんしょく"), Term("企む", "たくらむ"), Term("急用", "きゅうよう"), Term("雨宿り", "あまやどり"), Term("秘める", "ひめる"), Term("気掛かり", "きがかり"), Term("取り返す", "とりかえす"), Term("見た目", "みため"), Term("何故か", "なぜか"), Term("不機嫌", "ふきげん"), Term("やり直す", "やりなおす"), Term("愚図愚図", "ぐずぐず"), Term("運良く", "うんよく"), Term("散々", "さんざん"), Term("送別会", "そうべつかい"), Term("生き甲斐", "いきがい"), Term("患う", "わずらう"), Term("会釈", "えしゃく"), Term("弁える", "わきまえる"), Term("直視", "ちょくし"), Term("免許証", "めんきょしょう"), Term("序でに", "ついでに"), Term("蜂", "はち"), Term("殺到", "さっとう"), Term("真", "しん"), Term("思いとどまる", "おもいとどまる"), Term("父さん", "とうさん"), Term("独り占め", "ひとりじめ"), Term("乗り出す", "のりだす"), Term("寝付く", "ねつく"), Term("吹き込む", "ふきこむ"), Term("男らしい", "おとこらしい"), Term("寝過ごす", "ねすごす"), Term("抑", "そもそも"), Term("二十", "にじゅう"), Term("共和国", "きょうわこく"), Term("聊か", "いささか"), Term("腕白", "わんぱく"), Term("口出し", "くちだし"), Term("間抜け", "まぬけ"), Term("貧乏人", "びんぼうにん"), Term("立ち入り禁止", "たちいりきんし"), Term("正す", "ただす"), Term("儲け", "もうけ"), Term("偉人", "いじん"), Term("秘訣", "ひけつ"), Term("行き渡る", "いきわたる"), Term("乗り場", "のりば"), Term("侮る", "あなどる"), Term("生き返る", "いきかえる"), Term("冒す", "おかす"), Term("息切れ", "いきぎれ"), Term("損ねる", "そこねる"), Term("恰も", "あたかも"), Term("集る", "たかる"), Term("持て成し", "もてなし"), Term("伝う", "つたう"), Term("気絶", "きぜつ"), Term("起き上がる", "おきあがる"), Term("煽る", "あおる"), Term("摂氏", "せっし"), Term("奥様", "おくさま"), Term("復讐", "ふくしゅう"), Term("策略", "さくりゃく"), Term("不親切", "ふしんせつ"), Term("山登り", "やまのぼり"), Term("日に日に", "ひにひに"), Term("自活", "じかつ"), Term("口げんか", "くちげんか"), Term("償う", "つぐなう"), Term("作り上げる", "つくりあげる"), Term("破綻", "はたん"), Term("敗れる", "やぶれる"), Term("蝕む", "むしばむ"), Term("捕らわれる", "とらわれる"), Term("飛び下りる", "とびおりる"), Term("競う", "きそう"), Term("知れる", "しれる"), Term("美容院", "びよういん"), Term("そよ風", "そよかぜ"), Term("顔立ち", "かおだち"), Term("企てる", "くわだてる"), Term("報いる", "むくいる"), Term("折り返し", "おりかえし"), Term("跪く", "ひざまずく"), Term("故に", "ゆえに"), Term("恩人", "おんじん"), Term("零下", "れいか"), Term("食い止める", "くいとめる"), Term("付け", "つけ"), Term("伏せる", "ふせる"), Term("取り柄", "とりえ"), Term("蜜柑", "みかん"), Term("歩み寄る", "あゆみよる"), Term("握り締める", "にぎりしめる"), Term("書き直す", "かきなおす"), Term("不始末", "ふしまつ"), Term("用心深い", "ようじんぶかい"), Term("堕落", "だらく"), Term("西洋人", "せいようじん"), Term("暇つぶし", "ひまつぶし"), Term("小羊", "こひつじ"), Term("即死", "そくし"), Term("逆境", "ぎゃっきょう"), Term("拭う", "ぬぐう"), Term("珍紛漢紛", "ちんぷんかんぷん"), Term("有頂天", "うちょうてん"), Term("玉ねぎ", "たまねぎ"), Term("加特力", "カトリック"), Term("有り触れた", "ありふれた"), Term("見習う", "みならう"), Term("禿げる", "はげる"), Term("隙", "すき"), Term("実用的", "じつようてき"), Term("例文", "れいぶん"), Term("差し当たり", "さしあたり"), Term("散らばる", "ちらばる"), Term("社交的", "しゃこうてき"), Term("見せ掛け", "みせかけ"), Term("思う存分", "おもうぞんぶん"), Term("窓際", "まどぎわ"), Term("淑やか", "しとやか"), Term("悲観的", "ひかんてき"), Term("従える", "したがえる"), Term("仄か", "ほのか"), Term("話し言葉", "はなしことば"), Term("新学期", "しんがっき"), Term("早退", "そうたい"), Term("長続き", "ながつづき"), Term("引き離す", "ひきはなす"), Term("入れ歯", "いれば"), Term("渾名", "あだな"), Term("唆す", "そそのかす"), Term("二流", "にりゅう"), Term("気性", "きしょう"), Term("滅多", "めった"), Term("乱雑", "らんざつ"), Term("消防車", "しょうぼうしゃ"), Term("好都合", "こうつごう"), Term("思い切る", "おもいきる"), Term("言いなり", "いいなり"), Term("受動的", "じゅどうてき"), Term("苛め", "いじめ"), Term("浸る", "ひたる"), Term("言い返す", "いいかえす"), Term("見違える", "みちがえる"), Term("日給", "にっきゅう"), Term("引き抜く", "ひきぬく"), Term("情けない", "なさけない"), Term("貪欲", "どんよく"), Term("やり取り", "やりとり"), Term("洗練", "せんれん"), Term("率先", "そっせん"), Term("其奴", "そいつ"), Term("待ち兼ねる", "まちかねる"), Term("無害", "むがい"), Term("渇き", "かわき"), Term("長話", "ながばなし"), Term("不都合", "ふつごう"), Term("物覚え", "ものおぼえ"), Term("似合い", "にあい"), Term("身の上", "みのうえ"), Term("暴風雨", "ぼうふうう"), Term("急病", "きゅうびょう"), Term("日暮れ", "ひぐれ"), Term("持ち堪える", "もちこたえる"), Term("勉学", "べんがく"), Term("潔い", "いさぎよい"), Term("戸惑う", "とまどう"), Term("佇む", "たたずむ"), Term("作り話", "つくりばなし"), Term("参考書", "さんこうしょ"), Term("静寂", "せいじゃく"), Term("お袋", "おふくろ"), Term("喚く", "わめく"), Term("死人", "しにん"), Term("肥える", "こえる"), Term("見ず知らず", "みずしらず"), Term("寝返り", "ねがえり"), Term("渋る", "しぶる"), Term("力一杯", "ちからいっぱい"), Term("宿屋", "やどや"), Term("大急ぎ", "おおいそぎ"), Term("ぶら下がる", "ぶらさがる"), Term("閃く", "ひらめく"), Term("強情", "ごうじょう"), Term("菠薐草", "ほうれんそう"), Term("葉っぱ", "はっぱ"), Term("粘々", "ねばねば"), Term("擦れ擦れ", "すれすれ"), Term("何かと", "なにかと"), Term("筋道", "すじみち"), Term("隣り合う", "となりあう"), Term("凄まじい", "すさまじい"), Term("蹌踉めく", "よろめく"), Term("貸借", "たいしゃく"), Term("骸骨", "がいこつ"), Term("各国", "かっこく"), Term("見損なう", "みそこなう"), Term("寝床", "ねどこ"), Term("図書室", "としょしつ"), Term("哀れむ", "あわれむ"), Term("幼なじみ", "おさななじみ"), Term("起立", "きりつ"), Term("法外", "ほうがい"), Term("母国語", "ぼこくご"), Term("朝飯", "あさめし"), Term("不得意", "ふとくい"), Term("言い表す", "いいあらわす"), Term("突き刺す", "つきさす"), Term("後片付け", "あとかたづけ"), Term("お節介", "おせっかい"), Term("口ごもる", "くちごもる"), Term("彷徨く", "うろつく"), Term("品切れ", "しなぎれ"), Term("不相応", "ふそうおう"), Term("人殺し", "ひとごろし"), Term("力持ち", "ちからもち"), Term("あの世", "あのよ"), Term("尤もらしい", "もっともらしい"), Term("呪う", "のろう"), Term("悪気", "わるぎ"), Term("秀才", "しゅうさい"), Term("秋風", "あきかぜ"), Term("ぶっきら棒", "ぶっきらぼう"), Term("見る見る", "みるみる"), Term("見分け", "みわけ"), Term("囲う", "かこう"), Term("委ねる", "ゆだねる"), Term("満更", "まんざら"), Term("後戻り", "あともどり"), Term("寝ぼける", "ねぼける"), Term("婆さん", "ばあさん"), Term("落ち合う", "おちあう"), Term("疎遠", "そえん"), Term("女らしい", "おんならしい"), Term("腹一杯", "はらいっぱい"), Term("不動産屋", "ふどうさんや"), Term("俯く", "うつむく"), Term("早春", "そうしゅん"), Term("雑踏", "ざっとう"), Term("自営業", "じえいぎょう"), Term("乗り回す", "のりまわす"), Term("芋", "いも"), Term("雨漏り", "あまもり"), Term("鰻", "うなぎ"), Term("制止", "せいし"), Term("目茶目茶", "めちゃめちゃ"), Term("反面", "はんめん"), Term("吹き出物", "ふきでもの"), Term("静粛", "せいしゅく"), Term("内向的", "ないこうてき"), Term("絶交", "ぜっこう"), Term("嫁ぐ", "とつぐ"), Term("洗面所", "せんめんじょ"), Term("不幸せ", "ふしあわせ"), Term("改札口", "かいさつぐち"), Term("手落ち", "ておち"), Term("括る", "くくる"), Term("寒暖計", "かんだんけい"), Term("売り手", "うりて"), Term("程なく", "ほどなく"), Term("間一髪", "かんいっぱつ"), Term("添削", "てんさく"), Term("眼差し", "まなざし"), Term("幾何", "きか"), Term("気違い", "きちがい"), Term("お絞り", "おしぼり"), Term("翻す", "ひるがえす"), Term("急変", "きゅうへん"), Term("絵はがき", "えはがき"), Term("取り外す", "とりはずす"), Term("荒々しい", "あらあらしい"), Term("近日", "きんじつ"), Term("急所", "きゅうしょ"), Term("爺さん", "じいさん"), Term("見縊る", "みくびる"), Term("傍観", "ぼうかん"), Term("紛らす", "まぎらす"), Term("空虚", "くうきょ"), Term("先頃", "さきごろ"), Term("誤字", "ごじ"), Term("行き来", "いきき"), Term("浮かれる", "うかれる"), Term("拳骨", "げんこつ"), Term("用例", "ようれい"), Term("洋書", "ようしょ"), Term("蔑む", "さげすむ"), Term("瘤", "こぶ"), Term("同類", "どうるい"), Term("嘲る", "あざける"), Term("休校", "きゅうこう"), Term("腕力", "わんりょく"), Term("動じる", "どうじる"), Term("白熱", "はくねつ"), Term("形見", "かたみ"), Term("負んぶ", "おんぶ"), Term("踏み切る", "ふみきる"), Term("祝電", "しゅくでん"), Term("伊呂波", "いろは"), Term("表通り", "おもてどおり"), Term("お歳暮", "おせいぼ"), Term("有耶無耶", "うやむや"), Term("止めどなく", "とめどなく"), Term("一心に", "いっしんに"), Term("水入らず", "みずいらず"), Term("耳より", "みみより"), Term("不燃物", "ふねんぶつ"), Term("筆記用具", "ひっきようぐ"), Term("話し声", "はなしごえ"), Term("蔓延る", "はびこる"), Term("貪る", "むさぼる"), Term("立て続け", "たてつづけ"), Term("神髄", "しんずい"), Term("縋る", "すがる"), Term("親孝行", "おやこうこう"), Term("無神経", "むしんけい"), Term("恥知らず", "はじしらず"), Term("露見", "ろけん"), Term("垂らす", "たらす"), Term("虚栄心", "きょえいしん"), Term("風邪薬", "かぜぐすり"), Term("幾度", "いくど"), Term("非常識", "ひじょうしき"), Term("割れ目", "われめ"), Term("下等", "かとう"), Term("やり直し", "やりなおし"), Term("照れる", "てれる"), Term("洗面器", "せんめんき"), Term("脈拍", "みゃくはく"), Term("果てしない", "はてしない"), Term("模擬試験", "もぎしけん"), Term("転嫁", "てんか"), Term("打算的", "ださんてき"), Term("冷や汗", "ひやあせ"), Term("海産物", "かいさんぶつ"), Term("引き延ばす", "ひきのばす"), Term("辛子", "からし"), Term("蟹", "かに"), Term("抜粋", "ばっすい"), Term("化け物", "ばけもの"), Term("外気", "がいき"), Term("塩梅", "あんばい"), Term("抹消", "まっしょう"), Term("八つ当たり", "やつあたり"), Term("適量", "てきりょう"), Term("楽天的", "らくてんてき"), Term("割り引く", "わりびく"), Term("半袖", "はんそで"), Term("張り出す", "はりだす"), Term("町外れ", "まちはずれ"), Term("釣り合い", "つりあい"), Term("長袖", "ながそで"), Term("追突", "ついとつ"), Term("危篤", "きとく"), Term("洗い物", "あらいもの"), Term("幾", "いく"), Term("いつ頃", "いつごろ"), Term("立ち話", "たちばなし"), Term("汽笛", "きてき"), Term("眠気", "ねむけ"), Term("吃る", "どもる"), Term("往生", "おうじょう"), Term("狭まる", "せばまる"), Term("庇う", "かばう"), Term("呆気", "あっけ"), Term("隈なく", "くまなく"), Term("本箱", "ほんばこ"), Term("元より", "もとより"), Term("元旦", "がんたん"), Term("宛先", "あてさき"), Term("飽き", "あき"), Term("現住所", "げんじゅうしょ"), Term("後天的", "こうてんてき"), Term("澱む", "よどむ"), Term("無情", "むじょう"), Term("入梅", "にゅうばい"), Term("入室", "にゅうしつ"), Term("前借り", "まえがり"), Term("行き届く", "いきとどく"), Term("触れ合う", "ふれあう"), Term("手柄", "てがら"), Term("白菜", "はくさい"), Term("健気", "けなげ"), Term("三流", "さんりゅう"), Term("突き抜ける", "つきぬける"), Term("共通語", "きょうつうご"), Term("保育園", "ほいくえん"), Term("蹲る", "うずくまる"), Term("耳障り", "みみざわり"), Term("自明", "じめい"), Term("実話", "じつわ"), Term("和む", "なごむ"), Term("押し問答", "おしもんどう"), Term("推量", "すいりょう"), Term("留年", "りゅうねん"), Term("点滅", "てんめつ"), Term("抑揚", "よくよう"), Term("割り箸", "わりばし"), Term("お凸", "おでこ"), Term("修める", "おさめる"), Term("洋裁", "ようさい"), Term("自滅", "じめつ"), Term("悪賢い", "わるがしこい"), Term("悪用", "あくよう"), Term("行き止まり", "いきどまり"), Term("日替わり", "ひがわり"), Term("乗じる", "じょうじる"), Term("乗り降り", "のりおり"), Term("職歴", "しょくれき"), Term("引き戻す", "ひきもどす"), Term("引け目", "ひけめ"), Term("寝かす", "ねかす"), Term("余す", "あます"), Term("畝ねり", "うねり"), Term("等価", "とうか"), Term("身投げ", "みなげ"), Term("お坊さん", "おぼうさん"), Term("人違い", "ひとちがい"), Term("人だかり", "ひとだかり"), Term("見過ごす", "みすごす"), Term("強ち", "あながち"), Term("老眼", "ろうがん"), Term("逃げ道", "にげみち"), Term("外面", "がいめん"), Term("要注意", "ようちゅうい"), Term("申し分無い", "もうしぶんない"), Term("無機物", "むきぶつ"), Term("横着", "おうちゃく"), Term("糺す", "ただす"), Term("道草", "みちくさ"), Term("身軽", "みがる"), Term("水臭い", "みずくさい"), Term("温もり", "ぬくもり"), Term("盛り上げる", "もりあげる"), Term("精算", "せいさん"), Term("不意に", "ふいに"), Term("引っ付く", "ひっつく"), Term("罰点", "ばってん"), Term("夏ばて", "なつばて"), Term("切断", "せつだん"), Term("不確か", "ふたしか"), Term("披露宴", "ひろうえん"), Term("絶え間なく", "たえまなく"), Term("洞察", "どうさつ"), Term("得する", "とくする"), Term("冬期", "とうき"), Term("手際良く", "てぎわよく"), Term("男性的", "だんせいてき"), Term("桶", "おけ"), Term("速達便", "そくたつびん"), Term("女性的", "じょせいてき"), Term("順路", "じゅんろ"), Term("自問", "じもん"), Term("資本家", "しほんか"), Term("涎", "よだれ"), Term("湿っぽい", "しめっぽい"), Term("騒めく", "ざわめく"), Term("恐るべき", "おそるべき"), Term("か弱い", "かよわい"), Term("戒め", "いましめ"), Term("衛生的", "えいせいてき"), Term("怪しむ", "あやしむ"), Term("他者", "たしゃ"), Term("受け持ち", "うけもち"), Term("寄り道", "よりみち"), Term("対称", "たいしょう"), Term("貸し出す", "かしだす"), Term("杜撰", "ずさん"), Term("大きさ", "おおきさ"), Term("寄せ集め", "よせあつめ"), Term("丹精", "たんせい"), Term("追究", "ついきゅう"), Term("神業", "かみわざ"), Term("見比べる", "みくらべる"), Term("割り切る", "わりきる"), Term("真ん丸", "まんまる"), Term("見覚え", "みおぼえ"), Term("昼下がり", "ひるさがり"), Term("超特急", "ちょうとっきゅう"), Term("人並み", "ひとなみ"), Term("引き締める", "ひきしめる"), Term("卵形", "らんけい"), Term("漁る", "あさる"), Term("間借り", "まがり"), Term("歯向かう", "はむかう"), Term("企み", "たくらみ"), Term("不慮", "ふりょ"), Term("縫い目", "ぬいめ"), Term("悼む", "いたむ"), Term("長らく", "ながらく"), Term("共々", "ともども"), Term("取扱注意", "とりあつかいちゅうい"), Term("見限る", "みかぎる"), Term("書き言葉", "かきことば"), Term("泣き声", "なきごえ"), Term("供える", "そなえる"), Term("正座", "せいざ"), Term("苦味", "にがみ"), Term("暑中見舞", "しょちゅうみまい"), Term("携える", "たずさえる"), Term("無欲", "むよく"), Term("探し回る", "さがしまわる"), Term("無益", "むえき"), Term("月見", "つきみ"), Term("夢想", "むそう"), Term("月夜", "つきよ"), Term("極まる", "きわまる"), Term("切り捨てる", "きりすてる"), Term("白線", "はくせん"), Term("浚う", "さらう"), Term("見物人", "けんぶつにん"), Term("成算", "せいさん"), Term("貸し切り", "かしきり"), Term("配属", "はいぞく"), Term("僧侶", "そうりょ"), Term("傾げる", "かしげる"), Term("例題", "れいだい"), Term("互い違い", "たがいちがい"), Term("売り込む", "うりこむ"), Term("香る", "かおる"), Term("厚着", "あつぎ"), Term("更衣室", "こういしつ"), Term("変貌", "へんぼう"), Term("博学", "はくがく"), Term("暈す", "ぼかす"), Term("差し伸べる", "さしのべる"), Term("念入り", "ねんいり"), Term("作り笑い", "つくりわらい"), Term("折りたたみ", "おりたたみ"), Term("前売り券", "まえうりけん"), Term("暴騰", "ぼうとう"), Term("亡骸", "なきがら"), Term("日和", "ひより"), Term("持ち直す", "もちなおす"), Term("自炊", "じすい"), Term("忍ぶ", "しのぶ"), Term("香ばしい", "こうばしい"), Term("煮詰める", "につめる"), Term("人相", "にんそう"), Term("罅", "ひび"), Term("放任", "ほうにん"), Term("弱虫", "よわむし"), Term("給油所", "きゅうゆじょ"), Term("主観的", "しゅかんてき"), Term("多く", "おおく"), Term("方がいい", "ほうがいい"), Term("子供達", "こどもたち"), Term("頂ける", "いただける"), Term("人達", "ひとたち"), Term("に対して", "にたいして"), Term("無くてはならない", "なくてはならない"), Term("幾つか", "いくつか"), Term("一時間", "いちじかん"), Term("に対する", "にたいする"), Term("然う", "そう"), Term("誰にも", "だれにも"), Term("二度と", "にどと"), Term("其れ等", "それら"), Term("に関して", "にかんして"), Term("大", "だい"), Term("英吉利", "イギリス"), Term("持ってくる", "もってくる"), Term("何れくらい", "どれくらい"), Term("長い間", "ながいあいだ"), Term("仏蘭西", "フランス"), Term("そう言う", "そういう"), Term("大阪", "おおさか"), Term("気がつく", "きがつく"), Term("加奈陀", "カナダ"), Term("君達", "きみたち"), Term("若い頃", "わかいころ"), Term("こう言う", "こういう"), Term("摂る", "とる"), Term("世界中", "せかいじゅう"), Term("一年", "いちねん"), Term("羅馬", "ローマ"), Term("二人とも", "ふたりとも"), Term("此れ迄", "これまで"), Term("伊太利", "イタリア"), Term("僕達", "ぼくたち"), Term("何人か", "なんにんか"), Term("如何いう", "どういう"), Term("付いていく", "ついていく"), Term("度に", "たびに"), Term("濠太剌利", "オーストラリア"), Term("話し方", "はなしかた"), Term("神戸", "こうべ"), Term("今すぐ", "いますぐ"), Term("魅力的", "みりょくてき"), Term("独逸", "ドイツ"), Term("何年", "なんねん"), Term("印度", "インド"), Term("ないと行けない", "ないといけない"), Term("指導者", "しどうしゃ"), Term("あなた方", "あなたがた"), Term("何人", "なんにん"), Term("貴社", "きしゃ"), Term("午前中", "ごぜんちゅう"), Term("二回", "にかい"), Term("数人", "すうにん"), Term("途端に", "とたんに"), Term("杭", "くい"), Term("一匹", "いっぴき"), Term("一ヶ月", "いっかげつヶかげつ"), Term("海外旅行", "かいがいりょこう"), Term("木の葉", "このは"), Term("候補者", "こうほしゃ"), Term("僕ら", "ぼくら"), Term("西班牙", "スペイン"), Term("同時に", "どうじに"), Term("お客さま", "おきゃくさま"), Term("観光客", "かんこうきゃく"), Term("御連絡", "ごれんらく"), Term("し過ぎる", "しすぎる"), Term("名古屋", "なごや"), Term("数年", "すうねん"), Term("重要性", "じゅうようせい"), Term("少しずつ", "すこしずつ"), Term("一万", "いちまん"), Term("投函", "とうかん"), Term("些細", "ささい"), Term("学生時代", "がくせいじだい"), Term("滞在中", "たいざいちゅう"), Term("授業中", "じゅぎょうちゅう"), Term("付いてくる", "ついてくる"), Term("墨西哥", "メキシコ"), Term("瑞西", "スイス"), Term("横浜", "よこはま"), Term("お婆ちゃん", "おばあちゃん"), Term("殺人事件", "さつじんじけん"), Term("分間", "ふんかん"), Term("臆病者", "おくびょうもの"), Term("子犬", "こいぬ"), Term("伯剌西爾", "ブラジル"), Term("希臘", "ギリシャ"), Term("大都市", "だいとし"), Term("何処にも", "どこにも"), Term("新製品", "しんせいひん"), Term("子猫", "こねこ"), Term("あっと言う間に", "あっというまに"), Term("洗濯物", "せんたくもの"), Term("三回", "さんかい"), Term("Ｔシャツ", "シャツ"), Term("仕事中", "しごとちゅう"), Term("一冊", "いっさつ"), Term("一台", "いちだい"), Term("旅行者", "りょこうしゃ"), Term("控えめ", "ひかえめ"), Term("奴等", "やつら"), Term("新西蘭", "ニュージーランド"), Term("科学技術", "かがくぎじゅつ"), Term("数時間", "すうじかん"), Term("共通点", "きょうつうてん"), Term("契約書", "けいやくしょ"), Term("科学的", "かがくてき"), Term("何日", "なんにち"), Term("興味深い", "きょうみぶかい"), Term("大成功", "だいせいこう"), Term("帰り道", "かえりみち"), Term("中心部", "ちゅうしんぶ"), Term("あり得ない", "ありえない"), Term("仕方ない", "しかたない"), Term("解決策", "かいけつさく"), Term("今週末", "こんしゅうまつ"), Term("閉じ込める", "とじこめる"), Term("試着", "しちゃく"), Term("私自身", "わたしじしん"), Term("第二", "だいに"), Term("下記", "かき"), Term("影響力", "えいきょうりょく"), Term("数回", "すうかい"), Term("見下す", "みくだす"), Term("年後", "ねんご"), Term("三年", "さんねん"), Term("請求書", "せいきゅうしょ"), Term("英会話", "えいかいわ"), Term("日本経済", "にほんけいざい"), Term("美貌", "びぼう"), Term("親父", "おやじ"), Term("次のように", "つぎのように"), Term("説得力", "せっとくりょく"), Term("手当たり次第", "てあたりしだい"), Term("飽くまでも", "あくまでも"), Term("作り出す", "つくりだす"), Term("気分転換", "きぶんてんかん"), Term("犯罪者", "はんざいしゃ"), Term("どう仕様も無い", "どうしようもない"), Term("考え直す", "かんがえなおす"), Term("被災者", "ひさいしゃ"), Term("株式市場", "かぶしきしじょう"), Term("有名人", "ゆうめいじん"), Term("一番上", "いちばんうえ"), Term("所有者", "しょゆうしゃ"), Term("一人旅", "ひとりたび"), Term("付いてる", "ついてる"), Term("無さそう", "なさそう"), Term("野球部", "やきゅうぶ"), Term("乗り切る", "のりきる"), Term("機内", "きない"), Term("和蘭", "オランダ"), Term("申込書", "もうしこみしょ"), Term("数分", "すうふん"), Term("当店", "とうてん"), Term("動き出す", "うごきだす"), Term("反対側", "はんたいがわ"), Term("直ぐ様", "すぐさま"), Term("出来", "でき"), Term("一年間", "いちねんかん"), Term("応募者", "おうぼしゃ"), Term("露西亜", "ロシア"), Term("英単語", "えいたんご"), Term("糞", "くそ"), Term("本質的", "ほんしつてき"), Term("気持ちいい", "きもちいい"), Term("ＣＤプレーヤー", "プレーヤー"), Term("一介", "いっかい"), Term("愛嬌", "あいきょう"), Term("一撃", "いちげき"), Term("綴る", "つづる"), Term("カ国", "カこく"), Term("けが人", "けがにん"), Term("何という", "なんという"), Term("寝不足", "ねぶそく"), Term("種族", "しゅぞく"), Term("躊躇", "ちゅうちょ"), Term("暇がない", "ひまがない"), Term("今一", "いまいち"), Term("あれ程", "あれほど"), Term("切りがない", "きりがない"), Term("あの方", "あのかた"), Term("弊社", "へいしゃ"), Term("浸かる", "つかる"), Term("現実的", "げんじつてき"), Term("鼻水", "はなみず"), Term("因みに", "ちなみに"), Term("福岡", "ふくおか"), Term("左足", "ひだりあし"), Term("延々", "えんえん"), Term("日本史", "にほんし"), Term("心理的", "しんりてき"), Term("四人", "よにん"), Term("旺盛", "おうせい"), Term("会社員", "かいしゃいん"), Term("料理人", "りょうりにん"), Term("旅行会社", "りょこうがいしゃ"), Term("有りとあらゆる", "ありとあらゆる"), Term("部活", "ぶかつ"), Term("卒業生", "そつぎょうせい"), Term("静岡", "しずおか"), Term("やり甲斐", "やりがい"), Term("上海", "シャンハイ"), Term("予想以上", "よそういじょう"), Term("勤務時間", "きんむじかん"), Term("神秘的", "しんぴてき"), Term("代理人", "だいりにん"), Term("勉強中", "べんきょうちゅう"), Term("卒業後", "そつぎょうご"), Term("花屋", "はなや"), Term("古本屋", "ふるほんや"), Term("今時", "いまどき"), Term("不適切", "ふてきせつ"), Term("数十", "すうじゅう"), Term("有りそう", "ありそう"), Term("勇者", "ゆうしゃ"), Term("再確認", "さいかくにん"), Term("回目", "かいめ"), Term("強制的", "きょうせいてき"), Term("悪影響", "あくえいきょう"), Term("多め", "おおめ"), Term("女子高生", "じょしこうせい"), Term("連絡先", "れんらくさき"), Term("買い得", "かいどく"), Term("物理的", "ぶつりてき"), Term("登場人物", "とうじょうじんぶつ"), Term("返送", "へんそう"), Term("個性的", "こせいてき"), Term("訪問者", "ほうもんしゃ"), Term("不良品", "ふりょうひん"), Term("健康的", "けんこうてき"), Term("探検隊", "たんけんたい"), Term("この内", "このうち"), Term("葡萄牙", "ポルトガル"), Term("予期せぬ", "よきせぬ"), Term("細々", "こまごま"), Term("数千", "すうせん"), Term("時間帯", "じかんたい"), Term("治療法", "ちりょうほう"), Term("鮭", "さけ"), Term("全国的", "ぜんこくてき"), Term("休憩時間", "きゅうけいじかん"), Term("満足感", "まんぞくかん"), Term("諸島", "しょとう"), Term("１割", "ちわり"), Term("方向音痴", "ほうこうおんち"), Term("一般人", "いっぱんじん"), Term("引かれる", "ひかれる"), Term("出身地", "しゅっしんち"), Term("営業時間", "えいぎょうじかん"), Term("魔力", "まりょく"), Term("音量", "おんりょう"), Term("無作為", "むさくい"), Term("何処までも", "どこまでも"), Term("返金", "へんきん"), Term("爽快", "そうかい"), Term("管理者", "かんりしゃ"), Term("大粒", "おおつぶ"), Term("失踪", "しっそう"), Term("日本中", "にほんじゅう"), Term("始動", "しどう"), Term("重要視", "じゅうようし"), Term("白耳義", "ベルギー"), Term("卒業式", "そつぎょうしき"), Term("至福", "しふく"), Term("満腹", "まんぷく"), Term("鍵盤", "けんばん"), Term("定期購読", "ていきこうどく"), Term("前髪", "まえがみ"), Term("比律賓", "フィリピン"), Term("湿疹", "しっしん"), Term("紛れもない", "まぎれもない"), Term("所詮", "しょせん"), Term("お手数", "おてすう"), Term("曰く", "いわく"), Term("某", "ぼう"), Term("未だしも", "まだしも"), Term("短め", "みじかめ"), Term("意味不明", "いみふめい"), Term("下手くそ", "へたくそ"), Term("あっと言う間", "あっというま"), Term("千円札", "せんえんさつ"), Term("気持ち悪い", "きもちわるい"), Term("過小評価", "かしょうひょうか"), Term("右上", "みぎうえ"), Term("言いようがない", "いいようがない"), Term("苔", "こけ"), Term("返品", "へんぴん"), Term("摘み", "つまみ"), Term("お持て成し", "おもてなし"), Term("我ら", "われら"), Term("瑞典", "スウェーデン"), Term("覚醒", "かくせい"), Term("甲斐", "かい"), Term("左折", "させつ"), Term("置き換える", "おきかえる"), Term("意思疎通", "いしそつう"), Term("文句なし", "もんくなし"), Term("容赦なく", "ようしゃなく"), Term("お馴染み", "おなじみ"), Term("紹介者", "しょうかいしゃ"), Term("裏づける", "うらづける"), Term("朝一番", "あさいちばん"), Term("思いやる", "おもいやる"), Term("競合他社", "きょうごうたしゃ"), Term("虫除け", "むしよけ"), Term("立ち上げる", "たちあげる"), Term("読みにくい", "よみにくい"), Term("味気ない", "あじけない"), Term("椎茸", "しいたけ"), Term("思い描く", "おもいえがく"), Term("定番", "ていばん"), Term("知らないうちに", "しらないうちに"), Term("ご褒美", "ごほうび"), Term("頭金", "あたまきん"), Term("取り引き先", "とりひきさき"), Term("１１０番", "とおばん"), Term("団栗", "どんぐり"), Term("繰り広げる", "くりひろげる"), Term("欲張る", "よくばる"), Term("骨董", "こっとう"), Term("すぐ側", "すぐそば"), Term("胡桃", "くるみ"), Term("不釣り合い", "ふつりあい"), Term("何方も", "どちらも"), Term("最愛", "さいあい"), Term("自販機", "じはんき"), Term("偲ぶ", "しのぶ"), Term("経験豊富", "けいけんほうふ"), Term("緻密", "ちみつ"), Term("お疲れ様", "おつかれさま"), Term("何時に無く", "いつになく"), Term("安泰", "あんたい"), Term("日本初", "にほんはつ"), Term("そこら辺", "そこらへん"), Term("絶好調", "ぜっこうちょう"), Term("いつも通り", "いつもどおり"), Term("勝手気まま", "かってきまま"), Term("行ってきます", "いってきます"), Term("全貌", "ぜんぼう"), Term("追っかけ", "おっかけ"), Term("救急医療", "きゅうきゅういりょう"), Term("包み込む", "つつみこむ"), Term("右折", "うせつ"), Term("開発者", "かいはつしゃ"), Term("界隈", "かいわい"), Term("脆弱", "ぜいじゃく"), Term("棲む", "すむ"), Term("図解", "ずかい"), Term("塩味", "しおあじ"), Term("生活費", "せいかつひ"), Term("喘息", "ぜんそく"), Term("小中学生", "しょうちゅうがくせい"), Term("資金調達", "しきんちょうたつ"), Term("変更届", "へんこうとどけ"), Term("検索条件", "けんさくじょうけん"), Term("冷凍庫", "れいとうこ"), Term("有り勝ち", "ありがち"), Term("人権擁護", "じんけんようご"), Term("外付け", "そとづけ"), Term("今宵", "こよい"), Term("瓦礫", "がれき"), Term("保証付き", "ほしょうつき"), Term("兎もあれ", "ともあれ"), Term("ＢＧＭ", ""), Term("左上", "ひだりうえ"), Term("お子様", "おこさま"), Term("気のせい", "きのせい"), Term("二割", "にわり"), Term("琥珀", "こはく"), Term("得々", "とくとく"), Term("萌える", "もえる"), Term("剥がれる", "はがれる"), Term("数少ない", "かずすくない"), Term("漏洩", "ろうえい"), Term("発汗", "はっかん"), Term("お節", "おせち"), Term("風太郎", "ぷうたろう"), Term("蘭", "らん"), Term("尚且つ", "なおかつ"), Term("誹謗", "ひぼう"), Term("３次元", "んじげん"), Term("いっその事", "いっそのこと"), Term("御社", "おんしゃ"), Term("禿び", "ちび"), Term("萎える", "なえる"), Term("無きゃいけない", "なきゃいけない"), Term("子供の頃", "こどものころ"), Term("禁止事項", "きんしじこう"), Term("倫敦", "ロンドン"), Term("巴里", "パリ"), Term("布哇", "ハワイ"), Term("新嘉坡", "シンガポール"), Term("埃及", "エジプト"), Term("秘露", "ペルー"), Term("錻力", "ブリキ"), Term("巴奈馬", "パナマ"), Term("イラク", "イラク"), Term("芬蘭", "フィンランド"), Term("芒果", "マンゴー"), Term("玖馬", "キューバ"), Term("智利", "チリ"), Term("土耳古", "トルコ"), Term("で", "で"), Term("羽撃く", "はばたく"), Term("には", "には"), Term("から", "から"), Term("俄雨", "にわかあめ"), Term("うつ伏せ", "うつぶせ"), Term("食み出る", "はみでる"), Term("ので", "ので"), Term("たい", "たい"), Term("のに", "のに"), Term("とは", "とは"), Term("しか", "しか"), Term("許り", "ばかり"), Term("乍ら", "ながら"), Term("ぜ", "ぜ"), Term("さえ", "さえ"), Term("かい", "かい"), Term("かしら", "かしら"), Term("かな", "かな"), Term("とも", "とも"), Term("としても", "としても"), Term("こそ", "こそ"), Term("とか", "とか"), Term("だい", "だい"), Term("でさえ", "でさえ"), Term("のみ", "のみ"), Term("なり", "なり"), Term("たら", "たら"), Term("癖に", "くせに"), Term("かも", "かも"), Term("つつ", "つつ"), Term("乍らも", "ながらも"), Term("ものの", "ものの"), Term("許りか", "ばかりか"), Term("なりに", "なりに"), Term("だてらに", "だてらに"), Term("たり", "たり"), Term("かね", "かね"), Term("たって", "たって"), Term("富士山", "ふじさん"), Term("一本", "いっぽん"), Term("薪", "まき"), Term("北アイルランド", "きたアイルランドアイルランド"), Term("西ドイツ", "にしドイツドイツ"), Term("ドル", "ドル"), Term("ラグビー", "ラグビー"), Term("バナナ", "バナナ"), Term("ハム", "ハム"), Term("カーネーション", "カーネーション"), Term("ガンガン", "ガンガン"), Term("茄子", "なす"), Term("バレル", "バレル"), Term("ビラ", "ビラ"), Term("サハラ砂漠", "サハラさばく"), Term("カリブ海", "カリブかい"), Term("ボストン", "ボストン"), Term("シカゴ", "シカゴ"), Term("ボス", "ボス"), Term("イングランド", "イングランド"), Term("サンフランシスコ", "サンフランシスコ"), Term("ロサンゼルス", "ロサンゼルス"), Term("シドニー", "シドニー"), Term("オックスフォード", "オックスフォード"), Term("ホノルル", "ホノルル"), Term("プレイ", "プレイ"), Term("クロアチア", "クロアチア"), Term("モール", "モール"), Term("クール", "クール"), Term("ウェールズ", "ウェールズ"), Term("シベリア", "シベリア"), Term("オーロラ", "オーロラ"), Term("パラパラ", "パラパラ"), Term("ヒューズ", "ヒューズ"), Term("ポーチ", "ポーチ"), Term("ラジウム", "ラジウム"), Term("グリーンランド", "グリーンランド"), Term("シアトル", "シアトル"), Term("デンバー", "デンバー"), Term("コイル", "コイル"), Term("バドミントン", "バドミントン"), Term("ビーバー", "ビーバー"), Term("サンディエゴ", "サンディエゴ"), Term("ザンビア", "ザンビア"), Term("ボスニア", "ボスニア"), Term("ユーゴスラビア", "ユーゴスラビア"), Term("ヨルダン", "ヨルダン"), Term("ラテンアメリカ", "ラテンアメリカ"), Term("レンジャー", "レンジャー"), Term("ロッド", "ロッド"), Term("マニラ", "マニラ"), Term("テラス", "テラス"), Term("ウラニウム", "ウラニウム"), Term("トロント", "トロント"), Term("ナイジェリア", "ナイジェリア"), Term("コリー", "コリー"), Term("キュー", "キュー"), Term("バーミンガム", "バーミンガム"), Term("オアシス", "オアシス"), Term("サウジアラビア", "サウジアラビア"), Term("オタワ", "オタワ"), Term("リスボン", "リスボン"), Term("フェニックス", "フェニックス"), Term("ラック", "ラック"), Term("プラザ", "プラザ"), Term("カルシウム", "カルシウム"), Term("ジャカルタ", "ジャカルタ"), Term("ペンション", "ペンション"), Term("ジンバブエ", "ジンバブエ"), Term("チェコスロバキア", "チェコスロバキア"), Term("スパン", "スパン"), Term("タイムズ", "タイムズ"), Term("タブー", "タブー"), Term("クライマックス", "クライマックス"), Term("リンス", "リンス"), Term("日本人", "にほんじん"), Term("政治家", "せいじか"), Term("一行", "いちぎょう"), Term("鳩", "はと"), Term("第二次世界大戦", "だいにじせかいたいせん"), Term("研究所", "けんきゅうしょ"), Term("百合", "ゆり"), Term("欲", "よく"), Term("仏教", "ぶっきょう"), Term("腹痛", "ふくつう"), Term("我", "われ"), Term("三角形", "さんかくけい"), Term("日本酒", "にほんしゅ"), Term("一角", "いっかく"), Term("深海", "しんかい"), Term("七夕", "たなばた"), Term("干潟", "ひがた"), Term("水鳥", "すいちょう"), Term("省エネルギー", "しょうエネルギーエネルギー"), Term("古本", "ふるほん"), Term("日本航空", "にっぽんこうくう"), Term("河口", "かこう"), Term("大佐", "たいさ"), Term("栗", "くり"), Term("歯ブラシ", "はブラシブラシ"), Term("油井", "ゆせい"), Term("画集", "がしゅう"), Term("中道", "ちゅうどう"), Term("分泌", "ぶんぴつ"), Term("野手", "やしゅ"), Term("山地", "さんち"), Term("サッカー", "サッカー"), Term("ゴルフ", "ゴルフ"), Term("ジョギング", "ジョギング"), Term("スーパー", "スーパー"), Term("ロック", "ロック"), Term("リスト", "リスト"), Term("バイク", "バイク"), Term("キス", "キス"), Term("ロボット", "ロボット"), Term("チョコレート", "チョコレート"), Term("バスケットボール", "バスケットボール"), Term("クッキー", "クッキー"), Term("トマト", "トマト"), Term("スパイ", "スパイ"), Term("キー", "キー"), Term("パパ", "パパ"), Term("インフルエンザ", "インフルエンザ"), Term("スーパーマーケット", "スーパーマーケット"), Term("ハンバーガー", "ハンバーガー"), Term("アルファベット", "アルファベット"), Term("レモン", "レモン"), Term("バレーボール", "バレーボール"), Term("トースト", "トースト"), Term("ビザ", "ビザ"), Term("ファッション", "ファッション"), Term("カップル", "カップル"), Term("パンフレット", "パンフレット"), Term("スタッフ", "スタッフ"), Term("アレルギー", "アレルギー"), Term("タンカー", "タンカー"), Term("空オケ", "からオケオケ"), Term("チューリップ", "チューリップ"), Term("コーラ", "コーラ"), Term("シングル", "シングル"), Term("アリバイ", "アリバイ"), Term("キリスト教", "キリストきょう"), Term("スモッグ", "スモッグ"), Term("ラッシュ", "ラッシュ"), Term("アイドル", "アイドル"), Term("マナー", "マナー"), Term("サングラス", "サングラス"), Term("ベランダ", "ベランダ"), Term("屁", "おなら"), Term("バレエ", "バレエ"), Term("やくざ", "やくざ"), Term("キャベツ", "キャベツ"), Term("カレーライス", "カレーライス"), Term("ビスケット", "ビスケット"), Term("スムーズ", "スムーズ"), Term("グラウンド", "グラウンド"), Term("流行歌", "りゅうこうか"), Term("お守り", "おまもり"), Term("ターミナル", "ターミナル"), Term("チャック", "チャック"), Term("テクノロジー", "テクノロジー"), Term("食パン", "しょくパンパン"), Term("キノコ", "キノコ"), Term("パイナップル", "パイナップル"), Term("スリップ", "スリップ"), Term("塩水", "しおみず"), Term("マネー", "マネー"), Term("イデオロギー", "イデオロギー"), Term("イヤリング", "イヤリング"), Term("セルフサービス", "セルフサービス"), Term("ダイナマイト", "ダイナマイト"), Term("トイレットペーパー", "トイレットペーパー"), Term("ドーナツ", "ドーナツ"), Term("ネットワーク", "ネットワーク"), Term("天の川", "あまのがわ"), Term("フィクション", "フィクション"), Term("シンボル", "シンボル"), Term("餃子", "ギョーザ"), Term("蛸", "たこ"), Term("キッチン", "キッチン"), Term("スペシャル", "スペシャル"), Term("イスラム教", "イスラムきょう"), Term("リクエスト", "リクエスト"), Term("インテリア", "インテリア"), Term("リモコン", "リモコン"), Term("イントネーション", "イントネーション"), Term("ノーベル賞", "ノーベルしょう"), Term("ノンフィクション", "ノンフィクション"), Term("ティッシュ", "ティッシュ"), Term("バザー", "バザー"), Term("パンティー", "パンティー"), Term("ピーク", "ピーク"), Term("ピリオド", "ピリオド"), Term("シャープペンシル", "シャープペンシル"), Term("ファースト", "ファースト"), Term("粍", "ミリメートル"), Term("スプレー", "スプレー"), Term("ピリピリ", "ピリピリ"), Term("アルミニウム", "アルミニウム"), Term("マヨネーズ", "マヨネーズ"), Term("ミサイル", "ミサイル"), Term("センチメートル", "センチメートル"), Term("アイスコーヒー", "アイスコーヒー"), Term("ですか", "ですか"), Term("フランス語", "フランスご"), Term("ドイツ語", "ドイツご"), Term("まい", "まい"), Term("スペイン語", "スペインご"), Term("インターネット", "インターネット"), Term("シートベルト", "シートベルト"), Term("テレビ番組", "テレビばんぐみ"), Term("クラシック音楽", "クラシックおんがく"), Term("アメリカ合衆国", "アメリカがっしゅうこく"), Term("キャンデー", "キャンデー"), Term("ラテン語", "ラテンご"), Term("バタン", "バタン"), Term("メイド", "メイド"), Term("ウィンドウ", "ウィンドウ"), Term("電子メール", "でんしメールメール"), Term("クラブ活動", "クラブかつどう"), Term("プレーヤー", "プレーヤー"), Term("コーヒーカップ", "コーヒーカップ"), Term("シャボン玉", "シャボンだま"), Term("ボウリング", "ボウリング"), Term("ウォッカ", "ウォッカ"), Term("ウエア", "ウエア"), Term("グラフイック", "グラフイック"), Term("アキレス腱", "アキレスけん"), Term("ウェブサイト", "ウェブサイト"), Term("ダウンロード", "ダウンロード"), Term("アカデミー賞", "アカデミーしょう"), Term("エクストラ", "エクストラ"), Term("しゃぶしゃぶ", "しゃぶしゃぶ"), Term("アイシャドウ", "アイシャドウ"), Term("ベビーフード", "ベビーフード"), Term("カードゲーム", "カードゲーム"), Term("プレイリスト", "プレイリスト"), Term("ホワイトニング", "ホワイトニング"), Term("ウェブページ", "ウェブページ"), Term("ドッグフード", "ドッグフード"), Term("ペットフード", "ペットフード"), Term("パン粉", "パンこ"), Term("ファイアウォール", "ファイアウォール"), Term("金星", "きんせい"), Term("ブラウン管", "ブラウンかん"), Term("スワヒリ語", "スワヒリご"), Term("インスリン", "インスリン"), Term("エッフェル塔", "エッフェルとう"), Term("フライ級", "フライきゅう"), Term("マイル", "マイル"), Term("フットボール", "フットボール"), Term("ポンド", "ポンド"), Term("ピアニスト", "ピアニスト"), Term("ライオン", "ライオン"), Term("ダイエット", "ダイエット"), Term("プロジェクト", "プロジェクト"), Term("チェス", "チェス"), Term("フィート", "フィート"), Term("ピザ", "ピザ"), Term("ジョーク", "ジョーク"), Term("パレード", "パレード"), Term("クレジットカード", "クレジットカード"), Term("キャロル", "キャロル"), Term("ツアー", "ツアー"), Term("パイ", "パイ"), Term("ジャケット", "ジャケット"), Term("ゴリラ", "ゴリラ"), Term("テレビゲーム", "テレビゲーム"), Term("サーカス", "サーカス"), Term("ボランティア", "ボランティア"), Term("トラベラーズチェック", "トラベラーズチェック"), Term("ブロック", "ブロック"), Term("インチ", "インチ"), Term("インディアン", "インディアン"), Term("コアラ", "コアラ"), Term("オーブン", "オーブン"), Term("パズル", "パズル"), Term("ビートルズ", "ビートルズ"), Term("ボクシング", "ボクシング"), Term("ミュージカル", "ミュージカル"), Term("ソフトウェア", "ソフトウェア"), Term("ディズニーランド", "ディズニーランド"), Term("トランク", "トランク"), Term("ニュートン", "ニュートン"), Term("ホームページ", "ホームページ"), Term("パンチ", "パンチ"), Term("コンタクトレンズ", "コンタクトレンズ"), Term("サイクリング", "サイクリング"), Term("オペラ", "オペラ"), Term("アクセス", "アクセス"), Term("フルート", "フルート"), Term("アドレス", "アドレス"), Term("リラックス", "リラックス"), Term("バッテリー", "バッテリー"), Term("ミニスカート", "ミニスカート"), Term("パブ", "パブ"), Term("チーズケーキ", "チーズケーキ"), Term("ブランデー", "ブランデー"), Term("スコア", "スコア"), Term("ソーセージ", "ソーセージ"), Term("クレジット", "クレジット"), Term("プライバシー", "プライバシー"), Term("ベビーシッター", "ベビーシッター"), Term("ボーイング", "ボーイング"), Term("マーガリン", "マーガリン"), Term("キーボード", "キーボード"), Term("リムジン", "リムジン"), Term("データベース", "データベース"), Term("デザイナー", "デザイナー"), Term("ハイジャック", "ハイジャック"), Term("バイオリニスト", "バイオリニスト"), Term("バルコニー", "バルコニー"), Term("バレンタインデー", "バレンタインデー"), Term("サーフィン", "サーフィン"), Term("ヒーロー", "ヒーロー"), Term("シチュー", "シチュー"), Term("ブログ", "ブログ"), Term("ニーズ", "ニーズ"), Term("カフェテリア", "カフェテリア"), Term("ポーター", "ポーター"), Term("スタジアム", "スタジアム"), Term("プロセス", "プロセス"), Term("マット", "マット"), Term("サーバ", "サーバ"), Term("ココア", "ココア"), Term("オーク", "オーク"), Term("バブル", "バブル"), Term("メールアドレス", "メールアドレス"), Term("スポット", "スポット"), Term("ブラスバンド", "ブラスバンド"), Term("プレゼンテーション", "プレゼンテーション"), Term("ジェスチャー", "ジェスチャー"), Term("カンガルー", "カンガルー"), Term("ガードレール", "ガードレール"), Term("ボード", "ボード"), Term("ガウン", "ガウン"), Term("ガロン", "ガロン"), Term("スペースシャトル", "スペースシャトル"), Term("メダル", "メダル"), Term("キャンペーン", "キャンペーン"), Term("セミナー", "セミナー"), Term("ライン", "ライン"), Term("リスク", "リスク"), Term("マーケティング", "マーケティング"), Term("リンク", "リンク"), Term("インパクト", "インパクト"), Term("クレーム", "クレーム"), Term("グー", "グー"), Term("デジタル", "デジタル"), Term("エクスプレス", "エクスプレス"), Term("トロフィー", "トロフィー"), Term("ハロウィーン", "ハロウィーン"), Term("ラップ", "ラップ"), Term("コンドーム", "コンドーム"), Term("オーダー", "オーダー"), Term("バーベキュー", "バーベキュー"), Term("コンマ", "コンマ"), Term("バリケード", "バリケード"), Term("バレリーナ", "バレリーナ"), Term("ショーウインドー", "ショーウインドー"), Term("パートナー", "パートナー"), Term("アイテム", "アイテム"), Term("オムレツ", "オムレツ"), Term("ブルース", "ブルース"), Term("カウボーイ", "カウボーイ"), Term("フリーダイヤル", "フリーダイヤル"), Term("シャンプー", "シャンプー"), Term("カヌー", "カヌー"), Term("ジェット", "ジェット"), Term("マニュアル", "マニュアル"), Term("カリキュラム", "カリキュラム"), Term("ヘルメット", "ヘルメット"), Term("スケッチ", "スケッチ"), Term("マイアミ", "マイアミ"), Term("マフィア", "マフィア"), Term("マラリア", "マラリア"), Term("スポンジ", "スポンジ"), Term("ライブ", "ライブ"), Term("ラウンド", "ラウンド"), Term("ギプス", "ギプス"), Term("クーデター", "クーデター"), Term("リーダーシップ", "リーダーシップ"), Term("タグ", "タグ"), Term("クラウン", "クラウン"), Term("ルネサンス", "ルネサンス"), Term("クリケット", "クリケット"), Term("クリック", "クリック"), Term("ワイルド", "ワイルド"), Term("デッキ", "デッキ"), Term("トースター", "トースター"), Term("シーン", "シーン"), Term("トラクター", "トラクター"), Term("トランペット", "トランペット"), Term("トリック", "トリック"), Term("トレード", "トレード"), Term("エコロジー", "エコロジー"), Term("ニッケル", "ニッケル"), Term("コンパクト", "コンパクト"), Term("コメディアン", "コメディアン"), Term("ネット", "ネット"), Term("コルク", "コルク"), Term("ノンストップ", "ノンストップ"), Term("ハイヒール", "ハイヒール"), Term("オーラ", "オーラ"), Term("サーブ", "サーブ"), Term("パスワード", "パスワード"), Term("リストラ", "リストラ"), Term("ヒステリー", "ヒステリー"), Term("ピラミッド", "ピラミッド"), Term("フライ", "フライ"), Term("シャベル", "シャベル"), Term("ブーメラン", "ブーメラン"), Term("ショット", "ショット"), Term("ブラジャー", "ブラジャー"), Term("シンデレラ", "シンデレラ"), Term("プリズム", "プリズム"), Term("プリンター", "プリンター"), Term("プライベート", "プライベート"), Term("ディーラー", "ディーラー"), Term("ヘッドホン", "ヘッドホン"), Term("ヘロイン", "ヘロイン"), Term("ペニシリン", "ペニシリン"), Term("アメリカン", "アメリカン"), Term("ホッケー", "ホッケー"), Term("ホップ", "ホップ"), Term("ホラー", "ホラー"), Term("ガリバー", "ガリバー"), Term("マック", "マック"), Term("ストリート", "ストリート"), Term("アンプ", "アンプ"), Term("モード", "モード"), Term("セクシー", "セクシー"), Term("ラッキー", "ラッキー"), Term("ソナタ", "ソナタ"), Term("ラマ", "ラマ"), Term("クオート", "クオート"), Term("レーダー", "レーダー"), Term("レスリング", "レスリング"), Term("ローラースケート", "ローラースケート"), Term("ワールドカップ", "ワールドカップ"), Term("ワールドシリーズ", "ワールドシリーズ"), Term("チャレンジ", "チャレンジ"), Term("スカッシュ", "スカッシュ"), Term("テクニカル", "テクニカル"), Term("ウインタースポーツ", "ウインタースポーツ"), Term("テロリズム", "テロリズム"), Term("ディスク", "ディスク"), Term("ディベート", "ディベート"), Term("グレープフルーツ", "グレープフルーツ"), Term("ケチャップ", "ケチャップ"), Term("ドーム", "ドーム"), Term("レア", "レア"), Term("コカイン", "コカイン"), Term("ハンドボール", "ハンドボール"), Term("ニューズウィーク", "ニューズウィーク"), Term("ジグザグ", "ジグザグ"), Term("エラー", "エラー"), Term("コンサルタント", "コンサルタント"), Term("ハーブ", "ハーブ"), Term("ハーモニカ", "ハーモニカ"), Term("ハイテク", "ハイテク"), Term("ハンバーグ", "ハンバーグ"), Term("サロン", "サロン"), Term("バーボン", "バーボン"), Term("バウンド", "バウンド"), Term("フライング", "フライング"), Term("ソフトドリンク", "ソフトドリンク"), Term("バリエーション", "バリエーション"), Term("バレンタイン", "バレンタイン"), Term("バンパー", "バンパー"), Term("オゾンホール", "オゾンホール"), Term("パッケージ", "パッケージ"), Term("パニック", "パニック"), Term("パネル", "パネル"), Term("パレット", "パレット"), Term("パンジー", "パンジー"), Term("オプション", "オプション"), Term("クロール", "クロール"), Term("オペレーター", "オペレーター"), Term("ビート", "ビート"), Term("アクション", "アクション"), Term("ピーマン", "ピーマン"), Term("オリジナル", "オリジナル"), Term("ファウル", "ファウル"), Term("ファシズム", "ファシズム"), Term("アスパラガス", "アスパラガス"), Term("カール", "カール"), Term("シフト", "シフト"), Term("ミサ", "ミサ"), Term("シャトルバス", "シャトルバス"), Term("カオス", "カオス"), Term("シャンデリア", "シャンデリア"), Term("スーパーマン", "スーパーマン"), Term("ブラインド", "ブラインド"), Term("ブランド", "ブランド"), Term("シリウス", "シリウス"), Term("ブレスレット", "ブレスレット"), Term("シルクロード", "シルクロード"), Term("シロップ", "シロップ"), Term("カフェ", "カフェ"), Term("カプセル", "カプセル"), Term("プランクトン", "プランクトン"), Term("シンナー", "シンナー"), Term("ジープ", "ジープ"), Term("プレス", "プレス"), Term("アニメ", "アニメ"), Term("プロフィール", "プロフィール"), Term("プロフェッショナル", "プロフェッショナル"), Term("ジム", "ジム"), Term("リリース", "リリース"), Term("メーデー", "メーデー"), Term("ゴシック", "ゴシック"), Term("スパッツ", "スパッツ"), Term("トレーラー", "トレーラー"), Term("バイキング", "バイキング"), Term("ジョッキ", "ジョッキ"), Term("ペンダント", "ペンダント"), Term("スーパーボウル", "スーパーボウル"), Term("ホームステイ", "ホームステイ"), Term("ホームルーム", "ホームルーム"), Term("ホスト", "ホスト"), Term("ゲイ", "ゲイ"), Term("ボイラー", "ボイラー"), Term("ボンネット", "ボンネット"), Term("ボンベ", "ボンベ"), Term("アルデヒド", "アルデヒド"), Term("ガッツポーズ", "ガッツポーズ"), Term("ポニーテール", "ポニーテール"), Term("マジック", "マジック"), Term("マスタード", "マスタード"), Term("マスメディア", "マスメディア"), Term("キーワード", "キーワード"), Term("ストーリー", "ストーリー"), Term("マニア", "マニア"), Term("ストライク", "ストライク"), Term("ストレート", "ストレート"), Term("キップ", "キップ"), Term("ストロンチウム", "ストロンチウム"), Term("スナップ", "スナップ"), Term("ムスタング", "ムスタング"), Term("キャビア", "キャビア"), Term("スランプ", "スランプ"), Term("キャンバス", "キャンバス"), Term("スローガン", "スローガン"), Term("セッション", "セッション"), Term("ユーロ", "ユーロ"), Term("ラウンジ", "ラウンジ"), Term("ギャラリー", "ギャラリー"), Term("リクルート", "リクルート"), Term("リサイクル", "リサイクル"), Term("クエーサー", "クエーサー"), Term("クック", "クック"), Term("クライアント", "クライアント"), Term("リベート", "リベート"), Term("インテル", "インテル"), Term("リング", "リング"), Term("ルー", "ルー"), Term("ダイビング", "ダイビング"), Term("ノルディック", "ノルディック"), Term("ダメージ", "ダメージ"), Term("クリスマスツリー", "クリスマスツリー"), Term("クリップ", "クリップ"), Term("ゼラチン", "ゼラチン"), Term("チャリティー", "チャリティー"), Term("ワイド", "ワイド"), Term("ワイヤ", "ワイヤ"), Term("チューブ", "チューブ"), Term("ウィジェット", "ウィジェット"), Term("テーピング", "テーピング"), Term("ドレッシング", "ドレッシング"), Term("グライダー", "グライダー"), Term("ウエスタン", "ウエスタン"), Term("グラマー", "グラマー"), Term("マニキュア", "マニキュア"), Term("グランプリ", "グランプリ"), Term("グリークラブ", "グリークラブ"), Term("ディスプレイ", "ディスプレイ"), Term("ディフェンス", "ディフェンス"), Term("グロテスク", "グロテスク"), Term("フォース", "フォース"), Term("エイリアン", "エイリアン"), Term("リッチ", "リッチ"), Term("トレー", "トレー"), Term("コール", "コール"), Term("ドキュメンタリー", "ドキュメンタリー"), Term("ドラゴン", "ドラゴン"), Term("ドリアン", "ドリアン"), Term("ドロップ", "ドロップ"), Term("エスプリ", "エスプリ"), Term("ナイーブ", "ナイーブ"), Term("ナイトクラブ", "ナイトクラブ"), Term("ナショナリズム", "ナショナリズム"), Term("エバー", "エバー"), Term("ヌード", "ヌード"), Term("コラムニスト", "コラムニスト"), Term("コレクター", "コレクター"), Term("コレステロール", "コレステロール"), Term("ノイズ", "ノイズ"), Term("プロレス", "プロレス"), Term("コンコルド", "コンコルド"), Term("ハードボイルド", "ハードボイルド"), Term("ハードロック", "ハードロック"), Term("ハーフタイム", "ハーフタイム"), Term("ハープ", "ハープ"), Term("シミュレーション", "シミュレーション"), Term("ハイブリッド", "ハイブリッド"), Term("マイナー", "マイナー"), Term("ハムスター", "ハムスター"), Term("ワード", "ワード"), Term("コンドル", "コンドル"), Term("コンパ", "コンパ"), Term("コンパニオン", "コンパニオン"), Term("バースデー", "バースデー"), Term("バーベル", "バーベル"), Term("オーディション", "オーディション"), Term("バイヤー", "バイヤー"), Term("ゴーグル", "ゴーグル"), Term("ゴーストタウン", "ゴーストタウン"), Term("オードブル", "オードブル"), Term("ショート", "ショート"), Term("バニラ", "バニラ"), Term("バリウム", "バリウム"), Term("オーボエ", "オーボエ"), Term("オープンカー", "オープンカー"), Term("バロック", "バロック"), Term("バント", "バント"), Term("オクラ", "オクラ"), Term("アイスホッケー", "アイスホッケー"), Term("オスカー", "オスカー"), Term("オゾン", "オゾン"), Term("パッション", "パッション"), Term("サスペンス", "サスペンス"), Term("パット", "パット"), Term("アイデンティティ", "アイデンティティ"), Term("アイヌ", "アイヌ"), Term("ビリヤード", "ビリヤード"), Term("パラダイム", "パラダイム"), Term("シャトル", "シャトル"), Term("パロディー", "パロディー"), Term("アカデミー", "アカデミー"), Term("パンプス", "パンプス"), Term("ジャスト", "ジャスト"), Term("アクロバット", "アクロバット"), Term("ピストン", "ピストン"), Term("ピッキング", "ピッキング"), Term("ピック", "ピック"), Term("シークレットサービス", "シークレットサービス"), Term("アコーディオン", "アコーディオン"), Term("ファインダー", "ファインダー"), Term("オンス", "オンス"), Term("カートリッジ", "カートリッジ"), Term("シナモン", "シナモン"), Term("フォークソング", "フォークソング"), Term("フォーマット", "フォーマット"), Term("フォワード", "フォワード"), Term("フライドチキン", "フライドチキン"), Term("ミッション", "ミッション"), Term("シャフト", "シャフト"), Term("フラストレーション", "フラストレーション"), Term("シュークリーム", "シュークリーム"), Term("フレーズ", "フレーズ"), Term("フレーム", "フレーム"), Term("アトラクション", "アトラクション"), Term("ショートカット", "ショートカット"), Term("ブランク", "ブランク"), Term("ブルーカラー", "ブルーカラー"), Term("ブレザー", "ブレザー"), Term("シルエット", "シルエット"), Term("ブレッド", "ブレッド"), Term("プチ", "プチ"), Term("マジシャン", "マジシャン"), Term("プラモデル", "プラモデル"), Term("ドック", "ドック"), Term("アナリスト", "アナリスト"), Term("プロダクション", "プロダクション"), Term("ヘクタール", "ヘクタール"), Term("ジャガー", "ジャガー"), Term("カルチャーショック", "カルチャーショック"), Term("ベーコン", "ベーコン"), Term("ジャンクション", "ジャンクション"), Term("カルピス", "カルピス"), Term("スパイク", "スパイク"), Term("ナット", "ナット"), Term("シングルス", "シングルス"), Term("レンタルビデオ", "レンタルビデオ"), Term("スイング", "スイング"), Term("ジョーカー", "ジョーカー"), Term("ペスト", "ペスト"), Term("ホイッスル", "ホイッスル"), Term("スキッパー", "スキッパー"), Term("スキン", "スキン"), Term("スクラップ", "スクラップ"), Term("ボルボ", "ボルボ"), Term("スクリュー", "スクリュー"), Term("ポーカー", "ポーカー"), Term("スケープゴート", "スケープゴート"), Term("ポール", "ポール"), Term("スケッチブック", "スケッチブック"), Term("ポテトチップス", "ポテトチップス"), Term("ポピュラー", "ポピュラー"), Term("ポリープ", "ポリープ"), Term("ポロ", "ポロ"), Term("マーカー", "マーカー"), Term("マイクロ", "マイクロ"), Term("ステーション", "ステーション"), Term("マグニチュード", "マグニチュード"), Term("マグネシウム", "マグネシウム"), Term("マスコット", "マスコット"), Term("マスト", "マスト"), Term("マックス", "マックス"), Term("ストップウォッチ", "ストップウォッチ"), Term("マルチ", "マルチ"), Term("マンモス", "マンモス"), Term("ミイラ", "ミイラ"), Term("フラッシュ", "フラッシュ"), Term("ミスター", "ミスター"), Term("ミット", "ミット"), Term("ミニディスク", "ミニディスク"), Term("ミネラル", "ミネラル"), Term("アンモニア", "アンモニア"), Term("ミンク", "ミンク"), Term("スプリンクラー", "スプリンクラー"), Term("パントマイム", "パントマイム"), Term("キャビネット", "キャビネット"), Term("スペクトル", "スペクトル"), Term("キャブレター", "キャブレター"), Term("スポンサー", "スポンサー"), Term("スリーサイズ", "スリーサイズ"), Term("モーターショー", "モーターショー"), Term("スリラー", "スリラー"), Term("モザイク", "モザイク"), Term("キャンピングカー", "キャンピングカー"), Term("モデム", "モデム"), Term("イブ", "イブ"), Term("モルヒネ", "モルヒネ"), Term("セーブ", "セーブ"), Term("ヤンキー", "ヤンキー"), Term("セクター", "セクター"), Term("ヨーグルト", "ヨーグルト"), Term("ライセンス", "ライセンス"), Term("ギタリスト", "ギタリスト"), Term("センチメンタル", "センチメンタル"), Term("ラボ", "ラボ"), Term("ラリー", "ラリー"), Term("ランキング", "ランキング"), Term("ランク", "ランク"), Term("ソプラノ", "ソプラノ"), Term("リーグ", "リーグ"), Term("リアル", "リアル"), Term("リザーブ", "リザーブ"), Term("リゾート", "リゾート"), Term("タイムスタンプ", "タイムスタンプ"), Term("リトル", "リトル"), Term("タキシード", "タキシード"), Term("リフォーム", "リフォーム"), Term("リフト", "リフト"), Term("リュックサック", "リュックサック"), Term("クラッチ", "クラッチ"), Term("ロゼ", "ロゼ"), Term("レゲエ", "レゲエ"), Term("レジスター", "レジスター"), Term("レッテル", "レッテル"), Term("ダンプカー", "ダンプカー"), Term("レトルト", "レトルト"), Term("レトロ", "レトロ"), Term("レフト", "レフト"), Term("チェッカー", "チェッカー"), Term("チェロ", "チェロ"), Term("チタン", "チタン"), Term("ロッジ", "ロッジ"), Term("ジャッキ", "ジャッキ"), Term("ビーナス", "ビーナス"), Term("両足", "りょうそく"), Term("赤色", "あかいろ"), Term("南アフリカ", "みなみアフリカアフリカ"), Term("申", "さる"), Term("藤", "ふじ"), Term("八丁", "はっちょう"), Term("午", "うま"), Term("出し", "だし"), Term("一枚岩", "いちまいいわ"), Term("競艇", "きょうてい"), Term("宅地", "たくち"), Term("短期大学", "たんきだいがく"), Term("朝鮮民主主義人民共和国", "ちょうせんみんしゅしゅぎじんみんきょうわこく"), Term("殿下", "でんか"), Term("気象台", "きしょうだい"), Term("中部", "ちゅうぶ"), Term("航空自衛隊", "こうくうじえいたい"), Term("宮内庁", "くないちょう"), Term("国立劇場", "こくりつげきじょう"), Term("国土地理院", "こくどちりいん"), Term("警察庁", "けいさつちょう"), Term("競馬場", "けいばじょう"), Term("警視庁", "けいしちょう"), Term("法務省", "ほうむしょう"), Term("迎賓館", "げいひんかん"), Term("盲学校", "もうがっこう"), Term("平壌", "ピョンヤン"), Term("日本銀行", "にっぽんぎんこう"), Term("千島列島", "ちしまれっとう"), Term("特許庁", "とっきょちょう"), Term("窯", "かま"), Term("浄土真宗", "じょうどしんしゅう"), Term("郵政省", "ゆうせいしょう"), Term("コイン", "コイン"), Term("ローン", "ローン"), Term("リード", "リード"), Term("ピント", "ピント"), Term("タッチ", "タッチ"), Term("ジャパン", "ジャパン"), Term("惚け", "ぼけ"), Term("ハイ", "ハイ"), Term("紺屋", "こうや"), Term("方位", "ほうい"), Term("御輿", "みこし"), Term("鉢巻", "はちまき"), Term("ソ連", "ソれん"), Term("メーン", "メーン"), Term("軟派", "なんぱ"), Term("戌", "いぬ"), Term("天満宮", "てんまんぐう"), Term("文部科学省", "もんぶかがくしょう"), Term("アルプス", "アルプス"), Term("ナポレオン", "ナポレオン"), Term("ベートーヴェン", "ベートーヴェン"), Term("フロリダ", "フロリダ"), Term("テキサス", "テキサス"), Term("ロス", "ロス"), Term("サミット", "サミット"), Term("イースター", "イースター"), Term("ハート", "ハート"), Term("メリット", "メリット"), Term("チョコ", "チョコ"), Term("ビクトリア", "ビクトリア"), Term("テネシー", "テネシー"), Term("コロラド", "コロラド"), Term("バージニア", "バージニア"), Term("パーツ", "パーツ"), Term("サイド", "サイド"), Term("オハイオ", "オハイオ"), Term("シュート", "シュート"), Term("ピル", "ピル"), Term("バンクーバー", "バンクーバー"), Term("メモリー", "メモリー"), Term("ツール", "ツール"), Term("ユー", "ユー"), Term("レール", "レール"), Term("トロイ", "トロイ"), Term("コロニー", "コロニー"), Term("ハーモニー", "ハーモニー"), Term("パシフィック", "パシフィック"), Term("サバンナ", "サバンナ"), Term("ヒマラヤ", "ヒマラヤ"), Term("ブレーン", "ブレーン"), Term("カンザス", "カンザス"), Term("ミシガン", "ミシガン"), Term("ミズーリ", "ミズーリ"), Term("メンフィス", "メンフィス"), Term("ユタ", "ユタ"), Term("クルー", "クルー"), Term("浪漫", "ロマン"), Term("だ", "だ"), Term("歳", "さい"), Term("今まで", "いままで"), Term("心から", "こころから"), Term("一個", "いっこ"), Term("一回", "いっかい"), Term("一歩", "いっぽ"), Term("一晩", "ひとばん"), Term("緑色", "みどりいろ"), Term("片方", "かたほう"), Term("一口", "ひとくち"), Term("宝物", "たからもの"), Term("二分", "にぶん"), Term("一節", "いっせつ"), Term("報う", "むくう"), Term("新居", "しんきょ"), Term("一発", "いっぱつ"), Term("五分", "ごぶ"), Term("農作物", "のうさくぶつ"), Term("一泊", "いっぱく"), Term("烏", "からす"), Term("一つ一つ", "ひとつひとつ"), Term("遣わす", "つかわす"), Term("房", "ふさ"), Term("間中", "あいだじゅう"), Term("十二分", "じゅうにぶん"), Term("大家", "たいか"), Term("白鳥", "はくちょう"), Term("右腕", "みぎうで"), Term("草原", "そうげん"), Term("入り", "いり"), Term("布地", "ぬのじ"), Term("一握り", "ひとにぎり"), Term("一点", "いってん"), Term("相手方", "あいてかた"), Term("越し", "ごし"), Term("不合格", "ふごうかく"), Term("姑", "しゅうとめ"), Term("悪性", "あくせい"), Term("小国", "しょうこく"), Term("一件", "いっけん"), Term("日本一", "にほんいち"), Term("一通", "いっつう"), Term("旨", "むね"), Term("三本", "さんぼん"), Term("張り", "ばり"), Term("再検討", "さいけんとう"), Term("崎", "さき"), Term("早々", "そうそう"), Term("一端", "いったん"), Term("一文", "いちもん"), Term("不必要", "ふひつよう"), Term("上がったり", "あがったり"), Term("仕立て", "したて"), Term("一千", "いっせん"), Term("良", "りょう"), Term("著", "ちょ"), Term("上方", "かみがた"), Term("見え隠れ", "みえがくれ"), Term("出店", "でみせ"), Term("一室", "いっしつ"), Term("黒衣", "こくい"), Term("大根", "だいこん"), Term("梁", "はり"), Term("十八番", "おはこ"), Term("突き", "つき"), Term("軽やか", "かろやか"), Term("段ボール", "だんボールボール"), Term("供", "とも"), Term("報", "ほう"), Term("ＭＰ３プレーヤー", "プレーヤー"), Term("原野", "げんや"), Term("高地", "こうち"), Term("経", "きょう"), Term("兄ちゃん", "あんちゃん"), Term("里", "り"), Term("珍", "ちん"), Term("山村", "さんそん"), Term("癒着", "ゆちゃく"), Term("和菓子", "わがし"), Term("集落", "しゅうらく"), Term("持病", "じびょう"), Term("出入", "しゅつにゅう"), Term("緒", "お"), Term("一回り", "ひとまわり"), Term("一首", "いっしゅ"), Term("一派", "いっぱ"), Term("瀬", "せ"), Term("猟", "りょう"), Term("南方", "なんぽう"), Term("酷", "こく"), Term("内々", "うちうち"), Term("城内", "じょうない"), Term("鉄製", "てっせい"), Term("西方", "せいほう"), Term("年明け", "としあけ"), Term("無期限", "むきげん"), Term("不均衡", "ふきんこう"), Term("物心", "ものごころ"), Term("一世", "いっせい"), Term("門戸", "もんこ"), Term("三百", "さんびゃく"), Term("前々", "まえまえ"), Term("御所", "ごしょ"), Term("詩歌", "しいか"), Term("差し止め", "さしとめ"), Term("将", "しょう"), Term("無免許", "むめんきょ"), Term("大道", "だいどう"), Term("大自然", "だいしぜん"), Term("計測", "けいそく"), Term("打順", "だじゅん"), Term("高炉", "こうろ"), Term("儒教", "じゅきょう"), Term("受信機", "じゅしんき"), Term("受精卵", "じゅせいらん"), Term("落語", "らくご"), Term("凝固", "ぎょうこ"), Term("市民社会", "しみんしゃかい"), Term("広報", "こうほう"), Term("電光", "でんこう"), Term("悪役", "あくやく"), Term("襲名", "しゅうめい"), Term("史跡", "しせき"), Term("検視", "けんし"), Term("住宅地", "じゅうたくち"), Term("住友銀行", "すみともぎんこう"), Term("十字", "じゅうじ"), Term("安楽死", "あんらくし"), Term("安全保障", "あんぜんほしょう"), Term("安打", "あんだ"), Term("重さ", "おもさ"), Term("重ね合わせ", "かさねあわせ"), Term("任意", "にんい"), Term("重心", "じゅうしん"), Term("重油", "じゅうゆ"), Term("伊勢丹", "いせたん"), Term("囲碁", "いご"), Term("威嚇", "いかく"), Term("春闘", "しゅんとう"), Term("取り消し", "とりけし"), Term("処女", "しょじょ"), Term("初演", "しょえん"), Term("曙", "あけぼの"), Term("投票箱", "とうひょうばこ"), Term("医師会", "いしかい"), Term("踏み絵", "ふみえ"), Term("社会教育", "しゃかいきょういく"), Term("商工会議所", "しょうこうかいぎしょ"), Term("写真集", "しゃしんしゅう"), Term("商標", "しょうひょう"), Term("小銃", "しょうじゅう"), Term("少将", "しょうしょう"), Term("消印", "けしいん"), Term("被疑者", "ひぎしゃ"), Term("実像", "じつぞう"), Term("本因坊", "ほんいんぼう"), Term("社会復帰", "しゃかいふっき"), Term("大正", "たいしょう"), Term("文中", "ぶんちゅう"), Term("一方通行", "いっぽうつうこう"), Term("情報処理", "じょうほうしょり"), Term("条例", "じょうれい"), Term("小惑星", "しょうわくせい"), Term("浄土", "じょうど"), Term("譲渡", "じょうと"), Term("角膜", "かくまく"), Term("逸脱", "いつだつ"), Term("食肉", "しょくにく"), Term("食品添加物", "しょくひんてんかぶつ"), Term("打点", "だてん"), Term("右翼", "うよく"), Term("新語", "しんご"), Term("新星", "しんせい"), Term("新生", "しんせい"), Term("神楽", "かぐら"), Term("親日", "しんにち"), Term("栄養士", "えいようし"), Term("栄養失調", "えいようしっちょう"), Term("栄養素", "えいようそ"), Term("震源", "しんげん"), Term("震度", "しんど"), Term("人事院", "じんじいん"), Term("人道", "じんどう"), Term("人民戦線", "じんみんせんせん"), Term("国学", "こくがく"), Term("人名", "じんめい"), Term("演歌", "えんか"), Term("水銀", "すいぎん"), Term("水産業", "すいさんぎょう"), Term("浮世絵", "うきよえ"), Term("勝率", "しょうりつ"), Term("水力", "すいりょく"), Term("塩基", "えんき"), Term("性教育", "せいきょういく"), Term("偵察", "ていさつ"), Term("成層圏", "せいそうけん"), Term("国民年金", "こくみんねんきん"), Term("王朝", "おうちょう"), Term("黄金時代", "おうごんじだい"), Term("屋台", "やたい"), Term("生殖", "せいしょく"), Term("精子", "せいし"), Term("製鋼", "せいこう"), Term("製薬", "せいやく"), Term("広葉樹", "こうようじゅ"), Term("抗告", "こうこく"), Term("下敷き", "したじき"), Term("斉唱", "せいしょう"), Term("不妊", "ふにん"), Term("石灰", "せっかい"), Term("石橋", "いしばし"), Term("積雪", "せきせつ"), Term("接種", "せっしゅ"), Term("浪人", "ろうにん"), Term("接着", "せっちゃく"), Term("絶句", "ぜっく"), Term("船体", "せんたい"), Term("宣教師", "せんきょうし"), Term("夏時間", "なつじかん"), Term("家元", "いえもと"), Term("家族計画", "かぞくけいかく"), Term("船主", "せんしゅ"), Term("寡占", "かせん"), Term("銭湯", "せんとう"), Term("歌曲", "かきょく"), Term("養老", "ようろう"), Term("火炎瓶", "かえんびん"), Term("火山灰", "かざんばい"), Term("火葬", "かそう"), Term("全体主義", "ぜんたいしゅぎ"), Term("大腸菌", "だいちょうきん"), Term("大動脈", "だいどうみゃく"), Term("総会屋", "そうかいや"), Term("総統", "そうとう"), Term("総督", "そうとく"), Term("原子炉", "げんしろ"), Term("贈与", "ぞうよ"), Term("回し", "まわし"), Term("造語", "ぞうご"), Term("回廊", "かいろう"), Term("足場", "あしば"), Term("在日", "ざいにち"), Term("損害保険", "そんがいほけん"), Term("御用邸", "ごようてい"), Term("余震", "よしん"), Term("打ち込み", "うちこみ"), Term("打数", "だすう"), Term("舵", "かじ"), Term("三部作", "さんぶさく"), Term("循環器", "じゅんかんき"), Term("体外受精", "たいがいじゅせい"), Term("共生", "きょうせい"), Term("胎児", "たいじ"), Term("代謝", "たいしゃ"), Term("伐採", "ばっさい"), Term("常勤", "じょうきん"), Term("大隊", "だいたい"), Term("外野手", "がいやしゅ"), Term("大麻", "たいま"), Term("弾頭", "だんとう"), Term("弾道", "だんどう"), Term("弾薬", "だんやく"), Term("断層", "だんそう"), Term("団塊", "だんかい"), Term("楽章", "がくしょう"), Term("中尉", "ちゅうい"), Term("中央集権", "ちゅうおうしゅうけん"), Term("中佐", "ちゅうさ"), Term("中性子", "ちゅうせいし"), Term("信用金庫", "しんようきんこ"), Term("超音波", "ちょうおんぱ"), Term("完封", "かんぷう"), Term("音頭", "おんど"), Term("令状", "れいじょう"), Term("弾劾", "だんがい"), Term("縄張り", "なわばり"), Term("辻", "つじ"), Term("買い占め", "かいしめ"), Term("肝硬変", "かんこうへん"), Term("艦隊", "かんたい"), Term("帝国主義", "ていこくしゅぎ"), Term("還流", "かんりゅう"), Term("天下り", "あまくだり"), Term("協同組合", "きょうどうくみあい"), Term("天然記念物", "てんねんきねんぶつ"), Term("発熱", "はつねつ"), Term("火砕流", "かさいりゅう"), Term("公共放送", "こうきょうほうそう"), Term("丸刈り", "まるがり"), Term("点字", "てんじ"), Term("伝承", "でんしょう"), Term("伝送", "でんそう"), Term("殿堂", "でんどう"), Term("電圧", "でんあつ"), Term("電極", "でんきょく"), Term("売春", "ばいしゅん"), Term("塗料", "とりょう"), Term("都道府県", "とどうふけん"), Term("土器", "どき"), Term("機械化", "きかいか"), Term("機雷", "きらい"), Term("動脈", "どうみゃく"), Term("生き埋め", "いきうめ"), Term("同性愛", "どうせいあい"), Term("季語", "きご"), Term("紀行", "きこう"), Term("通信社", "つうしんしゃ"), Term("貴金属", "ききんぞく"), Term("軌跡", "きせき"), Term("復員", "ふくいん"), Term("儀礼", "ぎれい"), Term("内包", "ないほう"), Term("内野", "ないや"), Term("用心棒", "ようじんぼう"), Term("内野手", "ないやしゅ"), Term("南海", "なんかい"), Term("伊達", "だて"), Term("二軍", "にぐん"), Term("農地改革", "のうちかいかく"), Term("議院", "ぎいん"), Term("二塁手", "にるいしゅ"), Term("二塁打", "にるいだ"), Term("近世", "きんせい"), Term("脳出血", "のうしゅっけつ"), Term("検察官", "けんさつかん"), Term("球菌", "きゅうきん"), Term("民間放送", "みんかんほうそう"), Term("配電", "はいでん"), Term("劇画", "げきが"), Term("埋め立て地", "うめたてち"), Term("萩", "はぎ"), Term("伯爵", "はくしゃく"), Term("魚介類", "ぎょかいるい"), Term("魚類", "ぎょるい"), Term("白血球", "はっけっきゅう"), Term("赤松", "あかまつ"), Term("白血病", "はっけつびょう"), Term("供養", "くよう"), Term("迫撃砲", "はくげきほう"), Term("爆竹", "ばくちく"), Term("競歩", "きょうほ"), Term("辰", "たつ"), Term("共犯", "きょうはん"), Term("共和制", "きょうわせい"), Term("隼", "はやぶさ"), Term("判例", "はんれい"), Term("連戦", "れんせん"), Term("半導体", "はんどうたい"), Term("軽自動車", "けいじどうしゃ"), Term("乱獲", "らんかく"), Term("立ち合い", "たちあい"), Term("反動", "はんどう"), Term("藩", "はん"), Term("番付", "ばんづけ"), Term("保釈", "ほしゃく"), Term("共産党", "きょうさんとう"), Term("橋脚", "きょうきゃく"), Term("狂言", "きょうげん"), Term("金融市場", "きんゆうしじょう"), Term("家人", "かじん"), Term("歌合", "うたあわせ"), Term("尾根", "おね"), Term("琵琶", "びわ"), Term("微生物", "びせいぶつ"), Term("富士通", "ふじつう"), Term("扶助", "ふじょ"), Term("防災", "ぼうさい"), Term("和紙", "わし"), Term("武道", "ぶどう"), Term("九重", "ここのえ"), Term("復調", "ふくちょう"), Term("駆逐艦", "くちくかん"), Term("複利", "ふくり"), Term("青木", "あおき"), Term("化学兵器", "かがくへいき"), Term("仏壇", "ぶつだん"), Term("反米", "はんべい"), Term("一騎打ち", "いっきうち"), Term("文楽", "ぶんらく"), Term("行司", "ぎょうじ"), Term("併殺", "へいさつ"), Term("首長", "しゅちょう"), Term("平年", "へいねん"), Term("平面", "へいめん"), Term("軍国主義", "ぐんこくしゅぎ"), Term("軍配", "ぐんばい"), Term("偏り", "かたより"), Term("巡礼", "じゅんれい"), Term("保安", "ほあん"), Term("同名", "どうめい"), Term("捕手", "ほしゅ"), Term("山形", "やまがた"), Term("法務", "ほうむ"), Term("軽油", "けいゆ"), Term("鳴門", "なると"), Term("砲弾", "ほうだん"), Term("邦楽", "ほうがく"), Term("芸名", "げいめい"), Term("意思表示", "いしひょうじ"), Term("望月", "もちづき"), Term("本家", "ほんけ"), Term("本会議", "ほんかいぎ"), Term("本願", "ほんがん"), Term("本籍", "ほんせき"), Term("本堂", "ほんどう"), Term("本塁打", "ほんるいだ"), Term("教頭", "きょうとう"), Term("財閥", "ざいばつ"), Term("世界銀行", "せかいぎんこう"), Term("味の素", "あじのもと"), Term("健康保険", "けんこうほけん"), Term("密航", "みっこう"), Term("密室", "みっしつ"), Term("民営化", "みんえいか"), Term("民家", "みんか"), Term("民族自決", "みんぞくじけつ"), Term("民兵", "みんぺい"), Term("民法", "みんぽう"), Term("近衛", "このえ"), Term("検疫", "けんえき"), Term("命題", "めいだい"), Term("明暗", "めいあん"), Term("移譲", "いじょう"), Term("研究員", "けんきゅういん"), Term("効用", "こうよう"), Term("木炭", "もくたん"), Term("目白", "めじろ"), Term("系列", "けいれつ"), Term("元帥", "げんすい"), Term("網膜", "もうまく"), Term("元禄", "げんろく"), Term("原型", "げんけい"), Term("原稿用紙", "げんこうようし"), Term("友愛", "ゆうあい"), Term("有価証券", "ゆうかしょうけん"), Term("減価償却", "げんかしょうきゃく"), Term("遊撃手", "ゆうげきしゅ"), Term("溶接", "ようせつ"), Term("陽子", "ようし"), Term("呼吸器", "こきゅうき"), Term("卵巣", "らんそう"), Term("遺構", "いこう"), Term("民社党", "みんしゃとう"), Term("陸上競技", "りくじょうきょうぎ"), Term("浄化槽", "じょうかそう"), Term("留保", "りゅうほ"), Term("旅団", "りょだん"), Term("国分寺", "こくぶんじ"), Term("料亭", "りょうてい"), Term("疎開", "そかい"), Term("物流", "ぶつりゅう"), Term("湿地", "しっち"), Term("公認会計士", "こうにんかいけいし"), Term("屏風", "びょうぶ"), Term("軟禁", "なんきん"), Term("厚生", "こうせい"), Term("入れ墨", "いれずみ"), Term("組曲", "くみきょく"), Term("送電", "そうでん"), Term("口径", "こうけい"), Term("染色体", "せんしょくたい"), Term("相続税", "そうぞくぜい"), Term("国益", "こくえき"), Term("工作機械", "こうさくきかい"), Term("工兵", "こうへい"), Term("抗原", "こうげん"), Term("更改", "こうかい"), Term("江戸っ子", "えどっこ"), Term("甲状腺", "こうじょうせん"), Term("皇太后", "こうたいごう"), Term("酵素", "こうそ"), Term("高圧", "こうあつ"), Term("覚醒剤", "かくせいざい"), Term("高気圧", "こうきあつ"), Term("非鉄金属", "ひてつきんぞく"), Term("合憲", "ごうけん"), Term("合併症", "がっぺいしょう"), Term("公安委員会", "こうあんいいんかい"), Term("法医学", "ほういがく"), Term("選手村", "せんしゅむら"), Term("国技", "こくぎ"), Term("保育所", "ほいくしょ"), Term("里親", "さとおや"), Term("南北問題", "なんぼくもんだい"), Term("配管", "はいかん"), Term("査証", "さしょう"), Term("砂防", "さぼう"), Term("打席", "だせき"), Term("内閣法制局", "ないかくほうせいきょく"), Term("脱硫", "だつりゅう"), Term("最前線", "さいぜんせん"), Term("帆船", "はんせん"), Term("歳出", "さいしゅつ"), Term("拍子", "ひょうし"), Term("長打", "ちょうだ"), Term("財団法人", "ざいだんほうじん"), Term("宗派", "しゅうは"), Term("地方公共団体", "ちほうこうきょうだんたい"), Term("殺虫剤", "さっちゅうざい"), Term("雑木林", "ぞうきばやし"), Term("三塁手", "さんるいしゅ"), Term("参政権", "さんせいけん"), Term("参道", "さんどう"), Term("山菜", "さんさい"), Term("同人", "どうじん"), Term("大腸", "だいちょう"), Term("高麗", "こうらい"), Term("横ばい", "よこばい"), Term("領空", "りょうくう"), Term("天神", "てんじん"), Term("四輪車", "よんりんしゃ"), Term("市町村", "しちょうそん"), Term("師範", "しはん"), Term("死活", "しかつ"), Term("死球", "しきゅう"), Term("私書箱", "ししょばこ"), Term("布施", "ふせ"), Term("関取", "せきとり"), Term("紙芝居", "かみしばい"), Term("視聴率", "しちょうりつ"), Term("管区気象台", "かんくきしょうだい"), Term("試薬", "しやく"), Term("飼料", "しりょう"), Term("歯科医師", "しかいし"), Term("巻き返し", "まきかえし"), Term("侍従", "じじゅう"), Term("時代錯誤", "じだいさくご"), Term("次元", "じげん"), Term("完投", "かんとう"), Term("自治省", "じちしょう"), Term("割引債", "わりびきさい"), Term("学際", "がくさい"), Term("自閉症", "じへいしょう"), Term("執行猶予", "しっこうゆうよ"), Term("質量", "しつりょう"), Term("実数", "じっすう"), Term("介助", "かいじょ"), Term("講談", "こうだん"), Term("解体", "かいたい"), Term("批准", "ひじゅん"), Term("です", "です"), Term("達", "たち"), Term("儘", "まま"), Term("一人で", "ひとりで"), Term("一日中", "いちにちじゅう"), Term("絶対に", "ぜったいに"), Term("主", "おも"), Term("申し訳ありません", "もうしわけありません"), Term("チケット", "チケット"), Term("バス停", "バスてい"), Term("ほら", "ほら"), Term("つい", "つい"), Term("毎に", "ごとに"), Term("熟す", "こなす"), Term("わくわく", "わくわく"), Term("アドバイス", "アドバイス"), Term("セールスマン", "セールスマン"), Term("オリンピック", "オリンピック"), Term("エアコン", "エアコン"), Term("ミーティング", "ミーティング"), Term("くよくよ", "くよくよ"), Term("跳び上がる", "とびあがる"), Term("ガールフレンド", "ガールフレンド"), Term("くたくた", "くたくた"), Term("プロポーズ", "プロポーズ"), Term("キャンセル", "キャンセル"), Term("どうも有難う", "どうもありがとう"), Term("もしもし", "もしもし"), Term("カタログ", "カタログ"), Term("ボーイフレンド", "ボーイフレンド"), Term("さっさ", "さっさ"), Term("稲妻", "いなずま"), Term("チャンピオン", "チャンピオン"), Term("バスケット", "バスケット"), Term("パンダ", "パンダ"), Term("ぐるぐる", "ぐるぐる"), Term("エッセイ", "エッセイ"), Term("マネージャー", "マネージャー"), Term("へとへと", "へとへと"), Term("ガタガタ", "ガタガタ"), Term("スト", "スト"), Term("ようこそ", "ようこそ"), Term("ぎょっと", "ぎょっと"), Term("チキン", "チキン"), Term("バラバラ", "バラバラ"), Term("イメージ", "イメージ"), Term("せめて", "せめて"), Term("ハラハラ", "ハラハラ"), Term("きらきら", "きらきら"), Term("せがむ", "せがむ"), Term("ビジネスマン", "ビジネスマン"), Term("すらすら", "すらすら"), Term("グリーン", "グリーン"), Term("スリル", "スリル"), Term("ぱっと", "ぱっと"), Term("バイト", "バイト"), Term("ぎこちない", "ぎこちない"), Term("うとうと", "うとうと"), Term("見惚れる", "みとれる"), Term("ぎりぎり", "ぎりぎり"), Term("バーゲン", "バーゲン"), Term("バレー", "バレー"), Term("ぼろぼろ", "ぼろぼろ"), Term("ディスコ", "ディスコ"), Term("うずうず", "うずうず"), Term("そわそわ", "そわそわ"), Term("ヒット", "ヒット"), Term("プライド", "プライド"), Term("ふらふら", "ふらふら"), Term("彷徨う", "さまよう"), Term("びくびく", "びくびく"), Term("萎れる", "しおれる"), Term("ザラザラ", "ザラザラ"), Term("お休みなさい", "おやすみなさい"), Term("だらだら", "だらだら"), Term("ぎらぎら", "ぎらぎら"), Term("次々に", "つぎつぎに"), Term("くるくる", "くるくる"), Term("ペース", "ペース"), Term("ゴロゴロ", "ゴロゴロ"), Term("縺れる", "もつれる"), Term("ウエスト", "ウエスト"), Term("むかむか", "むかむか"), Term("おや", "おや"), Term("其れなら", "それなら"), Term("ビーチ", "ビーチ"), Term("インチキ", "インチキ"), Term("とんとん", "とんとん"), Term("こつこつ", "こつこつ"), Term("惚れる", "ほれる"), Term("何故ならば", "なぜならば"), Term("瞬く", "またたく"), Term("否々", "いやいや"), Term("かちかち", "かちかち"), Term("カッと", "カッと"), Term("べたべた", "べたべた"), Term("ぐらぐら", "ぐらぐら"), Term("ハード", "ハード"), Term("シューズ", "シューズ"), Term("ショッピング", "ショッピング"), Term("ずきずき", "ずきずき"), Term("決め付ける", "きめつける"), Term("ボリューム", "ボリューム"), Term("どう致しまして", "どういたしまして"), Term("選り分ける", "よりわける"), Term("めきめき", "めきめき"), Term("事による", "ことによる"), Term("びしょびしょ", "びしょびしょ"), Term("テクニック", "テクニック"), Term("ちょっぴり", "ちょっぴり"), Term("いざこざ", "いざこざ"), Term("ハイウエー", "ハイウエー"), Term("燥ぐ", "はしゃぐ"), Term("じめじめ", "じめじめ"), Term("ビデオテープ", "ビデオテープ"), Term("ひらひら", "ひらひら"), Term("せっかち", "せっかち"), Term("凹み", "くぼみ"), Term("捥ぐ", "もぐ"), Term("窶れる", "やつれる"), Term("呆ける", "ぼける"), Term("高名", "こうめい"), Term("レシート", "レシート"), Term("黒子", "ほくろ"), Term("荒野", "こうや"), Term("ひっそり", "ひっそり"), Term("ピンポン", "ピンポン"), Term("びりびり", "びりびり"), Term("引きつる", "ひきつる"), Term("選る", "よる"), Term("ペラペラ", "ペラペラ"), Term("ぽかん", "ぽかん"), Term("面子", "メンツ"), Term("やれやれ", "やれやれ"), Term("お帰りなさい", "おかえりなさい"), Term("ぴんぴん", "ぴんぴん"), Term("ゴールデンウィーク", "ゴールデンウィーク"), Term("アイス", "アイス"), Term("ぽたぽた", "ぽたぽた"), Term("ぶるぶる", "ぶるぶる"), Term("どきっと", "どきっと"), Term("にこやか", "にこやか"), Term("くたばる", "くたばる"), Term("ニヤニヤ", "ニヤニヤ"), Term("カセットテープ", "カセットテープ"), Term("ちらちら", "ちらちら"), Term("おろおろ", "おろおろ"), Term("プンプン", "プンプン"), Term("アピール", "アピール"), Term("ジャーナリズム", "ジャーナリズム"), Term("脛", "すね"), Term("ひそひそ", "ひそひそ"), Term("ころころ", "ころころ"), Term("きょろきょろ", "きょろきょろ"), Term("口笛", "くちぶえ"), Term("あのね", "あのね"), Term("たらたら", "たらたら"), Term("デマ", "デマ"), Term("ぽかぽか", "ぽかぽか"), Term("むっつり", "むっつり"), Term("セ氏", "セし"), Term("いそいそ", "いそいそ"), Term("ネーム", "ネーム"), Term("じゃぶじゃぶ", "じゃぶじゃぶ"), Term("てくてく", "てくてく"), Term("ぎゅうぎゅう", "ぎゅうぎゅう"), Term("いらっしゃいませ", "いらっしゃいませ"), Term("バイブル", "バイブル"), Term("よろよろ", "よろよろ"), Term("俄かに", "にわかに"), Term("レンタル", "レンタル"), Term("ぞろぞろ", "ぞろぞろ"), Term("点す", "ともす"), Term("アスファルト", "アスファルト"), Term("よそ行き", "よそゆき"), Term("フルーツ", "フルーツ"), Term("びっしり", "びっしり"), Term("がさがさ", "がさがさ"), Term("カサカサ", "カサカサ"), Term("ミニ", "ミニ"), Term("つるつる", "つるつる"), Term("ぎざぎざ", "ぎざぎざ"), Term("アベック", "アベック"), Term("どしどし", "どしどし"), Term("お中元", "おちゅうげん"), Term("ちぐはぐ", "ちぐはぐ"), Term("どたばた", "どたばた"), Term("しょんぼり", "しょんぼり"), Term("妄信", "ぼうしん"), Term("メカニズム", "メカニズム"), Term("せかせか", "せかせか"), Term("インスタント", "インスタント"), Term("ぐったり", "ぐったり"), Term("チェーン", "チェーン"), Term("ハウス", "ハウス"), Term("悪寒", "おかん"), Term("秋分", "しゅうぶん"), Term("巳", "み"), Term("製図", "せいず"), Term("春夏秋冬", "しゅんかしゅうとう"), Term("春分", "しゅんぶん"), Term("初夢", "はつゆめ"), Term("小数点", "しょうすうてん"), Term("消火器", "しょうかき"), Term("常用漢字", "じょうようかんじ"), Term("念力", "ねんりき"), Term("駅長", "えきちょう"), Term("焼き鳥", "やきとり"), Term("歩行者天国", "ほこうしゃてんごく"), Term("赤飯", "せきはん"), Term("可燃物", "かねんぶつ"), Term("夏至", "げし"), Term("栓抜き", "せんぬき"), Term("襟巻き", "えりまき"), Term("履物", "はきもの"), Term("爪切り", "つめきり"), Term("焼きそば", "やきそば"), Term("慣用句", "かんようく"), Term("画用紙", "がようし"), Term("餡", "あん"), Term("海藻", "かいそう"), Term("大脳", "だいのう"), Term("外来語", "がいらいご"), Term("探究", "たんきゅう"), Term("炭酸", "たんさん"), Term("灌漑", "かんがい"), Term("爪楊枝", "つまようじ"), Term("倒置", "とうち"), Term("冬至", "とうじ"), Term("投影", "とうえい"), Term("礼金", "れいきん"), Term("暖簾", "のれん"), Term("不条理", "ふじょうり"), Term("忘却", "ぼうきゃく"), Term("寡婦", "かふ"), Term("胡座", "あぐら"), Term("落ちこぼれ", "おちこぼれ"), Term("俎板", "まないた"), Term("風鈴", "ふうりん"), Term("堆積", "たいせき"), Term("夜学", "やがく"), Term("霧雨", "きりさめ"), Term("相殺", "そうさい"), Term("厚意", "こうい"), Term("待ち伏せ", "まちぶせ"), Term("捨て子", "すてご"), Term("筆順", "ひつじゅん"), Term("元号", "げんごう"), Term("閏年", "うるうどし"), Term("寄生", "きせい"), Term("雑煮", "ぞうに"), Term("拾得", "しゅうとく"), Term("予備校", "よびこう"), Term("時報", "じほう"), Term("蚊帳", "かや"), Term("掛け軸", "かけじく"), Term("書き初め", "かきぞめ"), Term("若布", "わかめ"), Term("である", "である"), Term("のです", "のです"), Term("だろう", "だろう"), Term("なければならない", "なければならない"), Term("為れる", "される"), Term("でしょう", "でしょう"), Term("為に", "ために"), Term("に就いて", "について"), Term("とする", "とする"), Term("可き", "べき"), Term("なら", "なら"), Term("と言う", "という"), Term("為せる", "させる"), Term("事がある", "ことがある"), Term("にも", "にも"), Term("したい", "したい"), Term("誰も", "だれも"), Term("よりも", "よりも"), Term("なのだ", "なのだ"), Term("に因って", "によって"), Term("す可き", "すべき"), Term("なんて", "なんて"), Term("に取って", "にとって"), Term("かどうか", "かどうか"), Term("となる", "となる"), Term("そうだ", "そうだ"), Term("すれば", "すれば"), Term("事になる", "ことになる"), Term("訳ではない", "わけではない"), Term("たがる", "たがる"), Term("誰でも", "だれでも"), Term("ならない", "ならない"), Term("お陰で", "おかげで"), Term("上手くいく", "うまくいく"), Term("風邪をひく", "かぜをひく"), Term("アメリカ人", "アメリカじん"), Term("ちゃう", "ちゃう"), Term("手に入れる", "てにいれる"), Term("に於いて", "において"), Term("お互いに", "おたがいに"), Term("どの様に", "どのように"), Term("だけでなく", "だけでなく"), Term("年をとる", "としをとる"), Term("みたい", "みたい"), Term("だったら", "だったら"), Term("に依る", "による"), Term("どうか", "どうか"), Term("この前", "このまえ"), Term("何時間", "なんじかん"), Term("有難うございます", "ありがとうございます"), Term("でもある", "でもある"), Term("になると", "になると"), Term("と言うもの", "というもの"), Term("ずつ", "ずつ"), Term("でなければ", "でなければ"), Term("身につける", "みにつける"), Term("に於ける", "における"), Term("質問をする", "しつもんをする"), Term("にしても", "にしても"), Term("誰にでも", "だれにでも"), Term("と言えば", "といえば"), Term("目を通す", "めをとおす"), Term("目が覚める", "めがさめる"), Term("どうしたの", "どうしたの"), Term("わね", "わね"), Term("手に入る", "てにはいる"), Term("事によって", "ことによって"), Term("１０００円", ""), Term("クラスメイト", "クラスメイト"), Term("しようとする", "しようとする"), Term("行方不明", "ゆくえふめい"), Term("でなければならない", "でなければならない"), Term("ある意味では", "あるいみでは"), Term("ちらり", "ちらり"), Term("どれだけ", "どれだけ"), Term("っぽい", "っぽい"), Term("とく", "とく"), Term("となると", "となると"), Term("お負けに", "おまけに"), Term("行ったり来たり", "いったりきたり"), Term("であります", "であります"), Term("に渡って", "にわたって"), Term("に加えて", "にくわえて"), Term("と言うことはない", "ということはない"), Term("責任を持つ", "せきにんをもつ"), Term("ある意味で", "あるいみで"), Term("お願いいたします", "おねがいいたします"), Term("ひょっとして", "ひょっとして"), Term("どうでもいい", "どうでもいい"), Term("ああいう", "ああいう"), Term("御内", "おうち"), Term("ご遠慮ください", "ごえんりょください"), Term("史", "し"), Term("そうですね", "そうですね"), Term("顔を出す", "かおをだす"), Term("一軒", "いっけん"), Term("ひょっとしたら", "ひょっとしたら"), Term("ばれる", "ばれる"), Term("格好いい", "かっこいい"), Term("無しには", "なしには"), Term("様になる", "ようになる"), Term("パン屋", "パンや"), Term("ぐるっと", "ぐるっと"), Term("もうすっかり", "もうすっかり"), Term("ひょっとすると", "ひょっとすると"), Term("たる", "たる"), Term("ぼーっと", "ぼーっと"), Term("さえあれば", "さえあれば"), Term("時は金なり", "ときはかねなり"), Term("その内に", "そのうちに"), Term("ぞくぞく", "ぞくぞく"), Term("訳じゃない", "わけじゃない"), Term("強者", "きょうしゃ"), Term("によって異なる", "によってことなる"), Term("やばい", "やばい"), Term("おっさん", "おっさん"), Term("テレビ局", "テレビきょく"), Term("様に", "ように"), Term("そうすると", "そうすると"), Term("心を込めて", "こころをこめて"), Term("そうか", "そうか"), Term("イヤホン", "イヤホン"), Term("あれだけ", "あれだけ"), Term("にゃあ", "にゃあ"), Term("訳がない", "わけがない"), Term("何なのか", "なんなのか"), Term("ばらす", "ばらす"), Term("なあ", "なあ"), Term("おいおい", "おいおい"), Term("ちんちん", "ちんちん"), Term("ねた", "ねた"), Term("おっと", "おっと"), Term("それにしても", "それにしても"), Term("コーヒーショップ", "コーヒーショップ"), Term("すっぽり", "すっぽり"), Term("Ｘ線", "ックスせん"), Term("かも知れません", "かもしれません"), Term("バタバタ", "バタバタ"), Term("までもない", "までもない"), Term("と言っても", "といっても"), Term("セラピー", "セラピー"), Term("おしっこ", "おしっこ"), Term("お早うございます", "おはようございます"), Term("細かいこと", "こまかいこと"), Term("までなら", "までなら"), Term("チンピラ", "チンピラ"), Term("ほっといてくれ", "ほっといてくれ"), Term("ううん", "ううん"), Term("女子高", "じょしこう"), Term("ノルマ", "ノルマ"), Term("かもしれん", "かもしれん"), Term("となれば", "となれば"), Term("ガシガシ", "ガシガシ"), Term("ベニヤ板", "ベニヤいた"), Term("ふん", "ふん"), Term("小さい頃", "ちいさいころ"), Term("いい加減にしろ", "いいかげんにしろ"), Term("色々あって", "いろいろあって"), Term("バスツアー", "バスツアー"), Term("コピー機", "コピーき"), Term("あっての", "あっての"), Term("メインストリート", "メインストリート"), Term("それより", "それより"), Term("ポートレート", "ポートレート"), Term("ふんわり", "ふんわり"), Term("鬱", "うつ"), Term("タイムセール", "タイムセール"), Term("パリーグ", "パリーグ"), Term("デブ", "デブ"), Term("ほんのり", "ほんのり"), Term("そんでもって", "そんでもって"), Term("しかない", "しかない"), Term("ちょびっと", "ちょびっと"), Term("となったら", "となったら"), Term("それでいて", "それでいて"), Term("デモ隊", "デモたい"), Term("それはさておき", "それはさておき"), Term("顔をつぶす", "かおをつぶす"), Term("パソコンショップ", "パソコンショップ"), Term("客体", "きゃくたい"), Term("うんこ", "うんこ"), Term("フレンドリー", "フレンドリー"), Term("やった", "やった"), Term("とすると", "とすると"), Term("アルカリ性", "アルカリせい"), Term("鱗", "うろこ"), Term("にかけて", "にかけて"), Term("ガラス張り", "ガラスばり"), Term("絵を描く", "えをかく"), Term("スパゲティ", "スパゲティ"), Term("それっぽい", "それっぽい"), Term("開発元", "かいはつもと"), Term("メーキャップ", "メーキャップ"), Term("これで", "これで"), Term("おっぱい", "おっぱい"), Term("断トツ", "だんトツトツ"), Term("亜熱帯", "あねったい"), Term("哀愁", "あいしゅう"), Term("構造物", "こうぞうぶつ"), Term("儒艮", "じゅごん"), Term("酉", "とり"), Term("地球温暖化", "ちきゅうおんだんか"), Term("生姜", "しょうが"), Term("丑", "うし"), Term("柚", "ゆず"), Term("決勝戦", "けっしょうせん"), Term("川崎", "かわさき"), Term("埼玉", "さいたま"), Term("あん摩", "あんま"), Term("かき氷", "かきごおり"), Term("太もも", "ふともも"), Term("中華街", "ちゅうかがい"), Term("斜体", "しゃたい"), Term("堆肥", "たいひ"), Term("うつ病", "うつびょう"), Term("千葉", "ちば"), Term("天王星", "てんのうせい"), Term("天狗", "てんぐ"), Term("救急箱", "きゅうきゅうばこ"), Term("牛丼", "ぎゅうどん"), Term("萎縮", "いしゅく"), Term("経験値", "けいけんち"), Term("だろうか", "だろうか"), Term("でしょうか", "でしょうか"), Term("勃起", "ぼっき"), Term("網戸", "あみど"), Term("自分で", "じぶんで"), Term("捏造", "ねつぞう"), Term("亥", "い"), Term("梗塞", "こうそく"), Term("土星", "どせい"), Term("顧客満足", "こかくまんぞく"), Term("もつ鍋", "もつなべ"), Term("鮎", "あゆ"), Term("援助交際", "えんじょこうさい"), Term("引きこもり", "ひきこもり"), Term("閾値", "いきち"), Term("珊瑚", "さんご"), Term("蝲蛄", "ざりがに"), Term("射精", "しゃせい"), Term("メール", "メール"), Term("スキャンダル", "スキャンダル"), Term("ピカソ", "ピカソ"), Term("リーダー", "リーダー"), Term("ディナー", "ディナー"), Term("チェックイン", "チェックイン"), Term("カリフォルニア", "カリフォルニア"), Term("ホワイト", "ホワイト"), Term("トーナメント", "トーナメント"), Term("カウンター", "カウンター"), Term("ランナー", "ランナー"), Term("チェックアウト", "チェックアウト"), Term("コスト", "コスト"), Term("ブラック", "ブラック"), Term("ジャングル", "ジャングル"), Term("ボクサー", "ボクサー"), Term("碼", "ヤード"), Term("ダンサー", "ダンサー"), Term("フェンス", "フェンス"), Term("メロン", "メロン"), Term("エアロビクス", "エアロビクス"), Term("ホームラン", "ホームラン"), Term("ゲート", "ゲート"), Term("サイト", "サイト"), Term("ヒーター", "ヒーター"), Term("ホームシック", "ホームシック"), Term("イベント", "イベント"), Term("ライト", "ライト"), Term("ライフル", "ライフル"), Term("ギャンブル", "ギャンブル"), Term("ハンマー", "ハンマー"), Term("ポップス", "ポップス"), Term("スポーツマン", "スポーツマン"), Term("モーツァルト", "モーツァルト"), Term("ライバル", "ライバル"), Term("テロリスト", "テロリスト"), Term("バッハ", "バッハ"), Term("パーマ", "パーマ"), Term("アシスタント", "アシスタント"), Term("フォード", "フォード"), Term("フライト", "フライト"), Term("ミュージシャン", "ミュージシャン"), Term("ルート", "ルート"), Term("ラブレター", "ラブレター"), Term("テロ", "テロ"), Term("ノウハウ", "ノウハウ"), Term("ハイカー", "ハイカー"), Term("ハンター", "ハンター"), Term("ステッキ", "ステッキ"), Term("フェア", "フェア"), Term("ダウンタウン", "ダウンタウン"), Term("ナイル", "ナイル"), Term("ゴルファー", "ゴルファー"), Term("ヒロイン", "ヒロイン"), Term("ショパン", "ショパン"), Term("ブリッジ", "ブリッジ"), Term("アナウンス", "アナウンス"), Term("ヘアスタイル", "ヘアスタイル"), Term("ボトル", "ボトル"), Term("マイホーム", "マイホーム"), Term("ドラム", "ドラム"), Term("イスラム", "イスラム"), Term("タンク", "タンク"), Term("クリスマスカード", "クリスマスカード"), Term("ワックス", "ワックス"), Term("クロス", "クロス"), Term("コカコーラ", "コカコーラ"), Term("コネ", "コネ"), Term("エリート", "エリート"), Term("エレクトロニクス", "エレクトロニクス"), Term("バージョン", "バージョン"), Term("コンビニ", "コンビニ"), Term("バスルーム", "バスルーム"), Term("オーナー", "オーナー"), Term("パー", "パー"), Term("パートタイム", "パートタイム"), Term("カート", "カート"), Term("フォロー", "フォロー"), Term("フロッピー", "フロッピー"), Term("ショッピングモール", "ショッピングモール"), Term("シンクロ", "シンクロ"), Term("プリン", "プリン"), Term("ヘッドライト", "ヘッドライト"), Term("ボックス", "ボックス"), Term("マシン", "マシン"), Term("アンバランス", "アンバランス"), Term("ミステリ", "ミステリ"), Term("ポテト", "ポテト"), Term("スペル", "スペル"), Term("シェア", "シェア"), Term("セクハラ", "セクハラ"), Term("ユナイテッド", "ユナイテッド"), Term("クッション", "クッション"), Term("レート", "レート"), Term("チャーター", "チャーター"), Term("ウインク", "ウインク"), Term("グランドピアノ", "グランドピアノ"), Term("エース", "エース"), Term("ケーブル", "ケーブル"), Term("Ｈ", ""), Term("エゴ", "エゴ"), Term("コールドゲーム", "コールドゲーム"), Term("エスニック", "エスニック"), Term("ナイト", "ナイト"), Term("ナウ", "ナウ"), Term("コミュニティ", "コミュニティ"), Term("コメディー", "コメディー"), Term("ハリケーン", "ハリケーン"), Term("バクテリア", "バクテリア"), Term("ゴールイン", "ゴールイン"), Term("バトン", "バトン"), Term("サウナ", "サウナ"), Term("マウス", "マウス"), Term("サポート", "サポート"), Term("ビーフ", "ビーフ"), Term("ビキニ", "ビキニ"), Term("ビッグ", "ビッグ"), Term("ピッチャー", "ピッチャー"), Term("フェスティバル", "フェスティバル"), Term("フェミニスト", "フェミニスト"), Term("フル", "フル"), Term("カメレオン", "カメレオン"), Term("アプリケーション", "アプリケーション"), Term("ジン", "ジン"), Term("ホイール", "ホイール"), Term("ガードマン", "ガードマン"), Term("スキーヤー", "スキーヤー"), Term("パーク", "パーク"), Term("マイカー", "マイカー"), Term("ガリレオ", "ガリレオ"), Term("ステッカー", "ステッカー"), Term("マヤ", "マヤ"), Term("スパイス", "スパイス"), Term("イースト", "イースト"), Term("イラスト", "イラスト"), Term("センセーション", "センセーション"), Term("タフ", "タフ"), Term("リレー", "リレー"), Term("ルックス", "ルックス"), Term("レスキュー", "レスキュー"), Term("レセプション", "レセプション"), Term("ロースト", "ロースト"), Term("インプット", "インプット"), Term("チャーミング", "チャーミング"), Term("テーマパーク", "テーマパーク"), Term("グッズ", "グッズ"), Term("ディーゼル", "ディーゼル"), Term("デスク", "デスク"), Term("デビュー", "デビュー"), Term("デメリット", "デメリット"), Term("デリケート", "デリケート"), Term("エキサイティング", "エキサイティング"), Term("トピック", "トピック"), Term("ナンバーワン", "ナンバーワン"), Term("コペルニクス", "コペルニクス"), Term("ニックネーム", "ニックネーム"), Term("エピソード", "エピソード"), Term("コラム", "コラム"), Term("ノータッチ", "ノータッチ"), Term("ノブ", "ノブ"), Term("ハードディスク", "ハードディスク"), Term("コンセンサス", "コンセンサス"), Term("ハイファイ", "ハイファイ"), Term("エンジョイ", "エンジョイ"), Term("エンディング", "エンディング"), Term("コンディション", "コンディション"), Term("ハッピーエンド", "ハッピーエンド"), Term("ハンディキャップ", "ハンディキャップ"), Term("バーゲンセール", "バーゲンセール"), Term("バーチャル", "バーチャル"), Term("バイオテクノロジー", "バイオテクノロジー"), Term("バッティング", "バッティング"), Term("パートタイマー", "パートタイマー"), Term("ティーンエージャー", "ティーンエージャー"), Term("パトロール", "パトロール"), Term("パフォーマンス", "パフォーマンス"), Term("パラソル", "パラソル"), Term("パラダイス", "パラダイス"), Term("パワー", "パワー"), Term("モンスター", "モンスター"), Term("アクシデント", "アクシデント"), Term("ピーナッツ", "ピーナッツ"), Term("ピエロ", "ピエロ"), Term("ピンチ", "ピンチ"), Term("シーフード", "シーフード"), Term("シェーバー", "シェーバー"), Term("カーニバル", "カーニバル"), Term("アタック", "アタック"), Term("フォーマル", "フォーマル"), Term("シャットアウト", "シャットアウト"), Term("カウンセリング", "カウンセリング"), Term("シスター", "シスター"), Term("ショートパンツ", "ショートパンツ"), Term("ブイ", "ブイ"), Term("アドバイザー", "アドバイザー"), Term("シルク", "シルク"), Term("ブレンド", "ブレンド"), Term("ブローカー", "ブローカー"), Term("プッシュホン", "プッシュホン"), Term("プレート", "プレート"), Term("スピードアップ", "スピードアップ"), Term("プレイボーイ", "プレイボーイ"), Term("カラフル", "カラフル"), Term("ヘビー", "ヘビー"), Term("ヘビースモーカー", "ヘビースモーカー"), Term("ディズニー", "ディズニー"), Term("ジューンブライド", "ジューンブライド"), Term("ペダル", "ペダル"), Term("スイマー", "スイマー"), Term("ホモ", "ホモ"), Term("ボーイスカウト", "ボーイスカウト"), Term("スケーター", "スケーター"), Term("ワゴン", "ワゴン"), Term("マガジン", "マガジン"), Term("キープ", "キープ"), Term("ステップ", "ステップ"), Term("ストア", "ストア"), Term("マネジメント", "マネジメント"), Term("アンティーク", "アンティーク"), Term("マンネリ", "マンネリ"), Term("スポークスマン", "スポークスマン"), Term("ビュッフェ", "ビュッフェ"), Term("オンリー", "オンリー"), Term("グリーンピース", "グリーンピース"), Term("スナック", "スナック"), Term("メンタル", "メンタル"), Term("スリム", "スリム"), Term("モラル", "モラル"), Term("ユーザー", "ユーザー"), Term("ギア", "ギア"), Term("ライフワーク", "ライフワーク"), Term("ギャンブラー", "ギャンブラー"), Term("ラブソング", "ラブソング"), Term("シンプル", "シンプル"), Term("ランドリー", "ランドリー"), Term("リハーサル", "リハーサル"), Term("クラクション", "クラクション"), Term("クリオール", "クリオール"), Term("レパートリー", "レパートリー"), Term("レフェリー", "レフェリー"), Term("チアガール", "チアガール"), Term("リポーター", "リポーター"), Term("クリスチャン", "クリスチャン"), Term("クリスマスイヴ", "クリスマスイヴ"), Term("クリニック", "クリニック"), Term("チャイナ", "チャイナ"), Term("ロブ", "ロブ"), Term("クレージー", "クレージー"), Term("サハラ", "サハラ"), Term("ドラッグ", "ドラッグ"), Term("ツイン", "ツイン"), Term("クレンザー", "クレンザー"), Term("テーゼ", "テーゼ"), Term("クローン", "クローン"), Term("テーラー", "テーラー"), Term("グラスファイバー", "グラスファイバー"), Term("マイペース", "マイペース"), Term("グラブ", "グラブ"), Term("ディスカウント", "ディスカウント"), Term("デイリーニュース", "デイリーニュース"), Term("デオキシルボ", "デオキシルボ"), Term("ウッド", "ウッド"), Term("プレハブ", "プレハブ"), Term("トータル", "トータル"), Term("エキスパート", "エキスパート"), Term("エキスポ", "エキスポ"), Term("エコノミー", "エコノミー"), Term("トレンド", "トレンド"), Term("レイプ", "レイプ"), Term("ドリンク", "ドリンク"), Term("ナチ", "ナチ"), Term("コテージ", "コテージ"), Term("ハングリー", "ハングリー"), Term("コマンド", "コマンド"), Term("コミック", "コミック"), Term("リハビリ", "リハビリ"), Term("スタメン", "スタメン"), Term("コロシアム", "コロシアム"), Term("ノーマーク", "ノーマーク"), Term("エレキギター", "エレキギター"), Term("コンセプト", "コンセプト"), Term("エンジニアリング", "エンジニアリング"), Term("ハイティーン", "ハイティーン"), Term("ナビ", "ナビ"), Term("ヴァンパイア", "ヴァンパイア"), Term("カウント", "カウント"), Term("ハッカー", "ハッカー"), Term("ハネムーン", "ハネムーン"), Term("オークション", "オークション"), Term("コンドミニアム", "コンドミニアム"), Term("ハンスト", "ハンスト"), Term("ハンディ", "ハンディ"), Term("ブルネット", "ブルネット"), Term("アーキテクチャ", "アーキテクチャ"), Term("バーテン", "バーテン"), Term("アーケード", "アーケード"), Term("オート", "オート"), Term("ノスタルジック", "ノスタルジック"), Term("オートロック", "オートロック"), Term("バックハンド", "バックハンド"), Term("アート", "アート"), Term("サーファー", "サーファー"), Term("サウンド", "サウンド"), Term("パッシング", "パッシング"), Term("パテ", "パテ"), Term("サファリ", "サファリ"), Term("アイリス", "アイリス"), Term("サブマリン", "サブマリン"), Term("サマースクール", "サマースクール"), Term("オブジェ", "オブジェ"), Term("サラリー", "サラリー"), Term("アカデミック", "アカデミック"), Term("ビバーク", "ビバーク"), Term("サンバ", "サンバ"), Term("ピース", "ピース"), Term("オリジナリティー", "オリジナリティー"), Term("ピッチング", "ピッチング"), Term("アグレッシブ", "アグレッシブ"), Term("シーズンオフ", "シーズンオフ"), Term("シーソーゲーム", "シーソーゲーム"), Term("ピンチヒッター", "ピンチヒッター"), Term("クオリティ", "クオリティ"), Term("シアター", "シアター"), Term("スレート", "スレート"), Term("シェパード", "シェパード"), Term("シェフ", "シェフ"), Term("ラスト", "ラスト"), Term("ファミリー", "ファミリー"), Term("アジト", "アジト"), Term("フィーリング", "フィーリング"), Term("フィールド", "フィールド"), Term("フィアンセ", "フィアンセ"), Term("フィル", "フィル"), Term("スロープ", "スロープ"), Term("フェアプレー", "フェアプレー"), Term("カーレース", "カーレース"), Term("アンカー", "アンカー"), Term("カウチポテト", "カウチポテト"), Term("シャッポ", "シャッポ"), Term("フットワーク", "フットワーク"), Term("ガット", "ガット"), Term("フリーエージェント", "フリーエージェント"), Term("フローリング", "フローリング"), Term("フロア", "フロア"), Term("フロスト", "フロスト"), Term("ショールーム", "ショールーム"), Term("ショッキング", "ショッキング"), Term("シリアス", "シリアス"), Term("シリコン", "シリコン"), Term("チョッキ", "チョッキ"), Term("ブロンズ", "ブロンズ"), Term("シンガー", "シンガー"), Term("シンク", "シンク"), Term("テク", "テク"), Term("シンドローム", "シンドローム"), Term("シンパ", "シンパ"), Term("シンフォニー", "シンフォニー"), Term("プレーン", "プレーン"), Term("プレッシャー", "プレッシャー"), Term("ジェットコースター", "ジェットコースター"), Term("プロダクト", "プロダクト"), Term("ジェラシー", "ジェラシー"), Term("スキンシップ", "スキンシップ"), Term("アバウト", "アバウト"), Term("ジブ", "ジブ"), Term("ジャー", "ジャー"), Term("フリーマーケット", "フリーマーケット"), Term("ベール", "ベール"), Term("ベビー", "ベビー"), Term("カレッジ", "カレッジ"), Term("ペーパー", "ペーパー"), Term("レス", "レス"), Term("イルミネーション", "イルミネーション"), Term("アメフト", "アメフト"), Term("ホステス", "ホステス"), Term("ガーデン", "ガーデン"), Term("ボディー", "ボディー"), Term("スクラム", "スクラム"), Term("ボレー", "ボレー"), Term("ポート", "ポート"), Term("ポケットベル", "ポケットベル"), Term("ポップ", "ポップ"), Term("スコッチ", "スコッチ"), Term("スコップ", "スコップ"), Term("ガッツ", "ガッツ"), Term("マークシート", "マークシート"), Term("マイクロバス", "マイクロバス"), Term("マイコン", "マイコン"), Term("マイノリティー", "マイノリティー"), Term("マイルド", "マイルド"), Term("オフレコ", "オフレコ"), Term("マニアック", "マニアック"), Term("ストック", "ストック"), Term("マリファナ", "マリファナ"), Term("キット", "キット"), Term("マンツーマン", "マンツーマン"), Term("ストロベリー", "ストロベリー"), Term("マンパワー", "マンパワー"), Term("スノー", "スノー"), Term("スパート", "スパート"), Term("ミッドナイト", "ミッドナイト"), Term("ミニマム", "ミニマム"), Term("キャッチャー", "キャッチャー"), Term("イージー", "イージー"), Term("ノミネート", "ノミネート"), Term("メドレー", "メドレー"), Term("スライス", "スライス"), Term("キャンドル", "キャンドル"), Term("キャンパー", "キャンパー"), Term("スリリング", "スリリング"), Term("スルー", "スルー"), Term("アンドロイド", "アンドロイド"), Term("キャップ", "キャップ"), Term("インセンティブ", "インセンティブ"), Term("スワン", "スワン"), Term("モンキー", "モンキー"), Term("セキュリティ", "セキュリティ"), Term("ユーモラス", "ユーモラス"), Term("セッティング", "セッティング"), Term("ユニット", "ユニット"), Term("エスカレート", "エスカレート"), Term("イン", "イン"), Term("ゼネスト", "ゼネスト"), Term("ラダー", "ラダー"), Term("インストラクター", "インストラクター"), Term("ソング", "ソング"), Term("リーディング", "リーディング"), Term("リアクション", "リアクション"), Term("タール", "タール"), Term("ターン", "ターン"), Term("リキッド", "リキッド"), Term("スロット", "スロット"), Term("インタラクティブ", "インタラクティブ"), Term("タイト", "タイト"), Term("リズミカル", "リズミカル"), Term("リセッション", "リセッション"), Term("タイムマシン", "タイムマシン"), Term("リフレッシュ", "リフレッシュ"), Term("インテリジェント", "インテリジェント"), Term("パーフェクト", "パーフェクト"), Term("ダーリン", "ダーリン"), Term("ダイジェスト", "ダイジェスト"), Term("レーク", "レーク"), Term("ダイレクト", "ダイレクト"), Term("レーサー", "レーサー"), Term("レーシングカー", "レーシングカー"), Term("オール", "オール"), Term("ダビング", "ダビング"), Term("レトリック", "レトリック"), Term("ローズ", "ローズ"), Term("ローテーション", "ローテーション"), Term("ローラー", "ローラー"), Term("ロゴ", "ロゴ"), Term("プラチナ", "プラチナ"), Term("Δ", ""), Term("切支丹", "キリシタン"), Term("Ω", ""), Term("アット", "アット"), Term("合羽", "カッパ"), Term("沃度丁幾", "ようどちんき"), Term("苦力", "クーリー"), Term("窒扶斯", "ちふす"), Term("突っ掛ける", "つっかける"), Term("ノーベル", "ノーベル"), Term("ソニー", "ソニー"), Term("マクドナルド", "マクドナルド"), Term("フェラーリ", "フェラーリ"), Term("ニコラス", "ニコラス"), Term("フィリップス", "フィリップス"), Term("シャネル", "シャネル"), Term("ポルシェ", "ポルシェ"), Term("マンハッタン", "マンハッタン"), Term("ネルソン", "ネルソン"), Term("ジュピター", "ジュピター"), Term("西欧", "せいおう"), Term("中継ぎ", "なかつぎ"), Term("俵", "たわら"), Term("本流", "ほんりゅう"), Term("沿海州", "えんかいしゅう"), Term("営団", "えいだん"), Term("根っ子", "ねっこ"), Term("野合", "やごう"), Term("西南", "せいなん"), Term("加", "か"), Term("全米", "ぜんべい"), Term("総理府", "そうりふ"), Term("測候所", "そっこうじょ"), Term("改新", "かいしん"), Term("東独", "とうどく"), Term("製油所", "せいゆじょ"), Term("代官", "だいかん"), Term("大社", "たいしゃ"), Term("中京", "ちゅうきょう"), Term("中将", "ちゅうじょう"), Term("歓喜", "かんき"), Term("太子", "たいし"), Term("帝", "みかど"), Term("丸み", "まるみ"), Term("電通大", "でんつうだい"), Term("東欧", "とうおう"), Term("日産", "にっさん"), Term("国立博物館", "こくりつはくぶつかん"), Term("宮中", "きゅうちゅう"), Term("漁港", "ぎょこう"), Term("共栄", "きょうえい"), Term("苗木", "なえぎ"), Term("普賢", "ふげん"), Term("分岐点", "ぶんきてん"), Term("西独", "せいどく"), Term("会心", "かいしん"), Term("原生", "げんせい"), Term("大師", "だいし"), Term("離宮", "りきゅう"), Term("建設省", "けんせつしょう"), Term("公民館", "こうみんかん"), Term("厚生省", "こうせいしょう"), Term("票田", "ひょうでん"), Term("白骨", "はっこつ"), Term("臨海", "りんかい"), Term("山陰", "やまかげ"), Term("山荘", "さんそう"), Term("持久", "じきゅう"), Term("農学部", "のうがくぶ"), Term("神主", "かんぬし"), Term("坊主", "ぼうず"), Term("理学部", "りがくぶ"), Term("裏門", "うらもん"), Term("療養所", "りょうようじょ"), Term("白粉", "おしろい"), Term("工学部", "こうがくぶ"), Term("阿弥陀", "あみだ"), Term("休憩所", "きゅうけいじょ"), Term("京阪", "けいはん"), Term("自然公園", "しぜんこうえん"), Term("胡麻", "ごま"), Term("琉球", "りゅうきゅう"), Term("北九州", "きたきゅうしゅう"), Term("ＪＡＳ", ""), Term("西藏", "せいぞう"), Term("スコットランド", "スコットランド"), Term("リューマチ", "リューマチ"), Term("語り", "かたり"), Term("思い", "おもい"), Term("齢", "よわい"), Term("最大", "さいだい"), Term("二度", "にど"), Term("間違いない", "まちがいない"), Term("乗り越える", "のりこえる"), Term("堪能", "たんのう"), Term("立ち", "たち"), Term("無謀", "むぼう"), Term("余儀なく", "よぎなく"), Term("心待ち", "こころまち"), Term("民", "たみ"), Term("盲目", "もうもく"), Term("短期間", "たんきかん"), Term("弱み", "よわみ"), Term("銭", "せん"), Term("流動", "りゅうどう"), Term("苦戦", "くせん"), Term("語らう", "かたらう"), Term("急務", "きゅうむ"), Term("潜む", "ひそむ"), Term("応分", "おうぶん"), Term("川端", "かわばた"), Term("花輪", "はなわ"), Term("中日", "ちゅうにち"), Term("波及", "はきゅう"), Term("大綱", "たいこう"), Term("紙袋", "かみぶくろ"), Term("点訳", "てんやく"), Term("戦費", "せんぴ"), Term("壇上", "だんじょう"), Term("法文", "ほうぶん"), Term("通達", "つうたつ"), Term("戦法", "せんぽう"), Term("手記", "しゅき"), Term("手口", "てぐち"), Term("耐性", "たいせい"), Term("葬祭", "そうさい"), Term("三冠馬", "さんかんば"), Term("手痛い", "ていたい"), Term("手抜き", "てぬき"), Term("種別", "しゅべつ"), Term("道義的責任", "どうぎてきせきにん"), Term("趣向", "しゅこう"), Term("首班", "しゅはん"), Term("首謀", "しゅぼう"), Term("高瀬", "たかせ"), Term("備蓄", "びちく"), Term("法治国", "ほうちこく"), Term("法相", "ほうしょう"), Term("受刑", "じゅけい"), Term("受像", "じゅぞう"), Term("奨学", "しょうがく"), Term("受注", "じゅちゅう"), Term("愛護", "あいご"), Term("受容", "じゅよう"), Term("寿", "ことぶき"), Term("領有", "りょうゆう"), Term("授受", "じゅじゅ"), Term("樹脂", "じゅし"), Term("頑な", "かたくな"), Term("艦船", "かんせん"), Term("胃腸", "いちょう"), Term("初年", "しょねん"), Term("収容所", "しゅうようじょ"), Term("収用", "しゅうよう"), Term("常任委員会", "じょうにんいいんかい"), Term("官民", "かんみん"), Term("乱調", "らんちょう"), Term("就航", "しゅうこう"), Term("爆音", "ばくおん"), Term("拾い物", "ひろいもの"), Term("秋口", "あきぐち"), Term("終身", "しゅうしん"), Term("終息", "しゅうそく"), Term("担ぎ", "かつぎ"), Term("握らす", "にぎらす"), Term("終焉", "しゅうえん"), Term("集荷", "しゅうか"), Term("住職", "じゅうしょく"), Term("住専", "じゅうせん"), Term("住民税", "じゅうみんぜい"), Term("米人", "べいじん"), Term("十億", "じゅうおく"), Term("十九", "じゅうきゅう"), Term("妃", "ひ"), Term("本線", "ほんせん"), Term("重鎮", "じゅうちん"), Term("旧姓", "きゅうせい"), Term("自発", "じはつ"), Term("宿舎", "しゅくしゃ"), Term("遊歩", "ゆうほ"), Term("沢", "さわ"), Term("福助", "ふくすけ"), Term("位置付け", "いちづけ"), Term("熟知", "じゅくち"), Term("選", "せん"), Term("出陣", "しゅつじん"), Term("出足", "であし"), Term("出遅れる", "でおくれる"), Term("出土", "しゅつど"), Term("選挙人", "せんきょにん"), Term("出納", "すいとう"), Term("出版物", "しゅっぱんぶつ"), Term("出方", "でかた"), Term("立国", "りっこく"), Term("振り付け", "ふりつけ"), Term("異口同音", "いくどうおん"), Term("純益", "じゅんえき"), Term("異国", "いこく"), Term("純度", "じゅんど"), Term("巡業", "じゅんぎょう"), Term("巡航", "じゅんこう"), Term("巡視", "じゅんし"), Term("順次", "じゅんじ"), Term("報奨金", "ほうしょうきん"), Term("通年", "つうねん"), Term("移管", "いかん"), Term("初夏", "しょか"), Term("農業協同組合", "のうぎょうきょうどうくみあい"), Term("初回", "しょかい"), Term("移送", "いそう"), Term("農法", "のうほう"), Term("初出", "しょしゅつ"), Term("農相", "のうしょう"), Term("初場所", "はつばしょ"), Term("公有", "こうゆう"), Term("林野庁", "りんやちょう"), Term("維新", "いしん"), Term("初任給", "しょにんきゅう"), Term("初歩", "しょほ"), Term("林野", "りんや"), Term("所信", "しょしん"), Term("違憲", "いけん"), Term("遺影", "いえい"), Term("遺作", "いさく"), Term("書院", "しょいん"), Term("立ち上がり", "たちあがり"), Term("書簡", "しょかん"), Term("書房", "しょぼう"), Term("遺品", "いひん"), Term("遺物", "いぶつ"), Term("医科", "いか"), Term("医長", "いちょう"), Term("復党", "ふくとう"), Term("医薬", "いやく"), Term("際会", "さいかい"), Term("助産婦", "じょさんぷ"), Term("助成", "じょせい"), Term("域内", "いきない"), Term("助役", "じょやく"), Term("育英", "いくえい"), Term("女子大", "じょしだい"), Term("女児", "じょじ"), Term("芸者", "げいしゃ"), Term("工作員", "こうさくいん"), Term("看過", "かんか"), Term("女流", "じょりゅう"), Term("傷害", "しょうがい"), Term("傷者", "しょうしゃ"), Term("償却", "しょうきゃく"), Term("勝訴", "しょうそ"), Term("商会", "しょうかい"), Term("商工", "しょうこう"), Term("商事", "しょうじ"), Term("一丸", "いちがん"), Term("商務", "しょうむ"), Term("一挙", "いっきょ"), Term("将来像", "しょうらいぞう"), Term("一局", "いっきょく"), Term("一軍", "いちぐん"), Term("小結", "こむすび"), Term("小康", "しょうこう"), Term("小さじ", "こさじ"), Term("一元", "いちげん"), Term("一元化", "いちげんか"), Term("怒鳴り込む", "どなりこむ"), Term("電撃", "でんげき"), Term("見入る", "みいる"), Term("一審", "いっしん"), Term("招致", "しょうち"), Term("松下電工", "まつしたでんこう"), Term("松原", "まつばら"), Term("松葉", "まつば"), Term("白地", "しろじ"), Term("一人物", "いちじんぶつ"), Term("消極", "しょうきょく"), Term("使用料", "しようりょう"), Term("一人娘", "ひとりむすめ"), Term("渉外", "しょうがい"), Term("焼却", "しょうきゃく"), Term("焦り", "あせり"), Term("食糧庁", "しょくりょうちょう"), Term("照準", "しょうじゅん"), Term("症候群", "しょうこうぐん"), Term("省庁", "しょうちょう"), Term("省令", "しょうれい"), Term("大店", "おおだな"), Term("大商い", "おおあきない"), Term("改憲", "かいけん"), Term("一品", "いっぴん"), Term("１対１", "ちたいいち"), Term("派兵", "はへい"), Term("賞状", "しょうじょう"), Term("賞与", "しょうよ"), Term("一男", "いちなん"), Term("上っ調子", "うわっちょうし"), Term("上越", "じょうえつ"), Term("誤って", "あやまって"), Term("上限", "じょうげん"), Term("余儀ない", "よぎない"), Term("上手投げ", "うわてなげ"), Term("上申", "じょうしん"), Term("上積み", "うわづみ"), Term("上層", "じょうそう"), Term("荒れ", "あれ"), Term("乗り気", "のりき"), Term("一番手", "いちばんて"), Term("乗降", "じょうこう"), Term("当落", "とうらく"), Term("断らず", "ことわらず"), Term("常設", "じょうせつ"), Term("常任", "じょうにん"), Term("常連", "じょうれん"), Term("情感", "じょうかん"), Term("勝ち越し", "かちこし"), Term("浄水", "じょうすい"), Term("一門", "いちもん"), Term("一覧", "いちらん"), Term("一覧表", "いちらんひょう"), Term("一両", "いちりょう"), Term("服飾", "ふくしょく"), Term("色素", "しきそ"), Term("印紙", "いんし"), Term("渡し", "わたし"), Term("食管法", "しょっかんほう"), Term("食道", "しょくどう"), Term("伸し", "のし"), Term("意表", "いひょう"), Term("伸び悩む", "のびなやむ"), Term("勝ち越す", "かちこす"), Term("引責", "いんせき"), Term("信義", "しんぎ"), Term("信用組合", "しんようくみあい"), Term("院長", "いんちょう"), Term("隠し引き出し", "かくしひきだし"), Term("隠滅", "いんめつ"), Term("覇者", "はしゃ"), Term("右派", "うは"), Term("浦", "うら"), Term("新婦", "しんぷ"), Term("新緑", "しんりょく"), Term("新郎", "しんろう"), Term("深層", "しんそう"), Term("殊勲", "しゅくん"), Term("運輸省", "うんゆしょう"), Term("真偽", "しんぎ"), Term("営み", "いとなみ"), Term("紋", "もん"), Term("真新しい", "まあたらしい"), Term("神宮", "じんぐう"), Term("神父", "しんぷ"), Term("神妙", "しんみょう"), Term("親衛", "しんえい"), Term("人為", "じんい"), Term("人件費", "じんけんひ"), Term("液化", "えきか"), Term("人骨", "じんこつ"), Term("人妻", "ひとづま"), Term("減益", "げんえき"), Term("人事異動", "じんじいどう"), Term("駅伝", "えきでん"), Term("投信", "とうしん"), Term("越境", "えっきょう"), Term("越冬", "えっとう"), Term("人選", "じんせん"), Term("人的", "じんてき"), Term("円筒", "えんとう"), Term("円盤", "えんばん"), Term("園児", "えんじ"), Term("園長", "えんちょう"), Term("延命", "えんめい"), Term("陣中", "じんちゅう"), Term("沿って", "そって"), Term("小品", "しょうひん"), Term("総務局", "そうむきょく"), Term("騎馬", "きば"), Term("沿海", "えんかい"), Term("大映", "だいえい"), Term("演算", "えんざん"), Term("陣容", "じんよう"), Term("物言い", "ものい"), Term("演目", "えんもく"), Term("図版", "ずはん"), Term("炎天", "えんてん"), Term("郵貯", "ゆうちょ"), Term("都内", "とない"), Term("輸銀", "ゆぎん"), Term("師匠", "ししょう"), Term("汚濁", "おだく"), Term("世話人", "せわにん"), Term("無死", "むし"), Term("奥山", "おくやま"), Term("制球", "せいきゅう"), Term("急遽", "きゅうきょ"), Term("制覇", "せいは"), Term("礎", "いしずえ"), Term("公定", "こうてい"), Term("見当たらない", "みあたらない"), Term("性向", "せいこう"), Term("性行", "せいこう"), Term("本欄", "ほんらん"), Term("政局", "せいきょく"), Term("政見", "せいけん"), Term("拘禁", "こうきん"), Term("清貧", "せいひん"), Term("清流", "せいりゅう"), Term("清涼", "せいりょう"), Term("王立", "おうりつ"), Term("生い立ち", "おいたち"), Term("応札", "おうさつ"), Term("乳児", "にゅうじ"), Term("沖縄開発庁長官", "おきなわかいはつちょうちょうかん"), Term("荻", "おぎ"), Term("抗戦", "こうせん"), Term("生体", "せいたい"), Term("生誕", "せいたん"), Term("生保", "せいほ"), Term("盛り上がり", "もりあがり"), Term("精", "せい"), Term("温床", "おんしょう"), Term("病棟", "びょうとう"), Term("精神薄弱", "せいしんはくじゃく"), Term("精米", "せいまい"), Term("広まり", "ひろまり"), Term("下っ腹", "したっぱら"), Term("聖域", "せいいき"), Term("聖戦", "せいせん"), Term("下級", "かきゅう"), Term("下限", "かげん"), Term("鳴り", "なり"), Term("西口", "にしぐち"), Term("残った分", "のこったぶん"), Term("同市", "どうし"), Term("下手投げ", "したてなげ"), Term("誓い", "ちかい"), Term("青果", "せいか"), Term("揺さぶり", "ゆさぶり"), Term("積極", "せっきょく"), Term("大台", "おおだい"), Term("仮処分", "かりしょぶん"), Term("積載", "せきさい"), Term("仮称", "かしょう"), Term("積算", "せきさん"), Term("積立金", "つみたてきん"), Term("府警", "ふけい"), Term("訪中", "ほうちゅう"), Term("切り口", "きりくち"), Term("折から", "おりから"), Term("深刻化", "しんこくか"), Term("鉄板", "てっぱん"), Term("設問", "せつもん"), Term("隆盛", "りゅうせい"), Term("絶妙", "ぜつみょう"), Term("銃撃", "じゅうげき"), Term("先取り", "さきどり"), Term("加害者", "かがいしゃ"), Term("先手", "せんて"), Term("社民党", "しゃみんとう"), Term("先陣", "せんじん"), Term("先発", "せんぱつ"), Term("先物", "さきもの"), Term("千秋楽", "せんしゅうらく"), Term("千島", "ちしま"), Term("夏場所", "なつばしょ"), Term("専業", "せんぎょう"), Term("専任", "せんにん"), Term("戦域", "せんいき"), Term("戦国", "せんごく"), Term("戦没", "せんぼつ"), Term("戦列", "せんれつ"), Term("扇", "おうぎ"), Term("家宅", "かたく"), Term("前週", "ぜんしゅう"), Term("前頭", "まえがしら"), Term("前年度", "ぜんねんど"), Term("前半戦", "ぜんはんせん"), Term("歌集", "かしゅう"), Term("前文", "ぜんぶん"), Term("歌人", "かじん"), Term("善隣", "ぜんりん"), Term("品格", "ひんかく"), Term("初戦", "しょせん"), Term("全域", "ぜんいき"), Term("全曲", "ぜんきょく"), Term("全勝", "ぜんしょう"), Term("全人", "ぜんじん"), Term("全日", "ぜんじつ"), Term("全日制", "ぜんにちせい"), Term("全廃", "ぜんぱい"), Term("全面", "ぜんめん"), Term("全容", "ぜんよう"), Term("全量", "ぜんりょう"), Term("禅寺", "ぜんでら"), Term("花形", "はながた"), Term("草刈り", "くさかり"), Term("素子", "そし"), Term("組み替え", "くみかえ"), Term("組織的", "そしきてき"), Term("訴状", "そじょう"), Term("課員", "かいん"), Term("課徴金", "かちょうきん"), Term("創始", "そうし"), Term("双", "そう"), Term("倉敷", "くらしき"), Term("喪主", "もしゅ"), Term("壮年", "そうねん"), Term("掃海", "そうかい"), Term("通産相", "つうさんしょう"), Term("過渡", "かと"), Term("克明", "こくめい"), Term("過当", "かとう"), Term("製作費", "せいさくひ"), Term("早瀬", "はやせ"), Term("画商", "がしょう"), Term("相互銀行", "そうごぎんこう"), Term("相乗", "そうじょう"), Term("総監", "そうかん"), Term("総決算", "そうけっさん"), Term("総帥", "そうすい"), Term("総長", "そうちょう"), Term("総評", "そうひょう"), Term("総務", "そうむ"), Term("総量", "そうりょう"), Term("総領事", "そうりょうじ"), Term("総力", "そうりょく"), Term("会食", "かいしょく"), Term("植樹", "しょくじゅ"), Term("葬送", "そうそう"), Term("送検", "そうけん"), Term("稲田", "いなだ"), Term("起爆", "きばく"), Term("騒乱", "そうらん"), Term("親会社", "おやがいしゃ"), Term("増員", "ぞういん"), Term("増産", "ぞうさん"), Term("増資", "ぞうし"), Term("増収", "ぞうしゅう"), Term("贈答", "ぞうとう"), Term("造形", "ぞうけい"), Term("回忌", "かいき"), Term("回帰", "かいき"), Term("即効", "そっこう"), Term("提供者", "ていきょうしゃ"), Term("回生", "かいせい"), Term("同点", "どうてん"), Term("快挙", "かいきょ"), Term("速報", "そくほう"), Term("戒告", "かいこく"), Term("他殺", "たさつ"), Term("他派", "たは"), Term("多岐", "たき"), Term("肉薄", "にくはく"), Term("多重", "たじゅう"), Term("多面", "ためん"), Term("多目的", "たもくてき"), Term("多様化", "たようか"), Term("太っ腹", "ふとっぱら"), Term("量販店", "りょうはんてん"), Term("助け合い", "たすけあい"), Term("改編", "かいへん"), Term("打ち上げ", "うちあげ"), Term("打線", "だせん"), Term("打撲", "だぼく"), Term("海岸線", "かいがんせん"), Term("体感", "たいかん"), Term("体型", "たいけい"), Term("対案", "たいあん"), Term("代議", "だいぎ"), Term("開示", "かいじ"), Term("代人", "だいにん"), Term("開場", "かいじょう"), Term("開戦", "かいせん"), Term("開閉", "かいへい"), Term("台帳", "だいちょう"), Term("冷暖房", "れいだんぼう"), Term("磯", "いそ"), Term("大黒柱", "だいこくばしら"), Term("漁", "りょう"), Term("年商", "ねんしょう"), Term("中欧", "ちゅうおう"), Term("外資", "がいし"), Term("外需", "がいじゅ"), Term("落札", "らくさつ"), Term("外信", "がいしん"), Term("大相撲", "おおずもう"), Term("大蔵", "おおくら"), Term("外務", "がいむ"), Term("外遊", "がいゆう"), Term("大豆", "だいず"), Term("支柱", "しちゅう"), Term("賛", "さん"), Term("滝川", "たきがわ"), Term("卓", "たく"), Term("宅配", "たくはい"), Term("奪回", "だっかい"), Term("奪還", "だっかん"), Term("脱水", "だっすい"), Term("谷川", "たにがわ"), Term("旗手", "きしゅ"), Term("菌", "きん"), Term("格付け", "かくづけ"), Term("単身", "たんしん"), Term("籍", "せき"), Term("談合", "だんごう"), Term("学界", "がっかい"), Term("学区", "がっく"), Term("不人気", "ふにんき"), Term("地検", "ちけん"), Term("地裁", "ちさい"), Term("地蔵", "じぞう"), Term("学卒", "がくそつ"), Term("学徒", "がくと"), Term("学内", "がくない"), Term("痴呆", "ちほう"), Term("軽", "けい"), Term("稚魚", "ちぎょ"), Term("置き場", "おきば"), Term("致死", "ちし"), Term("決", "けつ"), Term("岳", "たけ"), Term("中元", "ちゅうげん"), Term("対地", "たいち"), Term("祖", "そ"), Term("犠飛", "ぎひ"), Term("予選", "よせん"), Term("中軸", "ちゅうじく"), Term("中小", "ちゅうしょう"), Term("中前", "ちゅうぜん"), Term("活性", "かっせい"), Term("秀作", "しゅうさく"), Term("活動家", "かつどうか"), Term("中島", "なかじま"), Term("中等", "ちゅうとう"), Term("中盤", "ちゅうばん"), Term("中略", "ちゅうりゃく"), Term("渇水", "かっすい"), Term("途", "と"), Term("注意報", "ちゅういほう"), Term("完結", "かんけつ"), Term("私大", "しだい"), Term("範", "はん"), Term("灘", "なだ"), Term("銚子", "ちょうし"), Term("官界", "かんかい"), Term("官邸", "かんてい"), Term("官報", "かんぽう"), Term("官房", "かんぼう"), Term("官房長官", "かんぼうちょうかん"), Term("長者", "ちょうじゃ"), Term("長調", "ちょうちょう"), Term("短距離", "たんきょり"), Term("余剰", "よじょう"), Term("直営", "ちょくえい"), Term("感受性", "かんじゅせい"), Term("直轄", "ちょっかつ"), Term("直系", "ちょっけい"), Term("鎮魂", "ちんこん"), Term("陳謝", "ちんしゃ"), Term("追悼", "ついとう"), Term("環境庁", "かんきょうちょう"), Term("痛恨", "つうこん"), Term("痛烈", "つうれつ"), Term("監獄", "かんごく"), Term("通関", "つうかん"), Term("監察", "かんさつ"), Term("通算", "つうさん"), Term("監修", "かんしゅう"), Term("監理", "かんり"), Term("通信網", "つうしんもう"), Term("通念", "つうねん"), Term("醸成", "じょうせい"), Term("管区", "かんく"), Term("低学年", "ていがくねん"), Term("低水準", "ていすいじゅん"), Term("低利", "ていり"), Term("簡略", "かんりゃく"), Term("内閣官房", "ないかくかんぼう"), Term("堤", "つつみ"), Term("村議会", "そんぎかい"), Term("定額", "ていがく"), Term("艦", "かん"), Term("定説", "ていせつ"), Term("艦艇", "かんてい"), Term("別室", "べっしつ"), Term("定量", "ていりょう"), Term("定例", "ていれい"), Term("帝京", "ていきょう"), Term("底値", "そこね"), Term("提訴", "ていそ"), Term("締約", "ていやく"), Term("逓信", "ていしん"), Term("適格", "てきかく"), Term("天皇制", "てんのうせい"), Term("天皇陛下", "てんのうへいか"), Term("関脇", "せきわけ"), Term("天理", "てんり"), Term("館長", "かんちょう"), Term("題する", "だいする"), Term("添加物", "てんかぶつ"), Term("転機", "てんき"), Term("転出", "てんしゅつ"), Term("転身", "てんしん"), Term("受け", "うけ"), Term("転売", "てんばい"), Term("発光", "はっこう"), Term("国勢", "こくせい"), Term("岩間", "いわま"), Term("岩山", "いわやま"), Term("岩盤", "がんばん"), Term("身代金要求", "みのしろきんようきゅう"), Term("喜んで", "よろこんで"), Term("途方", "とほう"), Term("素顔", "すがお"), Term("器材", "きざい"), Term("都度", "つど"), Term("器物", "きぶつ"), Term("都立", "とりつ"), Term("基幹", "きかん"), Term("度合", "どあい"), Term("委嘱", "いしょく"), Term("土建屋", "どけんや"), Term("開き", "ひらき"), Term("奇襲", "きしゅう"), Term("土石", "どせき"), Term("寄せ", "よせ"), Term("逆しま", "さかしま"), Term("倒れ", "たおれ"), Term("予断", "よだん"), Term("倒閣", "とうかく"), Term("岐路", "きろ"), Term("党内", "とうない"), Term("党利", "とうり"), Term("島根", "しまね"), Term("旗揚げ", "はたあげ"), Term("投降", "とうこう"), Term("東口", "ひがしぐち"), Term("投石", "とうせき"), Term("既得権", "きとくけん"), Term("東海", "とうかい"), Term("損壊", "そんかい"), Term("東宮", "とうぐう"), Term("東都", "とうと"), Term("東南", "とうなん"), Term("東邦", "とうほう"), Term("行楽", "こうらく"), Term("機運", "きうん"), Term("当期", "とうき"), Term("実態調査", "じったいちょうさ"), Term("補正予算", "ほせいよさん"), Term("同好", "どうこう"), Term("同校", "どうこう"), Term("気筒", "きとう"), Term("同氏", "どうし"), Term("同省", "どうしょう"), Term("気負い", "きおい"), Term("同乗", "どうじょう"), Term("同姓", "どうせい"), Term("同船", "どうせん"), Term("同窓", "どうそう"), Term("飛び出し", "とびだし"), Term("同地", "どうち"), Term("同町", "どうちょう"), Term("同店", "どうてん"), Term("祈願", "きがん"), Term("同病", "どうびょう"), Term("祈念", "きねん"), Term("同夜", "どうや"), Term("追徴", "ついちょう"), Term("堂", "どう"), Term("来賓", "らいひん"), Term("胴上げ", "どうあげ"), Term("規程", "きてい"), Term("得票", "とくひょう"), Term("特訓", "とっくん"), Term("特効薬", "とっこうやく"), Term("特攻隊", "とっこうたい"), Term("特使", "とくし"), Term("特殊法人", "とくしゅほうじん"), Term("記帳", "きちょう"), Term("特段", "とくだん"), Term("特筆", "とくひつ"), Term("特約", "とくやく"), Term("特例", "とくれい"), Term("独禁法", "どっきんほう"), Term("起工", "きこう"), Term("起債", "きさい"), Term("疑獄", "ぎごく"), Term("無資格", "むしかく"), Term("民政", "みんせい"), Term("突き上げる", "つきあげる"), Term("突起", "とっき"), Term("突出", "とっしゅつ"), Term("偽証", "ぎしょう"), Term("鈍化", "どんか"), Term("内規", "ないき"), Term("儀", "ぎ"), Term("内需", "ないじゅ"), Term("内蔵", "ないぞう"), Term("内務", "ないむ"), Term("軟式", "なんしき"), Term("疑義", "ぎぎ"), Term("四畳半", "よじょうはん"), Term("難航", "なんこう"), Term("難病", "なんびょう"), Term("疑心", "ぎしん"), Term("二院", "にいん"), Term("二見", "ふたみ"), Term("紫色", "むらさきいろ"), Term("二号", "にごう"), Term("義援金", "ぎえんきん"), Term("二死", "にし"), Term("義塾", "ぎじゅく"), Term("義父", "ぎふ"), Term("二十四時間制", "にじゅうよじかんせい"), Term("二本立て", "にほんだて"), Term("二塁", "にるい"), Term("処遇", "しょぐう"), Term("議場", "ぎじょう"), Term("義太夫", "ぎだゆう"), Term("入閣", "にゅうかく"), Term("入居", "にゅうきょ"), Term("入国管理局", "にゅうこくかんりきょく"), Term("逆風", "ぎゃくふう"), Term("入所", "にゅうしょ"), Term("休する", "きゅうする"), Term("入幕", "にゅうまく"), Term("入門", "にゅうもん"), Term("如実", "にょじつ"), Term("任", "にん"), Term("休刊", "きゅうかん"), Term("認知", "にんち"), Term("休場", "きゅうじょう"), Term("休職", "きゅうしょく"), Term("熱弁", "ねつべん"), Term("年会", "ねんかい"), Term("年刊", "ねんかん"), Term("年産", "ねんさん"), Term("年初", "ねんしょ"), Term("年数", "ねんすう"), Term("年男", "としおとこ"), Term("年俸", "ねんぽう"), Term("急進", "きゅうしん"), Term("念書", "ねんしょ"), Term("濃縮", "のうしゅく"), Term("濃淡", "のうたん"), Term("仮題", "かだい"), Term("納税", "のうぜい"), Term("能動", "のうどう"), Term("求刑", "きゅうけい"), Term("農", "のう"), Term("農協", "のうきょう"), Term("農作業", "のうさぎょう"), Term("農産", "のうさん"), Term("農林", "のうりん"), Term("球団", "きゅうだん"), Term("破格", "はかく"), Term("追撃", "ついげき"), Term("窮状", "きゅうじょう"), Term("俳人", "はいじん"), Term("廃材", "はいざい"), Term("旧制", "きゅうせい"), Term("旧態", "きゅうたい"), Term("旧来", "きゅうらい"), Term("排他", "はいた"), Term("巨体", "きょたい"), Term("輩出", "はいしゅつ"), Term("適法", "てきほう"), Term("配備", "はいび"), Term("経理", "けいり"), Term("買取", "かいとり"), Term("買い出し", "かいだし"), Term("売り込み", "うりこみ"), Term("賠償金", "ばいしょうきん"), Term("漁場", "ぎょじょう"), Term("博物", "はくぶつ"), Term("柏木", "かしわぎ"), Term("京", "きょう"), Term("白羽", "しらは"), Term("小規模", "しょうきぼ"), Term("競演", "きょうえん"), Term("迫力", "はくりょく"), Term("縛り首", "しばりくび"), Term("発信", "はっしん"), Term("共著", "きょうちょ"), Term("共闘", "きょうとう"), Term("発着", "はっちゃく"), Term("共謀", "きょうぼう"), Term("発令", "はつれい"), Term("協賛", "きょうさん"), Term("協和", "きょうわ"), Term("半期", "はんき"), Term("半身", "はんしん"), Term("鮮魚", "せんぎょ"), Term("半面", "はんめん"), Term("境地", "きょうち"), Term("境内", "けいだい"), Term("反共", "はんきょう"), Term("強さ", "つよさ"), Term("反則", "はんそく"), Term("押し切る", "おしきる"), Term("反落", "はんらく"), Term("強打", "きょうだ"), Term("汎用", "はんよう"), Term("強敵", "きょうてき"), Term("藩主", "はんしゅ"), Term("挟み撃ち", "はさみうち"), Term("金具", "かなぐ"), Term("悲痛", "ひつう"), Term("教書", "きょうしょ"), Term("教祖", "きょうそ"), Term("皮膚科", "ひふか"), Term("教壇", "きょうだん"), Term("碑文", "ひぶん"), Term("秘話", "ひわ"), Term("教務", "きょうむ"), Term("肥", "こえ"), Term("教諭", "きょうゆ"), Term("被災", "ひさい"), Term("被爆", "ひばく"), Term("非公開", "ひこうかい"), Term("浮揚", "ふよう"), Term("飛行士", "ひこうし"), Term("圧巻", "あっかん"), Term("微小", "びしょう"), Term("微震", "びしん"), Term("郷土", "きょうど"), Term("必需", "ひつじゅ"), Term("必勝", "ひっしょう"), Term("必着", "ひっちゃく"), Term("業種", "ぎょうしゅ"), Term("筆頭", "ひっとう"), Term("既成", "きせい"), Term("局地", "きょくち"), Term("曲折", "きょくせつ"), Term("病死", "びょうし"), Term("上半期", "かみはんき"), Term("品性", "ひんせい"), Term("勤労者", "きんろうしゃ"), Term("均一", "きんいつ"), Term("不可避", "ふかひ"), Term("不信任", "ふしんにん"), Term("不成立", "ふせいりつ"), Term("不戦", "ふせん"), Term("筋力", "きんりょく"), Term("不退転", "ふたいてん"), Term("緊縮", "きんしゅく"), Term("不透明", "ふとうめい"), Term("不発", "ふはつ"), Term("近海", "きんかい"), Term("不払い", "ふばらい"), Term("近況", "きんきょう"), Term("近親", "きんしん"), Term("付帯", "ふたい"), Term("治水", "ちすい"), Term("府知事", "ふちじ"), Term("金脈", "きんみゃく"), Term("普通預金", "ふつうよきん"), Term("本塁", "ほんるい"), Term("負け越し", "まけこし"), Term("連名", "れんめい"), Term("純", "じゅん"), Term("武者", "むしゃ"), Term("定率", "ていりつ"), Term("武将", "ぶしょう"), Term("舞台裏", "ぶたいうら"), Term("安保", "あんぽ"), Term("区長", "くちょう"), Term("区内", "くない"), Term("積ん読", "つんどく"), Term("風情", "ふぜい"), Term("風力", "ふうりょく"), Term("伏線", "ふくせん"), Term("完工", "かんこう"), Term("副賞", "ふくしょう"), Term("副題", "ふくだい"), Term("復権", "ふっけん"), Term("復刻", "ふっこく"), Term("駆け込み", "かけこみ"), Term("複雑さ", "ふくざつさ"), Term("駆動", "くどう"), Term("淵", "ふち"), Term("具象", "ぐしょう"), Term("在外", "ざいがい"), Term("仏文", "ふつぶん"), Term("物件", "ぶっけん"), Term("物証", "ぶっしょう"), Term("物的", "ぶってき"), Term("物品", "ぶっぴん"), Term("分かつ", "わかつ"), Term("分かり", "わかり"), Term("空調", "くうちょう"), Term("分かれ目", "わかれめ"), Term("空転", "くうてん"), Term("分化", "ぶんか"), Term("空洞", "くうどう"), Term("空母", "くうぼ"), Term("偶発", "ぐうはつ"), Term("分権", "ぶんけん"), Term("分譲", "ぶんじょう"), Term("分立", "ぶんりつ"), Term("繰り延べ", "くりのべ"), Term("奮起", "ふんき"), Term("紛糾", "ふんきゅう"), Term("桑", "くわ"), Term("文学者", "ぶんがくしゃ"), Term("文壇", "ぶんだん"), Term("文民", "ぶんみん"), Term("聞き手", "ききて"), Term("併設", "へいせつ"), Term("群島", "ぐんとう"), Term("兵舎", "へいしゃ"), Term("軍医", "ぐんい"), Term("閉幕", "へいまく"), Term("米穀", "べいこく"), Term("米飯", "べいはん"), Term("別院", "べついん"), Term("軍用", "ぐんよう"), Term("別冊", "べっさつ"), Term("優遇", "ゆうぐう"), Term("別表", "べっぴょう"), Term("郡部", "ぐんぶ"), Term("追い上げる", "おいあげる"), Term("係争", "けいそう"), Term("変わらない", "かわらない"), Term("変化球", "へんかきゅう"), Term("変質", "へんしつ"), Term("刑事事件", "けいじじけん"), Term("変造", "へんぞう"), Term("編入", "へんにゅう"), Term("形式的", "けいしきてき"), Term("形状", "けいじょう"), Term("弁", "べん"), Term("比べ", "くらべ"), Term("恵比寿", "えびす"), Term("弁務官", "べんむかん"), Term("保する", "ほする"), Term("心外", "しんがい"), Term("持ち合い", "もちあい"), Term("保健婦", "ほけんふ"), Term("敬老", "けいろう"), Term("売上金", "うりあげきん"), Term("桂", "かつら"), Term("土砂", "どしゃ"), Term("信", "しん"), Term("経企庁", "けいきちょう"), Term("補正", "ほせい"), Term("経済界", "けいざいかい"), Term("経済企画庁", "けいざいきかくちょう"), Term("母性", "ぼせい"), Term("洞", "ほら"), Term("継投", "けいとう"), Term("敢闘", "かんとう"), Term("抱え", "かかえ"), Term("凝縮", "ぎょうしゅく"), Term("警護", "けいご"), Term("放射性", "ほうしゃせい"), Term("早乙女", "さおとめ"), Term("法師", "ほうし"), Term("軽震", "けいしん"), Term("法制", "ほうせい"), Term("法定", "ほうてい"), Term("軽妙", "けいみょう"), Term("砲", "ほう"), Term("軽量", "けいりょう"), Term("訪米", "ほうべい"), Term("邦画", "ほうが"), Term("邦人", "ほうじん"), Term("飽食", "ほうしょく"), Term("劇作", "げきさく"), Term("暴挙", "ぼうきょ"), Term("争奪", "そうだつ"), Term("防疫", "ぼうえき"), Term("防音", "ぼうおん"), Term("海難", "かいなん"), Term("欠員", "けついん"), Term("防空", "ぼうくう"), Term("犠打", "ぎだ"), Term("北緯", "ほくい"), Term("北海道開発庁長官", "ほっかいどうかいはつちょうちょうかん"), Term("北口", "きたぐち"), Term("弔辞", "ちょうじ"), Term("北端", "ほくたん"), Term("墨付き", "すみつき"), Term("熱戦", "ねっせん"), Term("決済", "けっさい"), Term("決裁", "けっさい"), Term("決戦", "けっせん"), Term("堀川", "ほりかわ"), Term("本位", "ほんい"), Term("本格化", "ほんかくか"), Term("本業", "ほんぎょう"), Term("本紙", "ほんし"), Term("満了", "まんりょう"), Term("未発表", "みはっぴょう"), Term("検診", "けんしん"), Term("健闘", "けんとう"), Term("未明", "みめい"), Term("兼ね合い", "かねあい"), Term("密猟", "みつりょう"), Term("剣士", "けんし"), Term("民営", "みんえい"), Term("民芸", "みんげい"), Term("圏内", "けんない"), Term("民事", "みんじ"), Term("民主国", "みんしゅこく"), Term("堅持", "けんじ"), Term("民需", "みんじゅ"), Term("建議", "けんぎ"), Term("建国", "けんこく"), Term("無気力", "むきりょく"), Term("無休", "むきゅう"), Term("無政府", "むせいふ"), Term("懸案", "けんあん"), Term("矛先", "ほこさき"), Term("検挙", "けんきょ"), Term("名曲", "めいきょく"), Term("名実", "めいじつ"), Term("名手", "めいしゅ"), Term("権益", "けんえき"), Term("命運", "めいうん"), Term("献上", "けんじょう"), Term("明快", "めいかい"), Term("明示", "めいじ"), Term("盟友", "めいゆう"), Term("県下", "けんか"), Term("県議", "けんぎ"), Term("県警", "けんけい"), Term("県内", "けんない"), Term("県民", "けんみん"), Term("県立", "けんりつ"), Term("在留", "ざいりゅう"), Term("縦断", "じゅうだん"), Term("面白", "おもしろ"), Term("猛攻", "もうこう"), Term("猛打", "もうだ"), Term("木戸", "きど"), Term("木場", "きば"), Term("戻り", "もどり"), Term("門扉", "もんぴ"), Term("落差", "らくさ"), Term("一女", "いちじょ"), Term("転移", "てんい"), Term("輸出入", "ゆしゅつにゅう"), Term("原人", "げんじん"), Term("優先的", "ゆうせんてき"), Term("優良", "ゆうりょう"), Term("原動力", "げんどうりょく"), Term("憂慮", "ゆうりょ"), Term("雨量", "うりょう"), Term("有給", "ゆうきゅう"), Term("有限", "ゆうげん"), Term("有人", "ゆうじん"), Term("弦楽", "げんがく"), Term("減額", "げんがく"), Term("息吹", "いぶき"), Term("減産", "げんさん"), Term("減収", "げんしゅう"), Term("由緒", "ゆいしょ"), Term("誘致", "ゆうち"), Term("減反", "げんたん"), Term("鉄筋", "てっきん"), Term("源流", "げんりゅう"), Term("遊撃", "ゆうげき"), Term("遊説", "ゆうぜい"), Term("現況", "げんきょう"), Term("現時点", "げんじてん"), Term("固形", "こけい"), Term("代表作", "だいひょうさく"), Term("固定資産", "こていしさん"), Term("惨状", "さんじょう"), Term("落ち着いた", "おちついた"), Term("戸数", "こすう"), Term("戸惑い", "とまどい"), Term("乱発", "らんぱつ"), Term("乱立", "らんりつ"), Term("卵子", "らんし"), Term("藍", "あい"), Term("口火", "くちび"), Term("利権", "りけん"), Term("湖沼", "こしょう"), Term("推奨", "すいしょう"), Term("利払い", "りばらい"), Term("理学", "りがく"), Term("理工", "りこう"), Term("理工学部", "りこうがくぶ"), Term("理髪", "りはつ"), Term("理不尽", "りふじん"), Term("誤算", "ごさん"), Term("海浜", "かいひん"), Term("互換", "ごかん"), Term("里帰り", "さとがえり"), Term("互助", "ごじょ"), Term("里子", "さとご"), Term("離散", "りさん"), Term("離反", "りはん"), Term("呉服", "ごふく"), Term("立ち直り", "たちなおり"), Term("後ろ盾", "うしろだて"), Term("立脚", "りっきゃく"), Term("後遺症", "こういしょう"), Term("立憲", "りっけん"), Term("後見", "こうけん"), Term("略式", "りゃくしき"), Term("相談所", "そうだんじょ"), Term("略歴", "りゃくれき"), Term("後手", "ごて"), Term("流用", "りゅうよう"), Term("留置", "りゅうち"), Term("後日", "ごじつ"), Term("後発", "こうはつ"), Term("両軍", "りょうぐん"), Term("両氏", "りょうし"), Term("両党", "りょうとう"), Term("御苑", "ぎょえん"), Term("両論", "りょうろん"), Term("料理屋", "りょうりや"), Term("良かったら", "よかったら"), Term("陵", "みささぎ"), Term("力投", "りきとう"), Term("臨床", "りんしょう"), Term("臨場感", "りんじょうかん"), Term("配信", "はいしん"), Term("輪切り", "わぎり"), Term("累進", "るいしん"), Term("例会", "れいかい"), Term("護岸", "ごがん"), Term("護憲", "ごけん"), Term("護送", "ごそう"), Term("冷え", "ひえ"), Term("交響楽", "こうきょうがく"), Term("交際費", "こうさいひ"), Term("受け皿", "うけざら"), Term("零時", "れいじ"), Term("霊園", "れいえん"), Term("硬派", "こうは"), Term("歴訪", "れきほう"), Term("残留", "ざんりゅう"), Term("連携", "れんけい"), Term("連合会", "れんごうかい"), Term("噴煙", "ふんえん"), Term("激動", "げきどう"), Term("公安", "こうあん"), Term("連打", "れんだ"), Term("公営", "こうえい"), Term("公益法人", "こうえきほうじん"), Term("連峰", "れんぽう"), Term("連用", "れんよう"), Term("公海", "こうかい"), Term("労災", "ろうさい"), Term("公館", "こうかん"), Term("労作", "ろうさく"), Term("労働省", "ろうどうしょう"), Term("労連", "ろうれん"), Term("公庫", "こうこ"), Term("公算", "こうさん"), Term("公司", "こうし"), Term("公子", "こうし"), Term("老人性", "ろうじんせい"), Term("埋め立て", "うめたて"), Term("公示", "こうじ"), Term("球威", "きゅうい"), Term("公社", "こうしゃ"), Term("公社債", "こうしゃさい"), Term("論説", "ろんせつ"), Term("公称", "こうしょう"), Term("公人", "こうじん"), Term("公設", "こうせつ"), Term("土地柄", "とちがら"), Term("公選", "こうせん"), Term("和平", "わへい"), Term("公的", "こうてき"), Term("公費", "こうひ"), Term("基軸", "きじく"), Term("公布", "こうふ"), Term("枠内", "わくない"), Term("公文書", "こうぶんしょ"), Term("公報", "こうほう"), Term("公民", "こうみん"), Term("公明", "こうめい"), Term("公論", "こうろん"), Term("功労", "こうろう"), Term("太り肉", "ふとりじし"), Term("陥没", "かんぼつ"), Term("厚さ", "あつさ"), Term("厚生年金", "こうせいねんきん"), Term("厚相", "こうしょう"), Term("小刻み", "こきざみ"), Term("即日", "そくじつ"), Term("続伸", "ぞくしん"), Term("後継", "こうけい"), Term("口上", "こうじょう"), Term("口利き", "くちき"), Term("翁", "おう"), Term("下半身", "かはんしん"), Term("好投", "こうとう"), Term("加重", "かじゅう"), Term("角界", "かくかい"), Term("工科", "こうか"), Term("工費", "こうひ"), Term("増殖", "ぞうしょく"), Term("興", "きょう"), Term("九十", "きゅうじゅう"), Term("外圧", "がいあつ"), Term("兼任", "けんにん"), Term("講和", "こうわ"), Term("工法", "こうほう"), Term("工房", "こうぼう"), Term("工務", "こうむ"), Term("抗日", "こうにち"), Term("舎", "しゃ"), Term("浮遊", "ふゆう"), Term("重厚", "じゅうこう"), Term("攻守", "こうしゅ"), Term("南口", "みなみぐち"), Term("攻防", "こうぼう"), Term("人心", "じんしん"), Term("校内", "こうない"), Term("人文", "じんぶん"), Term("正道", "せいどう"), Term("構図", "こうず"), Term("皇后", "こうごう"), Term("佃", "つくだ"), Term("皇族", "こうぞく"), Term("皇太子妃", "こうたいしひ"), Term("硬式", "こうしき"), Term("内示", "ないじ"), Term("南西", "なんせい"), Term("綱領", "こうりょう"), Term("年頭", "ねんとう"), Term("年表", "ねんぴょう"), Term("派出所", "はしゅつじょ"), Term("売春婦", "ばいしゅんふ"), Term("萩原", "はぎはら"), Term("博", "はく"), Term("航法", "こうほう"), Term("鼻息", "はないき"), Term("賓客", "ひんきゃく"), Term("荒木", "あらき"), Term("風穴", "かざあな"), Term("別名", "べつめい"), Term("編者", "へんしゃ"), Term("行革", "ぎょうかく"), Term("行脚", "あんぎゃ"), Term("密入国", "みつにゅうこく"), Term("果汁", "かじゅう"), Term("老舗", "しにせ"), Term("大和", "やまと"), Term("高位", "こうい"), Term("遺棄", "いき"), Term("位置付ける", "いちづける"), Term("訪欧", "ほうおう"), Term("異文", "いぶん"), Term("高台", "たかだい"), Term("水利", "すいり"), Term("浮き彫り", "うきぼり"), Term("受け渡し", "うけわたし"), Term("高低", "こうてい"), Term("撃ち止める", "うちとめる"), Term("高揚", "こうよう"), Term("大さじ", "おおさじ"), Term("憶測", "おくそく"), Term("押し出し", "おしだし"), Term("合作", "がっさく"), Term("合戦", "かっせん"), Term("合奏", "がっそう"), Term("返り咲き", "かえりざき"), Term("夏季", "かき"), Term("職能", "しょくのう"), Term("画一", "かくいつ"), Term("合力", "ごうりょく"), Term("豪快", "ごうかい"), Term("克己", "こっき"), Term("仮設", "かせつ"), Term("刻", "こく"), Term("自治体", "じちたい"), Term("刻み", "きざみ"), Term("画期的", "かっきてき"), Term("告示", "こくじ"), Term("高所", "こうしょ"), Term("告別", "こくべつ"), Term("国営", "こくえい"), Term("才", "さい"), Term("核分裂", "かくぶんれつ"), Term("切り替え", "きりかえ"), Term("切れ味", "きれあじ"), Term("国策", "こくさく"), Term("偽装", "ぎそう"), Term("国士", "こくし"), Term("国是", "こくぜ"), Term("国政", "こくせい"), Term("国税", "こくぜい"), Term("国鉄", "こくてつ"), Term("衣替え", "ころもがえ"), Term("国務省", "こくむしょう"), Term("往年", "おうねん"), Term("国名", "こくめい"), Term("示し", "しめし"), Term("黒鉛", "こくえん"), Term("下請け", "したうけ"), Term("悲壮", "ひそう"), Term("黒星", "くろぼし"), Term("締め付け", "しめつけ"), Term("首領", "しゅりょう"), Term("黒木", "くろき"), Term("獄中", "ごくちゅう"), Term("骨子", "こっし"), Term("送球", "そうきゅう"), Term("席巻", "せっけん"), Term("全線", "ぜんせん"), Term("装丁", "そうてい"), Term("今春", "こんしゅん"), Term("婚姻", "こんいん"), Term("垂れ幕", "たれまく"), Term("客員", "きゃくいん"), Term("浄化", "じょうか"), Term("淡泊", "たんぱく"), Term("懇親", "こんしん"), Term("懇談", "こんだん"), Term("中核", "ちゅうかく"), Term("懇話", "こんわ"), Term("根幹", "こんかん"), Term("帝政", "ていせい"), Term("混成", "こんせい"), Term("東亜", "とうあ"), Term("混迷", "こんめい"), Term("登用", "とうよう"), Term("飛び込み", "とびこみ"), Term("左記", "さき"), Term("左前", "ひだりまえ"), Term("取り込み", "とりこみ"), Term("取り調べ", "とりしらべ"), Term("棄却", "ききゃく"), Term("取次", "とりつぎ"), Term("端緒", "たんしょ"), Term("内情", "ないじょう"), Term("差し戻す", "さしもどす"), Term("差益", "さえき"), Term("飲み水", "のみみず"), Term("座り込み", "すわりこみ"), Term("座長", "ざちょう"), Term("債", "さい"), Term("波乱", "はらん"), Term("反逆", "はんぎゃく"), Term("再演", "さいえん"), Term("字詰め", "じづめ"), Term("再審", "さいしん"), Term("再任", "さいにん"), Term("再販", "さいはん"), Term("再編", "さいへん"), Term("再来", "さいらい"), Term("双葉", "ふたば"), Term("最少", "さいしょう"), Term("没後", "ぼつご"), Term("彩る", "いろどる"), Term("彩色", "さいしき"), Term("歳暮", "せいぼ"), Term("目白押し", "めじろおし"), Term("申し合わせ", "もうしあわせ"), Term("父子", "ふし"), Term("日系", "にっけい"), Term("斎場", "さいじょう"), Term("内実", "ないじつ"), Term("勇退", "ゆうたい"), Term("読み取り", "よみとり"), Term("高架", "こうか"), Term("裁量", "さいりょう"), Term("分かち", "わかち"), Term("通称", "つうしょう"), Term("順位", "じゅんい"), Term("激変", "げきへん"), Term("強豪", "きょうごう"), Term("追っかける", "おっかける"), Term("呼びかけ", "よびかけ"), Term("行き過ぎる", "いきすぎる"), Term("控え", "ひかえ"), Term("作詞", "さくし"), Term("作風", "さくふう"), Term("回戦", "かいせん"), Term("削り節", "けずりぶし"), Term("昨春", "さくしゅん"), Term("策定", "さくてい"), Term("水爆", "すいばく"), Term("冊子", "さっし"), Term("総論", "そうろん"), Term("刷新", "さっしん"), Term("多角", "たかく"), Term("殺傷", "さっしょう"), Term("親書", "しんしょ"), Term("雑居", "ざっきょ"), Term("据え置き", "すえおき"), Term("塁", "るい"), Term("主審", "しゅしん"), Term("重度", "じゅうど"), Term("日韓", "にっかん"), Term("民意", "みんい"), Term("三権", "さんけん"), Term("三十八度線", "さんじゅうはちどせん"), Term("参画", "さんかく"), Term("参観", "さんかん"), Term("参事", "さんじ"), Term("参事官", "さんじかん"), Term("参戦", "さんせん"), Term("十三", "じゅうさん"), Term("有機物", "ゆうきぶつ"), Term("揺るがす", "ゆるがす"), Term("要所", "ようしょ"), Term("参与", "さんよ"), Term("触れ合い", "ふれあい"), Term("散策", "さんさく"), Term("散発", "さんぱつ"), Term("夕", "ゆう"), Term("医科学", "いかがく"), Term("一校", "いっこう"), Term("短銃", "たんじゅう"), Term("引き取り", "ひきとり"), Term("右中間", "うちゅうかん"), Term("営業所", "えいぎょうしょ"), Term("営農", "えいのう"), Term("賛歌", "さんか"), Term("栄養学", "えいようがく"), Term("英明", "えいめい"), Term("越後", "えちご"), Term("園内", "えんない"), Term("演舞", "えんぶ"), Term("横手", "よこて"), Term("卸売市場", "おろしうりしじょう"), Term("家裁", "かさい"), Term("火付け役", "ひつけやく"), Term("稼働率", "かどうりつ"), Term("会社更生法", "かいしゃこうせいほう"), Term("快勝", "かいしょう"), Term("海道", "かいどう"), Term("開発部", "かいはつぶ"), Term("外苑", "がいえん"), Term("閣内", "かくない"), Term("学校法人", "がっこうほうじん"), Term("学習指導要領", "がくしゅうしどうようりょう"), Term("残暑", "ざんしょ"), Term("漢方", "かんぽう"), Term("管財", "かんざい"), Term("簡裁", "かんさい"), Term("還付", "かんぷ"), Term("間伐", "かんばつ"), Term("仕入れ", "しいれ"), Term("企画室", "きかくしつ"), Term("基準法", "きじゅんほう"), Term("期待感", "きたいかん"), Term("棋院", "きいん"), Term("棋聖", "きせい"), Term("機関紙", "きかんし"), Term("気に入り", "きにいり"), Term("気鋭", "きえい"), Term("起訴猶予", "きそゆうよ"), Term("露店", "ろてん"), Term("義務付け", "ぎむづけ"), Term("義勇", "ぎゆう"), Term("議院運営委員会", "ぎいんうんえいいいんかい"), Term("議定書", "ぎていしょ"), Term("客足", "きゃくあし"), Term("脚光", "きゃっこう"), Term("逆転勝ち", "ぎゃくてんがち"), Term("急伸", "きゅうしん"), Term("使途", "しと"), Term("救国", "きゅうこく"), Term("旧派", "きゅうは"), Term("牛歩", "ぎゅうほ"), Term("着衣", "ちゃくい"), Term("使用済み", "しようずみ"), Term("陰り", "かげり"), Term("掘削", "くっさく"), Term("順当", "じゅんとう"), Term("手薄", "てうす"), Term("勘案", "かんあん"), Term("退場", "たいじょう"), Term("登板", "とうばん"), Term("司令", "しれい"), Term("投棄", "とうき"), Term("特設", "とくせつ"), Term("登載", "とうさい"), Term("史家", "しか"), Term("預託", "よたく"), Term("現有", "げんゆう"), Term("史実", "しじつ"), Term("区立", "くりつ"), Term("無配", "むはい"), Term("所要", "しょよう"), Term("適時", "てきじ"), Term("在野", "ざいや"), Term("部会", "ぶかい"), Term("部局", "ぶきょく"), Term("臨界", "りんかい"), Term("誓って", "ちかって"), Term("調教", "ちょうきょう"), Term("忠臣", "ちゅうしん"), Term("大卒", "だいそつ"), Term("男児", "だんじ"), Term("執念", "しゅうねん"), Term("浮沈", "ふちん"), Term("不協和音", "ふきょうわおん"), Term("八幡", "はちまん"), Term("廃案", "はいあん"), Term("配本", "はいほん"), Term("運び", "はこび"), Term("迫撃", "はくげき"), Term("刃渡り", "はわたり"), Term("被保険者", "ひほけんしゃ"), Term("保革", "ほかく"), Term("崩落", "ほうらく"), Term("法制局", "ほうせいきょく"), Term("法要", "ほうよう"), Term("青葉", "あおば"), Term("堀江", "ほりえ"), Term("老婦", "ろうふ"), Term("投げ", "なげ"), Term("市議", "しぎ"), Term("市況", "しきょう"), Term("安芸", "あき"), Term("青柳", "あおやぎ"), Term("居室", "きょしつ"), Term("漁民", "ぎょみん"), Term("競り合い", "せりあい"), Term("市部", "しぶ"), Term("強行採決", "きょうこうさいけつ"), Term("曲がり", "まがり"), Term("禁止法", "きんしほう"), Term("近作", "きんさく"), Term("師事", "しじ"), Term("近著", "きんちょ"), Term("金権", "きんけん"), Term("金屏風", "きんびょうぶ"), Term("繰り上げ", "くりあげ"), Term("繰入", "くりいれ"), Term("刑事責任", "けいじせきにん"), Term("経済研究所", "けいざいけんきゅうしょ"), Term("経済成長率", "けいざいせいちょうりつ"), Term("経済封鎖", "けいざいふうさ"), Term("経常", "けいじょう"), Term("経常利益", "けいじょうりえき"), Term("芸術院", "げいじゅついん"), Term("芸術祭", "げいじゅつさい"), Term("欠場", "けつじょう"), Term("決め球", "きめだま"), Term("決勝点", "けっしょうてん"), Term("決選投票", "けっせんとうひょう"), Term("月産", "げっさん"), Term("月内", "げつない"), Term("健保", "けんぽ"), Term("照射", "しょうしゃ"), Term("建築学", "けんちくがく"), Term("検察庁", "けんさつちょう"), Term("検事正", "けんじせい"), Term("研究官", "けんきゅうかん"), Term("県外", "けんがい"), Term("見切り発車", "みきりはっしゃ"), Term("原資", "げんし"), Term("厳しさ", "きびしさ"), Term("減員", "げんいん"), Term("減給", "げんきゅう"), Term("言い渡し", "いいわたし"), Term("個々人", "ここじん"), Term("固定費", "こていひ"), Term("好守", "こうしゅ"), Term("甲子", "きのえね"), Term("皇民党", "こうみんとう"), Term("行政処分", "ぎょうせいしょぶん"), Term("行政訴訟", "ぎょうせいそしょう"), Term("鉱区", "こうく"), Term("降板", "こうばん"), Term("支局", "しきょく"), Term("高まり", "たかまり"), Term("受章", "じゅしょう"), Term("戦地", "せんち"), Term("怒らせる", "おこらせる"), Term("逃げ", "にげ"), Term("施策", "しさく"), Term("目抜き", "めぬき"), Term("施政", "しせい"), Term("焼け跡", "やけあと"), Term("自任", "じにん"), Term("陣頭", "じんとう"), Term("地力", "じりき"), Term("実相", "じっそう"), Term("実技", "じつぎ"), Term("囲み", "かこみ"), Term("貸金", "かしきん"), Term("通い", "かよい"), Term("飛ばし", "とばし"), Term("新春", "しんしゅん"), Term("総務部", "そうむぶ"), Term("終末", "しゅうまつ"), Term("担い手", "にないて"), Term("小口", "こぐち"), Term("小幅", "こはば"), Term("死亡者", "しぼうしゃ"), Term("目頭", "めがしら"), Term("戻し", "もどし"), Term("問責", "もんせき"), Term("兼務", "けんむ"), Term("肉声", "にくせい"), Term("農政", "のうせい"), Term("躍り", "おどり"), Term("私設", "しせつ"), Term("大口", "おおぐち"), Term("負い目", "おいめ"), Term("連作", "れんさく"), Term("製紙", "せいし"), Term("選者", "せんじゃ"), Term("出前", "でまえ"), Term("戦績", "せんせき"), Term("選奨", "せんしょう"), Term("遷都", "せんと"), Term("私学", "しがく"), Term("私語", "しご"), Term("至上", "しじょう"), Term("新装", "しんそう"), Term("至難", "しなん"), Term("入団", "にゅうだん"), Term("遊覧", "ゆうらん"), Term("非常勤", "ひじょうきん"), Term("奏功", "そうこう"), Term("存亡", "そんぼう"), Term("党議", "とうぎ"), Term("船橋", "ふなばし"), Term("試案", "しあん"), Term("幕下", "まくした"), Term("即戦力", "そくせんりょく"), Term("試行", "しこう"), Term("献花", "けんか"), Term("闘士", "とうし"), Term("中卒", "ちゅうそつ"), Term("試作", "しさく"), Term("透析", "とうせき"), Term("試算", "しさん"), Term("存立", "そんりつ"), Term("両日", "りょうじつ"), Term("署員", "しょいん"), Term("書家", "しょか"), Term("党略", "とうりゃく"), Term("党勢", "とうせい"), Term("党籍", "とうせき"), Term("試料", "しりょう"), Term("随員", "ずいいん"), Term("登竜門", "とうりゅうもん"), Term("総本山", "そうほんざん"), Term("速攻", "そっこう"), Term("預貯金", "よちょきん"), Term("春季", "しゅんき"), Term("対局", "たいきょく"), Term("塾長", "じゅくちょう"), Term("文相", "ぶんしょう"), Term("試験場", "しけんじょう"), Term("宿駅", "しゅくえき"), Term("嫡出", "ちゃくしゅつ"), Term("高学年", "こうがくねん"), Term("高裁", "こうさい"), Term("高率", "こうりつ"), Term("合成洗剤", "ごうせいせんざい"), Term("合繊", "ごうせん"), Term("国家公務員", "こっかこうむいん"), Term("国軍", "こくぐん"), Term("国権", "こっけん"), Term("国際協力事業団", "こくさいきょうりょくじぎょうだん"), Term("国際電信電話", "こくさいでんしんでんわ"), Term("国情", "こくじょう"), Term("国対", "こくたい"), Term("下半期", "しもはんき"), Term("国土庁", "こくどちょう"), Term("国柄", "くにがら"), Term("国労", "こくろう"), Term("国論", "こくろん"), Term("今季", "こんき"), Term("座り", "すわり"), Term("催涙", "さいるい"), Term("最下", "さいか"), Term("最恵国", "さいけいこく"), Term("最高級", "さいこうきゅう"), Term("最高検", "さいこうけん"), Term("最重点", "さいじゅうてん"), Term("最多", "さいた"), Term("最優遇", "さいゆうぐう"), Term("在京", "ざいきょう"), Term("在米", "ざいべい"), Term("財政投融資", "ざいせいとうゆうし"), Term("作況指数", "さっきょうしすう"), Term("事実無根", "じじつむこん"), Term("作付面積", "さくづけめんせき"), Term("昨年来", "さくねんらい"), Term("三次", "さんじ"), Term("三者", "さんしゃ"), Term("三代", "さんだい"), Term("事変", "じへん"), Term("山系", "さんけい"), Term("山手", "やまて"), Term("事務官", "じむかん"), Term("山陽", "さんよう"), Term("産量", "さんりょう"), Term("事務次官", "じむじかん"), Term("賛意", "さんい"), Term("司法裁判", "しほうさいばん"), Term("事務当局", "じむとうきょく"), Term("四死球", "ししきゅう"), Term("市道", "しどう"), Term("思い思い", "おもいおもい"), Term("似顔", "にがお"), Term("支所", "ししょ"), Term("私案", "しあん"), Term("私企業", "しきぎょう"), Term("恒久", "こうきゅう"), Term("私服", "しふく"), Term("私文書", "しぶんしょ"), Term("紙上", "しじょう"), Term("資する", "しする"), Term("賜杯", "しはい"), Term("持ち出し", "もちだし"), Term("字形", "じけい"), Term("自衛官", "じえいかん"), Term("自家用", "じかよう"), Term("自決", "じけつ"), Term("自己資本", "じこしほん"), Term("自由経済", "じゆうけいざい"), Term("式部", "しきぶ"), Term("執行委員", "しっこういいん"), Term("実子", "じっし"), Term("実勢", "じっせい"), Term("外角", "がいかく"), Term("社会事業", "しゃかいじぎょう"), Term("社告", "しゃこく"), Term("社葬", "しゃそう"), Term("若返り", "わかがえり"), Term("主税局", "しゅぜいきょく"), Term("取り下げ", "とりさげ"), Term("取り口", "とりくち"), Term("取締法", "とりしまりほう"), Term("温存", "おんぞん"), Term("守勢", "しゅせい"), Term("時価", "じか"), Term("酒税", "しゅぜい"), Term("首脳部", "しゅのうぶ"), Term("受給", "じゅきゅう"), Term("修士課程", "しゅうしかてい"), Term("秋季", "しゅうき"), Term("終了後", "しゅうりょうご"), Term("週内", "しゅうない"), Term("集散", "しゅうさん"), Term("集票", "しゅうひょう"), Term("重加算税", "じゅうかさんぜい"), Term("重層", "じゅうそう"), Term("酒店", "さかだな"), Term("古紙", "こし"), Term("職種", "しょくしゅ"), Term("粗鋼", "そこう"), Term("底流", "ていりゅう"), Term("生みの親", "うみのおや"), Term("今一つ", "いまひとつ"), Term("帰休", "ききゅう"), Term("無重量", "むじゅうりょう"), Term("次席", "じせき"), Term("無得点", "むとくてん"), Term("無期", "むき"), Term("次代", "じだい"), Term("無量", "むりょう"), Term("更生", "こうせい"), Term("馬場", "ばば"), Term("明文化", "めいぶんか"), Term("明け暮れ", "あけくれ"), Term("空域", "くういき"), Term("次点", "じてん"), Term("発言権", "はつげんけん"), Term("同率", "どうりつ"), Term("筒井", "つつい"), Term("配り物", "くばりもの"), Term("書記官", "しょきかん"), Term("土俵際", "どひょうぎわ"), Term("立会い", "たちあい"), Term("自家", "じか"), Term("石材", "せきざい"), Term("党務", "とうむ"), Term("専守防衛", "せんしゅぼうえい"), Term("専従", "せんじゅう"), Term("自給", "じきゅう"), Term("転戦", "てんせん"), Term("端末機", "たんまつき"), Term("勝因", "しょういん"), Term("勝ち星", "かちぼし"), Term("症例", "しょうれい"), Term("取り計らい", "とりはからい"), Term("総当たり", "そうあたり"), Term("総動員", "そうどういん"), Term("数次", "すうじ"), Term("走塁", "そうるい"), Term("防衛施設庁", "ぼうえいしせつちょう"), Term("防護", "ぼうご"), Term("病理", "びょうり"), Term("百八十度", "ひゃくはちじゅうど"), Term("野中", "のなか"), Term("野末", "のずえ"), Term("預り証", "あずかりしょう"), Term("春場所", "はるばしょ"), Term("対論", "たいろん"), Term("自他", "じた"), Term("研究家", "けんきゅうか"), Term("居住者", "きょじゅうしゃ"), Term("拡大均衡", "かくだいきんこう"), Term("新生児", "しんせいじ"), Term("新法", "しんぽう"), Term("改組", "かいそ"), Term("文様", "もんよう"), Term("微動", "びどう"), Term("門前払い", "もんぜんばらい"), Term("一二", "いちに"), Term("自律", "じりつ"), Term("二期", "にき"), Term("人間像", "にんげんぞう"), Term("掲揚", "けいよう"), Term("国費", "こくひ"), Term("密約", "みつやく"), Term("編著", "へんちょ"), Term("試験的", "しけんてき"), Term("適齢", "てきれい"), Term("敵失", "てきしつ"), Term("敵国", "てきこく"), Term("正念場", "しょうねんば"), Term("政庁", "せいちょう"), Term("識者", "しきしゃ"), Term("政争", "せいそう"), Term("政党政治", "せいとうせいじ"), Term("政教", "せいきょう"), Term("役回り", "やくまわり"), Term("船籍", "せんせき"), Term("水口", "みずぐち"), Term("水産庁", "すいさんちょう"), Term("水量", "すいりょう"), Term("論告", "ろんこく"), Term("副知事", "ふくちじ"), Term("崩し書き", "くずしがき"), Term("執務", "しつむ"), Term("財務官", "ざいむかん"), Term("超党派", "ちょうとうは"), Term("消防庁", "しょうぼうちょう"), Term("失跡", "しっせき"), Term("消費財", "しょうひざい"), Term("小児病", "しょうにびょう"), Term("有事", "ゆうじ"), Term("過失致死", "かしつちし"), Term("浮動票", "ふどうひょう"), Term("相関関係", "そうかんかんけい"), Term("相談役", "そうだんやく"), Term("割り出す", "わりだす"), Term("漆", "うるし"), Term("平幕", "ひらまく"), Term("評伝", "ひょうでん"), Term("買い入れ", "かいいれ"), Term("買い上げ", "かいあげ"), Term("疾患", "しっかん"), Term("買い控え", "かいびかえ"), Term("疾病", "しっぺい"), Term("産別", "さんべつ"), Term("憩い", "いこい"), Term("隣室", "りんしつ"), Term("利上げ", "りあげ"), Term("利下げ", "りさげ"), Term("質的", "しつてき"), Term("利便", "りべん"), Term("底入れ", "そこいれ"), Term("第三国", "だいさんごく"), Term("女学校", "じょがっこう"), Term("若松", "わかまつ"), Term("桑原", "くわばら"), Term("地方税", "ちほうぜい"), Term("地方議会", "ちほうぎかい"), Term("実況", "じっきょう"), Term("地合い", "じあい"), Term("成人病", "せいじんびょう"), Term("成約", "せいやく"), Term("成案", "せいあん"), Term("実効", "じっこう"), Term("持続的", "じぞくてき"), Term("得失", "とくしつ"), Term("上乗せ", "うわのせ"), Term("商学", "しょうがく"), Term("打力", "だりょく"), Term("打ち合い", "うちあい"), Term("町役場", "まちやくば"), Term("町議会", "ちょうぎかい"), Term("実弾", "じつだん"), Term("積み重ね", "つみかさね"), Term("球界", "きゅうかい"), Term("当たり役", "あたりやく"), Term("当確", "とうかく"), Term("実力行使", "じつりょくこうし"), Term("賞牌", "しょうはい"), Term("大役", "たいやく"), Term("大破", "たいは"), Term("大時代", "おおじだい"), Term("大義", "たいぎ"), Term("大震災", "だいしんさい"), Term("特別区", "とくべつく"), Term("特捜", "とくそう"), Term("押し入り", "おしいり"), Term("納金", "のうきん"), Term("寝泊まり", "ねとまり"), Term("心意気", "こころいき"), Term("養父母", "ようふぼ"), Term("象徴的", "しょうちょうてき"), Term("鳥獣", "ちょうじゅう"), Term("不問", "ふもん"), Term("長屋", "ながや"), Term("原潜", "げんせん"), Term("社団法人", "しゃだんほうじん"), Term("進攻", "しんこう"), Term("社名", "しゃめい"), Term("疑似", "ぎじ"), Term("乱売", "らんばい"), Term("本予算", "ほんよさん"), Term("聞き書き", "ききがき"), Term("竜王", "りゅうおう"), Term("陸海", "りくかい"), Term("全学", "ぜんがく"), Term("車体", "しゃたい"), Term("生命力", "せいめいりょく"), Term("蛇の目", "じゃのめ"), Term("乳幼児", "にゅうようじ"), Term("休館", "きゅうかん"), Term("借り入れ", "かりいれ"), Term("借地", "しゃくち"), Term("重点的", "じゅうてんてき"), Term("国賓", "こくひん"), Term("風物詩", "ふうぶつし"), Term("琢磨", "たくま"), Term("収まり", "おさまり"), Term("定休", "ていきゅう"), Term("弱体", "じゃくたい"), Term("遺児", "いじ"), Term("細かく", "こまかく"), Term("信金", "しんきん"), Term("主因", "しゅいん"), Term("身障者", "しんしょうしゃ"), Term("主幹", "しゅかん"), Term("世銀", "せぎん"), Term("主管", "しゅかん"), Term("千九百年代", "せんきゅうひゃくねんだい"), Term("体長", "たいちょう"), Term("奪三振", "だつさんしん"), Term("主義者", "しゅぎしゃ"), Term("中執", "ちゅうしつ"), Term("主計", "しゅけい"), Term("主計局", "しゅけいきょく"), Term("主査", "しゅさ"), Term("都議", "とぎ"), Term("整った", "ととのった"), Term("主戦", "しゅせん"), Term("蒸し", "むし"), Term("労相", "ろうしょう"), Term("断", "だん"), Term("主砲", "しゅほう"), Term("主力", "しゅりょく"), Term("住宅金融公庫", "じゅうたくきんゆうこうこ"), Term("三千", "さんぜん"), Term("医局", "いきょく"), Term("注意深い", "ちゅうい"), Term("閊える", "つかえる"), Term("各々", "おのおの"), Term("善くも", "よくも"), Term("仄めかす", "ほのめかす"), Term("卑劣", "ひれつ"), Term("極める", "きわめる"), Term("泥々", "どろどろ"), Term("目処", "めど"), Term("乾物", "かんぶつ"), Term("意気地", "いくじ"), Term("鰯", "いわし"), Term("擽る", "くすぐる"), Term("見す見す", "みすみす"), Term("丸まる", "まるまる"), Term("悪しからず", "あしからず"), Term("恩知らず", "おんしらず"), Term("悪女", "あくじょ"), Term("終着駅", "しゅうちゃくえき"), Term("にぎり寿司", "にぎりずし"), Term("幾日", "いくにち"), Term("凡人", "ぼんじん"), Term("避暑", "ひしょ"), Term("排他主義", "はいたしゅぎ"), Term("似顔絵", "にがおえ"), Term("恐る恐る", "おそるおそる"), Term("夏期", "かき"), Term("飢え死に", "うえじに"), Term("不毛", "ふもう"), Term("洋室", "ようしつ"), Term("真四角", "ましかく"), Term("身体", "しんたい"), Term("弱音", "よわね"), Term("名残惜しい", "なごりおしい"), Term("陸橋", "りっきょう"), Term("継ぎはぎ", "つぎはぎ"), Term("一向", "いっこう"), Term("逆上せる", "のぼせる"), Term("指切り", "ゆびきり"), Term("食い下がる", "くいさがる"), Term("一昔", "ひとむかし"), Term("戒める", "いましめる"), Term("憂える", "うれえる"), Term("鼻紙", "はながみ"), Term("楷書", "かいしょ"), Term("和式", "わしき"), Term("損する", "そんする"), Term("騰貴", "とうき"), Term("必読", "ひつどく"), Term("前略", "ぜんりゃく"), Term("明くる日", "あくるひ"), Term("鬘", "かつら"), Term("上せる", "のぼせる"), Term("乗ずる", "じょうずる"), Term("蒸かす", "ふかす"), Term("橙色", "だいだいいろ"), Term("朝礼", "ちょうれい"), Term("犇犇", "ひしひし"), Term("寝返る", "ねがえる"), Term("羽織", "はおり"), Term("深さ", "ふかさ"), Term("親愛", "しんあい"), Term("英気", "えいき"), Term("同列", "どうれつ"), Term("人道主義", "じんどうしゅぎ"), Term("一遍に", "いっぺんに"), Term("遠距離", "えんきょり"), Term("賞罰", "しょうばつ"), Term("横道", "よこみち"), Term("横文字", "よこもじ"), Term("石頭", "いしあたま"), Term("無色", "むしょく"), Term("音読み", "おんよみ"), Term("陶酔", "とうすい"), Term("鈍間", "のろま"), Term("餡こ", "あんこ"), Term("積立", "つみたて"), Term("土足", "どそく"), Term("何気なく", "なにげなく"), Term("直進", "ちょくしん"), Term("怪奇", "かいき"), Term("前書き", "まえがき"), Term("訓読み", "くんよみ"), Term("粗大", "そだい"), Term("早引け", "はやびけ"), Term("相関", "そうかん"), Term("画数", "かくすう"), Term("身寄り", "みより"), Term("解熱", "げねつ"), Term("父兄", "ふけい"), Term("多", "た"), Term("多湿", "たしつ"), Term("退避", "たいひ"), Term("大盛り", "おおもり"), Term("各位", "かくい"), Term("肌色", "はだいろ"), Term("洗面", "せんめん"), Term("学割", "がくわり"), Term("中産階級", "ちゅうさんかいきゅう"), Term("仲買", "なかがい"), Term("兆", "ちょう"), Term("寒冷", "かんれい"), Term("推敲", "すいこう"), Term("感化", "かんか"), Term("直列", "ちょくれつ"), Term("陳腐", "ちんぷ"), Term("追い抜く", "おいぬく"), Term("看る", "みる"), Term("物陰", "ものかげ"), Term("適齢期", "てきれいき"), Term("添加", "てんか"), Term("願わくは", "ねがわくは"), Term("縦書き", "たてがき"), Term("土間", "どま"), Term("達筆", "たっぴつ"), Term("横書き", "よこがき"), Term("寄り集まる", "よりあつまる"), Term("既製", "きせい"), Term("抱っこ", "だっこ"), Term("動もすれば", "ややもすれば"), Term("他面", "ためん"), Term("同音", "どうおん"), Term("気心", "きごころ"), Term("同上", "どうじょう"), Term("督促", "とくそく"), Term("毒薬", "どくやく"), Term("反日", "はんにち"), Term("和語", "わご"), Term("内職", "ないしょく"), Term("難易", "なんい"), Term("寝息", "ねいき"), Term("興す", "おこす"), Term("入籍", "にゅうせき"), Term("図示", "ずし"), Term("能動的", "のうどうてき"), Term("排日", "はいにち"), Term("巨視的", "きょしてき"), Term("虚無", "きょむ"), Term("剥ける", "むける"), Term("博愛", "はくあい"), Term("反作用", "はんさよう"), Term("反射的", "はんしゃてき"), Term("花婿", "はなむこ"), Term("美化", "びか"), Term("筆記試験", "ひっきしけん"), Term("表彰状", "ひょうしょうじょう"), Term("一風", "いっぷう"), Term("頻発", "ひんぱつ"), Term("禁句", "きんく"), Term("不孝", "ふこう"), Term("名著", "めいちょ"), Term("婦女", "ふじょ"), Term("府庁", "ふちょう"), Term("銀紙", "ぎんがみ"), Term("比喩", "ひゆ"), Term("風下", "かざしも"), Term("苦笑い", "にがわらい"), Term("分からず屋", "わからずや"), Term("頼りない", "たよりない"), Term("字画", "じかく"), Term("脇見", "わきみ"), Term("風流", "ふうりゅう"), Term("盆踊り", "ぼんおどり"), Term("失敬", "しっけい"), Term("月初め", "つきはじめ"), Term("朝顔", "あさがお"), Term("顔なじみ", "かおなじみ"), Term("雨垂れ", "あまだれ"), Term("未納", "みのう"), Term("魅惑", "みわく"), Term("無形", "むけい"), Term("無法", "むほう"), Term("洋間", "ようま"), Term("養老院", "ようろういん"), Term("理系", "りけい"), Term("立ち読み", "たちよみ"), Term("後書き", "あとがき"), Term("臨終", "りんじゅう"), Term("話し込む", "はなしこむ"), Term("咄嗟に", "とっさに"), Term("掟", "おきて"), Term("旁", "つくり"), Term("舅", "しゅうと"), Term("茣蓙", "ござ"), Term("口止め", "くちどめ"), Term("下唇", "したくちびる"), Term("碁会所", "ごかいじょ"), Term("空地", "くうち"), Term("力む", "りきむ"), Term("脱衣所", "だついじょ"), Term("二人前", "ふたりまえ"), Term("謹慎", "きんしん"), Term("富者", "ふしゃ"), Term("保養所", "ほようじょ"), Term("預かり所", "あずかりじょ"), Term("螺旋", "らせん"), Term("老若", "ろうにゃく"), Term("鯵", "あじ"), Term("備考", "びこう"), Term("置物", "おきもの"), Term("押し売り", "おしうり"), Term("お神輿", "おみこし"), Term("拡声機", "かくせいき"), Term("刻一刻", "こくいっこく"), Term("木枯らし", "こがらし"), Term("主唱", "しゅしょう"), Term("消灯", "しょうとう"), Term("暈ける", "ぼける"), Term("潤色", "じゅんしょく"), Term("順々に", "じゅんじゅんに"), Term("退廃", "たいはい"), Term("炊き出し", "たきだし"), Term("根掘り葉掘り", "ねほりはほり"), Term("包み紙", "つつみがみ"), Term("艶々", "つやつや"), Term("左遷", "させん"), Term("手応え", "てごたえ"), Term("執る", "とる"), Term("乗り越し", "のりこし"), Term("店開き", "みせびらき"), Term("食み出す", "はみだす"), Term("煩忙", "はんぼう"), Term("僻み", "ひがみ"), Term("必至", "ひっし"), Term("雲雀", "ひばり"), Term("表札", "ひょうさつ"), Term("無精", "ぶしょう"), Term("巻尺", "まきじゃく"), Term("歳末", "さいまつ"), Term("見届ける", "みとどける"), Term("見習い", "みならい"), Term("僻む", "ひがむ"), Term("粘着", "ねんちゃく"), Term("物干し", "ものほし"), Term("細長い", "ほそながい"), Term("菜食", "さいしょく"), Term("低音", "ていおん"), Term("把", "わ"), Term("薄まる", "うすまる"), Term("謳う", "うたう"), Term("風上", "かざかみ"), Term("禁欲的", "きんよくてき"), Term("下がり", "さがり"), Term("知らず知らず", "しらずしらず"), Term("節句", "せっく"), Term("草食", "そうしょく"), Term("蕎麦屋", "そばや"), Term("退廃的", "たいはいてき"), Term("脱衣", "だつい"), Term("縮み", "ちぢみ"), Term("投射", "とうしゃ"), Term("立て札", "たてふだ"), Term("どの辺", "どのへん"), Term("惚ける", "とぼける"), Term("泣き顔", "なきがお"), Term("逃げ足", "にげあし"), Term("寝相", "ねぞう"), Term("恥さらし", "はじさらし"), Term("末期的", "まっきてき"), Term("認め印", "みとめいん"), Term("明年", "みょうねん"), Term("無性に", "むしょうに"), Term("無心", "むしん"), Term("無生物", "むせいぶつ"), Term("無恥", "むち"), Term("目玉商品", "めだましょうひん"), Term("隣り合わせ", "となりあわせ"), Term("間に合わせ", "まにあわせ"), Term("行けません", "いけません"), Term("やり切れない", "やりきれない"), Term("思い上がる", "おもいあがる"), Term("弁済", "べんさい"), Term("時雨", "しぐれ"), Term("私費", "しひ"), Term("歯痒い", "はがゆい"), Term("似せる", "にせる"), Term("親不孝", "おやふこう"), Term("次女", "じじょ"), Term("次男", "じなん"), Term("気まま", "きまま"), Term("煮込む", "にこむ"), Term("寝冷え", "ねびえ"), Term("方が良い", "ほうがよい"), Term("っ放し", "っぱなし"), Term("どの様", "どのよう"), Term("本題", "ほんだい"), Term("事が無い", "ことがない"), Term("お詫び", "おわび"), Term("拉致問題", "らちもんだい"), Term("錬金術師", "れんきんじゅつし"), Term("紹介文", "しょうかいぶん"), Term("彼奴ら", "あいつら"), Term("就活", "しゅうかつ"), Term("気触れ", "かぶれ"), Term("此奴ら", "こいつら"), Term("揺らぎ", "ゆらぎ"), Term("対中", "たいちゅう"), Term("旅行券", "りょこうけん"), Term("１００均", "きん"), Term("世界各地", "せかいかくち"), Term("現代社会", "げんだいしゃかい"), Term("細胞内", "さいぼうない"), Term("急性期", "きゅうせいき"), Term("開始時刻", "かいしじこく"), Term("早期治療", "そうきちりょう"), Term("無力感", "むりょくかん"), Term("初売り", "はつうり"), Term("最新情報", "さいしんじょうほう"), Term("最新研究", "さいしんけんきゅう"), Term("気象予報士", "きしょうよほうし"), Term("自己管理", "じこかんり"), Term("統一感", "とういつかん"), Term("研究結果", "けんきゅうけっか"), Term("約束通り", "やくそくどおり"), Term("新概念", "しんがいねん"), Term("日本社会", "にほんしゃかい"), Term("設定可能", "せっていかのう"), Term("相互交流", "そうごこうりゅう"), Term("駄菓子屋", "だがしや"), Term("仕事始め", "しごとはじめ"), Term("捜査官", "そうさかん"), Term("販売員", "はんばいいん"), Term("最後尾", "さいこうび"), Term("日本政府", "にほんせいふ"), Term("幼少期", "ようしょうき"), Term("演技力", "えんぎりょく"), Term("に際して", "にさいして"), Term("大っきい", "おっきい"), Term("受付中", "うけつけちゅう"), Term("学校名", "がっこうめい"), Term("大募集", "だいぼしゅう"), Term("盛り付け", "もりつけ"), Term("種類豊富", "しゅるいほうふ"), Term("伝統文化", "でんとうぶんか"), Term("日本全国", "にほんぜんこく"), Term("大学進学", "だいがくしんがく"), Term("口座番号", "こうざばんごう"), Term("満員電車", "まんいんでんしゃ"), Term("日本企業", "にほんきぎょう"), Term("意識調査", "いしきちょうさ"), Term("学会誌", "がっかいし"), Term("海外出張", "かいがいしゅっちょう"), Term("基本料金", "きほんりょうきん"), Term("世界各国", "せかいかっこく"), Term("嫌悪感", "けんおかん"), Term("国内旅行", "こくないりょこう"), Term("最新鋭", "さいしんえい"), Term("洗浄剤", "せんじょうざい"), Term("疑問点", "ぎもんてん"), Term("安住", "あんじゅう"), Term("広島", "ひろしま"), Term("無修正", "むしゅうせい"), Term("初挑戦", "はつちょうせん"), Term("為さい", "なさい"), Term("事例集", "じれいしゅう"), Term("何処にもない", "どこにもない"), Term("正式名称", "せいしきめいしょう"), Term("電池切れ", "でんちぎれ"), Term("是非是非", "ぜひぜひ"), Term("授業参観", "じゅぎょうさんかん"), Term("失敗談", "しっぱいだん"), Term("除菌", "じょきん"), Term("よくあるご質問", "よくあるごしつもん"), Term("低料金", "ていりょうきん"), Term("出金", "しゅっきん"), Term("あり合わせ", "ありあわせ"), Term("物販", "ぶっぱん"), Term("光学式文字認識", "こうがくしきもじにんしき"), Term("表計算", "ひょうけいさん"), Term("し続ける", "しつづける"), Term("推奨環境", "すいしょうかんきょう"), Term("愛す", "あいす"), Term("ＤＶＤプレーヤー", "プレーヤー"), Term("ＪＲ", ""), Term("毀損", "きそん"), Term("老人福祉", "ろうじんふくし"), Term("に従って", "にしたがって"), Term("昔のまま", "むかしのまま"), Term("期間限定", "きかんげんてい"), Term("ＵＳＡ", ""), Term("酷く", "ひどく"), Term("長崎", "ながさき"), Term("鎌倉", "かまくら"), Term("そうこうしている内に", "そうこうしているうちに"), Term("街づくり", "まちづくり"), Term("実際は", "じっさいは"), Term("貼付", "ちょうふ"), Term("土日", "どにち"), Term("数年前", "すうねんまえ"), Term("何とも言えない", "なんともいえない"), Term("絞り込む", "しぼりこむ"), Term("進捗", "しんちょく"), Term("お一人様", "おひとりさま"), Term("お話", "おはなし"), Term("消耗品", "しょうもうひん"), Term("お買い得", "おかいどく"), Term("証明書", "しょうめいしょ"), Term("充填", "じゅうてん"), Term("あの人", "あのひと"), Term("発症", "はっしょう"), Term("驚くほど", "おどろくほど"), Term("金がない", "かねがない"), Term("売れ筋", "うれすじ"), Term("大事件", "だいじけん"), Term("新発売", "しんはつばい"), Term("厨房", "ちゅうぼう"), Term("新成人", "しんせいじん"), Term("生産者", "せいさんしゃ"), Term("前夜祭", "ぜんやさい"), Term("何度でも", "なんどでも"), Term("真っ当", "まっとう"), Term("Ｔバック", "バック"), Term("惣菜", "そうざい"), Term("多用", "たよう"), Term("安眠", "あんみん"), Term("叩き", "たたき"), Term("単身赴任", "たんしんふにん"), Term("払拭", "ふっしょく"), Term("市営地下鉄", "しえいちかてつ"), Term("全体的", "ぜんたいてき"), Term("登録商標", "とうろくしょうひょう"), Term("気づかれ", "きづかれ"), Term("ＣＭ", ""), Term("日本製", "にほんせい"), Term("別途", "べっと"), Term("みじん切り", "みじんぎり"), Term("斤量", "きんりょう"), Term("一安心", "ひとあんしん"), Term("大人っぽい", "おとなっぽい"), Term("仕出し", "しだし"), Term("保証金", "ほしょうきん"), Term("閉塞", "へいそく"), Term("ＧＵＩ", ""), Term("瑠璃", "るり"), Term("冷え性", "ひえしょう"), Term("老若男女", "ろうにゃくなんにょ"), Term("鍼灸", "しんきゅう"), Term("商品名", "しょうひんめい"), Term("萌芽", "ほうが"), Term("分かり悪い", "わかりにくい"), Term("炸裂", "さくれつ"), Term("怒涛", "どとう"), Term("戸籍謄本", "こせきとうほん"), Term("歯ごたえ", "はごたえ"), Term("絵文字", "えもじ"), Term("狩場", "かりば"), Term("見た所", "みたところ"), Term("自動化", "じどうか"), Term("仙台", "せんだい"), Term("筐体", "きょうたい"), Term("豊胸", "ほうきょう"), Term("浜松", "はままつ"), Term("日焼け止め", "ひやけどめ"), Term("必須条件", "ひっすじょうけん"), Term("狭間", "はざま"), Term("痩身", "そうしん"), Term("食べ歩き", "たべあるき"), Term("気の向くままに", "きのむくままに"), Term("ほんの少し", "ほんのすこし"), Term("登録者", "とうろくしゃ"), Term("登録番号", "とうろくばんごう"), Term("猶太", "ユダヤ"), Term("紐育", "ニューヨーク"), Term("ＲＯＭ", ""), Term("突尼斯", "チュニジア"), Term("和地関", "バチカン"), Term("烏克蘭", "ウクライナ"), Term("瓦無", "グアム"), Term("宇柳貝", "ウルグアイ"), Term("以色列", "イスラエル"), Term("科威都", "クウェート"), Term("厄瓜多", "エクアドル"), Term("牙買加", "ジャマイカ"), Term("勃牙利", "ブルガリア"), Term("ＤＯＳ", ""), Term("Ｓ", ""), Term("尼加拉瓦", "ニカラグア"), Term("ＦＭ", ""), Term("巴基斯担", "パキスタン"), Term("ＪＩＳ", ""), Term("ＡＳＣＩＩ", ""), Term("白耳曼", "ゲルマン"), Term("加答児", "カタル"), Term("叙利亜", "シリア"), Term("ＧＩ", ""), Term("ＪＥＴＲＯ", ""), Term("馬来西亜", "マレーシア"), Term("沈菜", "キムチ"), Term("ＭｉＧ", ""), Term("摩洛哥", "モロッコ"), Term("ＵＮＩＣＥＦ", ""), Term("塞爾維", "セルビア"), Term("蘇維埃", "ソビエト"), Term("利比利亜", "リベリア"), Term("利比亜", "リビア"), Term("印度支那", "インドシナ"), Term("黎巴嫩", "レバノン"), Term("印度尼西亜", "インドネシア"), Term("乱伐", "らんばつ"), Term("国電", "こくでん"), Term("もの", "もの"), Term("ば", "ば"), Term("ところを", "ところを"), Term("すら", "すら"), Term("だの", "だの"), Term("山野", "さんや"), Term("電源開発", "でんげんかいはつ"), Term("トレジャー", "トレジャー"), Term("酎ハイ", "ちゅうハイハイ"), Term("とろ", "とろ"), Term("カトリック教会", "カトリックきょうかい"), Term("カスピ海", "カスピかい"), Term("メキシコ湾", "メキシコわん"), Term("華府", "ワシントン"), Term("莫斯科", "モスクワ"), Term("ガール", "ガール"), Term("クルーズ", "クルーズ"), Term("テルアビブ", "テルアビブ"), Term("エルサルバドル", "エルサルバドル"), Term("コロナ", "コロナ"), Term("グリニッジ", "グリニッジ"), Term("ストックホルム", "ストックホルム"), Term("テヘラン", "テヘラン"), Term("トーキー", "トーキー"), Term("ケルン", "ケルン"), Term("トール", "トール"), Term("トマホーク", "トマホーク"), Term("トラップ", "トラップ"), Term("トランス", "トランス"), Term("エストニア", "エストニア"), Term("コスタリカ", "コスタリカ"), Term("コニャック", "コニャック"), Term("ナミビア", "ナミビア"), Term("コバルト", "コバルト"), Term("エディンバラ", "エディンバラ"), Term("コラール", "コラール"), Term("エメラルド", "エメラルド"), Term("ノーマル", "ノーマル"), Term("コロン", "コロン"), Term("コンゴ", "コンゴ"), Term("ハーレム", "ハーレム"), Term("ハイランド", "ハイランド"), Term("ハロー", "ハロー"), Term("バール", "バール"), Term("バスク", "バスク"), Term("バンコク", "バンコク"), Term("バルセロナ", "バルセロナ"), Term("バルト", "バルト"), Term("パーラー", "パーラー"), Term("オセアニア", "オセアニア"), Term("プラハ", "プラハ"), Term("パレスチナ", "パレスチナ"), Term("ベオグラード", "ベオグラード"), Term("サンノゼ", "サンノゼ"), Term("ピアス", "ピアス"), Term("カーディガン", "カーディガン"), Term("フィラデルフィア", "フィラデルフィア"), Term("ブリスベン", "ブリスベン"), Term("ブレスト", "ブレスト"), Term("カブ", "カブ"), Term("プレトリア", "プレトリア"), Term("カラチ", "カラチ"), Term("ジパング", "ジパング"), Term("ヘル", "ヘル"), Term("コスモス", "コスモス"), Term("カルデラ", "カルデラ"), Term("ベイルート", "ベイルート"), Term("ベルファスト", "ベルファスト"), Term("カロライナ", "カロライナ"), Term("ペンタゴン", "ペンタゴン"), Term("パース", "パース"), Term("ボー", "ボー"), Term("ガイ", "ガイ"), Term("ボーン", "ボーン"), Term("ボツワナ", "ボツワナ"), Term("ボン", "ボン"), Term("ボンド", "ボンド"), Term("アルト", "アルト"), Term("ポリネシア", "ポリネシア"), Term("マケドニア", "マケドニア"), Term("マドンナ", "マドンナ"), Term("マンガン", "マンガン"), Term("マンチェスター", "マンチェスター"), Term("ミール", "ミール"), Term("ミクロネシア", "ミクロネシア"), Term("スヌーピー", "スヌーピー"), Term("ミャンマー", "ミャンマー"), Term("ミュンヘン", "ミュンヘン"), Term("ミルウォーキー", "ミルウォーキー"), Term("スプリット", "スプリット"), Term("ムーラン", "ムーラン"), Term("メガ", "メガ"), Term("メス", "メス"), Term("メソポタミア", "メソポタミア"), Term("メタン", "メタン"), Term("メルボルン", "メルボルン"), Term("ポリ", "ポリ"), Term("モーゼル", "モーゼル"), Term("モザンビーク", "モザンビーク"), Term("キャンベラ", "キャンベラ"), Term("スロバキア", "スロバキア"), Term("モルドバ", "モルドバ"), Term("モンテカルロ", "モンテカルロ"), Term("ユートピア", "ユートピア"), Term("セダン", "セダン"), Term("ユニバーサル", "ユニバーサル"), Term("ライ", "ライ"), Term("カルガリー", "カルガリー"), Term("ヒンジ", "ヒンジ"), Term("ランド", "ランド"), Term("グール", "グール"), Term("リトアニア", "リトアニア"), Term("タンザニア", "タンザニア"), Term("ルーブル", "ルーブル"), Term("ルビー", "ルビー"), Term("チェコ", "チェコ"), Term("ローム", "ローム"), Term("ブリュッセル", "ブリュッセル"), Term("ローレル", "ローレル"), Term("ロデオ", "ロデオ"), Term("チャールストン", "チャールストン"), Term("方がまし", ""), Term("そんだけ", "そんだけ"), Term("棺", "かん"), Term("新日本製鐵", "しんにっぽんせいてつ"), Term("天然ガス", "てんねんガスガス"), Term("笠", "かさ"), Term("浮き", "うき"), Term("水上", "すいじょう"), Term("塩田", "えんでん"), Term("花王", "かおう"), Term("中原", "ちゅうげん"), Term("猪", "いのしし"), Term("塚", "つか"), Term("二宮", "にぐう"), Term("白樺", "しらかば"), Term("発泡スチロール", "はっぽうスチロールスチロール"), Term("九九", "くく"), Term("粉ミルク", "こなミルクミルク"), Term("平方キロメートル", "へいほうキロメートルキロメートル"), Term("人間ドック", "にんげんドックドック"), Term("保健所", "ほけんじょ"), Term("麻布", "あさぬの"), Term("万里", "ばんり"), Term("口コミ", "くちコミコミ"), Term("女形", "おんながた"), Term("墓石", "ぼせき"), Term("骨髄", "こつずい"), Term("紅", "くれない"), Term("花道", "はなみち"), Term("三重", "さんじゅう"), Term("珊瑚礁", "サンゴしょう"), Term("緑化", "りょっか"), Term("立方メートル", "りっぽうメートルメートル"), Term("資源エネルギー庁", "しげんエネルギーちょうエネルギーーちょう"), Term("築地", "ついじ"), Term("輪ゴム", "わゴムゴム"), Term("ウィークエンド", "ウィークエンド"), Term("マクロ", "マクロ"), Term("都市ガス", "としガスガス"), Term("ドクター", "ドクター"), Term("ドット", "ドット"), Term("ネオン", "ネオン"), Term("ハードウェア", "ハードウェア"), Term("コンプレックス", "コンプレックス"), Term("豚カツ", "とんカツカツ"), Term("排気ガス", "はいきガスガス"), Term("白バイ", "しろバイバイ"), Term("シンポジウム", "シンポジウム"), Term("プロテスタント", "プロテスタント"), Term("ガード", "ガード"), Term("昆布", "こんぶ"), Term("扇形", "おうぎがた"), Term("涼風", "りょうふう"), Term("マンホール", "マンホール"), Term("ミックス", "ミックス"), Term("キャッシュカード", "キャッシュカード"), Term("勅", "ちょく"), Term("モノ", "モノ"), Term("シャンソン", "シャンソン"), Term("プロ野球", "プロやきゅう"), Term("小文字", "こもじ"), Term("テイクアウト", "テイクアウト"), Term("ファンサイト", "ファンサイト"), Term("ネイチャー", "ネイチャー"), Term("ネイル", "ネイル"), Term("イナバウアー", "イナバウアー"), Term("サプライズ", "サプライズ"), Term("グループホーム", "グループホーム"), Term("缶コーヒー", "かんコーヒーコーヒー"), Term("ワンセグ", "ワンセグ"), Term("ポッドキャスト", "ポッドキャスト"), Term("スパム", "スパム"), Term("地理情報システム", "ちりじょうほうシステムシステム"), Term("フランス料理", "フランスりょうり"), Term("ウェディングドレス", "ウェディングドレス"), Term("ビーチサンダル", "ビーチサンダル"), Term("データ通信", "データつうしん"), Term("メモ帳", "メモちょう"), Term("エイプリルフール", "エイプリルフール"), Term("垂れ", "たれ"), Term("ロイヤリティ", "ロイヤリティ"), Term("コスプレ", "コスプレ"), Term("ネイビー", "ネイビー"), Term("ハンセン病", "ハンセンびょう"), Term("ダウ平均株価", "ダウへいきんかぶか"), Term("オーダーメイド", "オーダーメイド"), Term("バベルの塔", "バベルのとう"), Term("アイコン", "アイコン"), Term("セイバー", "セイバー"), Term("シーア派", "シーアは"), Term("ファック", "ファック"), Term("フェラチオ", "フェラチオ"), Term("シュルレアリスム", "シュルレアリスム"), Term("アミノ酸", "アミノさん"), Term("ミドル級", "ミドルきゅう"), Term("スピードウェイ", "スピードウェイ"), Term("ミューズ", "ミューズ"), Term("メート", "メート"), Term("メモリカード", "メモリカード"), Term("セーラー服", "セーラーふく"), Term("ウォール街", "ウォールがい"), Term("ドラム缶", "ドラムかん"), Term("バンタム級", "バンタムきゅう"), Term("ビー玉", "ビーだま"), Term("マルクス主義", "マルクスしゅぎ"), Term("ユダヤ教", "ユダヤきょう"), Term("リーグ戦", "リーグせん"), Term("デボン紀", "デボンき"), Term("オレンジ色", "オレンジいろ"), Term("リメーク", "リメーク"), Term("湧水", "ゆうすい"), Term("ロング", "ロング"), Term("サード", "サード"), Term("フック", "フック"), Term("メシア", "メシア"), Term("ロフト", "ロフト"), Term("ロマンス", "ロマンス"), Term("カラード", "カラード"), Term("クルド", "クルド"), Term("フリーダム", "フリーダム"), Term("チャット", "チャット"), Term("アンサンブル", "アンサンブル"), Term("クレー", "クレー"), Term("ワークショップ", "ワークショップ"), Term("プレーボール", "プレーボール"), Term("ワークステーション", "ワークステーション"), Term("ワイパー", "ワイパー"), Term("クレープ", "クレープ"), Term("チューター", "チューター"), Term("チューナー", "チューナー"), Term("ワコール", "ワコール"), Term("ワラビー", "ワラビー"), Term("チョーキング", "チョーキング"), Term("クラフト", "クラフト"), Term("チルダ", "チルダ"), Term("ツナ", "ツナ"), Term("クローク", "クローク"), Term("クローズ", "クローズ"), Term("クロスカントリー", "クロスカントリー"), Term("ティー", "ティー"), Term("クロック", "クロック"), Term("ティンパニ", "ティンパニ"), Term("テクスチャ", "テクスチャ"), Term("クロム", "クロム"), Term("クロレラ", "クロレラ"), Term("テトラクロロエチレン", "テトラクロロエチレン"), Term("グアテマラ", "グアテマラ"), Term("テノール", "テノール"), Term("テリトリー", "テリトリー"), Term("テレコム", "テレコム"), Term("ハードカバー", "ハードカバー"), Term("リマ", "リマ"), Term("ウェー", "ウェー"), Term("グラタン", "グラタン"), Term("ウェブ", "ウェブ"), Term("グラデーション", "グラデーション"), Term("ウエーブ", "ウエーブ"), Term("テン", "テン"), Term("ベストテン", "ベストテン"), Term("テンペラ", "テンペラ"), Term("トゥルー", "トゥルー"), Term("グラミー", "グラミー"), Term("ログ", "ログ"), Term("ランダム", "ランダム"), Term("グランデ", "グランデ"), Term("ディスクジョッキー", "ディスクジョッキー"), Term("オカルト", "オカルト"), Term("ディスクロージャー", "ディスクロージャー"), Term("シビック", "シビック"), Term("ウォークマン", "ウォークマン"), Term("グリコーゲン", "グリコーゲン"), Term("ゴージャス", "ゴージャス"), Term("ドッグファイト", "ドッグファイト"), Term("ウォン", "ウォン"), Term("ディレクター", "ディレクター"), Term("グリル", "グリル"), Term("ディレクトリ", "ディレクトリ"), Term("グルー", "グルー"), Term("ディンギー", "ディンギー"), Term("デタント", "デタント"), Term("モデルガン", "モデルガン"), Term("デッド", "デッド"), Term("デニール", "デニール"), Term("サリン", "サリン"), Term("デニム", "デニム"), Term("ヒッチハイク", "ヒッチハイク"), Term("デバイス", "デバイス"), Term("リバウンド", "リバウンド"), Term("デビスカップ", "デビスカップ"), Term("ウルフ", "ウルフ"), Term("グロリア", "グロリア"), Term("エンブレム", "エンブレム"), Term("デベロッパー", "デベロッパー"), Term("エージェンシー", "エージェンシー"), Term("ケージ", "ケージ"), Term("トーク", "トーク"), Term("エアバッグ", "エアバッグ"), Term("トーラス", "トーラス"), Term("ケロイド", "ケロイド"), Term("ゲージ", "ゲージ"), Term("ゲートボール", "ゲートボール"), Term("トタン", "トタン"), Term("トッパー", "トッパー"), Term("ゲームセンター", "ゲームセンター"), Term("トップレス", "トップレス"), Term("ゲシュタポ", "ゲシュタポ"), Term("トライアスロン", "トライアスロン"), Term("ゲットー", "ゲットー"), Term("トライアングル", "トライアングル"), Term("ゲノム", "ゲノム"), Term("トラスト", "トラスト"), Term("コーキング", "コーキング"), Term("トランクス", "トランクス"), Term("トランジット", "トランジット"), Term("コースター", "コースター"), Term("トランスポンダー", "トランスポンダー"), Term("エクステンション", "エクステンション"), Term("トリウム", "トリウム"), Term("チャーハン", "チャーハン"), Term("トリオ", "トリオ"), Term("トリガー", "トリガー"), Term("トリクロロエチレン", "トリクロロエチレン"), Term("コーディネーター", "コーディネーター"), Term("トリニトロトルエン", "トリニトロトルエン"), Term("ボブスレー", "ボブスレー"), Term("トリプル", "トリプル"), Term("トルエン", "トルエン"), Term("トルク", "トルク"), Term("トレース", "トレース"), Term("エコノミスト", "エコノミスト"), Term("トレンチコート", "トレンチコート"), Term("トロール", "トロール"), Term("コーポレーション", "コーポレーション"), Term("トロンボーン", "トロンボーン"), Term("コーラン", "コーラン"), Term("ドーピング", "ドーピング"), Term("エスコート", "エスコート"), Term("コーン", "コーン"), Term("ドクトリン", "ドクトリン"), Term("エステート", "エステート"), Term("コーンスターチ", "コーンスターチ"), Term("ドッキング", "ドッキング"), Term("コアビタシオン", "コアビタシオン"), Term("ドッジボール", "ドッジボール"), Term("ドナー", "ドナー"), Term("エステティックサロン", "エステティックサロン"), Term("ドミノ", "ドミノ"), Term("ドリブル", "ドリブル"), Term("イレブン", "イレブン"), Term("ドリー", "ドリー"), Term("エストロゲン", "エストロゲン"), Term("ドン", "ドン"), Term("ドロー", "ドロー"), Term("エッジ", "エッジ"), Term("コスモ", "コスモ"), Term("コスモポリタン", "コスモポリタン"), Term("ナショナル", "ナショナル"), Term("ナショナルリーグ", "ナショナルリーグ"), Term("ナトリウム", "ナトリウム"), Term("エッチング", "エッチング"), Term("ナノ", "ナノ"), Term("ナフサ", "ナフサ"), Term("コバルトブルー", "コバルトブルー"), Term("コマ", "コマ"), Term("ニコチン", "ニコチン"), Term("ニック", "ニック"), Term("エデン", "エデン"), Term("コミッショナー", "コミッショナー"), Term("エナメル", "エナメル"), Term("コミッション", "コミッション"), Term("コミット", "コミット"), Term("ニュータウン", "ニュータウン"), Term("コミュニケ", "コミュニケ"), Term("トリップ", "トリップ"), Term("ニューメディア", "ニューメディア"), Term("エピック", "エピック"), Term("コラージュ", "コラージュ"), Term("ネオ", "ネオ"), Term("ネオナチ", "ネオナチ"), Term("ネッカチーフ", "ネッカチーフ"), Term("コル", "コル"), Term("コロイド", "コロイド"), Term("エリア", "エリア"), Term("ノーブル", "ノーブル"), Term("コロッケ", "コロッケ"), Term("ノエル", "ノエル"), Term("ノスタルジア", "ノスタルジア"), Term("ノズル", "ノズル"), Term("ノッカー", "ノッカー"), Term("ノット", "ノット"), Term("コンコース", "コンコース"), Term("エレクトリック", "エレクトリック"), Term("ハードトップ", "ハードトップ"), Term("ハーフ", "ハーフ"), Term("コンソーシアム", "コンソーシアム"), Term("コンダクター", "コンダクター"), Term("ハイビジョン", "ハイビジョン"), Term("コンチネンタル", "コンチネンタル"), Term("ハイム", "ハイム"), Term("コンテ", "コンテ"), Term("ハイライト", "ハイライト"), Term("コンテナ", "コンテナ"), Term("エンタープライズ", "エンタープライズ"), Term("ハウ", "ハウ"), Term("ハウジング", "ハウジング"), Term("ハッチ", "ハッチ"), Term("コンデンサー", "コンデンサー"), Term("エンド", "エンド"), Term("エンドレス", "エンドレス"), Term("コントラ", "コントラ"), Term("ハプニング", "ハプニング"), Term("コントラバス", "コントラバス"), Term("コントローラー", "コントローラー"), Term("ハロン", "ハロン"), Term("ハング", "ハング"), Term("オークス", "オークス"), Term("ハングル", "ハングル"), Term("クラッシュ", "クラッシュ"), Term("オーソドックス", "オーソドックス"), Term("コンビ", "コンビ"), Term("コンビナート", "コンビナート"), Term("バーコード", "バーコード"), Term("コンフィギュレーション", "コンフィギュレーション"), Term("バーディー", "バーディー"), Term("アーク", "アーク"), Term("バーナー", "バーナー"), Term("コンプレッサー", "コンプレッサー"), Term("コンベンション", "コンベンション"), Term("コンベンションセンター", "コンベンションセンター"), Term("バーレスク", "バーレスク"), Term("バイアスロン", "バイアスロン"), Term("オートクチュール", "オートクチュール"), Term("バイオ", "バイオ"), Term("コンポ", "コンポ"), Term("バイパス", "バイパス"), Term("バウムクーヘン", "バウムクーヘン"), Term("アーチ", "アーチ"), Term("バガボンド", "バガボンド"), Term("アーチェリー", "アーチェリー"), Term("バギー", "バギー"), Term("ゴールキーパー", "ゴールキーパー"), Term("ゴールデン", "ゴールデン"), Term("バタフライ", "バタフライ"), Term("バックアップ", "バックアップ"), Term("バックグラウンド", "バックグラウンド"), Term("バックスクリーン", "バックスクリーン"), Term("オーバーラップ", "オーバーラップ"), Term("アーバン", "アーバン"), Term("ゴッドファーザー", "ゴッドファーザー"), Term("バットマン", "バットマン"), Term("バラード", "バラード"), Term("バラエティー", "バラエティー"), Term("ゴング", "ゴング"), Term("バラック", "バラック"), Term("バリア", "バリア"), Term("バリカン", "バリカン"), Term("バリトン", "バリトン"), Term("サーチ", "サーチ"), Term("サーチライト", "サーチライト"), Term("バルブ", "バルブ"), Term("アーモンド", "アーモンド"), Term("オールマイティー", "オールマイティー"), Term("サーベイランス", "サーベイランス"), Term("パーカー", "パーカー"), Term("パーセプトロン", "パーセプトロン"), Term("サイ", "サイ"), Term("サイエンス", "サイエンス"), Term("オイディプス", "オイディプス"), Term("サイクロン", "サイクロン"), Term("パームボール", "パームボール"), Term("オカリナ", "オカリナ"), Term("サイドカー", "サイドカー"), Term("パイオニア", "パイオニア"), Term("サイロ", "サイロ"), Term("フュージョン", "フュージョン"), Term("パスカル", "パスカル"), Term("パステル", "パステル"), Term("パセリ", "パセリ"), Term("サクセス", "サクセス"), Term("サクソフォン", "サクソフォン"), Term("サスペンション", "サスペンション"), Term("パッド", "パッド"), Term("サッシ", "サッシ"), Term("パドック", "パドック"), Term("パドル", "パドル"), Term("パパイア", "パパイア"), Term("サドンデス", "サドンデス"), Term("パビリオン", "パビリオン"), Term("サバイバル", "サバイバル"), Term("オピニオンリーダー", "オピニオンリーダー"), Term("パラグライダー", "パラグライダー"), Term("パラシュート", "パラシュート"), Term("アイボリー", "アイボリー"), Term("サファイア", "サファイア"), Term("ピュア", "ピュア"), Term("パラボラアンテナ", "パラボラアンテナ"), Term("サファリラリー", "サファリラリー"), Term("パラリンピック", "パラリンピック"), Term("サブ", "サブ"), Term("パルサー", "パルサー"), Term("パルス", "パルス"), Term("サブタイトル", "サブタイトル"), Term("パルチザン", "パルチザン"), Term("オフサイド", "オフサイド"), Term("パルプ", "パルプ"), Term("サプライ", "サプライ"), Term("パレス", "パレス"), Term("パワーステアリング", "パワーステアリング"), Term("オフロード", "オフロード"), Term("パワフル", "パワフル"), Term("オブザーバ", "オブザーバ"), Term("パンチパーマ", "パンチパーマ"), Term("パント", "パント"), Term("オブラート", "オブラート"), Term("サム", "サム"), Term("サラウンド", "サラウンド"), Term("サラブレッド", "サラブレッド"), Term("ツーリング", "ツーリング"), Term("ヒッピー", "ヒッピー"), Term("サルーン", "サルーン"), Term("ヒューマニズム", "ヒューマニズム"), Term("オペレーション", "オペレーション"), Term("サルサ", "サルサ"), Term("サルバルサン", "サルバルサン"), Term("ビーカ", "ビーカ"), Term("ビーグル", "ビーグル"), Term("アコースティック", "アコースティック"), Term("オペレッタ", "オペレッタ"), Term("ビーズ", "ビーズ"), Term("ビーム", "ビーム"), Term("サンスクリット", "サンスクリット"), Term("ビオラ", "ビオラ"), Term("オムロン", "オムロン"), Term("サンダーバード", "サンダーバード"), Term("オラトリオ", "オラトリオ"), Term("オランウータン", "オランウータン"), Term("ビット", "ビット"), Term("ビビッド", "ビビッド"), Term("ビュー", "ビュー"), Term("ビューティフル", "ビューティフル"), Term("オリエンタリズム", "オリエンタリズム"), Term("ビューロー", "ビューロー"), Term("ビルボード", "ビルボード"), Term("ビレッジ", "ビレッジ"), Term("ビンゴ", "ビンゴ"), Term("サンプラー", "サンプラー"), Term("サンプリング", "サンプリング"), Term("アクティブ", "アクティブ"), Term("オリエンテーリング", "オリエンテーリング"), Term("サンボ", "サンボ"), Term("サンルーフ", "サンルーフ"), Term("ピコ", "ピコ"), Term("オリゴマー", "オリゴマー"), Term("ピッチ", "ピッチ"), Term("シーク", "シーク"), Term("ピット", "ピット"), Term("ピラニア", "ピラニア"), Term("ピラフ", "ピラフ"), Term("ピンセット", "ピンセット"), Term("フーガ", "フーガ"), Term("ファイター", "ファイター"), Term("ファイナル", "ファイナル"), Term("シーリング", "シーリング"), Term("シール", "シール"), Term("アコード", "アコード"), Term("オンエア", "オンエア"), Term("シーレン", "シーレン"), Term("ファクシミリ", "ファクシミリ"), Term("ファシリティー", "ファシリティー"), Term("アシスト", "アシスト"), Term("オンブズマン", "オンブズマン"), Term("ファッションショー", "ファッションショー"), Term("シェリー", "シェリー"), Term("ファンク", "ファンク"), Term("シェル", "シェル"), Term("ファンクラブ", "ファンクラブ"), Term("ファンタジー", "ファンタジー"), Term("シエスタ", "シエスタ"), Term("ファンデーション", "ファンデーション"), Term("ファントム", "ファントム"), Term("カースト", "カースト"), Term("ファンド", "ファンド"), Term("シオニズム", "シオニズム"), Term("カーソル", "カーソル"), Term("フィーダ", "フィーダ"), Term("フィードバック", "フィードバック"), Term("シクラメン", "シクラメン"), Term("カーチェイス", "カーチェイス"), Term("フィクサー", "フィクサー"), Term("シス", "シス"), Term("フィットネス", "フィットネス"), Term("シソーラス", "シソーラス"), Term("フィニッシュ", "フィニッシュ"), Term("フィヨルド", "フィヨルド"), Term("シックスナイン", "シックスナイン"), Term("フィン", "フィン"), Term("フェイク", "フェイク"), Term("シトロン", "シトロン"), Term("フェイント", "フェイント"), Term("アスリート", "アスリート"), Term("フェミニズム", "フェミニズム"), Term("シネマ", "シネマ"), Term("フェルト", "フェルト"), Term("フェレット", "フェレット"), Term("シノニム", "シノニム"), Term("フェローシップ", "フェローシップ"), Term("フェロモン", "フェロモン"), Term("シフォン", "シフォン"), Term("フェンシング", "フェンシング"), Term("フォーカス", "フォーカス"), Term("フォークボール", "フォークボール"), Term("シボレー", "シボレー"), Term("フォーチュン", "フォーチュン"), Term("シミーズ", "シミーズ"), Term("カーン", "カーン"), Term("フォーミュラカー", "フォーミュラカー"), Term("フォーメーション", "フォーメーション"), Term("フォーラム", "フォーラム"), Term("シャーベット", "シャーベット"), Term("フォアグラ", "フォアグラ"), Term("フォアマン", "フォアマン"), Term("フォックストロット", "フォックストロット"), Term("フォト", "フォト"), Term("フォン", "フォン"), Term("フライホイール", "フライホイール"), Term("フラメンコ", "フラメンコ"), Term("フランク", "フランク"), Term("フランチャイズ", "フランチャイズ"), Term("フリーキック", "フリーキック"), Term("フリースタイル", "フリースタイル"), Term("カジノ", "カジノ"), Term("カジュアル", "カジュアル"), Term("フリーランス", "フリーランス"), Term("フリゲート", "フリゲート"), Term("カステラ", "カステラ"), Term("フリップフロップ", "フリップフロップ"), Term("フレアー", "フレアー"), Term("フレックス", "フレックス"), Term("フレンチ", "フレンチ"), Term("フロー", "フロー"), Term("フロート", "フロート"), Term("フロック", "フロック"), Term("フロッピーディスク", "フロッピーディスク"), Term("カッター", "カッター"), Term("シュレッダー", "シュレッダー"), Term("フロンティア", "フロンティア"), Term("ショーツ", "ショーツ"), Term("ブーイング", "ブーイング"), Term("ブーケ", "ブーケ"), Term("ブール", "ブール"), Term("ショール", "ショール"), Term("ブタン", "ブタン"), Term("ブックメーカー", "ブックメーカー"), Term("ブッシュ", "ブッシュ"), Term("カテーテル", "カテーテル"), Term("ブラボー", "ブラボー"), Term("ブリーフ", "ブリーフ"), Term("フリッカー", "フリッカー"), Term("カトリシズム", "カトリシズム"), Term("シリコーン", "シリコーン"), Term("ブルセラ", "ブルセラ"), Term("カトレヤ", "カトレヤ"), Term("ブルペン", "ブルペン"), Term("シリンダー", "シリンダー"), Term("ブロイラー", "ブロイラー"), Term("フランスパン", "フランスパン"), Term("ブロマイド", "ブロマイド"), Term("アドレナリン", "アドレナリン"), Term("シンカー", "シンカー"), Term("シンガーソングライター", "シンガーソングライター"), Term("カフェイン", "カフェイン"), Term("プッシュ", "プッシュ"), Term("シンクタンク", "シンクタンク"), Term("プライムタイム", "プライムタイム"), Term("プラウダ", "プラウダ"), Term("プラカード", "プラカード"), Term("プラグ", "プラグ"), Term("シンジケート", "シンジケート"), Term("プラグマティズム", "プラグマティズム"), Term("シンセサイザー", "シンセサイザー"), Term("プラズマ", "プラズマ"), Term("プラネタリウム", "プラネタリウム"), Term("カプラー", "カプラー"), Term("アナログ", "アナログ"), Term("カマーバンド", "カマーバンド"), Term("プリンス", "プリンス"), Term("プリンセス", "プリンセス"), Term("プルトニウム", "プルトニウム"), Term("プレーオフ", "プレーオフ"), Term("ラグ", "ラグ"), Term("プレスリリース", "プレスリリース"), Term("プレタポルテ", "プレタポルテ"), Term("プレミアム", "プレミアム"), Term("プレリュード", "プレリュード"), Term("アニメーション", "アニメーション"), Term("カヤック", "カヤック"), Term("プロジェクター", "プロジェクター"), Term("ジェノサイド", "ジェノサイド"), Term("ジェンダー", "ジェンダー"), Term("プロパガンダ", "プロパガンダ"), Term("ジグソーパズル", "ジグソーパズル"), Term("プロパン", "プロパン"), Term("ジッポー", "ジッポー"), Term("プロモーション", "プロモーション"), Term("ジハード", "ジハード"), Term("プロモーター", "プロモーター"), Term("カリウム", "カリウム"), Term("ヘア", "ヘア"), Term("ヘクト", "ヘクト"), Term("ヘザー", "ヘザー"), Term("アフター", "アフター"), Term("カリスマ", "カリスマ"), Term("ヘッドコーチ", "ヘッドコーチ"), Term("ビッグバン", "ビッグバン"), Term("ジャージー", "ジャージー"), Term("ヘドロ", "ヘドロ"), Term("ヘム", "ヘム"), Term("ヘモグロビン", "ヘモグロビン"), Term("ジャイアント", "ジャイアント"), Term("ヘリウム", "ヘリウム"), Term("ジャイロスコープ", "ジャイロスコープ"), Term("ヘリポート", "ヘリポート"), Term("ジャスミン", "ジャスミン"), Term("ヘルパー", "ヘルパー"), Term("ヘレニズム", "ヘレニズム"), Term("ベーシック", "ベーシック"), Term("ベージュ", "ベージュ"), Term("カルテル", "カルテル"), Term("ジャパンカップ", "ジャパンカップ"), Term("ジャブ", "ジャブ"), Term("ベクター", "ベクター"), Term("ベクトル", "ベクトル"), Term("カルト", "カルト"), Term("ベタ", "ベタ"), Term("ベドウィン", "ベドウィン"), Term("カルメラ", "カルメラ"), Term("ジュークボックス", "ジュークボックス"), Term("ベビーブーム", "ベビーブーム"), Term("ベリーダンス", "ベリーダンス"), Term("ベルトコンベア", "ベルトコンベア"), Term("ベルモット", "ベルモット"), Term("ジュニア", "ジュニア"), Term("カレンシー", "カレンシー"), Term("ジュビリー", "ジュビリー"), Term("ジュラルミン", "ジュラルミン"), Term("カローラ", "カローラ"), Term("ペール", "ペール"), Term("カロチン", "カロチン"), Term("アメーバ", "アメーバ"), Term("ジョイ", "ジョイ"), Term("ペトリ", "ペトリ"), Term("ペナルティー", "ペナルティー"), Term("ペナント", "ペナント"), Term("アンチ", "アンチ"), Term("ジレンマ", "ジレンマ"), Term("ペプシン", "ペプシン"), Term("アメダス", "アメダス"), Term("ペンギン", "ペンギン"), Term("カンタータ", "カンタータ"), Term("スーパーバイザ", "スーパーバイザ"), Term("ホーン", "ホーン"), Term("アラカルト", "アラカルト"), Term("ホスピス", "ホスピス"), Term("ガーゼ", "ガーゼ"), Term("ホットライン", "ホットライン"), Term("ホルスター", "ホルスター"), Term("スカーレット", "スカーレット"), Term("ホルモン", "ホルモン"), Term("ホルン", "ホルン"), Term("ホログラフィ", "ホログラフィ"), Term("アリーナ", "アリーナ"), Term("ホロコースト", "ホロコースト"), Term("ホン", "ホン"), Term("スカンク", "スカンク"), Term("アリア", "アリア"), Term("ボーク", "ボーク"), Term("ボーダーライン", "ボーダーライン"), Term("ボートピープル", "ボートピープル"), Term("ボイジャー", "ボイジャー"), Term("ボイスレコーダー", "ボイスレコーダー"), Term("スクーター", "スクーター"), Term("スクープ", "スクープ"), Term("スクイズ", "スクイズ"), Term("ボトム", "ボトム"), Term("スクランブル", "スクランブル"), Term("スクリプター", "スクリプター"), Term("スケートリンク", "スケートリンク"), Term("ポータブル", "ポータブル"), Term("ガスマスク", "ガスマスク"), Term("スケール", "スケール"), Term("ポートフォリオ", "ポートフォリオ"), Term("スコーカー", "スコーカー"), Term("スコール", "スコール"), Term("ポタージュ", "ポタージュ"), Term("スコアボード", "スコアボード"), Term("ポップアート", "ポップアート"), Term("アルパイン", "アルパイン"), Term("ポテンシャル", "ポテンシャル"), Term("ポトフ", "ポトフ"), Term("ポプリ", "ポプリ"), Term("ポリエチレン", "ポリエチレン"), Term("スターター", "スターター"), Term("ポリス", "ポリス"), Term("ポリプロピレン", "ポリプロピレン"), Term("スターリングエンジン", "スターリングエンジン"), Term("ガメラン", "ガメラン"), Term("ポルカ", "ポルカ"), Term("スタイミー", "スタイミー"), Term("スタイリスト", "スタイリスト"), Term("ポンポン", "ポンポン"), Term("ガリウム", "ガリウム"), Term("マージン", "マージン"), Term("スタブ", "スタブ"), Term("スタンガン", "スタンガン"), Term("マイクロフィルム", "マイクロフィルム"), Term("スタンダード", "スタンダード"), Term("スタンプ", "スタンプ"), Term("マウンテン", "マウンテン"), Term("マウント", "マウント"), Term("マカロニ", "マカロニ"), Term("マグナム", "マグナム"), Term("マグマ", "マグマ"), Term("スティック", "スティック"), Term("キーホルダー", "キーホルダー"), Term("マスゲーム", "マスゲーム"), Term("ステルス", "ステルス"), Term("ステレオタイプ", "ステレオタイプ"), Term("ステロイド", "ステロイド"), Term("ステンドグラス", "ステンドグラス"), Term("マッキントッシュ", "マッキントッシュ"), Term("マッシュルーム", "マッシュルーム"), Term("マッチプレー", "マッチプレー"), Term("マットレス", "マットレス"), Term("マドレーヌ", "マドレーヌ"), Term("マニフェスト", "マニフェスト"), Term("アンソロジー", "アンソロジー"), Term("マネーサプライ", "マネーサプライ"), Term("キックオフ", "キックオフ"), Term("ストッパー", "ストッパー"), Term("キックボクシング", "キックボクシング"), Term("マラカス", "マラカス"), Term("マリーン", "マリーン"), Term("マリンスノー", "マリンスノー"), Term("マリンバ", "マリンバ"), Term("マルチメディア", "マルチメディア"), Term("マン", "マン"), Term("マングローブ", "マングローブ"), Term("ストリップ", "ストリップ"), Term("マント", "マント"), Term("マントル", "マントル"), Term("キネシオロジー", "キネシオロジー"), Term("ストレッチ", "ストレッチ"), Term("マンボ", "マンボ"), Term("スナッチ", "スナッチ"), Term("スニーカー", "スニーカー"), Term("アンフェア", "アンフェア"), Term("ミキサー", "ミキサー"), Term("スヌーカー", "スヌーカー"), Term("キメラ", "キメラ"), Term("キャスター", "キャスター"), Term("ミシュラン", "ミシュラン"), Term("スパーク", "スパーク"), Term("キャスト", "キャスト"), Term("スパーリング", "スパーリング"), Term("イラストレーター", "イラストレーター"), Term("キャッシュ", "キャッシュ"), Term("ミトコンドリア", "ミトコンドリア"), Term("スパッタリング", "スパッタリング"), Term("ミニチュア", "ミニチュア"), Term("スピン", "スピン"), Term("キャッツアイ", "キャッツアイ"), Term("ミント", "ミント"), Term("ムービー", "ムービー"), Term("キャバレー", "キャバレー"), Term("スプリンター", "スプリンター"), Term("スプリント", "スプリント"), Term("ムール", "ムール"), Term("ムラート", "ムラート"), Term("キャビン", "キャビン"), Term("スペシャリスト", "スペシャリスト"), Term("メカ", "メカ"), Term("スポーク", "スポーク"), Term("メガホン", "メガホン"), Term("メコンデルタ", "メコンデルタ"), Term("メソジスト", "メソジスト"), Term("イオン", "イオン"), Term("メゾソプラノ", "メゾソプラノ"), Term("メタノール", "メタノール"), Term("スポットライト", "スポットライト"), Term("メッカ", "メッカ"), Term("スポンジケーキ", "スポンジケーキ"), Term("メッセ", "メッセ"), Term("イスタンブール", "イスタンブール"), Term("キャラバン", "キャラバン"), Term("スマッシュ", "スマッシュ"), Term("メトロ", "メトロ"), Term("メトロノーム", "メトロノーム"), Term("キャリー", "キャリー"), Term("スモーカー", "スモーカー"), Term("メラニン", "メラニン"), Term("メリー", "メリー"), Term("スライディング", "スライディング"), Term("スラローム", "スラローム"), Term("メロドラマ", "メロドラマ"), Term("メンタルヘルス", "メンタルヘルス"), Term("モアレ", "モアレ"), Term("モスク", "モスク"), Term("モダニズム", "モダニズム"), Term("イニング", "イニング"), Term("スロベニア", "スロベニア"), Term("スワップ", "スワップ"), Term("モトクロス", "モトクロス"), Term("モニュメント", "モニュメント"), Term("キヤノン", "キヤノン"), Term("イノベーション", "イノベーション"), Term("ズーム", "ズーム"), Term("モノローグ", "モノローグ"), Term("モラトリアム", "モラトリアム"), Term("セーフ", "セーフ"), Term("キュリー", "キュリー"), Term("モルタル", "モルタル"), Term("イブニング", "イブニング"), Term("モンスーン", "モンスーン"), Term("モンタージュ", "モンタージュ"), Term("ヤマハ", "ヤマハ"), Term("キラー", "キラー"), Term("ヤンマ", "ヤンマ"), Term("ユーカラ", "ユーカラ"), Term("ユーカリ", "ユーカリ"), Term("ユーゴ", "ユーゴ"), Term("セシウム", "セシウム"), Term("キリル", "キリル"), Term("ユーノス", "ユーノス"), Term("セピア", "セピア"), Term("キンキーブーツ", "キンキーブーツ"), Term("ユニシス", "ユニシス"), Term("セミコロン", "セミコロン"), Term("ユニバーシアード", "ユニバーシアード"), Term("ヨーガ", "ヨーガ"), Term("ヨットハーバー", "ヨットハーバー"), Term("ギガ", "ギガ"), Term("セリフ", "セリフ"), Term("ラード", "ラード"), Term("セル", "セル"), Term("ライオンズクラブ", "ライオンズクラブ"), Term("セルロイド", "セルロイド"), Term("セレナーデ", "セレナーデ"), Term("ライダー", "ライダー"), Term("ライトバン", "ライトバン"), Term("ライド", "ライド"), Term("セロハンテープ", "セロハンテープ"), Term("セロリ", "セロリ"), Term("セン", "セン"), Term("ライブハウス", "ライブハウス"), Term("センサー", "センサー"), Term("ライブラリー", "ライブラリー"), Term("ラジエーター", "ラジエーター"), Term("ラジカル", "ラジカル"), Term("ラス", "ラス"), Term("ギャル", "ギャル"), Term("ゼネラルマネージャー", "ゼネラルマネージャー"), Term("ラッセル", "ラッセル"), Term("ラッチ", "ラッチ"), Term("ゼロックス", "ゼロックス"), Term("ラッピング", "ラッピング"), Term("ラテックス", "ラテックス"), Term("ラドン", "ラドン"), Term("ラビオリ", "ラビオリ"), Term("ソープランド", "ソープランド"), Term("ラフト", "ラフト"), Term("ラム", "ラム"), Term("ギルド", "ギルド"), Term("ギロチン", "ギロチン"), Term("ラング", "ラング"), Term("ソフトボール", "ソフトボール"), Term("ランジェリー", "ランジェリー"), Term("ランドサット", "ランドサット"), Term("ソユーズ", "ソユーズ"), Term("ランドセル", "ランドセル"), Term("ランドマーク", "ランドマーク"), Term("クーペ", "クーペ"), Term("クーポン", "クーポン"), Term("リース", "リース"), Term("ゾーン", "ゾーン"), Term("リーチ", "リーチ"), Term("ターゲット", "ターゲット"), Term("ミレニアム", "ミレニアム"), Term("カチューシャ", "カチューシャ"), Term("タービン", "タービン"), Term("リーマン", "リーマン"), Term("リキュール", "リキュール"), Term("タイ", "タイ"), Term("タイアップ", "タイアップ"), Term("リクード", "リクード"), Term("リコー", "リコー"), Term("タイツ", "タイツ"), Term("レコーダー", "レコーダー"), Term("クイーン", "クイーン"), Term("リコール", "リコール"), Term("リス", "リス"), Term("オーガ", "オーガ"), Term("スタン", "スタン"), Term("クイック", "クイック"), Term("リゾット", "リゾット"), Term("インダストリアル", "インダストリアル"), Term("リチウム", "リチウム"), Term("クエーカー", "クエーカー"), Term("リトグラフ", "リトグラフ"), Term("インテグレーション", "インテグレーション"), Term("リハビリテーション", "リハビリテーション"), Term("リバーシブル", "リバーシブル"), Term("リバイバル", "リバイバル"), Term("タグボート", "タグボート"), Term("リミット", "リミット"), Term("リモート", "リモート"), Term("リュート", "リュート"), Term("タンクローリ", "タンクローリ"), Term("リリーフ", "リリーフ"), Term("リンパ", "リンパ"), Term("ルージュ", "ルージュ"), Term("ダイオード", "ダイオード"), Term("ルーレット", "ルーレット"), Term("ルアー", "ルアー"), Term("ダイナースクラブ", "ダイナースクラブ"), Term("クラッカー", "クラッカー"), Term("ルクス", "ルクス"), Term("ルサンチマン", "ルサンチマン"), Term("クラック", "クラック"), Term("ルック", "ルック"), Term("インディペンデント", "インディペンデント"), Term("ダイナミクス", "ダイナミクス"), Term("ルポルタージュ", "ルポルタージュ"), Term("ルミノール", "ルミノール"), Term("インデックス", "インデックス"), Term("レーザー", "レーザー"), Term("クランク", "クランク"), Term("レーザーディスク", "レーザーディスク"), Term("レーヨン", "レーヨン"), Term("レイアウト", "レイアウト"), Term("レインボーフィッシュ", "レインボーフィッシュ"), Term("レオタード", "レオタード"), Term("ダクト", "ダクト"), Term("レガーズ", "レガーズ"), Term("レガッタ", "レガッタ"), Term("レクイエム", "レクイエム"), Term("ダミー", "ダミー"), Term("ダンシング", "ダンシング"), Term("ダンスホール", "ダンスホール"), Term("チーフ", "チーフ"), Term("レプリカ", "レプリカ"), Term("インバーター", "インバーター"), Term("ローション", "ローション"), Term("ローター", "ローター"), Term("ロータス", "ロータス"), Term("ロータリー", "ロータリー"), Term("レタス", "レタス"), Term("チェンバロ", "チェンバロ"), Term("レイオフ", "レイオフ"), Term("ロイヤル", "ロイヤル"), Term("ロカビリー", "ロカビリー"), Term("ロケーション", "ロケーション"), Term("ロココ", "ロココ"), Term("クリンチ", "クリンチ"), Term("チャージ", "チャージ"), Term("チャーチ", "チャーチ"), Term("ロックウール", "ロックウール"), Term("ロバ", "ロバ"), Term("サンタフェ", "サンタフェ"), Term("トロイカ", "トロイカ"), Term("カモフラージ", "カモフラージ"), Term("ペレストロイカ", "ペレストロイカ"), Term("クレムリン", "クレムリン"), Term("マーキュリー", "マーキュリー"), Term("セリウム", "セリウム"), Term("タリウム", "タリウム"), Term("コミンテルン", "コミンテルン"), Term("ベガ", "ベガ"), Term("一分", "いちぶ"), Term("グアテマラ共和国", "グアテマラきょうわこく"), Term("三方", "さんぼう"), Term("寿府", "ジュネーブ"), Term("ワウ", "ワウ"), Term("ブラチスラバ", "ブラチスラバ"), Term("テナー", "テナー"), Term("グローブ", "グローブ"), Term("エア", "エア"), Term("ケベック", "ケベック"), Term("トーチ", "トーチ"), Term("ナイン", "ナイン"), Term("ニュージャージー", "ニュージャージー"), Term("ニューハンプシャー", "ニューハンプシャー"), Term("ニューメキシコ", "ニューメキシコ"), Term("コム", "コム"), Term("リート", "リート"), Term("ギャルソン", "ギャルソン"), Term("ネアンデルタール", "ネアンデルタール"), Term("ノースカロライナ", "ノースカロライナ"), Term("バイ", "バイ"), Term("オード", "オード"), Term("バスト", "バスト"), Term("パール", "パール"), Term("オクラホマ", "オクラホマ"), Term("サウスカロライナ", "サウスカロライナ"), Term("サザンクロス", "サザンクロス"), Term("パンパス", "パンパス"), Term("ヒート", "ヒート"), Term("サンシャイン", "サンシャイン"), Term("オリエント", "オリエント"), Term("エール", "エール"), Term("ザイール", "ザイール"), Term("アスベスト", "アスベスト"), Term("フォア", "フォア"), Term("シャーマン", "シャーマン"), Term("シャンティー", "シャンティー"), Term("カスバ", "カスバ"), Term("ブリタニア", "ブリタニア"), Term("ブロード", "ブロード"), Term("プリ", "プリ"), Term("シンポ", "シンポ"), Term("ヘルツェゴビナ", "ヘルツェゴビナ"), Term("カルバドス", "カルバドス"), Term("ベレー", "ベレー"), Term("ベンジン", "ベンジン"), Term("ホープ", "ホープ"), Term("カント", "カント"), Term("アルカディア", "アルカディア"), Term("スタンフォード", "スタンフォード"), Term("ガン", "ガン"), Term("マサチューセッツ", "マサチューセッツ"), Term("キール", "キール"), Term("マドラス", "マドラス"), Term("スネーク", "スネーク"), Term("ミネソタ", "ミネソタ"), Term("イーグル", "イーグル"), Term("ロー", "ロー"), Term("モンタナ", "モンタナ"), Term("イリノイ", "イリノイ"), Term("ヨーク", "ヨーク"), Term("インター", "インター"), Term("リーク", "リーク"), Term("ランス", "ランス"), Term("リトルロック", "リトルロック"), Term("リベラル", "リベラル"), Term("ミート", "ミート"), Term("インディアナ", "インディアナ"), Term("ルイジアナ", "ルイジアナ"), Term("クラン", "クラン"), Term("チェチェン", "チェチェン"), Term("朱", "あけ"), Term("一線", "いっせん"), Term("三十日", "みそか"), Term("日本学術会議", "にほんがくじゅつかいぎ"), Term("八千代", "やちよ"), Term("貫", "かん"), Term("願", "がん"), Term("宗", "しゅう"), Term("汎", "はん"), Term("中高", "ちゅうこう"), Term("馬主", "うまぬし"), Term("痴女", "ちじょ"), Term("ぐるり", "ぐるり"), Term("大山", "たいざん"), Term("重る", "おもる"), Term("存廃", "そんぱい"), Term("出張所", "しゅっちょうじょ"), Term("徐々に", "じょじょに"), Term("一期", "いちご"), Term("一級", "いっきゅう"), Term("老人ホーム", "ろうじんホームホーム"), Term("小豆", "あずき"), Term("一周年", "いっしゅうねん"), Term("六十四分音符", "ろくじゅうしぶおんぷ"), Term("一石", "いっせき"), Term("一戦", "いっせん"), Term("一丁", "いっちょう"), Term("一党", "いっとう"), Term("上田", "じょうでん"), Term("一幕", "ひとまく"), Term("色紙", "しきし"), Term("永代", "えいたい"), Term("遠", "とお"), Term("政", "まつりごと"), Term("一手", "いって"), Term("取り立て", "とりたて"), Term("滑り", "ぬめり"), Term("田畑", "たはた"), Term("丹", "に"), Term("中越", "ちゅうごし"), Term("葛", "くず"), Term("肝", "きも"), Term("炭", "すみ"), Term("島内", "とうない"), Term("同県", "どうけん"), Term("同党", "どうとう"), Term("無人", "むじん"), Term("二百十日", "にひゃくとおか"), Term("二百二十日", "にひゃくはつか"), Term("日照", "にっしょう"), Term("入り込み", "いりごみ"), Term("競る", "せる"), Term("不起訴", "ふきそ"), Term("抑える", "おさえる"), Term("桑田", "そうでん"), Term("牧野", "ぼくや"), Term("本島", "ほんとう"), Term("本木", "もとき"), Term("無差別", "むさべつ"), Term("預け入れる", "あずけいれる"), Term("養父", "ようふ"), Term("平行", "へいこう"), Term("録音テープ", "ろくおんテープテープ"), Term("論客", "ろんきゃく"), Term("公文", "こうぶん"), Term("奥地", "おくち"), Term("雁", "がん"), Term("軍兵", "ぐんぴょう"), Term("嫌気", "いやき"), Term("惨敗", "ざんぱい"), Term("十四", "じゅうし"), Term("千代", "ちよ"), Term("江", "え"), Term("大河", "たいが"), Term("内海", "うちうみ"), Term("南氷洋", "なんひょうよう"), Term("二七日", "ふたなぬか"), Term("不定", "ふじょう"), Term("余人", "よじん"), Term("高見", "こうけん"), Term("印象付ける", "いんしょうづける"), Term("七七日", "しちしちにち"), Term("要", "かなめ"), Term("斎", "とき"), Term("細目", "さいもく"), Term("陽", "よう"), Term("煙草屋", "タバコや"), Term("三省", "さんせい"), Term("山川", "さんせん"), Term("花柳", "かりゅう"), Term("完治", "かんち"), Term("急ピッチ", "きゅうピッチピッチ"), Term("刺し", "さし"), Term("施工", "せこう"), Term("毒ガス", "どくガスガス"), Term("金子", "きんす"), Term("金石", "きんせき"), Term("型式", "かたしき"), Term("五十三次", "ごじゅうさんつぎ"), Term("荒らげる", "あららげる"), Term("深山", "みやま"), Term("石神", "しゃくじん"), Term("対米", "たいべい"), Term("炭田", "たんでん"), Term("無投票", "むとうひょう"), Term("無記名", "むきめい"), Term("八重", "やえ"), Term("逆手", "ぎゃくて"), Term("手取り", "てとり"), Term("土橋", "どばし"), Term("新田", "しんでん"), Term("米倉", "こめぐら"), Term("一途", "いちず"), Term("青山", "せいざん"), Term("青梅", "あおうめ"), Term("大船", "おおぶね"), Term("本山", "ほんざん"), Term("白馬", "はくば"), Term("染め", "そめ"), Term("等々", "とうとう"), Term("日出", "にっしゅつ"), Term("向かって左", "むかってひだり"), Term("連係プレー", "れんけいプレープレー"), Term("らしい", "らしい"), Term("響めく", "どよめく"), Term("紛れ", "まぐれ"), Term("畝る", "うねる"), Term("ぴょんぴょん", "ぴょんぴょん"), Term("ふわり", "ふわり"), Term("眼", "まなこ"), Term("準える", "なぞらえる"), Term("よし", "よし"), Term("しとしと", "しとしと"), Term("がやがや", "がやがや"), Term("自棄", "やけ"), Term("むっと", "むっと"), Term("枝葉", "しよう"), Term("ざわざわ", "ざわざわ"), Term("コットン", "コットン"), Term("わいわい", "わいわい"), Term("めく", "めく"), Term("ぬるぬる", "ぬるぬる"), Term("欲深", "よくふか"), Term("すやすや", "すやすや"), Term("ハット", "ハット"), Term("よちよち", "よちよち"), Term("何遍", "なんべん"), Term("パチパチ", "パチパチ"), Term("禿", "はげ"), Term("戯れ", "たわむれ"), Term("戯れる", "たわむれる"), Term("日ソ", "にっソソ"), Term("上唇", "じょうしん"), Term("謹賀新年", "きんがしんねん"), Term("ブル", "ブル"), Term("けじめ", "けじめ"), Term("カルチャー", "カルチャー"), Term("省みる", "かえりみる"), Term("からり", "からり"), Term("鬼神", "きしん"), Term("寂然", "せきぜん"), Term("醜女", "しゅうじょ"), Term("アンダーライン", "アンダーライン"), Term("高音", "こうおん"), Term("ミクロ", "ミクロ"), Term("千切れる", "ちぎれる"), Term("ぼやぼや", "ぼやぼや"), Term("亡くす", "なくす"), Term("刻一刻と", "こくいっこくと"), Term("ガラス戸", "ガラスど"), Term("セロテープ", "セロテープ"), Term("タウン", "タウン"), Term("さよなら", "さよなら"), Term("ルーム", "ルーム"), Term("ドキュメント", "ドキュメント"), Term("がらんと", "がらんと"), Term("として", "として"), Term("ようにする", "ようにする"), Term("そのよう", "そのよう"), Term("でも無い", "でもない"), Term("では無いか", "ではないか"), Term("どれでも", "どれでも"), Term("どうにもならない", "どうにもならない"), Term("どなたか", "どなたか"), Term("じゃない", "じゃない"), Term("事にする", "ことにする"), Term("ほっといて", "ほっといて"), Term("するべき", "するべき"), Term("デー", "デー"), Term("ことが出来る", "ことができる"), Term("このぐらい", "このぐらい"), Term("タトゥー", "タトゥー"), Term("イケ面", "イケめん"), Term("だけれども", "だけれども"), Term("ばあちゃん", "ばあちゃん"), Term("またね", "またね"), Term("べきではない", "べきではない"), Term("ユーズド", "ユーズド"), Term("何と言うか", "なんというか"), Term("シェープ", "シェープ"), Term("然うすれば", "そうすれば"), Term("かまくら", "かまくら"), Term("しないのではないか", "しないのではないか"), Term("そぼろ", "そぼろ"), Term("１００円ショップ", "えんショップショップ"), Term("ブチ切れ", "ブチきれ"), Term("どちらでもない", "どちらでもない"), Term("デパ地下", "デパちか"), Term("できるだけ早く", "できるだけはやく"), Term("何を隠そう", "なにをかくそう"), Term("他にも", "ほかにも"), Term("とは言うものの", "とはいうものの"), Term("ワンダフル", "ワンダフル"), Term("グローバル化", "グローバルか"), Term("再スタート", "さいスタートスタート"), Term("最新ニュース", "さいしんニュースニュース"), Term("にあっては", "にあっては"), Term("生まれ育つ", "うまれそだつ"), Term("ノンアルコール", "ノンアルコール"), Term("ゆうパック", "ゆうパック"), Term("サービス業", "サービスぎょう"), Term("アルファベット順", "アルファベットじゅん"), Term("防犯カメラ", "ぼうはんカメラカメラ"), Term("ましょうか", "ましょうか"), Term("そそられる", "そそられる"), Term("に限って", "にかぎって"), Term("ウェブログ", "ウェブログ"), Term("アフィリエイト", "アフィリエイト"), Term("サプリ", "サプリ"), Term("ナイスバディ", "ナイスバディ"), Term("カスタマー", "カスタマー"), Term("ませんか", "ませんか"), Term("コンピレーション", "コンピレーション"), Term("そんなこんな", "そんなこんな"), Term("サイン会", "サインかい"), Term("一味違う", "ひとあじちがう"), Term("メタボリック", "メタボリック"), Term("ビーンズ", "ビーンズ"), Term("電源ケーブル", "でんげんケーブルケーブル"), Term("最後の舞台", "さいごのぶたい"), Term("蒸しパン", "むしパン"), Term("事により", "ことにより"), Term("ＡＴＭ", ""), Term("サーセン", "サーセン"), Term("携帯ストラップ", "けいたいストラップストラップ"), Term("パスケース", "パスケース"), Term("有って無い", "あってない"), Term("つまんない", "つまんない"), Term("アトラス", "アトラス"), Term("エクスペリエンス", "エクスペリエンス"), Term("そうなると", "そうなると"), Term("好感度", "こうかんど"), Term("アーアー", "アーアー"), Term("どちらにせよ", "どちらにせよ"), Term("まだまだこれから", "まだまだこれから"), Term("ドクターヘリ", "ドクターヘリ"), Term("に向けて", "にむけて"), Term("ウェルカム", "ウェルカム"), Term("なのです", "なのです"), Term("公式サイト", "こうしきサイトサイト"), Term("知っての通り", "しってのとおり"), Term("だった", "だった"), Term("ちゃうか", "ちゃうか"), Term("では無い", "ではない"), Term("今日この頃", "きょうこのごろ"), Term("いらして", "いらして"), Term("ウォッチング", "ウォッチング"), Term("令和", "れいわ"), Term("エンジェル", "エンジェル"), Term("無くちゃいけない", "なくちゃいけない"), Term("無くてはいけません", "なくてはいけません"), Term("並び変える", "ならびかえる"), Term("お久しぶり", "おひさしぶり"), Term("お手数ですが", "おてすうですが"), Term("ケーソン工法", "ケーソンこうほう"), Term("お腹の子", "おなかのこ"), Term("お目出度うご座います", "おめでとうございます"), Term("じゃ無いか", "じゃないか"), Term("可能にする", "かのうにする"), Term("ウェイト", "ウェイト"), Term("ドラ息子", "ドラむすこ"), Term("コピーライト", "コピーライト"), Term("オープン戦", "オープンせん"), Term("スポーツ新聞", "スポーツしんぶん"), Term("ミーハー", "ミーハー"), Term("可能性が高い", "かのうせいがたかい"), Term("すんごい", "すんごい"), Term("右クリック", "みぎクリッククリック"), Term("こんにちわ", "こんにちわ"), Term("菅", "すげ"), Term("すげー", "すげー"), Term("ヒヤリング", "ヒヤリング"), Term("クリエーター", "クリエーター"), Term("プロフィール画像", "プロフィールがぞう"), Term("ピン撥ね", "ピンはね"), Term("憧れの的", "あこがれのまと"), Term("ハンドメイド", "ハンドメイド"), Term("よれば", "よれば"), Term("選りすぐり", "よりすぐり"), Term("ぎゅっと", "ぎゅっと"), Term("観光スポット", "かんこうスポットスポット"), Term("そうです", "そうです"), Term("天然温泉", "てんねんおんせん"), Term("フェアウェイ", "フェアウェイ"), Term("だと", "だと"), Term("無線ＬＡＮ", "むせんラン"), Term("うんち", "うんち"), Term("ベロ", "ベロ"), Term("こうすると", "こうすると"), Term("ジワジワ", "ジワジワ"), Term("成吉思汗", "ジンギスかん"), Term("ペン先", "ペンさき"), Term("こうすれば", "こうすれば"), Term("ポシェット", "ポシェット"), Term("スポーティー", "スポーティー"), Term("このため", "このため"), Term("メチル", "メチル"), Term("この外", "このほか"), Term("ドル買い", "ドルかい"), Term("ロケット弾", "ロケットだん"), Term("の度に", "のたびに"), Term("オリーブ色", "オリーブいろ"), Term("リピーター", "リピーター"), Term("ばりばり", "ばりばり"), Term("ワンコ", "ワンコ"), Term("ロープウェイ", "ロープウェイ"), Term("ちくり", "ちくり"), Term("必死になって", "ひっしになって"), Term("御田", "おでん"), Term("ミラー", "ミラー"), Term("サテライト", "サテライト"), Term("シチュエーション", "シチュエーション"), Term("アプリ", "アプリ"), Term("ロビング", "ロビング"), Term("チャイニーズ", "チャイニーズ"), Term("インペリアル", "インペリアル"), Term("チャイルド", "チャイルド"), Term("ロングホール", "ロングホール"), Term("ワーカー", "ワーカー"), Term("ワーキング", "ワーキング"), Term("チャネリング", "チャネリング"), Term("ワーク", "ワーク"), Term("インポート", "インポート"), Term("クレーコート", "クレーコート"), Term("ワースト", "ワースト"), Term("ワールド", "ワールド"), Term("ワラント", "ワラント"), Term("ワン", "ワン"), Term("ウィーク", "ウィーク"), Term("クレアチニンクリアランス", "クレアチニンクリアランス"), Term("ワンタッチ", "ワンタッチ"), Term("ワンダー", "ワンダー"), Term("ワンポイントリリーフ", "ワンポイントリリーフ"), Term("クレオソート", "クレオソート"), Term("ワンルームマンション", "ワンルームマンション"), Term("チン", "チン"), Term("ツーピース", "ツーピース"), Term("ツーリスト", "ツーリスト"), Term("クレディビリティーギャップ", "クレディビリティーギャップ"), Term("ウィークリー", "ウィークリー"), Term("フェース", "フェース"), Term("バファリン", "バファリン"), Term("ツリー", "ツリー"), Term("クレンジングクリーム", "クレンジングクリーム"), Term("ウィンター", "ウィンター"), Term("テーマソング", "テーマソング"), Term("グラフィックス", "グラフィックス"), Term("クロスワード", "クロスワード"), Term("ティラニー", "ティラニー"), Term("テキ", "テキ"), Term("ウインド", "ウインド"), Term("クロニクル", "クロニクル"), Term("クワイア", "クワイア"), Term("テスター", "テスター"), Term("ウイング", "ウイング"), Term("クワルテット", "クワルテット"), Term("テストケース", "テストケース"), Term("テックス", "テックス"), Term("ヘッジ", "ヘッジ"), Term("テナント", "テナント"), Term("グッド", "グッド"), Term("グライコ", "グライコ"), Term("テリーヌ", "テリーヌ"), Term("テレカンファレンス", "テレカンファレンス"), Term("テレグラフ", "テレグラフ"), Term("テレスキャン", "テレスキャン"), Term("テレビジョン", "テレビジョン"), Term("グラチェ", "グラチェ"), Term("テレホン", "テレホン"), Term("テレメーター", "テレメーター"), Term("グラビア", "グラビア"), Term("テロップ", "テロップ"), Term("テンポラリー", "テンポラリー"), Term("デーゲーム", "デーゲーム"), Term("データバンク", "データバンク"), Term("クラーク", "クラーク"), Term("グランス", "グランス"), Term("デーモン", "デーモン"), Term("デーリー", "デーリー"), Term("ディープ", "ディープ"), Term("ディクショナリ", "ディクショナリ"), Term("キーパー", "キーパー"), Term("ディスカッション", "ディスカッション"), Term("ディスカバー", "ディスカバー"), Term("リセ", "リセ"), Term("ベニヤ", "ベニヤ"), Term("グリーンスクール", "グリーンスクール"), Term("ディストーション", "ディストーション"), Term("グリップ", "グリップ"), Term("ディテール", "ディテール"), Term("ディバイス", "ディバイス"), Term("オートキャンプ", "オートキャンプ"), Term("リニューアル", "リニューアル"), Term("ディミヌエンド", "ディミヌエンド"), Term("グルメ", "グルメ"), Term("デコーダ", "デコーダ"), Term("パンタグラフ", "パンタグラフ"), Term("ホームヘルパー", "ホームヘルパー"), Term("デサール", "デサール"), Term("グレコローマンスタイル", "グレコローマンスタイル"), Term("グレゴリオ", "グレゴリオ"), Term("グロ", "グロ"), Term("グローバリズム", "グローバリズム"), Term("グローバル", "グローバル"), Term("デノミ", "デノミ"), Term("マロン", "マロン"), Term("ロングセラー", "ロングセラー"), Term("ウルトラ", "ウルトラ"), Term("デフォルメ", "デフォルメ"), Term("デフレ", "デフレ"), Term("ケーオー", "ケーオー"), Term("デポジット", "デポジット"), Term("デマンド", "デマンド"), Term("デモクラシー", "デモクラシー"), Term("デモクラット", "デモクラット"), Term("デューティーフリー", "デューティーフリー"), Term("ケーススタディー", "ケーススタディー"), Term("デュエット", "デュエット"), Term("ケースワーカー", "ケースワーカー"), Term("ウインカー", "ウインカー"), Term("デライブド", "デライブド"), Term("デラックス", "デラックス"), Term("デリート", "デリート"), Term("デリカ", "デリカ"), Term("ケープ", "ケープ"), Term("デレゲーション", "デレゲーション"), Term("チア", "チア"), Term("ケア", "ケア"), Term("トークショー", "トークショー"), Term("ドライフラワー", "ドライフラワー"), Term("ケミカル", "ケミカル"), Term("トイレット", "トイレット"), Term("トゥギャザー", "トゥギャザー"), Term("トス", "トス"), Term("エイト", "エイト"), Term("ゲームセット", "ゲームセット"), Term("トップクラス", "トップクラス"), Term("トップスター", "トップスター"), Term("ゲイリブ", "ゲイリブ"), Term("トトカルチョ", "トトカルチョ"), Term("ゲイン", "ゲイン"), Term("トニータイ", "トニータイ"), Term("トミーガン", "トミーガン"), Term("エキサイト", "エキサイト"), Term("トライアル", "トライアル"), Term("ゲバリスタ", "ゲバリスタ"), Term("トラバーユ", "トラバーユ"), Term("ゲレンデ", "ゲレンデ"), Term("トラフィック", "トラフィック"), Term("トラベル", "トラベル"), Term("ゲン", "ゲン"), Term("トランキライザー", "トランキライザー"), Term("エキゾチック", "エキゾチック"), Term("コークスクリュー", "コークスクリュー"), Term("トランシーバー", "トランシーバー"), Term("トリートメント", "トリートメント"), Term("コーティング", "コーティング"), Term("シンクロナイズ", "シンクロナイズ"), Term("コーディネート", "コーディネート"), Term("トリビューン", "トリビューン"), Term("エグゼクティブ", "エグゼクティブ"), Term("トリュフ", "トリュフ"), Term("ボディコン", "ボディコン"), Term("ウエット", "ウエット"), Term("コードレス", "コードレス"), Term("コードレスホン", "コードレスホン"), Term("トレードマーク", "トレードマーク"), Term("コーナリング", "コーナリング"), Term("トレッカー", "トレッカー"), Term("トレンディー", "トレンディー"), Term("コープ", "コープ"), Term("コーポ", "コーポ"), Term("ムーディー", "ムーディー"), Term("コーポレートアイデンティティー", "コーポレートアイデンティティー"), Term("トワイライト", "トワイライト"), Term("ドーク", "ドーク"), Term("ドーマーウインドー", "ドーマーウインドー"), Term("コールド", "コールド"), Term("ドールキュー", "ドールキュー"), Term("テレクラ", "テレクラ"), Term("ドゥーイットユアセルフ", "ドゥーイットユアセルフ"), Term("マキシ", "マキシ"), Term("コインロッカー", "コインロッカー"), Term("ドラマチック", "ドラマチック"), Term("ドリーム", "ドリーム"), Term("コギトエルゴスム", "コギトエルゴスム"), Term("ドルフィンキック", "ドルフィンキック"), Term("ココム", "ココム"), Term("ドローイング", "ドローイング"), Term("ナーサリー", "ナーサリー"), Term("コスチューム", "コスチューム"), Term("ナース", "ナース")}
-#"fix syntax highlighting
+LEVELS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "jlpt.tsv")
+"""
+Path of the level data.
+
+Each line contains a level, a term text and a term reading, separated by tabs.
+Level 0 stands for common words outside of the JLPT levels.
+Lines are ordered by priority: N5 first, then N4 and so on.
+"""
+SET_NAMES = {"N5": 5, "N4": 4, "N3": 3, "N2": 2, "N1": 1, "COMMON": 0}
+
+LevelKey = Tuple[str, str]
+"""
+Text and reading of a term
+"""
+
+_levels: Optional[Dict[LevelKey, int]] = None
+_canonical_levels: Optional[Dict[CanonicalKey, int]] = None
+_level_sets: Dict[str, Set[Term]] = dict()
+
+
+def read_rows(path: str = LEVELS_PATH) -> Iterator[Tuple[int, str, str]]:
+    """
+    Iterate over the level, text and reading of each line of the level data.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        fields = f.read().rstrip("\n").replace("\n", "\t").split("\t")
+    return zip(map(int, fields[0::3]), fields[1::3], fields[2::3])
+
+
+def levels() -> Dict[LevelKey, int]:
+    """
+    Map of the text and reading of each term to its level.
+
+    The level data is loaded on first use.
+    """
+    global _levels
+    if _levels is None:
+        rows = [((text, reading), level) for level, text, reading in read_rows()]
+        # Lines are ordered by priority, so the first line of each term wins
+        _levels = dict(reversed(rows))
+    return _levels
+
+
+def canonical_levels() -> Dict[CanonicalKey, int]:
+    """
+    Map of the canonical key of each term to its level.
+
+    All spelling variants of a term share the same canonical key,
+    so variants are resolved once when this index is built.
+    Keys of multiple terms get the easiest level, or 0 if they are only common.
+    """
+    global _canonical_levels
+    if _canonical_levels is None:
+        level_map = levels()
+        keys = canonical_keys([Term(text, reading) for text, reading in level_map])
+        _canonical_levels = dict()
+        for key, level in zip(keys, level_map.values()):
+            _canonical_levels[key] = max(level, _canonical_levels.get(key, level))
+    return _canonical_levels
+
+
+def __getattr__(name: str) -> Set[Term]:
+    # Level sets are built on first use for backwards compatibility
+    if name in SET_NAMES:
+        level_set = _level_sets.get(name)
+        if level_set is None:
+            level_set = _level_sets[name] = {Term(text, reading) for level, text, reading in read_rows()
+                                             if level == SET_NAMES[name]}
+        return level_set
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def get_level(term: Term) -> Optional[int]:
-    if term in N5:
-        return 5
-    if term in N4:
-        return 4
-    if term in N3:
-        return 3
-    if term in N2:
-        return 2
-    if term in N1:
-        return 1
-    if term in COMMON:
-        return 0
-    return None
+    return levels().get((term.text, term.reading))
 
-def tag_level(definition: Definition) -> Optional[str]:
-    level = get_level(definition.term)
+def get_levels(terms: Iterable[Term]) -> List[Optional[int]]:
+    """
+    Look up the levels of many terms at once.
+    """
+    get = levels().get
+    return [get((term.text, term.reading)) for term in terms]
+
+def level_tag(level: Optional[int]) -> Optional[str]:
     if level is None:
         return None
     elif level > 0:
@@ -36,6 +97,34 @@ def tag_level(definition: Definition) -> Optional[str]:
     else:
         return "通常使用"
 
+def tag_level(definition: Definition) -> Optional[str]:
+    return level_tag(get_level(definition.term))
+
+def tag_levels(it: Iterator[Definition], chunk_size: int = 10000) -> Iterator[Definition]:
+    """
+    Add the level tag of each definition to its def tag field.
+
+    Definitions are processed in chunks.
+    Exact matches of the term are preferred.
+    Other definitions are matched by the canonical key of their term,
+    so spelling variants with kyujitai, kanji repetition marks or katakana readings are tagged, too.
+
+    Iterator[definition] → Iterator[definition]
+    """
+    # Imported here, because workers pulls in multiprocessing, which would slow down importing this module
+    import workers
+
+    canonical_get = canonical_levels().get
+    for chunk in workers.chunked(it, chunk_size):
+        terms = [x.term for x in chunk]
+        exact = get_levels(terms)
+        keys = canonical_keys(terms)
+        for x, level, key in zip(chunk, exact, keys):
+            if level is None:
+                level = canonical_get(key)
+            tag = level_tag(level)
+            yield x if tag is None else x.add_def_tag(tag)
+
 
 class TestJlpt(unittest.TestCase):
     def test_get_level(self):
@@ -46,3 +135,25 @@ class TestJlpt(unittest.TestCase):
         self.assertEqual(1, get_level(Term("農場", "のうじょう")))
         self.assertEqual(0, get_level(Term("北海道", "ほっかいどう")))
         self.assertEqual(None, get_level(Term("瘧", "おこり")))
+
+    def test_get_levels(self):
+        terms = [Term("学校", "がっこう"), Term("瘧", "おこり"), Term("北海道", "ほっかいどう")]
+        self.assertEqual([5, None, 0], get_levels(terms))
+
+    def test_tag_levels(self):
+        definitions = [
+            Definition(Term("学校", "がっこう"), "", "", 0, ("",), 0, ""),
+            Definition(Term("學校", "がっこう"), "名", "", 0, ("",), 1, ""),
+            Definition(Term("ガッコウ", "ガッコウ"), "", "", 0, ("",), 2, ""),
+            Definition(Term("北海道", "ホッカイドウ"), "", "", 0, ("",), 3, ""),
+            Definition(Term("瘧", "おこり"), "", "", 0, ("",), 4, ""),
+        ]
+        tags = [x.def_tags for x in tag_levels(iter(definitions), chunk_size=2)]
+        self.assertEqual(["N5", "名 N5", "", "通常使用", ""], tags)
+
+    def test_sets(self):
+        module = sys.modules[__name__]
+        self.assertEqual(655, len(module.N5))
+        self.assertEqual(10761, len(module.COMMON))
+        self.assertIn(Term("農場", "のうじょう"), module.N1)
+        self.assertIs(module.N5, module.N5)
@@ -0,0 +1,153 @@
+import operator
+from collections.abc import Mapping
+from typing import Dict, Tuple, Iterator, Callable, List
+import unittest
+
+from normalize import Normalizer, TEXT, READING
+from term import Term
+
+CanonicalKey = Tuple[str, str]
+"""
+Canonical text and reading of a term
+"""
+
+CANONICAL = Normalizer() \
+    .add_kyu_to_shin() \
+    .add_kanji_mark_removal() \
+    .add_kata_to_hira()
+"""
+Normalizer that maps spelling variants of a term to the same canonical form:
+shinjitai, no kanji repetition marks and hiragana reading.
+"""
+
+AGGREGATES: Dict[str, Callable[[int, int], int]] = {
+    "sum": operator.add,
+    "max": max,
+}
+"""
+Policies for combining the counts of variants with the same canonical key.
+
+Sum treats variants as different spellings of the same word that occur in distinct places.
+Max conservatively assumes that the variant counts overlap.
+"""
+
+
+def canonical_key(text: str, reading: str) -> CanonicalKey:
+    """
+    Canonical key of a term.
+
+    An empty reading is treated as equal to the text.
+    """
+    return CANONICAL.normalize_string(text, TEXT), CANONICAL.normalize_string(reading or text, READING)
+
+
+def canonical_keys(terms: List[Term]) -> List[CanonicalKey]:
+    """
+    Canonical keys of a whole list of terms.
+    """
+    texts = CANONICAL.normalize_strings([x.text for x in terms], TEXT)
+    readings = CANONICAL.normalize_strings([x.reading or x.text for x in terms], READING)
+    return list(zip(texts, readings))
+
+
+class JoinIndex(Mapping):
+    """
+    Term counts that can be looked up by any spelling variant of a term.
+
+    Counts are aggregated per canonical key when the index is built,
+    so each lookup is a single canonical key computation plus one dictionary access.
+
+    If exact matches are preferred, a term that occurs in the counts verbatim gets its own count
+    and only missing terms fall back to the aggregated count of their variants.
+
+    Unlike a plain mapping, lookups are not limited to the keys that iteration yields.
+    Iteration and len cover only the terms of the counts, while in, get and indexing also answer
+    any spelling variant of them. So a variant can be in the index without being among its keys,
+    and dict(index) maps only the counted terms, to the counts that the index gives them.
+    """
+    exact: Dict[Term, int]
+    canonical: Dict[CanonicalKey, int]
+    prefer_exact: bool
+
+    def __init__(self, counts: Dict[Term, int], aggregate: str = "sum", prefer_exact: bool = True):
+        if aggregate not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate: {aggregate}")
+        combine = AGGREGATES[aggregate]
+
+        terms = list(counts)
+        canonical: Dict[CanonicalKey, int] = dict()
+        for key, term in zip(canonical_keys(terms), terms):
+            count = counts[term]
+            if key in canonical:
+                canonical[key] = combine(canonical[key], count)
+            else:
+                canonical[key] = count
+
+        self.exact = counts
+        self.canonical = canonical
+        self.prefer_exact = prefer_exact
+
+    def __getitem__(self, term: Term) -> int:
+        if self.prefer_exact and term in self.exact:
+            return self.exact[term]
+        return self.canonical[canonical_key(term.text, term.reading)]
+
+    def __contains__(self, term: object) -> bool:
+        if not isinstance(term, Term):
+            return False
+        if self.prefer_exact and term in self.exact:
+            return True
+        return canonical_key(term.text, term.reading) in self.canonical
+
+    def __iter__(self) -> Iterator[Term]:
+        return iter(self.exact)
+
+    def __len__(self) -> int:
+        return len(self.exact)
+
+
+class TestJoinIndex(unittest.TestCase):
+    counts = {
+        Term("国学", "こくがく"): 10,
+        Term("國學", "こくがく"): 3,
+        Term("時々", "ときどき"): 5,
+        Term("時時", "ときどき"): 1,
+        Term("テレビ", "てれび"): 7,
+    }
+
+    def test_canonical_key(self):
+        self.assertEqual(("国学", "こくがく"), canonical_key("國學", "コクガク"))
+        self.assertEqual(("時時", "ときどき"), canonical_key("時々", "ときどき"))
+        self.assertEqual(("テレビ", "てれび"), canonical_key("テレビ", "テレビ"))
+        self.assertEqual(("テレビ", "てれび"), canonical_key("テレビ", ""))
+
+    def test_aggregate(self):
+        index = JoinIndex(self.counts, "sum", prefer_exact=False)
+        self.assertEqual(13, index.get(Term("国学", "こくがく")))
+        self.assertEqual(13, index.get(Term("國学", "コクガク")))
+        self.assertEqual(6, index.get(Term("時々", "ときどき")))
+        self.assertEqual(7, index.get(Term("テレビ", "テレビ")))
+        self.assertEqual(0, index.get(Term("ラジオ", "らじお"), 0))
+
+        index = JoinIndex(self.counts, "max", prefer_exact=False)
+        self.assertEqual(10, index.get(Term("國學", "こくがく")))
+        self.assertEqual(5, index.get(Term("時時", "ときどき")))
+
+    def test_prefer_exact(self):
+        index = JoinIndex(self.counts, "sum")
+        self.assertEqual(3, index.get(Term("國學", "こくがく")))
+        self.assertEqual(13, index.get(Term("国學", "こくがく")))
+        self.assertIn(Term("國学", "こくがく"), index)
+        self.assertNotIn(Term("ラジオ", "らじお"), index)
+
+    def test_keys(self):
+        variant = Term("國学", "こくがく")
+        for prefer_exact in [True, False]:
+            index = JoinIndex(self.counts, "sum", prefer_exact)
+            # Variants are looked up, but not iterated
+            self.assertEqual(len(self.counts), len(index))
+            self.assertEqual(list(self.counts), list(index))
+            self.assertIn(variant, index)
+            self.assertNotIn(variant, list(index))
+            self.assertEqual(13, index[variant])
+            self.assertEqual(10 if prefer_exact else 13, dict(index)[Term("国学", "こくがく")])
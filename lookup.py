@@ -0,0 +1,308 @@
+import argparse
+import http.client
+import json
+import random
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+import unittest
+
+import jlpt
+from arguments import name_and_path
+from definition import Definition
+from dictionary import Dictionary
+from join import canonical_keys
+from normalize import random_terms
+from rank import Rank
+from term import Term
+
+
+class LookupIndex:
+    """
+    In-memory index of any number of rank and definition dictionaries plus the JLPT levels.
+
+    Every dictionary is a hash map from terms to entries,
+    so a batch lookup costs a few dictionary accesses per term and dictionary.
+    Terms are indexed with their default reading, so entries with an empty reading
+    are found by the text as their reading, as parse_term returns them.
+    """
+    ranks: Dict[str, Dict[Term, int]]
+    """
+    Maps dictionary names to the rank of each term.
+
+    If a term occurs more than once, its first rank is kept.
+    """
+    definitions: Dict[str, Dict[Term, List[Definition]]]
+    """
+    Maps dictionary names to the definitions of each term.
+    """
+
+    def __init__(self):
+        self.ranks = dict()
+        self.definitions = dict()
+
+    def add_ranks(self, name: str, dic: Dictionary) -> "LookupIndex":
+        ranks: Dict[Term, int] = dict()
+        for x in dic:
+            ranks.setdefault(x.term.with_default_reading(), x.rank)
+        self.ranks[name] = ranks
+        return self
+
+    def add_definitions(self, name: str, dic: Dictionary) -> "LookupIndex":
+        definitions: Dict[Term, List[Definition]] = dict()
+        for x in dic:
+            definitions.setdefault(x.term.with_default_reading(), []).append(x)
+        self.definitions[name] = definitions
+        return self
+
+    def lookup(self, terms: List[Term]) -> List[Dict[str, Any]]:
+        """
+        Rank in each rank dictionary, definitions in each definition dictionary and JLPT level of each term.
+
+        Levels of terms that are not listed verbatim are looked up by their canonical key, as when tagging.
+        """
+        levels = jlpt.get_levels(terms)
+        missing = [i for i, level in enumerate(levels) if level is None]
+        if missing:
+            canonical_get = jlpt.canonical_levels().get
+            for i, key in zip(missing, canonical_keys([terms[i] for i in missing])):
+                levels[i] = canonical_get(key)
+
+        results = []
+        for term, level in zip(terms, levels):
+            results.append({
+                "text": term.text,
+                "reading": term.reading,
+                "ranks": {name: ranks.get(term) for name, ranks in self.ranks.items()},
+                "definitions": {name: [x.to_json() for x in definitions.get(term, ())]
+                                for name, definitions in self.definitions.items()},
+                "jlpt": jlpt.level_tag(level),
+            })
+        return results
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "ranks": {name: len(ranks) for name, ranks in self.ranks.items()},
+            "definitions": {name: len(definitions) for name, definitions in self.definitions.items()},
+        }
+
+
+def parse_term(obj: Any) -> Term:
+    """
+    Parse a term given as text, as [text, reading] or as {"text": ..., "reading": ...}.
+
+    A missing or empty reading is treated as equal to the text.
+    """
+    if isinstance(obj, str):
+        text, reading = obj, ""
+    elif isinstance(obj, list) and 1 <= len(obj) <= 2:
+        text, reading = obj[0], obj[1] if len(obj) == 2 else ""
+    elif isinstance(obj, dict) and "text" in obj:
+        text, reading = obj["text"], obj.get("reading", "")
+    else:
+        raise ValueError(f"Cannot parse term: {obj!r}")
+    if not isinstance(text, str) or not isinstance(reading, str):
+        raise ValueError(f"Cannot parse term: {obj!r}")
+    return Term(text, reading or text)
+
+
+class LookupHandler(BaseHTTPRequestHandler):
+    """
+    Endpoints:
+    - GET /health returns the number of terms in each loaded dictionary
+    - POST /lookup with {"terms": [...]} returns {"results": [...]} in the same order
+
+    Responses always carry a content length, so clients can keep the connection alive
+    and send many requests over it.
+    """
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, which would otherwise stall kept-alive connections
+    disable_nagle_algorithm = True
+    server: "LookupServer"
+
+    def send_json(self, status: int, obj: Any):
+        body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self.send_json(200, self.server.index.status())
+        else:
+            self.send_json(404, {"error": f"Unknown path: {self.path}"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        if self.path != "/lookup":
+            self.send_json(404, {"error": f"Unknown path: {self.path}"})
+            return
+
+        try:
+            request = json.loads(body)
+            terms = [parse_term(obj) for obj in request["terms"]]
+        except (ValueError, KeyError, TypeError) as e:
+            self.send_json(400, {"error": f"{type(e).__name__}: {e}"})
+            return
+
+        self.send_json(200, {"results": self.server.index.lookup(terms)})
+
+    def log_message(self, format: str, *args: Any):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class LookupServer(ThreadingHTTPServer):
+    daemon_threads = True
+    index: LookupIndex
+    verbose: bool
+
+    def __init__(self, address: Tuple[str, int], index: LookupIndex, verbose: bool = False):
+        self.index = index
+        self.verbose = verbose
+        super().__init__(address, LookupHandler)
+
+
+def post_lookup(connection: http.client.HTTPConnection, terms: List[Any]) -> Dict[str, Any]:
+    body = json.dumps({"terms": terms}, ensure_ascii=False).encode("utf-8")
+    connection.request("POST", "/lookup", body, {"Content-Type": "application/json"})
+    response = connection.getresponse()
+    return json.loads(response.read())
+
+
+def benchmark(address: Tuple[str, int], terms: List[Term], batch_size: int, requests: int, keep_alive: bool) -> List[float]:
+    """
+    Response times in seconds of the given number of batch requests of random terms.
+
+    Either one connection is kept alive for all requests or a new connection is opened for each.
+    """
+    host, port = address
+    seconds = []
+    connection = http.client.HTTPConnection(host, port)
+    for _ in range(requests):
+        batch = [[x.text, x.reading] for x in random.choices(terms, k=batch_size)]
+        start = time.perf_counter()
+        if not keep_alive:
+            connection = http.client.HTTPConnection(host, port)
+        post_lookup(connection, batch)
+        if not keep_alive:
+            connection.close()
+        seconds.append(time.perf_counter() - start)
+    connection.close()
+    return seconds
+
+
+class TestLookup(unittest.TestCase):
+    def make_index(self) -> LookupIndex:
+        ranks = Rank.dictionary([Rank(Term("学校", "がっこう"), 1), Rank(Term("川", "かわ"), 2),
+                                 Rank(Term("学校", "がっこう"), 5), Rank(Term("テレビ", ""), 7)])
+        definitions = Definition.dictionary([
+            Definition(Term("学校", "がっこう"), "", "", 0, ("教育を施す所。",), 0, ""),
+        ])
+        return LookupIndex() \
+            .add_ranks("bccwj", ranks) \
+            .add_definitions("shinmeikai", definitions)
+
+    def test_parse_term(self):
+        self.assertEqual(Term("川", "かわ"), parse_term(["川", "かわ"]))
+        self.assertEqual(Term("川", "かわ"), parse_term({"text": "川", "reading": "かわ"}))
+        self.assertEqual(Term("テレビ", "テレビ"), parse_term("テレビ"))
+        self.assertRaises(ValueError, parse_term, 1)
+
+    def test_lookup(self):
+        school, river, unknown = self.make_index().lookup([
+            Term("学校", "がっこう"), Term("川", "かわ"), Term("瘧", "おこり"),
+        ])
+        self.assertEqual({"bccwj": 1}, school["ranks"])
+        self.assertEqual(1, len(school["definitions"]["shinmeikai"]))
+        self.assertEqual("N5", school["jlpt"])
+        self.assertEqual({"bccwj": 2}, river["ranks"])
+        self.assertEqual([], river["definitions"]["shinmeikai"])
+        self.assertEqual({"bccwj": None}, unknown["ranks"])
+        self.assertIsNone(unknown["jlpt"])
+
+        # Entries with an empty reading are found however the reading is given
+        for obj in ["テレビ", ["テレビ", ""], ["テレビ", "テレビ"]]:
+            self.assertEqual({"bccwj": 7}, self.make_index().lookup([parse_term(obj)])[0]["ranks"])
+
+    def test_server(self):
+        with LookupServer(("127.0.0.1", 0), self.make_index()) as server:
+            thread = threading.Thread(target=server.serve_forever)
+            thread.start()
+            try:
+                connection = http.client.HTTPConnection(*server.server_address)
+                # Both requests share the connection
+                for _ in range(2):
+                    results = post_lookup(connection, [["学校", "がっこう"], {"text": "川", "reading": "かわ"}])["results"]
+                    self.assertEqual([1, 2], [x["ranks"]["bccwj"] for x in results])
+
+                connection.request("POST", "/lookup", b"{}")
+                response = connection.getresponse()
+                response.read()
+                self.assertEqual(400, response.status)
+                connection.request("GET", "/missing")
+                response = connection.getresponse()
+                response.read()
+                self.assertEqual(404, response.status)
+                connection.request("GET", "/health")
+                self.assertEqual({"bccwj": 3}, json.loads(connection.getresponse().read())["ranks"])
+                connection.close()
+            finally:
+                server.shutdown()
+                thread.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve batch lookups of ranks, definitions and JLPT levels over HTTP")
+
+    parser.add_argument("--rank", type=str, action="append", default=[], help="Rank dictionary as NAME=PATH")
+    parser.add_argument("--definitions", type=str, action="append", default=[],
+                        help="Definition dictionary as NAME=PATH")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Measure response times on an ephemeral port instead of serving")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 100, 1000], help="Terms per benchmark request")
+    parser.add_argument("--requests", type=int, default=200, help="Number of benchmark requests per batch size")
+
+    args = parser.parse_args()
+
+    index = LookupIndex()
+    for argument in args.rank:
+        name, path = name_and_path(argument)
+        index.add_ranks(name, Rank.dictionary_reader().with_path(path).read())
+    for argument in args.definitions:
+        name, path = name_and_path(argument)
+        index.add_definitions(name, Definition.dictionary_reader().with_path(path).read())
+    jlpt.canonical_levels()
+
+    if not args.benchmark:
+        with LookupServer((args.host, args.port), index, args.verbose) as server:
+            print(f"Serving on http://{args.host}:{server.server_address[1]}")
+            server.serve_forever()
+    else:
+        terms = [term for ranks in index.ranks.values() for term in ranks]
+        if not terms:
+            # Synthetic rank dictionary, so that the benchmark runs without data
+            terms = random_terms(100000)
+            index.add_ranks("synthetic", Rank.dictionary([Rank(x, i) for i, x in enumerate(terms)]))
+
+        with LookupServer(("127.0.0.1", 0), index) as server:
+            thread = threading.Thread(target=server.serve_forever)
+            thread.start()
+            for batch_size in args.batch_sizes:
+                for keep_alive in [True, False]:
+                    seconds = benchmark(server.server_address, terms, batch_size, args.requests, keep_alive)
+                    quantiles = statistics.quantiles(seconds, n=100)
+                    mode = "keep-alive" if keep_alive else "new connection"
+                    print(f"{batch_size:6} terms {mode:15} p50 {quantiles[49] * 1000:7.2f} ms "
+                          f"p99 {quantiles[98] * 1000:7.2f} ms "
+                          f"{len(seconds) / sum(seconds):8.0f} req/s {batch_size * len(seconds) / sum(seconds):10.0f} terms/s")
+            server.shutdown()
+            thread.join()
@@ -0,0 +1,282 @@
+import argparse
+import random
+import re
+import timeit
+from typing import List, Dict, Iterable, Optional, Callable, Union, Tuple
+import unittest
+
+import conversion
+import term
+from term import Term
+
+TEXT = "text"
+READING = "reading"
+
+STARS = "⁑⁎"
+"""
+Importance markers of Shinmeikai headwords
+"""
+KANJI_MARK = "々"
+
+Table = Dict[int, Optional[str]]
+"""
+Translation table in the format of str.translate
+"""
+
+
+def char_table(chars: str, f: Callable[[str], str]) -> Table:
+    """
+    Translation table that maps each of the characters to its image under function f.
+
+    Function f has to act on each character independently.
+    """
+    return {ord(char): f(char) or None for char in chars}
+
+
+def compose_tables(first: Table, second: Table) -> Table:
+    """
+    Translation table that is equivalent to translating with the first table and then with the second table.
+    """
+    table = dict(second)
+    for key, value in first.items():
+        if value is not None:
+            value = value.translate(second) or None
+        table[key] = value
+    return table
+
+
+class TranslateStep:
+    table: Table
+    trigger: re.Pattern
+    """
+    Matches any character that the table changes
+    """
+
+    def __init__(self, table: Table):
+        self.table = table
+        chars = "".join(re.escape(chr(key)) for key in sorted(table))
+        self.trigger = re.compile(f"[{chars}]")
+
+    def then(self, other: "TranslateStep") -> "TranslateStep":
+        return TranslateStep(compose_tables(self.table, other.table))
+
+    def apply(self, string: str) -> str:
+        if self.trigger.search(string):
+            return string.translate(self.table)
+        else:
+            return string
+
+
+class SubstituteStep:
+    pattern: re.Pattern
+    replacement: Callable[[re.Match], str]
+    required: Optional[str]
+    """
+    Character that occurs in every match, if there is one
+    """
+
+    def __init__(self, pattern: re.Pattern, replacement: Callable[[re.Match], str], required: Optional[str] = None):
+        self.pattern = pattern
+        self.replacement = replacement
+        self.required = required
+
+    def apply(self, string: str) -> str:
+        if self.required is not None and self.required not in string:
+            return string
+        # Returns the very same string if nothing matches
+        return self.pattern.sub(self.replacement, string)
+
+
+Step = Union[TranslateStep, SubstituteStep]
+
+KATA_TO_HIRA = TranslateStep(char_table(conversion.KATAKANA + "ヿヷヸヹヺ", conversion.kata_to_hira))
+SHIN_TO_KYU = TranslateStep(char_table(conversion.SHINJITAI, conversion.shin_to_kyu))
+KYU_TO_SHIN = TranslateStep(char_table(conversion.KYUJITAI, conversion.kyu_to_shin))
+REMOVE_STARS = TranslateStep({ord(char): None for char in STARS})
+REMOVE_KANJI_MARKS = SubstituteStep(
+    re.compile(f"([^{KANJI_MARK}]?)({KANJI_MARK}+)"),
+    lambda m: m.group(1) * (1 + len(m.group(2))),
+    KANJI_MARK,
+)
+ADD_KANJI_MARKS = SubstituteStep(
+    re.compile(f"({term.KANJI.pattern})\\1+"),
+    lambda m: m.group(1) + KANJI_MARK * (len(m.group(0)) - 1),
+)
+
+
+class Normalizer:
+    """
+    Batch normalizer that applies an ordered list of transforms to the text and reading of terms.
+
+    Consecutive character translations of the same field are merged into a single translation table,
+    so each string is traversed once per table.
+    Strings without any affected character are left untouched
+    and terms whose strings are unchanged are returned as they are.
+    """
+    steps: Dict[str, List[Step]]
+
+    def __init__(self):
+        self.steps = {TEXT: [], READING: []}
+
+    def add_step(self, step: Step, fields: Iterable[str]) -> "Normalizer":
+        for field in fields:
+            steps = self.steps[field]
+            if steps and isinstance(steps[-1], TranslateStep) and isinstance(step, TranslateStep):
+                steps[-1] = steps[-1].then(step)
+            else:
+                steps.append(step)
+        return self
+
+    def add_kata_to_hira(self, fields: Iterable[str] = (READING,)) -> "Normalizer":
+        return self.add_step(KATA_TO_HIRA, fields)
+
+    def add_shin_to_kyu(self, fields: Iterable[str] = (TEXT,)) -> "Normalizer":
+        return self.add_step(SHIN_TO_KYU, fields)
+
+    def add_kyu_to_shin(self, fields: Iterable[str] = (TEXT,)) -> "Normalizer":
+        return self.add_step(KYU_TO_SHIN, fields)
+
+    def add_star_removal(self, fields: Iterable[str] = (TEXT, READING)) -> "Normalizer":
+        return self.add_step(REMOVE_STARS, fields)
+
+    def add_kanji_mark_removal(self, fields: Iterable[str] = (TEXT,)) -> "Normalizer":
+        return self.add_step(REMOVE_KANJI_MARKS, fields)
+
+    def add_kanji_marks(self, fields: Iterable[str] = (TEXT,)) -> "Normalizer":
+        return self.add_step(ADD_KANJI_MARKS, fields)
+
+    def normalize_string(self, string: str, field: str) -> str:
+        for step in self.steps[field]:
+            string = step.apply(string)
+        return string
+
+    def normalize_strings(self, strings: List[str], field: str) -> List[str]:
+        for step in self.steps[field]:
+            apply = step.apply
+            strings = [apply(string) for string in strings]
+        return strings
+
+    def __call__(self, x: Term) -> Term:
+        text = self.normalize_string(x.text, TEXT)
+        reading = self.normalize_string(x.reading, READING)
+        if text is x.text and reading is x.reading:
+            return x
+        return Term(text, reading)
+
+    def normalize(self, terms: List[Term]) -> List[Term]:
+        """
+        Normalize a whole list of terms.
+        """
+        texts = self.normalize_strings([x.text for x in terms], TEXT)
+        readings = self.normalize_strings([x.reading for x in terms], READING)
+
+        result = []
+        for x, text, reading in zip(terms, texts, readings):
+            if text is x.text and reading is x.reading:
+                result.append(x)
+            else:
+                result.append(Term(text, reading))
+        return result
+
+
+def normalize_per_call(x: Term) -> Term:
+    """
+    Reference implementation of star removal, kanji repetition mark removal and kana conversion
+    in terms of the per-call functions.
+    """
+    text = x.text
+    reading = x.reading
+    for star in STARS:
+        if star in text:
+            text = text.replace(star, "")
+        if star in reading:
+            reading = reading.replace(star, "")
+    if KANJI_MARK in text:
+        text = term.remove_repetition_marks(text, KANJI_MARK)
+    return Term(text, conversion.kata_to_hira(reading))
+
+
+def random_terms(size: int, marked: float = 0.5) -> List[Term]:
+    """
+    Random terms where the given fraction carries stars, kanji repetition marks or katakana.
+    """
+    kanji = "時刻明白赤裸代木複線小支川学校"
+    terms = []
+    for _ in range(size):
+        text = "".join(random.choices(kanji, k=random.randint(1, 5)))
+        reading = "".join(random.choices(conversion.HIRAGANA, k=random.randint(2, 8)))
+        if random.random() < marked:
+            text = "".join(random.choice([char, char + KANJI_MARK, STARS[0] + char]) for char in text)
+            reading = conversion.hira_to_kata(reading)
+        terms.append(Term(text, reading))
+    return terms
+
+
+class TestNormalizer(unittest.TestCase):
+    words = [
+        ("時時", "ときどき"),
+        ("時々", "トキドキ"),
+        ("複々々線", "ふくふくふくせん"),
+        ("⁑明々白々", "メイメイ⁎ハクハク"),
+        ("々時", "とき"),
+        ("ヷヸヹヺヿ", "ヷヸヹヺヿ"),
+        ("國學", "こくがく"),
+    ]
+
+    def test_compose_tables(self):
+        first = {ord("a"): "bc", ord("x"): None}
+        second = {ord("b"): "d", ord("c"): None, ord("y"): "z"}
+        composed = compose_tables(first, second)
+        for string in ["abcxyz", "", "aaxx", "ccyy"]:
+            self.assertEqual(string.translate(first).translate(second), string.translate(composed))
+
+    def test_per_call_equivalence(self):
+        normalizer = Normalizer() \
+            .add_star_removal() \
+            .add_kanji_mark_removal() \
+            .add_kata_to_hira()
+        terms = [Term(text, reading) for text, reading in self.words] + random_terms(1000)
+        terms = terms + [Term(x.reading, x.text) for x in terms]
+
+        expected = [normalize_per_call(x) for x in terms]
+        self.assertEqual(expected, normalizer.normalize(terms))
+        self.assertEqual(expected, [normalizer(x) for x in terms])
+
+    def test_steps(self):
+        for text, reading in self.words:
+            x = Term(text, reading)
+            self.assertEqual(Term(term.add_repetition_marks(text, term.KANJI, KANJI_MARK), reading),
+                             Normalizer().add_kanji_marks()(x))
+            self.assertEqual(Term(conversion.kyu_to_shin(text), reading), Normalizer().add_kyu_to_shin()(x))
+            self.assertEqual(Term(text, conversion.shin_to_kyu(reading)), Normalizer().add_shin_to_kyu([READING])(x))
+
+    def test_unchanged(self):
+        x = Term("学校", "がっこう")
+        normalizer = Normalizer().add_star_removal().add_kanji_mark_removal().add_kata_to_hira()
+        self.assertIs(x, normalizer(x))
+        self.assertIs(x, normalizer.normalize([x])[0])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batch normalization against per-call functions")
+
+    parser.add_argument("--size", type=int, default=100000, help="Number of random terms")
+    parser.add_argument("--marked", type=float, default=0.05, help="Fraction of terms that need normalization")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed repetitions")
+
+    args = parser.parse_args()
+
+    terms = random_terms(args.size, args.marked)
+    normalizer = Normalizer() \
+        .add_star_removal() \
+        .add_kanji_mark_removal() \
+        .add_kata_to_hira()
+
+    candidates: List[Tuple[str, Callable[[], object]]] = [
+        ("per-call functions", lambda: [normalize_per_call(x) for x in terms]),
+        ("normalizer per term", lambda: [normalizer(x) for x in terms]),
+        ("normalizer batch", lambda: normalizer.normalize(terms)),
+    ]
+    for name, f in candidates:
+        seconds = min(timeit.repeat(f, number=1, repeat=args.repeat))
+        print(f"{name:20} {seconds * 1000:8.1f} ms {args.size / seconds:12.0f} terms/s")
@@ -2,14 +2,21 @@ import argparse
 import os
 import unittest
 from datetime import date
+from typing import Dict
 
+import profiling
 import rank
+from dictionary import Dictionary
 from occurrence import OccurrenceBag, OccurrenceReader
 from rank import Rank
+from sketch import SpaceSaving
+from term import Term
 
 
-def read_suw_bag(zip_dir_path: str) -> OccurrenceBag:
-    zip_path = os.path.join(zip_dir_path, "NWJC_frequencylist_suw_ver2022_02.zip")
+ZIP_NAME = "NWJC_frequencylist_suw_ver2022_02.zip"
+
+def suw_reader(zip_dir_path: str) -> OccurrenceReader:
+    zip_path = os.path.join(zip_dir_path, ZIP_NAME)
     return OccurrenceReader() \
         .with_zip_path(zip_path) \
         .add_path("NWJC_frequencylist_suw_ver2022_02/NWJC_frequencylist_suw_ver2022_02.tsv") \
@@ -17,8 +24,28 @@ def read_suw_bag(zip_dir_path: str) -> OccurrenceBag:
         .with_skip_lines(1) \
         .with_text_index(2) \
         .with_reading_index(1) \
-        .with_count_index(6) \
-        .read()
+        .with_count_index(6)
+
+def read_suw_bag(zip_dir_path: str) -> OccurrenceBag:
+    return suw_reader(zip_dir_path).read()
+
+def read_suw_sketch(zip_dir_path: str, capacity: int) -> SpaceSaving:
+    return suw_reader(zip_dir_path).read_approximate(capacity)
+
+
+def rank_dictionary(counts: Dict[Term, int], max_rank: int) -> Dictionary:
+    it = rank.from_counts(counts)
+    it = rank.below_max_rank(it, max_rank)
+
+    return Rank.dictionary(list(it)) \
+        .with_title("ウェブ") \
+        .with_revision(f"data v2022-02 yomi v{date.today().isoformat()} SUW") \
+        .with_author("NINJAL, uncomputable") \
+        .with_url("https://github.com/uncomputable/japanese-tools") \
+        .with_description("""『国語研日本語ウェブコーパス（NWJC）』はウェブを母集団として100億語規模を目標として構築した日本語コーパスです。
+
+        https://masayu-a.github.io/NWJC/""") \
+        .with_attribution("CC BY 4.0 https://creativecommons.org/licenses/by/4.0/deed.ja")
 
 
 class TestNWJC(unittest.TestCase):
@@ -33,23 +60,19 @@ if __name__ == "__main__":
     parser.add_argument("path_in", type=str, help="Path to directory with NWJC zip file")
     parser.add_argument("path_out", type=str, help="Path of output dictionary")
     parser.add_argument("--max", type=int, default=80000, help="Maximum term frequency included in dictionary")
+    parser.add_argument("--capacity", type=int, default=None,
+                        help="Count approximately with this many counters, for example twice the maximum; exact by default")
+    profiling.add_arguments(parser)
 
     args = parser.parse_args()
 
-    bag = read_suw_bag(args.path_in)
-    it = rank.from_counts(bag.to_counts())
-    it = rank.below_max_rank(it, args.max)
-
-    Rank.dictionary(list(it)) \
-        .with_title("ウェブ") \
-        .with_revision(f"data v2022-02 yomi v{date.today().isoformat()} SUW") \
-        .with_author("NINJAL, uncomputable") \
-        .with_url("https://github.com/uncomputable/japanese-tools") \
-        .with_description("""『国語研日本語ウェブコーパス（NWJC）』はウェブを母集団として100億語規模を目標として構築した日本語コーパスです。
-
-        https://masayu-a.github.io/NWJC/""") \
-        .with_attribution("CC BY 4.0 https://creativecommons.org/licenses/by/4.0/deed.ja") \
-        .writer() \
-        .with_path(args.path_out) \
-        .in_chunks(10000) \
-        .write()
+    with profiling.from_args(args):
+        if args.capacity is None:
+            counts = read_suw_bag(args.path_in).to_counts()
+        else:
+            counts = read_suw_sketch(args.path_in, args.capacity).to_counts()
+        rank_dictionary(counts, args.max) \
+            .writer() \
+            .with_path(args.path_out) \
+            .in_chunks(10000) \
+            .write()
@@ -1,11 +1,25 @@
+import codecs
+import io
+import os
+import tempfile
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Optional, List, Dict
+from itertools import islice
+from typing import Optional, List, Dict, Iterator, Iterable, Container, Any, Callable, Tuple
 from zipfile import ZipFile
 import unittest
 
 import conversion
-from term import Term
+import profiling
+from join import canonical_key
+from pipeline import Pipeline, StageStats
+from sketch import SpaceSaving, accuracy_report
+from term import Term, TermPool
+
+LINE_BOUNDARIES = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+"""
+Characters at which str.splitlines splits
+"""
 
 
 @dataclass(frozen=True)
@@ -60,6 +74,7 @@ class OccurrenceBag:
     def __len__(self) -> int:
         return len(self.data)
 
+    @profiling.stage("occurrence.extend_overlap", records_in=lambda self, other: len(other))
     def extend_overlap(self, other: "OccurrenceBag"):
         """
         Conservatively add counts from another bag.
@@ -74,6 +89,7 @@ class OccurrenceBag:
                 total_count = max(self.data[term][source], other.data[term][source])
                 self.data[term][source] = total_count
 
+    @profiling.stage("occurrence.extend_distinct", records_in=lambda self, other: len(other))
     def extend_distinct(self, other: "OccurrenceBag"):
         """
         Boldly add counts from another bag.
@@ -88,6 +104,7 @@ class OccurrenceBag:
                 total_count = self.data[term][source] + other.data[term][source]
                 self.data[term][source] = total_count
 
+    @profiling.stage("occurrence.to_counts", records_in=len)
     def to_counts(self) -> Dict[Term, int]:
         counts: Dict[Term, int] = defaultdict(int)
         for term in self.data:
@@ -106,12 +123,29 @@ class OccurrenceReader:
     provenance_indices: List[int]
     skip_lines: int
     encoding: str
+    term_pool: Optional[TermPool] = None
+    """
+    Pool to intern the read terms in, which only saves memory when it is shared by several readers
+    """
+    key_filter: Optional[Container[Any]] = None
+    key_function: Optional[Callable[[str, str], Any]] = None
+    queue_size: Optional[int] = None
+    """
+    Size of the queues between the stages of the pipeline, or None to read sequentially
+    """
+    block_size: int
+    stage_stats: List[StageStats]
+    """
+    Statistics of the stages of the last pipelined read
+    """
 
     def __init__(self):
         self.paths = []
         self.provenance_indices = []
         self.skip_lines = 0
         self.encoding = "utf-8"
+        self.block_size = conversion.BLOCK_SIZE
+        self.stage_stats = []
 
     def with_zip_path(self, zip_path: str) -> "OccurrenceReader":
         self.zip_path = zip_path
@@ -149,13 +183,42 @@ class OccurrenceReader:
         self.encoding = encoding
         return self
 
+    def with_term_pool(self, term_pool: TermPool) -> "OccurrenceReader":
+        self.term_pool = term_pool
+        return self
+
+    def with_key_filter(self, keys: Container[Any],
+                        key_function: Optional[Callable[[str, str], Any]] = None) -> "OccurrenceReader":
+        """
+        Keep only the rows whose key is among the given keys.
+
+        The key of a row is the pair of its text and hiragana reading,
+        or the result of the key function on them, such as a canonical key.
+        Other rows are dropped before any term is created.
+        """
+        self.key_filter = keys
+        self.key_function = key_function
+        return self
+
+    def with_pipeline(self, queue_size: int = 8, block_size: int = conversion.BLOCK_SIZE) -> "OccurrenceReader":
+        """
+        Read in a pipeline of three threads that inflate and decode blocks, split them into lines,
+        and count the lines into the bag.
+
+        Inflating releases the GIL, so it overlaps with counting.
+        The statistics of each stage show which one limits the throughput.
+        """
+        self.queue_size = queue_size
+        self.block_size = block_size
+        return self
+
     def maybe_read(self) -> Optional[OccurrenceBag]:
         try:
             return self.read()
         except FileNotFoundError:
             return None
 
-    def read(self) -> OccurrenceBag:
+    def check(self):
         if len(self.paths) == 0:
             raise ValueError("Path required")
         if not self.separator:
@@ -167,9 +230,20 @@ class OccurrenceReader:
         if self.count_index is None:
             raise ValueError("Count index required")
 
+    @profiling.stage("occurrence.read")
+    def read(self) -> OccurrenceBag:
+        self.check()
         bag = OccurrenceBag()
 
-        if self.zip_path is not None:
+        if self.queue_size is not None:
+            pipeline = Pipeline(self.queue_size) \
+                .add_stage("inflate", self.decoded_blocks) \
+                .add_stage("split", self.split_lines) \
+                .add_stage("count", lambda it: (self.update_bag_lines(lines, bag) for lines in it))
+            for _ in pipeline.run(iter(range(len(self.paths)))):
+                pass
+            self.stage_stats = pipeline.stats
+        elif self.zip_path is not None:
             with ZipFile(self.zip_path, mode="r") as zip_file:
                 for path in self.paths:
                     with zip_file.open(path, "r") as f:
@@ -183,24 +257,124 @@ class OccurrenceReader:
 
         return bag
 
+    def decoded_blocks(self, file_indices: Iterator[int]) -> Iterator[Tuple[int, str, bool]]:
+        """
+        Iterate over the file index, decoded text and whether it is the last block of the file
+        of each block of the given files.
+        """
+        zip_file = ZipFile(self.zip_path, mode="r") if self.zip_path is not None else None
+        try:
+            for file_index in file_indices:
+                path = self.paths[file_index]
+                decoder = codecs.getincrementaldecoder(self.encoding)()
+                with zip_file.open(path, "r") if zip_file is not None else open(path, "rb") as f:
+                    while True:
+                        data = f.read(self.block_size)
+                        yield file_index, decoder.decode(data, final=not data), not data
+                        if not data:
+                            break
+        finally:
+            if zip_file is not None:
+                zip_file.close()
+
+    def split_lines(self, blocks: Iterator[Tuple[int, str, bool]]) -> Iterator[List[str]]:
+        """
+        Split decoded blocks into batches of complete lines, as str.splitlines would split each file,
+        and drop the skipped lines at the start of each file.
+        """
+        carry = ""
+        skip = self.skip_lines
+        for _file_index, text, final in blocks:
+            text = carry + text
+            lines = text.splitlines()
+            carry = ""
+            # The last line may continue in the next block, and so may the line break "\r\n"
+            if not final and lines and (text[-1] not in LINE_BOUNDARIES or text[-1] == "\r"):
+                carry = lines.pop() + ("\r" if text[-1] == "\r" else "")
+            if skip:
+                dropped = min(skip, len(lines))
+                del lines[:dropped]
+                skip -= dropped
+            if final:
+                skip = self.skip_lines
+            if lines:
+                yield lines
+
+    def lines(self) -> Iterator[str]:
+        """
+        Stream the lines of all files, except for the skipped lines at the start of each file.
+        """
+        if self.zip_path is not None:
+            with ZipFile(self.zip_path, mode="r") as zip_file:
+                for path in self.paths:
+                    with zip_file.open(path, "r") as f:
+                        yield from islice(io.TextIOWrapper(f, encoding=self.encoding), self.skip_lines, None)
+        else:
+            for path in self.paths:
+                with open(path, "r", encoding=self.encoding) as f:
+                    yield from islice(f, self.skip_lines, None)
+
+    @profiling.stage("occurrence.read_approximate")
+    def read_approximate(self, capacity: int) -> SpaceSaving:
+        """
+        Count terms approximately, keeping at most capacity counters.
+
+        Lines are streamed, so memory does not grow with the size of the source.
+        Counts of all provenances of a term are summed, as in OccurrenceBag.to_counts.
+        To rank the top n terms reliably, the capacity should be a multiple of n.
+        """
+        self.check()
+        assert self.text_index is not None
+        assert self.reading_index is not None
+        assert self.count_index is not None
+
+        key_filter = self.key_filter
+        key_function = self.key_function
+
+        sketch = SpaceSaving(capacity)
+        line_count = 0
+        for line_count, line in enumerate(self.lines(), 1):
+            split_line = line.rstrip("\r\n").split(self.separator)
+            text = split_line[self.text_index]
+            reading = conversion.kata_to_hira(split_line[self.reading_index]) or text
+            if key_filter is not None:
+                key = (text, reading) if key_function is None else key_function(text, reading)
+                if key not in key_filter:
+                    continue
+            # Terms are not pooled, because the pool would hold every term of the source
+            sketch.insert(Term(text, reading), int(split_line[self.count_index]))
+        profiling.count_in(line_count)
+        return sketch
+
     def update_bag(self, content: str, bag: OccurrenceBag):
+        self.update_bag_lines(islice(content.splitlines(), self.skip_lines, None), bag)
+
+    def update_bag_lines(self, lines: Iterable[str], bag: OccurrenceBag):
         assert self.text_index is not None
         assert self.reading_index is not None
         assert self.count_index is not None
 
-        for (line_index, line) in enumerate(content.splitlines()):
-            if line_index < self.skip_lines:
-                continue
+        term_pool = self.term_pool
+        key_filter = self.key_filter
+        key_function = self.key_function
 
+        # Lines are counted as they go by, so that the lines need not be copied into a list
+        line_count = 0
+        for line_count, line in enumerate(lines, 1):
             split_line = line.split(self.separator)
 
             text = split_line[self.text_index]
-            reading = conversion.kata_to_hira(split_line[self.reading_index])
-            term = Term(text, reading).with_default_reading()
+            reading = conversion.kata_to_hira(split_line[self.reading_index]) or text
+            if key_filter is not None:
+                key = (text, reading) if key_function is None else key_function(text, reading)
+                if key not in key_filter:
+                    continue
+            term = Term(text, reading) if term_pool is None else term_pool.get(text, reading)
             provenance = ",".join(map(lambda index: split_line[index], self.provenance_indices))
             occurrence = Occurrence(term, provenance)
             count = int(split_line[self.count_index])
             bag.insert(occurrence, count)
+        profiling.count_in(line_count)
 
 
 class TestOccurrenceBag(unittest.TestCase):
@@ -216,6 +390,99 @@ class TestOccurrenceBag(unittest.TestCase):
             .read()
         self.assertEqual(175634, len(occurrences))
 
+    def test_read_approximate(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "counts.tsv")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("text\treading\tcount\n")
+                for i in range(1000):
+                    f.write(f"語{i % 300}\tゴ{i % 300}\t{1000 // (i + 1) + 1}\n")
+
+            reader = OccurrenceReader() \
+                .add_path(path) \
+                .with_separator("\t") \
+                .with_skip_lines(1) \
+                .with_text_index(0) \
+                .with_reading_index(1) \
+                .with_count_index(2)
+            exact = reader.read().to_counts()
+            sketch = reader.read_approximate(200)
+
+            pool = TermPool()
+            self.assertEqual(exact, reader.with_term_pool(pool).read().to_counts())
+            self.assertEqual(300, len(pool))
+
+            report = accuracy_report(sketch, exact, 50)
+            self.assertEqual(1.0, report["recall"])
+            self.assertTrue(report["within_bounds"])
+            self.assertEqual(exact[Term("語0", "ご0")], sketch.to_counts()[Term("語0", "ご0")])
+
+            with profiling.Profiler(memory=False) as profiler:
+                reader.read()
+                reader.read_approximate(200)
+            self.assertEqual(1000, profiler.stages["occurrence.read"].records_in)
+            self.assertEqual(1000, profiler.stages["occurrence.read_approximate"].records_in)
+
+    def test_key_filter(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "counts.tsv")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("text\treading\tcount\n國學\tコクガク\t3\n国学\tコクガク\t5\n学校\tガッコウ\t7\n")
+
+            def reader() -> OccurrenceReader:
+                return OccurrenceReader() \
+                    .add_path(path) \
+                    .with_separator("\t") \
+                    .with_skip_lines(1) \
+                    .with_text_index(0) \
+                    .with_reading_index(1) \
+                    .with_count_index(2)
+
+            counts = reader().with_key_filter({("国学", "こくがく")}).read().to_counts()
+            self.assertEqual({Term("国学", "こくがく"): 5}, counts)
+
+            counts = reader().with_key_filter({("国学", "こくがく")}, canonical_key).read().to_counts()
+            self.assertEqual({Term("國學", "こくがく"): 3, Term("国学", "こくがく"): 5}, counts)
+
+            sketch = reader().with_key_filter({("学校", "がっこう")}).read_approximate(10)
+            self.assertEqual({Term("学校", "がっこう"): 7}, sketch.to_counts())
+
+    def test_pipeline(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, f"counts{i}.tsv") for i in range(2)]
+            for i, path in enumerate(paths):
+                with open(path, "w", encoding="utf-16", newline="") as f:
+                    f.write("text\treading\tcount\r\n")
+                    for j in range(300):
+                        f.write(f"語{j % 70}\tゴ{j % 70}\t{i + j}\t出所{j % 3}\r\n")
+            zip_path = os.path.join(directory, "counts.zip")
+            with ZipFile(zip_path, mode="w") as zip_file:
+                for path in paths:
+                    zip_file.write(path, os.path.basename(path))
+
+            def reader() -> OccurrenceReader:
+                return OccurrenceReader() \
+                    .with_separator("\t") \
+                    .with_skip_lines(1) \
+                    .with_text_index(0) \
+                    .with_reading_index(1) \
+                    .with_count_index(2) \
+                    .add_provenance_index(3) \
+                    .with_encoding("utf-16")
+
+            expected = reader().add_path(paths[0]).add_path(paths[1]).read().data
+            # Odd block sizes split characters, lines and line breaks
+            for block_size in [1, 7, 64, 1 << 20]:
+                pipelined = reader().add_path(paths[0]).add_path(paths[1]).with_pipeline(2, block_size)
+                self.assertEqual(expected, pipelined.read().data)
+                self.assertEqual(["inflate", "split", "count"], [x.name for x in pipelined.stage_stats])
+
+                zipped = reader().with_zip_path(zip_path).add_path("counts0.tsv").add_path("counts1.tsv") \
+                    .with_pipeline(2, block_size)
+                self.assertEqual(expected, zipped.read().data)
+
+            self.assertIsNone(reader().add_path(os.path.join(directory, "missing.tsv")).with_pipeline().maybe_read())
+
     def test_extend_overlap(self):
         a = OccurrenceBag()
         a.insert(Occurrence(Term("ア", "あ"), "ある出所"), 10)
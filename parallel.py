@@ -0,0 +1,54 @@
+from functools import partial
+from typing import List, Any, Iterator
+import unittest
+
+import definition
+from definition import Definition
+from pipeline import Stage
+from term import Term
+from workers import chunked, imap_ordered
+
+
+def run_stages_on_chunk(stages: List[Stage], chunk: List[Any]) -> List[Any]:
+    it = iter(chunk)
+    for stage in stages:
+        it = stage(it)
+    return list(it)
+
+
+def run_stages(it: Iterator[Any], stages: List[Stage], processes: int = 1, chunk_size: int = 10000) -> Iterator[Any]:
+    """
+    Run a list of per-record stages on chunks of the iterator in a process pool.
+
+    The output order equals the order of the sequential pipeline.
+    Only stages that look at one record at a time are allowed,
+    because each chunk is processed in isolation.
+    Sorting or numbering stages belong before or after this one.
+
+    With a single process, the stages run sequentially in the current process.
+
+    Iterator[record] → Iterator[record]
+    """
+    if processes <= 1:
+        for stage in stages:
+            it = stage(it)
+        return it
+
+    f = partial(run_stages_on_chunk, stages)
+    chunks = imap_ordered(f, chunked(it, chunk_size), processes)
+    return (x for chunk in chunks for x in chunk)
+
+
+class TestParallel(unittest.TestCase):
+    def test_run_stages(self):
+        data = [Definition(Term(f"時時{i}", ""), "", "", 0, (f"定義{i}",), i, "") for i in range(100)]
+        stages = [
+            partial(definition.map_term, f=Term.with_default_reading),
+            partial(definition.copy_term, f=Term.with_kanji_repetition_marks),
+        ]
+        expected = run_stages_on_chunk(stages, data)
+
+        for processes in [1, 2]:
+            for chunk_size in [1, 7, 1000]:
+                output = list(run_stages(iter(data), stages, processes, chunk_size))
+                self.assertEqual(expected, output)
@@ -0,0 +1,239 @@
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Dict
+import unittest
+
+Stage = Callable[[Iterator[Any]], Iterator[Any]]
+"""
+Pipeline stage that maps an iterator of records to another iterator of records.
+
+Stages of a Pipeline run in threads of the current process, so any callable will do.
+Stages passed to parallel.run_stages run in a process pool and have to be picklable,
+for example module-level functions or partial applications of them.
+"""
+
+DONE = object()
+"""
+Marks the end of the items in a queue
+"""
+POLL_SECONDS = 0.1
+
+
+class Failure:
+    """
+    Exception raised by a stage, passed downstream in place of items.
+    """
+    exception: BaseException
+
+    def __init__(self, exception: BaseException):
+        self.exception = exception
+
+
+class Stopped(Exception):
+    pass
+
+
+class StageStats:
+    """
+    Where the thread of a stage spent its time.
+
+    A stage that is busy most of the time while the others wait limits the throughput.
+    Deep output queues mean that the next stage cannot keep up,
+    empty ones that this stage cannot.
+    """
+    name: str
+    items: int
+    """
+    Number of items produced
+    """
+    busy_seconds: float
+    wait_seconds: float
+    """
+    Time spent waiting for input
+    """
+    blocked_seconds: float
+    """
+    Time spent waiting for room in the full output queue
+    """
+    max_depth: int
+    depth_total: int
+
+    def __init__(self, name: str):
+        self.name = name
+        self.items = 0
+        self.busy_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.blocked_seconds = 0.0
+        self.max_depth = 0
+        self.depth_total = 0
+
+    def mean_depth(self) -> float:
+        return self.depth_total / self.items if self.items else 0.0
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "items": self.items,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "wait_seconds": round(self.wait_seconds, 3),
+            "blocked_seconds": round(self.blocked_seconds, 3),
+            "max_depth": self.max_depth,
+            "mean_depth": round(self.mean_depth(), 2),
+        }
+
+    def __str__(self) -> str:
+        return f"{self.name:12} {self.items:8} items busy {self.busy_seconds:7.2f} s " \
+               f"wait {self.wait_seconds:7.2f} s blocked {self.blocked_seconds:7.2f} s " \
+               f"queue mean {self.mean_depth():5.1f} max {self.max_depth:3}"
+
+
+class Pipeline:
+    """
+    Producer/consumer pipeline that runs each stage in its own thread, connected by bounded queues.
+
+    Stages overlap where they release the GIL, as zlib inflation and file reads do.
+    Items keep their order.
+    An exception in any stage stops all stages and is raised to the consumer.
+    """
+    stages: List[Tuple[str, Stage]]
+    queue_size: int
+    stats: List[StageStats]
+    """
+    Statistics of the last run, filled in while it runs
+    """
+
+    def __init__(self, queue_size: int = 8):
+        if queue_size < 1:
+            raise ValueError("Queue size must be positive")
+        self.stages = []
+        self.queue_size = queue_size
+        self.stats = []
+
+    def add_stage(self, name: str, stage: Stage) -> "Pipeline":
+        self.stages.append((name, stage))
+        return self
+
+    def run(self, it: Iterator[Any]) -> Iterator[Any]:
+        queues: List[queue.Queue] = [queue.Queue(self.queue_size) for _ in self.stages]
+        stop = threading.Event()
+        self.stats = [StageStats(name) for name, _stage in self.stages]
+
+        threads = []
+        for i, (_name, stage) in enumerate(self.stages):
+            q_in = None if i == 0 else queues[i - 1]
+            args = (stage, it if i == 0 else None, q_in, queues[i], stop, self.stats[i])
+            threads.append(threading.Thread(target=run_stage, args=args, daemon=True))
+        for thread in threads:
+            thread.start()
+
+        try:
+            q_out = queues[-1] if queues else None
+            if q_out is None:
+                yield from it
+                return
+            while True:
+                item = q_out.get()
+                if item is DONE:
+                    break
+                if isinstance(item, Failure):
+                    raise item.exception
+                yield item
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+
+def put(q: queue.Queue, item: Any, stop: threading.Event):
+    while True:
+        try:
+            q.put(item, timeout=POLL_SECONDS)
+            return
+        except queue.Full:
+            if stop.is_set():
+                raise Stopped()
+
+
+def run_stage(stage: Stage, source: Optional[Iterator[Any]], q_in: Optional[queue.Queue], q_out: queue.Queue,
+              stop: threading.Event, stats: StageStats):
+    def inputs() -> Iterator[Any]:
+        assert q_in is not None
+        while True:
+            start = time.perf_counter()
+            while True:
+                try:
+                    item = q_in.get(timeout=POLL_SECONDS)
+                    break
+                except queue.Empty:
+                    if stop.is_set():
+                        raise Stopped()
+            stats.wait_seconds += time.perf_counter() - start
+            if item is DONE:
+                return
+            if isinstance(item, Failure):
+                raise Stopped(item)
+            yield item
+
+    start = time.perf_counter()
+    try:
+        try:
+            for item in stage(source if q_in is None else inputs()):
+                put_start = time.perf_counter()
+                put(q_out, item, stop)
+                stats.blocked_seconds += time.perf_counter() - put_start
+                stats.items += 1
+                depth = q_out.qsize()
+                stats.depth_total += depth
+                stats.max_depth = max(stats.max_depth, depth)
+            put(q_out, DONE, stop)
+        except Stopped as e:
+            # Forward the failure of an upstream stage
+            if e.args:
+                put(q_out, e.args[0], stop)
+        except Exception as e:
+            put(q_out, Failure(e), stop)
+    except Stopped:
+        pass
+    finally:
+        stats.busy_seconds = time.perf_counter() - start - stats.wait_seconds - stats.blocked_seconds
+
+
+def double(it: Iterator[int]) -> Iterator[int]:
+    for x in it:
+        yield 2 * x
+
+
+def fail_at_three(it: Iterator[int]) -> Iterator[int]:
+    for x in it:
+        if x == 3:
+            raise ValueError("Three")
+        yield x
+
+
+class TestPipeline(unittest.TestCase):
+    def test_run(self):
+        pipeline = Pipeline(2) \
+            .add_stage("double", double) \
+            .add_stage("double again", double)
+        self.assertEqual([4 * x for x in range(100)], list(pipeline.run(iter(range(100)))))
+        self.assertEqual([100, 100], [stats.items for stats in pipeline.stats])
+        self.assertLessEqual(max(stats.max_depth for stats in pipeline.stats), 2)
+
+        self.assertEqual([1, 2], list(Pipeline().run(iter([1, 2]))))
+
+    def test_failure(self):
+        pipeline = Pipeline(2) \
+            .add_stage("fail", fail_at_three) \
+            .add_stage("double", double)
+        result = []
+        with self.assertRaises(ValueError):
+            for x in pipeline.run(iter(range(1000))):
+                result.append(x)
+        self.assertEqual([0, 2, 4], result)
+
+    def test_early_exit(self):
+        pipeline = Pipeline(1).add_stage("double", double)
+        for x in pipeline.run(iter(range(1000))):
+            break
+        self.assertLess(pipeline.stats[0].items, 1000)
@@ -0,0 +1,362 @@
+import argparse
+import contextlib
+import cProfile
+import functools
+import json
+import pstats
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, TypeVar
+import unittest
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class StageProfile:
+    """
+    Measurements of one instrumented stage, summed over all its calls.
+    """
+    name: str
+    calls: int
+    seconds: float
+    """
+    Wall time inside the stage, including the stages it called
+    """
+    self_seconds: float
+    """
+    Wall time inside the stage, excluding the stages it called
+    """
+    records_in: int
+    records_out: int
+    peak_bytes: int
+    """
+    Peak growth of traced memory during any call of the stage
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.seconds = 0.0
+        self.self_seconds = 0.0
+        self.records_in = 0
+        self.records_out = 0
+        self.peak_bytes = 0
+
+    def records_per_second(self) -> float:
+        return max(self.records_in, self.records_out) / self.seconds if self.seconds else 0.0
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "seconds": round(self.seconds, 4),
+            "self_seconds": round(self.self_seconds, 4),
+            "records_in": self.records_in,
+            "records_out": self.records_out,
+            "records_per_second": round(self.records_per_second()),
+            "peak_bytes": self.peak_bytes,
+        }
+
+    def __str__(self) -> str:
+        return f"{self.name:32} {self.calls:6} {self.seconds:8.2f} {self.self_seconds:8.2f} " \
+               f"{self.records_in:9} {self.records_out:9} {self.records_per_second():10.0f} " \
+               f"{self.peak_bytes / 1024 / 1024:8.1f}"
+
+
+class Frame:
+    profile: StageProfile
+    memory: bool
+    """
+    Whether the frame traces the memory peak
+    """
+    start: float
+    child_seconds: float
+    start_bytes: int
+    peak_bytes: int
+    """
+    Peak of traced memory before the last reset by a nested stage
+    """
+
+    def __init__(self, profile: StageProfile, memory: bool):
+        self.profile = profile
+        self.memory = memory
+        self.start_bytes = 0
+        self.peak_bytes = 0
+        self.child_seconds = 0.0
+        self.start = time.perf_counter()
+
+
+class Profiler:
+    """
+    Records the stages that run while the profiler is active.
+
+    Instrumented functions cost one global lookup while no profiler is active.
+    Stages are kept on one stack for the whole process,
+    so records counted by the pipeline threads of OccurrenceReader go to the read that started them.
+    Tracing memory and capturing cProfile both slow the run down, so timings are only comparable
+    between runs with the same options.
+    """
+    path: Optional[str]
+    memory: bool
+    stages: Dict[str, StageProfile]
+    stack: List[Frame]
+    cprofile: Optional[cProfile.Profile]
+    start: float
+    seconds: float
+
+    def __init__(self, path: Optional[str] = None, memory: bool = True, cprofile: bool = False):
+        self.path = path
+        self.memory = memory
+        self.stages = dict()
+        self.stack = []
+        self.cprofile = cProfile.Profile() if cprofile else None
+        self.start = 0.0
+        self.seconds = 0.0
+
+    def __enter__(self) -> "Profiler":
+        global _profiler
+        if _profiler is not None:
+            raise RuntimeError("Another profiler is active")
+        _profiler = self
+        if self.memory:
+            tracemalloc.start()
+        if self.cprofile is not None:
+            self.cprofile.enable()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        global _profiler
+        self.seconds = time.perf_counter() - self.start
+        if self.cprofile is not None:
+            self.cprofile.disable()
+        if self.memory:
+            tracemalloc.stop()
+        _profiler = None
+
+        if self.path is not None:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self.report(), f, indent=1)
+            print(self.summary(), file=sys.stderr)
+
+    def get(self, name: str) -> StageProfile:
+        profile = self.stages.get(name)
+        if profile is None:
+            profile = self.stages[name] = StageProfile(name)
+        return profile
+
+    def enter(self, name: str, call: bool = True, memory: bool = True) -> Frame:
+        profile = self.get(name)
+        if call:
+            profile.calls += 1
+
+        frame = Frame(profile, self.memory and memory)
+        if frame.memory:
+            current, peak = tracemalloc.get_traced_memory()
+            if self.stack:
+                parent = self.stack[-1]
+                parent.peak_bytes = max(parent.peak_bytes, peak)
+            tracemalloc.reset_peak()
+            frame.start_bytes = frame.peak_bytes = current
+        self.stack.append(frame)
+        return frame
+
+    def exit(self, frame: Frame):
+        seconds = time.perf_counter() - frame.start
+        popped = self.stack.pop()
+        assert popped is frame
+
+        profile = frame.profile
+        profile.seconds += seconds
+        profile.self_seconds += seconds - frame.child_seconds
+        if frame.memory:
+            peak = max(frame.peak_bytes, tracemalloc.get_traced_memory()[1])
+            profile.peak_bytes = max(profile.peak_bytes, peak - frame.start_bytes)
+        if self.stack:
+            parent = self.stack[-1]
+            parent.child_seconds += seconds
+            if frame.memory:
+                parent.peak_bytes = max(parent.peak_bytes, peak)
+
+    def count_in(self, records: int):
+        if self.stack:
+            self.stack[-1].profile.records_in += records
+
+    def report(self, functions: int = 30) -> Dict[str, Any]:
+        stages = sorted(self.stages.values(), key=lambda x: x.self_seconds, reverse=True)
+        obj: Dict[str, Any] = {
+            "seconds": round(self.seconds, 4),
+            "stages": [x.to_json() for x in stages],
+        }
+        if self.cprofile is not None:
+            stats = pstats.Stats(self.cprofile)
+            rows = sorted(stats.stats.items(), key=lambda x: x[1][2], reverse=True)[:functions]  # type: ignore
+            obj["functions"] = [
+                {"function": f"{path}:{line}({name})", "calls": calls, "self_seconds": round(tottime, 4),
+                 "seconds": round(cumtime, 4)}
+                for (path, line, name), (_primitive, calls, tottime, cumtime, _callers) in rows
+            ]
+        return obj
+
+    def summary(self, functions: int = 10) -> str:
+        lines = [f"{'stage':32} {'calls':>6} {'total s':>8} {'self s':>8} {'in':>9} {'out':>9} "
+                 f"{'records/s':>10} {'peak MB':>8}"]
+        lines.extend(str(x) for x in sorted(self.stages.values(), key=lambda x: x.self_seconds, reverse=True))
+        lines.append(f"{'run':32} {'':6} {self.seconds:8.2f}")
+        for x in self.report(functions).get("functions", []):
+            lines.append(f"{x['self_seconds']:8.2f} s {x['calls']:9} calls {x['function']}")
+        return "\n".join(lines)
+
+
+_profiler: Optional[Profiler] = None
+
+
+def count_in(records: int):
+    """
+    Add to the input records of the innermost stage, if profiling.
+    """
+    if _profiler is not None:
+        _profiler.count_in(records)
+
+
+def sized(x: Any) -> Optional[int]:
+    try:
+        return len(x)
+    except TypeError:
+        return None
+
+
+def stage(name: str, records_in: Optional[Callable[..., int]] = None) -> Callable[[F], F]:
+    """
+    Instrument a function as a stage.
+
+    Input records are counted by applying records_in to the arguments of the call,
+    output records are the length of the result, if it has one.
+    """
+    def decorator(function: F) -> F:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            profiler = _profiler
+            if profiler is None:
+                return function(*args, **kwargs)
+
+            frame = profiler.enter(name)
+            try:
+                result = function(*args, **kwargs)
+            finally:
+                profiler.exit(frame)
+            if records_in is not None:
+                frame.profile.records_in += records_in(*args, **kwargs)
+            frame.profile.records_out += sized(result) or 0
+            return result
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
+def iterator_stage(name: str) -> Callable[[F], F]:
+    """
+    Instrument a function that maps an iterator or collection to an iterator as a stage.
+
+    Only the time spent producing each record is attributed to the stage,
+    not the time the consumer spends between records.
+    Memory is not traced per record, which would cost more than most stages themselves.
+    """
+    def decorator(function: F) -> F:
+        @functools.wraps(function)
+        def wrapper(it: Any, *args, **kwargs):
+            profiler = _profiler
+            if profiler is None:
+                return function(it, *args, **kwargs)
+
+            profile = profiler.get(name)
+            profile.calls += 1
+            length = sized(it)
+            if length is not None:
+                profile.records_in += length
+            else:
+                it = counted(it, profile)
+            return timed(function(it, *args, **kwargs), profiler, profile)
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
+def counted(it: Iterator[Any], profile: StageProfile) -> Iterator[Any]:
+    for x in it:
+        profile.records_in += 1
+        yield x
+
+
+def timed(it: Iterator[Any], profiler: Profiler, profile: StageProfile) -> Iterator[Any]:
+    while True:
+        frame = profiler.enter(profile.name, call=False, memory=False)
+        try:
+            x = next(it)
+        except StopIteration:
+            return
+        finally:
+            profiler.exit(frame)
+        profile.records_out += 1
+        yield x
+
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--profile", type=str, default=None,
+                        help="Path of JSON report of the time, records and memory of each stage")
+    parser.add_argument("--cprofile", action="store_true", help="Add the slowest functions to the profile")
+    parser.add_argument("--no-trace-memory", action="store_true",
+                        help="Profile without tracing memory, which slows down allocation several times")
+
+
+def from_args(args: argparse.Namespace) -> ContextManager[Any]:
+    if args.profile is None:
+        return contextlib.nullcontext()
+    return Profiler(args.profile, memory=not args.no_trace_memory, cprofile=args.cprofile)
+
+
+@stage("test.outer", records_in=lambda xs: len(xs))
+def outer(xs: List[int]) -> List[int]:
+    inner(xs)
+    return [x for x in xs if x % 2]
+
+
+@stage("test.inner")
+def inner(xs: List[int]) -> List[int]:
+    count_in(len(xs))
+    return list(range(100000))
+
+
+@iterator_stage("test.evens")
+def evens(it: Iterator[int]) -> Iterator[int]:
+    return (x for x in it if x % 2 == 0)
+
+
+class TestProfiler(unittest.TestCase):
+    def test_stage(self):
+        self.assertEqual([1], outer([1, 2]))
+        with Profiler(cprofile=True) as profiler:
+            outer(list(range(10)))
+            outer([1])
+
+        self.assertEqual({"test.outer", "test.inner"}, set(profiler.stages))
+        a, b = profiler.stages["test.outer"], profiler.stages["test.inner"]
+        self.assertEqual((2, 11, 6), (a.calls, a.records_in, a.records_out))
+        self.assertEqual((2, 11, 200000), (b.calls, b.records_in, b.records_out))
+        self.assertLessEqual(a.self_seconds, a.seconds)
+        self.assertGreaterEqual(a.seconds, b.seconds)
+        # The inner list is still traced at the peak of the outer stage
+        self.assertGreater(b.peak_bytes, 800000)
+        self.assertGreaterEqual(a.peak_bytes, b.peak_bytes)
+        self.assertIn("functions", profiler.report())
+
+    def test_iterator_stage(self):
+        with Profiler(memory=False) as profiler:
+            self.assertEqual([0, 2, 4], list(evens(iter(range(5)))))
+            self.assertEqual([0], list(evens([0, 1])))
+        profile = profiler.stages["test.evens"]
+        self.assertEqual((2, 7, 4), (profile.calls, profile.records_in, profile.records_out))
+        self.assertIn("test.evens", profiler.summary())
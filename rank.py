@@ -1,12 +1,15 @@
 import argparse
 import json
+import os
+import tempfile
 from dataclasses import dataclass
 from datetime import date
 from typing import List, Any, Dict, Optional, Iterator, Callable
 import unittest
 
+import profiling
 from dictionary import Dictionary, DictionaryReader
-from term import Term
+from term import Term, TermPool
 
 
 @dataclass(frozen=True)
@@ -29,7 +32,7 @@ class Rank:
         return f"{self.term}#{self.rank}"
 
     @classmethod
-    def from_json(cls, obj: Any) -> "Rank":
+    def from_json(cls, obj: Any, term_pool: Optional[TermPool] = None) -> "Rank":
         text, mode, second_obj = obj
         assert isinstance(text, str)
         assert mode == "freq"
@@ -54,7 +57,8 @@ class Rank:
             reading = text
             rank = parse_frequency(second_obj)
 
-        return Rank(Term(text, reading), rank)
+        term = Term(text, reading) if term_pool is None else term_pool.get(text, reading)
+        return Rank(term, rank)
 
     def to_json(self) -> Any:
         return [
@@ -77,18 +81,21 @@ class Rank:
         return DictionaryReader(Rank, "term_meta_bank")
 
 
+@profiling.iterator_stage("rank.from_counts")
 def from_counts(counts: Dict[Term, int]) -> Iterator[Rank]:
     sorted_counts = sorted(counts.items(), key=lambda x: x[1], reverse=True)
     for rank, (term, _count) in enumerate(sorted_counts):
         yield Rank(term, rank)
 
 
+@profiling.iterator_stage("rank.below_max_rank")
 def below_max_rank(it: Iterator[Rank], max_rank: int) -> Iterator[Rank]:
     for x in it:
         if x.rank < max_rank:
             yield x
 
 
+@profiling.iterator_stage("rank.map_term")
 def map_term(it: Iterator[Rank], f: Callable[[Term], Term]) -> Iterator[Rank]:
     def helper(x: Rank) -> Rank:
         return Rank(f(x.term), x.rank)
@@ -96,6 +103,7 @@ def map_term(it: Iterator[Rank], f: Callable[[Term], Term]) -> Iterator[Rank]:
     return map(helper, it)
 
 
+@profiling.iterator_stage("rank.copy_term")
 def copy_term(it: Iterator[Rank], f: Callable[[Term], Optional[Term]]) -> Iterator[Rank]:
     for x in it:
         yield x
@@ -104,6 +112,16 @@ def copy_term(it: Iterator[Rank], f: Callable[[Term], Optional[Term]]) -> Iterat
             yield Rank(mapped_term, x.rank)
 
 
+def convert_dictionary(dic: Dictionary, max_rank: int) -> Dictionary:
+    it = iter(dic)
+    it = below_max_rank(it, max_rank)
+    it = copy_term(it, Term.update_kanji_repetition_marks)
+
+    return dic \
+        .with_data_same_type(list(it)) \
+        .with_revision(f"{dic.revision} converted {date.today().isoformat()}")
+
+
 class TestRank(unittest.TestCase):
     def test_impl(self):
         a = Rank(Term("ア", "あ"), 0)
@@ -153,6 +171,16 @@ class TestRank(unittest.TestCase):
             .in_chunks(10000) \
             .write()
 
+    def test_read_pipeline(self):
+        dic = Rank.dictionary([Rank(Term(f"語{i}", f"ご{i}" if i % 2 else ""), i) for i in range(100)])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "ranks.zip")
+            dic.writer().with_path(path).in_chunks(7).write()
+            expected = Rank.dictionary_reader().with_path(path).read()
+            reader = Rank.dictionary_reader().with_path(path).with_pipeline(2)
+            self.assertEqual(expected, reader.read())
+        self.assertEqual([15, 15, 15], [x.items for x in reader.stage_stats])
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Convert frequency dictionary for Yomichan")
@@ -160,20 +188,16 @@ if __name__ == "__main__":
     parser.add_argument("path_in", type=str, help="Path to input dictionary")
     parser.add_argument("path_out", type=str, help="Path of output dictionary")
     parser.add_argument("--max", type=int, default=80000, help="Maximum term frequency in output")
+    profiling.add_arguments(parser)
 
     args = parser.parse_args()
 
-    dic = Rank.dictionary_reader() \
-        .with_path(args.path_in) \
-        .read()
-
-    it = iter(dic)
-    it = below_max_rank(it, args.max)
-    it = copy_term(it, Term.update_kanji_repetition_marks)
+    with profiling.from_args(args):
+        dic = Rank.dictionary_reader() \
+            .with_path(args.path_in) \
+            .read()
 
-    dic \
-        .with_data_same_type(list(it)) \
-        .with_revision(f"{dic.revision} converted {date.today().isoformat()}") \
-        .writer() \
-        .with_path(args.path_out) \
-        .write()
+        convert_dictionary(dic, args.max) \
+            .writer() \
+            .with_path(args.path_out) \
+            .write()
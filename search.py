@@ -0,0 +1,280 @@
+import argparse
+import json
+import os
+import tempfile
+from array import array
+from collections import defaultdict
+from typing import List, Dict, Iterator, Optional, Set
+import unittest
+
+import profiling
+from definition import Definition
+from dictionary import Dictionary
+from term import Term
+
+SEPARATOR = "\0"
+"""
+Separator between the glosses of one definition.
+
+Glosses and queries never contain it, so no match spans two glosses.
+"""
+MAGIC = b"JTNGRAM1"
+
+
+def gloss_text(x: Definition) -> str:
+    return SEPARATOR.join(x.definitions)
+
+
+def ngrams(string: str, n: int) -> Iterator[str]:
+    for i in range(len(string) - n + 1):
+        yield string[i:i + n]
+
+
+def index_path(zip_path: str) -> str:
+    """
+    Path of the persisted index that belongs to the given dictionary zip.
+    """
+    return f"{zip_path}.ngram"
+
+
+def fingerprint(zip_path: str) -> List[int]:
+    stat = os.stat(zip_path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class DefinitionIndex:
+    """
+    Character n-gram inverted index over the glosses of a definition dictionary.
+
+    Each n-gram is mapped to the sorted positions of the definitions whose glosses contain it.
+    Posting lists are compact unsigned integer arrays.
+
+    Queries intersect the posting lists of the query n-grams
+    and verify the remaining candidates against the actual glosses.
+    """
+    data: List[Definition]
+    n: int
+    postings: Dict[str, array]
+
+    def __init__(self, data: List[Definition], n: int, postings: Dict[str, array]):
+        self.data = data
+        self.n = n
+        self.postings = postings
+
+    @classmethod
+    def build(cls, data: List[Definition], n: int = 2) -> "DefinitionIndex":
+        if n < 1:
+            raise ValueError("N-gram size must be positive")
+
+        postings: Dict[str, array] = defaultdict(lambda: array("I"))
+        for position, x in enumerate(data):
+            for gram in set(ngrams(gloss_text(x), n)):
+                postings[gram].append(position)
+
+        return DefinitionIndex(data, n, dict(postings))
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def candidates(self, phrase: str) -> Optional[Set[int]]:
+        """
+        Positions of definitions that contain every n-gram of the phrase.
+
+        Returns None if the phrase is shorter than the n-gram size,
+        in which case every definition is a candidate.
+        """
+        grams = set(ngrams(phrase, self.n))
+        if not grams:
+            return None
+
+        lists = []
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if posting is None:
+                return set()
+            lists.append(posting)
+
+        lists.sort(key=len)
+        result = set(lists[0])
+        for posting in lists[1:]:
+            result.intersection_update(posting)
+            if not result:
+                break
+
+        return result
+
+    def search_positions(self, phrases: List[str]) -> List[int]:
+        """
+        Positions of definitions whose glosses contain all phrases.
+        """
+        if not phrases:
+            return list(range(len(self.data)))
+
+        candidate_set: Optional[Set[int]] = None
+        for phrase in phrases:
+            candidates = self.candidates(phrase)
+            if candidates is None:
+                continue
+            if candidate_set is None:
+                candidate_set = candidates
+            else:
+                candidate_set.intersection_update(candidates)
+            if not candidate_set:
+                return []
+
+        if candidate_set is None:
+            positions = range(len(self.data))
+        else:
+            positions = sorted(candidate_set)
+
+        result = []
+        for position in positions:
+            text = gloss_text(self.data[position])
+            if all(phrase in text for phrase in phrases):
+                result.append(position)
+        return result
+
+    def search(self, phrase: str) -> Iterator[Definition]:
+        """
+        Iterate over definitions whose glosses contain the phrase.
+        """
+        return self.search_all([phrase])
+
+    def search_all(self, phrases: List[str]) -> Iterator[Definition]:
+        """
+        Iterate over definitions whose glosses contain every one of the phrases.
+        """
+        for position in self.search_positions(phrases):
+            yield self.data[position]
+
+    def save(self, path: str, source: Optional[List[int]] = None):
+        """
+        Write the index to a file.
+
+        Fingerprint of the source dictionary zip is stored alongside
+        so that stale indices can be detected on load.
+        """
+        grams = sorted(self.postings)
+        lengths = [len(self.postings[gram]) for gram in grams]
+        header = {
+            "n": self.n,
+            "count": len(self.data),
+            "source": source,
+            "grams": grams,
+            "lengths": lengths,
+        }
+        header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(len(header_bytes).to_bytes(8, "little"))
+            f.write(header_bytes)
+            for gram in grams:
+                posting = self.postings[gram]
+                if posting.itemsize != 4:
+                    posting = array("I", posting)
+                f.write(posting.tobytes())
+
+    @classmethod
+    def load(cls, path: str, data: List[Definition], source: Optional[List[int]] = None) -> Optional["DefinitionIndex"]:
+        """
+        Read an index from a file.
+
+        Returns None if the file does not belong to the given data or source fingerprint.
+        """
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                return None
+            header_length = int.from_bytes(f.read(8), "little")
+            header = json.loads(f.read(header_length).decode("utf-8"))
+            if header["count"] != len(data) or header["source"] != source:
+                return None
+
+            flat = array("I")
+            flat.frombytes(f.read())
+
+        postings = dict()
+        offset = 0
+        for gram, length in zip(header["grams"], header["lengths"]):
+            postings[gram] = flat[offset:offset + length]
+            offset += length
+
+        return DefinitionIndex(data, header["n"], postings)
+
+
+def read_index(zip_path: str, dic: Dictionary, n: int = 2) -> DefinitionIndex:
+    """
+    Load the persisted index next to the dictionary zip.
+
+    The index is built and persisted if it is missing or stale.
+    """
+    path = index_path(zip_path)
+    source = fingerprint(zip_path)
+    data = dic.data
+
+    if os.path.exists(path):
+        index = DefinitionIndex.load(path, data, source)
+        if index is not None and index.n == n:
+            return index
+
+    index = DefinitionIndex.build(data, n)
+    index.save(path, source)
+    return index
+
+
+class TestDefinitionIndex(unittest.TestCase):
+    data = [
+        Definition(Term("学校", "がっこう"), "", "", 0, ("児童・生徒に教育を施す所。",), 0, ""),
+        Definition(Term("川", "かわ"), "", "", 0, ("地表の水が集まって流れる所。", "流れ。"), 1, ""),
+        Definition(Term("海", "うみ"), "", "", 0, ("地球の表面の、塩水をたたえた所。",), 2, ""),
+        Definition(Term("水", "みず"), "", "", 0, ("水素と酸素の化合物。",), 3, ""),
+    ]
+
+    def assertSearch(self, index: DefinitionIndex, phrases: List[str], expected: List[str]):
+        found = [x.term.text for x in index.search_all(phrases)]
+        self.assertEqual(expected, found)
+
+    def test_search(self):
+        for n in [1, 2, 3]:
+            index = DefinitionIndex.build(self.data, n)
+            self.assertSearch(index, ["所。"], ["学校", "川", "海"])
+            self.assertSearch(index, ["流れ"], ["川"])
+            self.assertSearch(index, ["水"], ["川", "海", "水"])
+            self.assertSearch(index, ["地", "所"], ["川", "海"])
+            self.assertSearch(index, ["水が", "塩水"], [])
+            self.assertSearch(index, ["存在しない"], [])
+            # Phrases never span two glosses
+            self.assertSearch(index, ["所。流れ"], [])
+
+    def test_save_load(self):
+        index = DefinitionIndex.build(self.data, 2)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "index.ngram")
+            index.save(path, [1, 2])
+
+            self.assertIsNone(DefinitionIndex.load(path, self.data, [1, 3]))
+            self.assertIsNone(DefinitionIndex.load(path, self.data[1:], [1, 2]))
+
+            loaded = DefinitionIndex.load(path, self.data, [1, 2])
+            self.assertIsNotNone(loaded)
+            self.assertEqual(index.postings, loaded.postings)
+            self.assertSearch(loaded, ["塩水"], ["海"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Search the glosses of a definition dictionary")
+
+    parser.add_argument("path_in", type=str, help="Path to definition dictionary")
+    parser.add_argument("phrases", type=str, nargs="+", help="Phrases that must all occur in the glosses")
+    profiling.add_arguments(parser)
+
+    args = parser.parse_args()
+
+    with profiling.from_args(args):
+        dic = Definition.dictionary_reader() \
+            .with_path(args.path_in) \
+            .read()
+        index = read_index(args.path_in, dic)
+
+        for x in index.search_all(args.phrases):
+            print(json.dumps(x.to_json(), ensure_ascii=False))
@@ -0,0 +1,220 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+import unittest
+
+import profiling
+import rank
+import workers
+from definition import Definition
+from dictionary import Dictionary
+from occurrence import Occurrence, OccurrenceBag
+from rank import Rank
+from term import Term
+
+
+class Segmenter:
+    """
+    Longest-match segmenter that splits raw text into the terms of a dictionary.
+
+    The trie of all term texts is flattened into one hash map from each prefix to its term,
+    or to None for prefixes that are not terms themselves.
+    Matching walks this map one character at a time, as it would walk the trie.
+
+    Raw text carries no readings, so each text is attributed to its first term in the dictionary.
+    For rank dictionaries that is the most frequent reading.
+    Characters that start no term are skipped.
+    """
+    prefixes: Dict[str, Optional[Term]]
+
+    def __init__(self, terms: Iterable[Term]):
+        prefixes: Dict[str, Optional[Term]] = dict()
+        for term in terms:
+            text = term.text
+            if not text:
+                continue
+            if prefixes.get(text) is None:
+                prefixes[text] = term
+            for end in range(1, len(text)):
+                prefixes.setdefault(text[:end], None)
+        self.prefixes = prefixes
+
+    @classmethod
+    def from_dictionary(cls, dic: Dictionary) -> "Segmenter":
+        return Segmenter(x.term for x in dic)
+
+    def segment(self, line: str) -> Iterator[Term]:
+        """
+        Iterate over the longest matching terms from left to right.
+        """
+        prefixes = self.prefixes
+        length = len(line)
+        start = 0
+        while start < length:
+            match = None
+            match_end = start + 1
+            end = start + 1
+            while end <= length:
+                piece = line[start:end]
+                if piece not in prefixes:
+                    break
+                term = prefixes[piece]
+                if term is not None:
+                    match = term
+                    match_end = end
+                end += 1
+
+            if match is not None:
+                yield match
+            start = match_end
+
+    def count(self, lines: Iterable[str]) -> Tuple[Dict[Term, int], int]:
+        """
+        Occurrences of each term in the lines, plus the number of characters read.
+        """
+        counts: Dict[Term, int] = defaultdict(int)
+        chars = 0
+        for line in lines:
+            chars += len(line)
+            for term in self.segment(line):
+                counts[term] += 1
+        return counts, chars
+
+
+def text_files(directory: str) -> Iterator[str]:
+    """
+    Iterate over the paths of all files below the directory in a stable order.
+    """
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            yield os.path.join(root, name)
+
+
+def count_file(segmenter: Segmenter, path: str) -> Tuple[Dict[Term, int], int]:
+    # Terms never span lines, so the file is streamed line by line
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return segmenter.count(f)
+
+
+_segmenter: Optional[Segmenter] = None
+
+
+def init_worker(segmenter: Segmenter):
+    global _segmenter
+    _segmenter = segmenter
+
+
+def count_file_in_worker(path: str) -> Tuple[Dict[Term, int], int]:
+    assert _segmenter is not None
+    return count_file(_segmenter, path)
+
+
+def read_bag(segmenter: Segmenter, directory: str, processes: int = 1) -> Tuple[OccurrenceBag, int]:
+    """
+    Count the terms in every file below the directory,
+    with the path of each file relative to the directory as provenance.
+
+    With more than one process, files are counted in a process pool
+    that receives the segmenter once per process.
+
+    Returns the bag and the number of characters read.
+    """
+    paths = list(text_files(directory))
+    if processes <= 1:
+        results: Iterator[Tuple[Dict[Term, int], int]] = (count_file(segmenter, path) for path in paths)
+    else:
+        results = workers.imap_ordered(count_file_in_worker, iter(paths), processes,
+                                        initializer=init_worker, initargs=(segmenter,))
+
+    bag = OccurrenceBag()
+    total_chars = 0
+    for path, (counts, chars) in zip(paths, results):
+        provenance = os.path.relpath(path, directory)
+        for term, count in counts.items():
+            bag.insert(Occurrence(term, provenance), count)
+        total_chars += chars
+    return bag, total_chars
+
+
+def rank_dictionary(counts: Dict[Term, int], title: str, max_rank: int) -> Dictionary:
+    it = rank.from_counts(counts)
+    it = rank.below_max_rank(it, max_rank)
+
+    return Rank.dictionary(list(it)) \
+        .with_title(title) \
+        .with_revision(f"yomi v{date.today().isoformat()} longest match")
+
+
+class TestSegmenter(unittest.TestCase):
+    terms = [
+        Term("学校", "がっこう"),
+        Term("学", "がく"),
+        Term("学校教育", "がっこうきょういく"),
+        Term("教育", "きょういく"),
+        Term("日本", "にほん"),
+        Term("日本", "にっぽん"),
+    ]
+
+    def test_segment(self):
+        segmenter = Segmenter(self.terms)
+        self.assertEqual([Term("学校教育", "がっこうきょういく")], list(segmenter.segment("学校教育")))
+        self.assertEqual([Term("学校", "がっこう")], list(segmenter.segment("学校教")))
+        self.assertEqual([Term("学校", "がっこう"), Term("教育", "きょういく")], list(segmenter.segment("学校と教育")))
+        self.assertEqual([Term("学", "がく"), Term("学校", "がっこう")], list(segmenter.segment("学は学校")))
+        # The first reading in the dictionary wins
+        self.assertEqual([Term("日本", "にほん")], list(segmenter.segment("日本")))
+        self.assertEqual([], list(segmenter.segment("")))
+
+    def test_read_bag(self):
+        segmenter = Segmenter(self.terms)
+        with tempfile.TemporaryDirectory() as directory:
+            os.makedirs(os.path.join(directory, "sub"))
+            with open(os.path.join(directory, "a.txt"), "w", encoding="utf-8") as f:
+                f.write("日本の学校教育\n学校\n")
+            with open(os.path.join(directory, "sub", "b.txt"), "w", encoding="utf-8") as f:
+                f.write("学校と学\n")
+
+            for processes in [1, 2]:
+                bag, chars = read_bag(segmenter, directory, processes)
+                self.assertEqual(7 + 1 + 2 + 1 + 4 + 1, chars)
+                self.assertEqual(1, bag.get(Occurrence(Term("学校", "がっこう"), "a.txt")))
+                self.assertEqual(1, bag.get(Occurrence(Term("学校", "がっこう"), os.path.join("sub", "b.txt"))))
+                self.assertEqual(2, bag.to_counts()[Term("学校", "がっこう")])
+                self.assertEqual(1, bag.to_counts()[Term("日本", "にほん")])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Count dictionary terms in a directory of raw text by longest match")
+
+    parser.add_argument("path_dic", type=str, help="Path to rank or definition dictionary with the terms to count")
+    parser.add_argument("path_in", type=str, help="Path to directory with UTF-8 text files")
+    parser.add_argument("path_out", type=str, help="Path of output rank dictionary")
+    parser.add_argument("--definitions", action="store_true", help="Read the terms from a definition dictionary")
+    parser.add_argument("--title", type=str, default=None, help="Title of output dictionary; directory name by default")
+    parser.add_argument("--max", type=int, default=80000, help="Maximum term frequency included in dictionary")
+    parser.add_argument("--processes", type=int, default=1, help="Number of processes counting files")
+    profiling.add_arguments(parser)
+
+    args = parser.parse_args()
+
+    with profiling.from_args(args):
+        reader = Definition.dictionary_reader() if args.definitions else Rank.dictionary_reader()
+        segmenter = Segmenter.from_dictionary(reader.with_path(args.path_dic).read())
+
+        start = time.perf_counter()
+        bag, chars = read_bag(segmenter, args.path_in, args.processes)
+        seconds = time.perf_counter() - start
+        print(f"{chars} chars in {seconds:.2f} s, {chars / seconds:.0f} chars/s", file=sys.stderr)
+
+        title = args.title or os.path.basename(os.path.normpath(args.path_in))
+        rank_dictionary(bag.to_counts(), title, args.max) \
+            .writer() \
+            .with_path(args.path_out) \
+            .in_chunks(10000) \
+            .write()
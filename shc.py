@@ -2,14 +2,20 @@ import argparse
 import os
 import unittest
 from datetime import date
+from typing import Dict
 
+import profiling
 import rank
+from dictionary import Dictionary
 from occurrence import OccurrenceBag, OccurrenceReader
 from rank import Rank
+from term import Term
 
 
+ZIP_NAME = "SHC-LEX_SUW_202305.zip"
+
 def read_suw_bag(zip_dir_path: str) -> OccurrenceBag:
-    zip_path = os.path.join(zip_dir_path, "SHC-LEX_SUW_202305.zip")
+    zip_path = os.path.join(zip_dir_path, ZIP_NAME)
     return OccurrenceReader() \
         .with_zip_path(zip_path) \
         .add_path("SHC-LEX_SUW_202305_book.csv") \
@@ -24,6 +30,23 @@ def read_suw_bag(zip_dir_path: str) -> OccurrenceBag:
         .read()
 
 
+def rank_dictionary(counts: Dict[Term, int], max_rank: int) -> Dictionary:
+    it = rank.from_counts(counts)
+    it = rank.below_max_rank(it, max_rank)
+
+    return Rank.dictionary(list(it)) \
+        .with_title("昭和〜平成") \
+        .with_revision(f"data v2023-05 yomi v{date.today().isoformat()} SUW") \
+        .with_author("NINJAL, uncomputable") \
+        .with_url("https://github.com/uncomputable/japanese-tools") \
+        .with_description("""『昭和・平成書き言葉コーパス』は、昭和・平成期の日本語を通時的に研究できるように設計したコーパスです。
+
+        雑誌、ベストセラー書籍、新聞
+
+        https://clrd.ninjal.ac.jp/shc/index.html""") \
+        .with_attribution("CC BY-NC-SA 4.0 https://creativecommons.org/licenses/by-nc-sa/4.0/deed.ja")
+
+
 class TestSHC(unittest.TestCase):
     def test_read_suw(self):
         bag = read_suw_bag("../data")
@@ -36,25 +59,14 @@ if __name__ == "__main__":
     parser.add_argument("path_in", type=str, help="Path to directory with SHC zip file")
     parser.add_argument("path_out", type=str, help="Path of output dictionary")
     parser.add_argument("--max", type=int, default=80000, help="Maximum term frequency included in dictionary")
+    profiling.add_arguments(parser)
 
     args = parser.parse_args()
 
-    bag = read_suw_bag(args.path_in)
-    it = rank.from_counts(bag.to_counts())
-    it = rank.below_max_rank(it, args.max)
-
-    Rank.dictionary(list(it)) \
-        .with_title("昭和〜平成") \
-        .with_revision(f"data v2023-05 yomi v{date.today().isoformat()} SUW") \
-        .with_author("NINJAL, uncomputable") \
-        .with_url("https://github.com/uncomputable/japanese-tools") \
-        .with_description("""『昭和・平成書き言葉コーパス』は、昭和・平成期の日本語を通時的に研究できるように設計したコーパスです。
-
-        雑誌、ベストセラー書籍、新聞
-
-        https://clrd.ninjal.ac.jp/shc/index.html""") \
-        .with_attribution("CC BY-NC-SA 4.0 https://creativecommons.org/licenses/by-nc-sa/4.0/deed.ja") \
-        .writer() \
-        .with_path(args.path_out) \
-        .in_chunks(10000) \
-        .write()
+    with profiling.from_args(args):
+        bag = read_suw_bag(args.path_in)
+        rank_dictionary(bag.to_counts(), args.max) \
+            .writer() \
+            .with_path(args.path_out) \
+            .in_chunks(10000) \
+            .write()
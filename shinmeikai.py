@@ -1,18 +1,24 @@
 import argparse
 import os
 from datetime import date
-from typing import Optional
+from functools import partial
+from typing import Optional, Mapping
 
 import bccwj
 import definition
 import jlpt
+import join
+import parallel
+import profiling
 from definition import Definition
 from dictionary import Dictionary
 from term import Term
 
 
+ZIP_NAME = "新明解国語辞典第五版v3.zip"
+
 def read_dictionary(zip_dir_path: str) -> Dictionary:
-    zip_path = os.path.join(zip_dir_path, "新明解国語辞典第五版v3.zip")
+    zip_path = os.path.join(zip_dir_path, ZIP_NAME)
     return Definition.dictionary_reader() \
         .with_path(zip_path) \
         .read()
@@ -41,19 +47,20 @@ def remove_stars(term: Term) -> Term:
     return Term(text, reading)
 
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Upgrade Shinmeikai dictionary for Yomichan")
-
-    parser.add_argument("path_in", type=str, help="Path to directory with Shinmeikai dictionary")
-    parser.add_argument("path_out", type=str, help="Path of output dictionary")
-    parser.add_argument("path_bccwj", type=str, help="Path to directory with BCCWJ zip files")
+def key_filter(dic: Dictionary, variants: str) -> bccwj.KeyFilter:
+    """
+    Keys of the BCCWJ rows that can affect the counts of the dictionary terms.
 
-    args = parser.parse_args()
+    Exact counts only need the terms themselves.
+    Counts of spelling variants need every row with the canonical key of a term.
+    """
+    terms = [x.term for x in dic]
+    if variants == "exact":
+        return {(x.text, x.reading) for x in terms}, None
+    return set(join.canonical_keys(terms)), join.canonical_key
 
-    dic = read_dictionary(args.path_in)
-    bag, includes_luw = bccwj.read_bag(args.path_bccwj)
-    counts = bag.to_counts()
 
+def upgrade_dictionary(dic: Dictionary, counts: Mapping[Term, int], processes: int = 1) -> Dictionary:
     it = iter(dic)
     it = definition.with_counts(it, counts)
     it = definition.sort_by_count(it)
@@ -61,16 +68,41 @@ if __name__ == "__main__":
     it = definition.only_definitions(it)
     it = definition.position_as_sequence(it)
     it = definition.sort_by_term(it)
-    it = definition.copy_term(it, Term.update_kanji_repetition_marks)
-    it = definition.add_def_tag(it, tag_importance)
-    it = definition.add_def_tag(it, jlpt.tag_level)
-    it = definition.map_term(it, remove_stars)
+    it = parallel.run_stages(it, [
+        partial(definition.copy_term, f=Term.update_kanji_repetition_marks),
+        partial(definition.add_def_tag, f=tag_importance),
+        partial(definition.map_term, f=remove_stars),
+        jlpt.tag_levels,
+    ], processes)
 
-    Definition.dictionary(list(it)) \
+    return Definition.dictionary(list(it)) \
         .with_title("新明解国語辞典") \
         .with_revision(f"data v1997-11-03 yomi v{date.today().isoformat()}") \
-        .with_author("Yoga, uncomputable") \
-        .writer() \
-        .with_path(args.path_out) \
-        .in_chunks(10000) \
-        .write()
+        .with_author("Yoga, uncomputable")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Upgrade Shinmeikai dictionary for Yomichan")
+
+    parser.add_argument("path_in", type=str, help="Path to directory with Shinmeikai dictionary")
+    parser.add_argument("path_out", type=str, help="Path of output dictionary")
+    parser.add_argument("path_bccwj", type=str, help="Path to directory with BCCWJ zip files")
+    parser.add_argument("--variants", choices=["exact", *join.AGGREGATES], default="exact",
+                        help="How to count terms that occur only in spelling variants in BCCWJ")
+    parser.add_argument("--processes", type=int, default=1, help="Number of processes for per-definition stages")
+    profiling.add_arguments(parser)
+
+    args = parser.parse_args()
+
+    with profiling.from_args(args):
+        dic = read_dictionary(args.path_in)
+        bag, includes_luw = bccwj.read_bag(args.path_bccwj, key_filter(dic, args.variants))
+        counts = bag.to_counts()
+        if args.variants != "exact":
+            counts = join.JoinIndex(counts, args.variants)
+
+        upgrade_dictionary(dic, counts, args.processes) \
+            .writer() \
+            .with_path(args.path_out) \
+            .in_chunks(10000) \
+            .write()
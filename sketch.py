@@ -0,0 +1,182 @@
+import heapq
+import random
+from collections import Counter
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Tuple
+import unittest
+
+
+class SpaceSaving:
+    """
+    Approximate counts of the most frequent keys of a weighted stream, in memory bounded by the capacity.
+
+    At most capacity keys are monitored.
+    When an unmonitored key arrives and all counters are taken,
+    the key with the smallest count is replaced and the new key inherits its count as error.
+
+    Every monitored count overestimates the true count by at most its error,
+    and every error is at most total / capacity.
+    Each key whose true count exceeds total / capacity is guaranteed to be monitored.
+
+    Metwally, Agrawal and El Abbadi: Efficient Computation of Frequent and Top-k Elements in Data Streams (2005)
+    """
+    capacity: int
+    counts: Dict[Hashable, int]
+    errors: Dict[Hashable, int]
+    heap: List[Tuple[int, Any]]
+    """
+    One entry per monitored key.
+
+    Entries are not updated when a count grows, so an entry may be smaller than the count of its key.
+    Stale entries are fixed up lazily when the minimum is needed.
+    """
+    total: int
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        self.capacity = capacity
+        self.counts = dict()
+        self.errors = dict()
+        self.heap = []
+        self.total = 0
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.counts
+
+    def insert(self, key: Hashable, count: int = 1):
+        self.total += count
+        counts = self.counts
+
+        if key in counts:
+            counts[key] += count
+            return
+        if len(counts) < self.capacity:
+            counts[key] = count
+            self.errors[key] = 0
+            heapq.heappush(self.heap, (count, key))
+            return
+
+        heap = self.heap
+        while True:
+            entry_count, smallest = heap[0]
+            current = counts[smallest]
+            if entry_count == current:
+                break
+            heapq.heapreplace(heap, (current, smallest))
+
+        del counts[smallest]
+        del self.errors[smallest]
+        counts[key] = current + count
+        self.errors[key] = current
+        heapq.heapreplace(heap, (current + count, key))
+
+    def update(self, items: Iterable[Tuple[Hashable, int]]):
+        for key, count in items:
+            self.insert(key, count)
+
+    def get(self, key: Hashable) -> int:
+        """
+        Upper bound of the true count of the key.
+
+        Unmonitored keys occurred at most as often as the smallest monitored count.
+        """
+        if key in self.counts:
+            return self.counts[key]
+        if len(self.counts) < self.capacity:
+            return 0
+        return min(self.counts.values())
+
+    def error(self, key: Hashable) -> int:
+        """
+        Maximum overestimation of the count of a monitored key.
+        """
+        return self.errors[key]
+
+    def guaranteed(self, key: Hashable) -> int:
+        """
+        Lower bound of the true count of a monitored key.
+        """
+        return self.counts[key] - self.errors[key]
+
+    def max_error(self) -> int:
+        return self.total // self.capacity
+
+    def to_counts(self) -> Dict[Hashable, int]:
+        """
+        Estimated counts of the monitored keys, to be ranked like exact counts.
+        """
+        return dict(self.counts)
+
+
+def accuracy_report(sketch: SpaceSaving, exact: Mapping[Hashable, int], n: int) -> Dict[str, Any]:
+    """
+    Compare the top n keys of a sketch to the top n keys of the exact counts.
+
+    Recall is the fraction of the exact top n that is in the estimated top n.
+    Errors are the differences between estimated and true counts over the estimated top n.
+    """
+    estimated_top = sorted(sketch.counts, key=sketch.counts.__getitem__, reverse=True)[:n]
+    exact_top = sorted(exact, key=exact.__getitem__, reverse=True)[:n]
+    errors = [sketch.counts[key] - exact.get(key, 0) for key in estimated_top]
+    rank_shifts = {key: i for i, key in enumerate(exact_top)}
+    shifts = [abs(i - rank_shifts[key]) for i, key in enumerate(estimated_top) if key in rank_shifts]
+
+    return {
+        "n": n,
+        "capacity": sketch.capacity,
+        "recall": len(set(estimated_top) & set(exact_top)) / max(1, len(exact_top)),
+        "max_error": max(errors, default=0),
+        "max_error_bound": sketch.max_error(),
+        "within_bounds": all(0 <= error <= sketch.error(key) for key, error in zip(estimated_top, errors)),
+        "max_rank_shift": max(shifts, default=0),
+    }
+
+
+def zipf_stream(vocabulary: int, length: int, exponent: float = 1.1) -> List[Tuple[int, int]]:
+    """
+    Random stream of (key, count) pairs whose keys follow Zipf's law.
+    """
+    weights = [1 / (i + 1) ** exponent for i in range(vocabulary)]
+    keys = random.choices(range(vocabulary), weights, k=length)
+    return [(key, random.randint(1, 3)) for key in keys]
+
+
+class TestSpaceSaving(unittest.TestCase):
+    def test_exact_below_capacity(self):
+        sketch = SpaceSaving(3)
+        sketch.update([("a", 2), ("b", 1), ("a", 1)])
+        self.assertEqual({"a": 3, "b": 1}, sketch.to_counts())
+        self.assertEqual(0, sketch.error("a"))
+        self.assertEqual(0, sketch.get("c"))
+
+    def test_replacement(self):
+        sketch = SpaceSaving(2)
+        sketch.update([("a", 5), ("b", 2), ("b", 1), ("c", 1)])
+        # b is the smallest with 3 and c takes its place with the error 3
+        self.assertEqual({"a": 5, "c": 4}, sketch.to_counts())
+        self.assertEqual(3, sketch.error("c"))
+        self.assertEqual(1, sketch.guaranteed("c"))
+        self.assertEqual(4, sketch.get("b"))
+
+    def test_accuracy(self):
+        random.seed(0)
+        stream = zipf_stream(20000, 100000)
+        exact = Counter()
+        for key, count in stream:
+            exact[key] += count
+
+        n = 100
+        sketch = SpaceSaving(10 * n)
+        sketch.update(stream)
+        report = accuracy_report(sketch, exact, n)
+
+        self.assertTrue(report["within_bounds"])
+        self.assertLessEqual(report["max_error"], report["max_error_bound"])
+        self.assertGreaterEqual(report["recall"], 0.95)
+        for key in sketch.counts:
+            self.assertLessEqual(sketch.guaranteed(key), exact[key])
+            self.assertLessEqual(exact[key], sketch.counts[key])
+        self.assertLessEqual(len(sketch.heap), sketch.capacity)
@@ -0,0 +1,234 @@
+import argparse
+import os
+import random
+import tempfile
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Tuple
+from zipfile import ZipFile, ZIP_DEFLATED
+import unittest
+
+import bccwj
+import chj
+import conversion
+import csj
+import nwjc
+import shc
+from definition import Definition
+from dictionary import Dictionary
+from rank import Rank
+from term import Term
+
+KANJI = [chr(x) for x in range(0x4E00, 0x4E00 + 2000)]
+KATAKANA = [chr(x) for x in range(0x30A2, 0x30F3)]
+
+
+@dataclass
+class Layout:
+    """
+    Column layout of the frequency lists in a corpus zip, as read by the corpus module.
+    """
+    zip_name: str
+    members: List[str]
+    text_index: int
+    reading_index: int
+    count_index: int
+    provenance_indices: List[int] = field(default_factory=list)
+    encoding: str = "utf-8"
+
+    def columns(self) -> int:
+        return max([self.text_index, self.reading_index, self.count_index] + self.provenance_indices) + 1
+
+
+CHJ_SUW = dict(text_index=1, reading_index=0, count_index=16, provenance_indices=[9, 10, 13], encoding="utf-16")
+
+LAYOUTS: Dict[str, List[Layout]] = {
+    "bccwj": [
+        Layout(bccwj.SUW_ZIP_NAME, ["BCCWJ_frequencylist_suw_ver1_1.tsv"], 2, 1, 6),
+        Layout(bccwj.LUW2_ZIP_NAME, ["BCCWJ_frequencylist_luw2_ver1_1.tsv"], 2, 1, 6),
+    ],
+    "csj": [Layout(csj.ZIP_NAME, ["CSJ_frequencylist_suw_ver201803.tsv"], 2, 1, 6)],
+    "nwjc": [Layout(nwjc.ZIP_NAME, ["NWJC_frequencylist_suw_ver2022_02/NWJC_frequencylist_suw_ver2022_02.tsv"], 2, 1, 6)],
+    "shc": [Layout(shc.ZIP_NAME, ["SHC-LEX_SUW_202305_book.csv", "SHC-LEX_SUW_202305_magazine.csv",
+                                  "SHC-LEX_SUW_202305_newspaper.csv"], 1, 0, 15, encoding="utf-16")],
+    "chj": [
+        Layout(chj.ZIP_NAME, ["CHJ-LEX_SUW_2023.3_modern_nonmag.csv", "CHJ-LEX_SUW_2023.3_modern_mag.csv",
+                              "CHJ-LEX_SUW_2023.3_premodern.csv"], **CHJ_SUW),
+        Layout(chj.ZIP_NAME, ["CHJ-LEX_LUW_2023.3.csv"], 1, 0, 13, [8, 9, 12], "utf-16"),
+    ],
+}
+"""
+Maps corpus names to the layouts of their zips.
+Layouts with the same zip name are written into the same zip.
+"""
+
+
+class Vocabulary:
+    """
+    Random terms with Zipfian frequencies.
+
+    Terms are made of random kanji with random katakana readings,
+    so conversions such as kata_to_hira and kyu_to_shin see realistic characters.
+    The same seed always gives the same terms.
+    """
+    terms: List[Tuple[str, str]]
+    """
+    Pairs of text and katakana reading, from most to least frequent
+    """
+    exponent: float
+    rng: random.Random
+
+    def __init__(self, size: int, exponent: float = 1.1, seed: int = 0):
+        self.rng = random.Random(seed)
+        self.exponent = exponent
+        seen = set()
+        self.terms = []
+        while len(self.terms) < size:
+            text = "".join(self.rng.choices(KANJI, k=self.rng.randint(1, 3)))
+            if text in seen:
+                continue
+            seen.add(text)
+            reading = "".join(self.rng.choices(KATAKANA, k=self.rng.randint(2, 6)))
+            self.terms.append((text, reading))
+
+    def term(self, index: int) -> Term:
+        """
+        Term at the index with a hiragana reading, as in Yomichan dictionaries.
+        """
+        text, reading = self.terms[index]
+        return Term(text, conversion.kata_to_hira(reading))
+
+    def count(self, index: int, total: int) -> int:
+        """
+        Zipfian count of the term at the index in a corpus whose most frequent term occurs total times.
+        """
+        return max(1, int(total / (index + 1) ** self.exponent))
+
+    def sample(self, rows: int) -> List[int]:
+        """
+        Indices of the terms of a frequency list with the given number of rows.
+
+        Frequent terms are more likely to be included, and may be included more than once,
+        as with different parts of speech.
+        """
+        weights = [1 / (i + 1) ** (self.exponent / 2) for i in range(len(self.terms))]
+        return sorted(self.rng.choices(range(len(self.terms)), weights, k=rows))
+
+    def row(self, layout: Layout, index: int, total: int) -> str:
+        columns = [f"c{i}" for i in range(layout.columns())]
+        text, reading = self.terms[index]
+        columns[layout.text_index] = text
+        columns[layout.reading_index] = reading
+        columns[layout.count_index] = str(self.count(index, total))
+        for i, provenance_index in enumerate(layout.provenance_indices):
+            columns[provenance_index] = f"出所{i}-{index % (3 + i)}"
+        return "\t".join(columns)
+
+
+def write_corpus(vocabulary: Vocabulary, layouts: List[Layout], directory: str, rows: int):
+    """
+    Write synthetic frequency lists in the layouts into zips in the directory.
+    Each member gets the given number of rows plus a header.
+    """
+    members: Dict[str, List[Tuple[str, bytes]]] = dict()
+    for layout in layouts:
+        for member in layout.members:
+            header = "\t".join(f"column{i}" for i in range(layout.columns()))
+            total = rows * 100
+            lines = [header] + [vocabulary.row(layout, index, total) for index in vocabulary.sample(rows)]
+            content = ("\n".join(lines) + "\n").encode(layout.encoding)
+            members.setdefault(layout.zip_name, []).append((member, content))
+
+    for zip_name, contents in members.items():
+        with ZipFile(os.path.join(directory, zip_name), mode="w", compression=ZIP_DEFLATED) as zip_file:
+            for member, content in contents:
+                zip_file.writestr(member, content)
+
+
+def write_corpora(directory: str, rows: int, vocabulary_size: int, seed: int = 0,
+                  names: Optional[List[str]] = None):
+    """
+    Write synthetic zips of the given corpora, or of all of them, into the directory,
+    in the layout of the data directory that the corpus modules read.
+    """
+    vocabulary = Vocabulary(vocabulary_size, seed=seed)
+    for name in names or LAYOUTS:
+        write_corpus(vocabulary, LAYOUTS[name], directory, rows)
+
+
+def rank_dictionary(vocabulary: Vocabulary, size: int) -> Dictionary:
+    ranks = [Rank(vocabulary.term(i), i) for i in range(size)]
+    return Rank.dictionary(ranks).with_title("Synthetic ranks").with_revision("synthetic")
+
+
+def definition_dictionary(vocabulary: Vocabulary, size: int) -> Dictionary:
+    """
+    Definitions of a random sample of the vocabulary, some with several senses.
+    """
+    data = []
+    rng = vocabulary.rng
+    for sequence, index in enumerate(sorted(rng.sample(range(len(vocabulary.terms)), size))):
+        term = vocabulary.term(index)
+        for sense in range(1 + (sequence % 7 == 0)):
+            glosses = tuple("".join(rng.choices(KANJI, k=8)) + "。" for _ in range(rng.randint(1, 3)))
+            data.append(Definition(term, "", "", 0, glosses, sequence, "" if sense == 0 else "P"))
+    return Definition.dictionary(data).with_title("Synthetic definitions").with_revision("synthetic")
+
+
+class TestSynthetic(unittest.TestCase):
+    def test_vocabulary(self):
+        a = Vocabulary(100, seed=1)
+        self.assertEqual(a.terms, Vocabulary(100, seed=1).terms)
+        self.assertEqual(100, len({text for text, _reading in a.terms}))
+        self.assertGreater(a.count(0, 1000), a.count(10, 1000))
+        self.assertEqual(1, a.count(99, 10))
+
+    def test_corpora(self):
+        with tempfile.TemporaryDirectory() as directory:
+            write_corpora(directory, 200, 100)
+            # Every corpus module reads the synthetic zips as it would read the real ones
+            self.assertLessEqual(len(bccwj.read_suw_bag(directory)), 100)
+            bag, includes_luw = bccwj.read_bag(directory)
+            self.assertTrue(includes_luw)
+            self.assertGreater(len(csj.read_suw_bag(directory)), 0)
+            self.assertGreater(len(nwjc.read_suw_bag(directory)), 0)
+            self.assertGreater(len(shc.read_suw_bag(directory)), 0)
+            self.assertGreater(len(chj.read_modern_bag(directory)), 0)
+            self.assertGreater(len(chj.read_premodern_bag(directory)), 0)
+
+            counts = csj.read_suw_bag(directory).to_counts()
+            self.assertEqual(max(counts.values()), counts[Vocabulary(100).term(0)])
+
+    def test_dictionaries(self):
+        vocabulary = Vocabulary(100)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "definitions.zip")
+            dic = definition_dictionary(vocabulary, 50)
+            dic.writer().with_path(path).in_chunks(20).write()
+            read = Definition.dictionary_reader().with_path(path).read()
+            def fields(x: Definition) -> Tuple[Term, Tuple[str, ...], int, str]:
+                return x.term, tuple(x.definitions), x.sequence_number, x.top_tags
+
+            self.assertEqual(list(map(fields, dic)), list(map(fields, read)))
+        self.assertEqual(50, len({x.term for x in dic}))
+        self.assertEqual(100, len(rank_dictionary(vocabulary, 100)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write synthetic corpus zips and Yomichan dictionaries for benchmarks")
+
+    parser.add_argument("path_out", type=str, help="Path to directory of synthetic data")
+    parser.add_argument("--rows", type=int, default=100000, help="Number of rows of each frequency list")
+    parser.add_argument("--vocabulary", type=int, default=50000, help="Number of distinct terms")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random generator")
+    parser.add_argument("--corpus", type=str, action="append", choices=list(LAYOUTS),
+                        help="Corpus to write; all corpora by default")
+
+    args = parser.parse_args()
+
+    os.makedirs(args.path_out, exist_ok=True)
+    write_corpora(args.path_out, args.rows, args.vocabulary, args.seed, args.corpus)
+    vocabulary = Vocabulary(args.vocabulary, seed=args.seed)
+    rank_dictionary(vocabulary, len(vocabulary.terms)).writer() \
+        .with_path(os.path.join(args.path_out, "ranks.zip")).in_chunks(10000).write()
+    definition_dictionary(vocabulary, len(vocabulary.terms) // 2).writer() \
+        .with_path(os.path.join(args.path_out, "definitions.zip")).in_chunks(10000).write()
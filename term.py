@@ -1,6 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import total_ordering
-from typing import Optional
+from typing import Optional, Dict, Tuple
+import pickle
 import re
 import unittest
 
@@ -8,13 +9,14 @@ HIRAGANA = re.compile(r"[ぁ-ゖ]")
 KATAKANA = re.compile(r"[ァ-ヺ]")
 KANJI = re.compile(r"[\u4E00-\u9FFF\u3400-\u4DBF\u20000-\u2A6DF]")
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 @total_ordering
 class Term:
     """
     Japanese term with reading.
 
     Instances of this class are immutable.
+    The hash is computed once on construction.
     """
     text: str
     """
@@ -24,6 +26,17 @@ class Term:
     """
     Reading of the term, or an empty string if the reading is the same as the term.
     """
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_hash", hash((self.text, self.reading)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        # String hashes differ between processes, so the cached hash is recomputed on unpickling
+        return Term, (self.text, self.reading)
 
     def __repr__(self) -> str:
         return f"{self.text}[{self.reading}]"
@@ -58,6 +71,38 @@ class Term:
             return self.with_kanji_repetition_marks()
 
 
+class TermPool:
+    """
+    Interning pool of canonical term instances.
+
+    Equal terms that go through the same pool are the same object,
+    so they are stored only once and dictionary lookups succeed on the identity check.
+    Terms are keyed by text and reading, so get allocates a term only the first time it sees them.
+    """
+    terms: Dict[Tuple[str, str], Term]
+
+    def __init__(self):
+        self.terms = dict()
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def get(self, text: str, reading: str) -> Term:
+        """
+        Return the canonical term with the given text and reading.
+        """
+        term = self.terms.get((text, reading))
+        if term is None:
+            term = self.terms[(text, reading)] = Term(text, reading)
+        return term
+
+    def intern(self, term: Term) -> Term:
+        """
+        Return the canonical term that is equal to the given term.
+        """
+        return self.terms.setdefault((term.text, term.reading), term)
+
+
 def add_repetition_marks(string: str, pattern: re.Pattern, mark: str) -> str:
     new_string = ""
     prev_char = ""
@@ -108,3 +153,15 @@ class TestTerm(unittest.TestCase):
         self.assertNotEqual(a, i)
         self.assertEqual(hash(a), hash(a))
         self.assertNotEqual(hash(a), hash(i))
+        self.assertEqual(hash(a), hash(Term("ア", "あ")))
+        self.assertEqual(a, pickle.loads(pickle.dumps(a)))
+        self.assertEqual(hash(a), hash(pickle.loads(pickle.dumps(a))))
+
+    def test_pool(self):
+        pool = TermPool()
+        a = pool.get("ア", "あ")
+
+        self.assertIs(a, pool.get("ア", "あ"))
+        self.assertIs(a, pool.intern(Term("ア", "あ")))
+        self.assertIsNot(a, pool.get("イ", "い"))
+        self.assertEqual(2, len(pool))
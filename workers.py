@@ -0,0 +1,54 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Future
+from itertools import islice
+from typing import List, Any, Iterator, Callable, Deque, Optional, Tuple
+import unittest
+
+def chunked(it: Iterator[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """
+    Split an iterator into lists of at most the given size.
+    """
+    it = iter(it)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def imap_ordered(f: Callable[[Any], Any], it: Iterator[Any], processes: int, max_pending: Optional[int] = None,
+                 initializer: Optional[Callable[..., None]] = None, initargs: Tuple[Any, ...] = ()) -> Iterator[Any]:
+    """
+    Apply function f to each item in a process pool and iterate over the results in the original order.
+
+    At most max_pending items are in flight at any time,
+    so the input iterator is consumed only as fast as the results are.
+    By default, there are two pending items per process.
+
+    Function f and the items have to be picklable.
+    Large read-only state is better passed once per process to the initializer than with every item.
+    """
+    if max_pending is None:
+        max_pending = 2 * processes
+    if processes < 1 or max_pending < 1:
+        raise ValueError("Number of processes and pending items must be positive")
+
+    with ProcessPoolExecutor(max_workers=processes, initializer=initializer, initargs=initargs) as executor:
+        pending: Deque[Future] = deque()
+        for item in it:
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+            pending.append(executor.submit(f, item))
+        while pending:
+            yield pending.popleft().result()
+
+
+class TestWorkers(unittest.TestCase):
+    def test_chunked(self):
+        self.assertEqual([[0, 1, 2], [3, 4, 5], [6]], list(chunked(iter(range(7)), 3)))
+        self.assertEqual([], list(chunked(iter([]), 3)))
+
+    def test_imap_ordered(self):
+        self.assertEqual([str(x) for x in range(20)], list(imap_ordered(str, iter(range(20)), 2, max_pending=3)))
+        with self.assertRaises(ValueError):
+            list(imap_ordered(str, iter(range(2)), 0))